@@ -44,9 +44,12 @@
 #include "../ecl.h"
 #include "ekf.h"
 #include <mathlib/mathlib.h>
+#include "ekf_timing.h"
 
 void Ekf::fuseAirspeed()
 {
+	ECL_EKF_TIMED_SCOPE(FUSE_AIRSPEED);
+
 	const float &vn = _state.vel(0); // Velocity in north direction
 	const float &ve = _state.vel(1); // Velocity in east direction
 	const float &vd = _state.vel(2); // Velocity in downwards direction
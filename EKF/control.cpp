@@ -41,6 +41,7 @@
 
 #include "../ecl.h"
 #include "ekf.h"
+#include "ekf_timing.h"
 #include <mathlib/mathlib.h>
 
 void Ekf::controlFusionModes()
@@ -160,22 +161,22 @@ void Ekf::controlFusionModes()
 	controlHeightSensorTimeouts();
 
 	// control use of observations for aiding
-	controlMagFusion();
-	controlOpticalFlowFusion();
-	controlGpsFusion();
-	controlAirDataFusion();
-	controlBetaFusion();
-	controlDragFusion();
-	controlHeightFusion();
+	ECL_EKF_TIMED(CONTROL_MAG_FUSION, controlMagFusion());
+	ECL_EKF_TIMED(CONTROL_OPTICAL_FLOW_FUSION, controlOpticalFlowFusion());
+	ECL_EKF_TIMED(CONTROL_GPS_FUSION, controlGpsFusion());
+	ECL_EKF_TIMED(CONTROL_AIR_DATA_FUSION, controlAirDataFusion());
+	ECL_EKF_TIMED(CONTROL_BETA_FUSION, controlBetaFusion());
+	ECL_EKF_TIMED(CONTROL_DRAG_FUSION, controlDragFusion());
+	ECL_EKF_TIMED(CONTROL_HEIGHT_FUSION, controlHeightFusion());
 
 	// Additional data odoemtery data from an external estimator can be fused.
-	controlExternalVisionFusion();
+	ECL_EKF_TIMED(CONTROL_EXTERNAL_VISION_FUSION, controlExternalVisionFusion());
 
 	// Additional horizontal velocity data from an auxiliary sensor can be fused
-	controlAuxVelFusion();
+	ECL_EKF_TIMED(CONTROL_AUX_VEL_FUSION, controlAuxVelFusion());
 
 	// Fake position measurement for constraining drift when no other velocity or position measurements
-	controlFakePosFusion();
+	ECL_EKF_TIMED(CONTROL_FAKE_POS_FUSION, controlFakePosFusion());
 
 	// check if we are no longer fusing measurements that directly constrain velocity drift
 	update_deadreckoning_status();
@@ -43,9 +43,12 @@
 #include "ekf.h"
 #include <ecl.h>
 #include <mathlib/mathlib.h>
+#include "ekf_timing.h"
 
 void Ekf::fuseDrag()
 {
+	ECL_EKF_TIMED_SCOPE(FUSE_DRAG);
+
 	SparseVector24f<0,1,2,3,4,5,6,22,23> Hfusion;  // Observation Jacobians
 	Vector24f Kfusion; // Kalman gain vector
 
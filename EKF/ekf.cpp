@@ -40,6 +40,7 @@
  */
 
 #include "ekf.h"
+#include "ekf_timing.h"
 
 #include <ecl.h>
 #include <mathlib/mathlib.h>
@@ -102,6 +103,8 @@ void Ekf::reset()
 
 bool Ekf::update()
 {
+	ECL_EKF_TIMED_SCOPE(UPDATE);
+
 	bool updated = false;
 
 	if (!_filter_initialised) {
@@ -115,24 +118,24 @@ bool Ekf::update()
 	// Only run the filter if IMU data in the buffer has been updated
 	if (_imu_updated) {
 		// perform state and covariance prediction for the main filter
-		predictState();
-		predictCovariance();
+		ECL_EKF_TIMED(PREDICT_STATE, predictState());
+		ECL_EKF_TIMED(PREDICT_COVARIANCE, predictCovariance());
 
 		// control fusion of observation data
-		controlFusionModes();
+		ECL_EKF_TIMED(CONTROL_FUSION_MODES, controlFusionModes());
 
 		// run a separate filter for terrain estimation
-		runTerrainEstimator();
+		ECL_EKF_TIMED(RUN_TERRAIN_ESTIMATOR, runTerrainEstimator());
 
 		updated = true;
 
 		// run EKF-GSF yaw estimator
-		runYawEKFGSF();
+		ECL_EKF_TIMED(RUN_YAW_EKFGSF, runYawEKFGSF());
 	}
 
 	// the output observer always runs
 	// Use full rate IMU data at the current time horizon
-	calculateOutputStates();
+	ECL_EKF_TIMED(CALCULATE_OUTPUT_STATES, calculateOutputStates());
 
 	return updated;
 }
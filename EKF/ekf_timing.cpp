@@ -0,0 +1,97 @@
+/****************************************************************************
+ *
+ *   Copyright (c) 2020 Estimation and Control Library (ECL). All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions
+ * are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright
+ *    notice, this list of conditions and the following disclaimer.
+ * 2. Redistributions in binary form must reproduce the above copyright
+ *    notice, this list of conditions and the following disclaimer in
+ *    the documentation and/or other materials provided with the
+ *    distribution.
+ * 3. Neither the name ECL nor the names of its contributors may be
+ *    used to endorse or promote products derived from this software
+ *    without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ * FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ * COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ * INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ * BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS
+ * OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED
+ * AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ * LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ * ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ *
+ ****************************************************************************/
+
+/**
+ * @file ekf_timing.cpp
+ * Recording of the EKF update step timing, see ekf_timing.h.
+ */
+
+#include "ekf_timing.h"
+
+namespace estimator
+{
+namespace timing
+{
+
+static Recorder _recorder = nullptr;
+
+static const char *const section_names[SECTION_COUNT] = {
+	"update",
+	"predictState",
+	"predictCovariance",
+	"controlFusionModes",
+	"controlMagFusion",
+	"controlOpticalFlowFusion",
+	"controlGpsFusion",
+	"controlAirDataFusion",
+	"controlBetaFusion",
+	"controlDragFusion",
+	"controlHeightFusion",
+	"controlExternalVisionFusion",
+	"controlAuxVelFusion",
+	"controlFakePosFusion",
+	"runTerrainEstimator",
+	"runYawEKFGSF",
+	"calculateOutputStates",
+	"fuseVelPosHeight",
+	"fuseMag",
+	"fuseHeading",
+	"fuseDeclination",
+	"fuseAirspeed",
+	"fuseSideslip",
+	"fuseDrag",
+	"fuseOptFlow",
+	"fuseGpsYaw",
+	"fuseHagl",
+	"fuseFlowForTerrain",
+};
+
+const char *getSectionName(Section section)
+{
+	return (section < SECTION_COUNT) ? section_names[section] : "unknown";
+}
+
+void setRecorder(Recorder recorder)
+{
+	_recorder = recorder;
+}
+
+void record(Section section, uint64_t duration_ns)
+{
+	if (_recorder != nullptr) {
+		_recorder(section, duration_ns);
+	}
+}
+
+} // namespace timing
+} // namespace estimator
@@ -0,0 +1,131 @@
+/****************************************************************************
+ *
+ *   Copyright (c) 2020 Estimation and Control Library (ECL). All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions
+ * are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright
+ *    notice, this list of conditions and the following disclaimer.
+ * 2. Redistributions in binary form must reproduce the above copyright
+ *    notice, this list of conditions and the following disclaimer in
+ *    the documentation and/or other materials provided with the
+ *    distribution.
+ * 3. Neither the name ECL nor the names of its contributors may be
+ *    used to endorse or promote products derived from this software
+ *    without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ * FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ * COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ * INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ * BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS
+ * OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED
+ * AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ * LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ * ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ *
+ ****************************************************************************/
+
+/**
+ * @file ekf_timing.h
+ * Optional timing of the EKF update steps for the replay benchmark. The timers
+ * are only compiled in if ECL_EKF_TIMING is defined, which is the case for the
+ * ecl_EKF_timing library of the test build, else the timed statements run
+ * unchanged.
+ */
+
+#pragma once
+
+#include <cstdint>
+
+#if defined(ECL_EKF_TIMING)
+#include <chrono>
+#endif
+
+namespace estimator
+{
+namespace timing
+{
+
+enum Section : uint8_t {
+	UPDATE = 0,
+	PREDICT_STATE,
+	PREDICT_COVARIANCE,
+	CONTROL_FUSION_MODES,
+	CONTROL_MAG_FUSION,
+	CONTROL_OPTICAL_FLOW_FUSION,
+	CONTROL_GPS_FUSION,
+	CONTROL_AIR_DATA_FUSION,
+	CONTROL_BETA_FUSION,
+	CONTROL_DRAG_FUSION,
+	CONTROL_HEIGHT_FUSION,
+	CONTROL_EXTERNAL_VISION_FUSION,
+	CONTROL_AUX_VEL_FUSION,
+	CONTROL_FAKE_POS_FUSION,
+	RUN_TERRAIN_ESTIMATOR,
+	RUN_YAW_EKFGSF,
+	CALCULATE_OUTPUT_STATES,
+	// the fuse routines, called by the control functions above
+	FUSE_VEL_POS_HEIGHT,
+	FUSE_MAG,
+	FUSE_HEADING,
+	FUSE_DECLINATION,
+	FUSE_AIRSPEED,
+	FUSE_SIDESLIP,
+	FUSE_DRAG,
+	FUSE_OPT_FLOW,
+	FUSE_GPS_YAW,
+	FUSE_HAGL,
+	FUSE_FLOW_FOR_TERRAIN,
+	SECTION_COUNT
+};
+
+// name of the timed function of the section
+const char *getSectionName(Section section);
+
+// called with the duration of each timed call
+typedef void (*Recorder)(Section section, uint64_t duration_ns);
+
+// sets the recorder of all EKF instances, nullptr to stop recording
+void setRecorder(Recorder recorder);
+
+#if defined(ECL_EKF_TIMING)
+
+void record(Section section, uint64_t duration_ns);
+
+class ScopedTimer
+{
+public:
+	explicit ScopedTimer(Section section):
+		_section(section),
+		_start(std::chrono::steady_clock::now())
+	{}
+
+	~ScopedTimer()
+	{
+		const auto duration = std::chrono::steady_clock::now() - _start;
+		record(_section, std::chrono::duration_cast<std::chrono::nanoseconds>(duration).count());
+	}
+
+private:
+	const Section _section;
+	const std::chrono::steady_clock::time_point _start;
+};
+
+#define ECL_EKF_TIMED_SCOPE(section) const estimator::timing::ScopedTimer ecl_ekf_scope_timer(estimator::timing::section)
+#define ECL_EKF_TIMED(section, statement) do { ECL_EKF_TIMED_SCOPE(section); statement; } while (0)
+
+#else
+
+#define ECL_EKF_TIMED_SCOPE(section)
+#define ECL_EKF_TIMED(section, statement) statement
+
+#endif
+
+} // namespace timing
+} // namespace estimator
@@ -45,9 +45,12 @@
 #include <ecl.h>
 #include <mathlib/mathlib.h>
 #include <cstdlib>
+#include "ekf_timing.h"
 
 void Ekf::fuseGpsYaw()
 {
+	ECL_EKF_TIMED_SCOPE(FUSE_GPS_YAW);
+
 	// assign intermediate state variables
 	const float &q0 = _state.quat_nominal(0);
 	const float &q1 = _state.quat_nominal(1);
@@ -44,9 +44,12 @@
 #include "ekf.h"
 #include <ecl.h>
 #include <mathlib/mathlib.h>
+#include "ekf_timing.h"
 
 void Ekf::fuseMag()
 {
+	ECL_EKF_TIMED_SCOPE(FUSE_MAG);
+
 	// assign intermediate variables
 	const float &q0 = _state.quat_nominal(0);
 	const float &q1 = _state.quat_nominal(1);
@@ -700,6 +703,8 @@ void Ekf::updateQuaternion(const float innovation, const float variance, const f
 
 void Ekf::fuseHeading()
 {
+	ECL_EKF_TIMED_SCOPE(FUSE_HEADING);
+
 	Vector3f mag_earth_pred;
 	float measured_hdg;
 
@@ -827,6 +832,8 @@ void Ekf::fuseHeading()
 
 void Ekf::fuseDeclination(float decl_sigma)
 {
+	ECL_EKF_TIMED_SCOPE(FUSE_DECLINATION);
+
 	// assign intermediate state variables
 	const float &magN = _state.mag_I(0);
 	const float &magE = _state.mag_I(1);
@@ -46,9 +46,12 @@
 #include <mathlib/mathlib.h>
 #include <float.h>
 #include "utils.hpp"
+#include "ekf_timing.h"
 
 void Ekf::fuseOptFlow()
 {
+	ECL_EKF_TIMED_SCOPE(FUSE_OPT_FLOW);
+
 	float gndclearance = fmaxf(_params.rng_gnd_clearance, 0.1f);
 
 	// get latest estimated orientation
@@ -5,45 +5,330 @@ Created on Sat Mar 14 12:47:24 2020
 
 @author: roman
 """
-from sympy import ccode
+import builtins
+import keyword
+import os
+import re
+import tempfile
+from sympy import Symbol, ccode
 from sympy.codegen.ast import float32, real
+from sympy.printing.numpy import NumPyPrinter
+from sympy.printing.pycode import PythonCodePrinter
+from cost_model import get_file_cost
+from profiler import profiled
+from strength_reduction import check_strength_reduction, reduce_strength
+
+# operation counts of the files closed by this process, keyed on the file name
+_file_costs = {}
+
+# default for the strength reduction of new CodeGenerator instances
+_strength_reduction = False
+
+def get_file_costs():
+    return dict(_file_costs)
+
+def clear_file_costs():
+    _file_costs.clear()
+
+def set_strength_reduction(enabled):
+    global _strength_reduction
+    _strength_reduction = enabled
+
+# write the content to a temporary file next to the target and rename it over the
+# target, a file with the same content is left untouched to keep its timestamp
+# and avoid rebuilding everything that includes it
+def write_file_if_changed(file_name, content):
+    try:
+        with open(file_name, 'r') as file:
+            if file.read() == content:
+                return False
+        mode = os.stat(file_name).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+
+    directory = os.path.dirname(os.path.abspath(file_name))
+    handle, temporary_name = tempfile.mkstemp(dir=directory, prefix="." + os.path.basename(file_name) + ".")
+    try:
+        with os.fdopen(handle, 'w') as file:
+            file.write(content)
+        os.chmod(temporary_name, mode)
+        os.replace(temporary_name, file_name)
+    except BaseException:
+        if os.path.exists(temporary_name):
+            os.remove(temporary_name)
+        raise
+
+    return True
 
 class CodeGenerator:
-    def __init__(self, file_name):
+    # loop is a tuple of an index variable and a count, each section is then
+    # written inside a for loop over the index
+    def __init__(self, file_name, strength_reduction=None, loop=None):
         self.file_name = file_name
-        self.file = open(self.file_name, 'w')
+        # the output is kept in memory and only written to the file on close
+        self.chunks = []
+        self.strength_reduction = _strength_reduction if strength_reduction is None else strength_reduction
+        self.loop = loop
+        # sub expressions and the outputs computed from them, used for the operation count
+        self.sections = []
+        self.unreduced_sections = []
+        # a section is written once all outputs using its sub expressions are known
+        self.pending_subexpressions = None
+        self.pending_items = []
 
     def print_string(self, string):
-        self.file.write("// " + string + "\n")
+        self.pending_items.append(("string", string))
 
+    @profiled("ccode")
     def get_ccode(self, expression):
-        return ccode(expression, type_aliases={real:float32})
+        return ccode(expression, type_aliases={real:float32}, user_functions={"sq": "sq"})
 
     def write_subexpressions(self,subexpressions):
-        write_string = ""
-        for item in subexpressions:
-            write_string = write_string + "const float " + str(item[0]) + " = " + self.get_ccode(item[1]) + ";\n"
+        self.write_section()
+        self.pending_subexpressions = list(subexpressions)
 
-        write_string = write_string + "\n\n"
-        self.file.write(write_string)
-
-    def write_matrix(self, matrix, variable_name, is_symmetric=False, pre_bracket="(", post_bracket=")"):
-        write_string = ""
+    # skip_zeros leaves out the entries which are structurally zero, the variable
+    # must then be zero initialised, e.g. a SparseVector24f or matrix::Vector
+    def write_matrix(self, matrix, variable_name, is_symmetric=False, pre_bracket="(", post_bracket=")", separator=",", skip_zeros=False):
+        entries = []
 
         if matrix.shape[0] * matrix.shape[1] == 1:
-            write_string = write_string + variable_name + " = " + self.get_ccode(matrix[0]) + ";\n"
+            entries.append((variable_name, matrix[0]))
         elif matrix.shape[0] == 1 or matrix.shape[1] == 1:
             for i in range(0,len(matrix)):
-                write_string = write_string + variable_name + pre_bracket + str(i) + post_bracket + " = " + self.get_ccode(matrix[i]) + ";\n"
+                if not (skip_zeros and matrix[i] == 0):
+                    entries.append((variable_name + pre_bracket + str(i) + post_bracket, matrix[i]))
 
         else:
             for j in range(0, matrix.shape[1]):
                 for i in range(0, matrix.shape[0]):
-                    if j >= i or not is_symmetric:
-                        write_string = write_string + variable_name + pre_bracket + str(i) + "," + str(j) + post_bracket + " = " + self.get_ccode(matrix[i,j]) + ";\n"
+                    if (j >= i or not is_symmetric) and not (skip_zeros and matrix[i,j] == 0):
+                        entries.append((variable_name + pre_bracket + str(i) + separator + str(j) + post_bracket, matrix[i,j]))
+
+        self.pending_items.append(("matrix", entries))
+
+    @profiled("code generation")
+    def write_section(self):
+        subexpressions = self.pending_subexpressions if self.pending_subexpressions is not None else []
+        outputs = [entry[1] for kind, item in self.pending_items if kind == "matrix" for entry in item]
+
+        if self.pending_subexpressions is not None or outputs:
+            if self.strength_reduction:
+                reduced_subexpressions, reduced_outputs = reduce_strength(subexpressions, outputs)
+                check_strength_reduction(subexpressions, outputs, reduced_subexpressions, reduced_outputs)
+                self.unreduced_sections.append((subexpressions, outputs))
+                subexpressions, outputs = reduced_subexpressions, reduced_outputs
+
+            self.sections.append((subexpressions, outputs))
+
+        parts = []
+        if self.pending_subexpressions is not None:
+            for item in subexpressions:
+                parts.append("const float " + str(item[0]) + " = " + self.get_ccode(item[1]) + ";\n")
+
+            parts.append("\n\n")
+
+        output_index = 0
+        for kind, item in self.pending_items:
+            if kind == "string":
+                parts.append("// " + item + "\n")
+            else:
+                for entry in item:
+                    parts.append(entry[0] + " = " + self.get_ccode(outputs[output_index]) + ";\n")
+                    output_index += 1
+
+                parts.append("\n\n")
+
+        write_string = "".join(parts)
+
+        # comments written before the first section stay outside of the loop
+        if self.loop is not None and (self.pending_subexpressions is not None or outputs):
+            index, count = self.loop
+            body = "".join("\t" + line if line.strip() else "\n" for line in write_string.rstrip("\n").splitlines(True))
+            write_string = "for (unsigned %s = 0; %s < %s; %s++) {\n%s\n}\n\n" % (index, index, count, index, body)
+
+        self.chunks.append(write_string)
+        self.pending_subexpressions = None
+        self.pending_items = []
+
+    def get_cost(self):
+        cost = get_file_cost(self.sections)
+        if self.strength_reduction:
+            cost["before_strength_reduction"] = get_file_cost(self.unreduced_sections)
+
+        return cost
+
+    def close(self):
+        self.write_section()
+        write_file_if_changed(self.file_name, "".join(self.chunks))
+        _file_costs[os.path.basename(self.file_name)] = self.get_cost()
+
+# header of the generated Python modules, the kernels are compiled with numba if it is installed
+PYTHON_HEADER = """# generated by ekf_derivation/main.py, do not edit
+#
+# Batched NumPy versions of the EKF equations. The states of a batch of filters
+# are an array of shape (n_filters, 24) and their covariance matrices an array
+# of shape (n_filters, 24, 24), the other inputs are arrays of shape (n_filters,)
+# or scalars. predict_covariance returns the predicted covariance matrices of all
+# filters, without the process noise. The fuse_* functions only return the
+# observation Jacobian H and the Kalman gain K of each filter, the caller
+# computes the innovations and applies the state and covariance updates.
+#
+# The *_kernel functions compute the same outputs in a loop over the filters,
+# which is compiled with numba if it is installed.
+import math
+import numpy
+
+try:
+    from numba import njit as jit
+except ImportError:
+    def jit(function):
+        return function
+"""
+
+_MATRIX_ENTRY = re.compile(r"^(\w+)\((\d+),(\d+)\)$")
+
+# the inputs are float arrays, print integer powers and divisions as for scalars
+class VectorisedPrinter(NumPyPrinter):
+    def _print_Pow(self, expr, rational=False):
+        return self._hprint_Pow(expr, rational=rational, sqrt=self._module + ".sqrt")
+
+def get_python_name(name):
+    if keyword.iskeyword(name) or hasattr(builtins, name) or name in ("math", "numpy", "jit", "index", "n_filters"):
+        return name + "_"
+
+    return name
+
+# writes the equations as Python functions operating on a batch of filters,
+# the states are an array of shape (..., n_states) and the covariance
+# matrices an array of shape (..., n_states, n_states)
+class PythonCodeGenerator:
+    def __init__(self, file_name, state):
+        self.file_name = file_name
+        self.state_names = [str(symbol) for symbol in state]
+        self.lines = [PYTHON_HEADER]
+
+    # outputs is a list of (variable name, matrix, is symmetric), only the
+    # upper triangle of a symmetric matrix is used
+    @profiled("python code generation")
+    def write_function(self, name, subexpressions, outputs, comment=None):
+        temporaries = [item[0] for item in subexpressions]
+        inputs = set()
+        for item in subexpressions:
+            inputs |= item[1].free_symbols
+        for variable_name, matrix, is_symmetric in outputs:
+            for expression in matrix:
+                inputs |= expression.free_symbols
+        inputs -= set(temporaries)
+
+        states = []
+        matrix_entries = []
+        scalars = []
+        for symbol in inputs:
+            match = _MATRIX_ENTRY.match(str(symbol))
+            if str(symbol) in self.state_names:
+                states.append(symbol)
+            elif match:
+                matrix_entries.append((match.group(1), int(match.group(2)), int(match.group(3)), symbol))
+            else:
+                scalars.append(symbol)
+
+        states.sort(key=lambda symbol: self.state_names.index(str(symbol)))
+        matrix_entries.sort()
+        scalars.sort(key=str)
+        matrix_names = sorted(set(entry[0] for entry in matrix_entries) - {"P"})
+
+        replacements = {}
+        for symbol in states + scalars + temporaries:
+            replacements[symbol] = Symbol(get_python_name(str(symbol)), real=True)
+        for matrix_name, row, column, symbol in matrix_entries:
+            replacements[symbol] = Symbol("%s_%i_%i" % (matrix_name, row, column), real=True)
+
+        parameters = ["states", "P"] + matrix_names + [get_python_name(str(symbol)) for symbol in scalars]
+        subexpressions = [(replacements[symbol], expression.xreplace(replacements)) for symbol, expression in subexpressions]
+        outputs = [(variable_name, matrix.xreplace(replacements), is_symmetric) for variable_name, matrix, is_symmetric in outputs]
+        return_values = ", ".join(item[0] for item in outputs)
+
+        # vectorised NumPy function, scalar inputs are broadcast against the batch
+        printer = VectorisedPrinter()
+        if comment is not None:
+            self.lines.append("# " + comment)
+        self.lines.append("def %s(%s):" % (name, ", ".join(parameters)))
+        for symbol in states:
+            self.lines.append("    %s = states[..., %i]" % (replacements[symbol], self.state_names.index(str(symbol))))
+        for matrix_name, row, column, symbol in matrix_entries:
+            self.lines.append("    %s = %s[..., %i, %i]" % (replacements[symbol], matrix_name, row, column))
+        for symbol, expression in subexpressions:
+            self.lines.append("    %s = %s" % (symbol, printer.doprint(expression)))
+        for variable_name, matrix, is_symmetric in outputs:
+            self.lines.append("    %s = numpy.zeros(numpy.shape(P)[:-2] + %s)" % (variable_name, self.get_shape(matrix)))
+            for index, expression in self.get_output_entries(matrix, is_symmetric):
+                self.lines.append("    %s[..., %s] = %s" % (variable_name, self.format_index(index), printer.doprint(expression)))
+                if is_symmetric and index[0] != index[1]:
+                    self.lines.append("    %s[..., %i, %i] = %s[..., %i, %i]" % (variable_name, index[1], index[0], variable_name, index[0], index[1]))
+        self.lines.append("    return " + return_values + "\n")
+
+        # scalar kernel looping over the filters which can be compiled with numba,
+        # the inputs are broadcast to the batch as first dimension by its wrapper
+        if comment is not None:
+            self.lines.append("# " + comment + ", loop over the filters")
+        self.lines.append("def %s_kernel(%s):" % (name, ", ".join(parameters)))
+        self.lines.append("    n_filters = P.shape[0]")
+        for matrix_name in matrix_names:
+            self.lines.append("    %s = numpy.asarray(%s, dtype=numpy.float64)" % (matrix_name, matrix_name))
+            self.lines.append("    %s = numpy.broadcast_to(%s, (n_filters,) + %s.shape[-2:])" % (matrix_name, matrix_name, matrix_name))
+        for symbol in scalars:
+            self.lines.append("    %s = numpy.broadcast_to(numpy.asarray(%s, dtype=numpy.float64), (n_filters,))"
+                              % (replacements[symbol], replacements[symbol]))
+        self.lines.append("    return _%s_kernel(%s)\n" % (name, ", ".join(parameters)))
+
+        printer = PythonCodePrinter()
+        indexed = {replacements[symbol]: Symbol(str(replacements[symbol]) + "[index]", real=True) for symbol in scalars}
+        subexpressions = [(symbol, expression.xreplace(indexed)) for symbol, expression in subexpressions]
+        outputs = [(variable_name, matrix.xreplace(indexed), is_symmetric) for variable_name, matrix, is_symmetric in outputs]
+        self.lines.append("@jit")
+        self.lines.append("def _%s_kernel(%s):" % (name, ", ".join(parameters)))
+        self.lines.append("    n_filters = P.shape[0]")
+        for variable_name, matrix, is_symmetric in outputs:
+            self.lines.append("    %s = numpy.zeros((n_filters,) + %s)" % (variable_name, self.get_shape(matrix)))
+        self.lines.append("    for index in range(n_filters):")
+        for symbol in states:
+            self.lines.append("        %s = states[index, %i]" % (replacements[symbol], self.state_names.index(str(symbol))))
+        for matrix_name, row, column, symbol in matrix_entries:
+            self.lines.append("        %s = %s[index, %i, %i]" % (replacements[symbol], matrix_name, row, column))
+        for symbol, expression in subexpressions:
+            self.lines.append("        %s = %s" % (symbol, printer.doprint(expression)))
+        for variable_name, matrix, is_symmetric in outputs:
+            for index, expression in self.get_output_entries(matrix, is_symmetric):
+                self.lines.append("        %s[index, %s] = %s" % (variable_name, self.format_index(index), printer.doprint(expression)))
+                if is_symmetric and index[0] != index[1]:
+                    self.lines.append("        %s[index, %i, %i] = %s[index, %i, %i]" % (variable_name, index[1], index[0], variable_name, index[0], index[1]))
+        self.lines.append("    return " + return_values + "\n")
+
+    def get_shape(self, matrix):
+        if matrix.shape[0] == 1 or matrix.shape[1] == 1:
+            return "(%i,)" % len(matrix)
+
+        return "(%i, %i)" % matrix.shape
+
+    def format_index(self, index):
+        return ", ".join(str(item) for item in index)
+
+    # returns the index and the expression of each output entry, the outputs are
+    # zero initialised so the entries which are structurally zero are skipped
+    def get_output_entries(self, matrix, is_symmetric):
+        entries = []
+        if matrix.shape[0] == 1 or matrix.shape[1] == 1:
+            for i in range(len(matrix)):
+                if matrix[i] != 0:
+                    entries.append(((i,), matrix[i]))
+        else:
+            for j in range(matrix.shape[1]):
+                for i in range(matrix.shape[0]):
+                    if (j >= i or not is_symmetric) and matrix[i,j] != 0:
+                        entries.append(((i, j), matrix[i,j]))
 
-        write_string = write_string + "\n\n"
-        self.file.write(write_string)
+        return entries
 
     def close(self):
-        self.file.close()
+        write_file_if_changed(self.file_name, "\n".join(self.lines))
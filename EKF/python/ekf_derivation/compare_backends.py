@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Timing and numerical comparison of the sympy and symengine backends.
+
+Each stage of the EKF derivation is run with both backends: the state
+propagation Jacobians, the covariance prediction products, the observation
+Jacobians and Kalman gains and the cse of each of them. The wind estimator
+and terrain estimator derivations are run with both backends, their files
+are written to temporary directories and evaluated from the C code.
+
+The equations of both backends are evaluated at random inputs and must
+agree within the tolerance, the script exits with an error otherwise.
+
+Run from this directory:
+python3 compare_backends.py
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+import zlib
+
+from sympy import Float, Matrix, Pow, atan2, cos, parse_expr, sin, sqrt
+from sympy.core.cache import clear_cache
+import sympy
+
+from cost_model import get_file_cost
+from derivation_cache import set_cache
+from derivation_runner import run_derivation
+from main import (create_ekf_model, derive_terrain_flow, get_observation_jacobian_and_gain, get_observation_models,
+                  predict_covariance_upper_triangle, simplify_covariance_prediction, wind_est_derivation)
+from strength_reduction import evaluate
+from symbolic_backend import BACKENDS, cse, set_backend
+
+# value of an input symbol, the same for all backends and samples of the same index
+def get_input_value(name, sample):
+    return Float(random.Random(zlib.crc32(name.encode()) + sample).uniform(0.5, 1.5))
+
+def get_max_relative_difference(results, samples):
+    reference_subexpressions, reference_outputs = results[0]
+    temporaries = set()
+    inputs = set()
+    for subexpressions, outputs in results:
+        temporaries |= {item[0] for item in subexpressions}
+        for expression in [item[1] for item in subexpressions] + list(outputs):
+            inputs |= expression.free_symbols
+    inputs -= temporaries
+
+    difference = 0.0
+    for sample in range(samples):
+        values = {symbol: get_input_value(symbol.name, sample) for symbol in inputs}
+        expected = evaluate(reference_subexpressions, reference_outputs, values)
+        for subexpressions, outputs in results[1:]:
+            result = evaluate(subexpressions, outputs, values)
+            for index in range(len(expected)):
+                difference = max(difference, abs(result[index] - expected[index]) / max(1.0, abs(expected[index])))
+
+    return difference
+
+def run_stage(function, *args):
+    clear_cache()
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = function(*args)
+
+    return result, time.perf_counter() - start_time
+
+# timings and equations of each stage of the EKF derivation
+def compare_ekf(backends, models, samples):
+    timings = {}
+    equations = {}
+    for backend in backends:
+        set_backend(backend)
+
+        model, timings[("ekf", "state propagation jacobians"), backend] = run_stage(create_ekf_model)
+
+        P_new, timings[("ekf", "covariance prediction products"), backend] = run_stage(
+            predict_covariance_upper_triangle, model.P, model.A, model.G, model.var_u)
+        result, timings[("ekf", "covariance prediction cse"), backend] = run_stage(simplify_covariance_prediction, P_new)
+        n_states = P_new.shape[0]
+        outputs = [result[1][0][row,column] for column in range(n_states) for row in range(column + 1)]
+        equations.setdefault(("ekf", "covariance prediction cse"), []).append((result[0], outputs))
+
+        for name, observation, obs_var, kwargs in get_observation_models(model):
+            if models and name not in models:
+                continue
+            (H, K), timings[("ekf", name + " jacobian and gain"), backend] = run_stage(
+                get_observation_jacobian_and_gain, model.P, model.state, observation, obs_var)
+            result, timings[("ekf", name + " cse"), backend] = run_stage(
+                cse, Matrix([H.transpose(), K]), sympy.symbols("HK0:1000"), 'basic')
+            equations.setdefault(("ekf", name + " cse"), []).append((result[0], list(result[1][0])))
+
+    differences = {}
+    operations = {}
+    for stage, results in equations.items():
+        differences[stage] = get_max_relative_difference(results, samples)
+        operations[stage] = [get_file_cost([result])["total_operations"] for result in results]
+
+    return timings, differences, operations
+
+# symbols of the matrix entries and arrays of the generated files, e.g. _P(0,1) or q_att[0]
+def get_identifier(match):
+    return "%s__%s" % (match.group(1), "_".join(item for item in match.groups()[1:] if item is not None))
+
+C_FUNCTIONS = {"powf": Pow, "sqrtf": sqrt, "sinf": sin, "cosf": cos, "atan2f": atan2, "sq": lambda x: x**2}
+
+def parse_statement_expression(expression):
+    expression = re.sub(r"(\d\.?\d*(?:[eE][-+]?\d+)?)F\b", r"\1", expression)
+    expression = re.sub(r"([A-Za-z_]\w*)\((\d+),(\d+)\)", get_identifier, expression)
+    expression = re.sub(r"([A-Za-z_]\w*)\[(\d+)\]()", get_identifier, expression)
+    expression = re.sub(r"\b(?!%s\b)([A-Za-z_]\w*)\((\d+)\)()" % "\b|".join(C_FUNCTIONS), get_identifier, expression)
+
+    return parse_expr(expression, local_dict=dict(C_FUNCTIONS), evaluate=False)
+
+# evaluate the statements of a file written by the CodeGenerator,
+# returns the last value assigned to each output
+def evaluate_generated_file(file_name, sample):
+    values = {}
+    outputs = {}
+    with open(file_name) as file:
+        for line in file:
+            match = re.match(r"^(const float )?(.+?) = (.+);$", line.strip())
+            if not match:
+                continue
+            target = parse_statement_expression(match.group(2))
+            expression = parse_statement_expression(match.group(3))
+            for symbol in expression.free_symbols:
+                if symbol not in values:
+                    values[symbol] = get_input_value(symbol.name, sample)
+            values[target] = expression.xreplace(values).evalf()
+            # the temporaries differ between the backends
+            if not match.group(1):
+                outputs[target.name] = complex(values[target])
+
+    return outputs
+
+# timings and generated files of the wind estimator and terrain estimator derivations
+def compare_derivations(backends, samples):
+    timings = {}
+    differences = {}
+    for group, module, model in [("wind", wind_est_derivation, wind_est_derivation.create_wind_model()),
+                                 ("terrain", derive_terrain_flow, derive_terrain_flow.create_terrain_model())]:
+        file_outputs = {}
+        for backend in backends:
+            set_backend(backend)
+            with tempfile.TemporaryDirectory() as directory:
+                for derivation in module.get_derivations(model, directory):
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        result = run_derivation(derivation)
+                    timings[(group, derivation[0]), backend] = result[1]
+
+                for file_name in sorted(os.listdir(directory)):
+                    file_outputs.setdefault(file_name, []).append(
+                        [evaluate_generated_file(os.path.join(directory, file_name), sample) for sample in range(samples)])
+
+        for file_name, results in file_outputs.items():
+            difference = 0.0
+            for result in results[1:]:
+                for sample in range(samples):
+                    assert result[sample].keys() == results[0][sample].keys(), "different outputs in " + file_name
+                    for name, value in result[sample].items():
+                        expected = results[0][sample][name]
+                        difference = max(difference, abs(value - expected) / max(1.0, abs(expected)))
+            differences[(group, file_name)] = difference
+
+    return timings, differences
+
+def format_timings(timings, backends):
+    stages = []
+    for stage, backend in timings:
+        if stage not in stages:
+            stages.append(stage)
+
+    name_width = max(len("stage"), max(len("%s: %s" % stage) for stage in stages)) + 2
+    header = "stage".ljust(name_width) + "".join("%12s" % backend for backend in backends) + "%10s" % "speedup"
+    lines = [header, "-" * len(header)]
+    for stage in stages:
+        durations = [timings.get((stage, backend)) for backend in backends]
+        line = ("%s: %s" % stage).ljust(name_width) + "".join("%10.3f s" % duration for duration in durations)
+        if len(durations) > 1 and durations[-1] > 0:
+            line += "%9.1fx" % (durations[0] / durations[-1])
+        lines.append(line)
+
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the timing and the equations of the symbolic backends')
+    parser.add_argument('--models', nargs='+',
+                        help='names of the EKF observation models to compare (default: all)')
+    parser.add_argument('--samples', type=int, default=3,
+                        help='number of random inputs at which the equations are compared (default: 3)')
+    parser.add_argument('--tolerance', type=float, default=1e-9,
+                        help='largest relative difference of the equations (default: 1e-9)')
+    parser.add_argument('--no-scripts', action='store_true',
+                        help='only compare the EKF derivation, not the wind estimator and terrain estimator derivations')
+    options = parser.parse_args()
+
+    # the derivations are timed without the derivation cache
+    set_cache(None)
+    backends = list(BACKENDS)
+
+    timings, differences, operations = compare_ekf(backends, options.models, options.samples)
+    if not options.no_scripts:
+        script_timings, script_differences = compare_derivations(backends, options.samples)
+        timings.update(script_timings)
+        differences.update(script_differences)
+
+    print(format_timings(timings, backends))
+    print()
+    print("largest relative difference of the equations, total operations (%s):" % ", ".join(backends))
+    n_failed = 0
+    name_width = max(len("%s: %s" % stage) for stage in differences) + 2
+    for stage, difference in differences.items():
+        failed = difference > options.tolerance
+        n_failed += failed
+        line = ("%s: %s" % stage).ljust(name_width) + "%10.2e" % difference
+        if stage in operations:
+            line += "".join("%8i" % count for count in operations[stage])
+        print(line + ("  FAIL" if failed else ""))
+
+    if n_failed:
+        print('%i equations differ between the backends' % n_failed)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
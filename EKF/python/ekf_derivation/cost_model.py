@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Operation count cost model for the generated code.
+
+The operations are counted on the expressions passed to ccode, following the
+way ccode prints them: an Add of n terms costs n-1 additions, the factors of
+a Mul are split into a numerator and a denominator with a single division,
+constant factors are folded by the compiler. The number of stack floats is
+estimated as the largest number of sub expressions which are live at the
+same time.
+
+The legacy matlab equations of the *_compare.cpp files are counted from the
+C source, loops are counted once.
+"""
+import json
+import os
+import re
+
+from sympy import Pow, atan, atan2, acos, asin, cos, sin, tan
+from sympy.core.function import Application
+
+OPERATION_TYPES = ("add", "mul", "div", "neg", "pow", "sqrt", "trig", "other")
+
+TRIG_FUNCTIONS = (sin, cos, tan, asin, acos, atan, atan2)
+
+C_FUNCTION_TYPES = {
+    "sqrt": "sqrt", "sqrtf": "sqrt",
+    "pow": "pow", "powf": "pow", "ecl::powf": "pow",
+    "sin": "trig", "sinf": "trig", "cos": "trig", "cosf": "trig", "tan": "trig", "tanf": "trig",
+    "asin": "trig", "asinf": "trig", "acos": "trig", "acosf": "trig",
+    "atan": "trig", "atanf": "trig", "atan2": "trig", "atan2f": "trig",
+    "fabsf": "other", "fabs": "other", "expf": "other", "logf": "other",
+}
+
+def create_operation_counts():
+    return dict.fromkeys(OPERATION_TYPES, 0)
+
+def get_total_operations(counts):
+    return sum(counts[operation] for operation in OPERATION_TYPES)
+
+def count_operations(expression, counts=None, is_term=False):
+    if counts is None:
+        counts = create_operation_counts()
+
+    if expression.is_Atom:
+        return counts
+
+    if expression.is_Add:
+        counts["add"] += len(expression.args) - 1
+        # negative terms are printed as a subtraction, only negate if all are
+        if all(arg.could_extract_minus_sign() for arg in expression.args):
+            counts["neg"] += 1
+        for arg in expression.args:
+            count_operations(arg, counts, is_term=True)
+
+    elif expression.is_Mul:
+        numerator = []
+        denominator = []
+        for factor in expression.args:
+            if factor.is_Number and abs(factor) == 1:
+                if factor.is_negative and not is_term:
+                    counts["neg"] += 1
+            elif factor.is_Pow and factor.exp.is_Rational and factor.exp.is_negative:
+                denominator.append(Pow(factor.base, -factor.exp, evaluate=False))
+            else:
+                numerator.append(factor)
+
+        counts["mul"] += max(len(numerator) - 1, 0) + max(len(denominator) - 1, 0)
+        if denominator:
+            counts["div"] += 1
+        for factor in numerator + denominator:
+            count_operations(factor, counts)
+
+    elif expression.is_Pow:
+        if expression.exp == 1:
+            pass
+        elif expression.exp == -1:
+            counts["div"] += 1
+        elif expression.exp.is_Integer and expression.exp < 0:
+            counts["div"] += 1
+            counts["pow"] += 1
+        elif expression.exp.is_Rational and expression.exp.q == 2 and expression.exp.p == 1:
+            counts["sqrt"] += 1
+        else:
+            counts["pow"] += 1
+        count_operations(expression.base, counts)
+
+    elif isinstance(expression, Application):
+        if expression.func.__name__ == "sq":
+            counts["mul"] += 1
+        elif isinstance(expression, TRIG_FUNCTIONS):
+            counts["trig"] += 1
+        else:
+            counts["other"] += 1
+        for arg in expression.args:
+            count_operations(arg, counts)
+
+    else:
+        for arg in expression.args:
+            count_operations(arg, counts)
+
+    return counts
+
+# largest number of sub expressions which have been computed and are still
+# needed by a later sub expression or output
+def get_peak_live_temporaries(subexpressions, outputs):
+    definitions = {item[0]: index for index, item in enumerate(subexpressions)}
+    last_use = dict(definitions)
+
+    expressions = [item[1] for item in subexpressions] + list(outputs)
+    for step, expression in enumerate(expressions):
+        for symbol in expression.free_symbols:
+            if symbol in definitions:
+                last_use[symbol] = step
+
+    live_changes = [0] * (len(expressions) + 1)
+    for symbol, step in definitions.items():
+        live_changes[step] += 1
+        live_changes[last_use[symbol] + 1] -= 1
+
+    peak = 0
+    live = 0
+    for change in live_changes:
+        live += change
+        peak = max(peak, live)
+
+    return peak
+
+# cost of a generated file, each section is a list of sub expressions followed
+# by the outputs computed from them
+def get_file_cost(sections):
+    counts = create_operation_counts()
+    n_subexpressions = 0
+    n_outputs = 0
+    stack_floats = 0
+
+    for subexpressions, outputs in sections:
+        for item in subexpressions:
+            count_operations(item[1], counts)
+        for expression in outputs:
+            count_operations(expression, counts)
+        n_subexpressions += len(subexpressions)
+        n_outputs += len(outputs)
+        stack_floats = max(stack_floats, get_peak_live_temporaries(subexpressions, outputs))
+
+    return {"operations": counts,
+            "total_operations": get_total_operations(counts),
+            "subexpressions": n_subexpressions,
+            "outputs": n_outputs,
+            "stack_floats": stack_floats}
+
+# remove the statement headers of for, if and while blocks
+def _remove_control_statements(text):
+    result = ""
+    index = 0
+    for match in re.finditer(r"\b(for|if|while)\s*\(", text):
+        if match.start() < index:
+            continue
+        result += text[index:match.start()]
+        depth = 0
+        index = match.end() - 1
+        while index < len(text):
+            if text[index] == "(":
+                depth += 1
+            elif text[index] == ")":
+                depth -= 1
+                if depth == 0:
+                    break
+            index += 1
+        index += 1
+
+    result += text[index:]
+
+    return re.sub(r"\belse\b|[{}]", " ", result)
+
+_C_TOKEN = re.compile(r"\s*(ecl::\w+|[A-Za-z_]\w*|\d+\.?\d*(?:[eE][-+]?\d+)?[fF]?|\.\d+[fF]?|.)")
+
+def count_c_operations(statement, counts):
+    tokens = [token for token in _C_TOKEN.findall(statement) if token.strip()]
+    previous = None
+    for index, token in enumerate(tokens):
+        next_token = tokens[index + 1] if index + 1 < len(tokens) else None
+        if token in C_FUNCTION_TYPES and next_token == "(":
+            counts[C_FUNCTION_TYPES[token]] += 1
+        elif token == "sq" and next_token == "(":
+            counts["mul"] += 1
+        elif token == "+":
+            counts["add"] += 1
+        elif token == "-":
+            is_binary = previous is not None and (previous[0].isalnum() or previous[0] in "_.)]")
+            counts["add" if is_binary else "neg"] += 1
+        elif token == "*":
+            counts["mul"] += 1
+        elif token == "/":
+            counts["div"] += 1
+        previous = token
+
+    return counts
+
+# cost of the legacy matlab generated equations in a *_compare.cpp file
+def get_compare_file_cost(file_name):
+    with open(file_name) as file:
+        lines = file.readlines()
+
+    code = ""
+    is_matlab = False
+    for line in lines:
+        comment = line.split("//", 1)[1].lower() if "//" in line else ""
+        if "matlab generated" in comment and not "compare calculation" in comment:
+            is_matlab = True
+        elif "save output" in comment or "largest" in comment or "sympy" in comment:
+            is_matlab = False
+
+        if is_matlab:
+            code += line.split("//", 1)[0]
+
+    counts = create_operation_counts()
+    stack_floats = 0
+    n_outputs = 0
+    for statement in _remove_control_statements(code).split(";"):
+        for declaration in re.finditer(r"\bfloat\s+\w+\s*(\[\s*(\d+)\s*\])?", statement):
+            stack_floats += int(declaration.group(2)) if declaration.group(2) else 1
+        assignment = re.match(r"\s*[^=]*?[^=<>!]=(?!=)(.*)$", statement, re.DOTALL)
+        if assignment:
+            count_c_operations(assignment.group(1), counts)
+            n_outputs += 1
+
+    return {"operations": counts,
+            "total_operations": get_total_operations(counts),
+            "statements": n_outputs,
+            "stack_floats": stack_floats}
+
+def get_alt_file_name(file_name):
+    return file_name.replace("_generated.cpp", "_generated_alt.cpp")
+
+def get_compare_file_name(file_name, directory):
+    base_name = file_name.replace("_generated.cpp", "")
+    for candidate in (base_name + "_fusion_generated_compare.cpp", base_name + "_generated_compare.cpp"):
+        if os.path.isfile(os.path.join(directory, candidate)):
+            return candidate
+
+    return None
+
+# create the report of all generated files, file_costs maps the file name
+# relative to directory to the cost of that file. variant_files maps the name of
+# a state mask variant to the pairs of variant file and full file it replaces
+def create_report(file_costs, directory, variant_files=None):
+    report = {"files": {}, "alt": {}, "baseline": {}, "variants": {}}
+    for file_name in sorted(file_costs):
+        report["files"][file_name] = file_costs[file_name]
+
+    for variant in sorted(variant_files or {}):
+        report["variants"][variant] = {}
+        for variant_file_name, full_file_name in variant_files[variant]:
+            full_operations = file_costs[full_file_name]["total_operations"]
+            operations = file_costs[variant_file_name]["total_operations"]
+            report["variants"][variant][variant_file_name] = {"file": full_file_name,
+                                                              "total_operations": operations,
+                                                              "full_total_operations": full_operations,
+                                                              "saving": 1.0 - operations / full_operations}
+
+    variant_file_names = {file_name for files in report["variants"].values() for file_name in files}
+    for file_name in sorted(set(file_costs) - variant_file_names):
+        alt_file_name = get_alt_file_name(file_name)
+        if alt_file_name != file_name and alt_file_name in file_costs:
+            report["alt"][file_name] = alt_file_name
+
+        compare_file_name = get_compare_file_name(file_name, directory)
+        if compare_file_name is not None:
+            report["baseline"][file_name] = dict(get_compare_file_cost(os.path.join(directory, compare_file_name)),
+                                                 file=compare_file_name)
+
+    return report
+
+def write_report(report, file_name):
+    with open(file_name, 'w') as file:
+        json.dump(report, file, indent=4, sort_keys=True)
+        file.write("\n")
+
+def format_table(report):
+    rows = []
+    variant_file_names = {file_name for files in report["variants"].values() for file_name in files}
+    for file_name, cost in report["files"].items():
+        if file_name in report["alt"].values() or file_name in variant_file_names:
+            continue
+        rows.append((file_name, cost))
+        if file_name in report["alt"]:
+            alt_file_name = report["alt"][file_name]
+            rows.append(("  alt: " + alt_file_name, report["files"][alt_file_name]))
+        if "before_strength_reduction" in cost:
+            rows.append(("  before strength reduction", cost["before_strength_reduction"]))
+        if file_name in report["baseline"]:
+            rows.append(("  matlab: " + report["baseline"][file_name]["file"], report["baseline"][file_name]))
+
+    name_width = max([len("file")] + [len(name) for name, _ in rows]) + 2
+    columns = OPERATION_TYPES + ("total", "floats")
+    header = "file".ljust(name_width) + "".join("%8s" % column for column in columns)
+    lines = [header, "-" * len(header)]
+
+    for name, cost in rows:
+        values = [cost["operations"][operation] for operation in OPERATION_TYPES]
+        values += [cost["total_operations"], cost["stack_floats"]]
+        lines.append(name.ljust(name_width) + "".join("%8i" % value for value in values))
+
+    return "\n".join(lines)
+
+# operation count of each state mask variant file and of the full equations it replaces
+def format_variant_table(report):
+    rows = []
+    for variant, files in report["variants"].items():
+        for file_name, item in files.items():
+            rows.append((variant, file_name, item))
+
+    name_width = max([len("file")] + [len(file_name) for _, file_name, _ in rows]) + 2
+    variant_width = max([len("variant")] + [len(variant) for variant, _, _ in rows]) + 2
+    header = "variant".ljust(variant_width) + "file".ljust(name_width) + "%8s%8s%8s" % ("full", "total", "saving")
+    lines = [header, "-" * len(header)]
+
+    for variant, file_name, item in rows:
+        lines.append(variant.ljust(variant_width) + file_name.ljust(name_width)
+                     + "%8i%8i%7.1f%%" % (item["full_total_operations"], item["total_operations"], 100.0 * item["saving"]))
+
+    return "\n".join(lines)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+On-disk cache for the results of the symbolic derivations.
+
+Each entry is keyed on a hash of the srepr of the derivation inputs (the
+observation expression, state vector, covariance matrix, variance symbol and
+cse options) so an observation model that did not change is not derived
+again. The key also contains a hash of the source code of the module of the
+derivation and of the modules it is built from, so entries derived by a
+previous version of the derivations are not used. The cached values are the
+cse results, the C code is always written again by the CodeGenerator.
+"""
+import functools
+import hashlib
+import importlib
+import inspect
+import os
+import pickle
+import tempfile
+
+import sympy
+from sympy import srepr
+from symbolic_backend import get_backend_id
+
+# modules of which the source code is part of every key, this module is
+# included as it defines the format of the cached values
+SHARED_MODULES = ("derivation_cache", "derivation_utils", "symbolic_backend")
+
+_cache = None
+
+# returns the hash of the source code of the modules, a tuple of module names
+@functools.lru_cache(maxsize=None)
+def get_source_hash(module_names):
+    source_hash = hashlib.sha256()
+    for module_name in module_names:
+        source_hash.update(inspect.getsource(importlib.import_module(module_name)).encode())
+
+    return source_hash.hexdigest()
+
+class DerivationCache:
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    # module is the name of the module which defines the derivation
+    def make_key(self, module, name, args, kwargs):
+        source_hash = get_source_hash(tuple(sorted(set(SHARED_MODULES + (module,)))))
+        # the backends derive different but equivalent sub expressions
+        key_string = "%s\n%s\n%s\n%s.%s\n%s\n%s" % (source_hash, sympy.__version__, get_backend_id(), module, name,
+                                                   srepr(args), srepr(sorted(kwargs.items())))
+        return hashlib.sha256(key_string.encode()).hexdigest()
+
+    def get_path(self, key):
+        return os.path.join(self.directory, key + ".pickle")
+
+    def load(self, key):
+        try:
+            with open(self.get_path(key), 'rb') as file:
+                return True, pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False, None
+
+    def store(self, key, value):
+        os.makedirs(self.directory, exist_ok=True)
+        # write to a temporary file first, parallel jobs may store the same entry
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, 'wb') as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.get_path(key))
+
+    def get_stats(self):
+        entries = 0
+        size = 0
+        if os.path.isdir(self.directory):
+            for file_name in os.listdir(self.directory):
+                if file_name.endswith(".pickle"):
+                    entries += 1
+                    size += os.path.getsize(os.path.join(self.directory, file_name))
+
+        return {"directory": os.path.abspath(self.directory), "entries": entries, "size_bytes": size}
+
+    def clear(self):
+        if os.path.isdir(self.directory):
+            for file_name in os.listdir(self.directory):
+                if file_name.endswith(".pickle") or file_name.endswith(".tmp"):
+                    os.remove(os.path.join(self.directory, file_name))
+
+# set the cache used by the decorated derivations, None disables caching
+def set_cache(cache):
+    global _cache
+    _cache = cache
+
+def get_cache():
+    return _cache
+
+# returns the number of cache hits and misses of this process
+def get_counters():
+    if _cache is None:
+        return 0, 0
+
+    return _cache.hits, _cache.misses
+
+# decorator for derivation functions whose arguments are sympy objects or
+# plain python values and whose result can be pickled
+def cached_derivation(function):
+    module = function.__module__
+    name = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        cache = _cache
+        if cache is None:
+            return function(*args, **kwargs)
+
+        key = cache.make_key(module, name, args, kwargs)
+        found, value = cache.load(key)
+        if found:
+            cache.hits += 1
+            return value
+
+        cache.misses += 1
+        value = function(*args, **kwargs)
+        cache.store(key, value)
+
+        return value
+
+    return wrapper
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Runs the derivations of the EKF, wind estimator and terrain estimator.
+
+A derivation is a tuple of its name, a function and the arguments of the
+function. The wind estimator and terrain estimator derivations are modules
+next to the code they generate, load_derivation_module() loads them from
+their files so they can import the modules of this directory.
+"""
+import importlib.util
+import os
+import sys
+import time
+
+from sympy.core.cache import clear_cache
+from code_gen import clear_file_costs, get_file_costs, set_strength_reduction
+from derivation_cache import get_counters, set_cache
+from profiler import clear_records, get_records, profile_stage, set_profiling
+from symbolic_backend import set_backend
+
+# loads the module of a file once and registers it under the name of the file, so
+# the worker processes find the functions of its derivations when they are unpickled
+def load_derivation_module(file_name):
+    name = os.path.splitext(os.path.basename(file_name))[0]
+    if name not in sys.modules:
+        specification = importlib.util.spec_from_file_location(name, file_name)
+        module = importlib.util.module_from_spec(specification)
+        sys.modules[name] = module
+        try:
+            specification.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+
+    return sys.modules[name]
+
+# run a single derivation, returns its name, wall time in seconds, the number
+# of cache hits and misses, the operation counts of the generated files, the
+# value returned by the derivation and the profile records of its stages
+def run_derivation(derivation):
+    name, function, args = derivation
+    hits, misses = get_counters()
+    clear_file_costs()
+    clear_records()
+    # the order of the cse sub expressions depends on the expressions already in the
+    # sympy cache, start each derivation from an empty cache so that the generated
+    # code does not depend on which derivations ran before it in the same process
+    clear_cache()
+    start_time = time.perf_counter()
+    with profile_stage(name):
+        value = function(*args)
+    duration = time.perf_counter() - start_time
+    hits_end, misses_end = get_counters()
+
+    return name, duration, hits_end - hits, misses_end - misses, get_file_costs(), value, get_records()
+
+def print_derivation_result(result, cache):
+    name, duration, hits, misses = result[:4]
+    if cache is None:
+        print('Generated %s code in %.1f s' % (name, duration))
+    else:
+        print('Generated %s code in %.1f s (cache hits: %i, misses: %i)' % (name, duration, hits, misses))
+
+    return hits, misses
+
+# profiling is a tuple of the arguments of set_profiling()
+def initialise_process(cache, strength_reduction, backend="sympy", profiling=(False,)):
+    set_cache(cache)
+    set_strength_reduction(strength_reduction)
+    set_backend(backend)
+    set_profiling(*profiling)
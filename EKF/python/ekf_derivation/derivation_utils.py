@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Symbolic primitives shared by the EKF, wind estimator and terrain estimator
+derivations.
+
+The rotation matrices, covariance matrices and Jacobians are memoised on
+their inputs for the lifetime of the process, so the derivations which run
+in the same process share them.
+"""
+import functools
+
+from sympy import ImmutableMatrix, Matrix, Symbol, srepr
+from derivation_cache import cached_derivation
+from symbolic_backend import cse, get_backend
+import symbolic_backend
+
+cached_cse = cached_derivation(cse)
+
+# memoise a function of sympy objects and plain python values returning an immutable
+# sympy object. The arguments are keyed on their srepr, which contains the type and
+# assumptions of every node: arguments such as 2 and 2.0 or symbols with different
+# assumptions can compare or hash equal but derive different equations
+def memoised(function):
+    memo = {}
+
+    @functools.wraps(function)
+    def wrapper(*args):
+        key = srepr(args)
+        if key not in memo:
+            memo[key] = function(*args)
+
+        return memo[key]
+
+    return wrapper
+
+@memoised
+def get_rotation_matrix(q):
+    q0 = q[0]
+    q1 = q[1]
+    q2 = q[2]
+    q3 = q[3]
+
+    Rot = ImmutableMatrix([[q0**2 + q1**2 - q2**2 - q3**2, 2*(q1*q2 - q0*q3), 2*(q1*q3 + q0*q2)],
+                           [2*(q1*q2 + q0*q3), q0**2 - q1**2 + q2**2 - q3**2, 2*(q2*q3 - q0*q1)],
+                           [2*(q1*q3-q0*q2), 2*(q2*q3 + q0*q1), q0**2 - q1**2 - q2**2 + q3**2]])
+
+    return Rot
+
+# q: quaternion describing rotation from frame 1 to frame 2
+# returns a rotation matrix derived form q which describes the same
+# rotation
+def quat2Rot(q):
+    return Matrix(get_rotation_matrix(tuple(q)))
+
+@memoised
+def get_quaternion_product(p,q):
+    r = ImmutableMatrix([p[0] * q[0] - p[1] * q[1] - p[2] * q[2] - p[3] * q[3],
+                         p[0] * q[1] + p[1] * q[0] + p[2] * q[3] - p[3] * q[2],
+                         p[0] * q[2] - p[1] * q[3] + p[2] * q[0] + p[3] * q[1],
+                         p[0] * q[3] + p[1] * q[2] - p[2] * q[1] + p[3] * q[0]])
+
+    return r
+
+def quat_mult(p,q):
+    return Matrix(get_quaternion_product(tuple(p), tuple(q)))
+
+def create_cov_matrix(i, j, name="P"):
+    if j >= i:
+        return Symbol(name + "(" + str(i) + "," + str(j) + ")", real=True)
+        # legacy array format
+        # return Symbol(name + "[" + str(i) + "][" + str(j) + "]", real=True)
+    else:
+        return 0
+
+@memoised
+def get_symmetric_cov_matrix(n_states, name):
+    # define a symbolic covariance matrix
+    P = Matrix(n_states,n_states,lambda i, j: create_cov_matrix(i, j, name))
+
+    for index in range(n_states):
+        for j in range(n_states):
+            if index > j:
+                P[index,j] = P[j,index]
+
+    return ImmutableMatrix(P)
+
+# symmetric covariance matrix of the symbols name(i,j) of the upper triangle
+def create_symmetric_cov_matrix(n_states=24, name="P"):
+    return Matrix(get_symmetric_cov_matrix(n_states, name))
+
+@memoised
+def get_jacobian(backend, expressions, variables):
+    return ImmutableMatrix(symbolic_backend.jacobian(expressions, variables))
+
+# Jacobian of the symbolic backend, memoised on the expressions and variables
+def jacobian(expressions, variables):
+    return Matrix(get_jacobian(get_backend(), ImmutableMatrix(expressions), ImmutableMatrix(variables)))
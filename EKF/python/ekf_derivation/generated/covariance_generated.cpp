@@ -36,256 +36,237 @@ const float PS33 = P(0,0) + P(0,10)*PS6 + P(0,11)*PS7 + P(0,12)*PS9 - PS30 - PS3
 const float PS34 = 0.5F*q0;
 const float PS35 = q2*q3;
 const float PS36 = q0*q1;
-const float PS37 = q1*q3;
-const float PS38 = q0*q2;
-const float PS39 = q1*q2;
-const float PS40 = q0*q3;
-const float PS41 = -PS2;
-const float PS42 = powf(q0, 2);
-const float PS43 = -PS4 + PS42;
-const float PS44 = PS0 + PS41 + PS43;
-const float PS45 = P(0,13) - P(1,13)*PS11 + P(10,13)*PS6 + P(11,13)*PS7 + P(12,13)*PS9 - P(2,13)*PS12 - P(3,13)*PS13;
-const float PS46 = PS37 + PS38;
-const float PS47 = P(0,15) - P(1,15)*PS11 + P(10,15)*PS6 + P(11,15)*PS7 + P(12,15)*PS9 - P(2,15)*PS12 - P(3,15)*PS13;
-const float PS48 = 2*PS47;
-const float PS49 = dvy - dvy_b;
-const float PS50 = dvx - dvx_b;
-const float PS51 = dvz - dvz_b;
-const float PS52 = PS49*q0 + PS50*q3 - PS51*q1;
-const float PS53 = 2*PS29;
-const float PS54 = -PS39 + PS40;
-const float PS55 = P(0,14) - P(1,14)*PS11 + P(10,14)*PS6 + P(11,14)*PS7 + P(12,14)*PS9 - P(2,14)*PS12 - P(3,14)*PS13;
-const float PS56 = 2*PS55;
-const float PS57 = -PS49*q3 + PS50*q0 + PS51*q2;
-const float PS58 = 2*PS33;
-const float PS59 = PS49*q1 - PS50*q2 + PS51*q0;
-const float PS60 = 2*PS59;
-const float PS61 = PS49*q2 + PS50*q1 + PS51*q3;
-const float PS62 = 2*PS61;
-const float PS63 = P(0,4) - P(1,4)*PS11 - P(2,4)*PS12 - P(3,4)*PS13 + P(4,10)*PS6 + P(4,11)*PS7 + P(4,12)*PS9;
-const float PS64 = -PS0;
-const float PS65 = PS2 + PS43 + PS64;
-const float PS66 = PS39 + PS40;
-const float PS67 = 2*PS45;
-const float PS68 = -PS35 + PS36;
-const float PS69 = P(0,5) - P(1,5)*PS11 - P(2,5)*PS12 - P(3,5)*PS13 + P(5,10)*PS6 + P(5,11)*PS7 + P(5,12)*PS9;
-const float PS70 = PS4 + PS41 + PS42 + PS64;
-const float PS71 = PS35 + PS36;
-const float PS72 = 2*PS57;
-const float PS73 = -PS37 + PS38;
-const float PS74 = 2*PS52;
-const float PS75 = P(0,6) - P(1,6)*PS11 - P(2,6)*PS12 - P(3,6)*PS13 + P(6,10)*PS6 + P(6,11)*PS7 + P(6,12)*PS9;
-const float PS76 = -P(10,11)*PS34;
-const float PS77 = P(0,11)*PS11 + P(1,11) + P(11,11)*PS9 + P(2,11)*PS13 - P(3,11)*PS12 - PS19 + PS76;
-const float PS78 = P(0,2)*PS13;
-const float PS79 = P(0,3)*PS12;
-const float PS80 = P(0,0)*PS11 + P(0,1) - P(0,10)*PS34 + P(0,11)*PS9 - P(0,12)*PS7 + PS78 - PS79;
-const float PS81 = P(0,2)*PS11;
-const float PS82 = P(1,2) - P(2,10)*PS34 + P(2,11)*PS9 - P(2,12)*PS7 + P(2,2)*PS13 + PS28 + PS81;
-const float PS83 = P(10,11)*PS9;
-const float PS84 = P(10,12)*PS7;
-const float PS85 = P(0,10)*PS11 + P(1,10) - P(10,10)*PS34 + P(2,10)*PS13 - P(3,10)*PS12 + PS83 - PS84;
-const float PS86 = -P(10,12)*PS34;
-const float PS87 = P(0,12)*PS11 + P(1,12) - P(12,12)*PS7 + P(2,12)*PS13 - P(3,12)*PS12 + PS16 + PS86;
-const float PS88 = P(0,3)*PS11;
-const float PS89 = P(1,3) - P(3,10)*PS34 + P(3,11)*PS9 - P(3,12)*PS7 - P(3,3)*PS12 + PS25 + PS88;
-const float PS90 = P(1,2)*PS13;
-const float PS91 = P(1,3)*PS12;
-const float PS92 = P(1,1) - P(1,10)*PS34 + P(1,11)*PS9 - P(1,12)*PS7 + PS30 + PS90 - PS91;
-const float PS93 = P(0,13)*PS11 + P(1,13) - P(10,13)*PS34 + P(11,13)*PS9 - P(12,13)*PS7 + P(2,13)*PS13 - P(3,13)*PS12;
-const float PS94 = P(0,15)*PS11 + P(1,15) - P(10,15)*PS34 + P(11,15)*PS9 - P(12,15)*PS7 + P(2,15)*PS13 - P(3,15)*PS12;
-const float PS95 = 2*PS94;
-const float PS96 = P(0,14)*PS11 + P(1,14) - P(10,14)*PS34 + P(11,14)*PS9 - P(12,14)*PS7 + P(2,14)*PS13 - P(3,14)*PS12;
-const float PS97 = 2*PS96;
-const float PS98 = P(0,4)*PS11 + P(1,4) + P(2,4)*PS13 - P(3,4)*PS12 - P(4,10)*PS34 + P(4,11)*PS9 - P(4,12)*PS7;
-const float PS99 = 2*PS93;
-const float PS100 = P(0,5)*PS11 + P(1,5) + P(2,5)*PS13 - P(3,5)*PS12 - P(5,10)*PS34 + P(5,11)*PS9 - P(5,12)*PS7;
-const float PS101 = P(0,6)*PS11 + P(1,6) + P(2,6)*PS13 - P(3,6)*PS12 - P(6,10)*PS34 + P(6,11)*PS9 - P(6,12)*PS7;
-const float PS102 = -P(11,12)*PS34;
-const float PS103 = P(0,12)*PS12 - P(1,12)*PS13 + P(12,12)*PS6 + P(2,12) + P(3,12)*PS11 - PS10 + PS102;
-const float PS104 = P(2,3) - P(3,10)*PS9 - P(3,11)*PS34 + P(3,12)*PS6 + P(3,3)*PS11 + PS22 + PS79;
-const float PS105 = P(0,1)*PS13;
-const float PS106 = P(0,0)*PS12 - P(0,10)*PS9 - P(0,11)*PS34 + P(0,12)*PS6 + P(0,2) - PS105 + PS88;
-const float PS107 = P(11,12)*PS6;
-const float PS108 = P(0,11)*PS12 - P(1,11)*PS13 - P(11,11)*PS34 + P(2,11) + P(3,11)*PS11 + PS107 - PS83;
-const float PS109 = P(0,10)*PS12 - P(1,10)*PS13 - P(10,10)*PS9 + P(2,10) + P(3,10)*PS11 + PS18 + PS76;
-const float PS110 = P(0,1)*PS12;
-const float PS111 = -P(1,1)*PS13 - P(1,10)*PS9 - P(1,11)*PS34 + P(1,12)*PS6 + P(1,2) + PS110 + PS27;
-const float PS112 = P(2,3)*PS11;
-const float PS113 = -P(2,10)*PS9 - P(2,11)*PS34 + P(2,12)*PS6 + P(2,2) + PS112 + PS31 - PS90;
-const float PS114 = P(0,13)*PS12 - P(1,13)*PS13 - P(10,13)*PS9 - P(11,13)*PS34 + P(12,13)*PS6 + P(2,13) + P(3,13)*PS11;
-const float PS115 = P(0,15)*PS12 - P(1,15)*PS13 - P(10,15)*PS9 - P(11,15)*PS34 + P(12,15)*PS6 + P(2,15) + P(3,15)*PS11;
-const float PS116 = 2*PS115;
-const float PS117 = P(0,14)*PS12 - P(1,14)*PS13 - P(10,14)*PS9 - P(11,14)*PS34 + P(12,14)*PS6 + P(2,14) + P(3,14)*PS11;
-const float PS118 = 2*PS117;
-const float PS119 = P(0,4)*PS12 - P(1,4)*PS13 + P(2,4) + P(3,4)*PS11 - P(4,10)*PS9 - P(4,11)*PS34 + P(4,12)*PS6;
-const float PS120 = 2*PS114;
-const float PS121 = P(0,5)*PS12 - P(1,5)*PS13 + P(2,5) + P(3,5)*PS11 - P(5,10)*PS9 - P(5,11)*PS34 + P(5,12)*PS6;
-const float PS122 = P(0,6)*PS12 - P(1,6)*PS13 + P(2,6) + P(3,6)*PS11 - P(6,10)*PS9 - P(6,11)*PS34 + P(6,12)*PS6;
-const float PS123 = P(0,10)*PS13 + P(1,10)*PS12 + P(10,10)*PS7 - P(2,10)*PS11 + P(3,10) - PS15 + PS86;
-const float PS124 = P(1,1)*PS12 + P(1,10)*PS7 - P(1,11)*PS6 - P(1,12)*PS34 + P(1,3) + PS105 + PS24;
-const float PS125 = P(0,0)*PS13 + P(0,10)*PS7 - P(0,11)*PS6 - P(0,12)*PS34 + P(0,3) + PS110 - PS81;
-const float PS126 = P(0,12)*PS13 + P(1,12)*PS12 - P(12,12)*PS34 - P(2,12)*PS11 + P(3,12) - PS107 + PS84;
-const float PS127 = P(0,11)*PS13 + P(1,11)*PS12 - P(11,11)*PS6 - P(2,11)*PS11 + P(3,11) + PS102 + PS8;
-const float PS128 = P(2,10)*PS7 - P(2,11)*PS6 - P(2,12)*PS34 - P(2,2)*PS11 + P(2,3) + PS21 + PS78;
-const float PS129 = P(3,10)*PS7 - P(3,11)*PS6 - P(3,12)*PS34 + P(3,3) - PS112 + PS32 + PS91;
-const float PS130 = P(0,13)*PS13 + P(1,13)*PS12 + P(10,13)*PS7 - P(11,13)*PS6 - P(12,13)*PS34 - P(2,13)*PS11 + P(3,13);
-const float PS131 = P(0,15)*PS13 + P(1,15)*PS12 + P(10,15)*PS7 - P(11,15)*PS6 - P(12,15)*PS34 - P(2,15)*PS11 + P(3,15);
-const float PS132 = 2*PS131;
-const float PS133 = P(0,14)*PS13 + P(1,14)*PS12 + P(10,14)*PS7 - P(11,14)*PS6 - P(12,14)*PS34 - P(2,14)*PS11 + P(3,14);
-const float PS134 = 2*PS133;
-const float PS135 = P(0,4)*PS13 + P(1,4)*PS12 - P(2,4)*PS11 + P(3,4) + P(4,10)*PS7 - P(4,11)*PS6 - P(4,12)*PS34;
-const float PS136 = 2*PS130;
-const float PS137 = P(0,5)*PS13 + P(1,5)*PS12 - P(2,5)*PS11 + P(3,5) + P(5,10)*PS7 - P(5,11)*PS6 - P(5,12)*PS34;
-const float PS138 = P(0,6)*PS13 + P(1,6)*PS12 - P(2,6)*PS11 + P(3,6) + P(6,10)*PS7 - P(6,11)*PS6 - P(6,12)*PS34;
-const float PS139 = 2*PS46;
-const float PS140 = 2*PS54;
-const float PS141 = P(0,13)*PS72 + P(1,13)*PS62 - P(13,13)*PS44 + P(13,14)*PS140 - P(13,15)*PS139 + P(2,13)*PS60 - P(3,13)*PS74 + P(4,13);
-const float PS142 = P(0,15)*PS72 + P(1,15)*PS62 - P(13,15)*PS44 + P(14,15)*PS140 - P(15,15)*PS139 + P(2,15)*PS60 - P(3,15)*PS74 + P(4,15);
-const float PS143 = P(1,3)*PS62;
-const float PS144 = P(0,3)*PS72;
-const float PS145 = P(2,3)*PS60 - P(3,13)*PS44 + P(3,14)*PS140 - P(3,15)*PS139 - P(3,3)*PS74 + P(3,4) + PS143 + PS144;
-const float PS146 = P(0,14)*PS72 + P(1,14)*PS62 - P(13,14)*PS44 + P(14,14)*PS140 - P(14,15)*PS139 + P(2,14)*PS60 - P(3,14)*PS74 + P(4,14);
-const float PS147 = P(0,2)*PS60;
-const float PS148 = P(0,3)*PS74;
-const float PS149 = P(0,0)*PS72 + P(0,1)*PS62 - P(0,13)*PS44 + P(0,14)*PS140 - P(0,15)*PS139 + P(0,4) + PS147 - PS148;
-const float PS150 = P(1,2)*PS62;
-const float PS151 = P(0,2)*PS72;
-const float PS152 = -P(2,13)*PS44 + P(2,14)*PS140 - P(2,15)*PS139 + P(2,2)*PS60 - P(2,3)*PS74 + P(2,4) + PS150 + PS151;
-const float PS153 = P(1,2)*PS60;
-const float PS154 = P(1,3)*PS74;
-const float PS155 = P(0,1)*PS72 + P(1,1)*PS62 - P(1,13)*PS44 + P(1,14)*PS140 - P(1,15)*PS139 + P(1,4) + PS153 - PS154;
-const float PS156 = 4*dvyVar;
-const float PS157 = 4*dvzVar;
-const float PS158 = P(0,4)*PS72 + P(1,4)*PS62 + P(2,4)*PS60 - P(3,4)*PS74 - P(4,13)*PS44 + P(4,14)*PS140 - P(4,15)*PS139 + P(4,4);
-const float PS159 = 2*PS141;
-const float PS160 = 2*PS68;
-const float PS161 = PS65*dvyVar;
-const float PS162 = 2*PS66;
-const float PS163 = PS44*dvxVar;
-const float PS164 = P(0,5)*PS72 + P(1,5)*PS62 + P(2,5)*PS60 - P(3,5)*PS74 + P(4,5) - P(5,13)*PS44 + P(5,14)*PS140 - P(5,15)*PS139;
-const float PS165 = 2*PS71;
-const float PS166 = 2*PS73;
-const float PS167 = PS70*dvzVar;
-const float PS168 = P(0,6)*PS72 + P(1,6)*PS62 + P(2,6)*PS60 - P(3,6)*PS74 + P(4,6) - P(6,13)*PS44 + P(6,14)*PS140 - P(6,15)*PS139;
-const float PS169 = P(0,14)*PS74 - P(1,14)*PS60 - P(13,14)*PS162 - P(14,14)*PS65 + P(14,15)*PS160 + P(2,14)*PS62 + P(3,14)*PS72 + P(5,14);
-const float PS170 = P(0,13)*PS74 - P(1,13)*PS60 - P(13,13)*PS162 - P(13,14)*PS65 + P(13,15)*PS160 + P(2,13)*PS62 + P(3,13)*PS72 + P(5,13);
-const float PS171 = P(0,1)*PS74;
-const float PS172 = -P(1,1)*PS60 - P(1,13)*PS162 - P(1,14)*PS65 + P(1,15)*PS160 + P(1,3)*PS72 + P(1,5) + PS150 + PS171;
-const float PS173 = P(0,15)*PS74 - P(1,15)*PS60 - P(13,15)*PS162 - P(14,15)*PS65 + P(15,15)*PS160 + P(2,15)*PS62 + P(3,15)*PS72 + P(5,15);
-const float PS174 = P(2,3)*PS62;
-const float PS175 = -P(1,3)*PS60 - P(3,13)*PS162 - P(3,14)*PS65 + P(3,15)*PS160 + P(3,3)*PS72 + P(3,5) + PS148 + PS174;
-const float PS176 = P(0,1)*PS60;
-const float PS177 = P(0,0)*PS74 - P(0,13)*PS162 - P(0,14)*PS65 + P(0,15)*PS160 + P(0,2)*PS62 + P(0,5) + PS144 - PS176;
-const float PS178 = P(2,3)*PS72;
-const float PS179 = P(0,2)*PS74 - P(2,13)*PS162 - P(2,14)*PS65 + P(2,15)*PS160 + P(2,2)*PS62 + P(2,5) - PS153 + PS178;
-const float PS180 = 4*dvxVar;
-const float PS181 = P(0,5)*PS74 - P(1,5)*PS60 + P(2,5)*PS62 + P(3,5)*PS72 - P(5,13)*PS162 - P(5,14)*PS65 + P(5,15)*PS160 + P(5,5);
-const float PS182 = P(0,6)*PS74 - P(1,6)*PS60 + P(2,6)*PS62 + P(3,6)*PS72 + P(5,6) - P(6,13)*PS162 - P(6,14)*PS65 + P(6,15)*PS160;
-const float PS183 = P(0,15)*PS60 + P(1,15)*PS74 + P(13,15)*PS166 - P(14,15)*PS165 - P(15,15)*PS70 - P(2,15)*PS72 + P(3,15)*PS62 + P(6,15);
-const float PS184 = P(0,14)*PS60 + P(1,14)*PS74 + P(13,14)*PS166 - P(14,14)*PS165 - P(14,15)*PS70 - P(2,14)*PS72 + P(3,14)*PS62 + P(6,14);
-const float PS185 = P(0,13)*PS60 + P(1,13)*PS74 + P(13,13)*PS166 - P(13,14)*PS165 - P(13,15)*PS70 - P(2,13)*PS72 + P(3,13)*PS62 + P(6,13);
-const float PS186 = P(0,6)*PS60 + P(1,6)*PS74 - P(2,6)*PS72 + P(3,6)*PS62 + P(6,13)*PS166 - P(6,14)*PS165 - P(6,15)*PS70 + P(6,6);
+const float PS37 = powf(q0, 2);
+const float PS38 = -P(10,11)*PS34;
+const float PS39 = P(0,11)*PS11 + P(1,11) + P(11,11)*PS9 + P(2,11)*PS13 - P(3,11)*PS12 - PS19 + PS38;
+const float PS40 = P(0,2)*PS13;
+const float PS41 = P(0,3)*PS12;
+const float PS42 = P(0,0)*PS11 + P(0,1) - P(0,10)*PS34 + P(0,11)*PS9 - P(0,12)*PS7 + PS40 - PS41;
+const float PS43 = P(0,2)*PS11;
+const float PS44 = P(1,2) - P(2,10)*PS34 + P(2,11)*PS9 - P(2,12)*PS7 + P(2,2)*PS13 + PS28 + PS43;
+const float PS45 = P(10,11)*PS9;
+const float PS46 = P(10,12)*PS7;
+const float PS47 = P(0,10)*PS11 + P(1,10) - P(10,10)*PS34 + P(2,10)*PS13 - P(3,10)*PS12 + PS45 - PS46;
+const float PS48 = -P(10,12)*PS34;
+const float PS49 = P(0,12)*PS11 + P(1,12) - P(12,12)*PS7 + P(2,12)*PS13 - P(3,12)*PS12 + PS16 + PS48;
+const float PS50 = P(0,3)*PS11;
+const float PS51 = P(1,3) - P(3,10)*PS34 + P(3,11)*PS9 - P(3,12)*PS7 - P(3,3)*PS12 + PS25 + PS50;
+const float PS52 = P(1,2)*PS13;
+const float PS53 = P(1,3)*PS12;
+const float PS54 = P(1,1) - P(1,10)*PS34 + P(1,11)*PS9 - P(1,12)*PS7 + PS30 + PS52 - PS53;
+const float PS55 = q1*q3;
+const float PS56 = q0*q2;
+const float PS57 = q0*q3;
+const float PS58 = q1*q2;
+const float PS59 = -P(11,12)*PS34;
+const float PS60 = P(0,12)*PS12 - P(1,12)*PS13 + P(12,12)*PS6 + P(2,12) + P(3,12)*PS11 - PS10 + PS59;
+const float PS61 = P(2,3) - P(3,10)*PS9 - P(3,11)*PS34 + P(3,12)*PS6 + P(3,3)*PS11 + PS22 + PS41;
+const float PS62 = P(0,1)*PS13;
+const float PS63 = P(0,0)*PS12 - P(0,10)*PS9 - P(0,11)*PS34 + P(0,12)*PS6 + P(0,2) + PS50 - PS62;
+const float PS64 = P(11,12)*PS6;
+const float PS65 = P(0,11)*PS12 - P(1,11)*PS13 - P(11,11)*PS34 + P(2,11) + P(3,11)*PS11 - PS45 + PS64;
+const float PS66 = P(0,10)*PS12 - P(1,10)*PS13 - P(10,10)*PS9 + P(2,10) + P(3,10)*PS11 + PS18 + PS38;
+const float PS67 = P(0,1)*PS12;
+const float PS68 = -P(1,1)*PS13 - P(1,10)*PS9 - P(1,11)*PS34 + P(1,12)*PS6 + P(1,2) + PS27 + PS67;
+const float PS69 = P(2,3)*PS11;
+const float PS70 = -P(2,10)*PS9 - P(2,11)*PS34 + P(2,12)*PS6 + P(2,2) + PS31 - PS52 + PS69;
+const float PS71 = P(0,10)*PS13 + P(1,10)*PS12 + P(10,10)*PS7 - P(2,10)*PS11 + P(3,10) - PS15 + PS48;
+const float PS72 = P(1,1)*PS12 + P(1,10)*PS7 - P(1,11)*PS6 - P(1,12)*PS34 + P(1,3) + PS24 + PS62;
+const float PS73 = P(0,0)*PS13 + P(0,10)*PS7 - P(0,11)*PS6 - P(0,12)*PS34 + P(0,3) - PS43 + PS67;
+const float PS74 = P(0,12)*PS13 + P(1,12)*PS12 - P(12,12)*PS34 - P(2,12)*PS11 + P(3,12) + PS46 - PS64;
+const float PS75 = P(0,11)*PS13 + P(1,11)*PS12 - P(11,11)*PS6 - P(2,11)*PS11 + P(3,11) + PS59 + PS8;
+const float PS76 = P(2,10)*PS7 - P(2,11)*PS6 - P(2,12)*PS34 - P(2,2)*PS11 + P(2,3) + PS21 + PS40;
+const float PS77 = P(3,10)*PS7 - P(3,11)*PS6 - P(3,12)*PS34 + P(3,3) + PS32 + PS53 - PS69;
+const float PS78 = -PS2;
+const float PS79 = PS37 - PS4;
+const float PS80 = PS0 + PS78 + PS79;
+const float PS81 = P(0,13) - P(1,13)*PS11 + P(10,13)*PS6 + P(11,13)*PS7 + P(12,13)*PS9 - P(2,13)*PS12 - P(3,13)*PS13;
+const float PS82 = P(0,15) - P(1,15)*PS11 + P(10,15)*PS6 + P(11,15)*PS7 + P(12,15)*PS9 - P(2,15)*PS12 - P(3,15)*PS13;
+const float PS83 = PS55 + PS56;
+const float PS84 = 2*PS83;
+const float PS85 = dvy - dvy_b;
+const float PS86 = dvx - dvx_b;
+const float PS87 = dvz - dvz_b;
+const float PS88 = 2*PS85*q0 + 2*PS86*q3 - 2*PS87*q1;
+const float PS89 = P(0,14) - P(1,14)*PS11 + P(10,14)*PS6 + P(11,14)*PS7 + P(12,14)*PS9 - P(2,14)*PS12 - P(3,14)*PS13;
+const float PS90 = PS57 - PS58;
+const float PS91 = 2*PS90;
+const float PS92 = -2*PS85*q3 + 2*PS86*q0 + 2*PS87*q2;
+const float PS93 = 2*PS85*q1 - 2*PS86*q2 + 2*PS87*q0;
+const float PS94 = 2*PS85*q2 + 2*PS86*q1 + 2*PS87*q3;
+const float PS95 = P(0,4) - P(1,4)*PS11 - P(2,4)*PS12 - P(3,4)*PS13 + P(4,10)*PS6 + P(4,11)*PS7 + P(4,12)*PS9;
+const float PS96 = P(0,13)*PS11 + P(1,13) - P(10,13)*PS34 + P(11,13)*PS9 - P(12,13)*PS7 + P(2,13)*PS13 - P(3,13)*PS12;
+const float PS97 = P(0,15)*PS11 + P(1,15) - P(10,15)*PS34 + P(11,15)*PS9 - P(12,15)*PS7 + P(2,15)*PS13 - P(3,15)*PS12;
+const float PS98 = P(0,14)*PS11 + P(1,14) - P(10,14)*PS34 + P(11,14)*PS9 - P(12,14)*PS7 + P(2,14)*PS13 - P(3,14)*PS12;
+const float PS99 = P(0,4)*PS11 + P(1,4) + P(2,4)*PS13 - P(3,4)*PS12 - P(4,10)*PS34 + P(4,11)*PS9 - P(4,12)*PS7;
+const float PS100 = P(0,13)*PS12 - P(1,13)*PS13 - P(10,13)*PS9 - P(11,13)*PS34 + P(12,13)*PS6 + P(2,13) + P(3,13)*PS11;
+const float PS101 = P(0,15)*PS12 - P(1,15)*PS13 - P(10,15)*PS9 - P(11,15)*PS34 + P(12,15)*PS6 + P(2,15) + P(3,15)*PS11;
+const float PS102 = P(0,14)*PS12 - P(1,14)*PS13 - P(10,14)*PS9 - P(11,14)*PS34 + P(12,14)*PS6 + P(2,14) + P(3,14)*PS11;
+const float PS103 = P(0,4)*PS12 - P(1,4)*PS13 + P(2,4) + P(3,4)*PS11 - P(4,10)*PS9 - P(4,11)*PS34 + P(4,12)*PS6;
+const float PS104 = P(0,13)*PS13 + P(1,13)*PS12 + P(10,13)*PS7 - P(11,13)*PS6 - P(12,13)*PS34 - P(2,13)*PS11 + P(3,13);
+const float PS105 = P(0,15)*PS13 + P(1,15)*PS12 + P(10,15)*PS7 - P(11,15)*PS6 - P(12,15)*PS34 - P(2,15)*PS11 + P(3,15);
+const float PS106 = P(0,14)*PS13 + P(1,14)*PS12 + P(10,14)*PS7 - P(11,14)*PS6 - P(12,14)*PS34 - P(2,14)*PS11 + P(3,14);
+const float PS107 = P(0,4)*PS13 + P(1,4)*PS12 - P(2,4)*PS11 + P(3,4) + P(4,10)*PS7 - P(4,11)*PS6 - P(4,12)*PS34;
+const float PS108 = P(0,13)*PS92 + P(1,13)*PS94 - P(13,13)*PS80 + P(13,14)*PS91 - P(13,15)*PS84 + P(2,13)*PS93 - P(3,13)*PS88 + P(4,13);
+const float PS109 = P(0,15)*PS92 + P(1,15)*PS94 - P(13,15)*PS80 + P(14,15)*PS91 - P(15,15)*PS84 + P(2,15)*PS93 - P(3,15)*PS88 + P(4,15);
+const float PS110 = P(1,3)*PS94;
+const float PS111 = P(0,3)*PS92;
+const float PS112 = P(2,3)*PS93 - P(3,13)*PS80 + P(3,14)*PS91 - P(3,15)*PS84 - P(3,3)*PS88 + P(3,4) + PS110 + PS111;
+const float PS113 = P(0,14)*PS92 + P(1,14)*PS94 - P(13,14)*PS80 + P(14,14)*PS91 - P(14,15)*PS84 + P(2,14)*PS93 - P(3,14)*PS88 + P(4,14);
+const float PS114 = P(0,2)*PS93;
+const float PS115 = P(0,3)*PS88;
+const float PS116 = P(0,0)*PS92 + P(0,1)*PS94 - P(0,13)*PS80 + P(0,14)*PS91 - P(0,15)*PS84 + P(0,4) + PS114 - PS115;
+const float PS117 = P(1,2)*PS94;
+const float PS118 = P(0,2)*PS92;
+const float PS119 = -P(2,13)*PS80 + P(2,14)*PS91 - P(2,15)*PS84 + P(2,2)*PS93 - P(2,3)*PS88 + P(2,4) + PS117 + PS118;
+const float PS120 = P(1,2)*PS93;
+const float PS121 = P(1,3)*PS88;
+const float PS122 = P(0,1)*PS92 + P(1,1)*PS94 - P(1,13)*PS80 + P(1,14)*PS91 - P(1,15)*PS84 + P(1,4) + PS120 - PS121;
+const float PS123 = 4*dvyVar;
+const float PS124 = 4*dvzVar;
+const float PS125 = P(0,4)*PS92 + P(1,4)*PS94 + P(2,4)*PS93 - P(3,4)*PS88 - P(4,13)*PS80 + P(4,14)*PS91 - P(4,15)*PS84 + P(4,4);
+const float PS126 = -PS0;
+const float PS127 = PS126 + PS2 + PS79;
+const float PS128 = PS57 + PS58;
+const float PS129 = 2*PS128;
+const float PS130 = -PS35 + PS36;
+const float PS131 = 2*PS130;
+const float PS132 = P(0,5) - P(1,5)*PS11 - P(2,5)*PS12 - P(3,5)*PS13 + P(5,10)*PS6 + P(5,11)*PS7 + P(5,12)*PS9;
+const float PS133 = P(0,5)*PS11 + P(1,5) + P(2,5)*PS13 - P(3,5)*PS12 - P(5,10)*PS34 + P(5,11)*PS9 - P(5,12)*PS7;
+const float PS134 = P(0,5)*PS12 - P(1,5)*PS13 + P(2,5) + P(3,5)*PS11 - P(5,10)*PS9 - P(5,11)*PS34 + P(5,12)*PS6;
+const float PS135 = P(0,5)*PS13 + P(1,5)*PS12 - P(2,5)*PS11 + P(3,5) + P(5,10)*PS7 - P(5,11)*PS6 - P(5,12)*PS34;
+const float PS136 = PS127*dvyVar;
+const float PS137 = PS80*dvxVar;
+const float PS138 = P(0,5)*PS92 + P(1,5)*PS94 + P(2,5)*PS93 - P(3,5)*PS88 + P(4,5) - P(5,13)*PS80 + P(5,14)*PS91 - P(5,15)*PS84;
+const float PS139 = P(0,14)*PS88 - P(1,14)*PS93 - P(13,14)*PS129 - P(14,14)*PS127 + P(14,15)*PS131 + P(2,14)*PS94 + P(3,14)*PS92 + P(5,14);
+const float PS140 = P(0,13)*PS88 - P(1,13)*PS93 - P(13,13)*PS129 - P(13,14)*PS127 + P(13,15)*PS131 + P(2,13)*PS94 + P(3,13)*PS92 + P(5,13);
+const float PS141 = P(0,1)*PS88;
+const float PS142 = -P(1,1)*PS93 - P(1,13)*PS129 - P(1,14)*PS127 + P(1,15)*PS131 + P(1,3)*PS92 + P(1,5) + PS117 + PS141;
+const float PS143 = P(0,15)*PS88 - P(1,15)*PS93 - P(13,15)*PS129 - P(14,15)*PS127 + P(15,15)*PS131 + P(2,15)*PS94 + P(3,15)*PS92 + P(5,15);
+const float PS144 = P(2,3)*PS94;
+const float PS145 = -P(1,3)*PS93 - P(3,13)*PS129 - P(3,14)*PS127 + P(3,15)*PS131 + P(3,3)*PS92 + P(3,5) + PS115 + PS144;
+const float PS146 = P(0,1)*PS93;
+const float PS147 = P(0,0)*PS88 - P(0,13)*PS129 - P(0,14)*PS127 + P(0,15)*PS131 + P(0,2)*PS94 + P(0,5) + PS111 - PS146;
+const float PS148 = P(2,3)*PS92;
+const float PS149 = P(0,2)*PS88 - P(2,13)*PS129 - P(2,14)*PS127 + P(2,15)*PS131 + P(2,2)*PS94 + P(2,5) - PS120 + PS148;
+const float PS150 = 4*dvxVar;
+const float PS151 = P(0,5)*PS88 - P(1,5)*PS93 + P(2,5)*PS94 + P(3,5)*PS92 - P(5,13)*PS129 - P(5,14)*PS127 + P(5,15)*PS131 + P(5,5);
+const float PS152 = PS126 + PS37 + PS4 + PS78;
+const float PS153 = PS35 + PS36;
+const float PS154 = 2*PS153;
+const float PS155 = -PS55 + PS56;
+const float PS156 = 2*PS155;
+const float PS157 = P(0,6) - P(1,6)*PS11 - P(2,6)*PS12 - P(3,6)*PS13 + P(6,10)*PS6 + P(6,11)*PS7 + P(6,12)*PS9;
+const float PS158 = P(0,6)*PS11 + P(1,6) + P(2,6)*PS13 - P(3,6)*PS12 - P(6,10)*PS34 + P(6,11)*PS9 - P(6,12)*PS7;
+const float PS159 = P(0,6)*PS12 - P(1,6)*PS13 + P(2,6) + P(3,6)*PS11 - P(6,10)*PS9 - P(6,11)*PS34 + P(6,12)*PS6;
+const float PS160 = P(0,6)*PS13 + P(1,6)*PS12 - P(2,6)*PS11 + P(3,6) + P(6,10)*PS7 - P(6,11)*PS6 - P(6,12)*PS34;
+const float PS161 = PS152*dvzVar;
+const float PS162 = P(0,6)*PS92 + P(1,6)*PS94 + P(2,6)*PS93 - P(3,6)*PS88 + P(4,6) - P(6,13)*PS80 + P(6,14)*PS91 - P(6,15)*PS84;
+const float PS163 = P(0,6)*PS88 - P(1,6)*PS93 + P(2,6)*PS94 + P(3,6)*PS92 + P(5,6) - P(6,13)*PS129 - P(6,14)*PS127 + P(6,15)*PS131;
+const float PS164 = P(0,15)*PS93 + P(1,15)*PS88 + P(13,15)*PS156 - P(14,15)*PS154 - P(15,15)*PS152 - P(2,15)*PS92 + P(3,15)*PS94 + P(6,15);
+const float PS165 = P(0,14)*PS93 + P(1,14)*PS88 + P(13,14)*PS156 - P(14,14)*PS154 - P(14,15)*PS152 - P(2,14)*PS92 + P(3,14)*PS94 + P(6,14);
+const float PS166 = P(0,13)*PS93 + P(1,13)*PS88 + P(13,13)*PS156 - P(13,14)*PS154 - P(13,15)*PS152 - P(2,13)*PS92 + P(3,13)*PS94 + P(6,13);
+const float PS167 = P(0,6)*PS93 + P(1,6)*PS88 - P(2,6)*PS92 + P(3,6)*PS94 + P(6,13)*PS156 - P(6,14)*PS154 - P(6,15)*PS152 + P(6,6);
 
 
 nextP(0,0) = PS0*PS1 - PS11*PS23 - PS12*PS26 - PS13*PS29 + PS14*PS6 + PS17*PS7 + PS2*PS3 + PS20*PS9 + PS33 + PS4*PS5;
 nextP(0,1) = -PS1*PS36 + PS11*PS33 - PS12*PS29 + PS13*PS26 - PS14*PS34 + PS17*PS9 - PS20*PS7 + PS23 + PS3*PS35 - PS35*PS5;
-nextP(1,1) = PS1*PS42 + PS11*PS80 - PS12*PS89 + PS13*PS82 + PS2*PS5 + PS3*PS4 - PS34*PS85 - PS7*PS87 + PS77*PS9 + PS92;
-nextP(0,2) = -PS1*PS37 + PS11*PS29 + PS12*PS33 - PS13*PS23 - PS14*PS9 - PS17*PS34 + PS20*PS6 + PS26 - PS3*PS38 + PS37*PS5;
-nextP(1,2) = PS1*PS40 + PS11*PS89 + PS12*PS80 - PS13*PS92 - PS3*PS40 - PS34*PS77 - PS39*PS5 + PS6*PS87 + PS82 - PS85*PS9;
-nextP(2,2) = PS0*PS5 + PS1*PS4 + PS103*PS6 + PS104*PS11 + PS106*PS12 - PS108*PS34 - PS109*PS9 - PS111*PS13 + PS113 + PS3*PS42;
-nextP(0,3) = PS1*PS39 - PS11*PS26 + PS12*PS23 + PS13*PS33 + PS14*PS7 - PS17*PS6 - PS20*PS34 + PS29 - PS3*PS39 - PS40*PS5;
-nextP(1,3) = -PS1*PS38 - PS11*PS82 + PS12*PS92 + PS13*PS80 - PS3*PS37 - PS34*PS87 + PS38*PS5 - PS6*PS77 + PS7*PS85 + PS89;
-nextP(2,3) = -PS1*PS35 - PS103*PS34 + PS104 + PS106*PS13 - PS108*PS6 + PS109*PS7 - PS11*PS113 + PS111*PS12 + PS3*PS36 - PS36*PS5;
-nextP(3,3) = PS0*PS3 + PS1*PS2 - PS11*PS128 + PS12*PS124 + PS123*PS7 + PS125*PS13 - PS126*PS34 - PS127*PS6 + PS129 + PS42*PS5;
-nextP(0,4) = PS23*PS62 + PS26*PS60 - PS44*PS45 - PS46*PS48 - PS52*PS53 + PS54*PS56 + PS57*PS58 + PS63;
-nextP(1,4) = -PS44*PS93 - PS46*PS95 + PS54*PS97 + PS60*PS82 + PS62*PS92 + PS72*PS80 - PS74*PS89 + PS98;
-nextP(2,4) = -PS104*PS74 + PS106*PS72 + PS111*PS62 + PS113*PS60 - PS114*PS44 - PS116*PS46 + PS118*PS54 + PS119;
-nextP(3,4) = PS124*PS62 + PS125*PS72 + PS128*PS60 - PS129*PS74 - PS130*PS44 - PS132*PS46 + PS134*PS54 + PS135;
-nextP(4,4) = -PS139*PS142 + PS140*PS146 - PS141*PS44 - PS145*PS74 + PS149*PS72 + PS152*PS60 + PS155*PS62 + PS156*powf(PS54, 2) + PS157*powf(PS46, 2) + PS158 + powf(PS44, 2)*dvxVar;
-nextP(0,5) = -PS23*PS60 + PS26*PS62 + PS48*PS68 + PS52*PS58 + PS53*PS57 - PS55*PS65 - PS66*PS67 + PS69;
-nextP(1,5) = PS100 - PS60*PS92 + PS62*PS82 - PS65*PS96 - PS66*PS99 + PS68*PS95 + PS72*PS89 + PS74*PS80;
-nextP(2,5) = PS104*PS72 + PS106*PS74 - PS111*PS60 + PS113*PS62 + PS116*PS68 - PS117*PS65 - PS120*PS66 + PS121;
-nextP(3,5) = -PS124*PS60 + PS125*PS74 + PS128*PS62 + PS129*PS72 + PS132*PS68 - PS133*PS65 - PS136*PS66 + PS137;
-nextP(4,5) = -PS140*PS161 + PS142*PS160 + PS145*PS72 - PS146*PS65 + PS149*PS74 + PS152*PS62 - PS155*PS60 - PS157*PS46*PS68 - PS159*PS66 + PS162*PS163 + PS164;
-nextP(5,5) = PS157*powf(PS68, 2) + PS160*PS173 - PS162*PS170 - PS169*PS65 - PS172*PS60 + PS175*PS72 + PS177*PS74 + PS179*PS62 + PS180*powf(PS66, 2) + PS181 + powf(PS65, 2)*dvyVar;
-nextP(0,6) = PS23*PS74 - PS26*PS72 - PS47*PS70 + PS53*PS61 - PS56*PS71 + PS58*PS59 + PS67*PS73 + PS75;
-nextP(1,6) = PS101 + PS60*PS80 + PS62*PS89 - PS70*PS94 - PS71*PS97 - PS72*PS82 + PS73*PS99 + PS74*PS92;
-nextP(2,6) = PS104*PS62 + PS106*PS60 + PS111*PS74 - PS113*PS72 - PS115*PS70 - PS118*PS71 + PS120*PS73 + PS122;
-nextP(3,6) = PS124*PS74 + PS125*PS60 - PS128*PS72 + PS129*PS62 - PS131*PS70 - PS134*PS71 + PS136*PS73 + PS138;
-nextP(4,6) = PS139*PS167 - PS142*PS70 + PS145*PS62 - PS146*PS165 + PS149*PS60 - PS152*PS72 + PS155*PS74 - PS156*PS54*PS71 + PS159*PS73 - PS163*PS166 + PS168;
-nextP(5,6) = -PS160*PS167 + PS161*PS165 - PS165*PS169 + PS166*PS170 + PS172*PS74 - PS173*PS70 + PS175*PS62 + PS177*PS60 - PS179*PS72 - PS180*PS66*PS73 + PS182;
-nextP(6,6) = PS156*powf(PS71, 2) - PS165*PS184 + PS166*PS185 + PS180*powf(PS73, 2) - PS183*PS70 + PS186 + PS60*(P(0,0)*PS60 + P(0,13)*PS166 - P(0,14)*PS165 - P(0,15)*PS70 + P(0,3)*PS62 + P(0,6) - PS151 + PS171) + PS62*(P(0,3)*PS60 + P(3,13)*PS166 - P(3,14)*PS165 - P(3,15)*PS70 + P(3,3)*PS62 + P(3,6) + PS154 - PS178) + powf(PS70, 2)*dvzVar - PS72*(P(1,2)*PS74 + P(2,13)*PS166 - P(2,14)*PS165 - P(2,15)*PS70 - P(2,2)*PS72 + P(2,6) + PS147 + PS174) + PS74*(P(1,1)*PS74 + P(1,13)*PS166 - P(1,14)*PS165 - P(1,15)*PS70 - P(1,2)*PS72 + P(1,6) + PS143 + PS176);
-nextP(0,7) = P(0,7) - P(1,7)*PS11 - P(2,7)*PS12 - P(3,7)*PS13 + P(7,10)*PS6 + P(7,11)*PS7 + P(7,12)*PS9 + PS63*dt;
-nextP(1,7) = P(0,7)*PS11 + P(1,7) + P(2,7)*PS13 - P(3,7)*PS12 - P(7,10)*PS34 + P(7,11)*PS9 - P(7,12)*PS7 + PS98*dt;
-nextP(2,7) = P(0,7)*PS12 - P(1,7)*PS13 + P(2,7) + P(3,7)*PS11 - P(7,10)*PS9 - P(7,11)*PS34 + P(7,12)*PS6 + PS119*dt;
-nextP(3,7) = P(0,7)*PS13 + P(1,7)*PS12 - P(2,7)*PS11 + P(3,7) + P(7,10)*PS7 - P(7,11)*PS6 - P(7,12)*PS34 + PS135*dt;
-nextP(4,7) = P(0,7)*PS72 + P(1,7)*PS62 + P(2,7)*PS60 - P(3,7)*PS74 + P(4,7) - P(7,13)*PS44 + P(7,14)*PS140 - P(7,15)*PS139 + PS158*dt;
-nextP(5,7) = P(0,7)*PS74 - P(1,7)*PS60 + P(2,7)*PS62 + P(3,7)*PS72 + P(5,7) - P(7,13)*PS162 - P(7,14)*PS65 + P(7,15)*PS160 + dt*(P(0,4)*PS74 - P(1,4)*PS60 + P(2,4)*PS62 + P(3,4)*PS72 - P(4,13)*PS162 - P(4,14)*PS65 + P(4,15)*PS160 + P(4,5));
-nextP(6,7) = P(0,7)*PS60 + P(1,7)*PS74 - P(2,7)*PS72 + P(3,7)*PS62 + P(6,7) + P(7,13)*PS166 - P(7,14)*PS165 - P(7,15)*PS70 + dt*(P(0,4)*PS60 + P(1,4)*PS74 - P(2,4)*PS72 + P(3,4)*PS62 + P(4,13)*PS166 - P(4,14)*PS165 - P(4,15)*PS70 + P(4,6));
+nextP(1,1) = PS1*PS37 + PS11*PS42 - PS12*PS51 + PS13*PS44 + PS2*PS5 + PS3*PS4 - PS34*PS47 + PS39*PS9 - PS49*PS7 + PS54;
+nextP(0,2) = -PS1*PS55 + PS11*PS29 + PS12*PS33 - PS13*PS23 - PS14*PS9 - PS17*PS34 + PS20*PS6 + PS26 - PS3*PS56 + PS5*PS55;
+nextP(1,2) = PS1*PS57 + PS11*PS51 + PS12*PS42 - PS13*PS54 - PS3*PS57 - PS34*PS39 + PS44 - PS47*PS9 + PS49*PS6 - PS5*PS58;
+nextP(2,2) = PS0*PS5 + PS1*PS4 + PS11*PS61 + PS12*PS63 - PS13*PS68 + PS3*PS37 - PS34*PS65 + PS6*PS60 - PS66*PS9 + PS70;
+nextP(0,3) = PS1*PS58 - PS11*PS26 + PS12*PS23 + PS13*PS33 + PS14*PS7 - PS17*PS6 - PS20*PS34 + PS29 - PS3*PS58 - PS5*PS57;
+nextP(1,3) = -PS1*PS56 - PS11*PS44 + PS12*PS54 + PS13*PS42 - PS3*PS55 - PS34*PS49 - PS39*PS6 + PS47*PS7 + PS5*PS56 + PS51;
+nextP(2,3) = -PS1*PS35 - PS11*PS70 + PS12*PS68 + PS13*PS63 + PS3*PS36 - PS34*PS60 - PS36*PS5 - PS6*PS65 + PS61 + PS66*PS7;
+nextP(3,3) = PS0*PS3 + PS1*PS2 - PS11*PS76 + PS12*PS72 + PS13*PS73 - PS34*PS74 + PS37*PS5 - PS6*PS75 + PS7*PS71 + PS77;
+nextP(0,4) = PS23*PS94 + PS26*PS93 - PS29*PS88 + PS33*PS92 - PS80*PS81 - PS82*PS84 + PS89*PS91 + PS95;
+nextP(1,4) = PS42*PS92 + PS44*PS93 - PS51*PS88 + PS54*PS94 - PS80*PS96 - PS84*PS97 + PS91*PS98 + PS99;
+nextP(2,4) = -PS100*PS80 - PS101*PS84 + PS102*PS91 + PS103 - PS61*PS88 + PS63*PS92 + PS68*PS94 + PS70*PS93;
+nextP(3,4) = -PS104*PS80 - PS105*PS84 + PS106*PS91 + PS107 + PS72*PS94 + PS73*PS92 + PS76*PS93 - PS77*PS88;
+nextP(4,4) = -PS108*PS80 - PS109*PS84 - PS112*PS88 + PS113*PS91 + PS116*PS92 + PS119*PS93 + PS122*PS94 + PS123*powf(PS90, 2) + PS124*powf(PS83, 2) + PS125 + powf(PS80, 2)*dvxVar;
+nextP(0,5) = -PS127*PS89 - PS129*PS81 + PS131*PS82 + PS132 - PS23*PS93 + PS26*PS94 + PS29*PS92 + PS33*PS88;
+nextP(1,5) = -PS127*PS98 - PS129*PS96 + PS131*PS97 + PS133 + PS42*PS88 + PS44*PS94 + PS51*PS92 - PS54*PS93;
+nextP(2,5) = -PS100*PS129 + PS101*PS131 - PS102*PS127 + PS134 + PS61*PS92 + PS63*PS88 - PS68*PS93 + PS70*PS94;
+nextP(3,5) = -PS104*PS129 + PS105*PS131 - PS106*PS127 + PS135 - PS72*PS93 + PS73*PS88 + PS76*PS94 + PS77*PS92;
+nextP(4,5) = -PS108*PS129 + PS109*PS131 + PS112*PS92 - PS113*PS127 + PS116*PS88 + PS119*PS94 - PS122*PS93 - PS124*PS130*PS83 + PS129*PS137 - PS136*PS91 + PS138;
+nextP(5,5) = PS124*powf(PS130, 2) + powf(PS127, 2)*dvyVar - PS127*PS139 + powf(PS128, 2)*PS150 - PS129*PS140 + PS131*PS143 - PS142*PS93 + PS145*PS92 + PS147*PS88 + PS149*PS94 + PS151;
+nextP(0,6) = -PS152*PS82 - PS154*PS89 + PS156*PS81 + PS157 + PS23*PS88 - PS26*PS92 + PS29*PS94 + PS33*PS93;
+nextP(1,6) = -PS152*PS97 - PS154*PS98 + PS156*PS96 + PS158 + PS42*PS93 - PS44*PS92 + PS51*PS94 + PS54*PS88;
+nextP(2,6) = PS100*PS156 - PS101*PS152 - PS102*PS154 + PS159 + PS61*PS94 + PS63*PS93 + PS68*PS88 - PS70*PS92;
+nextP(3,6) = PS104*PS156 - PS105*PS152 - PS106*PS154 + PS160 + PS72*PS88 + PS73*PS93 - PS76*PS92 + PS77*PS94;
+nextP(4,6) = PS108*PS156 - PS109*PS152 + PS112*PS94 - PS113*PS154 + PS116*PS93 - PS119*PS92 + PS122*PS88 - PS123*PS153*PS90 - PS137*PS156 + PS161*PS84 + PS162;
+nextP(5,6) = -PS128*PS150*PS155 - PS131*PS161 + PS136*PS154 - PS139*PS154 + PS140*PS156 + PS142*PS88 - PS143*PS152 + PS145*PS94 + PS147*PS93 - PS149*PS92 + PS163;
+nextP(6,6) = PS123*powf(PS153, 2) + PS150*powf(PS155, 2) + powf(PS152, 2)*dvzVar - PS152*PS164 - PS154*PS165 + PS156*PS166 + PS167 + PS88*(P(1,1)*PS88 + P(1,13)*PS156 - P(1,14)*PS154 - P(1,15)*PS152 - P(1,2)*PS92 + P(1,6) + PS110 + PS146) - PS92*(P(1,2)*PS88 + P(2,13)*PS156 - P(2,14)*PS154 - P(2,15)*PS152 - P(2,2)*PS92 + P(2,6) + PS114 + PS144) + PS93*(P(0,0)*PS93 + P(0,13)*PS156 - P(0,14)*PS154 - P(0,15)*PS152 + P(0,3)*PS94 + P(0,6) - PS118 + PS141) + PS94*(P(0,3)*PS93 + P(3,13)*PS156 - P(3,14)*PS154 - P(3,15)*PS152 + P(3,3)*PS94 + P(3,6) + PS121 - PS148);
+nextP(0,7) = P(0,7) - P(1,7)*PS11 - P(2,7)*PS12 - P(3,7)*PS13 + P(7,10)*PS6 + P(7,11)*PS7 + P(7,12)*PS9 + PS95*dt;
+nextP(1,7) = P(0,7)*PS11 + P(1,7) + P(2,7)*PS13 - P(3,7)*PS12 - P(7,10)*PS34 + P(7,11)*PS9 - P(7,12)*PS7 + PS99*dt;
+nextP(2,7) = P(0,7)*PS12 - P(1,7)*PS13 + P(2,7) + P(3,7)*PS11 - P(7,10)*PS9 - P(7,11)*PS34 + P(7,12)*PS6 + PS103*dt;
+nextP(3,7) = P(0,7)*PS13 + P(1,7)*PS12 - P(2,7)*PS11 + P(3,7) + P(7,10)*PS7 - P(7,11)*PS6 - P(7,12)*PS34 + PS107*dt;
+nextP(4,7) = P(0,7)*PS92 + P(1,7)*PS94 + P(2,7)*PS93 - P(3,7)*PS88 + P(4,7) - P(7,13)*PS80 + P(7,14)*PS91 - P(7,15)*PS84 + PS125*dt;
+nextP(5,7) = P(0,7)*PS88 - P(1,7)*PS93 + P(2,7)*PS94 + P(3,7)*PS92 + P(5,7) - P(7,13)*PS129 - P(7,14)*PS127 + P(7,15)*PS131 + dt*(P(0,4)*PS88 - P(1,4)*PS93 + P(2,4)*PS94 + P(3,4)*PS92 - P(4,13)*PS129 - P(4,14)*PS127 + P(4,15)*PS131 + P(4,5));
+nextP(6,7) = P(0,7)*PS93 + P(1,7)*PS88 - P(2,7)*PS92 + P(3,7)*PS94 + P(6,7) + P(7,13)*PS156 - P(7,14)*PS154 - P(7,15)*PS152 + dt*(P(0,4)*PS93 + P(1,4)*PS88 - P(2,4)*PS92 + P(3,4)*PS94 + P(4,13)*PS156 - P(4,14)*PS154 - P(4,15)*PS152 + P(4,6));
 nextP(7,7) = P(4,7)*dt + P(7,7) + dt*(P(4,4)*dt + P(4,7));
-nextP(0,8) = P(0,8) - P(1,8)*PS11 - P(2,8)*PS12 - P(3,8)*PS13 + P(8,10)*PS6 + P(8,11)*PS7 + P(8,12)*PS9 + PS69*dt;
-nextP(1,8) = P(0,8)*PS11 + P(1,8) + P(2,8)*PS13 - P(3,8)*PS12 - P(8,10)*PS34 + P(8,11)*PS9 - P(8,12)*PS7 + PS100*dt;
-nextP(2,8) = P(0,8)*PS12 - P(1,8)*PS13 + P(2,8) + P(3,8)*PS11 - P(8,10)*PS9 - P(8,11)*PS34 + P(8,12)*PS6 + PS121*dt;
-nextP(3,8) = P(0,8)*PS13 + P(1,8)*PS12 - P(2,8)*PS11 + P(3,8) + P(8,10)*PS7 - P(8,11)*PS6 - P(8,12)*PS34 + PS137*dt;
-nextP(4,8) = P(0,8)*PS72 + P(1,8)*PS62 + P(2,8)*PS60 - P(3,8)*PS74 + P(4,8) - P(8,13)*PS44 + P(8,14)*PS140 - P(8,15)*PS139 + PS164*dt;
-nextP(5,8) = P(0,8)*PS74 - P(1,8)*PS60 + P(2,8)*PS62 + P(3,8)*PS72 + P(5,8) - P(8,13)*PS162 - P(8,14)*PS65 + P(8,15)*PS160 + PS181*dt;
-nextP(6,8) = P(0,8)*PS60 + P(1,8)*PS74 - P(2,8)*PS72 + P(3,8)*PS62 + P(6,8) + P(8,13)*PS166 - P(8,14)*PS165 - P(8,15)*PS70 + dt*(P(0,5)*PS60 + P(1,5)*PS74 - P(2,5)*PS72 + P(3,5)*PS62 + P(5,13)*PS166 - P(5,14)*PS165 - P(5,15)*PS70 + P(5,6));
+nextP(0,8) = P(0,8) - P(1,8)*PS11 - P(2,8)*PS12 - P(3,8)*PS13 + P(8,10)*PS6 + P(8,11)*PS7 + P(8,12)*PS9 + PS132*dt;
+nextP(1,8) = P(0,8)*PS11 + P(1,8) + P(2,8)*PS13 - P(3,8)*PS12 - P(8,10)*PS34 + P(8,11)*PS9 - P(8,12)*PS7 + PS133*dt;
+nextP(2,8) = P(0,8)*PS12 - P(1,8)*PS13 + P(2,8) + P(3,8)*PS11 - P(8,10)*PS9 - P(8,11)*PS34 + P(8,12)*PS6 + PS134*dt;
+nextP(3,8) = P(0,8)*PS13 + P(1,8)*PS12 - P(2,8)*PS11 + P(3,8) + P(8,10)*PS7 - P(8,11)*PS6 - P(8,12)*PS34 + PS135*dt;
+nextP(4,8) = P(0,8)*PS92 + P(1,8)*PS94 + P(2,8)*PS93 - P(3,8)*PS88 + P(4,8) - P(8,13)*PS80 + P(8,14)*PS91 - P(8,15)*PS84 + PS138*dt;
+nextP(5,8) = P(0,8)*PS88 - P(1,8)*PS93 + P(2,8)*PS94 + P(3,8)*PS92 + P(5,8) - P(8,13)*PS129 - P(8,14)*PS127 + P(8,15)*PS131 + PS151*dt;
+nextP(6,8) = P(0,8)*PS93 + P(1,8)*PS88 - P(2,8)*PS92 + P(3,8)*PS94 + P(6,8) + P(8,13)*PS156 - P(8,14)*PS154 - P(8,15)*PS152 + dt*(P(0,5)*PS93 + P(1,5)*PS88 - P(2,5)*PS92 + P(3,5)*PS94 + P(5,13)*PS156 - P(5,14)*PS154 - P(5,15)*PS152 + P(5,6));
 nextP(7,8) = P(4,8)*dt + P(7,8) + dt*(P(4,5)*dt + P(5,7));
 nextP(8,8) = P(5,8)*dt + P(8,8) + dt*(P(5,5)*dt + P(5,8));
-nextP(0,9) = P(0,9) - P(1,9)*PS11 - P(2,9)*PS12 - P(3,9)*PS13 + P(9,10)*PS6 + P(9,11)*PS7 + P(9,12)*PS9 + PS75*dt;
-nextP(1,9) = P(0,9)*PS11 + P(1,9) + P(2,9)*PS13 - P(3,9)*PS12 - P(9,10)*PS34 + P(9,11)*PS9 - P(9,12)*PS7 + PS101*dt;
-nextP(2,9) = P(0,9)*PS12 - P(1,9)*PS13 + P(2,9) + P(3,9)*PS11 - P(9,10)*PS9 - P(9,11)*PS34 + P(9,12)*PS6 + PS122*dt;
-nextP(3,9) = P(0,9)*PS13 + P(1,9)*PS12 - P(2,9)*PS11 + P(3,9) + P(9,10)*PS7 - P(9,11)*PS6 - P(9,12)*PS34 + PS138*dt;
-nextP(4,9) = P(0,9)*PS72 + P(1,9)*PS62 + P(2,9)*PS60 - P(3,9)*PS74 + P(4,9) - P(9,13)*PS44 + P(9,14)*PS140 - P(9,15)*PS139 + PS168*dt;
-nextP(5,9) = P(0,9)*PS74 - P(1,9)*PS60 + P(2,9)*PS62 + P(3,9)*PS72 + P(5,9) - P(9,13)*PS162 - P(9,14)*PS65 + P(9,15)*PS160 + PS182*dt;
-nextP(6,9) = P(0,9)*PS60 + P(1,9)*PS74 - P(2,9)*PS72 + P(3,9)*PS62 + P(6,9) + P(9,13)*PS166 - P(9,14)*PS165 - P(9,15)*PS70 + PS186*dt;
+nextP(0,9) = P(0,9) - P(1,9)*PS11 - P(2,9)*PS12 - P(3,9)*PS13 + P(9,10)*PS6 + P(9,11)*PS7 + P(9,12)*PS9 + PS157*dt;
+nextP(1,9) = P(0,9)*PS11 + P(1,9) + P(2,9)*PS13 - P(3,9)*PS12 - P(9,10)*PS34 + P(9,11)*PS9 - P(9,12)*PS7 + PS158*dt;
+nextP(2,9) = P(0,9)*PS12 - P(1,9)*PS13 + P(2,9) + P(3,9)*PS11 - P(9,10)*PS9 - P(9,11)*PS34 + P(9,12)*PS6 + PS159*dt;
+nextP(3,9) = P(0,9)*PS13 + P(1,9)*PS12 - P(2,9)*PS11 + P(3,9) + P(9,10)*PS7 - P(9,11)*PS6 - P(9,12)*PS34 + PS160*dt;
+nextP(4,9) = P(0,9)*PS92 + P(1,9)*PS94 + P(2,9)*PS93 - P(3,9)*PS88 + P(4,9) - P(9,13)*PS80 + P(9,14)*PS91 - P(9,15)*PS84 + PS162*dt;
+nextP(5,9) = P(0,9)*PS88 - P(1,9)*PS93 + P(2,9)*PS94 + P(3,9)*PS92 + P(5,9) - P(9,13)*PS129 - P(9,14)*PS127 + P(9,15)*PS131 + PS163*dt;
+nextP(6,9) = P(0,9)*PS93 + P(1,9)*PS88 - P(2,9)*PS92 + P(3,9)*PS94 + P(6,9) + P(9,13)*PS156 - P(9,14)*PS154 - P(9,15)*PS152 + PS167*dt;
 nextP(7,9) = P(4,9)*dt + P(7,9) + dt*(P(4,6)*dt + P(6,7));
 nextP(8,9) = P(5,9)*dt + P(8,9) + dt*(P(5,6)*dt + P(6,8));
 nextP(9,9) = P(6,9)*dt + P(9,9) + dt*(P(6,6)*dt + P(6,9));
 nextP(0,10) = PS14;
-nextP(1,10) = PS85;
-nextP(2,10) = PS109;
-nextP(3,10) = PS123;
-nextP(4,10) = P(0,10)*PS72 + P(1,10)*PS62 - P(10,13)*PS44 + P(10,14)*PS140 - P(10,15)*PS139 + P(2,10)*PS60 - P(3,10)*PS74 + P(4,10);
-nextP(5,10) = P(0,10)*PS74 - P(1,10)*PS60 - P(10,13)*PS162 - P(10,14)*PS65 + P(10,15)*PS160 + P(2,10)*PS62 + P(3,10)*PS72 + P(5,10);
-nextP(6,10) = P(0,10)*PS60 + P(1,10)*PS74 + P(10,13)*PS166 - P(10,14)*PS165 - P(10,15)*PS70 - P(2,10)*PS72 + P(3,10)*PS62 + P(6,10);
+nextP(1,10) = PS47;
+nextP(2,10) = PS66;
+nextP(3,10) = PS71;
+nextP(4,10) = P(0,10)*PS92 + P(1,10)*PS94 - P(10,13)*PS80 + P(10,14)*PS91 - P(10,15)*PS84 + P(2,10)*PS93 - P(3,10)*PS88 + P(4,10);
+nextP(5,10) = P(0,10)*PS88 - P(1,10)*PS93 - P(10,13)*PS129 - P(10,14)*PS127 + P(10,15)*PS131 + P(2,10)*PS94 + P(3,10)*PS92 + P(5,10);
+nextP(6,10) = P(0,10)*PS93 + P(1,10)*PS88 + P(10,13)*PS156 - P(10,14)*PS154 - P(10,15)*PS152 - P(2,10)*PS92 + P(3,10)*PS94 + P(6,10);
 nextP(7,10) = P(4,10)*dt + P(7,10);
 nextP(8,10) = P(5,10)*dt + P(8,10);
 nextP(9,10) = P(6,10)*dt + P(9,10);
 nextP(10,10) = P(10,10);
 nextP(0,11) = PS17;
-nextP(1,11) = PS77;
-nextP(2,11) = PS108;
-nextP(3,11) = PS127;
-nextP(4,11) = P(0,11)*PS72 + P(1,11)*PS62 - P(11,13)*PS44 + P(11,14)*PS140 - P(11,15)*PS139 + P(2,11)*PS60 - P(3,11)*PS74 + P(4,11);
-nextP(5,11) = P(0,11)*PS74 - P(1,11)*PS60 - P(11,13)*PS162 - P(11,14)*PS65 + P(11,15)*PS160 + P(2,11)*PS62 + P(3,11)*PS72 + P(5,11);
-nextP(6,11) = P(0,11)*PS60 + P(1,11)*PS74 + P(11,13)*PS166 - P(11,14)*PS165 - P(11,15)*PS70 - P(2,11)*PS72 + P(3,11)*PS62 + P(6,11);
+nextP(1,11) = PS39;
+nextP(2,11) = PS65;
+nextP(3,11) = PS75;
+nextP(4,11) = P(0,11)*PS92 + P(1,11)*PS94 - P(11,13)*PS80 + P(11,14)*PS91 - P(11,15)*PS84 + P(2,11)*PS93 - P(3,11)*PS88 + P(4,11);
+nextP(5,11) = P(0,11)*PS88 - P(1,11)*PS93 - P(11,13)*PS129 - P(11,14)*PS127 + P(11,15)*PS131 + P(2,11)*PS94 + P(3,11)*PS92 + P(5,11);
+nextP(6,11) = P(0,11)*PS93 + P(1,11)*PS88 + P(11,13)*PS156 - P(11,14)*PS154 - P(11,15)*PS152 - P(2,11)*PS92 + P(3,11)*PS94 + P(6,11);
 nextP(7,11) = P(4,11)*dt + P(7,11);
 nextP(8,11) = P(5,11)*dt + P(8,11);
 nextP(9,11) = P(6,11)*dt + P(9,11);
 nextP(10,11) = P(10,11);
 nextP(11,11) = P(11,11);
 nextP(0,12) = PS20;
-nextP(1,12) = PS87;
-nextP(2,12) = PS103;
-nextP(3,12) = PS126;
-nextP(4,12) = P(0,12)*PS72 + P(1,12)*PS62 - P(12,13)*PS44 + P(12,14)*PS140 - P(12,15)*PS139 + P(2,12)*PS60 - P(3,12)*PS74 + P(4,12);
-nextP(5,12) = P(0,12)*PS74 - P(1,12)*PS60 - P(12,13)*PS162 - P(12,14)*PS65 + P(12,15)*PS160 + P(2,12)*PS62 + P(3,12)*PS72 + P(5,12);
-nextP(6,12) = P(0,12)*PS60 + P(1,12)*PS74 + P(12,13)*PS166 - P(12,14)*PS165 - P(12,15)*PS70 - P(2,12)*PS72 + P(3,12)*PS62 + P(6,12);
+nextP(1,12) = PS49;
+nextP(2,12) = PS60;
+nextP(3,12) = PS74;
+nextP(4,12) = P(0,12)*PS92 + P(1,12)*PS94 - P(12,13)*PS80 + P(12,14)*PS91 - P(12,15)*PS84 + P(2,12)*PS93 - P(3,12)*PS88 + P(4,12);
+nextP(5,12) = P(0,12)*PS88 - P(1,12)*PS93 - P(12,13)*PS129 - P(12,14)*PS127 + P(12,15)*PS131 + P(2,12)*PS94 + P(3,12)*PS92 + P(5,12);
+nextP(6,12) = P(0,12)*PS93 + P(1,12)*PS88 + P(12,13)*PS156 - P(12,14)*PS154 - P(12,15)*PS152 - P(2,12)*PS92 + P(3,12)*PS94 + P(6,12);
 nextP(7,12) = P(4,12)*dt + P(7,12);
 nextP(8,12) = P(5,12)*dt + P(8,12);
 nextP(9,12) = P(6,12)*dt + P(9,12);
 nextP(10,12) = P(10,12);
 nextP(11,12) = P(11,12);
 nextP(12,12) = P(12,12);
-nextP(0,13) = PS45;
-nextP(1,13) = PS93;
-nextP(2,13) = PS114;
-nextP(3,13) = PS130;
-nextP(4,13) = PS141;
-nextP(5,13) = PS170;
-nextP(6,13) = PS185;
+nextP(0,13) = PS81;
+nextP(1,13) = PS96;
+nextP(2,13) = PS100;
+nextP(3,13) = PS104;
+nextP(4,13) = PS108;
+nextP(5,13) = PS140;
+nextP(6,13) = PS166;
 nextP(7,13) = P(4,13)*dt + P(7,13);
 nextP(8,13) = P(5,13)*dt + P(8,13);
 nextP(9,13) = P(6,13)*dt + P(9,13);
@@ -293,13 +274,13 @@ nextP(10,13) = P(10,13);
 nextP(11,13) = P(11,13);
 nextP(12,13) = P(12,13);
 nextP(13,13) = P(13,13);
-nextP(0,14) = PS55;
-nextP(1,14) = PS96;
-nextP(2,14) = PS117;
-nextP(3,14) = PS133;
-nextP(4,14) = PS146;
-nextP(5,14) = PS169;
-nextP(6,14) = PS184;
+nextP(0,14) = PS89;
+nextP(1,14) = PS98;
+nextP(2,14) = PS102;
+nextP(3,14) = PS106;
+nextP(4,14) = PS113;
+nextP(5,14) = PS139;
+nextP(6,14) = PS165;
 nextP(7,14) = P(4,14)*dt + P(7,14);
 nextP(8,14) = P(5,14)*dt + P(8,14);
 nextP(9,14) = P(6,14)*dt + P(9,14);
@@ -308,13 +289,13 @@ nextP(11,14) = P(11,14);
 nextP(12,14) = P(12,14);
 nextP(13,14) = P(13,14);
 nextP(14,14) = P(14,14);
-nextP(0,15) = PS47;
-nextP(1,15) = PS94;
-nextP(2,15) = PS115;
-nextP(3,15) = PS131;
-nextP(4,15) = PS142;
-nextP(5,15) = PS173;
-nextP(6,15) = PS183;
+nextP(0,15) = PS82;
+nextP(1,15) = PS97;
+nextP(2,15) = PS101;
+nextP(3,15) = PS105;
+nextP(4,15) = PS109;
+nextP(5,15) = PS143;
+nextP(6,15) = PS164;
 nextP(7,15) = P(4,15)*dt + P(7,15);
 nextP(8,15) = P(5,15)*dt + P(8,15);
 nextP(9,15) = P(6,15)*dt + P(9,15);
@@ -328,9 +309,9 @@ nextP(0,16) = P(0,16) - P(1,16)*PS11 + P(10,16)*PS6 + P(11,16)*PS7 + P(12,16)*PS
 nextP(1,16) = P(0,16)*PS11 + P(1,16) - P(10,16)*PS34 + P(11,16)*PS9 - P(12,16)*PS7 + P(2,16)*PS13 - P(3,16)*PS12;
 nextP(2,16) = P(0,16)*PS12 - P(1,16)*PS13 - P(10,16)*PS9 - P(11,16)*PS34 + P(12,16)*PS6 + P(2,16) + P(3,16)*PS11;
 nextP(3,16) = P(0,16)*PS13 + P(1,16)*PS12 + P(10,16)*PS7 - P(11,16)*PS6 - P(12,16)*PS34 - P(2,16)*PS11 + P(3,16);
-nextP(4,16) = P(0,16)*PS72 + P(1,16)*PS62 - P(13,16)*PS44 + P(14,16)*PS140 - P(15,16)*PS139 + P(2,16)*PS60 - P(3,16)*PS74 + P(4,16);
-nextP(5,16) = P(0,16)*PS74 - P(1,16)*PS60 - P(13,16)*PS162 - P(14,16)*PS65 + P(15,16)*PS160 + P(2,16)*PS62 + P(3,16)*PS72 + P(5,16);
-nextP(6,16) = P(0,16)*PS60 + P(1,16)*PS74 + P(13,16)*PS166 - P(14,16)*PS165 - P(15,16)*PS70 - P(2,16)*PS72 + P(3,16)*PS62 + P(6,16);
+nextP(4,16) = P(0,16)*PS92 + P(1,16)*PS94 - P(13,16)*PS80 + P(14,16)*PS91 - P(15,16)*PS84 + P(2,16)*PS93 - P(3,16)*PS88 + P(4,16);
+nextP(5,16) = P(0,16)*PS88 - P(1,16)*PS93 - P(13,16)*PS129 - P(14,16)*PS127 + P(15,16)*PS131 + P(2,16)*PS94 + P(3,16)*PS92 + P(5,16);
+nextP(6,16) = P(0,16)*PS93 + P(1,16)*PS88 + P(13,16)*PS156 - P(14,16)*PS154 - P(15,16)*PS152 - P(2,16)*PS92 + P(3,16)*PS94 + P(6,16);
 nextP(7,16) = P(4,16)*dt + P(7,16);
 nextP(8,16) = P(5,16)*dt + P(8,16);
 nextP(9,16) = P(6,16)*dt + P(9,16);
@@ -345,9 +326,9 @@ nextP(0,17) = P(0,17) - P(1,17)*PS11 + P(10,17)*PS6 + P(11,17)*PS7 + P(12,17)*PS
 nextP(1,17) = P(0,17)*PS11 + P(1,17) - P(10,17)*PS34 + P(11,17)*PS9 - P(12,17)*PS7 + P(2,17)*PS13 - P(3,17)*PS12;
 nextP(2,17) = P(0,17)*PS12 - P(1,17)*PS13 - P(10,17)*PS9 - P(11,17)*PS34 + P(12,17)*PS6 + P(2,17) + P(3,17)*PS11;
 nextP(3,17) = P(0,17)*PS13 + P(1,17)*PS12 + P(10,17)*PS7 - P(11,17)*PS6 - P(12,17)*PS34 - P(2,17)*PS11 + P(3,17);
-nextP(4,17) = P(0,17)*PS72 + P(1,17)*PS62 - P(13,17)*PS44 + P(14,17)*PS140 - P(15,17)*PS139 + P(2,17)*PS60 - P(3,17)*PS74 + P(4,17);
-nextP(5,17) = P(0,17)*PS74 - P(1,17)*PS60 - P(13,17)*PS162 - P(14,17)*PS65 + P(15,17)*PS160 + P(2,17)*PS62 + P(3,17)*PS72 + P(5,17);
-nextP(6,17) = P(0,17)*PS60 + P(1,17)*PS74 + P(13,17)*PS166 - P(14,17)*PS165 - P(15,17)*PS70 - P(2,17)*PS72 + P(3,17)*PS62 + P(6,17);
+nextP(4,17) = P(0,17)*PS92 + P(1,17)*PS94 - P(13,17)*PS80 + P(14,17)*PS91 - P(15,17)*PS84 + P(2,17)*PS93 - P(3,17)*PS88 + P(4,17);
+nextP(5,17) = P(0,17)*PS88 - P(1,17)*PS93 - P(13,17)*PS129 - P(14,17)*PS127 + P(15,17)*PS131 + P(2,17)*PS94 + P(3,17)*PS92 + P(5,17);
+nextP(6,17) = P(0,17)*PS93 + P(1,17)*PS88 + P(13,17)*PS156 - P(14,17)*PS154 - P(15,17)*PS152 - P(2,17)*PS92 + P(3,17)*PS94 + P(6,17);
 nextP(7,17) = P(4,17)*dt + P(7,17);
 nextP(8,17) = P(5,17)*dt + P(8,17);
 nextP(9,17) = P(6,17)*dt + P(9,17);
@@ -363,9 +344,9 @@ nextP(0,18) = P(0,18) - P(1,18)*PS11 + P(10,18)*PS6 + P(11,18)*PS7 + P(12,18)*PS
 nextP(1,18) = P(0,18)*PS11 + P(1,18) - P(10,18)*PS34 + P(11,18)*PS9 - P(12,18)*PS7 + P(2,18)*PS13 - P(3,18)*PS12;
 nextP(2,18) = P(0,18)*PS12 - P(1,18)*PS13 - P(10,18)*PS9 - P(11,18)*PS34 + P(12,18)*PS6 + P(2,18) + P(3,18)*PS11;
 nextP(3,18) = P(0,18)*PS13 + P(1,18)*PS12 + P(10,18)*PS7 - P(11,18)*PS6 - P(12,18)*PS34 - P(2,18)*PS11 + P(3,18);
-nextP(4,18) = P(0,18)*PS72 + P(1,18)*PS62 - P(13,18)*PS44 + P(14,18)*PS140 - P(15,18)*PS139 + P(2,18)*PS60 - P(3,18)*PS74 + P(4,18);
-nextP(5,18) = P(0,18)*PS74 - P(1,18)*PS60 - P(13,18)*PS162 - P(14,18)*PS65 + P(15,18)*PS160 + P(2,18)*PS62 + P(3,18)*PS72 + P(5,18);
-nextP(6,18) = P(0,18)*PS60 + P(1,18)*PS74 + P(13,18)*PS166 - P(14,18)*PS165 - P(15,18)*PS70 - P(2,18)*PS72 + P(3,18)*PS62 + P(6,18);
+nextP(4,18) = P(0,18)*PS92 + P(1,18)*PS94 - P(13,18)*PS80 + P(14,18)*PS91 - P(15,18)*PS84 + P(2,18)*PS93 - P(3,18)*PS88 + P(4,18);
+nextP(5,18) = P(0,18)*PS88 - P(1,18)*PS93 - P(13,18)*PS129 - P(14,18)*PS127 + P(15,18)*PS131 + P(2,18)*PS94 + P(3,18)*PS92 + P(5,18);
+nextP(6,18) = P(0,18)*PS93 + P(1,18)*PS88 + P(13,18)*PS156 - P(14,18)*PS154 - P(15,18)*PS152 - P(2,18)*PS92 + P(3,18)*PS94 + P(6,18);
 nextP(7,18) = P(4,18)*dt + P(7,18);
 nextP(8,18) = P(5,18)*dt + P(8,18);
 nextP(9,18) = P(6,18)*dt + P(9,18);
@@ -382,9 +363,9 @@ nextP(0,19) = P(0,19) - P(1,19)*PS11 + P(10,19)*PS6 + P(11,19)*PS7 + P(12,19)*PS
 nextP(1,19) = P(0,19)*PS11 + P(1,19) - P(10,19)*PS34 + P(11,19)*PS9 - P(12,19)*PS7 + P(2,19)*PS13 - P(3,19)*PS12;
 nextP(2,19) = P(0,19)*PS12 - P(1,19)*PS13 - P(10,19)*PS9 - P(11,19)*PS34 + P(12,19)*PS6 + P(2,19) + P(3,19)*PS11;
 nextP(3,19) = P(0,19)*PS13 + P(1,19)*PS12 + P(10,19)*PS7 - P(11,19)*PS6 - P(12,19)*PS34 - P(2,19)*PS11 + P(3,19);
-nextP(4,19) = P(0,19)*PS72 + P(1,19)*PS62 - P(13,19)*PS44 + P(14,19)*PS140 - P(15,19)*PS139 + P(2,19)*PS60 - P(3,19)*PS74 + P(4,19);
-nextP(5,19) = P(0,19)*PS74 - P(1,19)*PS60 - P(13,19)*PS162 - P(14,19)*PS65 + P(15,19)*PS160 + P(2,19)*PS62 + P(3,19)*PS72 + P(5,19);
-nextP(6,19) = P(0,19)*PS60 + P(1,19)*PS74 + P(13,19)*PS166 - P(14,19)*PS165 - P(15,19)*PS70 - P(2,19)*PS72 + P(3,19)*PS62 + P(6,19);
+nextP(4,19) = P(0,19)*PS92 + P(1,19)*PS94 - P(13,19)*PS80 + P(14,19)*PS91 - P(15,19)*PS84 + P(2,19)*PS93 - P(3,19)*PS88 + P(4,19);
+nextP(5,19) = P(0,19)*PS88 - P(1,19)*PS93 - P(13,19)*PS129 - P(14,19)*PS127 + P(15,19)*PS131 + P(2,19)*PS94 + P(3,19)*PS92 + P(5,19);
+nextP(6,19) = P(0,19)*PS93 + P(1,19)*PS88 + P(13,19)*PS156 - P(14,19)*PS154 - P(15,19)*PS152 - P(2,19)*PS92 + P(3,19)*PS94 + P(6,19);
 nextP(7,19) = P(4,19)*dt + P(7,19);
 nextP(8,19) = P(5,19)*dt + P(8,19);
 nextP(9,19) = P(6,19)*dt + P(9,19);
@@ -402,9 +383,9 @@ nextP(0,20) = P(0,20) - P(1,20)*PS11 + P(10,20)*PS6 + P(11,20)*PS7 + P(12,20)*PS
 nextP(1,20) = P(0,20)*PS11 + P(1,20) - P(10,20)*PS34 + P(11,20)*PS9 - P(12,20)*PS7 + P(2,20)*PS13 - P(3,20)*PS12;
 nextP(2,20) = P(0,20)*PS12 - P(1,20)*PS13 - P(10,20)*PS9 - P(11,20)*PS34 + P(12,20)*PS6 + P(2,20) + P(3,20)*PS11;
 nextP(3,20) = P(0,20)*PS13 + P(1,20)*PS12 + P(10,20)*PS7 - P(11,20)*PS6 - P(12,20)*PS34 - P(2,20)*PS11 + P(3,20);
-nextP(4,20) = P(0,20)*PS72 + P(1,20)*PS62 - P(13,20)*PS44 + P(14,20)*PS140 - P(15,20)*PS139 + P(2,20)*PS60 - P(3,20)*PS74 + P(4,20);
-nextP(5,20) = P(0,20)*PS74 - P(1,20)*PS60 - P(13,20)*PS162 - P(14,20)*PS65 + P(15,20)*PS160 + P(2,20)*PS62 + P(3,20)*PS72 + P(5,20);
-nextP(6,20) = P(0,20)*PS60 + P(1,20)*PS74 + P(13,20)*PS166 - P(14,20)*PS165 - P(15,20)*PS70 - P(2,20)*PS72 + P(3,20)*PS62 + P(6,20);
+nextP(4,20) = P(0,20)*PS92 + P(1,20)*PS94 - P(13,20)*PS80 + P(14,20)*PS91 - P(15,20)*PS84 + P(2,20)*PS93 - P(3,20)*PS88 + P(4,20);
+nextP(5,20) = P(0,20)*PS88 - P(1,20)*PS93 - P(13,20)*PS129 - P(14,20)*PS127 + P(15,20)*PS131 + P(2,20)*PS94 + P(3,20)*PS92 + P(5,20);
+nextP(6,20) = P(0,20)*PS93 + P(1,20)*PS88 + P(13,20)*PS156 - P(14,20)*PS154 - P(15,20)*PS152 - P(2,20)*PS92 + P(3,20)*PS94 + P(6,20);
 nextP(7,20) = P(4,20)*dt + P(7,20);
 nextP(8,20) = P(5,20)*dt + P(8,20);
 nextP(9,20) = P(6,20)*dt + P(9,20);
@@ -423,9 +404,9 @@ nextP(0,21) = P(0,21) - P(1,21)*PS11 + P(10,21)*PS6 + P(11,21)*PS7 + P(12,21)*PS
 nextP(1,21) = P(0,21)*PS11 + P(1,21) - P(10,21)*PS34 + P(11,21)*PS9 - P(12,21)*PS7 + P(2,21)*PS13 - P(3,21)*PS12;
 nextP(2,21) = P(0,21)*PS12 - P(1,21)*PS13 - P(10,21)*PS9 - P(11,21)*PS34 + P(12,21)*PS6 + P(2,21) + P(3,21)*PS11;
 nextP(3,21) = P(0,21)*PS13 + P(1,21)*PS12 + P(10,21)*PS7 - P(11,21)*PS6 - P(12,21)*PS34 - P(2,21)*PS11 + P(3,21);
-nextP(4,21) = P(0,21)*PS72 + P(1,21)*PS62 - P(13,21)*PS44 + P(14,21)*PS140 - P(15,21)*PS139 + P(2,21)*PS60 - P(3,21)*PS74 + P(4,21);
-nextP(5,21) = P(0,21)*PS74 - P(1,21)*PS60 - P(13,21)*PS162 - P(14,21)*PS65 + P(15,21)*PS160 + P(2,21)*PS62 + P(3,21)*PS72 + P(5,21);
-nextP(6,21) = P(0,21)*PS60 + P(1,21)*PS74 + P(13,21)*PS166 - P(14,21)*PS165 - P(15,21)*PS70 - P(2,21)*PS72 + P(3,21)*PS62 + P(6,21);
+nextP(4,21) = P(0,21)*PS92 + P(1,21)*PS94 - P(13,21)*PS80 + P(14,21)*PS91 - P(15,21)*PS84 + P(2,21)*PS93 - P(3,21)*PS88 + P(4,21);
+nextP(5,21) = P(0,21)*PS88 - P(1,21)*PS93 - P(13,21)*PS129 - P(14,21)*PS127 + P(15,21)*PS131 + P(2,21)*PS94 + P(3,21)*PS92 + P(5,21);
+nextP(6,21) = P(0,21)*PS93 + P(1,21)*PS88 + P(13,21)*PS156 - P(14,21)*PS154 - P(15,21)*PS152 - P(2,21)*PS92 + P(3,21)*PS94 + P(6,21);
 nextP(7,21) = P(4,21)*dt + P(7,21);
 nextP(8,21) = P(5,21)*dt + P(8,21);
 nextP(9,21) = P(6,21)*dt + P(9,21);
@@ -445,9 +426,9 @@ nextP(0,22) = P(0,22) - P(1,22)*PS11 + P(10,22)*PS6 + P(11,22)*PS7 + P(12,22)*PS
 nextP(1,22) = P(0,22)*PS11 + P(1,22) - P(10,22)*PS34 + P(11,22)*PS9 - P(12,22)*PS7 + P(2,22)*PS13 - P(3,22)*PS12;
 nextP(2,22) = P(0,22)*PS12 - P(1,22)*PS13 - P(10,22)*PS9 - P(11,22)*PS34 + P(12,22)*PS6 + P(2,22) + P(3,22)*PS11;
 nextP(3,22) = P(0,22)*PS13 + P(1,22)*PS12 + P(10,22)*PS7 - P(11,22)*PS6 - P(12,22)*PS34 - P(2,22)*PS11 + P(3,22);
-nextP(4,22) = P(0,22)*PS72 + P(1,22)*PS62 - P(13,22)*PS44 + P(14,22)*PS140 - P(15,22)*PS139 + P(2,22)*PS60 - P(3,22)*PS74 + P(4,22);
-nextP(5,22) = P(0,22)*PS74 - P(1,22)*PS60 - P(13,22)*PS162 - P(14,22)*PS65 + P(15,22)*PS160 + P(2,22)*PS62 + P(3,22)*PS72 + P(5,22);
-nextP(6,22) = P(0,22)*PS60 + P(1,22)*PS74 + P(13,22)*PS166 - P(14,22)*PS165 - P(15,22)*PS70 - P(2,22)*PS72 + P(3,22)*PS62 + P(6,22);
+nextP(4,22) = P(0,22)*PS92 + P(1,22)*PS94 - P(13,22)*PS80 + P(14,22)*PS91 - P(15,22)*PS84 + P(2,22)*PS93 - P(3,22)*PS88 + P(4,22);
+nextP(5,22) = P(0,22)*PS88 - P(1,22)*PS93 - P(13,22)*PS129 - P(14,22)*PS127 + P(15,22)*PS131 + P(2,22)*PS94 + P(3,22)*PS92 + P(5,22);
+nextP(6,22) = P(0,22)*PS93 + P(1,22)*PS88 + P(13,22)*PS156 - P(14,22)*PS154 - P(15,22)*PS152 - P(2,22)*PS92 + P(3,22)*PS94 + P(6,22);
 nextP(7,22) = P(4,22)*dt + P(7,22);
 nextP(8,22) = P(5,22)*dt + P(8,22);
 nextP(9,22) = P(6,22)*dt + P(9,22);
@@ -468,9 +449,9 @@ nextP(0,23) = P(0,23) - P(1,23)*PS11 + P(10,23)*PS6 + P(11,23)*PS7 + P(12,23)*PS
 nextP(1,23) = P(0,23)*PS11 + P(1,23) - P(10,23)*PS34 + P(11,23)*PS9 - P(12,23)*PS7 + P(2,23)*PS13 - P(3,23)*PS12;
 nextP(2,23) = P(0,23)*PS12 - P(1,23)*PS13 - P(10,23)*PS9 - P(11,23)*PS34 + P(12,23)*PS6 + P(2,23) + P(3,23)*PS11;
 nextP(3,23) = P(0,23)*PS13 + P(1,23)*PS12 + P(10,23)*PS7 - P(11,23)*PS6 - P(12,23)*PS34 - P(2,23)*PS11 + P(3,23);
-nextP(4,23) = P(0,23)*PS72 + P(1,23)*PS62 - P(13,23)*PS44 + P(14,23)*PS140 - P(15,23)*PS139 + P(2,23)*PS60 - P(3,23)*PS74 + P(4,23);
-nextP(5,23) = P(0,23)*PS74 - P(1,23)*PS60 - P(13,23)*PS162 - P(14,23)*PS65 + P(15,23)*PS160 + P(2,23)*PS62 + P(3,23)*PS72 + P(5,23);
-nextP(6,23) = P(0,23)*PS60 + P(1,23)*PS74 + P(13,23)*PS166 - P(14,23)*PS165 - P(15,23)*PS70 - P(2,23)*PS72 + P(3,23)*PS62 + P(6,23);
+nextP(4,23) = P(0,23)*PS92 + P(1,23)*PS94 - P(13,23)*PS80 + P(14,23)*PS91 - P(15,23)*PS84 + P(2,23)*PS93 - P(3,23)*PS88 + P(4,23);
+nextP(5,23) = P(0,23)*PS88 - P(1,23)*PS93 - P(13,23)*PS129 - P(14,23)*PS127 + P(15,23)*PS131 + P(2,23)*PS94 + P(3,23)*PS92 + P(5,23);
+nextP(6,23) = P(0,23)*PS93 + P(1,23)*PS88 + P(13,23)*PS156 - P(14,23)*PS154 - P(15,23)*PS152 - P(2,23)*PS92 + P(3,23)*PS94 + P(6,23);
 nextP(7,23) = P(4,23)*dt + P(7,23);
 nextP(8,23) = P(5,23)*dt + P(8,23);
 nextP(9,23) = P(6,23)*dt + P(9,23);
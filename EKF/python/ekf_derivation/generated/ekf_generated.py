@@ -0,0 +1,8331 @@
+# generated by ekf_derivation/main.py, do not edit
+#
+# Batched NumPy versions of the EKF equations. The states of a batch of filters
+# are an array of shape (n_filters, 24) and their covariance matrices an array
+# of shape (n_filters, 24, 24), the other inputs are arrays of shape (n_filters,)
+# or scalars. predict_covariance returns the predicted covariance matrices of all
+# filters, without the process noise. The fuse_* functions only return the
+# observation Jacobian H and the Kalman gain K of each filter, the caller
+# computes the innovations and applies the state and covariance updates.
+#
+# The *_kernel functions compute the same outputs in a loop over the filters,
+# which is compiled with numba if it is installed.
+import math
+import numpy
+
+try:
+    from numba import njit as jit
+except ImportError:
+    def jit(function):
+        return function
+
+# covariance matrix prediction, without process noise
+def predict_covariance(states, P, dax, daxVar, day, dayVar, daz, dazVar, dt, dvx, dvxVar, dvy, dvyVar, dvz, dvzVar):
+    q0 = states[..., 0]
+    q1 = states[..., 1]
+    q2 = states[..., 2]
+    q3 = states[..., 3]
+    dax_b = states[..., 10]
+    day_b = states[..., 11]
+    daz_b = states[..., 12]
+    dvx_b = states[..., 13]
+    dvy_b = states[..., 14]
+    dvz_b = states[..., 15]
+    P_0_0 = P[..., 0, 0]
+    P_0_1 = P[..., 0, 1]
+    P_0_2 = P[..., 0, 2]
+    P_0_3 = P[..., 0, 3]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_7 = P[..., 0, 7]
+    P_0_8 = P[..., 0, 8]
+    P_0_9 = P[..., 0, 9]
+    P_0_10 = P[..., 0, 10]
+    P_0_11 = P[..., 0, 11]
+    P_0_12 = P[..., 0, 12]
+    P_0_13 = P[..., 0, 13]
+    P_0_14 = P[..., 0, 14]
+    P_0_15 = P[..., 0, 15]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_0_18 = P[..., 0, 18]
+    P_0_19 = P[..., 0, 19]
+    P_0_20 = P[..., 0, 20]
+    P_0_21 = P[..., 0, 21]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_1 = P[..., 1, 1]
+    P_1_2 = P[..., 1, 2]
+    P_1_3 = P[..., 1, 3]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_7 = P[..., 1, 7]
+    P_1_8 = P[..., 1, 8]
+    P_1_9 = P[..., 1, 9]
+    P_1_10 = P[..., 1, 10]
+    P_1_11 = P[..., 1, 11]
+    P_1_12 = P[..., 1, 12]
+    P_1_13 = P[..., 1, 13]
+    P_1_14 = P[..., 1, 14]
+    P_1_15 = P[..., 1, 15]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_1_18 = P[..., 1, 18]
+    P_1_19 = P[..., 1, 19]
+    P_1_20 = P[..., 1, 20]
+    P_1_21 = P[..., 1, 21]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_2 = P[..., 2, 2]
+    P_2_3 = P[..., 2, 3]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_7 = P[..., 2, 7]
+    P_2_8 = P[..., 2, 8]
+    P_2_9 = P[..., 2, 9]
+    P_2_10 = P[..., 2, 10]
+    P_2_11 = P[..., 2, 11]
+    P_2_12 = P[..., 2, 12]
+    P_2_13 = P[..., 2, 13]
+    P_2_14 = P[..., 2, 14]
+    P_2_15 = P[..., 2, 15]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_2_18 = P[..., 2, 18]
+    P_2_19 = P[..., 2, 19]
+    P_2_20 = P[..., 2, 20]
+    P_2_21 = P[..., 2, 21]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_3 = P[..., 3, 3]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_7 = P[..., 3, 7]
+    P_3_8 = P[..., 3, 8]
+    P_3_9 = P[..., 3, 9]
+    P_3_10 = P[..., 3, 10]
+    P_3_11 = P[..., 3, 11]
+    P_3_12 = P[..., 3, 12]
+    P_3_13 = P[..., 3, 13]
+    P_3_14 = P[..., 3, 14]
+    P_3_15 = P[..., 3, 15]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_3_18 = P[..., 3, 18]
+    P_3_19 = P[..., 3, 19]
+    P_3_20 = P[..., 3, 20]
+    P_3_21 = P[..., 3, 21]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    P_4_4 = P[..., 4, 4]
+    P_4_5 = P[..., 4, 5]
+    P_4_6 = P[..., 4, 6]
+    P_4_7 = P[..., 4, 7]
+    P_4_8 = P[..., 4, 8]
+    P_4_9 = P[..., 4, 9]
+    P_4_10 = P[..., 4, 10]
+    P_4_11 = P[..., 4, 11]
+    P_4_12 = P[..., 4, 12]
+    P_4_13 = P[..., 4, 13]
+    P_4_14 = P[..., 4, 14]
+    P_4_15 = P[..., 4, 15]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_4_18 = P[..., 4, 18]
+    P_4_19 = P[..., 4, 19]
+    P_4_20 = P[..., 4, 20]
+    P_4_21 = P[..., 4, 21]
+    P_4_22 = P[..., 4, 22]
+    P_4_23 = P[..., 4, 23]
+    P_5_5 = P[..., 5, 5]
+    P_5_6 = P[..., 5, 6]
+    P_5_7 = P[..., 5, 7]
+    P_5_8 = P[..., 5, 8]
+    P_5_9 = P[..., 5, 9]
+    P_5_10 = P[..., 5, 10]
+    P_5_11 = P[..., 5, 11]
+    P_5_12 = P[..., 5, 12]
+    P_5_13 = P[..., 5, 13]
+    P_5_14 = P[..., 5, 14]
+    P_5_15 = P[..., 5, 15]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_5_18 = P[..., 5, 18]
+    P_5_19 = P[..., 5, 19]
+    P_5_20 = P[..., 5, 20]
+    P_5_21 = P[..., 5, 21]
+    P_5_22 = P[..., 5, 22]
+    P_5_23 = P[..., 5, 23]
+    P_6_6 = P[..., 6, 6]
+    P_6_7 = P[..., 6, 7]
+    P_6_8 = P[..., 6, 8]
+    P_6_9 = P[..., 6, 9]
+    P_6_10 = P[..., 6, 10]
+    P_6_11 = P[..., 6, 11]
+    P_6_12 = P[..., 6, 12]
+    P_6_13 = P[..., 6, 13]
+    P_6_14 = P[..., 6, 14]
+    P_6_15 = P[..., 6, 15]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_6_18 = P[..., 6, 18]
+    P_6_19 = P[..., 6, 19]
+    P_6_20 = P[..., 6, 20]
+    P_6_21 = P[..., 6, 21]
+    P_6_22 = P[..., 6, 22]
+    P_6_23 = P[..., 6, 23]
+    P_7_7 = P[..., 7, 7]
+    P_7_8 = P[..., 7, 8]
+    P_7_9 = P[..., 7, 9]
+    P_7_10 = P[..., 7, 10]
+    P_7_11 = P[..., 7, 11]
+    P_7_12 = P[..., 7, 12]
+    P_7_13 = P[..., 7, 13]
+    P_7_14 = P[..., 7, 14]
+    P_7_15 = P[..., 7, 15]
+    P_7_16 = P[..., 7, 16]
+    P_7_17 = P[..., 7, 17]
+    P_7_18 = P[..., 7, 18]
+    P_7_19 = P[..., 7, 19]
+    P_7_20 = P[..., 7, 20]
+    P_7_21 = P[..., 7, 21]
+    P_7_22 = P[..., 7, 22]
+    P_7_23 = P[..., 7, 23]
+    P_8_8 = P[..., 8, 8]
+    P_8_9 = P[..., 8, 9]
+    P_8_10 = P[..., 8, 10]
+    P_8_11 = P[..., 8, 11]
+    P_8_12 = P[..., 8, 12]
+    P_8_13 = P[..., 8, 13]
+    P_8_14 = P[..., 8, 14]
+    P_8_15 = P[..., 8, 15]
+    P_8_16 = P[..., 8, 16]
+    P_8_17 = P[..., 8, 17]
+    P_8_18 = P[..., 8, 18]
+    P_8_19 = P[..., 8, 19]
+    P_8_20 = P[..., 8, 20]
+    P_8_21 = P[..., 8, 21]
+    P_8_22 = P[..., 8, 22]
+    P_8_23 = P[..., 8, 23]
+    P_9_9 = P[..., 9, 9]
+    P_9_10 = P[..., 9, 10]
+    P_9_11 = P[..., 9, 11]
+    P_9_12 = P[..., 9, 12]
+    P_9_13 = P[..., 9, 13]
+    P_9_14 = P[..., 9, 14]
+    P_9_15 = P[..., 9, 15]
+    P_9_16 = P[..., 9, 16]
+    P_9_17 = P[..., 9, 17]
+    P_9_18 = P[..., 9, 18]
+    P_9_19 = P[..., 9, 19]
+    P_9_20 = P[..., 9, 20]
+    P_9_21 = P[..., 9, 21]
+    P_9_22 = P[..., 9, 22]
+    P_9_23 = P[..., 9, 23]
+    P_10_10 = P[..., 10, 10]
+    P_10_11 = P[..., 10, 11]
+    P_10_12 = P[..., 10, 12]
+    P_10_13 = P[..., 10, 13]
+    P_10_14 = P[..., 10, 14]
+    P_10_15 = P[..., 10, 15]
+    P_10_16 = P[..., 10, 16]
+    P_10_17 = P[..., 10, 17]
+    P_10_18 = P[..., 10, 18]
+    P_10_19 = P[..., 10, 19]
+    P_10_20 = P[..., 10, 20]
+    P_10_21 = P[..., 10, 21]
+    P_10_22 = P[..., 10, 22]
+    P_10_23 = P[..., 10, 23]
+    P_11_11 = P[..., 11, 11]
+    P_11_12 = P[..., 11, 12]
+    P_11_13 = P[..., 11, 13]
+    P_11_14 = P[..., 11, 14]
+    P_11_15 = P[..., 11, 15]
+    P_11_16 = P[..., 11, 16]
+    P_11_17 = P[..., 11, 17]
+    P_11_18 = P[..., 11, 18]
+    P_11_19 = P[..., 11, 19]
+    P_11_20 = P[..., 11, 20]
+    P_11_21 = P[..., 11, 21]
+    P_11_22 = P[..., 11, 22]
+    P_11_23 = P[..., 11, 23]
+    P_12_12 = P[..., 12, 12]
+    P_12_13 = P[..., 12, 13]
+    P_12_14 = P[..., 12, 14]
+    P_12_15 = P[..., 12, 15]
+    P_12_16 = P[..., 12, 16]
+    P_12_17 = P[..., 12, 17]
+    P_12_18 = P[..., 12, 18]
+    P_12_19 = P[..., 12, 19]
+    P_12_20 = P[..., 12, 20]
+    P_12_21 = P[..., 12, 21]
+    P_12_22 = P[..., 12, 22]
+    P_12_23 = P[..., 12, 23]
+    P_13_13 = P[..., 13, 13]
+    P_13_14 = P[..., 13, 14]
+    P_13_15 = P[..., 13, 15]
+    P_13_16 = P[..., 13, 16]
+    P_13_17 = P[..., 13, 17]
+    P_13_18 = P[..., 13, 18]
+    P_13_19 = P[..., 13, 19]
+    P_13_20 = P[..., 13, 20]
+    P_13_21 = P[..., 13, 21]
+    P_13_22 = P[..., 13, 22]
+    P_13_23 = P[..., 13, 23]
+    P_14_14 = P[..., 14, 14]
+    P_14_15 = P[..., 14, 15]
+    P_14_16 = P[..., 14, 16]
+    P_14_17 = P[..., 14, 17]
+    P_14_18 = P[..., 14, 18]
+    P_14_19 = P[..., 14, 19]
+    P_14_20 = P[..., 14, 20]
+    P_14_21 = P[..., 14, 21]
+    P_14_22 = P[..., 14, 22]
+    P_14_23 = P[..., 14, 23]
+    P_15_15 = P[..., 15, 15]
+    P_15_16 = P[..., 15, 16]
+    P_15_17 = P[..., 15, 17]
+    P_15_18 = P[..., 15, 18]
+    P_15_19 = P[..., 15, 19]
+    P_15_20 = P[..., 15, 20]
+    P_15_21 = P[..., 15, 21]
+    P_15_22 = P[..., 15, 22]
+    P_15_23 = P[..., 15, 23]
+    P_16_16 = P[..., 16, 16]
+    P_16_17 = P[..., 16, 17]
+    P_16_18 = P[..., 16, 18]
+    P_16_19 = P[..., 16, 19]
+    P_16_20 = P[..., 16, 20]
+    P_16_21 = P[..., 16, 21]
+    P_16_22 = P[..., 16, 22]
+    P_16_23 = P[..., 16, 23]
+    P_17_17 = P[..., 17, 17]
+    P_17_18 = P[..., 17, 18]
+    P_17_19 = P[..., 17, 19]
+    P_17_20 = P[..., 17, 20]
+    P_17_21 = P[..., 17, 21]
+    P_17_22 = P[..., 17, 22]
+    P_17_23 = P[..., 17, 23]
+    P_18_18 = P[..., 18, 18]
+    P_18_19 = P[..., 18, 19]
+    P_18_20 = P[..., 18, 20]
+    P_18_21 = P[..., 18, 21]
+    P_18_22 = P[..., 18, 22]
+    P_18_23 = P[..., 18, 23]
+    P_19_19 = P[..., 19, 19]
+    P_19_20 = P[..., 19, 20]
+    P_19_21 = P[..., 19, 21]
+    P_19_22 = P[..., 19, 22]
+    P_19_23 = P[..., 19, 23]
+    P_20_20 = P[..., 20, 20]
+    P_20_21 = P[..., 20, 21]
+    P_20_22 = P[..., 20, 22]
+    P_20_23 = P[..., 20, 23]
+    P_21_21 = P[..., 21, 21]
+    P_21_22 = P[..., 21, 22]
+    P_21_23 = P[..., 21, 23]
+    P_22_22 = P[..., 22, 22]
+    P_22_23 = P[..., 22, 23]
+    P_23_23 = P[..., 23, 23]
+    PS0 = q1**2
+    PS1 = 0.25*daxVar
+    PS2 = q2**2
+    PS3 = 0.25*dayVar
+    PS4 = q3**2
+    PS5 = 0.25*dazVar
+    PS6 = 0.5*q1
+    PS7 = 0.5*q2
+    PS8 = PS7*P_10_11
+    PS9 = 0.5*q3
+    PS10 = PS9*P_10_12
+    PS11 = 0.5*dax - 0.5*dax_b
+    PS12 = 0.5*day - 0.5*day_b
+    PS13 = 0.5*daz - 0.5*daz_b
+    PS14 = PS10 - PS11*P_1_10 - PS12*P_2_10 - PS13*P_3_10 + PS6*P_10_10 + PS8 + P_0_10
+    PS15 = PS6*P_10_11
+    PS16 = PS9*P_11_12
+    PS17 = -PS11*P_1_11 - PS12*P_2_11 - PS13*P_3_11 + PS15 + PS16 + PS7*P_11_11 + P_0_11
+    PS18 = PS6*P_10_12
+    PS19 = PS7*P_11_12
+    PS20 = -PS11*P_1_12 - PS12*P_2_12 - PS13*P_3_12 + PS18 + PS19 + PS9*P_12_12 + P_0_12
+    PS21 = PS12*P_1_2
+    PS22 = -PS13*P_1_3
+    PS23 = -PS11*P_1_1 - PS21 + PS22 + PS6*P_1_10 + PS7*P_1_11 + PS9*P_1_12 + P_0_1
+    PS24 = -PS11*P_1_2
+    PS25 = PS13*P_2_3
+    PS26 = -PS12*P_2_2 + PS24 - PS25 + PS6*P_2_10 + PS7*P_2_11 + PS9*P_2_12 + P_0_2
+    PS27 = PS11*P_1_3
+    PS28 = -PS12*P_2_3
+    PS29 = -PS13*P_3_3 - PS27 + PS28 + PS6*P_3_10 + PS7*P_3_11 + PS9*P_3_12 + P_0_3
+    PS30 = PS11*P_0_1
+    PS31 = PS12*P_0_2
+    PS32 = PS13*P_0_3
+    PS33 = -PS30 - PS31 - PS32 + PS6*P_0_10 + PS7*P_0_11 + PS9*P_0_12 + P_0_0
+    PS34 = 0.5*q0
+    PS35 = q2*q3
+    PS36 = q0*q1
+    PS37 = q0**2
+    PS38 = -PS34*P_10_11
+    PS39 = PS11*P_0_11 - PS12*P_3_11 + PS13*P_2_11 - PS19 + PS38 + PS9*P_11_11 + P_1_11
+    PS40 = PS13*P_0_2
+    PS41 = PS12*P_0_3
+    PS42 = PS11*P_0_0 - PS34*P_0_10 + PS40 - PS41 - PS7*P_0_12 + PS9*P_0_11 + P_0_1
+    PS43 = PS11*P_0_2
+    PS44 = PS13*P_2_2 + PS28 - PS34*P_2_10 + PS43 - PS7*P_2_12 + PS9*P_2_11 + P_1_2
+    PS45 = PS9*P_10_11
+    PS46 = PS7*P_10_12
+    PS47 = PS11*P_0_10 - PS12*P_3_10 + PS13*P_2_10 - PS34*P_10_10 + PS45 - PS46 + P_1_10
+    PS48 = -PS34*P_10_12
+    PS49 = PS11*P_0_12 - PS12*P_3_12 + PS13*P_2_12 + PS16 + PS48 - PS7*P_12_12 + P_1_12
+    PS50 = PS11*P_0_3
+    PS51 = -PS12*P_3_3 + PS25 - PS34*P_3_10 + PS50 - PS7*P_3_12 + PS9*P_3_11 + P_1_3
+    PS52 = PS13*P_1_2
+    PS53 = PS12*P_1_3
+    PS54 = PS30 - PS34*P_1_10 + PS52 - PS53 - PS7*P_1_12 + PS9*P_1_11 + P_1_1
+    PS55 = q1*q3
+    PS56 = q0*q2
+    PS57 = q0*q3
+    PS58 = q1*q2
+    PS59 = -PS34*P_11_12
+    PS60 = -PS10 + PS11*P_3_12 + PS12*P_0_12 - PS13*P_1_12 + PS59 + PS6*P_12_12 + P_2_12
+    PS61 = PS11*P_3_3 + PS22 - PS34*P_3_11 + PS41 + PS6*P_3_12 - PS9*P_3_10 + P_2_3
+    PS62 = PS13*P_0_1
+    PS63 = PS12*P_0_0 - PS34*P_0_11 + PS50 + PS6*P_0_12 - PS62 - PS9*P_0_10 + P_0_2
+    PS64 = PS6*P_11_12
+    PS65 = PS11*P_3_11 + PS12*P_0_11 - PS13*P_1_11 - PS34*P_11_11 - PS45 + PS64 + P_2_11
+    PS66 = PS11*P_3_10 + PS12*P_0_10 - PS13*P_1_10 + PS18 + PS38 - PS9*P_10_10 + P_2_10
+    PS67 = PS12*P_0_1
+    PS68 = -PS13*P_1_1 + PS27 - PS34*P_1_11 + PS6*P_1_12 + PS67 - PS9*P_1_10 + P_1_2
+    PS69 = PS11*P_2_3
+    PS70 = PS31 - PS34*P_2_11 - PS52 + PS6*P_2_12 + PS69 - PS9*P_2_10 + P_2_2
+    PS71 = -PS11*P_2_10 + PS12*P_1_10 + PS13*P_0_10 - PS15 + PS48 + PS7*P_10_10 + P_3_10
+    PS72 = PS12*P_1_1 + PS24 - PS34*P_1_12 - PS6*P_1_11 + PS62 + PS7*P_1_10 + P_1_3
+    PS73 = PS13*P_0_0 - PS34*P_0_12 - PS43 - PS6*P_0_11 + PS67 + PS7*P_0_10 + P_0_3
+    PS74 = -PS11*P_2_12 + PS12*P_1_12 + PS13*P_0_12 - PS34*P_12_12 + PS46 - PS64 + P_3_12
+    PS75 = -PS11*P_2_11 + PS12*P_1_11 + PS13*P_0_11 + PS59 - PS6*P_11_11 + PS8 + P_3_11
+    PS76 = -PS11*P_2_2 + PS21 - PS34*P_2_12 + PS40 - PS6*P_2_11 + PS7*P_2_10 + P_2_3
+    PS77 = PS32 - PS34*P_3_12 + PS53 - PS6*P_3_11 - PS69 + PS7*P_3_10 + P_3_3
+    PS78 = -PS2
+    PS79 = PS37 - PS4
+    PS80 = PS0 + PS78 + PS79
+    PS81 = -PS11*P_1_13 - PS12*P_2_13 - PS13*P_3_13 + PS6*P_10_13 + PS7*P_11_13 + PS9*P_12_13 + P_0_13
+    PS82 = -PS11*P_1_15 - PS12*P_2_15 - PS13*P_3_15 + PS6*P_10_15 + PS7*P_11_15 + PS9*P_12_15 + P_0_15
+    PS83 = PS55 + PS56
+    PS84 = 2*PS83
+    PS85 = dvy - dvy_b
+    PS86 = dvx - dvx_b
+    PS87 = dvz - dvz_b
+    PS88 = 2*PS85*q0 + 2*PS86*q3 - 2*PS87*q1
+    PS89 = -PS11*P_1_14 - PS12*P_2_14 - PS13*P_3_14 + PS6*P_10_14 + PS7*P_11_14 + PS9*P_12_14 + P_0_14
+    PS90 = PS57 - PS58
+    PS91 = 2*PS90
+    PS92 = -2*PS85*q3 + 2*PS86*q0 + 2*PS87*q2
+    PS93 = 2*PS85*q1 - 2*PS86*q2 + 2*PS87*q0
+    PS94 = 2*PS85*q2 + 2*PS86*q1 + 2*PS87*q3
+    PS95 = -PS11*P_1_4 - PS12*P_2_4 - PS13*P_3_4 + PS6*P_4_10 + PS7*P_4_11 + PS9*P_4_12 + P_0_4
+    PS96 = PS11*P_0_13 - PS12*P_3_13 + PS13*P_2_13 - PS34*P_10_13 - PS7*P_12_13 + PS9*P_11_13 + P_1_13
+    PS97 = PS11*P_0_15 - PS12*P_3_15 + PS13*P_2_15 - PS34*P_10_15 - PS7*P_12_15 + PS9*P_11_15 + P_1_15
+    PS98 = PS11*P_0_14 - PS12*P_3_14 + PS13*P_2_14 - PS34*P_10_14 - PS7*P_12_14 + PS9*P_11_14 + P_1_14
+    PS99 = PS11*P_0_4 - PS12*P_3_4 + PS13*P_2_4 - PS34*P_4_10 - PS7*P_4_12 + PS9*P_4_11 + P_1_4
+    PS100 = PS11*P_3_13 + PS12*P_0_13 - PS13*P_1_13 - PS34*P_11_13 + PS6*P_12_13 - PS9*P_10_13 + P_2_13
+    PS101 = PS11*P_3_15 + PS12*P_0_15 - PS13*P_1_15 - PS34*P_11_15 + PS6*P_12_15 - PS9*P_10_15 + P_2_15
+    PS102 = PS11*P_3_14 + PS12*P_0_14 - PS13*P_1_14 - PS34*P_11_14 + PS6*P_12_14 - PS9*P_10_14 + P_2_14
+    PS103 = PS11*P_3_4 + PS12*P_0_4 - PS13*P_1_4 - PS34*P_4_11 + PS6*P_4_12 - PS9*P_4_10 + P_2_4
+    PS104 = -PS11*P_2_13 + PS12*P_1_13 + PS13*P_0_13 - PS34*P_12_13 - PS6*P_11_13 + PS7*P_10_13 + P_3_13
+    PS105 = -PS11*P_2_15 + PS12*P_1_15 + PS13*P_0_15 - PS34*P_12_15 - PS6*P_11_15 + PS7*P_10_15 + P_3_15
+    PS106 = -PS11*P_2_14 + PS12*P_1_14 + PS13*P_0_14 - PS34*P_12_14 - PS6*P_11_14 + PS7*P_10_14 + P_3_14
+    PS107 = -PS11*P_2_4 + PS12*P_1_4 + PS13*P_0_4 - PS34*P_4_12 - PS6*P_4_11 + PS7*P_4_10 + P_3_4
+    PS108 = -PS80*P_13_13 - PS84*P_13_15 - PS88*P_3_13 + PS91*P_13_14 + PS92*P_0_13 + PS93*P_2_13 + PS94*P_1_13 + P_4_13
+    PS109 = -PS80*P_13_15 - PS84*P_15_15 - PS88*P_3_15 + PS91*P_14_15 + PS92*P_0_15 + PS93*P_2_15 + PS94*P_1_15 + P_4_15
+    PS110 = PS94*P_1_3
+    PS111 = PS92*P_0_3
+    PS112 = PS110 + PS111 - PS80*P_3_13 - PS84*P_3_15 - PS88*P_3_3 + PS91*P_3_14 + PS93*P_2_3 + P_3_4
+    PS113 = -PS80*P_13_14 - PS84*P_14_15 - PS88*P_3_14 + PS91*P_14_14 + PS92*P_0_14 + PS93*P_2_14 + PS94*P_1_14 + P_4_14
+    PS114 = PS93*P_0_2
+    PS115 = PS88*P_0_3
+    PS116 = PS114 - PS115 - PS80*P_0_13 - PS84*P_0_15 + PS91*P_0_14 + PS92*P_0_0 + PS94*P_0_1 + P_0_4
+    PS117 = PS94*P_1_2
+    PS118 = PS92*P_0_2
+    PS119 = PS117 + PS118 - PS80*P_2_13 - PS84*P_2_15 - PS88*P_2_3 + PS91*P_2_14 + PS93*P_2_2 + P_2_4
+    PS120 = PS93*P_1_2
+    PS121 = PS88*P_1_3
+    PS122 = PS120 - PS121 - PS80*P_1_13 - PS84*P_1_15 + PS91*P_1_14 + PS92*P_0_1 + PS94*P_1_1 + P_1_4
+    PS123 = 4*dvyVar
+    PS124 = 4*dvzVar
+    PS125 = -PS80*P_4_13 - PS84*P_4_15 - PS88*P_3_4 + PS91*P_4_14 + PS92*P_0_4 + PS93*P_2_4 + PS94*P_1_4 + P_4_4
+    PS126 = -PS0
+    PS127 = PS126 + PS2 + PS79
+    PS128 = PS57 + PS58
+    PS129 = 2*PS128
+    PS130 = -PS35 + PS36
+    PS131 = 2*PS130
+    PS132 = -PS11*P_1_5 - PS12*P_2_5 - PS13*P_3_5 + PS6*P_5_10 + PS7*P_5_11 + PS9*P_5_12 + P_0_5
+    PS133 = PS11*P_0_5 - PS12*P_3_5 + PS13*P_2_5 - PS34*P_5_10 - PS7*P_5_12 + PS9*P_5_11 + P_1_5
+    PS134 = PS11*P_3_5 + PS12*P_0_5 - PS13*P_1_5 - PS34*P_5_11 + PS6*P_5_12 - PS9*P_5_10 + P_2_5
+    PS135 = -PS11*P_2_5 + PS12*P_1_5 + PS13*P_0_5 - PS34*P_5_12 - PS6*P_5_11 + PS7*P_5_10 + P_3_5
+    PS136 = PS127*dvyVar
+    PS137 = PS80*dvxVar
+    PS138 = -PS80*P_5_13 - PS84*P_5_15 - PS88*P_3_5 + PS91*P_5_14 + PS92*P_0_5 + PS93*P_2_5 + PS94*P_1_5 + P_4_5
+    PS139 = -PS127*P_14_14 - PS129*P_13_14 + PS131*P_14_15 + PS88*P_0_14 + PS92*P_3_14 - PS93*P_1_14 + PS94*P_2_14 + P_5_14
+    PS140 = -PS127*P_13_14 - PS129*P_13_13 + PS131*P_13_15 + PS88*P_0_13 + PS92*P_3_13 - PS93*P_1_13 + PS94*P_2_13 + P_5_13
+    PS141 = PS88*P_0_1
+    PS142 = PS117 - PS127*P_1_14 - PS129*P_1_13 + PS131*P_1_15 + PS141 + PS92*P_1_3 - PS93*P_1_1 + P_1_5
+    PS143 = -PS127*P_14_15 - PS129*P_13_15 + PS131*P_15_15 + PS88*P_0_15 + PS92*P_3_15 - PS93*P_1_15 + PS94*P_2_15 + P_5_15
+    PS144 = PS94*P_2_3
+    PS145 = PS115 - PS127*P_3_14 - PS129*P_3_13 + PS131*P_3_15 + PS144 + PS92*P_3_3 - PS93*P_1_3 + P_3_5
+    PS146 = PS93*P_0_1
+    PS147 = PS111 - PS127*P_0_14 - PS129*P_0_13 + PS131*P_0_15 - PS146 + PS88*P_0_0 + PS94*P_0_2 + P_0_5
+    PS148 = PS92*P_2_3
+    PS149 = -PS120 - PS127*P_2_14 - PS129*P_2_13 + PS131*P_2_15 + PS148 + PS88*P_0_2 + PS94*P_2_2 + P_2_5
+    PS150 = 4*dvxVar
+    PS151 = -PS127*P_5_14 - PS129*P_5_13 + PS131*P_5_15 + PS88*P_0_5 + PS92*P_3_5 - PS93*P_1_5 + PS94*P_2_5 + P_5_5
+    PS152 = PS126 + PS37 + PS4 + PS78
+    PS153 = PS35 + PS36
+    PS154 = 2*PS153
+    PS155 = -PS55 + PS56
+    PS156 = 2*PS155
+    PS157 = -PS11*P_1_6 - PS12*P_2_6 - PS13*P_3_6 + PS6*P_6_10 + PS7*P_6_11 + PS9*P_6_12 + P_0_6
+    PS158 = PS11*P_0_6 - PS12*P_3_6 + PS13*P_2_6 - PS34*P_6_10 - PS7*P_6_12 + PS9*P_6_11 + P_1_6
+    PS159 = PS11*P_3_6 + PS12*P_0_6 - PS13*P_1_6 - PS34*P_6_11 + PS6*P_6_12 - PS9*P_6_10 + P_2_6
+    PS160 = -PS11*P_2_6 + PS12*P_1_6 + PS13*P_0_6 - PS34*P_6_12 - PS6*P_6_11 + PS7*P_6_10 + P_3_6
+    PS161 = PS152*dvzVar
+    PS162 = -PS80*P_6_13 - PS84*P_6_15 - PS88*P_3_6 + PS91*P_6_14 + PS92*P_0_6 + PS93*P_2_6 + PS94*P_1_6 + P_4_6
+    PS163 = -PS127*P_6_14 - PS129*P_6_13 + PS131*P_6_15 + PS88*P_0_6 + PS92*P_3_6 - PS93*P_1_6 + PS94*P_2_6 + P_5_6
+    PS164 = -PS152*P_15_15 - PS154*P_14_15 + PS156*P_13_15 + PS88*P_1_15 - PS92*P_2_15 + PS93*P_0_15 + PS94*P_3_15 + P_6_15
+    PS165 = -PS152*P_14_15 - PS154*P_14_14 + PS156*P_13_14 + PS88*P_1_14 - PS92*P_2_14 + PS93*P_0_14 + PS94*P_3_14 + P_6_14
+    PS166 = -PS152*P_13_15 - PS154*P_13_14 + PS156*P_13_13 + PS88*P_1_13 - PS92*P_2_13 + PS93*P_0_13 + PS94*P_3_13 + P_6_13
+    PS167 = -PS152*P_6_15 - PS154*P_6_14 + PS156*P_6_13 + PS88*P_1_6 - PS92*P_2_6 + PS93*P_0_6 + PS94*P_3_6 + P_6_6
+    nextP = numpy.zeros(numpy.shape(P)[:-2] + (24, 24))
+    nextP[..., 0, 0] = PS0*PS1 - PS11*PS23 - PS12*PS26 - PS13*PS29 + PS14*PS6 + PS17*PS7 + PS2*PS3 + PS20*PS9 + PS33 + PS4*PS5
+    nextP[..., 0, 1] = -PS1*PS36 + PS11*PS33 - PS12*PS29 + PS13*PS26 - PS14*PS34 + PS17*PS9 - PS20*PS7 + PS23 + PS3*PS35 - PS35*PS5
+    nextP[..., 1, 0] = nextP[..., 0, 1]
+    nextP[..., 1, 1] = PS1*PS37 + PS11*PS42 - PS12*PS51 + PS13*PS44 + PS2*PS5 + PS3*PS4 - PS34*PS47 + PS39*PS9 - PS49*PS7 + PS54
+    nextP[..., 0, 2] = -PS1*PS55 + PS11*PS29 + PS12*PS33 - PS13*PS23 - PS14*PS9 - PS17*PS34 + PS20*PS6 + PS26 - PS3*PS56 + PS5*PS55
+    nextP[..., 2, 0] = nextP[..., 0, 2]
+    nextP[..., 1, 2] = PS1*PS57 + PS11*PS51 + PS12*PS42 - PS13*PS54 - PS3*PS57 - PS34*PS39 + PS44 - PS47*PS9 + PS49*PS6 - PS5*PS58
+    nextP[..., 2, 1] = nextP[..., 1, 2]
+    nextP[..., 2, 2] = PS0*PS5 + PS1*PS4 + PS11*PS61 + PS12*PS63 - PS13*PS68 + PS3*PS37 - PS34*PS65 + PS6*PS60 - PS66*PS9 + PS70
+    nextP[..., 0, 3] = PS1*PS58 - PS11*PS26 + PS12*PS23 + PS13*PS33 + PS14*PS7 - PS17*PS6 - PS20*PS34 + PS29 - PS3*PS58 - PS5*PS57
+    nextP[..., 3, 0] = nextP[..., 0, 3]
+    nextP[..., 1, 3] = -PS1*PS56 - PS11*PS44 + PS12*PS54 + PS13*PS42 - PS3*PS55 - PS34*PS49 - PS39*PS6 + PS47*PS7 + PS5*PS56 + PS51
+    nextP[..., 3, 1] = nextP[..., 1, 3]
+    nextP[..., 2, 3] = -PS1*PS35 - PS11*PS70 + PS12*PS68 + PS13*PS63 + PS3*PS36 - PS34*PS60 - PS36*PS5 - PS6*PS65 + PS61 + PS66*PS7
+    nextP[..., 3, 2] = nextP[..., 2, 3]
+    nextP[..., 3, 3] = PS0*PS3 + PS1*PS2 - PS11*PS76 + PS12*PS72 + PS13*PS73 - PS34*PS74 + PS37*PS5 - PS6*PS75 + PS7*PS71 + PS77
+    nextP[..., 0, 4] = PS23*PS94 + PS26*PS93 - PS29*PS88 + PS33*PS92 - PS80*PS81 - PS82*PS84 + PS89*PS91 + PS95
+    nextP[..., 4, 0] = nextP[..., 0, 4]
+    nextP[..., 1, 4] = PS42*PS92 + PS44*PS93 - PS51*PS88 + PS54*PS94 - PS80*PS96 - PS84*PS97 + PS91*PS98 + PS99
+    nextP[..., 4, 1] = nextP[..., 1, 4]
+    nextP[..., 2, 4] = -PS100*PS80 - PS101*PS84 + PS102*PS91 + PS103 - PS61*PS88 + PS63*PS92 + PS68*PS94 + PS70*PS93
+    nextP[..., 4, 2] = nextP[..., 2, 4]
+    nextP[..., 3, 4] = -PS104*PS80 - PS105*PS84 + PS106*PS91 + PS107 + PS72*PS94 + PS73*PS92 + PS76*PS93 - PS77*PS88
+    nextP[..., 4, 3] = nextP[..., 3, 4]
+    nextP[..., 4, 4] = -PS108*PS80 - PS109*PS84 - PS112*PS88 + PS113*PS91 + PS116*PS92 + PS119*PS93 + PS122*PS94 + PS123*PS90**2 + PS124*PS83**2 + PS125 + PS80**2*dvxVar
+    nextP[..., 0, 5] = -PS127*PS89 - PS129*PS81 + PS131*PS82 + PS132 - PS23*PS93 + PS26*PS94 + PS29*PS92 + PS33*PS88
+    nextP[..., 5, 0] = nextP[..., 0, 5]
+    nextP[..., 1, 5] = -PS127*PS98 - PS129*PS96 + PS131*PS97 + PS133 + PS42*PS88 + PS44*PS94 + PS51*PS92 - PS54*PS93
+    nextP[..., 5, 1] = nextP[..., 1, 5]
+    nextP[..., 2, 5] = -PS100*PS129 + PS101*PS131 - PS102*PS127 + PS134 + PS61*PS92 + PS63*PS88 - PS68*PS93 + PS70*PS94
+    nextP[..., 5, 2] = nextP[..., 2, 5]
+    nextP[..., 3, 5] = -PS104*PS129 + PS105*PS131 - PS106*PS127 + PS135 - PS72*PS93 + PS73*PS88 + PS76*PS94 + PS77*PS92
+    nextP[..., 5, 3] = nextP[..., 3, 5]
+    nextP[..., 4, 5] = -PS108*PS129 + PS109*PS131 + PS112*PS92 - PS113*PS127 + PS116*PS88 + PS119*PS94 - PS122*PS93 - PS124*PS130*PS83 + PS129*PS137 - PS136*PS91 + PS138
+    nextP[..., 5, 4] = nextP[..., 4, 5]
+    nextP[..., 5, 5] = PS124*PS130**2 + PS127**2*dvyVar - PS127*PS139 + PS128**2*PS150 - PS129*PS140 + PS131*PS143 - PS142*PS93 + PS145*PS92 + PS147*PS88 + PS149*PS94 + PS151
+    nextP[..., 0, 6] = -PS152*PS82 - PS154*PS89 + PS156*PS81 + PS157 + PS23*PS88 - PS26*PS92 + PS29*PS94 + PS33*PS93
+    nextP[..., 6, 0] = nextP[..., 0, 6]
+    nextP[..., 1, 6] = -PS152*PS97 - PS154*PS98 + PS156*PS96 + PS158 + PS42*PS93 - PS44*PS92 + PS51*PS94 + PS54*PS88
+    nextP[..., 6, 1] = nextP[..., 1, 6]
+    nextP[..., 2, 6] = PS100*PS156 - PS101*PS152 - PS102*PS154 + PS159 + PS61*PS94 + PS63*PS93 + PS68*PS88 - PS70*PS92
+    nextP[..., 6, 2] = nextP[..., 2, 6]
+    nextP[..., 3, 6] = PS104*PS156 - PS105*PS152 - PS106*PS154 + PS160 + PS72*PS88 + PS73*PS93 - PS76*PS92 + PS77*PS94
+    nextP[..., 6, 3] = nextP[..., 3, 6]
+    nextP[..., 4, 6] = PS108*PS156 - PS109*PS152 + PS112*PS94 - PS113*PS154 + PS116*PS93 - PS119*PS92 + PS122*PS88 - PS123*PS153*PS90 - PS137*PS156 + PS161*PS84 + PS162
+    nextP[..., 6, 4] = nextP[..., 4, 6]
+    nextP[..., 5, 6] = -PS128*PS150*PS155 - PS131*PS161 + PS136*PS154 - PS139*PS154 + PS140*PS156 + PS142*PS88 - PS143*PS152 + PS145*PS94 + PS147*PS93 - PS149*PS92 + PS163
+    nextP[..., 6, 5] = nextP[..., 5, 6]
+    nextP[..., 6, 6] = PS123*PS153**2 + PS150*PS155**2 + PS152**2*dvzVar - PS152*PS164 - PS154*PS165 + PS156*PS166 + PS167 + PS88*(PS110 + PS146 - PS152*P_1_15 - PS154*P_1_14 + PS156*P_1_13 + PS88*P_1_1 - PS92*P_1_2 + P_1_6) - PS92*(PS114 + PS144 - PS152*P_2_15 - PS154*P_2_14 + PS156*P_2_13 + PS88*P_1_2 - PS92*P_2_2 + P_2_6) + PS93*(-PS118 + PS141 - PS152*P_0_15 - PS154*P_0_14 + PS156*P_0_13 + PS93*P_0_0 + PS94*P_0_3 + P_0_6) + PS94*(PS121 - PS148 - PS152*P_3_15 - PS154*P_3_14 + PS156*P_3_13 + PS93*P_0_3 + PS94*P_3_3 + P_3_6)
+    nextP[..., 0, 7] = -PS11*P_1_7 - PS12*P_2_7 - PS13*P_3_7 + PS6*P_7_10 + PS7*P_7_11 + PS9*P_7_12 + PS95*dt + P_0_7
+    nextP[..., 7, 0] = nextP[..., 0, 7]
+    nextP[..., 1, 7] = PS11*P_0_7 - PS12*P_3_7 + PS13*P_2_7 - PS34*P_7_10 - PS7*P_7_12 + PS9*P_7_11 + PS99*dt + P_1_7
+    nextP[..., 7, 1] = nextP[..., 1, 7]
+    nextP[..., 2, 7] = PS103*dt + PS11*P_3_7 + PS12*P_0_7 - PS13*P_1_7 - PS34*P_7_11 + PS6*P_7_12 - PS9*P_7_10 + P_2_7
+    nextP[..., 7, 2] = nextP[..., 2, 7]
+    nextP[..., 3, 7] = PS107*dt - PS11*P_2_7 + PS12*P_1_7 + PS13*P_0_7 - PS34*P_7_12 - PS6*P_7_11 + PS7*P_7_10 + P_3_7
+    nextP[..., 7, 3] = nextP[..., 3, 7]
+    nextP[..., 4, 7] = PS125*dt - PS80*P_7_13 - PS84*P_7_15 - PS88*P_3_7 + PS91*P_7_14 + PS92*P_0_7 + PS93*P_2_7 + PS94*P_1_7 + P_4_7
+    nextP[..., 7, 4] = nextP[..., 4, 7]
+    nextP[..., 5, 7] = -PS127*P_7_14 - PS129*P_7_13 + PS131*P_7_15 + PS88*P_0_7 + PS92*P_3_7 - PS93*P_1_7 + PS94*P_2_7 + P_5_7 + dt*(-PS127*P_4_14 - PS129*P_4_13 + PS131*P_4_15 + PS88*P_0_4 + PS92*P_3_4 - PS93*P_1_4 + PS94*P_2_4 + P_4_5)
+    nextP[..., 7, 5] = nextP[..., 5, 7]
+    nextP[..., 6, 7] = -PS152*P_7_15 - PS154*P_7_14 + PS156*P_7_13 + PS88*P_1_7 - PS92*P_2_7 + PS93*P_0_7 + PS94*P_3_7 + P_6_7 + dt*(-PS152*P_4_15 - PS154*P_4_14 + PS156*P_4_13 + PS88*P_1_4 - PS92*P_2_4 + PS93*P_0_4 + PS94*P_3_4 + P_4_6)
+    nextP[..., 7, 6] = nextP[..., 6, 7]
+    nextP[..., 7, 7] = P_4_7*dt + P_7_7 + dt*(P_4_4*dt + P_4_7)
+    nextP[..., 0, 8] = -PS11*P_1_8 - PS12*P_2_8 - PS13*P_3_8 + PS132*dt + PS6*P_8_10 + PS7*P_8_11 + PS9*P_8_12 + P_0_8
+    nextP[..., 8, 0] = nextP[..., 0, 8]
+    nextP[..., 1, 8] = PS11*P_0_8 - PS12*P_3_8 + PS13*P_2_8 + PS133*dt - PS34*P_8_10 - PS7*P_8_12 + PS9*P_8_11 + P_1_8
+    nextP[..., 8, 1] = nextP[..., 1, 8]
+    nextP[..., 2, 8] = PS11*P_3_8 + PS12*P_0_8 - PS13*P_1_8 + PS134*dt - PS34*P_8_11 + PS6*P_8_12 - PS9*P_8_10 + P_2_8
+    nextP[..., 8, 2] = nextP[..., 2, 8]
+    nextP[..., 3, 8] = -PS11*P_2_8 + PS12*P_1_8 + PS13*P_0_8 + PS135*dt - PS34*P_8_12 - PS6*P_8_11 + PS7*P_8_10 + P_3_8
+    nextP[..., 8, 3] = nextP[..., 3, 8]
+    nextP[..., 4, 8] = PS138*dt - PS80*P_8_13 - PS84*P_8_15 - PS88*P_3_8 + PS91*P_8_14 + PS92*P_0_8 + PS93*P_2_8 + PS94*P_1_8 + P_4_8
+    nextP[..., 8, 4] = nextP[..., 4, 8]
+    nextP[..., 5, 8] = -PS127*P_8_14 - PS129*P_8_13 + PS131*P_8_15 + PS151*dt + PS88*P_0_8 + PS92*P_3_8 - PS93*P_1_8 + PS94*P_2_8 + P_5_8
+    nextP[..., 8, 5] = nextP[..., 5, 8]
+    nextP[..., 6, 8] = -PS152*P_8_15 - PS154*P_8_14 + PS156*P_8_13 + PS88*P_1_8 - PS92*P_2_8 + PS93*P_0_8 + PS94*P_3_8 + P_6_8 + dt*(-PS152*P_5_15 - PS154*P_5_14 + PS156*P_5_13 + PS88*P_1_5 - PS92*P_2_5 + PS93*P_0_5 + PS94*P_3_5 + P_5_6)
+    nextP[..., 8, 6] = nextP[..., 6, 8]
+    nextP[..., 7, 8] = P_4_8*dt + P_7_8 + dt*(P_4_5*dt + P_5_7)
+    nextP[..., 8, 7] = nextP[..., 7, 8]
+    nextP[..., 8, 8] = P_5_8*dt + P_8_8 + dt*(P_5_5*dt + P_5_8)
+    nextP[..., 0, 9] = -PS11*P_1_9 - PS12*P_2_9 - PS13*P_3_9 + PS157*dt + PS6*P_9_10 + PS7*P_9_11 + PS9*P_9_12 + P_0_9
+    nextP[..., 9, 0] = nextP[..., 0, 9]
+    nextP[..., 1, 9] = PS11*P_0_9 - PS12*P_3_9 + PS13*P_2_9 + PS158*dt - PS34*P_9_10 - PS7*P_9_12 + PS9*P_9_11 + P_1_9
+    nextP[..., 9, 1] = nextP[..., 1, 9]
+    nextP[..., 2, 9] = PS11*P_3_9 + PS12*P_0_9 - PS13*P_1_9 + PS159*dt - PS34*P_9_11 + PS6*P_9_12 - PS9*P_9_10 + P_2_9
+    nextP[..., 9, 2] = nextP[..., 2, 9]
+    nextP[..., 3, 9] = -PS11*P_2_9 + PS12*P_1_9 + PS13*P_0_9 + PS160*dt - PS34*P_9_12 - PS6*P_9_11 + PS7*P_9_10 + P_3_9
+    nextP[..., 9, 3] = nextP[..., 3, 9]
+    nextP[..., 4, 9] = PS162*dt - PS80*P_9_13 - PS84*P_9_15 - PS88*P_3_9 + PS91*P_9_14 + PS92*P_0_9 + PS93*P_2_9 + PS94*P_1_9 + P_4_9
+    nextP[..., 9, 4] = nextP[..., 4, 9]
+    nextP[..., 5, 9] = -PS127*P_9_14 - PS129*P_9_13 + PS131*P_9_15 + PS163*dt + PS88*P_0_9 + PS92*P_3_9 - PS93*P_1_9 + PS94*P_2_9 + P_5_9
+    nextP[..., 9, 5] = nextP[..., 5, 9]
+    nextP[..., 6, 9] = -PS152*P_9_15 - PS154*P_9_14 + PS156*P_9_13 + PS167*dt + PS88*P_1_9 - PS92*P_2_9 + PS93*P_0_9 + PS94*P_3_9 + P_6_9
+    nextP[..., 9, 6] = nextP[..., 6, 9]
+    nextP[..., 7, 9] = P_4_9*dt + P_7_9 + dt*(P_4_6*dt + P_6_7)
+    nextP[..., 9, 7] = nextP[..., 7, 9]
+    nextP[..., 8, 9] = P_5_9*dt + P_8_9 + dt*(P_5_6*dt + P_6_8)
+    nextP[..., 9, 8] = nextP[..., 8, 9]
+    nextP[..., 9, 9] = P_6_9*dt + P_9_9 + dt*(P_6_6*dt + P_6_9)
+    nextP[..., 0, 10] = PS14
+    nextP[..., 10, 0] = nextP[..., 0, 10]
+    nextP[..., 1, 10] = PS47
+    nextP[..., 10, 1] = nextP[..., 1, 10]
+    nextP[..., 2, 10] = PS66
+    nextP[..., 10, 2] = nextP[..., 2, 10]
+    nextP[..., 3, 10] = PS71
+    nextP[..., 10, 3] = nextP[..., 3, 10]
+    nextP[..., 4, 10] = -PS80*P_10_13 - PS84*P_10_15 - PS88*P_3_10 + PS91*P_10_14 + PS92*P_0_10 + PS93*P_2_10 + PS94*P_1_10 + P_4_10
+    nextP[..., 10, 4] = nextP[..., 4, 10]
+    nextP[..., 5, 10] = -PS127*P_10_14 - PS129*P_10_13 + PS131*P_10_15 + PS88*P_0_10 + PS92*P_3_10 - PS93*P_1_10 + PS94*P_2_10 + P_5_10
+    nextP[..., 10, 5] = nextP[..., 5, 10]
+    nextP[..., 6, 10] = -PS152*P_10_15 - PS154*P_10_14 + PS156*P_10_13 + PS88*P_1_10 - PS92*P_2_10 + PS93*P_0_10 + PS94*P_3_10 + P_6_10
+    nextP[..., 10, 6] = nextP[..., 6, 10]
+    nextP[..., 7, 10] = P_4_10*dt + P_7_10
+    nextP[..., 10, 7] = nextP[..., 7, 10]
+    nextP[..., 8, 10] = P_5_10*dt + P_8_10
+    nextP[..., 10, 8] = nextP[..., 8, 10]
+    nextP[..., 9, 10] = P_6_10*dt + P_9_10
+    nextP[..., 10, 9] = nextP[..., 9, 10]
+    nextP[..., 10, 10] = P_10_10
+    nextP[..., 0, 11] = PS17
+    nextP[..., 11, 0] = nextP[..., 0, 11]
+    nextP[..., 1, 11] = PS39
+    nextP[..., 11, 1] = nextP[..., 1, 11]
+    nextP[..., 2, 11] = PS65
+    nextP[..., 11, 2] = nextP[..., 2, 11]
+    nextP[..., 3, 11] = PS75
+    nextP[..., 11, 3] = nextP[..., 3, 11]
+    nextP[..., 4, 11] = -PS80*P_11_13 - PS84*P_11_15 - PS88*P_3_11 + PS91*P_11_14 + PS92*P_0_11 + PS93*P_2_11 + PS94*P_1_11 + P_4_11
+    nextP[..., 11, 4] = nextP[..., 4, 11]
+    nextP[..., 5, 11] = -PS127*P_11_14 - PS129*P_11_13 + PS131*P_11_15 + PS88*P_0_11 + PS92*P_3_11 - PS93*P_1_11 + PS94*P_2_11 + P_5_11
+    nextP[..., 11, 5] = nextP[..., 5, 11]
+    nextP[..., 6, 11] = -PS152*P_11_15 - PS154*P_11_14 + PS156*P_11_13 + PS88*P_1_11 - PS92*P_2_11 + PS93*P_0_11 + PS94*P_3_11 + P_6_11
+    nextP[..., 11, 6] = nextP[..., 6, 11]
+    nextP[..., 7, 11] = P_4_11*dt + P_7_11
+    nextP[..., 11, 7] = nextP[..., 7, 11]
+    nextP[..., 8, 11] = P_5_11*dt + P_8_11
+    nextP[..., 11, 8] = nextP[..., 8, 11]
+    nextP[..., 9, 11] = P_6_11*dt + P_9_11
+    nextP[..., 11, 9] = nextP[..., 9, 11]
+    nextP[..., 10, 11] = P_10_11
+    nextP[..., 11, 10] = nextP[..., 10, 11]
+    nextP[..., 11, 11] = P_11_11
+    nextP[..., 0, 12] = PS20
+    nextP[..., 12, 0] = nextP[..., 0, 12]
+    nextP[..., 1, 12] = PS49
+    nextP[..., 12, 1] = nextP[..., 1, 12]
+    nextP[..., 2, 12] = PS60
+    nextP[..., 12, 2] = nextP[..., 2, 12]
+    nextP[..., 3, 12] = PS74
+    nextP[..., 12, 3] = nextP[..., 3, 12]
+    nextP[..., 4, 12] = -PS80*P_12_13 - PS84*P_12_15 - PS88*P_3_12 + PS91*P_12_14 + PS92*P_0_12 + PS93*P_2_12 + PS94*P_1_12 + P_4_12
+    nextP[..., 12, 4] = nextP[..., 4, 12]
+    nextP[..., 5, 12] = -PS127*P_12_14 - PS129*P_12_13 + PS131*P_12_15 + PS88*P_0_12 + PS92*P_3_12 - PS93*P_1_12 + PS94*P_2_12 + P_5_12
+    nextP[..., 12, 5] = nextP[..., 5, 12]
+    nextP[..., 6, 12] = -PS152*P_12_15 - PS154*P_12_14 + PS156*P_12_13 + PS88*P_1_12 - PS92*P_2_12 + PS93*P_0_12 + PS94*P_3_12 + P_6_12
+    nextP[..., 12, 6] = nextP[..., 6, 12]
+    nextP[..., 7, 12] = P_4_12*dt + P_7_12
+    nextP[..., 12, 7] = nextP[..., 7, 12]
+    nextP[..., 8, 12] = P_5_12*dt + P_8_12
+    nextP[..., 12, 8] = nextP[..., 8, 12]
+    nextP[..., 9, 12] = P_6_12*dt + P_9_12
+    nextP[..., 12, 9] = nextP[..., 9, 12]
+    nextP[..., 10, 12] = P_10_12
+    nextP[..., 12, 10] = nextP[..., 10, 12]
+    nextP[..., 11, 12] = P_11_12
+    nextP[..., 12, 11] = nextP[..., 11, 12]
+    nextP[..., 12, 12] = P_12_12
+    nextP[..., 0, 13] = PS81
+    nextP[..., 13, 0] = nextP[..., 0, 13]
+    nextP[..., 1, 13] = PS96
+    nextP[..., 13, 1] = nextP[..., 1, 13]
+    nextP[..., 2, 13] = PS100
+    nextP[..., 13, 2] = nextP[..., 2, 13]
+    nextP[..., 3, 13] = PS104
+    nextP[..., 13, 3] = nextP[..., 3, 13]
+    nextP[..., 4, 13] = PS108
+    nextP[..., 13, 4] = nextP[..., 4, 13]
+    nextP[..., 5, 13] = PS140
+    nextP[..., 13, 5] = nextP[..., 5, 13]
+    nextP[..., 6, 13] = PS166
+    nextP[..., 13, 6] = nextP[..., 6, 13]
+    nextP[..., 7, 13] = P_4_13*dt + P_7_13
+    nextP[..., 13, 7] = nextP[..., 7, 13]
+    nextP[..., 8, 13] = P_5_13*dt + P_8_13
+    nextP[..., 13, 8] = nextP[..., 8, 13]
+    nextP[..., 9, 13] = P_6_13*dt + P_9_13
+    nextP[..., 13, 9] = nextP[..., 9, 13]
+    nextP[..., 10, 13] = P_10_13
+    nextP[..., 13, 10] = nextP[..., 10, 13]
+    nextP[..., 11, 13] = P_11_13
+    nextP[..., 13, 11] = nextP[..., 11, 13]
+    nextP[..., 12, 13] = P_12_13
+    nextP[..., 13, 12] = nextP[..., 12, 13]
+    nextP[..., 13, 13] = P_13_13
+    nextP[..., 0, 14] = PS89
+    nextP[..., 14, 0] = nextP[..., 0, 14]
+    nextP[..., 1, 14] = PS98
+    nextP[..., 14, 1] = nextP[..., 1, 14]
+    nextP[..., 2, 14] = PS102
+    nextP[..., 14, 2] = nextP[..., 2, 14]
+    nextP[..., 3, 14] = PS106
+    nextP[..., 14, 3] = nextP[..., 3, 14]
+    nextP[..., 4, 14] = PS113
+    nextP[..., 14, 4] = nextP[..., 4, 14]
+    nextP[..., 5, 14] = PS139
+    nextP[..., 14, 5] = nextP[..., 5, 14]
+    nextP[..., 6, 14] = PS165
+    nextP[..., 14, 6] = nextP[..., 6, 14]
+    nextP[..., 7, 14] = P_4_14*dt + P_7_14
+    nextP[..., 14, 7] = nextP[..., 7, 14]
+    nextP[..., 8, 14] = P_5_14*dt + P_8_14
+    nextP[..., 14, 8] = nextP[..., 8, 14]
+    nextP[..., 9, 14] = P_6_14*dt + P_9_14
+    nextP[..., 14, 9] = nextP[..., 9, 14]
+    nextP[..., 10, 14] = P_10_14
+    nextP[..., 14, 10] = nextP[..., 10, 14]
+    nextP[..., 11, 14] = P_11_14
+    nextP[..., 14, 11] = nextP[..., 11, 14]
+    nextP[..., 12, 14] = P_12_14
+    nextP[..., 14, 12] = nextP[..., 12, 14]
+    nextP[..., 13, 14] = P_13_14
+    nextP[..., 14, 13] = nextP[..., 13, 14]
+    nextP[..., 14, 14] = P_14_14
+    nextP[..., 0, 15] = PS82
+    nextP[..., 15, 0] = nextP[..., 0, 15]
+    nextP[..., 1, 15] = PS97
+    nextP[..., 15, 1] = nextP[..., 1, 15]
+    nextP[..., 2, 15] = PS101
+    nextP[..., 15, 2] = nextP[..., 2, 15]
+    nextP[..., 3, 15] = PS105
+    nextP[..., 15, 3] = nextP[..., 3, 15]
+    nextP[..., 4, 15] = PS109
+    nextP[..., 15, 4] = nextP[..., 4, 15]
+    nextP[..., 5, 15] = PS143
+    nextP[..., 15, 5] = nextP[..., 5, 15]
+    nextP[..., 6, 15] = PS164
+    nextP[..., 15, 6] = nextP[..., 6, 15]
+    nextP[..., 7, 15] = P_4_15*dt + P_7_15
+    nextP[..., 15, 7] = nextP[..., 7, 15]
+    nextP[..., 8, 15] = P_5_15*dt + P_8_15
+    nextP[..., 15, 8] = nextP[..., 8, 15]
+    nextP[..., 9, 15] = P_6_15*dt + P_9_15
+    nextP[..., 15, 9] = nextP[..., 9, 15]
+    nextP[..., 10, 15] = P_10_15
+    nextP[..., 15, 10] = nextP[..., 10, 15]
+    nextP[..., 11, 15] = P_11_15
+    nextP[..., 15, 11] = nextP[..., 11, 15]
+    nextP[..., 12, 15] = P_12_15
+    nextP[..., 15, 12] = nextP[..., 12, 15]
+    nextP[..., 13, 15] = P_13_15
+    nextP[..., 15, 13] = nextP[..., 13, 15]
+    nextP[..., 14, 15] = P_14_15
+    nextP[..., 15, 14] = nextP[..., 14, 15]
+    nextP[..., 15, 15] = P_15_15
+    nextP[..., 0, 16] = -PS11*P_1_16 - PS12*P_2_16 - PS13*P_3_16 + PS6*P_10_16 + PS7*P_11_16 + PS9*P_12_16 + P_0_16
+    nextP[..., 16, 0] = nextP[..., 0, 16]
+    nextP[..., 1, 16] = PS11*P_0_16 - PS12*P_3_16 + PS13*P_2_16 - PS34*P_10_16 - PS7*P_12_16 + PS9*P_11_16 + P_1_16
+    nextP[..., 16, 1] = nextP[..., 1, 16]
+    nextP[..., 2, 16] = PS11*P_3_16 + PS12*P_0_16 - PS13*P_1_16 - PS34*P_11_16 + PS6*P_12_16 - PS9*P_10_16 + P_2_16
+    nextP[..., 16, 2] = nextP[..., 2, 16]
+    nextP[..., 3, 16] = -PS11*P_2_16 + PS12*P_1_16 + PS13*P_0_16 - PS34*P_12_16 - PS6*P_11_16 + PS7*P_10_16 + P_3_16
+    nextP[..., 16, 3] = nextP[..., 3, 16]
+    nextP[..., 4, 16] = -PS80*P_13_16 - PS84*P_15_16 - PS88*P_3_16 + PS91*P_14_16 + PS92*P_0_16 + PS93*P_2_16 + PS94*P_1_16 + P_4_16
+    nextP[..., 16, 4] = nextP[..., 4, 16]
+    nextP[..., 5, 16] = -PS127*P_14_16 - PS129*P_13_16 + PS131*P_15_16 + PS88*P_0_16 + PS92*P_3_16 - PS93*P_1_16 + PS94*P_2_16 + P_5_16
+    nextP[..., 16, 5] = nextP[..., 5, 16]
+    nextP[..., 6, 16] = -PS152*P_15_16 - PS154*P_14_16 + PS156*P_13_16 + PS88*P_1_16 - PS92*P_2_16 + PS93*P_0_16 + PS94*P_3_16 + P_6_16
+    nextP[..., 16, 6] = nextP[..., 6, 16]
+    nextP[..., 7, 16] = P_4_16*dt + P_7_16
+    nextP[..., 16, 7] = nextP[..., 7, 16]
+    nextP[..., 8, 16] = P_5_16*dt + P_8_16
+    nextP[..., 16, 8] = nextP[..., 8, 16]
+    nextP[..., 9, 16] = P_6_16*dt + P_9_16
+    nextP[..., 16, 9] = nextP[..., 9, 16]
+    nextP[..., 10, 16] = P_10_16
+    nextP[..., 16, 10] = nextP[..., 10, 16]
+    nextP[..., 11, 16] = P_11_16
+    nextP[..., 16, 11] = nextP[..., 11, 16]
+    nextP[..., 12, 16] = P_12_16
+    nextP[..., 16, 12] = nextP[..., 12, 16]
+    nextP[..., 13, 16] = P_13_16
+    nextP[..., 16, 13] = nextP[..., 13, 16]
+    nextP[..., 14, 16] = P_14_16
+    nextP[..., 16, 14] = nextP[..., 14, 16]
+    nextP[..., 15, 16] = P_15_16
+    nextP[..., 16, 15] = nextP[..., 15, 16]
+    nextP[..., 16, 16] = P_16_16
+    nextP[..., 0, 17] = -PS11*P_1_17 - PS12*P_2_17 - PS13*P_3_17 + PS6*P_10_17 + PS7*P_11_17 + PS9*P_12_17 + P_0_17
+    nextP[..., 17, 0] = nextP[..., 0, 17]
+    nextP[..., 1, 17] = PS11*P_0_17 - PS12*P_3_17 + PS13*P_2_17 - PS34*P_10_17 - PS7*P_12_17 + PS9*P_11_17 + P_1_17
+    nextP[..., 17, 1] = nextP[..., 1, 17]
+    nextP[..., 2, 17] = PS11*P_3_17 + PS12*P_0_17 - PS13*P_1_17 - PS34*P_11_17 + PS6*P_12_17 - PS9*P_10_17 + P_2_17
+    nextP[..., 17, 2] = nextP[..., 2, 17]
+    nextP[..., 3, 17] = -PS11*P_2_17 + PS12*P_1_17 + PS13*P_0_17 - PS34*P_12_17 - PS6*P_11_17 + PS7*P_10_17 + P_3_17
+    nextP[..., 17, 3] = nextP[..., 3, 17]
+    nextP[..., 4, 17] = -PS80*P_13_17 - PS84*P_15_17 - PS88*P_3_17 + PS91*P_14_17 + PS92*P_0_17 + PS93*P_2_17 + PS94*P_1_17 + P_4_17
+    nextP[..., 17, 4] = nextP[..., 4, 17]
+    nextP[..., 5, 17] = -PS127*P_14_17 - PS129*P_13_17 + PS131*P_15_17 + PS88*P_0_17 + PS92*P_3_17 - PS93*P_1_17 + PS94*P_2_17 + P_5_17
+    nextP[..., 17, 5] = nextP[..., 5, 17]
+    nextP[..., 6, 17] = -PS152*P_15_17 - PS154*P_14_17 + PS156*P_13_17 + PS88*P_1_17 - PS92*P_2_17 + PS93*P_0_17 + PS94*P_3_17 + P_6_17
+    nextP[..., 17, 6] = nextP[..., 6, 17]
+    nextP[..., 7, 17] = P_4_17*dt + P_7_17
+    nextP[..., 17, 7] = nextP[..., 7, 17]
+    nextP[..., 8, 17] = P_5_17*dt + P_8_17
+    nextP[..., 17, 8] = nextP[..., 8, 17]
+    nextP[..., 9, 17] = P_6_17*dt + P_9_17
+    nextP[..., 17, 9] = nextP[..., 9, 17]
+    nextP[..., 10, 17] = P_10_17
+    nextP[..., 17, 10] = nextP[..., 10, 17]
+    nextP[..., 11, 17] = P_11_17
+    nextP[..., 17, 11] = nextP[..., 11, 17]
+    nextP[..., 12, 17] = P_12_17
+    nextP[..., 17, 12] = nextP[..., 12, 17]
+    nextP[..., 13, 17] = P_13_17
+    nextP[..., 17, 13] = nextP[..., 13, 17]
+    nextP[..., 14, 17] = P_14_17
+    nextP[..., 17, 14] = nextP[..., 14, 17]
+    nextP[..., 15, 17] = P_15_17
+    nextP[..., 17, 15] = nextP[..., 15, 17]
+    nextP[..., 16, 17] = P_16_17
+    nextP[..., 17, 16] = nextP[..., 16, 17]
+    nextP[..., 17, 17] = P_17_17
+    nextP[..., 0, 18] = -PS11*P_1_18 - PS12*P_2_18 - PS13*P_3_18 + PS6*P_10_18 + PS7*P_11_18 + PS9*P_12_18 + P_0_18
+    nextP[..., 18, 0] = nextP[..., 0, 18]
+    nextP[..., 1, 18] = PS11*P_0_18 - PS12*P_3_18 + PS13*P_2_18 - PS34*P_10_18 - PS7*P_12_18 + PS9*P_11_18 + P_1_18
+    nextP[..., 18, 1] = nextP[..., 1, 18]
+    nextP[..., 2, 18] = PS11*P_3_18 + PS12*P_0_18 - PS13*P_1_18 - PS34*P_11_18 + PS6*P_12_18 - PS9*P_10_18 + P_2_18
+    nextP[..., 18, 2] = nextP[..., 2, 18]
+    nextP[..., 3, 18] = -PS11*P_2_18 + PS12*P_1_18 + PS13*P_0_18 - PS34*P_12_18 - PS6*P_11_18 + PS7*P_10_18 + P_3_18
+    nextP[..., 18, 3] = nextP[..., 3, 18]
+    nextP[..., 4, 18] = -PS80*P_13_18 - PS84*P_15_18 - PS88*P_3_18 + PS91*P_14_18 + PS92*P_0_18 + PS93*P_2_18 + PS94*P_1_18 + P_4_18
+    nextP[..., 18, 4] = nextP[..., 4, 18]
+    nextP[..., 5, 18] = -PS127*P_14_18 - PS129*P_13_18 + PS131*P_15_18 + PS88*P_0_18 + PS92*P_3_18 - PS93*P_1_18 + PS94*P_2_18 + P_5_18
+    nextP[..., 18, 5] = nextP[..., 5, 18]
+    nextP[..., 6, 18] = -PS152*P_15_18 - PS154*P_14_18 + PS156*P_13_18 + PS88*P_1_18 - PS92*P_2_18 + PS93*P_0_18 + PS94*P_3_18 + P_6_18
+    nextP[..., 18, 6] = nextP[..., 6, 18]
+    nextP[..., 7, 18] = P_4_18*dt + P_7_18
+    nextP[..., 18, 7] = nextP[..., 7, 18]
+    nextP[..., 8, 18] = P_5_18*dt + P_8_18
+    nextP[..., 18, 8] = nextP[..., 8, 18]
+    nextP[..., 9, 18] = P_6_18*dt + P_9_18
+    nextP[..., 18, 9] = nextP[..., 9, 18]
+    nextP[..., 10, 18] = P_10_18
+    nextP[..., 18, 10] = nextP[..., 10, 18]
+    nextP[..., 11, 18] = P_11_18
+    nextP[..., 18, 11] = nextP[..., 11, 18]
+    nextP[..., 12, 18] = P_12_18
+    nextP[..., 18, 12] = nextP[..., 12, 18]
+    nextP[..., 13, 18] = P_13_18
+    nextP[..., 18, 13] = nextP[..., 13, 18]
+    nextP[..., 14, 18] = P_14_18
+    nextP[..., 18, 14] = nextP[..., 14, 18]
+    nextP[..., 15, 18] = P_15_18
+    nextP[..., 18, 15] = nextP[..., 15, 18]
+    nextP[..., 16, 18] = P_16_18
+    nextP[..., 18, 16] = nextP[..., 16, 18]
+    nextP[..., 17, 18] = P_17_18
+    nextP[..., 18, 17] = nextP[..., 17, 18]
+    nextP[..., 18, 18] = P_18_18
+    nextP[..., 0, 19] = -PS11*P_1_19 - PS12*P_2_19 - PS13*P_3_19 + PS6*P_10_19 + PS7*P_11_19 + PS9*P_12_19 + P_0_19
+    nextP[..., 19, 0] = nextP[..., 0, 19]
+    nextP[..., 1, 19] = PS11*P_0_19 - PS12*P_3_19 + PS13*P_2_19 - PS34*P_10_19 - PS7*P_12_19 + PS9*P_11_19 + P_1_19
+    nextP[..., 19, 1] = nextP[..., 1, 19]
+    nextP[..., 2, 19] = PS11*P_3_19 + PS12*P_0_19 - PS13*P_1_19 - PS34*P_11_19 + PS6*P_12_19 - PS9*P_10_19 + P_2_19
+    nextP[..., 19, 2] = nextP[..., 2, 19]
+    nextP[..., 3, 19] = -PS11*P_2_19 + PS12*P_1_19 + PS13*P_0_19 - PS34*P_12_19 - PS6*P_11_19 + PS7*P_10_19 + P_3_19
+    nextP[..., 19, 3] = nextP[..., 3, 19]
+    nextP[..., 4, 19] = -PS80*P_13_19 - PS84*P_15_19 - PS88*P_3_19 + PS91*P_14_19 + PS92*P_0_19 + PS93*P_2_19 + PS94*P_1_19 + P_4_19
+    nextP[..., 19, 4] = nextP[..., 4, 19]
+    nextP[..., 5, 19] = -PS127*P_14_19 - PS129*P_13_19 + PS131*P_15_19 + PS88*P_0_19 + PS92*P_3_19 - PS93*P_1_19 + PS94*P_2_19 + P_5_19
+    nextP[..., 19, 5] = nextP[..., 5, 19]
+    nextP[..., 6, 19] = -PS152*P_15_19 - PS154*P_14_19 + PS156*P_13_19 + PS88*P_1_19 - PS92*P_2_19 + PS93*P_0_19 + PS94*P_3_19 + P_6_19
+    nextP[..., 19, 6] = nextP[..., 6, 19]
+    nextP[..., 7, 19] = P_4_19*dt + P_7_19
+    nextP[..., 19, 7] = nextP[..., 7, 19]
+    nextP[..., 8, 19] = P_5_19*dt + P_8_19
+    nextP[..., 19, 8] = nextP[..., 8, 19]
+    nextP[..., 9, 19] = P_6_19*dt + P_9_19
+    nextP[..., 19, 9] = nextP[..., 9, 19]
+    nextP[..., 10, 19] = P_10_19
+    nextP[..., 19, 10] = nextP[..., 10, 19]
+    nextP[..., 11, 19] = P_11_19
+    nextP[..., 19, 11] = nextP[..., 11, 19]
+    nextP[..., 12, 19] = P_12_19
+    nextP[..., 19, 12] = nextP[..., 12, 19]
+    nextP[..., 13, 19] = P_13_19
+    nextP[..., 19, 13] = nextP[..., 13, 19]
+    nextP[..., 14, 19] = P_14_19
+    nextP[..., 19, 14] = nextP[..., 14, 19]
+    nextP[..., 15, 19] = P_15_19
+    nextP[..., 19, 15] = nextP[..., 15, 19]
+    nextP[..., 16, 19] = P_16_19
+    nextP[..., 19, 16] = nextP[..., 16, 19]
+    nextP[..., 17, 19] = P_17_19
+    nextP[..., 19, 17] = nextP[..., 17, 19]
+    nextP[..., 18, 19] = P_18_19
+    nextP[..., 19, 18] = nextP[..., 18, 19]
+    nextP[..., 19, 19] = P_19_19
+    nextP[..., 0, 20] = -PS11*P_1_20 - PS12*P_2_20 - PS13*P_3_20 + PS6*P_10_20 + PS7*P_11_20 + PS9*P_12_20 + P_0_20
+    nextP[..., 20, 0] = nextP[..., 0, 20]
+    nextP[..., 1, 20] = PS11*P_0_20 - PS12*P_3_20 + PS13*P_2_20 - PS34*P_10_20 - PS7*P_12_20 + PS9*P_11_20 + P_1_20
+    nextP[..., 20, 1] = nextP[..., 1, 20]
+    nextP[..., 2, 20] = PS11*P_3_20 + PS12*P_0_20 - PS13*P_1_20 - PS34*P_11_20 + PS6*P_12_20 - PS9*P_10_20 + P_2_20
+    nextP[..., 20, 2] = nextP[..., 2, 20]
+    nextP[..., 3, 20] = -PS11*P_2_20 + PS12*P_1_20 + PS13*P_0_20 - PS34*P_12_20 - PS6*P_11_20 + PS7*P_10_20 + P_3_20
+    nextP[..., 20, 3] = nextP[..., 3, 20]
+    nextP[..., 4, 20] = -PS80*P_13_20 - PS84*P_15_20 - PS88*P_3_20 + PS91*P_14_20 + PS92*P_0_20 + PS93*P_2_20 + PS94*P_1_20 + P_4_20
+    nextP[..., 20, 4] = nextP[..., 4, 20]
+    nextP[..., 5, 20] = -PS127*P_14_20 - PS129*P_13_20 + PS131*P_15_20 + PS88*P_0_20 + PS92*P_3_20 - PS93*P_1_20 + PS94*P_2_20 + P_5_20
+    nextP[..., 20, 5] = nextP[..., 5, 20]
+    nextP[..., 6, 20] = -PS152*P_15_20 - PS154*P_14_20 + PS156*P_13_20 + PS88*P_1_20 - PS92*P_2_20 + PS93*P_0_20 + PS94*P_3_20 + P_6_20
+    nextP[..., 20, 6] = nextP[..., 6, 20]
+    nextP[..., 7, 20] = P_4_20*dt + P_7_20
+    nextP[..., 20, 7] = nextP[..., 7, 20]
+    nextP[..., 8, 20] = P_5_20*dt + P_8_20
+    nextP[..., 20, 8] = nextP[..., 8, 20]
+    nextP[..., 9, 20] = P_6_20*dt + P_9_20
+    nextP[..., 20, 9] = nextP[..., 9, 20]
+    nextP[..., 10, 20] = P_10_20
+    nextP[..., 20, 10] = nextP[..., 10, 20]
+    nextP[..., 11, 20] = P_11_20
+    nextP[..., 20, 11] = nextP[..., 11, 20]
+    nextP[..., 12, 20] = P_12_20
+    nextP[..., 20, 12] = nextP[..., 12, 20]
+    nextP[..., 13, 20] = P_13_20
+    nextP[..., 20, 13] = nextP[..., 13, 20]
+    nextP[..., 14, 20] = P_14_20
+    nextP[..., 20, 14] = nextP[..., 14, 20]
+    nextP[..., 15, 20] = P_15_20
+    nextP[..., 20, 15] = nextP[..., 15, 20]
+    nextP[..., 16, 20] = P_16_20
+    nextP[..., 20, 16] = nextP[..., 16, 20]
+    nextP[..., 17, 20] = P_17_20
+    nextP[..., 20, 17] = nextP[..., 17, 20]
+    nextP[..., 18, 20] = P_18_20
+    nextP[..., 20, 18] = nextP[..., 18, 20]
+    nextP[..., 19, 20] = P_19_20
+    nextP[..., 20, 19] = nextP[..., 19, 20]
+    nextP[..., 20, 20] = P_20_20
+    nextP[..., 0, 21] = -PS11*P_1_21 - PS12*P_2_21 - PS13*P_3_21 + PS6*P_10_21 + PS7*P_11_21 + PS9*P_12_21 + P_0_21
+    nextP[..., 21, 0] = nextP[..., 0, 21]
+    nextP[..., 1, 21] = PS11*P_0_21 - PS12*P_3_21 + PS13*P_2_21 - PS34*P_10_21 - PS7*P_12_21 + PS9*P_11_21 + P_1_21
+    nextP[..., 21, 1] = nextP[..., 1, 21]
+    nextP[..., 2, 21] = PS11*P_3_21 + PS12*P_0_21 - PS13*P_1_21 - PS34*P_11_21 + PS6*P_12_21 - PS9*P_10_21 + P_2_21
+    nextP[..., 21, 2] = nextP[..., 2, 21]
+    nextP[..., 3, 21] = -PS11*P_2_21 + PS12*P_1_21 + PS13*P_0_21 - PS34*P_12_21 - PS6*P_11_21 + PS7*P_10_21 + P_3_21
+    nextP[..., 21, 3] = nextP[..., 3, 21]
+    nextP[..., 4, 21] = -PS80*P_13_21 - PS84*P_15_21 - PS88*P_3_21 + PS91*P_14_21 + PS92*P_0_21 + PS93*P_2_21 + PS94*P_1_21 + P_4_21
+    nextP[..., 21, 4] = nextP[..., 4, 21]
+    nextP[..., 5, 21] = -PS127*P_14_21 - PS129*P_13_21 + PS131*P_15_21 + PS88*P_0_21 + PS92*P_3_21 - PS93*P_1_21 + PS94*P_2_21 + P_5_21
+    nextP[..., 21, 5] = nextP[..., 5, 21]
+    nextP[..., 6, 21] = -PS152*P_15_21 - PS154*P_14_21 + PS156*P_13_21 + PS88*P_1_21 - PS92*P_2_21 + PS93*P_0_21 + PS94*P_3_21 + P_6_21
+    nextP[..., 21, 6] = nextP[..., 6, 21]
+    nextP[..., 7, 21] = P_4_21*dt + P_7_21
+    nextP[..., 21, 7] = nextP[..., 7, 21]
+    nextP[..., 8, 21] = P_5_21*dt + P_8_21
+    nextP[..., 21, 8] = nextP[..., 8, 21]
+    nextP[..., 9, 21] = P_6_21*dt + P_9_21
+    nextP[..., 21, 9] = nextP[..., 9, 21]
+    nextP[..., 10, 21] = P_10_21
+    nextP[..., 21, 10] = nextP[..., 10, 21]
+    nextP[..., 11, 21] = P_11_21
+    nextP[..., 21, 11] = nextP[..., 11, 21]
+    nextP[..., 12, 21] = P_12_21
+    nextP[..., 21, 12] = nextP[..., 12, 21]
+    nextP[..., 13, 21] = P_13_21
+    nextP[..., 21, 13] = nextP[..., 13, 21]
+    nextP[..., 14, 21] = P_14_21
+    nextP[..., 21, 14] = nextP[..., 14, 21]
+    nextP[..., 15, 21] = P_15_21
+    nextP[..., 21, 15] = nextP[..., 15, 21]
+    nextP[..., 16, 21] = P_16_21
+    nextP[..., 21, 16] = nextP[..., 16, 21]
+    nextP[..., 17, 21] = P_17_21
+    nextP[..., 21, 17] = nextP[..., 17, 21]
+    nextP[..., 18, 21] = P_18_21
+    nextP[..., 21, 18] = nextP[..., 18, 21]
+    nextP[..., 19, 21] = P_19_21
+    nextP[..., 21, 19] = nextP[..., 19, 21]
+    nextP[..., 20, 21] = P_20_21
+    nextP[..., 21, 20] = nextP[..., 20, 21]
+    nextP[..., 21, 21] = P_21_21
+    nextP[..., 0, 22] = -PS11*P_1_22 - PS12*P_2_22 - PS13*P_3_22 + PS6*P_10_22 + PS7*P_11_22 + PS9*P_12_22 + P_0_22
+    nextP[..., 22, 0] = nextP[..., 0, 22]
+    nextP[..., 1, 22] = PS11*P_0_22 - PS12*P_3_22 + PS13*P_2_22 - PS34*P_10_22 - PS7*P_12_22 + PS9*P_11_22 + P_1_22
+    nextP[..., 22, 1] = nextP[..., 1, 22]
+    nextP[..., 2, 22] = PS11*P_3_22 + PS12*P_0_22 - PS13*P_1_22 - PS34*P_11_22 + PS6*P_12_22 - PS9*P_10_22 + P_2_22
+    nextP[..., 22, 2] = nextP[..., 2, 22]
+    nextP[..., 3, 22] = -PS11*P_2_22 + PS12*P_1_22 + PS13*P_0_22 - PS34*P_12_22 - PS6*P_11_22 + PS7*P_10_22 + P_3_22
+    nextP[..., 22, 3] = nextP[..., 3, 22]
+    nextP[..., 4, 22] = -PS80*P_13_22 - PS84*P_15_22 - PS88*P_3_22 + PS91*P_14_22 + PS92*P_0_22 + PS93*P_2_22 + PS94*P_1_22 + P_4_22
+    nextP[..., 22, 4] = nextP[..., 4, 22]
+    nextP[..., 5, 22] = -PS127*P_14_22 - PS129*P_13_22 + PS131*P_15_22 + PS88*P_0_22 + PS92*P_3_22 - PS93*P_1_22 + PS94*P_2_22 + P_5_22
+    nextP[..., 22, 5] = nextP[..., 5, 22]
+    nextP[..., 6, 22] = -PS152*P_15_22 - PS154*P_14_22 + PS156*P_13_22 + PS88*P_1_22 - PS92*P_2_22 + PS93*P_0_22 + PS94*P_3_22 + P_6_22
+    nextP[..., 22, 6] = nextP[..., 6, 22]
+    nextP[..., 7, 22] = P_4_22*dt + P_7_22
+    nextP[..., 22, 7] = nextP[..., 7, 22]
+    nextP[..., 8, 22] = P_5_22*dt + P_8_22
+    nextP[..., 22, 8] = nextP[..., 8, 22]
+    nextP[..., 9, 22] = P_6_22*dt + P_9_22
+    nextP[..., 22, 9] = nextP[..., 9, 22]
+    nextP[..., 10, 22] = P_10_22
+    nextP[..., 22, 10] = nextP[..., 10, 22]
+    nextP[..., 11, 22] = P_11_22
+    nextP[..., 22, 11] = nextP[..., 11, 22]
+    nextP[..., 12, 22] = P_12_22
+    nextP[..., 22, 12] = nextP[..., 12, 22]
+    nextP[..., 13, 22] = P_13_22
+    nextP[..., 22, 13] = nextP[..., 13, 22]
+    nextP[..., 14, 22] = P_14_22
+    nextP[..., 22, 14] = nextP[..., 14, 22]
+    nextP[..., 15, 22] = P_15_22
+    nextP[..., 22, 15] = nextP[..., 15, 22]
+    nextP[..., 16, 22] = P_16_22
+    nextP[..., 22, 16] = nextP[..., 16, 22]
+    nextP[..., 17, 22] = P_17_22
+    nextP[..., 22, 17] = nextP[..., 17, 22]
+    nextP[..., 18, 22] = P_18_22
+    nextP[..., 22, 18] = nextP[..., 18, 22]
+    nextP[..., 19, 22] = P_19_22
+    nextP[..., 22, 19] = nextP[..., 19, 22]
+    nextP[..., 20, 22] = P_20_22
+    nextP[..., 22, 20] = nextP[..., 20, 22]
+    nextP[..., 21, 22] = P_21_22
+    nextP[..., 22, 21] = nextP[..., 21, 22]
+    nextP[..., 22, 22] = P_22_22
+    nextP[..., 0, 23] = -PS11*P_1_23 - PS12*P_2_23 - PS13*P_3_23 + PS6*P_10_23 + PS7*P_11_23 + PS9*P_12_23 + P_0_23
+    nextP[..., 23, 0] = nextP[..., 0, 23]
+    nextP[..., 1, 23] = PS11*P_0_23 - PS12*P_3_23 + PS13*P_2_23 - PS34*P_10_23 - PS7*P_12_23 + PS9*P_11_23 + P_1_23
+    nextP[..., 23, 1] = nextP[..., 1, 23]
+    nextP[..., 2, 23] = PS11*P_3_23 + PS12*P_0_23 - PS13*P_1_23 - PS34*P_11_23 + PS6*P_12_23 - PS9*P_10_23 + P_2_23
+    nextP[..., 23, 2] = nextP[..., 2, 23]
+    nextP[..., 3, 23] = -PS11*P_2_23 + PS12*P_1_23 + PS13*P_0_23 - PS34*P_12_23 - PS6*P_11_23 + PS7*P_10_23 + P_3_23
+    nextP[..., 23, 3] = nextP[..., 3, 23]
+    nextP[..., 4, 23] = -PS80*P_13_23 - PS84*P_15_23 - PS88*P_3_23 + PS91*P_14_23 + PS92*P_0_23 + PS93*P_2_23 + PS94*P_1_23 + P_4_23
+    nextP[..., 23, 4] = nextP[..., 4, 23]
+    nextP[..., 5, 23] = -PS127*P_14_23 - PS129*P_13_23 + PS131*P_15_23 + PS88*P_0_23 + PS92*P_3_23 - PS93*P_1_23 + PS94*P_2_23 + P_5_23
+    nextP[..., 23, 5] = nextP[..., 5, 23]
+    nextP[..., 6, 23] = -PS152*P_15_23 - PS154*P_14_23 + PS156*P_13_23 + PS88*P_1_23 - PS92*P_2_23 + PS93*P_0_23 + PS94*P_3_23 + P_6_23
+    nextP[..., 23, 6] = nextP[..., 6, 23]
+    nextP[..., 7, 23] = P_4_23*dt + P_7_23
+    nextP[..., 23, 7] = nextP[..., 7, 23]
+    nextP[..., 8, 23] = P_5_23*dt + P_8_23
+    nextP[..., 23, 8] = nextP[..., 8, 23]
+    nextP[..., 9, 23] = P_6_23*dt + P_9_23
+    nextP[..., 23, 9] = nextP[..., 9, 23]
+    nextP[..., 10, 23] = P_10_23
+    nextP[..., 23, 10] = nextP[..., 10, 23]
+    nextP[..., 11, 23] = P_11_23
+    nextP[..., 23, 11] = nextP[..., 11, 23]
+    nextP[..., 12, 23] = P_12_23
+    nextP[..., 23, 12] = nextP[..., 12, 23]
+    nextP[..., 13, 23] = P_13_23
+    nextP[..., 23, 13] = nextP[..., 13, 23]
+    nextP[..., 14, 23] = P_14_23
+    nextP[..., 23, 14] = nextP[..., 14, 23]
+    nextP[..., 15, 23] = P_15_23
+    nextP[..., 23, 15] = nextP[..., 15, 23]
+    nextP[..., 16, 23] = P_16_23
+    nextP[..., 23, 16] = nextP[..., 16, 23]
+    nextP[..., 17, 23] = P_17_23
+    nextP[..., 23, 17] = nextP[..., 17, 23]
+    nextP[..., 18, 23] = P_18_23
+    nextP[..., 23, 18] = nextP[..., 18, 23]
+    nextP[..., 19, 23] = P_19_23
+    nextP[..., 23, 19] = nextP[..., 19, 23]
+    nextP[..., 20, 23] = P_20_23
+    nextP[..., 23, 20] = nextP[..., 20, 23]
+    nextP[..., 21, 23] = P_21_23
+    nextP[..., 23, 21] = nextP[..., 21, 23]
+    nextP[..., 22, 23] = P_22_23
+    nextP[..., 23, 22] = nextP[..., 22, 23]
+    nextP[..., 23, 23] = P_23_23
+    return nextP
+
+# covariance matrix prediction, without process noise, loop over the filters
+def predict_covariance_kernel(states, P, dax, daxVar, day, dayVar, daz, dazVar, dt, dvx, dvxVar, dvy, dvyVar, dvz, dvzVar):
+    n_filters = P.shape[0]
+    dax = numpy.broadcast_to(numpy.asarray(dax, dtype=numpy.float64), (n_filters,))
+    daxVar = numpy.broadcast_to(numpy.asarray(daxVar, dtype=numpy.float64), (n_filters,))
+    day = numpy.broadcast_to(numpy.asarray(day, dtype=numpy.float64), (n_filters,))
+    dayVar = numpy.broadcast_to(numpy.asarray(dayVar, dtype=numpy.float64), (n_filters,))
+    daz = numpy.broadcast_to(numpy.asarray(daz, dtype=numpy.float64), (n_filters,))
+    dazVar = numpy.broadcast_to(numpy.asarray(dazVar, dtype=numpy.float64), (n_filters,))
+    dt = numpy.broadcast_to(numpy.asarray(dt, dtype=numpy.float64), (n_filters,))
+    dvx = numpy.broadcast_to(numpy.asarray(dvx, dtype=numpy.float64), (n_filters,))
+    dvxVar = numpy.broadcast_to(numpy.asarray(dvxVar, dtype=numpy.float64), (n_filters,))
+    dvy = numpy.broadcast_to(numpy.asarray(dvy, dtype=numpy.float64), (n_filters,))
+    dvyVar = numpy.broadcast_to(numpy.asarray(dvyVar, dtype=numpy.float64), (n_filters,))
+    dvz = numpy.broadcast_to(numpy.asarray(dvz, dtype=numpy.float64), (n_filters,))
+    dvzVar = numpy.broadcast_to(numpy.asarray(dvzVar, dtype=numpy.float64), (n_filters,))
+    return _predict_covariance_kernel(states, P, dax, daxVar, day, dayVar, daz, dazVar, dt, dvx, dvxVar, dvy, dvyVar, dvz, dvzVar)
+
+@jit
+def _predict_covariance_kernel(states, P, dax, daxVar, day, dayVar, daz, dazVar, dt, dvx, dvxVar, dvy, dvyVar, dvz, dvzVar):
+    n_filters = P.shape[0]
+    nextP = numpy.zeros((n_filters,) + (24, 24))
+    for index in range(n_filters):
+        q0 = states[index, 0]
+        q1 = states[index, 1]
+        q2 = states[index, 2]
+        q3 = states[index, 3]
+        dax_b = states[index, 10]
+        day_b = states[index, 11]
+        daz_b = states[index, 12]
+        dvx_b = states[index, 13]
+        dvy_b = states[index, 14]
+        dvz_b = states[index, 15]
+        P_0_0 = P[index, 0, 0]
+        P_0_1 = P[index, 0, 1]
+        P_0_2 = P[index, 0, 2]
+        P_0_3 = P[index, 0, 3]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_7 = P[index, 0, 7]
+        P_0_8 = P[index, 0, 8]
+        P_0_9 = P[index, 0, 9]
+        P_0_10 = P[index, 0, 10]
+        P_0_11 = P[index, 0, 11]
+        P_0_12 = P[index, 0, 12]
+        P_0_13 = P[index, 0, 13]
+        P_0_14 = P[index, 0, 14]
+        P_0_15 = P[index, 0, 15]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_0_18 = P[index, 0, 18]
+        P_0_19 = P[index, 0, 19]
+        P_0_20 = P[index, 0, 20]
+        P_0_21 = P[index, 0, 21]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_1 = P[index, 1, 1]
+        P_1_2 = P[index, 1, 2]
+        P_1_3 = P[index, 1, 3]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_7 = P[index, 1, 7]
+        P_1_8 = P[index, 1, 8]
+        P_1_9 = P[index, 1, 9]
+        P_1_10 = P[index, 1, 10]
+        P_1_11 = P[index, 1, 11]
+        P_1_12 = P[index, 1, 12]
+        P_1_13 = P[index, 1, 13]
+        P_1_14 = P[index, 1, 14]
+        P_1_15 = P[index, 1, 15]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_1_18 = P[index, 1, 18]
+        P_1_19 = P[index, 1, 19]
+        P_1_20 = P[index, 1, 20]
+        P_1_21 = P[index, 1, 21]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_2 = P[index, 2, 2]
+        P_2_3 = P[index, 2, 3]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_7 = P[index, 2, 7]
+        P_2_8 = P[index, 2, 8]
+        P_2_9 = P[index, 2, 9]
+        P_2_10 = P[index, 2, 10]
+        P_2_11 = P[index, 2, 11]
+        P_2_12 = P[index, 2, 12]
+        P_2_13 = P[index, 2, 13]
+        P_2_14 = P[index, 2, 14]
+        P_2_15 = P[index, 2, 15]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_2_18 = P[index, 2, 18]
+        P_2_19 = P[index, 2, 19]
+        P_2_20 = P[index, 2, 20]
+        P_2_21 = P[index, 2, 21]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_3 = P[index, 3, 3]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_7 = P[index, 3, 7]
+        P_3_8 = P[index, 3, 8]
+        P_3_9 = P[index, 3, 9]
+        P_3_10 = P[index, 3, 10]
+        P_3_11 = P[index, 3, 11]
+        P_3_12 = P[index, 3, 12]
+        P_3_13 = P[index, 3, 13]
+        P_3_14 = P[index, 3, 14]
+        P_3_15 = P[index, 3, 15]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_3_18 = P[index, 3, 18]
+        P_3_19 = P[index, 3, 19]
+        P_3_20 = P[index, 3, 20]
+        P_3_21 = P[index, 3, 21]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        P_4_4 = P[index, 4, 4]
+        P_4_5 = P[index, 4, 5]
+        P_4_6 = P[index, 4, 6]
+        P_4_7 = P[index, 4, 7]
+        P_4_8 = P[index, 4, 8]
+        P_4_9 = P[index, 4, 9]
+        P_4_10 = P[index, 4, 10]
+        P_4_11 = P[index, 4, 11]
+        P_4_12 = P[index, 4, 12]
+        P_4_13 = P[index, 4, 13]
+        P_4_14 = P[index, 4, 14]
+        P_4_15 = P[index, 4, 15]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_4_18 = P[index, 4, 18]
+        P_4_19 = P[index, 4, 19]
+        P_4_20 = P[index, 4, 20]
+        P_4_21 = P[index, 4, 21]
+        P_4_22 = P[index, 4, 22]
+        P_4_23 = P[index, 4, 23]
+        P_5_5 = P[index, 5, 5]
+        P_5_6 = P[index, 5, 6]
+        P_5_7 = P[index, 5, 7]
+        P_5_8 = P[index, 5, 8]
+        P_5_9 = P[index, 5, 9]
+        P_5_10 = P[index, 5, 10]
+        P_5_11 = P[index, 5, 11]
+        P_5_12 = P[index, 5, 12]
+        P_5_13 = P[index, 5, 13]
+        P_5_14 = P[index, 5, 14]
+        P_5_15 = P[index, 5, 15]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_5_18 = P[index, 5, 18]
+        P_5_19 = P[index, 5, 19]
+        P_5_20 = P[index, 5, 20]
+        P_5_21 = P[index, 5, 21]
+        P_5_22 = P[index, 5, 22]
+        P_5_23 = P[index, 5, 23]
+        P_6_6 = P[index, 6, 6]
+        P_6_7 = P[index, 6, 7]
+        P_6_8 = P[index, 6, 8]
+        P_6_9 = P[index, 6, 9]
+        P_6_10 = P[index, 6, 10]
+        P_6_11 = P[index, 6, 11]
+        P_6_12 = P[index, 6, 12]
+        P_6_13 = P[index, 6, 13]
+        P_6_14 = P[index, 6, 14]
+        P_6_15 = P[index, 6, 15]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_6_18 = P[index, 6, 18]
+        P_6_19 = P[index, 6, 19]
+        P_6_20 = P[index, 6, 20]
+        P_6_21 = P[index, 6, 21]
+        P_6_22 = P[index, 6, 22]
+        P_6_23 = P[index, 6, 23]
+        P_7_7 = P[index, 7, 7]
+        P_7_8 = P[index, 7, 8]
+        P_7_9 = P[index, 7, 9]
+        P_7_10 = P[index, 7, 10]
+        P_7_11 = P[index, 7, 11]
+        P_7_12 = P[index, 7, 12]
+        P_7_13 = P[index, 7, 13]
+        P_7_14 = P[index, 7, 14]
+        P_7_15 = P[index, 7, 15]
+        P_7_16 = P[index, 7, 16]
+        P_7_17 = P[index, 7, 17]
+        P_7_18 = P[index, 7, 18]
+        P_7_19 = P[index, 7, 19]
+        P_7_20 = P[index, 7, 20]
+        P_7_21 = P[index, 7, 21]
+        P_7_22 = P[index, 7, 22]
+        P_7_23 = P[index, 7, 23]
+        P_8_8 = P[index, 8, 8]
+        P_8_9 = P[index, 8, 9]
+        P_8_10 = P[index, 8, 10]
+        P_8_11 = P[index, 8, 11]
+        P_8_12 = P[index, 8, 12]
+        P_8_13 = P[index, 8, 13]
+        P_8_14 = P[index, 8, 14]
+        P_8_15 = P[index, 8, 15]
+        P_8_16 = P[index, 8, 16]
+        P_8_17 = P[index, 8, 17]
+        P_8_18 = P[index, 8, 18]
+        P_8_19 = P[index, 8, 19]
+        P_8_20 = P[index, 8, 20]
+        P_8_21 = P[index, 8, 21]
+        P_8_22 = P[index, 8, 22]
+        P_8_23 = P[index, 8, 23]
+        P_9_9 = P[index, 9, 9]
+        P_9_10 = P[index, 9, 10]
+        P_9_11 = P[index, 9, 11]
+        P_9_12 = P[index, 9, 12]
+        P_9_13 = P[index, 9, 13]
+        P_9_14 = P[index, 9, 14]
+        P_9_15 = P[index, 9, 15]
+        P_9_16 = P[index, 9, 16]
+        P_9_17 = P[index, 9, 17]
+        P_9_18 = P[index, 9, 18]
+        P_9_19 = P[index, 9, 19]
+        P_9_20 = P[index, 9, 20]
+        P_9_21 = P[index, 9, 21]
+        P_9_22 = P[index, 9, 22]
+        P_9_23 = P[index, 9, 23]
+        P_10_10 = P[index, 10, 10]
+        P_10_11 = P[index, 10, 11]
+        P_10_12 = P[index, 10, 12]
+        P_10_13 = P[index, 10, 13]
+        P_10_14 = P[index, 10, 14]
+        P_10_15 = P[index, 10, 15]
+        P_10_16 = P[index, 10, 16]
+        P_10_17 = P[index, 10, 17]
+        P_10_18 = P[index, 10, 18]
+        P_10_19 = P[index, 10, 19]
+        P_10_20 = P[index, 10, 20]
+        P_10_21 = P[index, 10, 21]
+        P_10_22 = P[index, 10, 22]
+        P_10_23 = P[index, 10, 23]
+        P_11_11 = P[index, 11, 11]
+        P_11_12 = P[index, 11, 12]
+        P_11_13 = P[index, 11, 13]
+        P_11_14 = P[index, 11, 14]
+        P_11_15 = P[index, 11, 15]
+        P_11_16 = P[index, 11, 16]
+        P_11_17 = P[index, 11, 17]
+        P_11_18 = P[index, 11, 18]
+        P_11_19 = P[index, 11, 19]
+        P_11_20 = P[index, 11, 20]
+        P_11_21 = P[index, 11, 21]
+        P_11_22 = P[index, 11, 22]
+        P_11_23 = P[index, 11, 23]
+        P_12_12 = P[index, 12, 12]
+        P_12_13 = P[index, 12, 13]
+        P_12_14 = P[index, 12, 14]
+        P_12_15 = P[index, 12, 15]
+        P_12_16 = P[index, 12, 16]
+        P_12_17 = P[index, 12, 17]
+        P_12_18 = P[index, 12, 18]
+        P_12_19 = P[index, 12, 19]
+        P_12_20 = P[index, 12, 20]
+        P_12_21 = P[index, 12, 21]
+        P_12_22 = P[index, 12, 22]
+        P_12_23 = P[index, 12, 23]
+        P_13_13 = P[index, 13, 13]
+        P_13_14 = P[index, 13, 14]
+        P_13_15 = P[index, 13, 15]
+        P_13_16 = P[index, 13, 16]
+        P_13_17 = P[index, 13, 17]
+        P_13_18 = P[index, 13, 18]
+        P_13_19 = P[index, 13, 19]
+        P_13_20 = P[index, 13, 20]
+        P_13_21 = P[index, 13, 21]
+        P_13_22 = P[index, 13, 22]
+        P_13_23 = P[index, 13, 23]
+        P_14_14 = P[index, 14, 14]
+        P_14_15 = P[index, 14, 15]
+        P_14_16 = P[index, 14, 16]
+        P_14_17 = P[index, 14, 17]
+        P_14_18 = P[index, 14, 18]
+        P_14_19 = P[index, 14, 19]
+        P_14_20 = P[index, 14, 20]
+        P_14_21 = P[index, 14, 21]
+        P_14_22 = P[index, 14, 22]
+        P_14_23 = P[index, 14, 23]
+        P_15_15 = P[index, 15, 15]
+        P_15_16 = P[index, 15, 16]
+        P_15_17 = P[index, 15, 17]
+        P_15_18 = P[index, 15, 18]
+        P_15_19 = P[index, 15, 19]
+        P_15_20 = P[index, 15, 20]
+        P_15_21 = P[index, 15, 21]
+        P_15_22 = P[index, 15, 22]
+        P_15_23 = P[index, 15, 23]
+        P_16_16 = P[index, 16, 16]
+        P_16_17 = P[index, 16, 17]
+        P_16_18 = P[index, 16, 18]
+        P_16_19 = P[index, 16, 19]
+        P_16_20 = P[index, 16, 20]
+        P_16_21 = P[index, 16, 21]
+        P_16_22 = P[index, 16, 22]
+        P_16_23 = P[index, 16, 23]
+        P_17_17 = P[index, 17, 17]
+        P_17_18 = P[index, 17, 18]
+        P_17_19 = P[index, 17, 19]
+        P_17_20 = P[index, 17, 20]
+        P_17_21 = P[index, 17, 21]
+        P_17_22 = P[index, 17, 22]
+        P_17_23 = P[index, 17, 23]
+        P_18_18 = P[index, 18, 18]
+        P_18_19 = P[index, 18, 19]
+        P_18_20 = P[index, 18, 20]
+        P_18_21 = P[index, 18, 21]
+        P_18_22 = P[index, 18, 22]
+        P_18_23 = P[index, 18, 23]
+        P_19_19 = P[index, 19, 19]
+        P_19_20 = P[index, 19, 20]
+        P_19_21 = P[index, 19, 21]
+        P_19_22 = P[index, 19, 22]
+        P_19_23 = P[index, 19, 23]
+        P_20_20 = P[index, 20, 20]
+        P_20_21 = P[index, 20, 21]
+        P_20_22 = P[index, 20, 22]
+        P_20_23 = P[index, 20, 23]
+        P_21_21 = P[index, 21, 21]
+        P_21_22 = P[index, 21, 22]
+        P_21_23 = P[index, 21, 23]
+        P_22_22 = P[index, 22, 22]
+        P_22_23 = P[index, 22, 23]
+        P_23_23 = P[index, 23, 23]
+        PS0 = q1**2
+        PS1 = 0.25*daxVar[index]
+        PS2 = q2**2
+        PS3 = 0.25*dayVar[index]
+        PS4 = q3**2
+        PS5 = 0.25*dazVar[index]
+        PS6 = 0.5*q1
+        PS7 = 0.5*q2
+        PS8 = PS7*P_10_11
+        PS9 = 0.5*q3
+        PS10 = PS9*P_10_12
+        PS11 = 0.5*dax[index] - 0.5*dax_b
+        PS12 = 0.5*day[index] - 0.5*day_b
+        PS13 = 0.5*daz[index] - 0.5*daz_b
+        PS14 = PS10 - PS11*P_1_10 - PS12*P_2_10 - PS13*P_3_10 + PS6*P_10_10 + PS8 + P_0_10
+        PS15 = PS6*P_10_11
+        PS16 = PS9*P_11_12
+        PS17 = -PS11*P_1_11 - PS12*P_2_11 - PS13*P_3_11 + PS15 + PS16 + PS7*P_11_11 + P_0_11
+        PS18 = PS6*P_10_12
+        PS19 = PS7*P_11_12
+        PS20 = -PS11*P_1_12 - PS12*P_2_12 - PS13*P_3_12 + PS18 + PS19 + PS9*P_12_12 + P_0_12
+        PS21 = PS12*P_1_2
+        PS22 = -PS13*P_1_3
+        PS23 = -PS11*P_1_1 - PS21 + PS22 + PS6*P_1_10 + PS7*P_1_11 + PS9*P_1_12 + P_0_1
+        PS24 = -PS11*P_1_2
+        PS25 = PS13*P_2_3
+        PS26 = -PS12*P_2_2 + PS24 - PS25 + PS6*P_2_10 + PS7*P_2_11 + PS9*P_2_12 + P_0_2
+        PS27 = PS11*P_1_3
+        PS28 = -PS12*P_2_3
+        PS29 = -PS13*P_3_3 - PS27 + PS28 + PS6*P_3_10 + PS7*P_3_11 + PS9*P_3_12 + P_0_3
+        PS30 = PS11*P_0_1
+        PS31 = PS12*P_0_2
+        PS32 = PS13*P_0_3
+        PS33 = -PS30 - PS31 - PS32 + PS6*P_0_10 + PS7*P_0_11 + PS9*P_0_12 + P_0_0
+        PS34 = 0.5*q0
+        PS35 = q2*q3
+        PS36 = q0*q1
+        PS37 = q0**2
+        PS38 = -PS34*P_10_11
+        PS39 = PS11*P_0_11 - PS12*P_3_11 + PS13*P_2_11 - PS19 + PS38 + PS9*P_11_11 + P_1_11
+        PS40 = PS13*P_0_2
+        PS41 = PS12*P_0_3
+        PS42 = PS11*P_0_0 - PS34*P_0_10 + PS40 - PS41 - PS7*P_0_12 + PS9*P_0_11 + P_0_1
+        PS43 = PS11*P_0_2
+        PS44 = PS13*P_2_2 + PS28 - PS34*P_2_10 + PS43 - PS7*P_2_12 + PS9*P_2_11 + P_1_2
+        PS45 = PS9*P_10_11
+        PS46 = PS7*P_10_12
+        PS47 = PS11*P_0_10 - PS12*P_3_10 + PS13*P_2_10 - PS34*P_10_10 + PS45 - PS46 + P_1_10
+        PS48 = -PS34*P_10_12
+        PS49 = PS11*P_0_12 - PS12*P_3_12 + PS13*P_2_12 + PS16 + PS48 - PS7*P_12_12 + P_1_12
+        PS50 = PS11*P_0_3
+        PS51 = -PS12*P_3_3 + PS25 - PS34*P_3_10 + PS50 - PS7*P_3_12 + PS9*P_3_11 + P_1_3
+        PS52 = PS13*P_1_2
+        PS53 = PS12*P_1_3
+        PS54 = PS30 - PS34*P_1_10 + PS52 - PS53 - PS7*P_1_12 + PS9*P_1_11 + P_1_1
+        PS55 = q1*q3
+        PS56 = q0*q2
+        PS57 = q0*q3
+        PS58 = q1*q2
+        PS59 = -PS34*P_11_12
+        PS60 = -PS10 + PS11*P_3_12 + PS12*P_0_12 - PS13*P_1_12 + PS59 + PS6*P_12_12 + P_2_12
+        PS61 = PS11*P_3_3 + PS22 - PS34*P_3_11 + PS41 + PS6*P_3_12 - PS9*P_3_10 + P_2_3
+        PS62 = PS13*P_0_1
+        PS63 = PS12*P_0_0 - PS34*P_0_11 + PS50 + PS6*P_0_12 - PS62 - PS9*P_0_10 + P_0_2
+        PS64 = PS6*P_11_12
+        PS65 = PS11*P_3_11 + PS12*P_0_11 - PS13*P_1_11 - PS34*P_11_11 - PS45 + PS64 + P_2_11
+        PS66 = PS11*P_3_10 + PS12*P_0_10 - PS13*P_1_10 + PS18 + PS38 - PS9*P_10_10 + P_2_10
+        PS67 = PS12*P_0_1
+        PS68 = -PS13*P_1_1 + PS27 - PS34*P_1_11 + PS6*P_1_12 + PS67 - PS9*P_1_10 + P_1_2
+        PS69 = PS11*P_2_3
+        PS70 = PS31 - PS34*P_2_11 - PS52 + PS6*P_2_12 + PS69 - PS9*P_2_10 + P_2_2
+        PS71 = -PS11*P_2_10 + PS12*P_1_10 + PS13*P_0_10 - PS15 + PS48 + PS7*P_10_10 + P_3_10
+        PS72 = PS12*P_1_1 + PS24 - PS34*P_1_12 - PS6*P_1_11 + PS62 + PS7*P_1_10 + P_1_3
+        PS73 = PS13*P_0_0 - PS34*P_0_12 - PS43 - PS6*P_0_11 + PS67 + PS7*P_0_10 + P_0_3
+        PS74 = -PS11*P_2_12 + PS12*P_1_12 + PS13*P_0_12 - PS34*P_12_12 + PS46 - PS64 + P_3_12
+        PS75 = -PS11*P_2_11 + PS12*P_1_11 + PS13*P_0_11 + PS59 - PS6*P_11_11 + PS8 + P_3_11
+        PS76 = -PS11*P_2_2 + PS21 - PS34*P_2_12 + PS40 - PS6*P_2_11 + PS7*P_2_10 + P_2_3
+        PS77 = PS32 - PS34*P_3_12 + PS53 - PS6*P_3_11 - PS69 + PS7*P_3_10 + P_3_3
+        PS78 = -PS2
+        PS79 = PS37 - PS4
+        PS80 = PS0 + PS78 + PS79
+        PS81 = -PS11*P_1_13 - PS12*P_2_13 - PS13*P_3_13 + PS6*P_10_13 + PS7*P_11_13 + PS9*P_12_13 + P_0_13
+        PS82 = -PS11*P_1_15 - PS12*P_2_15 - PS13*P_3_15 + PS6*P_10_15 + PS7*P_11_15 + PS9*P_12_15 + P_0_15
+        PS83 = PS55 + PS56
+        PS84 = 2*PS83
+        PS85 = dvy[index] - dvy_b
+        PS86 = dvx[index] - dvx_b
+        PS87 = dvz[index] - dvz_b
+        PS88 = 2*PS85*q0 + 2*PS86*q3 - 2*PS87*q1
+        PS89 = -PS11*P_1_14 - PS12*P_2_14 - PS13*P_3_14 + PS6*P_10_14 + PS7*P_11_14 + PS9*P_12_14 + P_0_14
+        PS90 = PS57 - PS58
+        PS91 = 2*PS90
+        PS92 = -2*PS85*q3 + 2*PS86*q0 + 2*PS87*q2
+        PS93 = 2*PS85*q1 - 2*PS86*q2 + 2*PS87*q0
+        PS94 = 2*PS85*q2 + 2*PS86*q1 + 2*PS87*q3
+        PS95 = -PS11*P_1_4 - PS12*P_2_4 - PS13*P_3_4 + PS6*P_4_10 + PS7*P_4_11 + PS9*P_4_12 + P_0_4
+        PS96 = PS11*P_0_13 - PS12*P_3_13 + PS13*P_2_13 - PS34*P_10_13 - PS7*P_12_13 + PS9*P_11_13 + P_1_13
+        PS97 = PS11*P_0_15 - PS12*P_3_15 + PS13*P_2_15 - PS34*P_10_15 - PS7*P_12_15 + PS9*P_11_15 + P_1_15
+        PS98 = PS11*P_0_14 - PS12*P_3_14 + PS13*P_2_14 - PS34*P_10_14 - PS7*P_12_14 + PS9*P_11_14 + P_1_14
+        PS99 = PS11*P_0_4 - PS12*P_3_4 + PS13*P_2_4 - PS34*P_4_10 - PS7*P_4_12 + PS9*P_4_11 + P_1_4
+        PS100 = PS11*P_3_13 + PS12*P_0_13 - PS13*P_1_13 - PS34*P_11_13 + PS6*P_12_13 - PS9*P_10_13 + P_2_13
+        PS101 = PS11*P_3_15 + PS12*P_0_15 - PS13*P_1_15 - PS34*P_11_15 + PS6*P_12_15 - PS9*P_10_15 + P_2_15
+        PS102 = PS11*P_3_14 + PS12*P_0_14 - PS13*P_1_14 - PS34*P_11_14 + PS6*P_12_14 - PS9*P_10_14 + P_2_14
+        PS103 = PS11*P_3_4 + PS12*P_0_4 - PS13*P_1_4 - PS34*P_4_11 + PS6*P_4_12 - PS9*P_4_10 + P_2_4
+        PS104 = -PS11*P_2_13 + PS12*P_1_13 + PS13*P_0_13 - PS34*P_12_13 - PS6*P_11_13 + PS7*P_10_13 + P_3_13
+        PS105 = -PS11*P_2_15 + PS12*P_1_15 + PS13*P_0_15 - PS34*P_12_15 - PS6*P_11_15 + PS7*P_10_15 + P_3_15
+        PS106 = -PS11*P_2_14 + PS12*P_1_14 + PS13*P_0_14 - PS34*P_12_14 - PS6*P_11_14 + PS7*P_10_14 + P_3_14
+        PS107 = -PS11*P_2_4 + PS12*P_1_4 + PS13*P_0_4 - PS34*P_4_12 - PS6*P_4_11 + PS7*P_4_10 + P_3_4
+        PS108 = -PS80*P_13_13 - PS84*P_13_15 - PS88*P_3_13 + PS91*P_13_14 + PS92*P_0_13 + PS93*P_2_13 + PS94*P_1_13 + P_4_13
+        PS109 = -PS80*P_13_15 - PS84*P_15_15 - PS88*P_3_15 + PS91*P_14_15 + PS92*P_0_15 + PS93*P_2_15 + PS94*P_1_15 + P_4_15
+        PS110 = PS94*P_1_3
+        PS111 = PS92*P_0_3
+        PS112 = PS110 + PS111 - PS80*P_3_13 - PS84*P_3_15 - PS88*P_3_3 + PS91*P_3_14 + PS93*P_2_3 + P_3_4
+        PS113 = -PS80*P_13_14 - PS84*P_14_15 - PS88*P_3_14 + PS91*P_14_14 + PS92*P_0_14 + PS93*P_2_14 + PS94*P_1_14 + P_4_14
+        PS114 = PS93*P_0_2
+        PS115 = PS88*P_0_3
+        PS116 = PS114 - PS115 - PS80*P_0_13 - PS84*P_0_15 + PS91*P_0_14 + PS92*P_0_0 + PS94*P_0_1 + P_0_4
+        PS117 = PS94*P_1_2
+        PS118 = PS92*P_0_2
+        PS119 = PS117 + PS118 - PS80*P_2_13 - PS84*P_2_15 - PS88*P_2_3 + PS91*P_2_14 + PS93*P_2_2 + P_2_4
+        PS120 = PS93*P_1_2
+        PS121 = PS88*P_1_3
+        PS122 = PS120 - PS121 - PS80*P_1_13 - PS84*P_1_15 + PS91*P_1_14 + PS92*P_0_1 + PS94*P_1_1 + P_1_4
+        PS123 = 4*dvyVar[index]
+        PS124 = 4*dvzVar[index]
+        PS125 = -PS80*P_4_13 - PS84*P_4_15 - PS88*P_3_4 + PS91*P_4_14 + PS92*P_0_4 + PS93*P_2_4 + PS94*P_1_4 + P_4_4
+        PS126 = -PS0
+        PS127 = PS126 + PS2 + PS79
+        PS128 = PS57 + PS58
+        PS129 = 2*PS128
+        PS130 = -PS35 + PS36
+        PS131 = 2*PS130
+        PS132 = -PS11*P_1_5 - PS12*P_2_5 - PS13*P_3_5 + PS6*P_5_10 + PS7*P_5_11 + PS9*P_5_12 + P_0_5
+        PS133 = PS11*P_0_5 - PS12*P_3_5 + PS13*P_2_5 - PS34*P_5_10 - PS7*P_5_12 + PS9*P_5_11 + P_1_5
+        PS134 = PS11*P_3_5 + PS12*P_0_5 - PS13*P_1_5 - PS34*P_5_11 + PS6*P_5_12 - PS9*P_5_10 + P_2_5
+        PS135 = -PS11*P_2_5 + PS12*P_1_5 + PS13*P_0_5 - PS34*P_5_12 - PS6*P_5_11 + PS7*P_5_10 + P_3_5
+        PS136 = PS127*dvyVar[index]
+        PS137 = PS80*dvxVar[index]
+        PS138 = -PS80*P_5_13 - PS84*P_5_15 - PS88*P_3_5 + PS91*P_5_14 + PS92*P_0_5 + PS93*P_2_5 + PS94*P_1_5 + P_4_5
+        PS139 = -PS127*P_14_14 - PS129*P_13_14 + PS131*P_14_15 + PS88*P_0_14 + PS92*P_3_14 - PS93*P_1_14 + PS94*P_2_14 + P_5_14
+        PS140 = -PS127*P_13_14 - PS129*P_13_13 + PS131*P_13_15 + PS88*P_0_13 + PS92*P_3_13 - PS93*P_1_13 + PS94*P_2_13 + P_5_13
+        PS141 = PS88*P_0_1
+        PS142 = PS117 - PS127*P_1_14 - PS129*P_1_13 + PS131*P_1_15 + PS141 + PS92*P_1_3 - PS93*P_1_1 + P_1_5
+        PS143 = -PS127*P_14_15 - PS129*P_13_15 + PS131*P_15_15 + PS88*P_0_15 + PS92*P_3_15 - PS93*P_1_15 + PS94*P_2_15 + P_5_15
+        PS144 = PS94*P_2_3
+        PS145 = PS115 - PS127*P_3_14 - PS129*P_3_13 + PS131*P_3_15 + PS144 + PS92*P_3_3 - PS93*P_1_3 + P_3_5
+        PS146 = PS93*P_0_1
+        PS147 = PS111 - PS127*P_0_14 - PS129*P_0_13 + PS131*P_0_15 - PS146 + PS88*P_0_0 + PS94*P_0_2 + P_0_5
+        PS148 = PS92*P_2_3
+        PS149 = -PS120 - PS127*P_2_14 - PS129*P_2_13 + PS131*P_2_15 + PS148 + PS88*P_0_2 + PS94*P_2_2 + P_2_5
+        PS150 = 4*dvxVar[index]
+        PS151 = -PS127*P_5_14 - PS129*P_5_13 + PS131*P_5_15 + PS88*P_0_5 + PS92*P_3_5 - PS93*P_1_5 + PS94*P_2_5 + P_5_5
+        PS152 = PS126 + PS37 + PS4 + PS78
+        PS153 = PS35 + PS36
+        PS154 = 2*PS153
+        PS155 = -PS55 + PS56
+        PS156 = 2*PS155
+        PS157 = -PS11*P_1_6 - PS12*P_2_6 - PS13*P_3_6 + PS6*P_6_10 + PS7*P_6_11 + PS9*P_6_12 + P_0_6
+        PS158 = PS11*P_0_6 - PS12*P_3_6 + PS13*P_2_6 - PS34*P_6_10 - PS7*P_6_12 + PS9*P_6_11 + P_1_6
+        PS159 = PS11*P_3_6 + PS12*P_0_6 - PS13*P_1_6 - PS34*P_6_11 + PS6*P_6_12 - PS9*P_6_10 + P_2_6
+        PS160 = -PS11*P_2_6 + PS12*P_1_6 + PS13*P_0_6 - PS34*P_6_12 - PS6*P_6_11 + PS7*P_6_10 + P_3_6
+        PS161 = PS152*dvzVar[index]
+        PS162 = -PS80*P_6_13 - PS84*P_6_15 - PS88*P_3_6 + PS91*P_6_14 + PS92*P_0_6 + PS93*P_2_6 + PS94*P_1_6 + P_4_6
+        PS163 = -PS127*P_6_14 - PS129*P_6_13 + PS131*P_6_15 + PS88*P_0_6 + PS92*P_3_6 - PS93*P_1_6 + PS94*P_2_6 + P_5_6
+        PS164 = -PS152*P_15_15 - PS154*P_14_15 + PS156*P_13_15 + PS88*P_1_15 - PS92*P_2_15 + PS93*P_0_15 + PS94*P_3_15 + P_6_15
+        PS165 = -PS152*P_14_15 - PS154*P_14_14 + PS156*P_13_14 + PS88*P_1_14 - PS92*P_2_14 + PS93*P_0_14 + PS94*P_3_14 + P_6_14
+        PS166 = -PS152*P_13_15 - PS154*P_13_14 + PS156*P_13_13 + PS88*P_1_13 - PS92*P_2_13 + PS93*P_0_13 + PS94*P_3_13 + P_6_13
+        PS167 = -PS152*P_6_15 - PS154*P_6_14 + PS156*P_6_13 + PS88*P_1_6 - PS92*P_2_6 + PS93*P_0_6 + PS94*P_3_6 + P_6_6
+        nextP[index, 0, 0] = PS0*PS1 - PS11*PS23 - PS12*PS26 - PS13*PS29 + PS14*PS6 + PS17*PS7 + PS2*PS3 + PS20*PS9 + PS33 + PS4*PS5
+        nextP[index, 0, 1] = -PS1*PS36 + PS11*PS33 - PS12*PS29 + PS13*PS26 - PS14*PS34 + PS17*PS9 - PS20*PS7 + PS23 + PS3*PS35 - PS35*PS5
+        nextP[index, 1, 0] = nextP[index, 0, 1]
+        nextP[index, 1, 1] = PS1*PS37 + PS11*PS42 - PS12*PS51 + PS13*PS44 + PS2*PS5 + PS3*PS4 - PS34*PS47 + PS39*PS9 - PS49*PS7 + PS54
+        nextP[index, 0, 2] = -PS1*PS55 + PS11*PS29 + PS12*PS33 - PS13*PS23 - PS14*PS9 - PS17*PS34 + PS20*PS6 + PS26 - PS3*PS56 + PS5*PS55
+        nextP[index, 2, 0] = nextP[index, 0, 2]
+        nextP[index, 1, 2] = PS1*PS57 + PS11*PS51 + PS12*PS42 - PS13*PS54 - PS3*PS57 - PS34*PS39 + PS44 - PS47*PS9 + PS49*PS6 - PS5*PS58
+        nextP[index, 2, 1] = nextP[index, 1, 2]
+        nextP[index, 2, 2] = PS0*PS5 + PS1*PS4 + PS11*PS61 + PS12*PS63 - PS13*PS68 + PS3*PS37 - PS34*PS65 + PS6*PS60 - PS66*PS9 + PS70
+        nextP[index, 0, 3] = PS1*PS58 - PS11*PS26 + PS12*PS23 + PS13*PS33 + PS14*PS7 - PS17*PS6 - PS20*PS34 + PS29 - PS3*PS58 - PS5*PS57
+        nextP[index, 3, 0] = nextP[index, 0, 3]
+        nextP[index, 1, 3] = -PS1*PS56 - PS11*PS44 + PS12*PS54 + PS13*PS42 - PS3*PS55 - PS34*PS49 - PS39*PS6 + PS47*PS7 + PS5*PS56 + PS51
+        nextP[index, 3, 1] = nextP[index, 1, 3]
+        nextP[index, 2, 3] = -PS1*PS35 - PS11*PS70 + PS12*PS68 + PS13*PS63 + PS3*PS36 - PS34*PS60 - PS36*PS5 - PS6*PS65 + PS61 + PS66*PS7
+        nextP[index, 3, 2] = nextP[index, 2, 3]
+        nextP[index, 3, 3] = PS0*PS3 + PS1*PS2 - PS11*PS76 + PS12*PS72 + PS13*PS73 - PS34*PS74 + PS37*PS5 - PS6*PS75 + PS7*PS71 + PS77
+        nextP[index, 0, 4] = PS23*PS94 + PS26*PS93 - PS29*PS88 + PS33*PS92 - PS80*PS81 - PS82*PS84 + PS89*PS91 + PS95
+        nextP[index, 4, 0] = nextP[index, 0, 4]
+        nextP[index, 1, 4] = PS42*PS92 + PS44*PS93 - PS51*PS88 + PS54*PS94 - PS80*PS96 - PS84*PS97 + PS91*PS98 + PS99
+        nextP[index, 4, 1] = nextP[index, 1, 4]
+        nextP[index, 2, 4] = -PS100*PS80 - PS101*PS84 + PS102*PS91 + PS103 - PS61*PS88 + PS63*PS92 + PS68*PS94 + PS70*PS93
+        nextP[index, 4, 2] = nextP[index, 2, 4]
+        nextP[index, 3, 4] = -PS104*PS80 - PS105*PS84 + PS106*PS91 + PS107 + PS72*PS94 + PS73*PS92 + PS76*PS93 - PS77*PS88
+        nextP[index, 4, 3] = nextP[index, 3, 4]
+        nextP[index, 4, 4] = -PS108*PS80 - PS109*PS84 - PS112*PS88 + PS113*PS91 + PS116*PS92 + PS119*PS93 + PS122*PS94 + PS123*PS90**2 + PS124*PS83**2 + PS125 + PS80**2*dvxVar[index]
+        nextP[index, 0, 5] = -PS127*PS89 - PS129*PS81 + PS131*PS82 + PS132 - PS23*PS93 + PS26*PS94 + PS29*PS92 + PS33*PS88
+        nextP[index, 5, 0] = nextP[index, 0, 5]
+        nextP[index, 1, 5] = -PS127*PS98 - PS129*PS96 + PS131*PS97 + PS133 + PS42*PS88 + PS44*PS94 + PS51*PS92 - PS54*PS93
+        nextP[index, 5, 1] = nextP[index, 1, 5]
+        nextP[index, 2, 5] = -PS100*PS129 + PS101*PS131 - PS102*PS127 + PS134 + PS61*PS92 + PS63*PS88 - PS68*PS93 + PS70*PS94
+        nextP[index, 5, 2] = nextP[index, 2, 5]
+        nextP[index, 3, 5] = -PS104*PS129 + PS105*PS131 - PS106*PS127 + PS135 - PS72*PS93 + PS73*PS88 + PS76*PS94 + PS77*PS92
+        nextP[index, 5, 3] = nextP[index, 3, 5]
+        nextP[index, 4, 5] = -PS108*PS129 + PS109*PS131 + PS112*PS92 - PS113*PS127 + PS116*PS88 + PS119*PS94 - PS122*PS93 - PS124*PS130*PS83 + PS129*PS137 - PS136*PS91 + PS138
+        nextP[index, 5, 4] = nextP[index, 4, 5]
+        nextP[index, 5, 5] = PS124*PS130**2 + PS127**2*dvyVar[index] - PS127*PS139 + PS128**2*PS150 - PS129*PS140 + PS131*PS143 - PS142*PS93 + PS145*PS92 + PS147*PS88 + PS149*PS94 + PS151
+        nextP[index, 0, 6] = -PS152*PS82 - PS154*PS89 + PS156*PS81 + PS157 + PS23*PS88 - PS26*PS92 + PS29*PS94 + PS33*PS93
+        nextP[index, 6, 0] = nextP[index, 0, 6]
+        nextP[index, 1, 6] = -PS152*PS97 - PS154*PS98 + PS156*PS96 + PS158 + PS42*PS93 - PS44*PS92 + PS51*PS94 + PS54*PS88
+        nextP[index, 6, 1] = nextP[index, 1, 6]
+        nextP[index, 2, 6] = PS100*PS156 - PS101*PS152 - PS102*PS154 + PS159 + PS61*PS94 + PS63*PS93 + PS68*PS88 - PS70*PS92
+        nextP[index, 6, 2] = nextP[index, 2, 6]
+        nextP[index, 3, 6] = PS104*PS156 - PS105*PS152 - PS106*PS154 + PS160 + PS72*PS88 + PS73*PS93 - PS76*PS92 + PS77*PS94
+        nextP[index, 6, 3] = nextP[index, 3, 6]
+        nextP[index, 4, 6] = PS108*PS156 - PS109*PS152 + PS112*PS94 - PS113*PS154 + PS116*PS93 - PS119*PS92 + PS122*PS88 - PS123*PS153*PS90 - PS137*PS156 + PS161*PS84 + PS162
+        nextP[index, 6, 4] = nextP[index, 4, 6]
+        nextP[index, 5, 6] = -PS128*PS150*PS155 - PS131*PS161 + PS136*PS154 - PS139*PS154 + PS140*PS156 + PS142*PS88 - PS143*PS152 + PS145*PS94 + PS147*PS93 - PS149*PS92 + PS163
+        nextP[index, 6, 5] = nextP[index, 5, 6]
+        nextP[index, 6, 6] = PS123*PS153**2 + PS150*PS155**2 + PS152**2*dvzVar[index] - PS152*PS164 - PS154*PS165 + PS156*PS166 + PS167 + PS88*(PS110 + PS146 - PS152*P_1_15 - PS154*P_1_14 + PS156*P_1_13 + PS88*P_1_1 - PS92*P_1_2 + P_1_6) - PS92*(PS114 + PS144 - PS152*P_2_15 - PS154*P_2_14 + PS156*P_2_13 + PS88*P_1_2 - PS92*P_2_2 + P_2_6) + PS93*(-PS118 + PS141 - PS152*P_0_15 - PS154*P_0_14 + PS156*P_0_13 + PS93*P_0_0 + PS94*P_0_3 + P_0_6) + PS94*(PS121 - PS148 - PS152*P_3_15 - PS154*P_3_14 + PS156*P_3_13 + PS93*P_0_3 + PS94*P_3_3 + P_3_6)
+        nextP[index, 0, 7] = -PS11*P_1_7 - PS12*P_2_7 - PS13*P_3_7 + PS6*P_7_10 + PS7*P_7_11 + PS9*P_7_12 + PS95*dt[index] + P_0_7
+        nextP[index, 7, 0] = nextP[index, 0, 7]
+        nextP[index, 1, 7] = PS11*P_0_7 - PS12*P_3_7 + PS13*P_2_7 - PS34*P_7_10 - PS7*P_7_12 + PS9*P_7_11 + PS99*dt[index] + P_1_7
+        nextP[index, 7, 1] = nextP[index, 1, 7]
+        nextP[index, 2, 7] = PS103*dt[index] + PS11*P_3_7 + PS12*P_0_7 - PS13*P_1_7 - PS34*P_7_11 + PS6*P_7_12 - PS9*P_7_10 + P_2_7
+        nextP[index, 7, 2] = nextP[index, 2, 7]
+        nextP[index, 3, 7] = PS107*dt[index] - PS11*P_2_7 + PS12*P_1_7 + PS13*P_0_7 - PS34*P_7_12 - PS6*P_7_11 + PS7*P_7_10 + P_3_7
+        nextP[index, 7, 3] = nextP[index, 3, 7]
+        nextP[index, 4, 7] = PS125*dt[index] - PS80*P_7_13 - PS84*P_7_15 - PS88*P_3_7 + PS91*P_7_14 + PS92*P_0_7 + PS93*P_2_7 + PS94*P_1_7 + P_4_7
+        nextP[index, 7, 4] = nextP[index, 4, 7]
+        nextP[index, 5, 7] = -PS127*P_7_14 - PS129*P_7_13 + PS131*P_7_15 + PS88*P_0_7 + PS92*P_3_7 - PS93*P_1_7 + PS94*P_2_7 + P_5_7 + dt[index]*(-PS127*P_4_14 - PS129*P_4_13 + PS131*P_4_15 + PS88*P_0_4 + PS92*P_3_4 - PS93*P_1_4 + PS94*P_2_4 + P_4_5)
+        nextP[index, 7, 5] = nextP[index, 5, 7]
+        nextP[index, 6, 7] = -PS152*P_7_15 - PS154*P_7_14 + PS156*P_7_13 + PS88*P_1_7 - PS92*P_2_7 + PS93*P_0_7 + PS94*P_3_7 + P_6_7 + dt[index]*(-PS152*P_4_15 - PS154*P_4_14 + PS156*P_4_13 + PS88*P_1_4 - PS92*P_2_4 + PS93*P_0_4 + PS94*P_3_4 + P_4_6)
+        nextP[index, 7, 6] = nextP[index, 6, 7]
+        nextP[index, 7, 7] = P_4_7*dt[index] + P_7_7 + dt[index]*(P_4_4*dt[index] + P_4_7)
+        nextP[index, 0, 8] = -PS11*P_1_8 - PS12*P_2_8 - PS13*P_3_8 + PS132*dt[index] + PS6*P_8_10 + PS7*P_8_11 + PS9*P_8_12 + P_0_8
+        nextP[index, 8, 0] = nextP[index, 0, 8]
+        nextP[index, 1, 8] = PS11*P_0_8 - PS12*P_3_8 + PS13*P_2_8 + PS133*dt[index] - PS34*P_8_10 - PS7*P_8_12 + PS9*P_8_11 + P_1_8
+        nextP[index, 8, 1] = nextP[index, 1, 8]
+        nextP[index, 2, 8] = PS11*P_3_8 + PS12*P_0_8 - PS13*P_1_8 + PS134*dt[index] - PS34*P_8_11 + PS6*P_8_12 - PS9*P_8_10 + P_2_8
+        nextP[index, 8, 2] = nextP[index, 2, 8]
+        nextP[index, 3, 8] = -PS11*P_2_8 + PS12*P_1_8 + PS13*P_0_8 + PS135*dt[index] - PS34*P_8_12 - PS6*P_8_11 + PS7*P_8_10 + P_3_8
+        nextP[index, 8, 3] = nextP[index, 3, 8]
+        nextP[index, 4, 8] = PS138*dt[index] - PS80*P_8_13 - PS84*P_8_15 - PS88*P_3_8 + PS91*P_8_14 + PS92*P_0_8 + PS93*P_2_8 + PS94*P_1_8 + P_4_8
+        nextP[index, 8, 4] = nextP[index, 4, 8]
+        nextP[index, 5, 8] = -PS127*P_8_14 - PS129*P_8_13 + PS131*P_8_15 + PS151*dt[index] + PS88*P_0_8 + PS92*P_3_8 - PS93*P_1_8 + PS94*P_2_8 + P_5_8
+        nextP[index, 8, 5] = nextP[index, 5, 8]
+        nextP[index, 6, 8] = -PS152*P_8_15 - PS154*P_8_14 + PS156*P_8_13 + PS88*P_1_8 - PS92*P_2_8 + PS93*P_0_8 + PS94*P_3_8 + P_6_8 + dt[index]*(-PS152*P_5_15 - PS154*P_5_14 + PS156*P_5_13 + PS88*P_1_5 - PS92*P_2_5 + PS93*P_0_5 + PS94*P_3_5 + P_5_6)
+        nextP[index, 8, 6] = nextP[index, 6, 8]
+        nextP[index, 7, 8] = P_4_8*dt[index] + P_7_8 + dt[index]*(P_4_5*dt[index] + P_5_7)
+        nextP[index, 8, 7] = nextP[index, 7, 8]
+        nextP[index, 8, 8] = P_5_8*dt[index] + P_8_8 + dt[index]*(P_5_5*dt[index] + P_5_8)
+        nextP[index, 0, 9] = -PS11*P_1_9 - PS12*P_2_9 - PS13*P_3_9 + PS157*dt[index] + PS6*P_9_10 + PS7*P_9_11 + PS9*P_9_12 + P_0_9
+        nextP[index, 9, 0] = nextP[index, 0, 9]
+        nextP[index, 1, 9] = PS11*P_0_9 - PS12*P_3_9 + PS13*P_2_9 + PS158*dt[index] - PS34*P_9_10 - PS7*P_9_12 + PS9*P_9_11 + P_1_9
+        nextP[index, 9, 1] = nextP[index, 1, 9]
+        nextP[index, 2, 9] = PS11*P_3_9 + PS12*P_0_9 - PS13*P_1_9 + PS159*dt[index] - PS34*P_9_11 + PS6*P_9_12 - PS9*P_9_10 + P_2_9
+        nextP[index, 9, 2] = nextP[index, 2, 9]
+        nextP[index, 3, 9] = -PS11*P_2_9 + PS12*P_1_9 + PS13*P_0_9 + PS160*dt[index] - PS34*P_9_12 - PS6*P_9_11 + PS7*P_9_10 + P_3_9
+        nextP[index, 9, 3] = nextP[index, 3, 9]
+        nextP[index, 4, 9] = PS162*dt[index] - PS80*P_9_13 - PS84*P_9_15 - PS88*P_3_9 + PS91*P_9_14 + PS92*P_0_9 + PS93*P_2_9 + PS94*P_1_9 + P_4_9
+        nextP[index, 9, 4] = nextP[index, 4, 9]
+        nextP[index, 5, 9] = -PS127*P_9_14 - PS129*P_9_13 + PS131*P_9_15 + PS163*dt[index] + PS88*P_0_9 + PS92*P_3_9 - PS93*P_1_9 + PS94*P_2_9 + P_5_9
+        nextP[index, 9, 5] = nextP[index, 5, 9]
+        nextP[index, 6, 9] = -PS152*P_9_15 - PS154*P_9_14 + PS156*P_9_13 + PS167*dt[index] + PS88*P_1_9 - PS92*P_2_9 + PS93*P_0_9 + PS94*P_3_9 + P_6_9
+        nextP[index, 9, 6] = nextP[index, 6, 9]
+        nextP[index, 7, 9] = P_4_9*dt[index] + P_7_9 + dt[index]*(P_4_6*dt[index] + P_6_7)
+        nextP[index, 9, 7] = nextP[index, 7, 9]
+        nextP[index, 8, 9] = P_5_9*dt[index] + P_8_9 + dt[index]*(P_5_6*dt[index] + P_6_8)
+        nextP[index, 9, 8] = nextP[index, 8, 9]
+        nextP[index, 9, 9] = P_6_9*dt[index] + P_9_9 + dt[index]*(P_6_6*dt[index] + P_6_9)
+        nextP[index, 0, 10] = PS14
+        nextP[index, 10, 0] = nextP[index, 0, 10]
+        nextP[index, 1, 10] = PS47
+        nextP[index, 10, 1] = nextP[index, 1, 10]
+        nextP[index, 2, 10] = PS66
+        nextP[index, 10, 2] = nextP[index, 2, 10]
+        nextP[index, 3, 10] = PS71
+        nextP[index, 10, 3] = nextP[index, 3, 10]
+        nextP[index, 4, 10] = -PS80*P_10_13 - PS84*P_10_15 - PS88*P_3_10 + PS91*P_10_14 + PS92*P_0_10 + PS93*P_2_10 + PS94*P_1_10 + P_4_10
+        nextP[index, 10, 4] = nextP[index, 4, 10]
+        nextP[index, 5, 10] = -PS127*P_10_14 - PS129*P_10_13 + PS131*P_10_15 + PS88*P_0_10 + PS92*P_3_10 - PS93*P_1_10 + PS94*P_2_10 + P_5_10
+        nextP[index, 10, 5] = nextP[index, 5, 10]
+        nextP[index, 6, 10] = -PS152*P_10_15 - PS154*P_10_14 + PS156*P_10_13 + PS88*P_1_10 - PS92*P_2_10 + PS93*P_0_10 + PS94*P_3_10 + P_6_10
+        nextP[index, 10, 6] = nextP[index, 6, 10]
+        nextP[index, 7, 10] = P_4_10*dt[index] + P_7_10
+        nextP[index, 10, 7] = nextP[index, 7, 10]
+        nextP[index, 8, 10] = P_5_10*dt[index] + P_8_10
+        nextP[index, 10, 8] = nextP[index, 8, 10]
+        nextP[index, 9, 10] = P_6_10*dt[index] + P_9_10
+        nextP[index, 10, 9] = nextP[index, 9, 10]
+        nextP[index, 10, 10] = P_10_10
+        nextP[index, 0, 11] = PS17
+        nextP[index, 11, 0] = nextP[index, 0, 11]
+        nextP[index, 1, 11] = PS39
+        nextP[index, 11, 1] = nextP[index, 1, 11]
+        nextP[index, 2, 11] = PS65
+        nextP[index, 11, 2] = nextP[index, 2, 11]
+        nextP[index, 3, 11] = PS75
+        nextP[index, 11, 3] = nextP[index, 3, 11]
+        nextP[index, 4, 11] = -PS80*P_11_13 - PS84*P_11_15 - PS88*P_3_11 + PS91*P_11_14 + PS92*P_0_11 + PS93*P_2_11 + PS94*P_1_11 + P_4_11
+        nextP[index, 11, 4] = nextP[index, 4, 11]
+        nextP[index, 5, 11] = -PS127*P_11_14 - PS129*P_11_13 + PS131*P_11_15 + PS88*P_0_11 + PS92*P_3_11 - PS93*P_1_11 + PS94*P_2_11 + P_5_11
+        nextP[index, 11, 5] = nextP[index, 5, 11]
+        nextP[index, 6, 11] = -PS152*P_11_15 - PS154*P_11_14 + PS156*P_11_13 + PS88*P_1_11 - PS92*P_2_11 + PS93*P_0_11 + PS94*P_3_11 + P_6_11
+        nextP[index, 11, 6] = nextP[index, 6, 11]
+        nextP[index, 7, 11] = P_4_11*dt[index] + P_7_11
+        nextP[index, 11, 7] = nextP[index, 7, 11]
+        nextP[index, 8, 11] = P_5_11*dt[index] + P_8_11
+        nextP[index, 11, 8] = nextP[index, 8, 11]
+        nextP[index, 9, 11] = P_6_11*dt[index] + P_9_11
+        nextP[index, 11, 9] = nextP[index, 9, 11]
+        nextP[index, 10, 11] = P_10_11
+        nextP[index, 11, 10] = nextP[index, 10, 11]
+        nextP[index, 11, 11] = P_11_11
+        nextP[index, 0, 12] = PS20
+        nextP[index, 12, 0] = nextP[index, 0, 12]
+        nextP[index, 1, 12] = PS49
+        nextP[index, 12, 1] = nextP[index, 1, 12]
+        nextP[index, 2, 12] = PS60
+        nextP[index, 12, 2] = nextP[index, 2, 12]
+        nextP[index, 3, 12] = PS74
+        nextP[index, 12, 3] = nextP[index, 3, 12]
+        nextP[index, 4, 12] = -PS80*P_12_13 - PS84*P_12_15 - PS88*P_3_12 + PS91*P_12_14 + PS92*P_0_12 + PS93*P_2_12 + PS94*P_1_12 + P_4_12
+        nextP[index, 12, 4] = nextP[index, 4, 12]
+        nextP[index, 5, 12] = -PS127*P_12_14 - PS129*P_12_13 + PS131*P_12_15 + PS88*P_0_12 + PS92*P_3_12 - PS93*P_1_12 + PS94*P_2_12 + P_5_12
+        nextP[index, 12, 5] = nextP[index, 5, 12]
+        nextP[index, 6, 12] = -PS152*P_12_15 - PS154*P_12_14 + PS156*P_12_13 + PS88*P_1_12 - PS92*P_2_12 + PS93*P_0_12 + PS94*P_3_12 + P_6_12
+        nextP[index, 12, 6] = nextP[index, 6, 12]
+        nextP[index, 7, 12] = P_4_12*dt[index] + P_7_12
+        nextP[index, 12, 7] = nextP[index, 7, 12]
+        nextP[index, 8, 12] = P_5_12*dt[index] + P_8_12
+        nextP[index, 12, 8] = nextP[index, 8, 12]
+        nextP[index, 9, 12] = P_6_12*dt[index] + P_9_12
+        nextP[index, 12, 9] = nextP[index, 9, 12]
+        nextP[index, 10, 12] = P_10_12
+        nextP[index, 12, 10] = nextP[index, 10, 12]
+        nextP[index, 11, 12] = P_11_12
+        nextP[index, 12, 11] = nextP[index, 11, 12]
+        nextP[index, 12, 12] = P_12_12
+        nextP[index, 0, 13] = PS81
+        nextP[index, 13, 0] = nextP[index, 0, 13]
+        nextP[index, 1, 13] = PS96
+        nextP[index, 13, 1] = nextP[index, 1, 13]
+        nextP[index, 2, 13] = PS100
+        nextP[index, 13, 2] = nextP[index, 2, 13]
+        nextP[index, 3, 13] = PS104
+        nextP[index, 13, 3] = nextP[index, 3, 13]
+        nextP[index, 4, 13] = PS108
+        nextP[index, 13, 4] = nextP[index, 4, 13]
+        nextP[index, 5, 13] = PS140
+        nextP[index, 13, 5] = nextP[index, 5, 13]
+        nextP[index, 6, 13] = PS166
+        nextP[index, 13, 6] = nextP[index, 6, 13]
+        nextP[index, 7, 13] = P_4_13*dt[index] + P_7_13
+        nextP[index, 13, 7] = nextP[index, 7, 13]
+        nextP[index, 8, 13] = P_5_13*dt[index] + P_8_13
+        nextP[index, 13, 8] = nextP[index, 8, 13]
+        nextP[index, 9, 13] = P_6_13*dt[index] + P_9_13
+        nextP[index, 13, 9] = nextP[index, 9, 13]
+        nextP[index, 10, 13] = P_10_13
+        nextP[index, 13, 10] = nextP[index, 10, 13]
+        nextP[index, 11, 13] = P_11_13
+        nextP[index, 13, 11] = nextP[index, 11, 13]
+        nextP[index, 12, 13] = P_12_13
+        nextP[index, 13, 12] = nextP[index, 12, 13]
+        nextP[index, 13, 13] = P_13_13
+        nextP[index, 0, 14] = PS89
+        nextP[index, 14, 0] = nextP[index, 0, 14]
+        nextP[index, 1, 14] = PS98
+        nextP[index, 14, 1] = nextP[index, 1, 14]
+        nextP[index, 2, 14] = PS102
+        nextP[index, 14, 2] = nextP[index, 2, 14]
+        nextP[index, 3, 14] = PS106
+        nextP[index, 14, 3] = nextP[index, 3, 14]
+        nextP[index, 4, 14] = PS113
+        nextP[index, 14, 4] = nextP[index, 4, 14]
+        nextP[index, 5, 14] = PS139
+        nextP[index, 14, 5] = nextP[index, 5, 14]
+        nextP[index, 6, 14] = PS165
+        nextP[index, 14, 6] = nextP[index, 6, 14]
+        nextP[index, 7, 14] = P_4_14*dt[index] + P_7_14
+        nextP[index, 14, 7] = nextP[index, 7, 14]
+        nextP[index, 8, 14] = P_5_14*dt[index] + P_8_14
+        nextP[index, 14, 8] = nextP[index, 8, 14]
+        nextP[index, 9, 14] = P_6_14*dt[index] + P_9_14
+        nextP[index, 14, 9] = nextP[index, 9, 14]
+        nextP[index, 10, 14] = P_10_14
+        nextP[index, 14, 10] = nextP[index, 10, 14]
+        nextP[index, 11, 14] = P_11_14
+        nextP[index, 14, 11] = nextP[index, 11, 14]
+        nextP[index, 12, 14] = P_12_14
+        nextP[index, 14, 12] = nextP[index, 12, 14]
+        nextP[index, 13, 14] = P_13_14
+        nextP[index, 14, 13] = nextP[index, 13, 14]
+        nextP[index, 14, 14] = P_14_14
+        nextP[index, 0, 15] = PS82
+        nextP[index, 15, 0] = nextP[index, 0, 15]
+        nextP[index, 1, 15] = PS97
+        nextP[index, 15, 1] = nextP[index, 1, 15]
+        nextP[index, 2, 15] = PS101
+        nextP[index, 15, 2] = nextP[index, 2, 15]
+        nextP[index, 3, 15] = PS105
+        nextP[index, 15, 3] = nextP[index, 3, 15]
+        nextP[index, 4, 15] = PS109
+        nextP[index, 15, 4] = nextP[index, 4, 15]
+        nextP[index, 5, 15] = PS143
+        nextP[index, 15, 5] = nextP[index, 5, 15]
+        nextP[index, 6, 15] = PS164
+        nextP[index, 15, 6] = nextP[index, 6, 15]
+        nextP[index, 7, 15] = P_4_15*dt[index] + P_7_15
+        nextP[index, 15, 7] = nextP[index, 7, 15]
+        nextP[index, 8, 15] = P_5_15*dt[index] + P_8_15
+        nextP[index, 15, 8] = nextP[index, 8, 15]
+        nextP[index, 9, 15] = P_6_15*dt[index] + P_9_15
+        nextP[index, 15, 9] = nextP[index, 9, 15]
+        nextP[index, 10, 15] = P_10_15
+        nextP[index, 15, 10] = nextP[index, 10, 15]
+        nextP[index, 11, 15] = P_11_15
+        nextP[index, 15, 11] = nextP[index, 11, 15]
+        nextP[index, 12, 15] = P_12_15
+        nextP[index, 15, 12] = nextP[index, 12, 15]
+        nextP[index, 13, 15] = P_13_15
+        nextP[index, 15, 13] = nextP[index, 13, 15]
+        nextP[index, 14, 15] = P_14_15
+        nextP[index, 15, 14] = nextP[index, 14, 15]
+        nextP[index, 15, 15] = P_15_15
+        nextP[index, 0, 16] = -PS11*P_1_16 - PS12*P_2_16 - PS13*P_3_16 + PS6*P_10_16 + PS7*P_11_16 + PS9*P_12_16 + P_0_16
+        nextP[index, 16, 0] = nextP[index, 0, 16]
+        nextP[index, 1, 16] = PS11*P_0_16 - PS12*P_3_16 + PS13*P_2_16 - PS34*P_10_16 - PS7*P_12_16 + PS9*P_11_16 + P_1_16
+        nextP[index, 16, 1] = nextP[index, 1, 16]
+        nextP[index, 2, 16] = PS11*P_3_16 + PS12*P_0_16 - PS13*P_1_16 - PS34*P_11_16 + PS6*P_12_16 - PS9*P_10_16 + P_2_16
+        nextP[index, 16, 2] = nextP[index, 2, 16]
+        nextP[index, 3, 16] = -PS11*P_2_16 + PS12*P_1_16 + PS13*P_0_16 - PS34*P_12_16 - PS6*P_11_16 + PS7*P_10_16 + P_3_16
+        nextP[index, 16, 3] = nextP[index, 3, 16]
+        nextP[index, 4, 16] = -PS80*P_13_16 - PS84*P_15_16 - PS88*P_3_16 + PS91*P_14_16 + PS92*P_0_16 + PS93*P_2_16 + PS94*P_1_16 + P_4_16
+        nextP[index, 16, 4] = nextP[index, 4, 16]
+        nextP[index, 5, 16] = -PS127*P_14_16 - PS129*P_13_16 + PS131*P_15_16 + PS88*P_0_16 + PS92*P_3_16 - PS93*P_1_16 + PS94*P_2_16 + P_5_16
+        nextP[index, 16, 5] = nextP[index, 5, 16]
+        nextP[index, 6, 16] = -PS152*P_15_16 - PS154*P_14_16 + PS156*P_13_16 + PS88*P_1_16 - PS92*P_2_16 + PS93*P_0_16 + PS94*P_3_16 + P_6_16
+        nextP[index, 16, 6] = nextP[index, 6, 16]
+        nextP[index, 7, 16] = P_4_16*dt[index] + P_7_16
+        nextP[index, 16, 7] = nextP[index, 7, 16]
+        nextP[index, 8, 16] = P_5_16*dt[index] + P_8_16
+        nextP[index, 16, 8] = nextP[index, 8, 16]
+        nextP[index, 9, 16] = P_6_16*dt[index] + P_9_16
+        nextP[index, 16, 9] = nextP[index, 9, 16]
+        nextP[index, 10, 16] = P_10_16
+        nextP[index, 16, 10] = nextP[index, 10, 16]
+        nextP[index, 11, 16] = P_11_16
+        nextP[index, 16, 11] = nextP[index, 11, 16]
+        nextP[index, 12, 16] = P_12_16
+        nextP[index, 16, 12] = nextP[index, 12, 16]
+        nextP[index, 13, 16] = P_13_16
+        nextP[index, 16, 13] = nextP[index, 13, 16]
+        nextP[index, 14, 16] = P_14_16
+        nextP[index, 16, 14] = nextP[index, 14, 16]
+        nextP[index, 15, 16] = P_15_16
+        nextP[index, 16, 15] = nextP[index, 15, 16]
+        nextP[index, 16, 16] = P_16_16
+        nextP[index, 0, 17] = -PS11*P_1_17 - PS12*P_2_17 - PS13*P_3_17 + PS6*P_10_17 + PS7*P_11_17 + PS9*P_12_17 + P_0_17
+        nextP[index, 17, 0] = nextP[index, 0, 17]
+        nextP[index, 1, 17] = PS11*P_0_17 - PS12*P_3_17 + PS13*P_2_17 - PS34*P_10_17 - PS7*P_12_17 + PS9*P_11_17 + P_1_17
+        nextP[index, 17, 1] = nextP[index, 1, 17]
+        nextP[index, 2, 17] = PS11*P_3_17 + PS12*P_0_17 - PS13*P_1_17 - PS34*P_11_17 + PS6*P_12_17 - PS9*P_10_17 + P_2_17
+        nextP[index, 17, 2] = nextP[index, 2, 17]
+        nextP[index, 3, 17] = -PS11*P_2_17 + PS12*P_1_17 + PS13*P_0_17 - PS34*P_12_17 - PS6*P_11_17 + PS7*P_10_17 + P_3_17
+        nextP[index, 17, 3] = nextP[index, 3, 17]
+        nextP[index, 4, 17] = -PS80*P_13_17 - PS84*P_15_17 - PS88*P_3_17 + PS91*P_14_17 + PS92*P_0_17 + PS93*P_2_17 + PS94*P_1_17 + P_4_17
+        nextP[index, 17, 4] = nextP[index, 4, 17]
+        nextP[index, 5, 17] = -PS127*P_14_17 - PS129*P_13_17 + PS131*P_15_17 + PS88*P_0_17 + PS92*P_3_17 - PS93*P_1_17 + PS94*P_2_17 + P_5_17
+        nextP[index, 17, 5] = nextP[index, 5, 17]
+        nextP[index, 6, 17] = -PS152*P_15_17 - PS154*P_14_17 + PS156*P_13_17 + PS88*P_1_17 - PS92*P_2_17 + PS93*P_0_17 + PS94*P_3_17 + P_6_17
+        nextP[index, 17, 6] = nextP[index, 6, 17]
+        nextP[index, 7, 17] = P_4_17*dt[index] + P_7_17
+        nextP[index, 17, 7] = nextP[index, 7, 17]
+        nextP[index, 8, 17] = P_5_17*dt[index] + P_8_17
+        nextP[index, 17, 8] = nextP[index, 8, 17]
+        nextP[index, 9, 17] = P_6_17*dt[index] + P_9_17
+        nextP[index, 17, 9] = nextP[index, 9, 17]
+        nextP[index, 10, 17] = P_10_17
+        nextP[index, 17, 10] = nextP[index, 10, 17]
+        nextP[index, 11, 17] = P_11_17
+        nextP[index, 17, 11] = nextP[index, 11, 17]
+        nextP[index, 12, 17] = P_12_17
+        nextP[index, 17, 12] = nextP[index, 12, 17]
+        nextP[index, 13, 17] = P_13_17
+        nextP[index, 17, 13] = nextP[index, 13, 17]
+        nextP[index, 14, 17] = P_14_17
+        nextP[index, 17, 14] = nextP[index, 14, 17]
+        nextP[index, 15, 17] = P_15_17
+        nextP[index, 17, 15] = nextP[index, 15, 17]
+        nextP[index, 16, 17] = P_16_17
+        nextP[index, 17, 16] = nextP[index, 16, 17]
+        nextP[index, 17, 17] = P_17_17
+        nextP[index, 0, 18] = -PS11*P_1_18 - PS12*P_2_18 - PS13*P_3_18 + PS6*P_10_18 + PS7*P_11_18 + PS9*P_12_18 + P_0_18
+        nextP[index, 18, 0] = nextP[index, 0, 18]
+        nextP[index, 1, 18] = PS11*P_0_18 - PS12*P_3_18 + PS13*P_2_18 - PS34*P_10_18 - PS7*P_12_18 + PS9*P_11_18 + P_1_18
+        nextP[index, 18, 1] = nextP[index, 1, 18]
+        nextP[index, 2, 18] = PS11*P_3_18 + PS12*P_0_18 - PS13*P_1_18 - PS34*P_11_18 + PS6*P_12_18 - PS9*P_10_18 + P_2_18
+        nextP[index, 18, 2] = nextP[index, 2, 18]
+        nextP[index, 3, 18] = -PS11*P_2_18 + PS12*P_1_18 + PS13*P_0_18 - PS34*P_12_18 - PS6*P_11_18 + PS7*P_10_18 + P_3_18
+        nextP[index, 18, 3] = nextP[index, 3, 18]
+        nextP[index, 4, 18] = -PS80*P_13_18 - PS84*P_15_18 - PS88*P_3_18 + PS91*P_14_18 + PS92*P_0_18 + PS93*P_2_18 + PS94*P_1_18 + P_4_18
+        nextP[index, 18, 4] = nextP[index, 4, 18]
+        nextP[index, 5, 18] = -PS127*P_14_18 - PS129*P_13_18 + PS131*P_15_18 + PS88*P_0_18 + PS92*P_3_18 - PS93*P_1_18 + PS94*P_2_18 + P_5_18
+        nextP[index, 18, 5] = nextP[index, 5, 18]
+        nextP[index, 6, 18] = -PS152*P_15_18 - PS154*P_14_18 + PS156*P_13_18 + PS88*P_1_18 - PS92*P_2_18 + PS93*P_0_18 + PS94*P_3_18 + P_6_18
+        nextP[index, 18, 6] = nextP[index, 6, 18]
+        nextP[index, 7, 18] = P_4_18*dt[index] + P_7_18
+        nextP[index, 18, 7] = nextP[index, 7, 18]
+        nextP[index, 8, 18] = P_5_18*dt[index] + P_8_18
+        nextP[index, 18, 8] = nextP[index, 8, 18]
+        nextP[index, 9, 18] = P_6_18*dt[index] + P_9_18
+        nextP[index, 18, 9] = nextP[index, 9, 18]
+        nextP[index, 10, 18] = P_10_18
+        nextP[index, 18, 10] = nextP[index, 10, 18]
+        nextP[index, 11, 18] = P_11_18
+        nextP[index, 18, 11] = nextP[index, 11, 18]
+        nextP[index, 12, 18] = P_12_18
+        nextP[index, 18, 12] = nextP[index, 12, 18]
+        nextP[index, 13, 18] = P_13_18
+        nextP[index, 18, 13] = nextP[index, 13, 18]
+        nextP[index, 14, 18] = P_14_18
+        nextP[index, 18, 14] = nextP[index, 14, 18]
+        nextP[index, 15, 18] = P_15_18
+        nextP[index, 18, 15] = nextP[index, 15, 18]
+        nextP[index, 16, 18] = P_16_18
+        nextP[index, 18, 16] = nextP[index, 16, 18]
+        nextP[index, 17, 18] = P_17_18
+        nextP[index, 18, 17] = nextP[index, 17, 18]
+        nextP[index, 18, 18] = P_18_18
+        nextP[index, 0, 19] = -PS11*P_1_19 - PS12*P_2_19 - PS13*P_3_19 + PS6*P_10_19 + PS7*P_11_19 + PS9*P_12_19 + P_0_19
+        nextP[index, 19, 0] = nextP[index, 0, 19]
+        nextP[index, 1, 19] = PS11*P_0_19 - PS12*P_3_19 + PS13*P_2_19 - PS34*P_10_19 - PS7*P_12_19 + PS9*P_11_19 + P_1_19
+        nextP[index, 19, 1] = nextP[index, 1, 19]
+        nextP[index, 2, 19] = PS11*P_3_19 + PS12*P_0_19 - PS13*P_1_19 - PS34*P_11_19 + PS6*P_12_19 - PS9*P_10_19 + P_2_19
+        nextP[index, 19, 2] = nextP[index, 2, 19]
+        nextP[index, 3, 19] = -PS11*P_2_19 + PS12*P_1_19 + PS13*P_0_19 - PS34*P_12_19 - PS6*P_11_19 + PS7*P_10_19 + P_3_19
+        nextP[index, 19, 3] = nextP[index, 3, 19]
+        nextP[index, 4, 19] = -PS80*P_13_19 - PS84*P_15_19 - PS88*P_3_19 + PS91*P_14_19 + PS92*P_0_19 + PS93*P_2_19 + PS94*P_1_19 + P_4_19
+        nextP[index, 19, 4] = nextP[index, 4, 19]
+        nextP[index, 5, 19] = -PS127*P_14_19 - PS129*P_13_19 + PS131*P_15_19 + PS88*P_0_19 + PS92*P_3_19 - PS93*P_1_19 + PS94*P_2_19 + P_5_19
+        nextP[index, 19, 5] = nextP[index, 5, 19]
+        nextP[index, 6, 19] = -PS152*P_15_19 - PS154*P_14_19 + PS156*P_13_19 + PS88*P_1_19 - PS92*P_2_19 + PS93*P_0_19 + PS94*P_3_19 + P_6_19
+        nextP[index, 19, 6] = nextP[index, 6, 19]
+        nextP[index, 7, 19] = P_4_19*dt[index] + P_7_19
+        nextP[index, 19, 7] = nextP[index, 7, 19]
+        nextP[index, 8, 19] = P_5_19*dt[index] + P_8_19
+        nextP[index, 19, 8] = nextP[index, 8, 19]
+        nextP[index, 9, 19] = P_6_19*dt[index] + P_9_19
+        nextP[index, 19, 9] = nextP[index, 9, 19]
+        nextP[index, 10, 19] = P_10_19
+        nextP[index, 19, 10] = nextP[index, 10, 19]
+        nextP[index, 11, 19] = P_11_19
+        nextP[index, 19, 11] = nextP[index, 11, 19]
+        nextP[index, 12, 19] = P_12_19
+        nextP[index, 19, 12] = nextP[index, 12, 19]
+        nextP[index, 13, 19] = P_13_19
+        nextP[index, 19, 13] = nextP[index, 13, 19]
+        nextP[index, 14, 19] = P_14_19
+        nextP[index, 19, 14] = nextP[index, 14, 19]
+        nextP[index, 15, 19] = P_15_19
+        nextP[index, 19, 15] = nextP[index, 15, 19]
+        nextP[index, 16, 19] = P_16_19
+        nextP[index, 19, 16] = nextP[index, 16, 19]
+        nextP[index, 17, 19] = P_17_19
+        nextP[index, 19, 17] = nextP[index, 17, 19]
+        nextP[index, 18, 19] = P_18_19
+        nextP[index, 19, 18] = nextP[index, 18, 19]
+        nextP[index, 19, 19] = P_19_19
+        nextP[index, 0, 20] = -PS11*P_1_20 - PS12*P_2_20 - PS13*P_3_20 + PS6*P_10_20 + PS7*P_11_20 + PS9*P_12_20 + P_0_20
+        nextP[index, 20, 0] = nextP[index, 0, 20]
+        nextP[index, 1, 20] = PS11*P_0_20 - PS12*P_3_20 + PS13*P_2_20 - PS34*P_10_20 - PS7*P_12_20 + PS9*P_11_20 + P_1_20
+        nextP[index, 20, 1] = nextP[index, 1, 20]
+        nextP[index, 2, 20] = PS11*P_3_20 + PS12*P_0_20 - PS13*P_1_20 - PS34*P_11_20 + PS6*P_12_20 - PS9*P_10_20 + P_2_20
+        nextP[index, 20, 2] = nextP[index, 2, 20]
+        nextP[index, 3, 20] = -PS11*P_2_20 + PS12*P_1_20 + PS13*P_0_20 - PS34*P_12_20 - PS6*P_11_20 + PS7*P_10_20 + P_3_20
+        nextP[index, 20, 3] = nextP[index, 3, 20]
+        nextP[index, 4, 20] = -PS80*P_13_20 - PS84*P_15_20 - PS88*P_3_20 + PS91*P_14_20 + PS92*P_0_20 + PS93*P_2_20 + PS94*P_1_20 + P_4_20
+        nextP[index, 20, 4] = nextP[index, 4, 20]
+        nextP[index, 5, 20] = -PS127*P_14_20 - PS129*P_13_20 + PS131*P_15_20 + PS88*P_0_20 + PS92*P_3_20 - PS93*P_1_20 + PS94*P_2_20 + P_5_20
+        nextP[index, 20, 5] = nextP[index, 5, 20]
+        nextP[index, 6, 20] = -PS152*P_15_20 - PS154*P_14_20 + PS156*P_13_20 + PS88*P_1_20 - PS92*P_2_20 + PS93*P_0_20 + PS94*P_3_20 + P_6_20
+        nextP[index, 20, 6] = nextP[index, 6, 20]
+        nextP[index, 7, 20] = P_4_20*dt[index] + P_7_20
+        nextP[index, 20, 7] = nextP[index, 7, 20]
+        nextP[index, 8, 20] = P_5_20*dt[index] + P_8_20
+        nextP[index, 20, 8] = nextP[index, 8, 20]
+        nextP[index, 9, 20] = P_6_20*dt[index] + P_9_20
+        nextP[index, 20, 9] = nextP[index, 9, 20]
+        nextP[index, 10, 20] = P_10_20
+        nextP[index, 20, 10] = nextP[index, 10, 20]
+        nextP[index, 11, 20] = P_11_20
+        nextP[index, 20, 11] = nextP[index, 11, 20]
+        nextP[index, 12, 20] = P_12_20
+        nextP[index, 20, 12] = nextP[index, 12, 20]
+        nextP[index, 13, 20] = P_13_20
+        nextP[index, 20, 13] = nextP[index, 13, 20]
+        nextP[index, 14, 20] = P_14_20
+        nextP[index, 20, 14] = nextP[index, 14, 20]
+        nextP[index, 15, 20] = P_15_20
+        nextP[index, 20, 15] = nextP[index, 15, 20]
+        nextP[index, 16, 20] = P_16_20
+        nextP[index, 20, 16] = nextP[index, 16, 20]
+        nextP[index, 17, 20] = P_17_20
+        nextP[index, 20, 17] = nextP[index, 17, 20]
+        nextP[index, 18, 20] = P_18_20
+        nextP[index, 20, 18] = nextP[index, 18, 20]
+        nextP[index, 19, 20] = P_19_20
+        nextP[index, 20, 19] = nextP[index, 19, 20]
+        nextP[index, 20, 20] = P_20_20
+        nextP[index, 0, 21] = -PS11*P_1_21 - PS12*P_2_21 - PS13*P_3_21 + PS6*P_10_21 + PS7*P_11_21 + PS9*P_12_21 + P_0_21
+        nextP[index, 21, 0] = nextP[index, 0, 21]
+        nextP[index, 1, 21] = PS11*P_0_21 - PS12*P_3_21 + PS13*P_2_21 - PS34*P_10_21 - PS7*P_12_21 + PS9*P_11_21 + P_1_21
+        nextP[index, 21, 1] = nextP[index, 1, 21]
+        nextP[index, 2, 21] = PS11*P_3_21 + PS12*P_0_21 - PS13*P_1_21 - PS34*P_11_21 + PS6*P_12_21 - PS9*P_10_21 + P_2_21
+        nextP[index, 21, 2] = nextP[index, 2, 21]
+        nextP[index, 3, 21] = -PS11*P_2_21 + PS12*P_1_21 + PS13*P_0_21 - PS34*P_12_21 - PS6*P_11_21 + PS7*P_10_21 + P_3_21
+        nextP[index, 21, 3] = nextP[index, 3, 21]
+        nextP[index, 4, 21] = -PS80*P_13_21 - PS84*P_15_21 - PS88*P_3_21 + PS91*P_14_21 + PS92*P_0_21 + PS93*P_2_21 + PS94*P_1_21 + P_4_21
+        nextP[index, 21, 4] = nextP[index, 4, 21]
+        nextP[index, 5, 21] = -PS127*P_14_21 - PS129*P_13_21 + PS131*P_15_21 + PS88*P_0_21 + PS92*P_3_21 - PS93*P_1_21 + PS94*P_2_21 + P_5_21
+        nextP[index, 21, 5] = nextP[index, 5, 21]
+        nextP[index, 6, 21] = -PS152*P_15_21 - PS154*P_14_21 + PS156*P_13_21 + PS88*P_1_21 - PS92*P_2_21 + PS93*P_0_21 + PS94*P_3_21 + P_6_21
+        nextP[index, 21, 6] = nextP[index, 6, 21]
+        nextP[index, 7, 21] = P_4_21*dt[index] + P_7_21
+        nextP[index, 21, 7] = nextP[index, 7, 21]
+        nextP[index, 8, 21] = P_5_21*dt[index] + P_8_21
+        nextP[index, 21, 8] = nextP[index, 8, 21]
+        nextP[index, 9, 21] = P_6_21*dt[index] + P_9_21
+        nextP[index, 21, 9] = nextP[index, 9, 21]
+        nextP[index, 10, 21] = P_10_21
+        nextP[index, 21, 10] = nextP[index, 10, 21]
+        nextP[index, 11, 21] = P_11_21
+        nextP[index, 21, 11] = nextP[index, 11, 21]
+        nextP[index, 12, 21] = P_12_21
+        nextP[index, 21, 12] = nextP[index, 12, 21]
+        nextP[index, 13, 21] = P_13_21
+        nextP[index, 21, 13] = nextP[index, 13, 21]
+        nextP[index, 14, 21] = P_14_21
+        nextP[index, 21, 14] = nextP[index, 14, 21]
+        nextP[index, 15, 21] = P_15_21
+        nextP[index, 21, 15] = nextP[index, 15, 21]
+        nextP[index, 16, 21] = P_16_21
+        nextP[index, 21, 16] = nextP[index, 16, 21]
+        nextP[index, 17, 21] = P_17_21
+        nextP[index, 21, 17] = nextP[index, 17, 21]
+        nextP[index, 18, 21] = P_18_21
+        nextP[index, 21, 18] = nextP[index, 18, 21]
+        nextP[index, 19, 21] = P_19_21
+        nextP[index, 21, 19] = nextP[index, 19, 21]
+        nextP[index, 20, 21] = P_20_21
+        nextP[index, 21, 20] = nextP[index, 20, 21]
+        nextP[index, 21, 21] = P_21_21
+        nextP[index, 0, 22] = -PS11*P_1_22 - PS12*P_2_22 - PS13*P_3_22 + PS6*P_10_22 + PS7*P_11_22 + PS9*P_12_22 + P_0_22
+        nextP[index, 22, 0] = nextP[index, 0, 22]
+        nextP[index, 1, 22] = PS11*P_0_22 - PS12*P_3_22 + PS13*P_2_22 - PS34*P_10_22 - PS7*P_12_22 + PS9*P_11_22 + P_1_22
+        nextP[index, 22, 1] = nextP[index, 1, 22]
+        nextP[index, 2, 22] = PS11*P_3_22 + PS12*P_0_22 - PS13*P_1_22 - PS34*P_11_22 + PS6*P_12_22 - PS9*P_10_22 + P_2_22
+        nextP[index, 22, 2] = nextP[index, 2, 22]
+        nextP[index, 3, 22] = -PS11*P_2_22 + PS12*P_1_22 + PS13*P_0_22 - PS34*P_12_22 - PS6*P_11_22 + PS7*P_10_22 + P_3_22
+        nextP[index, 22, 3] = nextP[index, 3, 22]
+        nextP[index, 4, 22] = -PS80*P_13_22 - PS84*P_15_22 - PS88*P_3_22 + PS91*P_14_22 + PS92*P_0_22 + PS93*P_2_22 + PS94*P_1_22 + P_4_22
+        nextP[index, 22, 4] = nextP[index, 4, 22]
+        nextP[index, 5, 22] = -PS127*P_14_22 - PS129*P_13_22 + PS131*P_15_22 + PS88*P_0_22 + PS92*P_3_22 - PS93*P_1_22 + PS94*P_2_22 + P_5_22
+        nextP[index, 22, 5] = nextP[index, 5, 22]
+        nextP[index, 6, 22] = -PS152*P_15_22 - PS154*P_14_22 + PS156*P_13_22 + PS88*P_1_22 - PS92*P_2_22 + PS93*P_0_22 + PS94*P_3_22 + P_6_22
+        nextP[index, 22, 6] = nextP[index, 6, 22]
+        nextP[index, 7, 22] = P_4_22*dt[index] + P_7_22
+        nextP[index, 22, 7] = nextP[index, 7, 22]
+        nextP[index, 8, 22] = P_5_22*dt[index] + P_8_22
+        nextP[index, 22, 8] = nextP[index, 8, 22]
+        nextP[index, 9, 22] = P_6_22*dt[index] + P_9_22
+        nextP[index, 22, 9] = nextP[index, 9, 22]
+        nextP[index, 10, 22] = P_10_22
+        nextP[index, 22, 10] = nextP[index, 10, 22]
+        nextP[index, 11, 22] = P_11_22
+        nextP[index, 22, 11] = nextP[index, 11, 22]
+        nextP[index, 12, 22] = P_12_22
+        nextP[index, 22, 12] = nextP[index, 12, 22]
+        nextP[index, 13, 22] = P_13_22
+        nextP[index, 22, 13] = nextP[index, 13, 22]
+        nextP[index, 14, 22] = P_14_22
+        nextP[index, 22, 14] = nextP[index, 14, 22]
+        nextP[index, 15, 22] = P_15_22
+        nextP[index, 22, 15] = nextP[index, 15, 22]
+        nextP[index, 16, 22] = P_16_22
+        nextP[index, 22, 16] = nextP[index, 16, 22]
+        nextP[index, 17, 22] = P_17_22
+        nextP[index, 22, 17] = nextP[index, 17, 22]
+        nextP[index, 18, 22] = P_18_22
+        nextP[index, 22, 18] = nextP[index, 18, 22]
+        nextP[index, 19, 22] = P_19_22
+        nextP[index, 22, 19] = nextP[index, 19, 22]
+        nextP[index, 20, 22] = P_20_22
+        nextP[index, 22, 20] = nextP[index, 20, 22]
+        nextP[index, 21, 22] = P_21_22
+        nextP[index, 22, 21] = nextP[index, 21, 22]
+        nextP[index, 22, 22] = P_22_22
+        nextP[index, 0, 23] = -PS11*P_1_23 - PS12*P_2_23 - PS13*P_3_23 + PS6*P_10_23 + PS7*P_11_23 + PS9*P_12_23 + P_0_23
+        nextP[index, 23, 0] = nextP[index, 0, 23]
+        nextP[index, 1, 23] = PS11*P_0_23 - PS12*P_3_23 + PS13*P_2_23 - PS34*P_10_23 - PS7*P_12_23 + PS9*P_11_23 + P_1_23
+        nextP[index, 23, 1] = nextP[index, 1, 23]
+        nextP[index, 2, 23] = PS11*P_3_23 + PS12*P_0_23 - PS13*P_1_23 - PS34*P_11_23 + PS6*P_12_23 - PS9*P_10_23 + P_2_23
+        nextP[index, 23, 2] = nextP[index, 2, 23]
+        nextP[index, 3, 23] = -PS11*P_2_23 + PS12*P_1_23 + PS13*P_0_23 - PS34*P_12_23 - PS6*P_11_23 + PS7*P_10_23 + P_3_23
+        nextP[index, 23, 3] = nextP[index, 3, 23]
+        nextP[index, 4, 23] = -PS80*P_13_23 - PS84*P_15_23 - PS88*P_3_23 + PS91*P_14_23 + PS92*P_0_23 + PS93*P_2_23 + PS94*P_1_23 + P_4_23
+        nextP[index, 23, 4] = nextP[index, 4, 23]
+        nextP[index, 5, 23] = -PS127*P_14_23 - PS129*P_13_23 + PS131*P_15_23 + PS88*P_0_23 + PS92*P_3_23 - PS93*P_1_23 + PS94*P_2_23 + P_5_23
+        nextP[index, 23, 5] = nextP[index, 5, 23]
+        nextP[index, 6, 23] = -PS152*P_15_23 - PS154*P_14_23 + PS156*P_13_23 + PS88*P_1_23 - PS92*P_2_23 + PS93*P_0_23 + PS94*P_3_23 + P_6_23
+        nextP[index, 23, 6] = nextP[index, 6, 23]
+        nextP[index, 7, 23] = P_4_23*dt[index] + P_7_23
+        nextP[index, 23, 7] = nextP[index, 7, 23]
+        nextP[index, 8, 23] = P_5_23*dt[index] + P_8_23
+        nextP[index, 23, 8] = nextP[index, 8, 23]
+        nextP[index, 9, 23] = P_6_23*dt[index] + P_9_23
+        nextP[index, 23, 9] = nextP[index, 9, 23]
+        nextP[index, 10, 23] = P_10_23
+        nextP[index, 23, 10] = nextP[index, 10, 23]
+        nextP[index, 11, 23] = P_11_23
+        nextP[index, 23, 11] = nextP[index, 11, 23]
+        nextP[index, 12, 23] = P_12_23
+        nextP[index, 23, 12] = nextP[index, 12, 23]
+        nextP[index, 13, 23] = P_13_23
+        nextP[index, 23, 13] = nextP[index, 13, 23]
+        nextP[index, 14, 23] = P_14_23
+        nextP[index, 23, 14] = nextP[index, 14, 23]
+        nextP[index, 15, 23] = P_15_23
+        nextP[index, 23, 15] = nextP[index, 15, 23]
+        nextP[index, 16, 23] = P_16_23
+        nextP[index, 23, 16] = nextP[index, 16, 23]
+        nextP[index, 17, 23] = P_17_23
+        nextP[index, 23, 17] = nextP[index, 17, 23]
+        nextP[index, 18, 23] = P_18_23
+        nextP[index, 23, 18] = nextP[index, 18, 23]
+        nextP[index, 19, 23] = P_19_23
+        nextP[index, 23, 19] = nextP[index, 19, 23]
+        nextP[index, 20, 23] = P_20_23
+        nextP[index, 23, 20] = nextP[index, 20, 23]
+        nextP[index, 21, 23] = P_21_23
+        nextP[index, 23, 21] = nextP[index, 21, 23]
+        nextP[index, 22, 23] = P_22_23
+        nextP[index, 23, 22] = nextP[index, 22, 23]
+        nextP[index, 23, 23] = P_23_23
+    return nextP
+
+# tas observation Jacobian and Kalman gain
+def fuse_tas(states, P, R_TAS):
+    vn = states[..., 4]
+    ve = states[..., 5]
+    vd = states[..., 6]
+    vwn = states[..., 22]
+    vwe = states[..., 23]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    P_4_4 = P[..., 4, 4]
+    P_4_5 = P[..., 4, 5]
+    P_4_6 = P[..., 4, 6]
+    P_4_7 = P[..., 4, 7]
+    P_4_8 = P[..., 4, 8]
+    P_4_9 = P[..., 4, 9]
+    P_4_10 = P[..., 4, 10]
+    P_4_11 = P[..., 4, 11]
+    P_4_12 = P[..., 4, 12]
+    P_4_13 = P[..., 4, 13]
+    P_4_14 = P[..., 4, 14]
+    P_4_15 = P[..., 4, 15]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_4_18 = P[..., 4, 18]
+    P_4_19 = P[..., 4, 19]
+    P_4_20 = P[..., 4, 20]
+    P_4_21 = P[..., 4, 21]
+    P_4_22 = P[..., 4, 22]
+    P_4_23 = P[..., 4, 23]
+    P_5_5 = P[..., 5, 5]
+    P_5_6 = P[..., 5, 6]
+    P_5_7 = P[..., 5, 7]
+    P_5_8 = P[..., 5, 8]
+    P_5_9 = P[..., 5, 9]
+    P_5_10 = P[..., 5, 10]
+    P_5_11 = P[..., 5, 11]
+    P_5_12 = P[..., 5, 12]
+    P_5_13 = P[..., 5, 13]
+    P_5_14 = P[..., 5, 14]
+    P_5_15 = P[..., 5, 15]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_5_18 = P[..., 5, 18]
+    P_5_19 = P[..., 5, 19]
+    P_5_20 = P[..., 5, 20]
+    P_5_21 = P[..., 5, 21]
+    P_5_22 = P[..., 5, 22]
+    P_5_23 = P[..., 5, 23]
+    P_6_6 = P[..., 6, 6]
+    P_6_7 = P[..., 6, 7]
+    P_6_8 = P[..., 6, 8]
+    P_6_9 = P[..., 6, 9]
+    P_6_10 = P[..., 6, 10]
+    P_6_11 = P[..., 6, 11]
+    P_6_12 = P[..., 6, 12]
+    P_6_13 = P[..., 6, 13]
+    P_6_14 = P[..., 6, 14]
+    P_6_15 = P[..., 6, 15]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_6_18 = P[..., 6, 18]
+    P_6_19 = P[..., 6, 19]
+    P_6_20 = P[..., 6, 20]
+    P_6_21 = P[..., 6, 21]
+    P_6_22 = P[..., 6, 22]
+    P_6_23 = P[..., 6, 23]
+    P_7_22 = P[..., 7, 22]
+    P_7_23 = P[..., 7, 23]
+    P_8_22 = P[..., 8, 22]
+    P_8_23 = P[..., 8, 23]
+    P_9_22 = P[..., 9, 22]
+    P_9_23 = P[..., 9, 23]
+    P_10_22 = P[..., 10, 22]
+    P_10_23 = P[..., 10, 23]
+    P_11_22 = P[..., 11, 22]
+    P_11_23 = P[..., 11, 23]
+    P_12_22 = P[..., 12, 22]
+    P_12_23 = P[..., 12, 23]
+    P_13_22 = P[..., 13, 22]
+    P_13_23 = P[..., 13, 23]
+    P_14_22 = P[..., 14, 22]
+    P_14_23 = P[..., 14, 23]
+    P_15_22 = P[..., 15, 22]
+    P_15_23 = P[..., 15, 23]
+    P_16_22 = P[..., 16, 22]
+    P_16_23 = P[..., 16, 23]
+    P_17_22 = P[..., 17, 22]
+    P_17_23 = P[..., 17, 23]
+    P_18_22 = P[..., 18, 22]
+    P_18_23 = P[..., 18, 23]
+    P_19_22 = P[..., 19, 22]
+    P_19_23 = P[..., 19, 23]
+    P_20_22 = P[..., 20, 22]
+    P_20_23 = P[..., 20, 23]
+    P_21_22 = P[..., 21, 22]
+    P_21_23 = P[..., 21, 23]
+    P_22_22 = P[..., 22, 22]
+    P_22_23 = P[..., 22, 23]
+    P_23_23 = P[..., 23, 23]
+    HK0 = vn - vwn
+    HK1 = ve - vwe
+    HK2 = HK0**2 + HK1**2 + vd**2
+    HK3 = 1/numpy.sqrt(HK2)
+    HK4 = HK0*HK3
+    HK5 = HK1*HK3
+    HK6 = 1/HK2
+    HK7 = HK0*P_4_6 - HK0*P_6_22 + HK1*P_5_6 - HK1*P_6_23 + P_6_6*vd
+    HK8 = HK1*P_5_23
+    HK9 = HK0*P_4_5 - HK0*P_5_22 + HK1*P_5_5 - HK8 + P_5_6*vd
+    HK10 = HK1*HK6
+    HK11 = HK0*P_4_22
+    HK12 = HK0*P_4_4 - HK1*P_4_23 + HK1*P_4_5 - HK11 + P_4_6*vd
+    HK13 = HK0*HK6
+    HK14 = -HK0*P_22_23 + HK0*P_4_23 - HK1*P_23_23 + HK8 + P_6_23*vd
+    HK15 = -HK0*P_22_22 - HK1*P_22_23 + HK1*P_5_22 + HK11 + P_6_22*vd
+    HK16 = HK3/(-HK10*HK14 + HK10*HK9 + HK12*HK13 - HK13*HK15 + HK6*HK7*vd + R_TAS)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 4] = HK4
+    H[..., 5] = HK5
+    H[..., 6] = HK3*vd
+    H[..., 22] = -HK4
+    H[..., 23] = -HK5
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = HK16*(-HK0*P_0_22 + HK0*P_0_4 - HK1*P_0_23 + HK1*P_0_5 + P_0_6*vd)
+    K[..., 1] = HK16*(-HK0*P_1_22 + HK0*P_1_4 - HK1*P_1_23 + HK1*P_1_5 + P_1_6*vd)
+    K[..., 2] = HK16*(-HK0*P_2_22 + HK0*P_2_4 - HK1*P_2_23 + HK1*P_2_5 + P_2_6*vd)
+    K[..., 3] = HK16*(-HK0*P_3_22 + HK0*P_3_4 - HK1*P_3_23 + HK1*P_3_5 + P_3_6*vd)
+    K[..., 4] = HK12*HK16
+    K[..., 5] = HK16*HK9
+    K[..., 6] = HK16*HK7
+    K[..., 7] = HK16*(HK0*P_4_7 - HK0*P_7_22 + HK1*P_5_7 - HK1*P_7_23 + P_6_7*vd)
+    K[..., 8] = HK16*(HK0*P_4_8 - HK0*P_8_22 + HK1*P_5_8 - HK1*P_8_23 + P_6_8*vd)
+    K[..., 9] = HK16*(HK0*P_4_9 - HK0*P_9_22 + HK1*P_5_9 - HK1*P_9_23 + P_6_9*vd)
+    K[..., 10] = HK16*(-HK0*P_10_22 + HK0*P_4_10 - HK1*P_10_23 + HK1*P_5_10 + P_6_10*vd)
+    K[..., 11] = HK16*(-HK0*P_11_22 + HK0*P_4_11 - HK1*P_11_23 + HK1*P_5_11 + P_6_11*vd)
+    K[..., 12] = HK16*(-HK0*P_12_22 + HK0*P_4_12 - HK1*P_12_23 + HK1*P_5_12 + P_6_12*vd)
+    K[..., 13] = HK16*(-HK0*P_13_22 + HK0*P_4_13 - HK1*P_13_23 + HK1*P_5_13 + P_6_13*vd)
+    K[..., 14] = HK16*(-HK0*P_14_22 + HK0*P_4_14 - HK1*P_14_23 + HK1*P_5_14 + P_6_14*vd)
+    K[..., 15] = HK16*(-HK0*P_15_22 + HK0*P_4_15 - HK1*P_15_23 + HK1*P_5_15 + P_6_15*vd)
+    K[..., 16] = HK16*(-HK0*P_16_22 + HK0*P_4_16 - HK1*P_16_23 + HK1*P_5_16 + P_6_16*vd)
+    K[..., 17] = HK16*(-HK0*P_17_22 + HK0*P_4_17 - HK1*P_17_23 + HK1*P_5_17 + P_6_17*vd)
+    K[..., 18] = HK16*(-HK0*P_18_22 + HK0*P_4_18 - HK1*P_18_23 + HK1*P_5_18 + P_6_18*vd)
+    K[..., 19] = HK16*(-HK0*P_19_22 + HK0*P_4_19 - HK1*P_19_23 + HK1*P_5_19 + P_6_19*vd)
+    K[..., 20] = HK16*(-HK0*P_20_22 + HK0*P_4_20 - HK1*P_20_23 + HK1*P_5_20 + P_6_20*vd)
+    K[..., 21] = HK16*(-HK0*P_21_22 + HK0*P_4_21 - HK1*P_21_23 + HK1*P_5_21 + P_6_21*vd)
+    K[..., 22] = HK15*HK16
+    K[..., 23] = HK14*HK16
+    return H, K
+
+# tas observation Jacobian and Kalman gain, loop over the filters
+def fuse_tas_kernel(states, P, R_TAS):
+    n_filters = P.shape[0]
+    R_TAS = numpy.broadcast_to(numpy.asarray(R_TAS, dtype=numpy.float64), (n_filters,))
+    return _fuse_tas_kernel(states, P, R_TAS)
+
+@jit
+def _fuse_tas_kernel(states, P, R_TAS):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        vn = states[index, 4]
+        ve = states[index, 5]
+        vd = states[index, 6]
+        vwn = states[index, 22]
+        vwe = states[index, 23]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        P_4_4 = P[index, 4, 4]
+        P_4_5 = P[index, 4, 5]
+        P_4_6 = P[index, 4, 6]
+        P_4_7 = P[index, 4, 7]
+        P_4_8 = P[index, 4, 8]
+        P_4_9 = P[index, 4, 9]
+        P_4_10 = P[index, 4, 10]
+        P_4_11 = P[index, 4, 11]
+        P_4_12 = P[index, 4, 12]
+        P_4_13 = P[index, 4, 13]
+        P_4_14 = P[index, 4, 14]
+        P_4_15 = P[index, 4, 15]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_4_18 = P[index, 4, 18]
+        P_4_19 = P[index, 4, 19]
+        P_4_20 = P[index, 4, 20]
+        P_4_21 = P[index, 4, 21]
+        P_4_22 = P[index, 4, 22]
+        P_4_23 = P[index, 4, 23]
+        P_5_5 = P[index, 5, 5]
+        P_5_6 = P[index, 5, 6]
+        P_5_7 = P[index, 5, 7]
+        P_5_8 = P[index, 5, 8]
+        P_5_9 = P[index, 5, 9]
+        P_5_10 = P[index, 5, 10]
+        P_5_11 = P[index, 5, 11]
+        P_5_12 = P[index, 5, 12]
+        P_5_13 = P[index, 5, 13]
+        P_5_14 = P[index, 5, 14]
+        P_5_15 = P[index, 5, 15]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_5_18 = P[index, 5, 18]
+        P_5_19 = P[index, 5, 19]
+        P_5_20 = P[index, 5, 20]
+        P_5_21 = P[index, 5, 21]
+        P_5_22 = P[index, 5, 22]
+        P_5_23 = P[index, 5, 23]
+        P_6_6 = P[index, 6, 6]
+        P_6_7 = P[index, 6, 7]
+        P_6_8 = P[index, 6, 8]
+        P_6_9 = P[index, 6, 9]
+        P_6_10 = P[index, 6, 10]
+        P_6_11 = P[index, 6, 11]
+        P_6_12 = P[index, 6, 12]
+        P_6_13 = P[index, 6, 13]
+        P_6_14 = P[index, 6, 14]
+        P_6_15 = P[index, 6, 15]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_6_18 = P[index, 6, 18]
+        P_6_19 = P[index, 6, 19]
+        P_6_20 = P[index, 6, 20]
+        P_6_21 = P[index, 6, 21]
+        P_6_22 = P[index, 6, 22]
+        P_6_23 = P[index, 6, 23]
+        P_7_22 = P[index, 7, 22]
+        P_7_23 = P[index, 7, 23]
+        P_8_22 = P[index, 8, 22]
+        P_8_23 = P[index, 8, 23]
+        P_9_22 = P[index, 9, 22]
+        P_9_23 = P[index, 9, 23]
+        P_10_22 = P[index, 10, 22]
+        P_10_23 = P[index, 10, 23]
+        P_11_22 = P[index, 11, 22]
+        P_11_23 = P[index, 11, 23]
+        P_12_22 = P[index, 12, 22]
+        P_12_23 = P[index, 12, 23]
+        P_13_22 = P[index, 13, 22]
+        P_13_23 = P[index, 13, 23]
+        P_14_22 = P[index, 14, 22]
+        P_14_23 = P[index, 14, 23]
+        P_15_22 = P[index, 15, 22]
+        P_15_23 = P[index, 15, 23]
+        P_16_22 = P[index, 16, 22]
+        P_16_23 = P[index, 16, 23]
+        P_17_22 = P[index, 17, 22]
+        P_17_23 = P[index, 17, 23]
+        P_18_22 = P[index, 18, 22]
+        P_18_23 = P[index, 18, 23]
+        P_19_22 = P[index, 19, 22]
+        P_19_23 = P[index, 19, 23]
+        P_20_22 = P[index, 20, 22]
+        P_20_23 = P[index, 20, 23]
+        P_21_22 = P[index, 21, 22]
+        P_21_23 = P[index, 21, 23]
+        P_22_22 = P[index, 22, 22]
+        P_22_23 = P[index, 22, 23]
+        P_23_23 = P[index, 23, 23]
+        HK0 = vn - vwn
+        HK1 = ve - vwe
+        HK2 = HK0**2 + HK1**2 + vd**2
+        HK3 = 1/math.sqrt(HK2)
+        HK4 = HK0*HK3
+        HK5 = HK1*HK3
+        HK6 = 1/HK2
+        HK7 = HK0*P_4_6 - HK0*P_6_22 + HK1*P_5_6 - HK1*P_6_23 + P_6_6*vd
+        HK8 = HK1*P_5_23
+        HK9 = HK0*P_4_5 - HK0*P_5_22 + HK1*P_5_5 - HK8 + P_5_6*vd
+        HK10 = HK1*HK6
+        HK11 = HK0*P_4_22
+        HK12 = HK0*P_4_4 - HK1*P_4_23 + HK1*P_4_5 - HK11 + P_4_6*vd
+        HK13 = HK0*HK6
+        HK14 = -HK0*P_22_23 + HK0*P_4_23 - HK1*P_23_23 + HK8 + P_6_23*vd
+        HK15 = -HK0*P_22_22 - HK1*P_22_23 + HK1*P_5_22 + HK11 + P_6_22*vd
+        HK16 = HK3/(-HK10*HK14 + HK10*HK9 + HK12*HK13 - HK13*HK15 + HK6*HK7*vd + R_TAS[index])
+        H[index, 4] = HK4
+        H[index, 5] = HK5
+        H[index, 6] = HK3*vd
+        H[index, 22] = -HK4
+        H[index, 23] = -HK5
+        K[index, 0] = HK16*(-HK0*P_0_22 + HK0*P_0_4 - HK1*P_0_23 + HK1*P_0_5 + P_0_6*vd)
+        K[index, 1] = HK16*(-HK0*P_1_22 + HK0*P_1_4 - HK1*P_1_23 + HK1*P_1_5 + P_1_6*vd)
+        K[index, 2] = HK16*(-HK0*P_2_22 + HK0*P_2_4 - HK1*P_2_23 + HK1*P_2_5 + P_2_6*vd)
+        K[index, 3] = HK16*(-HK0*P_3_22 + HK0*P_3_4 - HK1*P_3_23 + HK1*P_3_5 + P_3_6*vd)
+        K[index, 4] = HK12*HK16
+        K[index, 5] = HK16*HK9
+        K[index, 6] = HK16*HK7
+        K[index, 7] = HK16*(HK0*P_4_7 - HK0*P_7_22 + HK1*P_5_7 - HK1*P_7_23 + P_6_7*vd)
+        K[index, 8] = HK16*(HK0*P_4_8 - HK0*P_8_22 + HK1*P_5_8 - HK1*P_8_23 + P_6_8*vd)
+        K[index, 9] = HK16*(HK0*P_4_9 - HK0*P_9_22 + HK1*P_5_9 - HK1*P_9_23 + P_6_9*vd)
+        K[index, 10] = HK16*(-HK0*P_10_22 + HK0*P_4_10 - HK1*P_10_23 + HK1*P_5_10 + P_6_10*vd)
+        K[index, 11] = HK16*(-HK0*P_11_22 + HK0*P_4_11 - HK1*P_11_23 + HK1*P_5_11 + P_6_11*vd)
+        K[index, 12] = HK16*(-HK0*P_12_22 + HK0*P_4_12 - HK1*P_12_23 + HK1*P_5_12 + P_6_12*vd)
+        K[index, 13] = HK16*(-HK0*P_13_22 + HK0*P_4_13 - HK1*P_13_23 + HK1*P_5_13 + P_6_13*vd)
+        K[index, 14] = HK16*(-HK0*P_14_22 + HK0*P_4_14 - HK1*P_14_23 + HK1*P_5_14 + P_6_14*vd)
+        K[index, 15] = HK16*(-HK0*P_15_22 + HK0*P_4_15 - HK1*P_15_23 + HK1*P_5_15 + P_6_15*vd)
+        K[index, 16] = HK16*(-HK0*P_16_22 + HK0*P_4_16 - HK1*P_16_23 + HK1*P_5_16 + P_6_16*vd)
+        K[index, 17] = HK16*(-HK0*P_17_22 + HK0*P_4_17 - HK1*P_17_23 + HK1*P_5_17 + P_6_17*vd)
+        K[index, 18] = HK16*(-HK0*P_18_22 + HK0*P_4_18 - HK1*P_18_23 + HK1*P_5_18 + P_6_18*vd)
+        K[index, 19] = HK16*(-HK0*P_19_22 + HK0*P_4_19 - HK1*P_19_23 + HK1*P_5_19 + P_6_19*vd)
+        K[index, 20] = HK16*(-HK0*P_20_22 + HK0*P_4_20 - HK1*P_20_23 + HK1*P_5_20 + P_6_20*vd)
+        K[index, 21] = HK16*(-HK0*P_21_22 + HK0*P_4_21 - HK1*P_21_23 + HK1*P_5_21 + P_6_21*vd)
+        K[index, 22] = HK15*HK16
+        K[index, 23] = HK14*HK16
+    return H, K
+
+# beta observation Jacobian and Kalman gain
+def fuse_beta(states, P, R_BETA):
+    q0 = states[..., 0]
+    q1 = states[..., 1]
+    q2 = states[..., 2]
+    q3 = states[..., 3]
+    vn = states[..., 4]
+    ve = states[..., 5]
+    vd = states[..., 6]
+    vwn = states[..., 22]
+    vwe = states[..., 23]
+    P_0_0 = P[..., 0, 0]
+    P_0_1 = P[..., 0, 1]
+    P_0_2 = P[..., 0, 2]
+    P_0_3 = P[..., 0, 3]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_7 = P[..., 0, 7]
+    P_0_8 = P[..., 0, 8]
+    P_0_9 = P[..., 0, 9]
+    P_0_10 = P[..., 0, 10]
+    P_0_11 = P[..., 0, 11]
+    P_0_12 = P[..., 0, 12]
+    P_0_13 = P[..., 0, 13]
+    P_0_14 = P[..., 0, 14]
+    P_0_15 = P[..., 0, 15]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_0_18 = P[..., 0, 18]
+    P_0_19 = P[..., 0, 19]
+    P_0_20 = P[..., 0, 20]
+    P_0_21 = P[..., 0, 21]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_1 = P[..., 1, 1]
+    P_1_2 = P[..., 1, 2]
+    P_1_3 = P[..., 1, 3]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_7 = P[..., 1, 7]
+    P_1_8 = P[..., 1, 8]
+    P_1_9 = P[..., 1, 9]
+    P_1_10 = P[..., 1, 10]
+    P_1_11 = P[..., 1, 11]
+    P_1_12 = P[..., 1, 12]
+    P_1_13 = P[..., 1, 13]
+    P_1_14 = P[..., 1, 14]
+    P_1_15 = P[..., 1, 15]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_1_18 = P[..., 1, 18]
+    P_1_19 = P[..., 1, 19]
+    P_1_20 = P[..., 1, 20]
+    P_1_21 = P[..., 1, 21]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_2 = P[..., 2, 2]
+    P_2_3 = P[..., 2, 3]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_7 = P[..., 2, 7]
+    P_2_8 = P[..., 2, 8]
+    P_2_9 = P[..., 2, 9]
+    P_2_10 = P[..., 2, 10]
+    P_2_11 = P[..., 2, 11]
+    P_2_12 = P[..., 2, 12]
+    P_2_13 = P[..., 2, 13]
+    P_2_14 = P[..., 2, 14]
+    P_2_15 = P[..., 2, 15]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_2_18 = P[..., 2, 18]
+    P_2_19 = P[..., 2, 19]
+    P_2_20 = P[..., 2, 20]
+    P_2_21 = P[..., 2, 21]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_3 = P[..., 3, 3]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_7 = P[..., 3, 7]
+    P_3_8 = P[..., 3, 8]
+    P_3_9 = P[..., 3, 9]
+    P_3_10 = P[..., 3, 10]
+    P_3_11 = P[..., 3, 11]
+    P_3_12 = P[..., 3, 12]
+    P_3_13 = P[..., 3, 13]
+    P_3_14 = P[..., 3, 14]
+    P_3_15 = P[..., 3, 15]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_3_18 = P[..., 3, 18]
+    P_3_19 = P[..., 3, 19]
+    P_3_20 = P[..., 3, 20]
+    P_3_21 = P[..., 3, 21]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    P_4_4 = P[..., 4, 4]
+    P_4_5 = P[..., 4, 5]
+    P_4_6 = P[..., 4, 6]
+    P_4_7 = P[..., 4, 7]
+    P_4_8 = P[..., 4, 8]
+    P_4_9 = P[..., 4, 9]
+    P_4_10 = P[..., 4, 10]
+    P_4_11 = P[..., 4, 11]
+    P_4_12 = P[..., 4, 12]
+    P_4_13 = P[..., 4, 13]
+    P_4_14 = P[..., 4, 14]
+    P_4_15 = P[..., 4, 15]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_4_18 = P[..., 4, 18]
+    P_4_19 = P[..., 4, 19]
+    P_4_20 = P[..., 4, 20]
+    P_4_21 = P[..., 4, 21]
+    P_4_22 = P[..., 4, 22]
+    P_4_23 = P[..., 4, 23]
+    P_5_5 = P[..., 5, 5]
+    P_5_6 = P[..., 5, 6]
+    P_5_7 = P[..., 5, 7]
+    P_5_8 = P[..., 5, 8]
+    P_5_9 = P[..., 5, 9]
+    P_5_10 = P[..., 5, 10]
+    P_5_11 = P[..., 5, 11]
+    P_5_12 = P[..., 5, 12]
+    P_5_13 = P[..., 5, 13]
+    P_5_14 = P[..., 5, 14]
+    P_5_15 = P[..., 5, 15]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_5_18 = P[..., 5, 18]
+    P_5_19 = P[..., 5, 19]
+    P_5_20 = P[..., 5, 20]
+    P_5_21 = P[..., 5, 21]
+    P_5_22 = P[..., 5, 22]
+    P_5_23 = P[..., 5, 23]
+    P_6_6 = P[..., 6, 6]
+    P_6_7 = P[..., 6, 7]
+    P_6_8 = P[..., 6, 8]
+    P_6_9 = P[..., 6, 9]
+    P_6_10 = P[..., 6, 10]
+    P_6_11 = P[..., 6, 11]
+    P_6_12 = P[..., 6, 12]
+    P_6_13 = P[..., 6, 13]
+    P_6_14 = P[..., 6, 14]
+    P_6_15 = P[..., 6, 15]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_6_18 = P[..., 6, 18]
+    P_6_19 = P[..., 6, 19]
+    P_6_20 = P[..., 6, 20]
+    P_6_21 = P[..., 6, 21]
+    P_6_22 = P[..., 6, 22]
+    P_6_23 = P[..., 6, 23]
+    P_7_22 = P[..., 7, 22]
+    P_7_23 = P[..., 7, 23]
+    P_8_22 = P[..., 8, 22]
+    P_8_23 = P[..., 8, 23]
+    P_9_22 = P[..., 9, 22]
+    P_9_23 = P[..., 9, 23]
+    P_10_22 = P[..., 10, 22]
+    P_10_23 = P[..., 10, 23]
+    P_11_22 = P[..., 11, 22]
+    P_11_23 = P[..., 11, 23]
+    P_12_22 = P[..., 12, 22]
+    P_12_23 = P[..., 12, 23]
+    P_13_22 = P[..., 13, 22]
+    P_13_23 = P[..., 13, 23]
+    P_14_22 = P[..., 14, 22]
+    P_14_23 = P[..., 14, 23]
+    P_15_22 = P[..., 15, 22]
+    P_15_23 = P[..., 15, 23]
+    P_16_22 = P[..., 16, 22]
+    P_16_23 = P[..., 16, 23]
+    P_17_22 = P[..., 17, 22]
+    P_17_23 = P[..., 17, 23]
+    P_18_22 = P[..., 18, 22]
+    P_18_23 = P[..., 18, 23]
+    P_19_22 = P[..., 19, 22]
+    P_19_23 = P[..., 19, 23]
+    P_20_22 = P[..., 20, 22]
+    P_20_23 = P[..., 20, 23]
+    P_21_22 = P[..., 21, 22]
+    P_21_23 = P[..., 21, 23]
+    P_22_22 = P[..., 22, 22]
+    P_22_23 = P[..., 22, 23]
+    P_23_23 = P[..., 23, 23]
+    HK0 = vn - vwn
+    HK1 = ve - vwe
+    HK2 = HK0*q0 + HK1*q3 - q2*vd
+    HK3 = q0*q2 - q1*q3
+    HK4 = 2*vd
+    HK5 = q0*q3
+    HK6 = q1*q2
+    HK7 = 2*HK5 + 2*HK6
+    HK8 = q0**2
+    HK9 = q3**2
+    HK10 = HK8 - HK9
+    HK11 = q1**2
+    HK12 = q2**2
+    HK13 = HK11 - HK12
+    HK14 = HK10 + HK13
+    HK15 = HK0*HK14 + HK1*HK7 - HK3*HK4
+    HK16 = 1/HK15
+    HK17 = q0*q1 + q2*q3
+    HK18 = HK16*(-2*HK0*(HK5 - HK6) + HK1*(HK10 - HK11 + HK12) + HK17*HK4)
+    HK19 = -HK0*q3 + HK1*q0 + q1*vd
+    HK20 = -HK18*HK2 + HK19
+    HK21 = 2*HK16
+    HK22 = HK0*q1 + HK1*q2 + q3*vd
+    HK23 = HK0*q2 - HK1*q1 + q0*vd
+    HK24 = -HK18*HK22 + HK23
+    HK25 = HK18*HK23 + HK22
+    HK26 = HK18*HK19 + HK2
+    HK27 = HK14*HK18 + 2*HK5 - 2*HK6
+    HK28 = HK16*HK27
+    HK29 = HK13 + HK18*HK7 - HK8 + HK9
+    HK30 = HK17 + HK18*HK3
+    HK31 = 2*HK30
+    HK32 = 2*HK25
+    HK33 = 2*HK24
+    HK34 = 2*HK26
+    HK35 = 2*HK20
+    HK36 = HK27*P_0_22 - HK27*P_0_4 + HK29*P_0_23 - HK29*P_0_5 + HK31*P_0_6 + HK32*P_0_2 + HK33*P_0_1 - HK34*P_0_3 + HK35*P_0_0
+    HK37 = HK15**(-2)
+    HK38 = -HK27*P_4_6 + HK27*P_6_22 - HK29*P_5_6 + HK29*P_6_23 + HK31*P_6_6 + HK32*P_2_6 + HK33*P_1_6 - HK34*P_3_6 + HK35*P_0_6
+    HK39 = HK29*P_5_23
+    HK40 = HK27*P_22_23 - HK27*P_4_23 + HK29*P_23_23 + HK31*P_6_23 + HK32*P_2_23 + HK33*P_1_23 - HK34*P_3_23 + HK35*P_0_23 - HK39
+    HK41 = HK29*HK37
+    HK42 = HK27*P_4_22
+    HK43 = HK27*P_22_22 + HK29*P_22_23 - HK29*P_5_22 + HK31*P_6_22 + HK32*P_2_22 + HK33*P_1_22 - HK34*P_3_22 + HK35*P_0_22 - HK42
+    HK44 = HK27*HK37
+    HK45 = -HK27*P_4_5 + HK27*P_5_22 - HK29*P_5_5 + HK31*P_5_6 + HK32*P_2_5 + HK33*P_1_5 - HK34*P_3_5 + HK35*P_0_5 + HK39
+    HK46 = -HK27*P_4_4 + HK29*P_4_23 - HK29*P_4_5 + HK31*P_4_6 + HK32*P_2_4 + HK33*P_1_4 - HK34*P_3_4 + HK35*P_0_4 + HK42
+    HK47 = HK27*P_2_22 - HK27*P_2_4 + HK29*P_2_23 - HK29*P_2_5 + HK31*P_2_6 + HK32*P_2_2 + HK33*P_1_2 - HK34*P_2_3 + HK35*P_0_2
+    HK48 = HK27*P_1_22 - HK27*P_1_4 + HK29*P_1_23 - HK29*P_1_5 + HK31*P_1_6 + HK32*P_1_2 + HK33*P_1_1 - HK34*P_1_3 + HK35*P_0_1
+    HK49 = HK27*P_3_22 - HK27*P_3_4 + HK29*P_3_23 - HK29*P_3_5 + HK31*P_3_6 + HK32*P_2_3 + HK33*P_1_3 - HK34*P_3_3 + HK35*P_0_3
+    HK50 = HK16/(HK31*HK37*HK38 + HK32*HK37*HK47 + HK33*HK37*HK48 - HK34*HK37*HK49 + HK35*HK36*HK37 + HK40*HK41 - HK41*HK45 + HK43*HK44 - HK44*HK46 + R_BETA)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 0] = HK20*HK21
+    H[..., 1] = HK21*HK24
+    H[..., 2] = HK21*HK25
+    H[..., 3] = -HK21*HK26
+    H[..., 4] = -HK28
+    H[..., 5] = -HK16*HK29
+    H[..., 6] = HK21*HK30
+    H[..., 22] = HK28
+    H[..., 23] = HK16*HK29
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = HK36*HK50
+    K[..., 1] = HK48*HK50
+    K[..., 2] = HK47*HK50
+    K[..., 3] = HK49*HK50
+    K[..., 4] = HK46*HK50
+    K[..., 5] = HK45*HK50
+    K[..., 6] = HK38*HK50
+    K[..., 7] = HK50*(-HK27*P_4_7 + HK27*P_7_22 - HK29*P_5_7 + HK29*P_7_23 + HK31*P_6_7 + HK32*P_2_7 + HK33*P_1_7 - HK34*P_3_7 + HK35*P_0_7)
+    K[..., 8] = HK50*(-HK27*P_4_8 + HK27*P_8_22 - HK29*P_5_8 + HK29*P_8_23 + HK31*P_6_8 + HK32*P_2_8 + HK33*P_1_8 - HK34*P_3_8 + HK35*P_0_8)
+    K[..., 9] = HK50*(-HK27*P_4_9 + HK27*P_9_22 - HK29*P_5_9 + HK29*P_9_23 + HK31*P_6_9 + HK32*P_2_9 + HK33*P_1_9 - HK34*P_3_9 + HK35*P_0_9)
+    K[..., 10] = HK50*(HK27*P_10_22 - HK27*P_4_10 + HK29*P_10_23 - HK29*P_5_10 + HK31*P_6_10 + HK32*P_2_10 + HK33*P_1_10 - HK34*P_3_10 + HK35*P_0_10)
+    K[..., 11] = HK50*(HK27*P_11_22 - HK27*P_4_11 + HK29*P_11_23 - HK29*P_5_11 + HK31*P_6_11 + HK32*P_2_11 + HK33*P_1_11 - HK34*P_3_11 + HK35*P_0_11)
+    K[..., 12] = HK50*(HK27*P_12_22 - HK27*P_4_12 + HK29*P_12_23 - HK29*P_5_12 + HK31*P_6_12 + HK32*P_2_12 + HK33*P_1_12 - HK34*P_3_12 + HK35*P_0_12)
+    K[..., 13] = HK50*(HK27*P_13_22 - HK27*P_4_13 + HK29*P_13_23 - HK29*P_5_13 + HK31*P_6_13 + HK32*P_2_13 + HK33*P_1_13 - HK34*P_3_13 + HK35*P_0_13)
+    K[..., 14] = HK50*(HK27*P_14_22 - HK27*P_4_14 + HK29*P_14_23 - HK29*P_5_14 + HK31*P_6_14 + HK32*P_2_14 + HK33*P_1_14 - HK34*P_3_14 + HK35*P_0_14)
+    K[..., 15] = HK50*(HK27*P_15_22 - HK27*P_4_15 + HK29*P_15_23 - HK29*P_5_15 + HK31*P_6_15 + HK32*P_2_15 + HK33*P_1_15 - HK34*P_3_15 + HK35*P_0_15)
+    K[..., 16] = HK50*(HK27*P_16_22 - HK27*P_4_16 + HK29*P_16_23 - HK29*P_5_16 + HK31*P_6_16 + HK32*P_2_16 + HK33*P_1_16 - HK34*P_3_16 + HK35*P_0_16)
+    K[..., 17] = HK50*(HK27*P_17_22 - HK27*P_4_17 + HK29*P_17_23 - HK29*P_5_17 + HK31*P_6_17 + HK32*P_2_17 + HK33*P_1_17 - HK34*P_3_17 + HK35*P_0_17)
+    K[..., 18] = HK50*(HK27*P_18_22 - HK27*P_4_18 + HK29*P_18_23 - HK29*P_5_18 + HK31*P_6_18 + HK32*P_2_18 + HK33*P_1_18 - HK34*P_3_18 + HK35*P_0_18)
+    K[..., 19] = HK50*(HK27*P_19_22 - HK27*P_4_19 + HK29*P_19_23 - HK29*P_5_19 + HK31*P_6_19 + HK32*P_2_19 + HK33*P_1_19 - HK34*P_3_19 + HK35*P_0_19)
+    K[..., 20] = HK50*(HK27*P_20_22 - HK27*P_4_20 + HK29*P_20_23 - HK29*P_5_20 + HK31*P_6_20 + HK32*P_2_20 + HK33*P_1_20 - HK34*P_3_20 + HK35*P_0_20)
+    K[..., 21] = HK50*(HK27*P_21_22 - HK27*P_4_21 + HK29*P_21_23 - HK29*P_5_21 + HK31*P_6_21 + HK32*P_2_21 + HK33*P_1_21 - HK34*P_3_21 + HK35*P_0_21)
+    K[..., 22] = HK43*HK50
+    K[..., 23] = HK40*HK50
+    return H, K
+
+# beta observation Jacobian and Kalman gain, loop over the filters
+def fuse_beta_kernel(states, P, R_BETA):
+    n_filters = P.shape[0]
+    R_BETA = numpy.broadcast_to(numpy.asarray(R_BETA, dtype=numpy.float64), (n_filters,))
+    return _fuse_beta_kernel(states, P, R_BETA)
+
+@jit
+def _fuse_beta_kernel(states, P, R_BETA):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        q0 = states[index, 0]
+        q1 = states[index, 1]
+        q2 = states[index, 2]
+        q3 = states[index, 3]
+        vn = states[index, 4]
+        ve = states[index, 5]
+        vd = states[index, 6]
+        vwn = states[index, 22]
+        vwe = states[index, 23]
+        P_0_0 = P[index, 0, 0]
+        P_0_1 = P[index, 0, 1]
+        P_0_2 = P[index, 0, 2]
+        P_0_3 = P[index, 0, 3]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_7 = P[index, 0, 7]
+        P_0_8 = P[index, 0, 8]
+        P_0_9 = P[index, 0, 9]
+        P_0_10 = P[index, 0, 10]
+        P_0_11 = P[index, 0, 11]
+        P_0_12 = P[index, 0, 12]
+        P_0_13 = P[index, 0, 13]
+        P_0_14 = P[index, 0, 14]
+        P_0_15 = P[index, 0, 15]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_0_18 = P[index, 0, 18]
+        P_0_19 = P[index, 0, 19]
+        P_0_20 = P[index, 0, 20]
+        P_0_21 = P[index, 0, 21]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_1 = P[index, 1, 1]
+        P_1_2 = P[index, 1, 2]
+        P_1_3 = P[index, 1, 3]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_7 = P[index, 1, 7]
+        P_1_8 = P[index, 1, 8]
+        P_1_9 = P[index, 1, 9]
+        P_1_10 = P[index, 1, 10]
+        P_1_11 = P[index, 1, 11]
+        P_1_12 = P[index, 1, 12]
+        P_1_13 = P[index, 1, 13]
+        P_1_14 = P[index, 1, 14]
+        P_1_15 = P[index, 1, 15]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_1_18 = P[index, 1, 18]
+        P_1_19 = P[index, 1, 19]
+        P_1_20 = P[index, 1, 20]
+        P_1_21 = P[index, 1, 21]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_2 = P[index, 2, 2]
+        P_2_3 = P[index, 2, 3]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_7 = P[index, 2, 7]
+        P_2_8 = P[index, 2, 8]
+        P_2_9 = P[index, 2, 9]
+        P_2_10 = P[index, 2, 10]
+        P_2_11 = P[index, 2, 11]
+        P_2_12 = P[index, 2, 12]
+        P_2_13 = P[index, 2, 13]
+        P_2_14 = P[index, 2, 14]
+        P_2_15 = P[index, 2, 15]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_2_18 = P[index, 2, 18]
+        P_2_19 = P[index, 2, 19]
+        P_2_20 = P[index, 2, 20]
+        P_2_21 = P[index, 2, 21]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_3 = P[index, 3, 3]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_7 = P[index, 3, 7]
+        P_3_8 = P[index, 3, 8]
+        P_3_9 = P[index, 3, 9]
+        P_3_10 = P[index, 3, 10]
+        P_3_11 = P[index, 3, 11]
+        P_3_12 = P[index, 3, 12]
+        P_3_13 = P[index, 3, 13]
+        P_3_14 = P[index, 3, 14]
+        P_3_15 = P[index, 3, 15]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_3_18 = P[index, 3, 18]
+        P_3_19 = P[index, 3, 19]
+        P_3_20 = P[index, 3, 20]
+        P_3_21 = P[index, 3, 21]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        P_4_4 = P[index, 4, 4]
+        P_4_5 = P[index, 4, 5]
+        P_4_6 = P[index, 4, 6]
+        P_4_7 = P[index, 4, 7]
+        P_4_8 = P[index, 4, 8]
+        P_4_9 = P[index, 4, 9]
+        P_4_10 = P[index, 4, 10]
+        P_4_11 = P[index, 4, 11]
+        P_4_12 = P[index, 4, 12]
+        P_4_13 = P[index, 4, 13]
+        P_4_14 = P[index, 4, 14]
+        P_4_15 = P[index, 4, 15]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_4_18 = P[index, 4, 18]
+        P_4_19 = P[index, 4, 19]
+        P_4_20 = P[index, 4, 20]
+        P_4_21 = P[index, 4, 21]
+        P_4_22 = P[index, 4, 22]
+        P_4_23 = P[index, 4, 23]
+        P_5_5 = P[index, 5, 5]
+        P_5_6 = P[index, 5, 6]
+        P_5_7 = P[index, 5, 7]
+        P_5_8 = P[index, 5, 8]
+        P_5_9 = P[index, 5, 9]
+        P_5_10 = P[index, 5, 10]
+        P_5_11 = P[index, 5, 11]
+        P_5_12 = P[index, 5, 12]
+        P_5_13 = P[index, 5, 13]
+        P_5_14 = P[index, 5, 14]
+        P_5_15 = P[index, 5, 15]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_5_18 = P[index, 5, 18]
+        P_5_19 = P[index, 5, 19]
+        P_5_20 = P[index, 5, 20]
+        P_5_21 = P[index, 5, 21]
+        P_5_22 = P[index, 5, 22]
+        P_5_23 = P[index, 5, 23]
+        P_6_6 = P[index, 6, 6]
+        P_6_7 = P[index, 6, 7]
+        P_6_8 = P[index, 6, 8]
+        P_6_9 = P[index, 6, 9]
+        P_6_10 = P[index, 6, 10]
+        P_6_11 = P[index, 6, 11]
+        P_6_12 = P[index, 6, 12]
+        P_6_13 = P[index, 6, 13]
+        P_6_14 = P[index, 6, 14]
+        P_6_15 = P[index, 6, 15]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_6_18 = P[index, 6, 18]
+        P_6_19 = P[index, 6, 19]
+        P_6_20 = P[index, 6, 20]
+        P_6_21 = P[index, 6, 21]
+        P_6_22 = P[index, 6, 22]
+        P_6_23 = P[index, 6, 23]
+        P_7_22 = P[index, 7, 22]
+        P_7_23 = P[index, 7, 23]
+        P_8_22 = P[index, 8, 22]
+        P_8_23 = P[index, 8, 23]
+        P_9_22 = P[index, 9, 22]
+        P_9_23 = P[index, 9, 23]
+        P_10_22 = P[index, 10, 22]
+        P_10_23 = P[index, 10, 23]
+        P_11_22 = P[index, 11, 22]
+        P_11_23 = P[index, 11, 23]
+        P_12_22 = P[index, 12, 22]
+        P_12_23 = P[index, 12, 23]
+        P_13_22 = P[index, 13, 22]
+        P_13_23 = P[index, 13, 23]
+        P_14_22 = P[index, 14, 22]
+        P_14_23 = P[index, 14, 23]
+        P_15_22 = P[index, 15, 22]
+        P_15_23 = P[index, 15, 23]
+        P_16_22 = P[index, 16, 22]
+        P_16_23 = P[index, 16, 23]
+        P_17_22 = P[index, 17, 22]
+        P_17_23 = P[index, 17, 23]
+        P_18_22 = P[index, 18, 22]
+        P_18_23 = P[index, 18, 23]
+        P_19_22 = P[index, 19, 22]
+        P_19_23 = P[index, 19, 23]
+        P_20_22 = P[index, 20, 22]
+        P_20_23 = P[index, 20, 23]
+        P_21_22 = P[index, 21, 22]
+        P_21_23 = P[index, 21, 23]
+        P_22_22 = P[index, 22, 22]
+        P_22_23 = P[index, 22, 23]
+        P_23_23 = P[index, 23, 23]
+        HK0 = vn - vwn
+        HK1 = ve - vwe
+        HK2 = HK0*q0 + HK1*q3 - q2*vd
+        HK3 = q0*q2 - q1*q3
+        HK4 = 2*vd
+        HK5 = q0*q3
+        HK6 = q1*q2
+        HK7 = 2*HK5 + 2*HK6
+        HK8 = q0**2
+        HK9 = q3**2
+        HK10 = HK8 - HK9
+        HK11 = q1**2
+        HK12 = q2**2
+        HK13 = HK11 - HK12
+        HK14 = HK10 + HK13
+        HK15 = HK0*HK14 + HK1*HK7 - HK3*HK4
+        HK16 = 1/HK15
+        HK17 = q0*q1 + q2*q3
+        HK18 = HK16*(-2*HK0*(HK5 - HK6) + HK1*(HK10 - HK11 + HK12) + HK17*HK4)
+        HK19 = -HK0*q3 + HK1*q0 + q1*vd
+        HK20 = -HK18*HK2 + HK19
+        HK21 = 2*HK16
+        HK22 = HK0*q1 + HK1*q2 + q3*vd
+        HK23 = HK0*q2 - HK1*q1 + q0*vd
+        HK24 = -HK18*HK22 + HK23
+        HK25 = HK18*HK23 + HK22
+        HK26 = HK18*HK19 + HK2
+        HK27 = HK14*HK18 + 2*HK5 - 2*HK6
+        HK28 = HK16*HK27
+        HK29 = HK13 + HK18*HK7 - HK8 + HK9
+        HK30 = HK17 + HK18*HK3
+        HK31 = 2*HK30
+        HK32 = 2*HK25
+        HK33 = 2*HK24
+        HK34 = 2*HK26
+        HK35 = 2*HK20
+        HK36 = HK27*P_0_22 - HK27*P_0_4 + HK29*P_0_23 - HK29*P_0_5 + HK31*P_0_6 + HK32*P_0_2 + HK33*P_0_1 - HK34*P_0_3 + HK35*P_0_0
+        HK37 = HK15**(-2)
+        HK38 = -HK27*P_4_6 + HK27*P_6_22 - HK29*P_5_6 + HK29*P_6_23 + HK31*P_6_6 + HK32*P_2_6 + HK33*P_1_6 - HK34*P_3_6 + HK35*P_0_6
+        HK39 = HK29*P_5_23
+        HK40 = HK27*P_22_23 - HK27*P_4_23 + HK29*P_23_23 + HK31*P_6_23 + HK32*P_2_23 + HK33*P_1_23 - HK34*P_3_23 + HK35*P_0_23 - HK39
+        HK41 = HK29*HK37
+        HK42 = HK27*P_4_22
+        HK43 = HK27*P_22_22 + HK29*P_22_23 - HK29*P_5_22 + HK31*P_6_22 + HK32*P_2_22 + HK33*P_1_22 - HK34*P_3_22 + HK35*P_0_22 - HK42
+        HK44 = HK27*HK37
+        HK45 = -HK27*P_4_5 + HK27*P_5_22 - HK29*P_5_5 + HK31*P_5_6 + HK32*P_2_5 + HK33*P_1_5 - HK34*P_3_5 + HK35*P_0_5 + HK39
+        HK46 = -HK27*P_4_4 + HK29*P_4_23 - HK29*P_4_5 + HK31*P_4_6 + HK32*P_2_4 + HK33*P_1_4 - HK34*P_3_4 + HK35*P_0_4 + HK42
+        HK47 = HK27*P_2_22 - HK27*P_2_4 + HK29*P_2_23 - HK29*P_2_5 + HK31*P_2_6 + HK32*P_2_2 + HK33*P_1_2 - HK34*P_2_3 + HK35*P_0_2
+        HK48 = HK27*P_1_22 - HK27*P_1_4 + HK29*P_1_23 - HK29*P_1_5 + HK31*P_1_6 + HK32*P_1_2 + HK33*P_1_1 - HK34*P_1_3 + HK35*P_0_1
+        HK49 = HK27*P_3_22 - HK27*P_3_4 + HK29*P_3_23 - HK29*P_3_5 + HK31*P_3_6 + HK32*P_2_3 + HK33*P_1_3 - HK34*P_3_3 + HK35*P_0_3
+        HK50 = HK16/(HK31*HK37*HK38 + HK32*HK37*HK47 + HK33*HK37*HK48 - HK34*HK37*HK49 + HK35*HK36*HK37 + HK40*HK41 - HK41*HK45 + HK43*HK44 - HK44*HK46 + R_BETA[index])
+        H[index, 0] = HK20*HK21
+        H[index, 1] = HK21*HK24
+        H[index, 2] = HK21*HK25
+        H[index, 3] = -HK21*HK26
+        H[index, 4] = -HK28
+        H[index, 5] = -HK16*HK29
+        H[index, 6] = HK21*HK30
+        H[index, 22] = HK28
+        H[index, 23] = HK16*HK29
+        K[index, 0] = HK36*HK50
+        K[index, 1] = HK48*HK50
+        K[index, 2] = HK47*HK50
+        K[index, 3] = HK49*HK50
+        K[index, 4] = HK46*HK50
+        K[index, 5] = HK45*HK50
+        K[index, 6] = HK38*HK50
+        K[index, 7] = HK50*(-HK27*P_4_7 + HK27*P_7_22 - HK29*P_5_7 + HK29*P_7_23 + HK31*P_6_7 + HK32*P_2_7 + HK33*P_1_7 - HK34*P_3_7 + HK35*P_0_7)
+        K[index, 8] = HK50*(-HK27*P_4_8 + HK27*P_8_22 - HK29*P_5_8 + HK29*P_8_23 + HK31*P_6_8 + HK32*P_2_8 + HK33*P_1_8 - HK34*P_3_8 + HK35*P_0_8)
+        K[index, 9] = HK50*(-HK27*P_4_9 + HK27*P_9_22 - HK29*P_5_9 + HK29*P_9_23 + HK31*P_6_9 + HK32*P_2_9 + HK33*P_1_9 - HK34*P_3_9 + HK35*P_0_9)
+        K[index, 10] = HK50*(HK27*P_10_22 - HK27*P_4_10 + HK29*P_10_23 - HK29*P_5_10 + HK31*P_6_10 + HK32*P_2_10 + HK33*P_1_10 - HK34*P_3_10 + HK35*P_0_10)
+        K[index, 11] = HK50*(HK27*P_11_22 - HK27*P_4_11 + HK29*P_11_23 - HK29*P_5_11 + HK31*P_6_11 + HK32*P_2_11 + HK33*P_1_11 - HK34*P_3_11 + HK35*P_0_11)
+        K[index, 12] = HK50*(HK27*P_12_22 - HK27*P_4_12 + HK29*P_12_23 - HK29*P_5_12 + HK31*P_6_12 + HK32*P_2_12 + HK33*P_1_12 - HK34*P_3_12 + HK35*P_0_12)
+        K[index, 13] = HK50*(HK27*P_13_22 - HK27*P_4_13 + HK29*P_13_23 - HK29*P_5_13 + HK31*P_6_13 + HK32*P_2_13 + HK33*P_1_13 - HK34*P_3_13 + HK35*P_0_13)
+        K[index, 14] = HK50*(HK27*P_14_22 - HK27*P_4_14 + HK29*P_14_23 - HK29*P_5_14 + HK31*P_6_14 + HK32*P_2_14 + HK33*P_1_14 - HK34*P_3_14 + HK35*P_0_14)
+        K[index, 15] = HK50*(HK27*P_15_22 - HK27*P_4_15 + HK29*P_15_23 - HK29*P_5_15 + HK31*P_6_15 + HK32*P_2_15 + HK33*P_1_15 - HK34*P_3_15 + HK35*P_0_15)
+        K[index, 16] = HK50*(HK27*P_16_22 - HK27*P_4_16 + HK29*P_16_23 - HK29*P_5_16 + HK31*P_6_16 + HK32*P_2_16 + HK33*P_1_16 - HK34*P_3_16 + HK35*P_0_16)
+        K[index, 17] = HK50*(HK27*P_17_22 - HK27*P_4_17 + HK29*P_17_23 - HK29*P_5_17 + HK31*P_6_17 + HK32*P_2_17 + HK33*P_1_17 - HK34*P_3_17 + HK35*P_0_17)
+        K[index, 18] = HK50*(HK27*P_18_22 - HK27*P_4_18 + HK29*P_18_23 - HK29*P_5_18 + HK31*P_6_18 + HK32*P_2_18 + HK33*P_1_18 - HK34*P_3_18 + HK35*P_0_18)
+        K[index, 19] = HK50*(HK27*P_19_22 - HK27*P_4_19 + HK29*P_19_23 - HK29*P_5_19 + HK31*P_6_19 + HK32*P_2_19 + HK33*P_1_19 - HK34*P_3_19 + HK35*P_0_19)
+        K[index, 20] = HK50*(HK27*P_20_22 - HK27*P_4_20 + HK29*P_20_23 - HK29*P_5_20 + HK31*P_6_20 + HK32*P_2_20 + HK33*P_1_20 - HK34*P_3_20 + HK35*P_0_20)
+        K[index, 21] = HK50*(HK27*P_21_22 - HK27*P_4_21 + HK29*P_21_23 - HK29*P_5_21 + HK31*P_6_21 + HK32*P_2_21 + HK33*P_1_21 - HK34*P_3_21 + HK35*P_0_21)
+        K[index, 22] = HK43*HK50
+        K[index, 23] = HK40*HK50
+    return H, K
+
+# mag_decl observation Jacobian and Kalman gain
+def fuse_mag_decl(states, P, R_DECL):
+    magN = states[..., 16]
+    magE = states[..., 17]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_7_16 = P[..., 7, 16]
+    P_7_17 = P[..., 7, 17]
+    P_8_16 = P[..., 8, 16]
+    P_8_17 = P[..., 8, 17]
+    P_9_16 = P[..., 9, 16]
+    P_9_17 = P[..., 9, 17]
+    P_10_16 = P[..., 10, 16]
+    P_10_17 = P[..., 10, 17]
+    P_11_16 = P[..., 11, 16]
+    P_11_17 = P[..., 11, 17]
+    P_12_16 = P[..., 12, 16]
+    P_12_17 = P[..., 12, 17]
+    P_13_16 = P[..., 13, 16]
+    P_13_17 = P[..., 13, 17]
+    P_14_16 = P[..., 14, 16]
+    P_14_17 = P[..., 14, 17]
+    P_15_16 = P[..., 15, 16]
+    P_15_17 = P[..., 15, 17]
+    P_16_16 = P[..., 16, 16]
+    P_16_17 = P[..., 16, 17]
+    P_16_18 = P[..., 16, 18]
+    P_16_19 = P[..., 16, 19]
+    P_16_20 = P[..., 16, 20]
+    P_16_21 = P[..., 16, 21]
+    P_16_22 = P[..., 16, 22]
+    P_16_23 = P[..., 16, 23]
+    P_17_17 = P[..., 17, 17]
+    P_17_18 = P[..., 17, 18]
+    P_17_19 = P[..., 17, 19]
+    P_17_20 = P[..., 17, 20]
+    P_17_21 = P[..., 17, 21]
+    P_17_22 = P[..., 17, 22]
+    P_17_23 = P[..., 17, 23]
+    HK0 = magN**(-2)
+    HK1 = HK0*magE**2 + 1
+    HK2 = 1/HK1
+    HK3 = 1/magN
+    HK4 = HK2*HK3
+    HK5 = HK3*magE
+    HK6 = HK5*P_16_17 - P_17_17
+    HK7 = HK1**(-2)
+    HK8 = HK5*P_16_16 - P_16_17
+    HK9 = HK4/(-HK0*HK6*HK7 + HK7*HK8*magE/magN**3 + R_DECL)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 16] = -HK0*HK2*magE
+    H[..., 17] = HK4
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = -HK9*(HK5*P_0_16 - P_0_17)
+    K[..., 1] = -HK9*(HK5*P_1_16 - P_1_17)
+    K[..., 2] = -HK9*(HK5*P_2_16 - P_2_17)
+    K[..., 3] = -HK9*(HK5*P_3_16 - P_3_17)
+    K[..., 4] = -HK9*(HK5*P_4_16 - P_4_17)
+    K[..., 5] = -HK9*(HK5*P_5_16 - P_5_17)
+    K[..., 6] = -HK9*(HK5*P_6_16 - P_6_17)
+    K[..., 7] = -HK9*(HK5*P_7_16 - P_7_17)
+    K[..., 8] = -HK9*(HK5*P_8_16 - P_8_17)
+    K[..., 9] = -HK9*(HK5*P_9_16 - P_9_17)
+    K[..., 10] = -HK9*(HK5*P_10_16 - P_10_17)
+    K[..., 11] = -HK9*(HK5*P_11_16 - P_11_17)
+    K[..., 12] = -HK9*(HK5*P_12_16 - P_12_17)
+    K[..., 13] = -HK9*(HK5*P_13_16 - P_13_17)
+    K[..., 14] = -HK9*(HK5*P_14_16 - P_14_17)
+    K[..., 15] = -HK9*(HK5*P_15_16 - P_15_17)
+    K[..., 16] = -HK8*HK9
+    K[..., 17] = -HK6*HK9
+    K[..., 18] = -HK9*(HK5*P_16_18 - P_17_18)
+    K[..., 19] = -HK9*(HK5*P_16_19 - P_17_19)
+    K[..., 20] = -HK9*(HK5*P_16_20 - P_17_20)
+    K[..., 21] = -HK9*(HK5*P_16_21 - P_17_21)
+    K[..., 22] = -HK9*(HK5*P_16_22 - P_17_22)
+    K[..., 23] = -HK9*(HK5*P_16_23 - P_17_23)
+    return H, K
+
+# mag_decl observation Jacobian and Kalman gain, loop over the filters
+def fuse_mag_decl_kernel(states, P, R_DECL):
+    n_filters = P.shape[0]
+    R_DECL = numpy.broadcast_to(numpy.asarray(R_DECL, dtype=numpy.float64), (n_filters,))
+    return _fuse_mag_decl_kernel(states, P, R_DECL)
+
+@jit
+def _fuse_mag_decl_kernel(states, P, R_DECL):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        magN = states[index, 16]
+        magE = states[index, 17]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_7_16 = P[index, 7, 16]
+        P_7_17 = P[index, 7, 17]
+        P_8_16 = P[index, 8, 16]
+        P_8_17 = P[index, 8, 17]
+        P_9_16 = P[index, 9, 16]
+        P_9_17 = P[index, 9, 17]
+        P_10_16 = P[index, 10, 16]
+        P_10_17 = P[index, 10, 17]
+        P_11_16 = P[index, 11, 16]
+        P_11_17 = P[index, 11, 17]
+        P_12_16 = P[index, 12, 16]
+        P_12_17 = P[index, 12, 17]
+        P_13_16 = P[index, 13, 16]
+        P_13_17 = P[index, 13, 17]
+        P_14_16 = P[index, 14, 16]
+        P_14_17 = P[index, 14, 17]
+        P_15_16 = P[index, 15, 16]
+        P_15_17 = P[index, 15, 17]
+        P_16_16 = P[index, 16, 16]
+        P_16_17 = P[index, 16, 17]
+        P_16_18 = P[index, 16, 18]
+        P_16_19 = P[index, 16, 19]
+        P_16_20 = P[index, 16, 20]
+        P_16_21 = P[index, 16, 21]
+        P_16_22 = P[index, 16, 22]
+        P_16_23 = P[index, 16, 23]
+        P_17_17 = P[index, 17, 17]
+        P_17_18 = P[index, 17, 18]
+        P_17_19 = P[index, 17, 19]
+        P_17_20 = P[index, 17, 20]
+        P_17_21 = P[index, 17, 21]
+        P_17_22 = P[index, 17, 22]
+        P_17_23 = P[index, 17, 23]
+        HK0 = magN**(-2)
+        HK1 = HK0*magE**2 + 1
+        HK2 = 1/HK1
+        HK3 = 1/magN
+        HK4 = HK2*HK3
+        HK5 = HK3*magE
+        HK6 = HK5*P_16_17 - P_17_17
+        HK7 = HK1**(-2)
+        HK8 = HK5*P_16_16 - P_16_17
+        HK9 = HK4/(-HK0*HK6*HK7 + HK7*HK8*magE/magN**3 + R_DECL[index])
+        H[index, 16] = -HK0*HK2*magE
+        H[index, 17] = HK4
+        K[index, 0] = -HK9*(HK5*P_0_16 - P_0_17)
+        K[index, 1] = -HK9*(HK5*P_1_16 - P_1_17)
+        K[index, 2] = -HK9*(HK5*P_2_16 - P_2_17)
+        K[index, 3] = -HK9*(HK5*P_3_16 - P_3_17)
+        K[index, 4] = -HK9*(HK5*P_4_16 - P_4_17)
+        K[index, 5] = -HK9*(HK5*P_5_16 - P_5_17)
+        K[index, 6] = -HK9*(HK5*P_6_16 - P_6_17)
+        K[index, 7] = -HK9*(HK5*P_7_16 - P_7_17)
+        K[index, 8] = -HK9*(HK5*P_8_16 - P_8_17)
+        K[index, 9] = -HK9*(HK5*P_9_16 - P_9_17)
+        K[index, 10] = -HK9*(HK5*P_10_16 - P_10_17)
+        K[index, 11] = -HK9*(HK5*P_11_16 - P_11_17)
+        K[index, 12] = -HK9*(HK5*P_12_16 - P_12_17)
+        K[index, 13] = -HK9*(HK5*P_13_16 - P_13_17)
+        K[index, 14] = -HK9*(HK5*P_14_16 - P_14_17)
+        K[index, 15] = -HK9*(HK5*P_15_16 - P_15_17)
+        K[index, 16] = -HK8*HK9
+        K[index, 17] = -HK6*HK9
+        K[index, 18] = -HK9*(HK5*P_16_18 - P_17_18)
+        K[index, 19] = -HK9*(HK5*P_16_19 - P_17_19)
+        K[index, 20] = -HK9*(HK5*P_16_20 - P_17_20)
+        K[index, 21] = -HK9*(HK5*P_16_21 - P_17_21)
+        K[index, 22] = -HK9*(HK5*P_16_22 - P_17_22)
+        K[index, 23] = -HK9*(HK5*P_16_23 - P_17_23)
+    return H, K
+
+# gps_yaw observation Jacobian and Kalman gain
+def fuse_gps_yaw(states, P, R_YAW, ant_yaw):
+    q0 = states[..., 0]
+    q1 = states[..., 1]
+    q2 = states[..., 2]
+    q3 = states[..., 3]
+    P_0_0 = P[..., 0, 0]
+    P_0_1 = P[..., 0, 1]
+    P_0_2 = P[..., 0, 2]
+    P_0_3 = P[..., 0, 3]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_7 = P[..., 0, 7]
+    P_0_8 = P[..., 0, 8]
+    P_0_9 = P[..., 0, 9]
+    P_0_10 = P[..., 0, 10]
+    P_0_11 = P[..., 0, 11]
+    P_0_12 = P[..., 0, 12]
+    P_0_13 = P[..., 0, 13]
+    P_0_14 = P[..., 0, 14]
+    P_0_15 = P[..., 0, 15]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_0_18 = P[..., 0, 18]
+    P_0_19 = P[..., 0, 19]
+    P_0_20 = P[..., 0, 20]
+    P_0_21 = P[..., 0, 21]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_1 = P[..., 1, 1]
+    P_1_2 = P[..., 1, 2]
+    P_1_3 = P[..., 1, 3]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_7 = P[..., 1, 7]
+    P_1_8 = P[..., 1, 8]
+    P_1_9 = P[..., 1, 9]
+    P_1_10 = P[..., 1, 10]
+    P_1_11 = P[..., 1, 11]
+    P_1_12 = P[..., 1, 12]
+    P_1_13 = P[..., 1, 13]
+    P_1_14 = P[..., 1, 14]
+    P_1_15 = P[..., 1, 15]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_1_18 = P[..., 1, 18]
+    P_1_19 = P[..., 1, 19]
+    P_1_20 = P[..., 1, 20]
+    P_1_21 = P[..., 1, 21]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_2 = P[..., 2, 2]
+    P_2_3 = P[..., 2, 3]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_7 = P[..., 2, 7]
+    P_2_8 = P[..., 2, 8]
+    P_2_9 = P[..., 2, 9]
+    P_2_10 = P[..., 2, 10]
+    P_2_11 = P[..., 2, 11]
+    P_2_12 = P[..., 2, 12]
+    P_2_13 = P[..., 2, 13]
+    P_2_14 = P[..., 2, 14]
+    P_2_15 = P[..., 2, 15]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_2_18 = P[..., 2, 18]
+    P_2_19 = P[..., 2, 19]
+    P_2_20 = P[..., 2, 20]
+    P_2_21 = P[..., 2, 21]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_3 = P[..., 3, 3]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_7 = P[..., 3, 7]
+    P_3_8 = P[..., 3, 8]
+    P_3_9 = P[..., 3, 9]
+    P_3_10 = P[..., 3, 10]
+    P_3_11 = P[..., 3, 11]
+    P_3_12 = P[..., 3, 12]
+    P_3_13 = P[..., 3, 13]
+    P_3_14 = P[..., 3, 14]
+    P_3_15 = P[..., 3, 15]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_3_18 = P[..., 3, 18]
+    P_3_19 = P[..., 3, 19]
+    P_3_20 = P[..., 3, 20]
+    P_3_21 = P[..., 3, 21]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    HK0 = numpy.sin(ant_yaw)
+    HK1 = q0*q3
+    HK2 = q1*q2
+    HK3 = numpy.cos(ant_yaw)
+    HK4 = q1**2
+    HK5 = q2**2
+    HK6 = q0**2 - q3**2
+    HK7 = 2*HK0*(HK1 - HK2) - HK3*(HK4 - HK5 + HK6)
+    HK8 = 1/HK7
+    HK9 = HK3*q0
+    HK10 = HK0*q3
+    HK11 = HK0*(-HK4 + HK5 + HK6) + 2*HK3*(HK1 + HK2)
+    HK12 = HK11*HK8
+    HK13 = HK0*q0 + HK3*q3
+    HK14 = HK8*(HK12*(-HK10 + HK9) + HK13)
+    HK15 = HK11**2/HK7**2 + 1
+    HK16 = 2/HK15
+    HK17 = -1/HK7
+    HK18 = HK0*q2 + HK3*q1
+    HK19 = HK0*q1 - HK3*q2
+    HK20 = HK17*(HK11*HK17*HK18 + HK19)
+    HK21 = HK17*(HK11*HK17*HK19 - HK18)
+    HK22 = HK10 + HK12*HK13 - HK9
+    HK23 = -HK14*P_0_0 - HK20*P_0_1 - HK21*P_0_2 + HK22*HK8*P_0_3
+    HK24 = -HK14*P_0_1 - HK20*P_1_1 - HK21*P_1_2 + HK22*HK8*P_1_3
+    HK25 = HK15**(-2)
+    HK26 = 4*HK25
+    HK27 = -HK14*P_0_2 - HK20*P_1_2 - HK21*P_2_2 + HK22*HK8*P_2_3
+    HK28 = -HK14*P_0_3 - HK20*P_1_3 - HK21*P_2_3 + HK22*HK8*P_3_3
+    HK29 = HK16/(-HK14*HK23*HK26 - HK20*HK24*HK26 - HK21*HK26*HK27 + 4*HK22*HK25*HK28*HK8 + R_YAW)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 0] = -HK14*HK16
+    H[..., 1] = -HK16*HK20
+    H[..., 2] = -HK16*HK21
+    H[..., 3] = HK16*HK22*HK8
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = HK23*HK29
+    K[..., 1] = HK24*HK29
+    K[..., 2] = HK27*HK29
+    K[..., 3] = HK28*HK29
+    K[..., 4] = HK29*(-HK14*P_0_4 - HK20*P_1_4 - HK21*P_2_4 + HK22*HK8*P_3_4)
+    K[..., 5] = HK29*(-HK14*P_0_5 - HK20*P_1_5 - HK21*P_2_5 + HK22*HK8*P_3_5)
+    K[..., 6] = HK29*(-HK14*P_0_6 - HK20*P_1_6 - HK21*P_2_6 + HK22*HK8*P_3_6)
+    K[..., 7] = HK29*(-HK14*P_0_7 - HK20*P_1_7 - HK21*P_2_7 + HK22*HK8*P_3_7)
+    K[..., 8] = HK29*(-HK14*P_0_8 - HK20*P_1_8 - HK21*P_2_8 + HK22*HK8*P_3_8)
+    K[..., 9] = HK29*(-HK14*P_0_9 - HK20*P_1_9 - HK21*P_2_9 + HK22*HK8*P_3_9)
+    K[..., 10] = HK29*(-HK14*P_0_10 - HK20*P_1_10 - HK21*P_2_10 + HK22*HK8*P_3_10)
+    K[..., 11] = HK29*(-HK14*P_0_11 - HK20*P_1_11 - HK21*P_2_11 + HK22*HK8*P_3_11)
+    K[..., 12] = HK29*(-HK14*P_0_12 - HK20*P_1_12 - HK21*P_2_12 + HK22*HK8*P_3_12)
+    K[..., 13] = HK29*(-HK14*P_0_13 - HK20*P_1_13 - HK21*P_2_13 + HK22*HK8*P_3_13)
+    K[..., 14] = HK29*(-HK14*P_0_14 - HK20*P_1_14 - HK21*P_2_14 + HK22*HK8*P_3_14)
+    K[..., 15] = HK29*(-HK14*P_0_15 - HK20*P_1_15 - HK21*P_2_15 + HK22*HK8*P_3_15)
+    K[..., 16] = HK29*(-HK14*P_0_16 - HK20*P_1_16 - HK21*P_2_16 + HK22*HK8*P_3_16)
+    K[..., 17] = HK29*(-HK14*P_0_17 - HK20*P_1_17 - HK21*P_2_17 + HK22*HK8*P_3_17)
+    K[..., 18] = HK29*(-HK14*P_0_18 - HK20*P_1_18 - HK21*P_2_18 + HK22*HK8*P_3_18)
+    K[..., 19] = HK29*(-HK14*P_0_19 - HK20*P_1_19 - HK21*P_2_19 + HK22*HK8*P_3_19)
+    K[..., 20] = HK29*(-HK14*P_0_20 - HK20*P_1_20 - HK21*P_2_20 + HK22*HK8*P_3_20)
+    K[..., 21] = HK29*(-HK14*P_0_21 - HK20*P_1_21 - HK21*P_2_21 + HK22*HK8*P_3_21)
+    K[..., 22] = HK29*(-HK14*P_0_22 - HK20*P_1_22 - HK21*P_2_22 + HK22*HK8*P_3_22)
+    K[..., 23] = HK29*(-HK14*P_0_23 - HK20*P_1_23 - HK21*P_2_23 + HK22*HK8*P_3_23)
+    return H, K
+
+# gps_yaw observation Jacobian and Kalman gain, loop over the filters
+def fuse_gps_yaw_kernel(states, P, R_YAW, ant_yaw):
+    n_filters = P.shape[0]
+    R_YAW = numpy.broadcast_to(numpy.asarray(R_YAW, dtype=numpy.float64), (n_filters,))
+    ant_yaw = numpy.broadcast_to(numpy.asarray(ant_yaw, dtype=numpy.float64), (n_filters,))
+    return _fuse_gps_yaw_kernel(states, P, R_YAW, ant_yaw)
+
+@jit
+def _fuse_gps_yaw_kernel(states, P, R_YAW, ant_yaw):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        q0 = states[index, 0]
+        q1 = states[index, 1]
+        q2 = states[index, 2]
+        q3 = states[index, 3]
+        P_0_0 = P[index, 0, 0]
+        P_0_1 = P[index, 0, 1]
+        P_0_2 = P[index, 0, 2]
+        P_0_3 = P[index, 0, 3]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_7 = P[index, 0, 7]
+        P_0_8 = P[index, 0, 8]
+        P_0_9 = P[index, 0, 9]
+        P_0_10 = P[index, 0, 10]
+        P_0_11 = P[index, 0, 11]
+        P_0_12 = P[index, 0, 12]
+        P_0_13 = P[index, 0, 13]
+        P_0_14 = P[index, 0, 14]
+        P_0_15 = P[index, 0, 15]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_0_18 = P[index, 0, 18]
+        P_0_19 = P[index, 0, 19]
+        P_0_20 = P[index, 0, 20]
+        P_0_21 = P[index, 0, 21]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_1 = P[index, 1, 1]
+        P_1_2 = P[index, 1, 2]
+        P_1_3 = P[index, 1, 3]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_7 = P[index, 1, 7]
+        P_1_8 = P[index, 1, 8]
+        P_1_9 = P[index, 1, 9]
+        P_1_10 = P[index, 1, 10]
+        P_1_11 = P[index, 1, 11]
+        P_1_12 = P[index, 1, 12]
+        P_1_13 = P[index, 1, 13]
+        P_1_14 = P[index, 1, 14]
+        P_1_15 = P[index, 1, 15]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_1_18 = P[index, 1, 18]
+        P_1_19 = P[index, 1, 19]
+        P_1_20 = P[index, 1, 20]
+        P_1_21 = P[index, 1, 21]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_2 = P[index, 2, 2]
+        P_2_3 = P[index, 2, 3]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_7 = P[index, 2, 7]
+        P_2_8 = P[index, 2, 8]
+        P_2_9 = P[index, 2, 9]
+        P_2_10 = P[index, 2, 10]
+        P_2_11 = P[index, 2, 11]
+        P_2_12 = P[index, 2, 12]
+        P_2_13 = P[index, 2, 13]
+        P_2_14 = P[index, 2, 14]
+        P_2_15 = P[index, 2, 15]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_2_18 = P[index, 2, 18]
+        P_2_19 = P[index, 2, 19]
+        P_2_20 = P[index, 2, 20]
+        P_2_21 = P[index, 2, 21]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_3 = P[index, 3, 3]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_7 = P[index, 3, 7]
+        P_3_8 = P[index, 3, 8]
+        P_3_9 = P[index, 3, 9]
+        P_3_10 = P[index, 3, 10]
+        P_3_11 = P[index, 3, 11]
+        P_3_12 = P[index, 3, 12]
+        P_3_13 = P[index, 3, 13]
+        P_3_14 = P[index, 3, 14]
+        P_3_15 = P[index, 3, 15]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_3_18 = P[index, 3, 18]
+        P_3_19 = P[index, 3, 19]
+        P_3_20 = P[index, 3, 20]
+        P_3_21 = P[index, 3, 21]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        HK0 = math.sin(ant_yaw[index])
+        HK1 = q0*q3
+        HK2 = q1*q2
+        HK3 = math.cos(ant_yaw[index])
+        HK4 = q1**2
+        HK5 = q2**2
+        HK6 = q0**2 - q3**2
+        HK7 = 2*HK0*(HK1 - HK2) - HK3*(HK4 - HK5 + HK6)
+        HK8 = 1/HK7
+        HK9 = HK3*q0
+        HK10 = HK0*q3
+        HK11 = HK0*(-HK4 + HK5 + HK6) + 2*HK3*(HK1 + HK2)
+        HK12 = HK11*HK8
+        HK13 = HK0*q0 + HK3*q3
+        HK14 = HK8*(HK12*(-HK10 + HK9) + HK13)
+        HK15 = HK11**2/HK7**2 + 1
+        HK16 = 2/HK15
+        HK17 = -1/HK7
+        HK18 = HK0*q2 + HK3*q1
+        HK19 = HK0*q1 - HK3*q2
+        HK20 = HK17*(HK11*HK17*HK18 + HK19)
+        HK21 = HK17*(HK11*HK17*HK19 - HK18)
+        HK22 = HK10 + HK12*HK13 - HK9
+        HK23 = -HK14*P_0_0 - HK20*P_0_1 - HK21*P_0_2 + HK22*HK8*P_0_3
+        HK24 = -HK14*P_0_1 - HK20*P_1_1 - HK21*P_1_2 + HK22*HK8*P_1_3
+        HK25 = HK15**(-2)
+        HK26 = 4*HK25
+        HK27 = -HK14*P_0_2 - HK20*P_1_2 - HK21*P_2_2 + HK22*HK8*P_2_3
+        HK28 = -HK14*P_0_3 - HK20*P_1_3 - HK21*P_2_3 + HK22*HK8*P_3_3
+        HK29 = HK16/(-HK14*HK23*HK26 - HK20*HK24*HK26 - HK21*HK26*HK27 + 4*HK22*HK25*HK28*HK8 + R_YAW[index])
+        H[index, 0] = -HK14*HK16
+        H[index, 1] = -HK16*HK20
+        H[index, 2] = -HK16*HK21
+        H[index, 3] = HK16*HK22*HK8
+        K[index, 0] = HK23*HK29
+        K[index, 1] = HK24*HK29
+        K[index, 2] = HK27*HK29
+        K[index, 3] = HK28*HK29
+        K[index, 4] = HK29*(-HK14*P_0_4 - HK20*P_1_4 - HK21*P_2_4 + HK22*HK8*P_3_4)
+        K[index, 5] = HK29*(-HK14*P_0_5 - HK20*P_1_5 - HK21*P_2_5 + HK22*HK8*P_3_5)
+        K[index, 6] = HK29*(-HK14*P_0_6 - HK20*P_1_6 - HK21*P_2_6 + HK22*HK8*P_3_6)
+        K[index, 7] = HK29*(-HK14*P_0_7 - HK20*P_1_7 - HK21*P_2_7 + HK22*HK8*P_3_7)
+        K[index, 8] = HK29*(-HK14*P_0_8 - HK20*P_1_8 - HK21*P_2_8 + HK22*HK8*P_3_8)
+        K[index, 9] = HK29*(-HK14*P_0_9 - HK20*P_1_9 - HK21*P_2_9 + HK22*HK8*P_3_9)
+        K[index, 10] = HK29*(-HK14*P_0_10 - HK20*P_1_10 - HK21*P_2_10 + HK22*HK8*P_3_10)
+        K[index, 11] = HK29*(-HK14*P_0_11 - HK20*P_1_11 - HK21*P_2_11 + HK22*HK8*P_3_11)
+        K[index, 12] = HK29*(-HK14*P_0_12 - HK20*P_1_12 - HK21*P_2_12 + HK22*HK8*P_3_12)
+        K[index, 13] = HK29*(-HK14*P_0_13 - HK20*P_1_13 - HK21*P_2_13 + HK22*HK8*P_3_13)
+        K[index, 14] = HK29*(-HK14*P_0_14 - HK20*P_1_14 - HK21*P_2_14 + HK22*HK8*P_3_14)
+        K[index, 15] = HK29*(-HK14*P_0_15 - HK20*P_1_15 - HK21*P_2_15 + HK22*HK8*P_3_15)
+        K[index, 16] = HK29*(-HK14*P_0_16 - HK20*P_1_16 - HK21*P_2_16 + HK22*HK8*P_3_16)
+        K[index, 17] = HK29*(-HK14*P_0_17 - HK20*P_1_17 - HK21*P_2_17 + HK22*HK8*P_3_17)
+        K[index, 18] = HK29*(-HK14*P_0_18 - HK20*P_1_18 - HK21*P_2_18 + HK22*HK8*P_3_18)
+        K[index, 19] = HK29*(-HK14*P_0_19 - HK20*P_1_19 - HK21*P_2_19 + HK22*HK8*P_3_19)
+        K[index, 20] = HK29*(-HK14*P_0_20 - HK20*P_1_20 - HK21*P_2_20 + HK22*HK8*P_3_20)
+        K[index, 21] = HK29*(-HK14*P_0_21 - HK20*P_1_21 - HK21*P_2_21 + HK22*HK8*P_3_21)
+        K[index, 22] = HK29*(-HK14*P_0_22 - HK20*P_1_22 - HK21*P_2_22 + HK22*HK8*P_3_22)
+        K[index, 23] = HK29*(-HK14*P_0_23 - HK20*P_1_23 - HK21*P_2_23 + HK22*HK8*P_3_23)
+    return H, K
+
+# 3Dmag_x observation Jacobian and Kalman gain
+def fuse_3Dmag_x(states, P, R_MAG):
+    q0 = states[..., 0]
+    q1 = states[..., 1]
+    q2 = states[..., 2]
+    q3 = states[..., 3]
+    magN = states[..., 16]
+    magE = states[..., 17]
+    magD = states[..., 18]
+    P_0_0 = P[..., 0, 0]
+    P_0_1 = P[..., 0, 1]
+    P_0_2 = P[..., 0, 2]
+    P_0_3 = P[..., 0, 3]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_7 = P[..., 0, 7]
+    P_0_8 = P[..., 0, 8]
+    P_0_9 = P[..., 0, 9]
+    P_0_10 = P[..., 0, 10]
+    P_0_11 = P[..., 0, 11]
+    P_0_12 = P[..., 0, 12]
+    P_0_13 = P[..., 0, 13]
+    P_0_14 = P[..., 0, 14]
+    P_0_15 = P[..., 0, 15]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_0_18 = P[..., 0, 18]
+    P_0_19 = P[..., 0, 19]
+    P_0_20 = P[..., 0, 20]
+    P_0_21 = P[..., 0, 21]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_1 = P[..., 1, 1]
+    P_1_2 = P[..., 1, 2]
+    P_1_3 = P[..., 1, 3]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_7 = P[..., 1, 7]
+    P_1_8 = P[..., 1, 8]
+    P_1_9 = P[..., 1, 9]
+    P_1_10 = P[..., 1, 10]
+    P_1_11 = P[..., 1, 11]
+    P_1_12 = P[..., 1, 12]
+    P_1_13 = P[..., 1, 13]
+    P_1_14 = P[..., 1, 14]
+    P_1_15 = P[..., 1, 15]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_1_18 = P[..., 1, 18]
+    P_1_19 = P[..., 1, 19]
+    P_1_20 = P[..., 1, 20]
+    P_1_21 = P[..., 1, 21]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_2 = P[..., 2, 2]
+    P_2_3 = P[..., 2, 3]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_7 = P[..., 2, 7]
+    P_2_8 = P[..., 2, 8]
+    P_2_9 = P[..., 2, 9]
+    P_2_10 = P[..., 2, 10]
+    P_2_11 = P[..., 2, 11]
+    P_2_12 = P[..., 2, 12]
+    P_2_13 = P[..., 2, 13]
+    P_2_14 = P[..., 2, 14]
+    P_2_15 = P[..., 2, 15]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_2_18 = P[..., 2, 18]
+    P_2_19 = P[..., 2, 19]
+    P_2_20 = P[..., 2, 20]
+    P_2_21 = P[..., 2, 21]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_3 = P[..., 3, 3]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_7 = P[..., 3, 7]
+    P_3_8 = P[..., 3, 8]
+    P_3_9 = P[..., 3, 9]
+    P_3_10 = P[..., 3, 10]
+    P_3_11 = P[..., 3, 11]
+    P_3_12 = P[..., 3, 12]
+    P_3_13 = P[..., 3, 13]
+    P_3_14 = P[..., 3, 14]
+    P_3_15 = P[..., 3, 15]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_3_18 = P[..., 3, 18]
+    P_3_19 = P[..., 3, 19]
+    P_3_20 = P[..., 3, 20]
+    P_3_21 = P[..., 3, 21]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_4_18 = P[..., 4, 18]
+    P_4_19 = P[..., 4, 19]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_5_18 = P[..., 5, 18]
+    P_5_19 = P[..., 5, 19]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_6_18 = P[..., 6, 18]
+    P_6_19 = P[..., 6, 19]
+    P_7_16 = P[..., 7, 16]
+    P_7_17 = P[..., 7, 17]
+    P_7_18 = P[..., 7, 18]
+    P_7_19 = P[..., 7, 19]
+    P_8_16 = P[..., 8, 16]
+    P_8_17 = P[..., 8, 17]
+    P_8_18 = P[..., 8, 18]
+    P_8_19 = P[..., 8, 19]
+    P_9_16 = P[..., 9, 16]
+    P_9_17 = P[..., 9, 17]
+    P_9_18 = P[..., 9, 18]
+    P_9_19 = P[..., 9, 19]
+    P_10_16 = P[..., 10, 16]
+    P_10_17 = P[..., 10, 17]
+    P_10_18 = P[..., 10, 18]
+    P_10_19 = P[..., 10, 19]
+    P_11_16 = P[..., 11, 16]
+    P_11_17 = P[..., 11, 17]
+    P_11_18 = P[..., 11, 18]
+    P_11_19 = P[..., 11, 19]
+    P_12_16 = P[..., 12, 16]
+    P_12_17 = P[..., 12, 17]
+    P_12_18 = P[..., 12, 18]
+    P_12_19 = P[..., 12, 19]
+    P_13_16 = P[..., 13, 16]
+    P_13_17 = P[..., 13, 17]
+    P_13_18 = P[..., 13, 18]
+    P_13_19 = P[..., 13, 19]
+    P_14_16 = P[..., 14, 16]
+    P_14_17 = P[..., 14, 17]
+    P_14_18 = P[..., 14, 18]
+    P_14_19 = P[..., 14, 19]
+    P_15_16 = P[..., 15, 16]
+    P_15_17 = P[..., 15, 17]
+    P_15_18 = P[..., 15, 18]
+    P_15_19 = P[..., 15, 19]
+    P_16_16 = P[..., 16, 16]
+    P_16_17 = P[..., 16, 17]
+    P_16_18 = P[..., 16, 18]
+    P_16_19 = P[..., 16, 19]
+    P_16_20 = P[..., 16, 20]
+    P_16_21 = P[..., 16, 21]
+    P_16_22 = P[..., 16, 22]
+    P_16_23 = P[..., 16, 23]
+    P_17_17 = P[..., 17, 17]
+    P_17_18 = P[..., 17, 18]
+    P_17_19 = P[..., 17, 19]
+    P_17_20 = P[..., 17, 20]
+    P_17_21 = P[..., 17, 21]
+    P_17_22 = P[..., 17, 22]
+    P_17_23 = P[..., 17, 23]
+    P_18_18 = P[..., 18, 18]
+    P_18_19 = P[..., 18, 19]
+    P_18_20 = P[..., 18, 20]
+    P_18_21 = P[..., 18, 21]
+    P_18_22 = P[..., 18, 22]
+    P_18_23 = P[..., 18, 23]
+    P_19_19 = P[..., 19, 19]
+    P_19_20 = P[..., 19, 20]
+    P_19_21 = P[..., 19, 21]
+    P_19_22 = P[..., 19, 22]
+    P_19_23 = P[..., 19, 23]
+    HKX0 = -magD*q2 + magE*q3 + magN*q0
+    HKX1 = magD*q3 + magE*q2 + magN*q1
+    HKX2 = magD*q0 - magE*q1 + magN*q2
+    HKX3 = magD*q1 + magE*q0 - magN*q3
+    HKX4 = q0**2 + q1**2 - q2**2 - q3**2
+    HKX5 = q0*q3 + q1*q2
+    HKX6 = q0*q2 - q1*q3
+    HKX7 = 2*HKX5
+    HKX8 = 2*HKX6
+    HKX9 = 2*HKX1
+    HKX10 = 2*HKX0
+    HKX11 = 2*HKX2
+    HKX12 = 2*HKX3
+    HKX13 = HKX10*P_0_0 - HKX11*P_0_2 + HKX12*P_0_3 + HKX4*P_0_16 + HKX7*P_0_17 - HKX8*P_0_18 + HKX9*P_0_1 + P_0_19
+    HKX14 = HKX10*P_0_16 - HKX11*P_2_16 + HKX12*P_3_16 + HKX4*P_16_16 + HKX7*P_16_17 - HKX8*P_16_18 + HKX9*P_1_16 + P_16_19
+    HKX15 = HKX10*P_0_18 - HKX11*P_2_18 + HKX12*P_3_18 + HKX4*P_16_18 + HKX7*P_17_18 - HKX8*P_18_18 + HKX9*P_1_18 + P_18_19
+    HKX16 = HKX10*P_0_2 - HKX11*P_2_2 + HKX12*P_2_3 + HKX4*P_2_16 + HKX7*P_2_17 - HKX8*P_2_18 + HKX9*P_1_2 + P_2_19
+    HKX17 = HKX10*P_0_17 - HKX11*P_2_17 + HKX12*P_3_17 + HKX4*P_16_17 + HKX7*P_17_17 - HKX8*P_17_18 + HKX9*P_1_17 + P_17_19
+    HKX18 = HKX10*P_0_3 - HKX11*P_2_3 + HKX12*P_3_3 + HKX4*P_3_16 + HKX7*P_3_17 - HKX8*P_3_18 + HKX9*P_1_3 + P_3_19
+    HKX19 = HKX10*P_0_1 - HKX11*P_1_2 + HKX12*P_1_3 + HKX4*P_1_16 + HKX7*P_1_17 - HKX8*P_1_18 + HKX9*P_1_1 + P_1_19
+    HKX20 = HKX10*P_0_19 - HKX11*P_2_19 + HKX12*P_3_19 + HKX4*P_16_19 + HKX7*P_17_19 - HKX8*P_18_19 + HKX9*P_1_19 + P_19_19
+    HKX21 = 1/(HKX10*HKX13 - HKX11*HKX16 + HKX12*HKX18 + HKX14*HKX4 - HKX15*HKX8 + HKX17*HKX7 + HKX19*HKX9 + HKX20 + R_MAG)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 0] = 2*HKX0
+    H[..., 1] = 2*HKX1
+    H[..., 2] = -2*HKX2
+    H[..., 3] = 2*HKX3
+    H[..., 16] = HKX4
+    H[..., 17] = 2*HKX5
+    H[..., 18] = -2*HKX6
+    H[..., 19] = 1
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = HKX13*HKX21
+    K[..., 1] = HKX19*HKX21
+    K[..., 2] = HKX16*HKX21
+    K[..., 3] = HKX18*HKX21
+    K[..., 4] = HKX21*(HKX10*P_0_4 - HKX11*P_2_4 + HKX12*P_3_4 + HKX4*P_4_16 + HKX7*P_4_17 - HKX8*P_4_18 + HKX9*P_1_4 + P_4_19)
+    K[..., 5] = HKX21*(HKX10*P_0_5 - HKX11*P_2_5 + HKX12*P_3_5 + HKX4*P_5_16 + HKX7*P_5_17 - HKX8*P_5_18 + HKX9*P_1_5 + P_5_19)
+    K[..., 6] = HKX21*(HKX10*P_0_6 - HKX11*P_2_6 + HKX12*P_3_6 + HKX4*P_6_16 + HKX7*P_6_17 - HKX8*P_6_18 + HKX9*P_1_6 + P_6_19)
+    K[..., 7] = HKX21*(HKX10*P_0_7 - HKX11*P_2_7 + HKX12*P_3_7 + HKX4*P_7_16 + HKX7*P_7_17 - HKX8*P_7_18 + HKX9*P_1_7 + P_7_19)
+    K[..., 8] = HKX21*(HKX10*P_0_8 - HKX11*P_2_8 + HKX12*P_3_8 + HKX4*P_8_16 + HKX7*P_8_17 - HKX8*P_8_18 + HKX9*P_1_8 + P_8_19)
+    K[..., 9] = HKX21*(HKX10*P_0_9 - HKX11*P_2_9 + HKX12*P_3_9 + HKX4*P_9_16 + HKX7*P_9_17 - HKX8*P_9_18 + HKX9*P_1_9 + P_9_19)
+    K[..., 10] = HKX21*(HKX10*P_0_10 - HKX11*P_2_10 + HKX12*P_3_10 + HKX4*P_10_16 + HKX7*P_10_17 - HKX8*P_10_18 + HKX9*P_1_10 + P_10_19)
+    K[..., 11] = HKX21*(HKX10*P_0_11 - HKX11*P_2_11 + HKX12*P_3_11 + HKX4*P_11_16 + HKX7*P_11_17 - HKX8*P_11_18 + HKX9*P_1_11 + P_11_19)
+    K[..., 12] = HKX21*(HKX10*P_0_12 - HKX11*P_2_12 + HKX12*P_3_12 + HKX4*P_12_16 + HKX7*P_12_17 - HKX8*P_12_18 + HKX9*P_1_12 + P_12_19)
+    K[..., 13] = HKX21*(HKX10*P_0_13 - HKX11*P_2_13 + HKX12*P_3_13 + HKX4*P_13_16 + HKX7*P_13_17 - HKX8*P_13_18 + HKX9*P_1_13 + P_13_19)
+    K[..., 14] = HKX21*(HKX10*P_0_14 - HKX11*P_2_14 + HKX12*P_3_14 + HKX4*P_14_16 + HKX7*P_14_17 - HKX8*P_14_18 + HKX9*P_1_14 + P_14_19)
+    K[..., 15] = HKX21*(HKX10*P_0_15 - HKX11*P_2_15 + HKX12*P_3_15 + HKX4*P_15_16 + HKX7*P_15_17 - HKX8*P_15_18 + HKX9*P_1_15 + P_15_19)
+    K[..., 16] = HKX14*HKX21
+    K[..., 17] = HKX17*HKX21
+    K[..., 18] = HKX15*HKX21
+    K[..., 19] = HKX20*HKX21
+    K[..., 20] = HKX21*(HKX10*P_0_20 - HKX11*P_2_20 + HKX12*P_3_20 + HKX4*P_16_20 + HKX7*P_17_20 - HKX8*P_18_20 + HKX9*P_1_20 + P_19_20)
+    K[..., 21] = HKX21*(HKX10*P_0_21 - HKX11*P_2_21 + HKX12*P_3_21 + HKX4*P_16_21 + HKX7*P_17_21 - HKX8*P_18_21 + HKX9*P_1_21 + P_19_21)
+    K[..., 22] = HKX21*(HKX10*P_0_22 - HKX11*P_2_22 + HKX12*P_3_22 + HKX4*P_16_22 + HKX7*P_17_22 - HKX8*P_18_22 + HKX9*P_1_22 + P_19_22)
+    K[..., 23] = HKX21*(HKX10*P_0_23 - HKX11*P_2_23 + HKX12*P_3_23 + HKX4*P_16_23 + HKX7*P_17_23 - HKX8*P_18_23 + HKX9*P_1_23 + P_19_23)
+    return H, K
+
+# 3Dmag_x observation Jacobian and Kalman gain, loop over the filters
+def fuse_3Dmag_x_kernel(states, P, R_MAG):
+    n_filters = P.shape[0]
+    R_MAG = numpy.broadcast_to(numpy.asarray(R_MAG, dtype=numpy.float64), (n_filters,))
+    return _fuse_3Dmag_x_kernel(states, P, R_MAG)
+
+@jit
+def _fuse_3Dmag_x_kernel(states, P, R_MAG):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        q0 = states[index, 0]
+        q1 = states[index, 1]
+        q2 = states[index, 2]
+        q3 = states[index, 3]
+        magN = states[index, 16]
+        magE = states[index, 17]
+        magD = states[index, 18]
+        P_0_0 = P[index, 0, 0]
+        P_0_1 = P[index, 0, 1]
+        P_0_2 = P[index, 0, 2]
+        P_0_3 = P[index, 0, 3]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_7 = P[index, 0, 7]
+        P_0_8 = P[index, 0, 8]
+        P_0_9 = P[index, 0, 9]
+        P_0_10 = P[index, 0, 10]
+        P_0_11 = P[index, 0, 11]
+        P_0_12 = P[index, 0, 12]
+        P_0_13 = P[index, 0, 13]
+        P_0_14 = P[index, 0, 14]
+        P_0_15 = P[index, 0, 15]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_0_18 = P[index, 0, 18]
+        P_0_19 = P[index, 0, 19]
+        P_0_20 = P[index, 0, 20]
+        P_0_21 = P[index, 0, 21]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_1 = P[index, 1, 1]
+        P_1_2 = P[index, 1, 2]
+        P_1_3 = P[index, 1, 3]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_7 = P[index, 1, 7]
+        P_1_8 = P[index, 1, 8]
+        P_1_9 = P[index, 1, 9]
+        P_1_10 = P[index, 1, 10]
+        P_1_11 = P[index, 1, 11]
+        P_1_12 = P[index, 1, 12]
+        P_1_13 = P[index, 1, 13]
+        P_1_14 = P[index, 1, 14]
+        P_1_15 = P[index, 1, 15]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_1_18 = P[index, 1, 18]
+        P_1_19 = P[index, 1, 19]
+        P_1_20 = P[index, 1, 20]
+        P_1_21 = P[index, 1, 21]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_2 = P[index, 2, 2]
+        P_2_3 = P[index, 2, 3]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_7 = P[index, 2, 7]
+        P_2_8 = P[index, 2, 8]
+        P_2_9 = P[index, 2, 9]
+        P_2_10 = P[index, 2, 10]
+        P_2_11 = P[index, 2, 11]
+        P_2_12 = P[index, 2, 12]
+        P_2_13 = P[index, 2, 13]
+        P_2_14 = P[index, 2, 14]
+        P_2_15 = P[index, 2, 15]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_2_18 = P[index, 2, 18]
+        P_2_19 = P[index, 2, 19]
+        P_2_20 = P[index, 2, 20]
+        P_2_21 = P[index, 2, 21]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_3 = P[index, 3, 3]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_7 = P[index, 3, 7]
+        P_3_8 = P[index, 3, 8]
+        P_3_9 = P[index, 3, 9]
+        P_3_10 = P[index, 3, 10]
+        P_3_11 = P[index, 3, 11]
+        P_3_12 = P[index, 3, 12]
+        P_3_13 = P[index, 3, 13]
+        P_3_14 = P[index, 3, 14]
+        P_3_15 = P[index, 3, 15]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_3_18 = P[index, 3, 18]
+        P_3_19 = P[index, 3, 19]
+        P_3_20 = P[index, 3, 20]
+        P_3_21 = P[index, 3, 21]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_4_18 = P[index, 4, 18]
+        P_4_19 = P[index, 4, 19]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_5_18 = P[index, 5, 18]
+        P_5_19 = P[index, 5, 19]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_6_18 = P[index, 6, 18]
+        P_6_19 = P[index, 6, 19]
+        P_7_16 = P[index, 7, 16]
+        P_7_17 = P[index, 7, 17]
+        P_7_18 = P[index, 7, 18]
+        P_7_19 = P[index, 7, 19]
+        P_8_16 = P[index, 8, 16]
+        P_8_17 = P[index, 8, 17]
+        P_8_18 = P[index, 8, 18]
+        P_8_19 = P[index, 8, 19]
+        P_9_16 = P[index, 9, 16]
+        P_9_17 = P[index, 9, 17]
+        P_9_18 = P[index, 9, 18]
+        P_9_19 = P[index, 9, 19]
+        P_10_16 = P[index, 10, 16]
+        P_10_17 = P[index, 10, 17]
+        P_10_18 = P[index, 10, 18]
+        P_10_19 = P[index, 10, 19]
+        P_11_16 = P[index, 11, 16]
+        P_11_17 = P[index, 11, 17]
+        P_11_18 = P[index, 11, 18]
+        P_11_19 = P[index, 11, 19]
+        P_12_16 = P[index, 12, 16]
+        P_12_17 = P[index, 12, 17]
+        P_12_18 = P[index, 12, 18]
+        P_12_19 = P[index, 12, 19]
+        P_13_16 = P[index, 13, 16]
+        P_13_17 = P[index, 13, 17]
+        P_13_18 = P[index, 13, 18]
+        P_13_19 = P[index, 13, 19]
+        P_14_16 = P[index, 14, 16]
+        P_14_17 = P[index, 14, 17]
+        P_14_18 = P[index, 14, 18]
+        P_14_19 = P[index, 14, 19]
+        P_15_16 = P[index, 15, 16]
+        P_15_17 = P[index, 15, 17]
+        P_15_18 = P[index, 15, 18]
+        P_15_19 = P[index, 15, 19]
+        P_16_16 = P[index, 16, 16]
+        P_16_17 = P[index, 16, 17]
+        P_16_18 = P[index, 16, 18]
+        P_16_19 = P[index, 16, 19]
+        P_16_20 = P[index, 16, 20]
+        P_16_21 = P[index, 16, 21]
+        P_16_22 = P[index, 16, 22]
+        P_16_23 = P[index, 16, 23]
+        P_17_17 = P[index, 17, 17]
+        P_17_18 = P[index, 17, 18]
+        P_17_19 = P[index, 17, 19]
+        P_17_20 = P[index, 17, 20]
+        P_17_21 = P[index, 17, 21]
+        P_17_22 = P[index, 17, 22]
+        P_17_23 = P[index, 17, 23]
+        P_18_18 = P[index, 18, 18]
+        P_18_19 = P[index, 18, 19]
+        P_18_20 = P[index, 18, 20]
+        P_18_21 = P[index, 18, 21]
+        P_18_22 = P[index, 18, 22]
+        P_18_23 = P[index, 18, 23]
+        P_19_19 = P[index, 19, 19]
+        P_19_20 = P[index, 19, 20]
+        P_19_21 = P[index, 19, 21]
+        P_19_22 = P[index, 19, 22]
+        P_19_23 = P[index, 19, 23]
+        HKX0 = -magD*q2 + magE*q3 + magN*q0
+        HKX1 = magD*q3 + magE*q2 + magN*q1
+        HKX2 = magD*q0 - magE*q1 + magN*q2
+        HKX3 = magD*q1 + magE*q0 - magN*q3
+        HKX4 = q0**2 + q1**2 - q2**2 - q3**2
+        HKX5 = q0*q3 + q1*q2
+        HKX6 = q0*q2 - q1*q3
+        HKX7 = 2*HKX5
+        HKX8 = 2*HKX6
+        HKX9 = 2*HKX1
+        HKX10 = 2*HKX0
+        HKX11 = 2*HKX2
+        HKX12 = 2*HKX3
+        HKX13 = HKX10*P_0_0 - HKX11*P_0_2 + HKX12*P_0_3 + HKX4*P_0_16 + HKX7*P_0_17 - HKX8*P_0_18 + HKX9*P_0_1 + P_0_19
+        HKX14 = HKX10*P_0_16 - HKX11*P_2_16 + HKX12*P_3_16 + HKX4*P_16_16 + HKX7*P_16_17 - HKX8*P_16_18 + HKX9*P_1_16 + P_16_19
+        HKX15 = HKX10*P_0_18 - HKX11*P_2_18 + HKX12*P_3_18 + HKX4*P_16_18 + HKX7*P_17_18 - HKX8*P_18_18 + HKX9*P_1_18 + P_18_19
+        HKX16 = HKX10*P_0_2 - HKX11*P_2_2 + HKX12*P_2_3 + HKX4*P_2_16 + HKX7*P_2_17 - HKX8*P_2_18 + HKX9*P_1_2 + P_2_19
+        HKX17 = HKX10*P_0_17 - HKX11*P_2_17 + HKX12*P_3_17 + HKX4*P_16_17 + HKX7*P_17_17 - HKX8*P_17_18 + HKX9*P_1_17 + P_17_19
+        HKX18 = HKX10*P_0_3 - HKX11*P_2_3 + HKX12*P_3_3 + HKX4*P_3_16 + HKX7*P_3_17 - HKX8*P_3_18 + HKX9*P_1_3 + P_3_19
+        HKX19 = HKX10*P_0_1 - HKX11*P_1_2 + HKX12*P_1_3 + HKX4*P_1_16 + HKX7*P_1_17 - HKX8*P_1_18 + HKX9*P_1_1 + P_1_19
+        HKX20 = HKX10*P_0_19 - HKX11*P_2_19 + HKX12*P_3_19 + HKX4*P_16_19 + HKX7*P_17_19 - HKX8*P_18_19 + HKX9*P_1_19 + P_19_19
+        HKX21 = 1/(HKX10*HKX13 - HKX11*HKX16 + HKX12*HKX18 + HKX14*HKX4 - HKX15*HKX8 + HKX17*HKX7 + HKX19*HKX9 + HKX20 + R_MAG[index])
+        H[index, 0] = 2*HKX0
+        H[index, 1] = 2*HKX1
+        H[index, 2] = -2*HKX2
+        H[index, 3] = 2*HKX3
+        H[index, 16] = HKX4
+        H[index, 17] = 2*HKX5
+        H[index, 18] = -2*HKX6
+        H[index, 19] = 1
+        K[index, 0] = HKX13*HKX21
+        K[index, 1] = HKX19*HKX21
+        K[index, 2] = HKX16*HKX21
+        K[index, 3] = HKX18*HKX21
+        K[index, 4] = HKX21*(HKX10*P_0_4 - HKX11*P_2_4 + HKX12*P_3_4 + HKX4*P_4_16 + HKX7*P_4_17 - HKX8*P_4_18 + HKX9*P_1_4 + P_4_19)
+        K[index, 5] = HKX21*(HKX10*P_0_5 - HKX11*P_2_5 + HKX12*P_3_5 + HKX4*P_5_16 + HKX7*P_5_17 - HKX8*P_5_18 + HKX9*P_1_5 + P_5_19)
+        K[index, 6] = HKX21*(HKX10*P_0_6 - HKX11*P_2_6 + HKX12*P_3_6 + HKX4*P_6_16 + HKX7*P_6_17 - HKX8*P_6_18 + HKX9*P_1_6 + P_6_19)
+        K[index, 7] = HKX21*(HKX10*P_0_7 - HKX11*P_2_7 + HKX12*P_3_7 + HKX4*P_7_16 + HKX7*P_7_17 - HKX8*P_7_18 + HKX9*P_1_7 + P_7_19)
+        K[index, 8] = HKX21*(HKX10*P_0_8 - HKX11*P_2_8 + HKX12*P_3_8 + HKX4*P_8_16 + HKX7*P_8_17 - HKX8*P_8_18 + HKX9*P_1_8 + P_8_19)
+        K[index, 9] = HKX21*(HKX10*P_0_9 - HKX11*P_2_9 + HKX12*P_3_9 + HKX4*P_9_16 + HKX7*P_9_17 - HKX8*P_9_18 + HKX9*P_1_9 + P_9_19)
+        K[index, 10] = HKX21*(HKX10*P_0_10 - HKX11*P_2_10 + HKX12*P_3_10 + HKX4*P_10_16 + HKX7*P_10_17 - HKX8*P_10_18 + HKX9*P_1_10 + P_10_19)
+        K[index, 11] = HKX21*(HKX10*P_0_11 - HKX11*P_2_11 + HKX12*P_3_11 + HKX4*P_11_16 + HKX7*P_11_17 - HKX8*P_11_18 + HKX9*P_1_11 + P_11_19)
+        K[index, 12] = HKX21*(HKX10*P_0_12 - HKX11*P_2_12 + HKX12*P_3_12 + HKX4*P_12_16 + HKX7*P_12_17 - HKX8*P_12_18 + HKX9*P_1_12 + P_12_19)
+        K[index, 13] = HKX21*(HKX10*P_0_13 - HKX11*P_2_13 + HKX12*P_3_13 + HKX4*P_13_16 + HKX7*P_13_17 - HKX8*P_13_18 + HKX9*P_1_13 + P_13_19)
+        K[index, 14] = HKX21*(HKX10*P_0_14 - HKX11*P_2_14 + HKX12*P_3_14 + HKX4*P_14_16 + HKX7*P_14_17 - HKX8*P_14_18 + HKX9*P_1_14 + P_14_19)
+        K[index, 15] = HKX21*(HKX10*P_0_15 - HKX11*P_2_15 + HKX12*P_3_15 + HKX4*P_15_16 + HKX7*P_15_17 - HKX8*P_15_18 + HKX9*P_1_15 + P_15_19)
+        K[index, 16] = HKX14*HKX21
+        K[index, 17] = HKX17*HKX21
+        K[index, 18] = HKX15*HKX21
+        K[index, 19] = HKX20*HKX21
+        K[index, 20] = HKX21*(HKX10*P_0_20 - HKX11*P_2_20 + HKX12*P_3_20 + HKX4*P_16_20 + HKX7*P_17_20 - HKX8*P_18_20 + HKX9*P_1_20 + P_19_20)
+        K[index, 21] = HKX21*(HKX10*P_0_21 - HKX11*P_2_21 + HKX12*P_3_21 + HKX4*P_16_21 + HKX7*P_17_21 - HKX8*P_18_21 + HKX9*P_1_21 + P_19_21)
+        K[index, 22] = HKX21*(HKX10*P_0_22 - HKX11*P_2_22 + HKX12*P_3_22 + HKX4*P_16_22 + HKX7*P_17_22 - HKX8*P_18_22 + HKX9*P_1_22 + P_19_22)
+        K[index, 23] = HKX21*(HKX10*P_0_23 - HKX11*P_2_23 + HKX12*P_3_23 + HKX4*P_16_23 + HKX7*P_17_23 - HKX8*P_18_23 + HKX9*P_1_23 + P_19_23)
+    return H, K
+
+# 3Dmag_y observation Jacobian and Kalman gain
+def fuse_3Dmag_y(states, P, R_MAG):
+    q0 = states[..., 0]
+    q1 = states[..., 1]
+    q2 = states[..., 2]
+    q3 = states[..., 3]
+    magN = states[..., 16]
+    magE = states[..., 17]
+    magD = states[..., 18]
+    P_0_0 = P[..., 0, 0]
+    P_0_1 = P[..., 0, 1]
+    P_0_2 = P[..., 0, 2]
+    P_0_3 = P[..., 0, 3]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_7 = P[..., 0, 7]
+    P_0_8 = P[..., 0, 8]
+    P_0_9 = P[..., 0, 9]
+    P_0_10 = P[..., 0, 10]
+    P_0_11 = P[..., 0, 11]
+    P_0_12 = P[..., 0, 12]
+    P_0_13 = P[..., 0, 13]
+    P_0_14 = P[..., 0, 14]
+    P_0_15 = P[..., 0, 15]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_0_18 = P[..., 0, 18]
+    P_0_19 = P[..., 0, 19]
+    P_0_20 = P[..., 0, 20]
+    P_0_21 = P[..., 0, 21]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_1 = P[..., 1, 1]
+    P_1_2 = P[..., 1, 2]
+    P_1_3 = P[..., 1, 3]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_7 = P[..., 1, 7]
+    P_1_8 = P[..., 1, 8]
+    P_1_9 = P[..., 1, 9]
+    P_1_10 = P[..., 1, 10]
+    P_1_11 = P[..., 1, 11]
+    P_1_12 = P[..., 1, 12]
+    P_1_13 = P[..., 1, 13]
+    P_1_14 = P[..., 1, 14]
+    P_1_15 = P[..., 1, 15]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_1_18 = P[..., 1, 18]
+    P_1_19 = P[..., 1, 19]
+    P_1_20 = P[..., 1, 20]
+    P_1_21 = P[..., 1, 21]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_2 = P[..., 2, 2]
+    P_2_3 = P[..., 2, 3]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_7 = P[..., 2, 7]
+    P_2_8 = P[..., 2, 8]
+    P_2_9 = P[..., 2, 9]
+    P_2_10 = P[..., 2, 10]
+    P_2_11 = P[..., 2, 11]
+    P_2_12 = P[..., 2, 12]
+    P_2_13 = P[..., 2, 13]
+    P_2_14 = P[..., 2, 14]
+    P_2_15 = P[..., 2, 15]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_2_18 = P[..., 2, 18]
+    P_2_19 = P[..., 2, 19]
+    P_2_20 = P[..., 2, 20]
+    P_2_21 = P[..., 2, 21]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_3 = P[..., 3, 3]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_7 = P[..., 3, 7]
+    P_3_8 = P[..., 3, 8]
+    P_3_9 = P[..., 3, 9]
+    P_3_10 = P[..., 3, 10]
+    P_3_11 = P[..., 3, 11]
+    P_3_12 = P[..., 3, 12]
+    P_3_13 = P[..., 3, 13]
+    P_3_14 = P[..., 3, 14]
+    P_3_15 = P[..., 3, 15]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_3_18 = P[..., 3, 18]
+    P_3_19 = P[..., 3, 19]
+    P_3_20 = P[..., 3, 20]
+    P_3_21 = P[..., 3, 21]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_4_18 = P[..., 4, 18]
+    P_4_20 = P[..., 4, 20]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_5_18 = P[..., 5, 18]
+    P_5_20 = P[..., 5, 20]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_6_18 = P[..., 6, 18]
+    P_6_20 = P[..., 6, 20]
+    P_7_16 = P[..., 7, 16]
+    P_7_17 = P[..., 7, 17]
+    P_7_18 = P[..., 7, 18]
+    P_7_20 = P[..., 7, 20]
+    P_8_16 = P[..., 8, 16]
+    P_8_17 = P[..., 8, 17]
+    P_8_18 = P[..., 8, 18]
+    P_8_20 = P[..., 8, 20]
+    P_9_16 = P[..., 9, 16]
+    P_9_17 = P[..., 9, 17]
+    P_9_18 = P[..., 9, 18]
+    P_9_20 = P[..., 9, 20]
+    P_10_16 = P[..., 10, 16]
+    P_10_17 = P[..., 10, 17]
+    P_10_18 = P[..., 10, 18]
+    P_10_20 = P[..., 10, 20]
+    P_11_16 = P[..., 11, 16]
+    P_11_17 = P[..., 11, 17]
+    P_11_18 = P[..., 11, 18]
+    P_11_20 = P[..., 11, 20]
+    P_12_16 = P[..., 12, 16]
+    P_12_17 = P[..., 12, 17]
+    P_12_18 = P[..., 12, 18]
+    P_12_20 = P[..., 12, 20]
+    P_13_16 = P[..., 13, 16]
+    P_13_17 = P[..., 13, 17]
+    P_13_18 = P[..., 13, 18]
+    P_13_20 = P[..., 13, 20]
+    P_14_16 = P[..., 14, 16]
+    P_14_17 = P[..., 14, 17]
+    P_14_18 = P[..., 14, 18]
+    P_14_20 = P[..., 14, 20]
+    P_15_16 = P[..., 15, 16]
+    P_15_17 = P[..., 15, 17]
+    P_15_18 = P[..., 15, 18]
+    P_15_20 = P[..., 15, 20]
+    P_16_16 = P[..., 16, 16]
+    P_16_17 = P[..., 16, 17]
+    P_16_18 = P[..., 16, 18]
+    P_16_19 = P[..., 16, 19]
+    P_16_20 = P[..., 16, 20]
+    P_16_21 = P[..., 16, 21]
+    P_16_22 = P[..., 16, 22]
+    P_16_23 = P[..., 16, 23]
+    P_17_17 = P[..., 17, 17]
+    P_17_18 = P[..., 17, 18]
+    P_17_19 = P[..., 17, 19]
+    P_17_20 = P[..., 17, 20]
+    P_17_21 = P[..., 17, 21]
+    P_17_22 = P[..., 17, 22]
+    P_17_23 = P[..., 17, 23]
+    P_18_18 = P[..., 18, 18]
+    P_18_19 = P[..., 18, 19]
+    P_18_20 = P[..., 18, 20]
+    P_18_21 = P[..., 18, 21]
+    P_18_22 = P[..., 18, 22]
+    P_18_23 = P[..., 18, 23]
+    P_19_20 = P[..., 19, 20]
+    P_20_20 = P[..., 20, 20]
+    P_20_21 = P[..., 20, 21]
+    P_20_22 = P[..., 20, 22]
+    P_20_23 = P[..., 20, 23]
+    HKY0 = magD*q1 + magE*q0 - magN*q3
+    HKY1 = magD*q0 - magE*q1 + magN*q2
+    HKY2 = magD*q3 + magE*q2 + magN*q1
+    HKY3 = -magD*q2 + magE*q3 + magN*q0
+    HKY4 = q0*q3 - q1*q2
+    HKY5 = q0**2 - q1**2 + q2**2 - q3**2
+    HKY6 = q0*q1 + q2*q3
+    HKY7 = 2*HKY6
+    HKY8 = 2*HKY4
+    HKY9 = 2*HKY2
+    HKY10 = 2*HKY0
+    HKY11 = 2*HKY1
+    HKY12 = 2*HKY3
+    HKY13 = HKY10*P_0_0 + HKY11*P_0_1 - HKY12*P_0_3 + HKY5*P_0_17 + HKY7*P_0_18 - HKY8*P_0_16 + HKY9*P_0_2 + P_0_20
+    HKY14 = HKY10*P_0_17 + HKY11*P_1_17 - HKY12*P_3_17 + HKY5*P_17_17 + HKY7*P_17_18 - HKY8*P_16_17 + HKY9*P_2_17 + P_17_20
+    HKY15 = HKY10*P_0_16 + HKY11*P_1_16 - HKY12*P_3_16 + HKY5*P_16_17 + HKY7*P_16_18 - HKY8*P_16_16 + HKY9*P_2_16 + P_16_20
+    HKY16 = HKY10*P_0_3 + HKY11*P_1_3 - HKY12*P_3_3 + HKY5*P_3_17 + HKY7*P_3_18 - HKY8*P_3_16 + HKY9*P_2_3 + P_3_20
+    HKY17 = HKY10*P_0_18 + HKY11*P_1_18 - HKY12*P_3_18 + HKY5*P_17_18 + HKY7*P_18_18 - HKY8*P_16_18 + HKY9*P_2_18 + P_18_20
+    HKY18 = HKY10*P_0_1 + HKY11*P_1_1 - HKY12*P_1_3 + HKY5*P_1_17 + HKY7*P_1_18 - HKY8*P_1_16 + HKY9*P_1_2 + P_1_20
+    HKY19 = HKY10*P_0_2 + HKY11*P_1_2 - HKY12*P_2_3 + HKY5*P_2_17 + HKY7*P_2_18 - HKY8*P_2_16 + HKY9*P_2_2 + P_2_20
+    HKY20 = HKY10*P_0_20 + HKY11*P_1_20 - HKY12*P_3_20 + HKY5*P_17_20 + HKY7*P_18_20 - HKY8*P_16_20 + HKY9*P_2_20 + P_20_20
+    HKY21 = 1/(HKY10*HKY13 + HKY11*HKY18 - HKY12*HKY16 + HKY14*HKY5 - HKY15*HKY8 + HKY17*HKY7 + HKY19*HKY9 + HKY20 + R_MAG)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 0] = 2*HKY0
+    H[..., 1] = 2*HKY1
+    H[..., 2] = 2*HKY2
+    H[..., 3] = -2*HKY3
+    H[..., 16] = -2*HKY4
+    H[..., 17] = HKY5
+    H[..., 18] = 2*HKY6
+    H[..., 20] = 1
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = HKY13*HKY21
+    K[..., 1] = HKY18*HKY21
+    K[..., 2] = HKY19*HKY21
+    K[..., 3] = HKY16*HKY21
+    K[..., 4] = HKY21*(HKY10*P_0_4 + HKY11*P_1_4 - HKY12*P_3_4 + HKY5*P_4_17 + HKY7*P_4_18 - HKY8*P_4_16 + HKY9*P_2_4 + P_4_20)
+    K[..., 5] = HKY21*(HKY10*P_0_5 + HKY11*P_1_5 - HKY12*P_3_5 + HKY5*P_5_17 + HKY7*P_5_18 - HKY8*P_5_16 + HKY9*P_2_5 + P_5_20)
+    K[..., 6] = HKY21*(HKY10*P_0_6 + HKY11*P_1_6 - HKY12*P_3_6 + HKY5*P_6_17 + HKY7*P_6_18 - HKY8*P_6_16 + HKY9*P_2_6 + P_6_20)
+    K[..., 7] = HKY21*(HKY10*P_0_7 + HKY11*P_1_7 - HKY12*P_3_7 + HKY5*P_7_17 + HKY7*P_7_18 - HKY8*P_7_16 + HKY9*P_2_7 + P_7_20)
+    K[..., 8] = HKY21*(HKY10*P_0_8 + HKY11*P_1_8 - HKY12*P_3_8 + HKY5*P_8_17 + HKY7*P_8_18 - HKY8*P_8_16 + HKY9*P_2_8 + P_8_20)
+    K[..., 9] = HKY21*(HKY10*P_0_9 + HKY11*P_1_9 - HKY12*P_3_9 + HKY5*P_9_17 + HKY7*P_9_18 - HKY8*P_9_16 + HKY9*P_2_9 + P_9_20)
+    K[..., 10] = HKY21*(HKY10*P_0_10 + HKY11*P_1_10 - HKY12*P_3_10 + HKY5*P_10_17 + HKY7*P_10_18 - HKY8*P_10_16 + HKY9*P_2_10 + P_10_20)
+    K[..., 11] = HKY21*(HKY10*P_0_11 + HKY11*P_1_11 - HKY12*P_3_11 + HKY5*P_11_17 + HKY7*P_11_18 - HKY8*P_11_16 + HKY9*P_2_11 + P_11_20)
+    K[..., 12] = HKY21*(HKY10*P_0_12 + HKY11*P_1_12 - HKY12*P_3_12 + HKY5*P_12_17 + HKY7*P_12_18 - HKY8*P_12_16 + HKY9*P_2_12 + P_12_20)
+    K[..., 13] = HKY21*(HKY10*P_0_13 + HKY11*P_1_13 - HKY12*P_3_13 + HKY5*P_13_17 + HKY7*P_13_18 - HKY8*P_13_16 + HKY9*P_2_13 + P_13_20)
+    K[..., 14] = HKY21*(HKY10*P_0_14 + HKY11*P_1_14 - HKY12*P_3_14 + HKY5*P_14_17 + HKY7*P_14_18 - HKY8*P_14_16 + HKY9*P_2_14 + P_14_20)
+    K[..., 15] = HKY21*(HKY10*P_0_15 + HKY11*P_1_15 - HKY12*P_3_15 + HKY5*P_15_17 + HKY7*P_15_18 - HKY8*P_15_16 + HKY9*P_2_15 + P_15_20)
+    K[..., 16] = HKY15*HKY21
+    K[..., 17] = HKY14*HKY21
+    K[..., 18] = HKY17*HKY21
+    K[..., 19] = HKY21*(HKY10*P_0_19 + HKY11*P_1_19 - HKY12*P_3_19 + HKY5*P_17_19 + HKY7*P_18_19 - HKY8*P_16_19 + HKY9*P_2_19 + P_19_20)
+    K[..., 20] = HKY20*HKY21
+    K[..., 21] = HKY21*(HKY10*P_0_21 + HKY11*P_1_21 - HKY12*P_3_21 + HKY5*P_17_21 + HKY7*P_18_21 - HKY8*P_16_21 + HKY9*P_2_21 + P_20_21)
+    K[..., 22] = HKY21*(HKY10*P_0_22 + HKY11*P_1_22 - HKY12*P_3_22 + HKY5*P_17_22 + HKY7*P_18_22 - HKY8*P_16_22 + HKY9*P_2_22 + P_20_22)
+    K[..., 23] = HKY21*(HKY10*P_0_23 + HKY11*P_1_23 - HKY12*P_3_23 + HKY5*P_17_23 + HKY7*P_18_23 - HKY8*P_16_23 + HKY9*P_2_23 + P_20_23)
+    return H, K
+
+# 3Dmag_y observation Jacobian and Kalman gain, loop over the filters
+def fuse_3Dmag_y_kernel(states, P, R_MAG):
+    n_filters = P.shape[0]
+    R_MAG = numpy.broadcast_to(numpy.asarray(R_MAG, dtype=numpy.float64), (n_filters,))
+    return _fuse_3Dmag_y_kernel(states, P, R_MAG)
+
+@jit
+def _fuse_3Dmag_y_kernel(states, P, R_MAG):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        q0 = states[index, 0]
+        q1 = states[index, 1]
+        q2 = states[index, 2]
+        q3 = states[index, 3]
+        magN = states[index, 16]
+        magE = states[index, 17]
+        magD = states[index, 18]
+        P_0_0 = P[index, 0, 0]
+        P_0_1 = P[index, 0, 1]
+        P_0_2 = P[index, 0, 2]
+        P_0_3 = P[index, 0, 3]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_7 = P[index, 0, 7]
+        P_0_8 = P[index, 0, 8]
+        P_0_9 = P[index, 0, 9]
+        P_0_10 = P[index, 0, 10]
+        P_0_11 = P[index, 0, 11]
+        P_0_12 = P[index, 0, 12]
+        P_0_13 = P[index, 0, 13]
+        P_0_14 = P[index, 0, 14]
+        P_0_15 = P[index, 0, 15]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_0_18 = P[index, 0, 18]
+        P_0_19 = P[index, 0, 19]
+        P_0_20 = P[index, 0, 20]
+        P_0_21 = P[index, 0, 21]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_1 = P[index, 1, 1]
+        P_1_2 = P[index, 1, 2]
+        P_1_3 = P[index, 1, 3]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_7 = P[index, 1, 7]
+        P_1_8 = P[index, 1, 8]
+        P_1_9 = P[index, 1, 9]
+        P_1_10 = P[index, 1, 10]
+        P_1_11 = P[index, 1, 11]
+        P_1_12 = P[index, 1, 12]
+        P_1_13 = P[index, 1, 13]
+        P_1_14 = P[index, 1, 14]
+        P_1_15 = P[index, 1, 15]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_1_18 = P[index, 1, 18]
+        P_1_19 = P[index, 1, 19]
+        P_1_20 = P[index, 1, 20]
+        P_1_21 = P[index, 1, 21]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_2 = P[index, 2, 2]
+        P_2_3 = P[index, 2, 3]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_7 = P[index, 2, 7]
+        P_2_8 = P[index, 2, 8]
+        P_2_9 = P[index, 2, 9]
+        P_2_10 = P[index, 2, 10]
+        P_2_11 = P[index, 2, 11]
+        P_2_12 = P[index, 2, 12]
+        P_2_13 = P[index, 2, 13]
+        P_2_14 = P[index, 2, 14]
+        P_2_15 = P[index, 2, 15]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_2_18 = P[index, 2, 18]
+        P_2_19 = P[index, 2, 19]
+        P_2_20 = P[index, 2, 20]
+        P_2_21 = P[index, 2, 21]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_3 = P[index, 3, 3]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_7 = P[index, 3, 7]
+        P_3_8 = P[index, 3, 8]
+        P_3_9 = P[index, 3, 9]
+        P_3_10 = P[index, 3, 10]
+        P_3_11 = P[index, 3, 11]
+        P_3_12 = P[index, 3, 12]
+        P_3_13 = P[index, 3, 13]
+        P_3_14 = P[index, 3, 14]
+        P_3_15 = P[index, 3, 15]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_3_18 = P[index, 3, 18]
+        P_3_19 = P[index, 3, 19]
+        P_3_20 = P[index, 3, 20]
+        P_3_21 = P[index, 3, 21]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_4_18 = P[index, 4, 18]
+        P_4_20 = P[index, 4, 20]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_5_18 = P[index, 5, 18]
+        P_5_20 = P[index, 5, 20]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_6_18 = P[index, 6, 18]
+        P_6_20 = P[index, 6, 20]
+        P_7_16 = P[index, 7, 16]
+        P_7_17 = P[index, 7, 17]
+        P_7_18 = P[index, 7, 18]
+        P_7_20 = P[index, 7, 20]
+        P_8_16 = P[index, 8, 16]
+        P_8_17 = P[index, 8, 17]
+        P_8_18 = P[index, 8, 18]
+        P_8_20 = P[index, 8, 20]
+        P_9_16 = P[index, 9, 16]
+        P_9_17 = P[index, 9, 17]
+        P_9_18 = P[index, 9, 18]
+        P_9_20 = P[index, 9, 20]
+        P_10_16 = P[index, 10, 16]
+        P_10_17 = P[index, 10, 17]
+        P_10_18 = P[index, 10, 18]
+        P_10_20 = P[index, 10, 20]
+        P_11_16 = P[index, 11, 16]
+        P_11_17 = P[index, 11, 17]
+        P_11_18 = P[index, 11, 18]
+        P_11_20 = P[index, 11, 20]
+        P_12_16 = P[index, 12, 16]
+        P_12_17 = P[index, 12, 17]
+        P_12_18 = P[index, 12, 18]
+        P_12_20 = P[index, 12, 20]
+        P_13_16 = P[index, 13, 16]
+        P_13_17 = P[index, 13, 17]
+        P_13_18 = P[index, 13, 18]
+        P_13_20 = P[index, 13, 20]
+        P_14_16 = P[index, 14, 16]
+        P_14_17 = P[index, 14, 17]
+        P_14_18 = P[index, 14, 18]
+        P_14_20 = P[index, 14, 20]
+        P_15_16 = P[index, 15, 16]
+        P_15_17 = P[index, 15, 17]
+        P_15_18 = P[index, 15, 18]
+        P_15_20 = P[index, 15, 20]
+        P_16_16 = P[index, 16, 16]
+        P_16_17 = P[index, 16, 17]
+        P_16_18 = P[index, 16, 18]
+        P_16_19 = P[index, 16, 19]
+        P_16_20 = P[index, 16, 20]
+        P_16_21 = P[index, 16, 21]
+        P_16_22 = P[index, 16, 22]
+        P_16_23 = P[index, 16, 23]
+        P_17_17 = P[index, 17, 17]
+        P_17_18 = P[index, 17, 18]
+        P_17_19 = P[index, 17, 19]
+        P_17_20 = P[index, 17, 20]
+        P_17_21 = P[index, 17, 21]
+        P_17_22 = P[index, 17, 22]
+        P_17_23 = P[index, 17, 23]
+        P_18_18 = P[index, 18, 18]
+        P_18_19 = P[index, 18, 19]
+        P_18_20 = P[index, 18, 20]
+        P_18_21 = P[index, 18, 21]
+        P_18_22 = P[index, 18, 22]
+        P_18_23 = P[index, 18, 23]
+        P_19_20 = P[index, 19, 20]
+        P_20_20 = P[index, 20, 20]
+        P_20_21 = P[index, 20, 21]
+        P_20_22 = P[index, 20, 22]
+        P_20_23 = P[index, 20, 23]
+        HKY0 = magD*q1 + magE*q0 - magN*q3
+        HKY1 = magD*q0 - magE*q1 + magN*q2
+        HKY2 = magD*q3 + magE*q2 + magN*q1
+        HKY3 = -magD*q2 + magE*q3 + magN*q0
+        HKY4 = q0*q3 - q1*q2
+        HKY5 = q0**2 - q1**2 + q2**2 - q3**2
+        HKY6 = q0*q1 + q2*q3
+        HKY7 = 2*HKY6
+        HKY8 = 2*HKY4
+        HKY9 = 2*HKY2
+        HKY10 = 2*HKY0
+        HKY11 = 2*HKY1
+        HKY12 = 2*HKY3
+        HKY13 = HKY10*P_0_0 + HKY11*P_0_1 - HKY12*P_0_3 + HKY5*P_0_17 + HKY7*P_0_18 - HKY8*P_0_16 + HKY9*P_0_2 + P_0_20
+        HKY14 = HKY10*P_0_17 + HKY11*P_1_17 - HKY12*P_3_17 + HKY5*P_17_17 + HKY7*P_17_18 - HKY8*P_16_17 + HKY9*P_2_17 + P_17_20
+        HKY15 = HKY10*P_0_16 + HKY11*P_1_16 - HKY12*P_3_16 + HKY5*P_16_17 + HKY7*P_16_18 - HKY8*P_16_16 + HKY9*P_2_16 + P_16_20
+        HKY16 = HKY10*P_0_3 + HKY11*P_1_3 - HKY12*P_3_3 + HKY5*P_3_17 + HKY7*P_3_18 - HKY8*P_3_16 + HKY9*P_2_3 + P_3_20
+        HKY17 = HKY10*P_0_18 + HKY11*P_1_18 - HKY12*P_3_18 + HKY5*P_17_18 + HKY7*P_18_18 - HKY8*P_16_18 + HKY9*P_2_18 + P_18_20
+        HKY18 = HKY10*P_0_1 + HKY11*P_1_1 - HKY12*P_1_3 + HKY5*P_1_17 + HKY7*P_1_18 - HKY8*P_1_16 + HKY9*P_1_2 + P_1_20
+        HKY19 = HKY10*P_0_2 + HKY11*P_1_2 - HKY12*P_2_3 + HKY5*P_2_17 + HKY7*P_2_18 - HKY8*P_2_16 + HKY9*P_2_2 + P_2_20
+        HKY20 = HKY10*P_0_20 + HKY11*P_1_20 - HKY12*P_3_20 + HKY5*P_17_20 + HKY7*P_18_20 - HKY8*P_16_20 + HKY9*P_2_20 + P_20_20
+        HKY21 = 1/(HKY10*HKY13 + HKY11*HKY18 - HKY12*HKY16 + HKY14*HKY5 - HKY15*HKY8 + HKY17*HKY7 + HKY19*HKY9 + HKY20 + R_MAG[index])
+        H[index, 0] = 2*HKY0
+        H[index, 1] = 2*HKY1
+        H[index, 2] = 2*HKY2
+        H[index, 3] = -2*HKY3
+        H[index, 16] = -2*HKY4
+        H[index, 17] = HKY5
+        H[index, 18] = 2*HKY6
+        H[index, 20] = 1
+        K[index, 0] = HKY13*HKY21
+        K[index, 1] = HKY18*HKY21
+        K[index, 2] = HKY19*HKY21
+        K[index, 3] = HKY16*HKY21
+        K[index, 4] = HKY21*(HKY10*P_0_4 + HKY11*P_1_4 - HKY12*P_3_4 + HKY5*P_4_17 + HKY7*P_4_18 - HKY8*P_4_16 + HKY9*P_2_4 + P_4_20)
+        K[index, 5] = HKY21*(HKY10*P_0_5 + HKY11*P_1_5 - HKY12*P_3_5 + HKY5*P_5_17 + HKY7*P_5_18 - HKY8*P_5_16 + HKY9*P_2_5 + P_5_20)
+        K[index, 6] = HKY21*(HKY10*P_0_6 + HKY11*P_1_6 - HKY12*P_3_6 + HKY5*P_6_17 + HKY7*P_6_18 - HKY8*P_6_16 + HKY9*P_2_6 + P_6_20)
+        K[index, 7] = HKY21*(HKY10*P_0_7 + HKY11*P_1_7 - HKY12*P_3_7 + HKY5*P_7_17 + HKY7*P_7_18 - HKY8*P_7_16 + HKY9*P_2_7 + P_7_20)
+        K[index, 8] = HKY21*(HKY10*P_0_8 + HKY11*P_1_8 - HKY12*P_3_8 + HKY5*P_8_17 + HKY7*P_8_18 - HKY8*P_8_16 + HKY9*P_2_8 + P_8_20)
+        K[index, 9] = HKY21*(HKY10*P_0_9 + HKY11*P_1_9 - HKY12*P_3_9 + HKY5*P_9_17 + HKY7*P_9_18 - HKY8*P_9_16 + HKY9*P_2_9 + P_9_20)
+        K[index, 10] = HKY21*(HKY10*P_0_10 + HKY11*P_1_10 - HKY12*P_3_10 + HKY5*P_10_17 + HKY7*P_10_18 - HKY8*P_10_16 + HKY9*P_2_10 + P_10_20)
+        K[index, 11] = HKY21*(HKY10*P_0_11 + HKY11*P_1_11 - HKY12*P_3_11 + HKY5*P_11_17 + HKY7*P_11_18 - HKY8*P_11_16 + HKY9*P_2_11 + P_11_20)
+        K[index, 12] = HKY21*(HKY10*P_0_12 + HKY11*P_1_12 - HKY12*P_3_12 + HKY5*P_12_17 + HKY7*P_12_18 - HKY8*P_12_16 + HKY9*P_2_12 + P_12_20)
+        K[index, 13] = HKY21*(HKY10*P_0_13 + HKY11*P_1_13 - HKY12*P_3_13 + HKY5*P_13_17 + HKY7*P_13_18 - HKY8*P_13_16 + HKY9*P_2_13 + P_13_20)
+        K[index, 14] = HKY21*(HKY10*P_0_14 + HKY11*P_1_14 - HKY12*P_3_14 + HKY5*P_14_17 + HKY7*P_14_18 - HKY8*P_14_16 + HKY9*P_2_14 + P_14_20)
+        K[index, 15] = HKY21*(HKY10*P_0_15 + HKY11*P_1_15 - HKY12*P_3_15 + HKY5*P_15_17 + HKY7*P_15_18 - HKY8*P_15_16 + HKY9*P_2_15 + P_15_20)
+        K[index, 16] = HKY15*HKY21
+        K[index, 17] = HKY14*HKY21
+        K[index, 18] = HKY17*HKY21
+        K[index, 19] = HKY21*(HKY10*P_0_19 + HKY11*P_1_19 - HKY12*P_3_19 + HKY5*P_17_19 + HKY7*P_18_19 - HKY8*P_16_19 + HKY9*P_2_19 + P_19_20)
+        K[index, 20] = HKY20*HKY21
+        K[index, 21] = HKY21*(HKY10*P_0_21 + HKY11*P_1_21 - HKY12*P_3_21 + HKY5*P_17_21 + HKY7*P_18_21 - HKY8*P_16_21 + HKY9*P_2_21 + P_20_21)
+        K[index, 22] = HKY21*(HKY10*P_0_22 + HKY11*P_1_22 - HKY12*P_3_22 + HKY5*P_17_22 + HKY7*P_18_22 - HKY8*P_16_22 + HKY9*P_2_22 + P_20_22)
+        K[index, 23] = HKY21*(HKY10*P_0_23 + HKY11*P_1_23 - HKY12*P_3_23 + HKY5*P_17_23 + HKY7*P_18_23 - HKY8*P_16_23 + HKY9*P_2_23 + P_20_23)
+    return H, K
+
+# 3Dmag_z observation Jacobian and Kalman gain
+def fuse_3Dmag_z(states, P, R_MAG):
+    q0 = states[..., 0]
+    q1 = states[..., 1]
+    q2 = states[..., 2]
+    q3 = states[..., 3]
+    magN = states[..., 16]
+    magE = states[..., 17]
+    magD = states[..., 18]
+    P_0_0 = P[..., 0, 0]
+    P_0_1 = P[..., 0, 1]
+    P_0_2 = P[..., 0, 2]
+    P_0_3 = P[..., 0, 3]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_7 = P[..., 0, 7]
+    P_0_8 = P[..., 0, 8]
+    P_0_9 = P[..., 0, 9]
+    P_0_10 = P[..., 0, 10]
+    P_0_11 = P[..., 0, 11]
+    P_0_12 = P[..., 0, 12]
+    P_0_13 = P[..., 0, 13]
+    P_0_14 = P[..., 0, 14]
+    P_0_15 = P[..., 0, 15]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_0_18 = P[..., 0, 18]
+    P_0_19 = P[..., 0, 19]
+    P_0_20 = P[..., 0, 20]
+    P_0_21 = P[..., 0, 21]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_1 = P[..., 1, 1]
+    P_1_2 = P[..., 1, 2]
+    P_1_3 = P[..., 1, 3]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_7 = P[..., 1, 7]
+    P_1_8 = P[..., 1, 8]
+    P_1_9 = P[..., 1, 9]
+    P_1_10 = P[..., 1, 10]
+    P_1_11 = P[..., 1, 11]
+    P_1_12 = P[..., 1, 12]
+    P_1_13 = P[..., 1, 13]
+    P_1_14 = P[..., 1, 14]
+    P_1_15 = P[..., 1, 15]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_1_18 = P[..., 1, 18]
+    P_1_19 = P[..., 1, 19]
+    P_1_20 = P[..., 1, 20]
+    P_1_21 = P[..., 1, 21]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_2 = P[..., 2, 2]
+    P_2_3 = P[..., 2, 3]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_7 = P[..., 2, 7]
+    P_2_8 = P[..., 2, 8]
+    P_2_9 = P[..., 2, 9]
+    P_2_10 = P[..., 2, 10]
+    P_2_11 = P[..., 2, 11]
+    P_2_12 = P[..., 2, 12]
+    P_2_13 = P[..., 2, 13]
+    P_2_14 = P[..., 2, 14]
+    P_2_15 = P[..., 2, 15]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_2_18 = P[..., 2, 18]
+    P_2_19 = P[..., 2, 19]
+    P_2_20 = P[..., 2, 20]
+    P_2_21 = P[..., 2, 21]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_3 = P[..., 3, 3]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_7 = P[..., 3, 7]
+    P_3_8 = P[..., 3, 8]
+    P_3_9 = P[..., 3, 9]
+    P_3_10 = P[..., 3, 10]
+    P_3_11 = P[..., 3, 11]
+    P_3_12 = P[..., 3, 12]
+    P_3_13 = P[..., 3, 13]
+    P_3_14 = P[..., 3, 14]
+    P_3_15 = P[..., 3, 15]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_3_18 = P[..., 3, 18]
+    P_3_19 = P[..., 3, 19]
+    P_3_20 = P[..., 3, 20]
+    P_3_21 = P[..., 3, 21]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_4_18 = P[..., 4, 18]
+    P_4_21 = P[..., 4, 21]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_5_18 = P[..., 5, 18]
+    P_5_21 = P[..., 5, 21]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_6_18 = P[..., 6, 18]
+    P_6_21 = P[..., 6, 21]
+    P_7_16 = P[..., 7, 16]
+    P_7_17 = P[..., 7, 17]
+    P_7_18 = P[..., 7, 18]
+    P_7_21 = P[..., 7, 21]
+    P_8_16 = P[..., 8, 16]
+    P_8_17 = P[..., 8, 17]
+    P_8_18 = P[..., 8, 18]
+    P_8_21 = P[..., 8, 21]
+    P_9_16 = P[..., 9, 16]
+    P_9_17 = P[..., 9, 17]
+    P_9_18 = P[..., 9, 18]
+    P_9_21 = P[..., 9, 21]
+    P_10_16 = P[..., 10, 16]
+    P_10_17 = P[..., 10, 17]
+    P_10_18 = P[..., 10, 18]
+    P_10_21 = P[..., 10, 21]
+    P_11_16 = P[..., 11, 16]
+    P_11_17 = P[..., 11, 17]
+    P_11_18 = P[..., 11, 18]
+    P_11_21 = P[..., 11, 21]
+    P_12_16 = P[..., 12, 16]
+    P_12_17 = P[..., 12, 17]
+    P_12_18 = P[..., 12, 18]
+    P_12_21 = P[..., 12, 21]
+    P_13_16 = P[..., 13, 16]
+    P_13_17 = P[..., 13, 17]
+    P_13_18 = P[..., 13, 18]
+    P_13_21 = P[..., 13, 21]
+    P_14_16 = P[..., 14, 16]
+    P_14_17 = P[..., 14, 17]
+    P_14_18 = P[..., 14, 18]
+    P_14_21 = P[..., 14, 21]
+    P_15_16 = P[..., 15, 16]
+    P_15_17 = P[..., 15, 17]
+    P_15_18 = P[..., 15, 18]
+    P_15_21 = P[..., 15, 21]
+    P_16_16 = P[..., 16, 16]
+    P_16_17 = P[..., 16, 17]
+    P_16_18 = P[..., 16, 18]
+    P_16_19 = P[..., 16, 19]
+    P_16_20 = P[..., 16, 20]
+    P_16_21 = P[..., 16, 21]
+    P_16_22 = P[..., 16, 22]
+    P_16_23 = P[..., 16, 23]
+    P_17_17 = P[..., 17, 17]
+    P_17_18 = P[..., 17, 18]
+    P_17_19 = P[..., 17, 19]
+    P_17_20 = P[..., 17, 20]
+    P_17_21 = P[..., 17, 21]
+    P_17_22 = P[..., 17, 22]
+    P_17_23 = P[..., 17, 23]
+    P_18_18 = P[..., 18, 18]
+    P_18_19 = P[..., 18, 19]
+    P_18_20 = P[..., 18, 20]
+    P_18_21 = P[..., 18, 21]
+    P_18_22 = P[..., 18, 22]
+    P_18_23 = P[..., 18, 23]
+    P_19_21 = P[..., 19, 21]
+    P_20_21 = P[..., 20, 21]
+    P_21_21 = P[..., 21, 21]
+    P_21_22 = P[..., 21, 22]
+    P_21_23 = P[..., 21, 23]
+    HKZ0 = magD*q0 - magE*q1 + magN*q2
+    HKZ1 = magD*q1 + magE*q0 - magN*q3
+    HKZ2 = -magD*q2 + magE*q3 + magN*q0
+    HKZ3 = magD*q3 + magE*q2 + magN*q1
+    HKZ4 = q0*q2 + q1*q3
+    HKZ5 = q0*q1 - q2*q3
+    HKZ6 = q0**2 - q1**2 - q2**2 + q3**2
+    HKZ7 = 2*HKZ4
+    HKZ8 = 2*HKZ5
+    HKZ9 = 2*HKZ3
+    HKZ10 = 2*HKZ0
+    HKZ11 = 2*HKZ1
+    HKZ12 = 2*HKZ2
+    HKZ13 = HKZ10*P_0_0 - HKZ11*P_0_1 + HKZ12*P_0_2 + HKZ6*P_0_18 + HKZ7*P_0_16 - HKZ8*P_0_17 + HKZ9*P_0_3 + P_0_21
+    HKZ14 = HKZ10*P_0_18 - HKZ11*P_1_18 + HKZ12*P_2_18 + HKZ6*P_18_18 + HKZ7*P_16_18 - HKZ8*P_17_18 + HKZ9*P_3_18 + P_18_21
+    HKZ15 = HKZ10*P_0_17 - HKZ11*P_1_17 + HKZ12*P_2_17 + HKZ6*P_17_18 + HKZ7*P_16_17 - HKZ8*P_17_17 + HKZ9*P_3_17 + P_17_21
+    HKZ16 = HKZ10*P_0_1 - HKZ11*P_1_1 + HKZ12*P_1_2 + HKZ6*P_1_18 + HKZ7*P_1_16 - HKZ8*P_1_17 + HKZ9*P_1_3 + P_1_21
+    HKZ17 = HKZ10*P_0_16 - HKZ11*P_1_16 + HKZ12*P_2_16 + HKZ6*P_16_18 + HKZ7*P_16_16 - HKZ8*P_16_17 + HKZ9*P_3_16 + P_16_21
+    HKZ18 = HKZ10*P_0_3 - HKZ11*P_1_3 + HKZ12*P_2_3 + HKZ6*P_3_18 + HKZ7*P_3_16 - HKZ8*P_3_17 + HKZ9*P_3_3 + P_3_21
+    HKZ19 = HKZ10*P_0_2 - HKZ11*P_1_2 + HKZ12*P_2_2 + HKZ6*P_2_18 + HKZ7*P_2_16 - HKZ8*P_2_17 + HKZ9*P_2_3 + P_2_21
+    HKZ20 = HKZ10*P_0_21 - HKZ11*P_1_21 + HKZ12*P_2_21 + HKZ6*P_18_21 + HKZ7*P_16_21 - HKZ8*P_17_21 + HKZ9*P_3_21 + P_21_21
+    HKZ21 = 1/(HKZ10*HKZ13 - HKZ11*HKZ16 + HKZ12*HKZ19 + HKZ14*HKZ6 - HKZ15*HKZ8 + HKZ17*HKZ7 + HKZ18*HKZ9 + HKZ20 + R_MAG)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 0] = 2*HKZ0
+    H[..., 1] = -2*HKZ1
+    H[..., 2] = 2*HKZ2
+    H[..., 3] = 2*HKZ3
+    H[..., 16] = 2*HKZ4
+    H[..., 17] = -2*HKZ5
+    H[..., 18] = HKZ6
+    H[..., 21] = 1
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = HKZ13*HKZ21
+    K[..., 1] = HKZ16*HKZ21
+    K[..., 2] = HKZ19*HKZ21
+    K[..., 3] = HKZ18*HKZ21
+    K[..., 4] = HKZ21*(HKZ10*P_0_4 - HKZ11*P_1_4 + HKZ12*P_2_4 + HKZ6*P_4_18 + HKZ7*P_4_16 - HKZ8*P_4_17 + HKZ9*P_3_4 + P_4_21)
+    K[..., 5] = HKZ21*(HKZ10*P_0_5 - HKZ11*P_1_5 + HKZ12*P_2_5 + HKZ6*P_5_18 + HKZ7*P_5_16 - HKZ8*P_5_17 + HKZ9*P_3_5 + P_5_21)
+    K[..., 6] = HKZ21*(HKZ10*P_0_6 - HKZ11*P_1_6 + HKZ12*P_2_6 + HKZ6*P_6_18 + HKZ7*P_6_16 - HKZ8*P_6_17 + HKZ9*P_3_6 + P_6_21)
+    K[..., 7] = HKZ21*(HKZ10*P_0_7 - HKZ11*P_1_7 + HKZ12*P_2_7 + HKZ6*P_7_18 + HKZ7*P_7_16 - HKZ8*P_7_17 + HKZ9*P_3_7 + P_7_21)
+    K[..., 8] = HKZ21*(HKZ10*P_0_8 - HKZ11*P_1_8 + HKZ12*P_2_8 + HKZ6*P_8_18 + HKZ7*P_8_16 - HKZ8*P_8_17 + HKZ9*P_3_8 + P_8_21)
+    K[..., 9] = HKZ21*(HKZ10*P_0_9 - HKZ11*P_1_9 + HKZ12*P_2_9 + HKZ6*P_9_18 + HKZ7*P_9_16 - HKZ8*P_9_17 + HKZ9*P_3_9 + P_9_21)
+    K[..., 10] = HKZ21*(HKZ10*P_0_10 - HKZ11*P_1_10 + HKZ12*P_2_10 + HKZ6*P_10_18 + HKZ7*P_10_16 - HKZ8*P_10_17 + HKZ9*P_3_10 + P_10_21)
+    K[..., 11] = HKZ21*(HKZ10*P_0_11 - HKZ11*P_1_11 + HKZ12*P_2_11 + HKZ6*P_11_18 + HKZ7*P_11_16 - HKZ8*P_11_17 + HKZ9*P_3_11 + P_11_21)
+    K[..., 12] = HKZ21*(HKZ10*P_0_12 - HKZ11*P_1_12 + HKZ12*P_2_12 + HKZ6*P_12_18 + HKZ7*P_12_16 - HKZ8*P_12_17 + HKZ9*P_3_12 + P_12_21)
+    K[..., 13] = HKZ21*(HKZ10*P_0_13 - HKZ11*P_1_13 + HKZ12*P_2_13 + HKZ6*P_13_18 + HKZ7*P_13_16 - HKZ8*P_13_17 + HKZ9*P_3_13 + P_13_21)
+    K[..., 14] = HKZ21*(HKZ10*P_0_14 - HKZ11*P_1_14 + HKZ12*P_2_14 + HKZ6*P_14_18 + HKZ7*P_14_16 - HKZ8*P_14_17 + HKZ9*P_3_14 + P_14_21)
+    K[..., 15] = HKZ21*(HKZ10*P_0_15 - HKZ11*P_1_15 + HKZ12*P_2_15 + HKZ6*P_15_18 + HKZ7*P_15_16 - HKZ8*P_15_17 + HKZ9*P_3_15 + P_15_21)
+    K[..., 16] = HKZ17*HKZ21
+    K[..., 17] = HKZ15*HKZ21
+    K[..., 18] = HKZ14*HKZ21
+    K[..., 19] = HKZ21*(HKZ10*P_0_19 - HKZ11*P_1_19 + HKZ12*P_2_19 + HKZ6*P_18_19 + HKZ7*P_16_19 - HKZ8*P_17_19 + HKZ9*P_3_19 + P_19_21)
+    K[..., 20] = HKZ21*(HKZ10*P_0_20 - HKZ11*P_1_20 + HKZ12*P_2_20 + HKZ6*P_18_20 + HKZ7*P_16_20 - HKZ8*P_17_20 + HKZ9*P_3_20 + P_20_21)
+    K[..., 21] = HKZ20*HKZ21
+    K[..., 22] = HKZ21*(HKZ10*P_0_22 - HKZ11*P_1_22 + HKZ12*P_2_22 + HKZ6*P_18_22 + HKZ7*P_16_22 - HKZ8*P_17_22 + HKZ9*P_3_22 + P_21_22)
+    K[..., 23] = HKZ21*(HKZ10*P_0_23 - HKZ11*P_1_23 + HKZ12*P_2_23 + HKZ6*P_18_23 + HKZ7*P_16_23 - HKZ8*P_17_23 + HKZ9*P_3_23 + P_21_23)
+    return H, K
+
+# 3Dmag_z observation Jacobian and Kalman gain, loop over the filters
+def fuse_3Dmag_z_kernel(states, P, R_MAG):
+    n_filters = P.shape[0]
+    R_MAG = numpy.broadcast_to(numpy.asarray(R_MAG, dtype=numpy.float64), (n_filters,))
+    return _fuse_3Dmag_z_kernel(states, P, R_MAG)
+
+@jit
+def _fuse_3Dmag_z_kernel(states, P, R_MAG):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        q0 = states[index, 0]
+        q1 = states[index, 1]
+        q2 = states[index, 2]
+        q3 = states[index, 3]
+        magN = states[index, 16]
+        magE = states[index, 17]
+        magD = states[index, 18]
+        P_0_0 = P[index, 0, 0]
+        P_0_1 = P[index, 0, 1]
+        P_0_2 = P[index, 0, 2]
+        P_0_3 = P[index, 0, 3]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_7 = P[index, 0, 7]
+        P_0_8 = P[index, 0, 8]
+        P_0_9 = P[index, 0, 9]
+        P_0_10 = P[index, 0, 10]
+        P_0_11 = P[index, 0, 11]
+        P_0_12 = P[index, 0, 12]
+        P_0_13 = P[index, 0, 13]
+        P_0_14 = P[index, 0, 14]
+        P_0_15 = P[index, 0, 15]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_0_18 = P[index, 0, 18]
+        P_0_19 = P[index, 0, 19]
+        P_0_20 = P[index, 0, 20]
+        P_0_21 = P[index, 0, 21]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_1 = P[index, 1, 1]
+        P_1_2 = P[index, 1, 2]
+        P_1_3 = P[index, 1, 3]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_7 = P[index, 1, 7]
+        P_1_8 = P[index, 1, 8]
+        P_1_9 = P[index, 1, 9]
+        P_1_10 = P[index, 1, 10]
+        P_1_11 = P[index, 1, 11]
+        P_1_12 = P[index, 1, 12]
+        P_1_13 = P[index, 1, 13]
+        P_1_14 = P[index, 1, 14]
+        P_1_15 = P[index, 1, 15]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_1_18 = P[index, 1, 18]
+        P_1_19 = P[index, 1, 19]
+        P_1_20 = P[index, 1, 20]
+        P_1_21 = P[index, 1, 21]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_2 = P[index, 2, 2]
+        P_2_3 = P[index, 2, 3]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_7 = P[index, 2, 7]
+        P_2_8 = P[index, 2, 8]
+        P_2_9 = P[index, 2, 9]
+        P_2_10 = P[index, 2, 10]
+        P_2_11 = P[index, 2, 11]
+        P_2_12 = P[index, 2, 12]
+        P_2_13 = P[index, 2, 13]
+        P_2_14 = P[index, 2, 14]
+        P_2_15 = P[index, 2, 15]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_2_18 = P[index, 2, 18]
+        P_2_19 = P[index, 2, 19]
+        P_2_20 = P[index, 2, 20]
+        P_2_21 = P[index, 2, 21]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_3 = P[index, 3, 3]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_7 = P[index, 3, 7]
+        P_3_8 = P[index, 3, 8]
+        P_3_9 = P[index, 3, 9]
+        P_3_10 = P[index, 3, 10]
+        P_3_11 = P[index, 3, 11]
+        P_3_12 = P[index, 3, 12]
+        P_3_13 = P[index, 3, 13]
+        P_3_14 = P[index, 3, 14]
+        P_3_15 = P[index, 3, 15]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_3_18 = P[index, 3, 18]
+        P_3_19 = P[index, 3, 19]
+        P_3_20 = P[index, 3, 20]
+        P_3_21 = P[index, 3, 21]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_4_18 = P[index, 4, 18]
+        P_4_21 = P[index, 4, 21]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_5_18 = P[index, 5, 18]
+        P_5_21 = P[index, 5, 21]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_6_18 = P[index, 6, 18]
+        P_6_21 = P[index, 6, 21]
+        P_7_16 = P[index, 7, 16]
+        P_7_17 = P[index, 7, 17]
+        P_7_18 = P[index, 7, 18]
+        P_7_21 = P[index, 7, 21]
+        P_8_16 = P[index, 8, 16]
+        P_8_17 = P[index, 8, 17]
+        P_8_18 = P[index, 8, 18]
+        P_8_21 = P[index, 8, 21]
+        P_9_16 = P[index, 9, 16]
+        P_9_17 = P[index, 9, 17]
+        P_9_18 = P[index, 9, 18]
+        P_9_21 = P[index, 9, 21]
+        P_10_16 = P[index, 10, 16]
+        P_10_17 = P[index, 10, 17]
+        P_10_18 = P[index, 10, 18]
+        P_10_21 = P[index, 10, 21]
+        P_11_16 = P[index, 11, 16]
+        P_11_17 = P[index, 11, 17]
+        P_11_18 = P[index, 11, 18]
+        P_11_21 = P[index, 11, 21]
+        P_12_16 = P[index, 12, 16]
+        P_12_17 = P[index, 12, 17]
+        P_12_18 = P[index, 12, 18]
+        P_12_21 = P[index, 12, 21]
+        P_13_16 = P[index, 13, 16]
+        P_13_17 = P[index, 13, 17]
+        P_13_18 = P[index, 13, 18]
+        P_13_21 = P[index, 13, 21]
+        P_14_16 = P[index, 14, 16]
+        P_14_17 = P[index, 14, 17]
+        P_14_18 = P[index, 14, 18]
+        P_14_21 = P[index, 14, 21]
+        P_15_16 = P[index, 15, 16]
+        P_15_17 = P[index, 15, 17]
+        P_15_18 = P[index, 15, 18]
+        P_15_21 = P[index, 15, 21]
+        P_16_16 = P[index, 16, 16]
+        P_16_17 = P[index, 16, 17]
+        P_16_18 = P[index, 16, 18]
+        P_16_19 = P[index, 16, 19]
+        P_16_20 = P[index, 16, 20]
+        P_16_21 = P[index, 16, 21]
+        P_16_22 = P[index, 16, 22]
+        P_16_23 = P[index, 16, 23]
+        P_17_17 = P[index, 17, 17]
+        P_17_18 = P[index, 17, 18]
+        P_17_19 = P[index, 17, 19]
+        P_17_20 = P[index, 17, 20]
+        P_17_21 = P[index, 17, 21]
+        P_17_22 = P[index, 17, 22]
+        P_17_23 = P[index, 17, 23]
+        P_18_18 = P[index, 18, 18]
+        P_18_19 = P[index, 18, 19]
+        P_18_20 = P[index, 18, 20]
+        P_18_21 = P[index, 18, 21]
+        P_18_22 = P[index, 18, 22]
+        P_18_23 = P[index, 18, 23]
+        P_19_21 = P[index, 19, 21]
+        P_20_21 = P[index, 20, 21]
+        P_21_21 = P[index, 21, 21]
+        P_21_22 = P[index, 21, 22]
+        P_21_23 = P[index, 21, 23]
+        HKZ0 = magD*q0 - magE*q1 + magN*q2
+        HKZ1 = magD*q1 + magE*q0 - magN*q3
+        HKZ2 = -magD*q2 + magE*q3 + magN*q0
+        HKZ3 = magD*q3 + magE*q2 + magN*q1
+        HKZ4 = q0*q2 + q1*q3
+        HKZ5 = q0*q1 - q2*q3
+        HKZ6 = q0**2 - q1**2 - q2**2 + q3**2
+        HKZ7 = 2*HKZ4
+        HKZ8 = 2*HKZ5
+        HKZ9 = 2*HKZ3
+        HKZ10 = 2*HKZ0
+        HKZ11 = 2*HKZ1
+        HKZ12 = 2*HKZ2
+        HKZ13 = HKZ10*P_0_0 - HKZ11*P_0_1 + HKZ12*P_0_2 + HKZ6*P_0_18 + HKZ7*P_0_16 - HKZ8*P_0_17 + HKZ9*P_0_3 + P_0_21
+        HKZ14 = HKZ10*P_0_18 - HKZ11*P_1_18 + HKZ12*P_2_18 + HKZ6*P_18_18 + HKZ7*P_16_18 - HKZ8*P_17_18 + HKZ9*P_3_18 + P_18_21
+        HKZ15 = HKZ10*P_0_17 - HKZ11*P_1_17 + HKZ12*P_2_17 + HKZ6*P_17_18 + HKZ7*P_16_17 - HKZ8*P_17_17 + HKZ9*P_3_17 + P_17_21
+        HKZ16 = HKZ10*P_0_1 - HKZ11*P_1_1 + HKZ12*P_1_2 + HKZ6*P_1_18 + HKZ7*P_1_16 - HKZ8*P_1_17 + HKZ9*P_1_3 + P_1_21
+        HKZ17 = HKZ10*P_0_16 - HKZ11*P_1_16 + HKZ12*P_2_16 + HKZ6*P_16_18 + HKZ7*P_16_16 - HKZ8*P_16_17 + HKZ9*P_3_16 + P_16_21
+        HKZ18 = HKZ10*P_0_3 - HKZ11*P_1_3 + HKZ12*P_2_3 + HKZ6*P_3_18 + HKZ7*P_3_16 - HKZ8*P_3_17 + HKZ9*P_3_3 + P_3_21
+        HKZ19 = HKZ10*P_0_2 - HKZ11*P_1_2 + HKZ12*P_2_2 + HKZ6*P_2_18 + HKZ7*P_2_16 - HKZ8*P_2_17 + HKZ9*P_2_3 + P_2_21
+        HKZ20 = HKZ10*P_0_21 - HKZ11*P_1_21 + HKZ12*P_2_21 + HKZ6*P_18_21 + HKZ7*P_16_21 - HKZ8*P_17_21 + HKZ9*P_3_21 + P_21_21
+        HKZ21 = 1/(HKZ10*HKZ13 - HKZ11*HKZ16 + HKZ12*HKZ19 + HKZ14*HKZ6 - HKZ15*HKZ8 + HKZ17*HKZ7 + HKZ18*HKZ9 + HKZ20 + R_MAG[index])
+        H[index, 0] = 2*HKZ0
+        H[index, 1] = -2*HKZ1
+        H[index, 2] = 2*HKZ2
+        H[index, 3] = 2*HKZ3
+        H[index, 16] = 2*HKZ4
+        H[index, 17] = -2*HKZ5
+        H[index, 18] = HKZ6
+        H[index, 21] = 1
+        K[index, 0] = HKZ13*HKZ21
+        K[index, 1] = HKZ16*HKZ21
+        K[index, 2] = HKZ19*HKZ21
+        K[index, 3] = HKZ18*HKZ21
+        K[index, 4] = HKZ21*(HKZ10*P_0_4 - HKZ11*P_1_4 + HKZ12*P_2_4 + HKZ6*P_4_18 + HKZ7*P_4_16 - HKZ8*P_4_17 + HKZ9*P_3_4 + P_4_21)
+        K[index, 5] = HKZ21*(HKZ10*P_0_5 - HKZ11*P_1_5 + HKZ12*P_2_5 + HKZ6*P_5_18 + HKZ7*P_5_16 - HKZ8*P_5_17 + HKZ9*P_3_5 + P_5_21)
+        K[index, 6] = HKZ21*(HKZ10*P_0_6 - HKZ11*P_1_6 + HKZ12*P_2_6 + HKZ6*P_6_18 + HKZ7*P_6_16 - HKZ8*P_6_17 + HKZ9*P_3_6 + P_6_21)
+        K[index, 7] = HKZ21*(HKZ10*P_0_7 - HKZ11*P_1_7 + HKZ12*P_2_7 + HKZ6*P_7_18 + HKZ7*P_7_16 - HKZ8*P_7_17 + HKZ9*P_3_7 + P_7_21)
+        K[index, 8] = HKZ21*(HKZ10*P_0_8 - HKZ11*P_1_8 + HKZ12*P_2_8 + HKZ6*P_8_18 + HKZ7*P_8_16 - HKZ8*P_8_17 + HKZ9*P_3_8 + P_8_21)
+        K[index, 9] = HKZ21*(HKZ10*P_0_9 - HKZ11*P_1_9 + HKZ12*P_2_9 + HKZ6*P_9_18 + HKZ7*P_9_16 - HKZ8*P_9_17 + HKZ9*P_3_9 + P_9_21)
+        K[index, 10] = HKZ21*(HKZ10*P_0_10 - HKZ11*P_1_10 + HKZ12*P_2_10 + HKZ6*P_10_18 + HKZ7*P_10_16 - HKZ8*P_10_17 + HKZ9*P_3_10 + P_10_21)
+        K[index, 11] = HKZ21*(HKZ10*P_0_11 - HKZ11*P_1_11 + HKZ12*P_2_11 + HKZ6*P_11_18 + HKZ7*P_11_16 - HKZ8*P_11_17 + HKZ9*P_3_11 + P_11_21)
+        K[index, 12] = HKZ21*(HKZ10*P_0_12 - HKZ11*P_1_12 + HKZ12*P_2_12 + HKZ6*P_12_18 + HKZ7*P_12_16 - HKZ8*P_12_17 + HKZ9*P_3_12 + P_12_21)
+        K[index, 13] = HKZ21*(HKZ10*P_0_13 - HKZ11*P_1_13 + HKZ12*P_2_13 + HKZ6*P_13_18 + HKZ7*P_13_16 - HKZ8*P_13_17 + HKZ9*P_3_13 + P_13_21)
+        K[index, 14] = HKZ21*(HKZ10*P_0_14 - HKZ11*P_1_14 + HKZ12*P_2_14 + HKZ6*P_14_18 + HKZ7*P_14_16 - HKZ8*P_14_17 + HKZ9*P_3_14 + P_14_21)
+        K[index, 15] = HKZ21*(HKZ10*P_0_15 - HKZ11*P_1_15 + HKZ12*P_2_15 + HKZ6*P_15_18 + HKZ7*P_15_16 - HKZ8*P_15_17 + HKZ9*P_3_15 + P_15_21)
+        K[index, 16] = HKZ17*HKZ21
+        K[index, 17] = HKZ15*HKZ21
+        K[index, 18] = HKZ14*HKZ21
+        K[index, 19] = HKZ21*(HKZ10*P_0_19 - HKZ11*P_1_19 + HKZ12*P_2_19 + HKZ6*P_18_19 + HKZ7*P_16_19 - HKZ8*P_17_19 + HKZ9*P_3_19 + P_19_21)
+        K[index, 20] = HKZ21*(HKZ10*P_0_20 - HKZ11*P_1_20 + HKZ12*P_2_20 + HKZ6*P_18_20 + HKZ7*P_16_20 - HKZ8*P_17_20 + HKZ9*P_3_20 + P_20_21)
+        K[index, 21] = HKZ20*HKZ21
+        K[index, 22] = HKZ21*(HKZ10*P_0_22 - HKZ11*P_1_22 + HKZ12*P_2_22 + HKZ6*P_18_22 + HKZ7*P_16_22 - HKZ8*P_17_22 + HKZ9*P_3_22 + P_21_22)
+        K[index, 23] = HKZ21*(HKZ10*P_0_23 - HKZ11*P_1_23 + HKZ12*P_2_23 + HKZ6*P_18_23 + HKZ7*P_16_23 - HKZ8*P_17_23 + HKZ9*P_3_23 + P_21_23)
+    return H, K
+
+# flow_x observation Jacobian and Kalman gain
+def fuse_flow_x(states, P, Tbs, R_LOS, range_):
+    q0 = states[..., 0]
+    q1 = states[..., 1]
+    q2 = states[..., 2]
+    q3 = states[..., 3]
+    vn = states[..., 4]
+    ve = states[..., 5]
+    vd = states[..., 6]
+    P_0_0 = P[..., 0, 0]
+    P_0_1 = P[..., 0, 1]
+    P_0_2 = P[..., 0, 2]
+    P_0_3 = P[..., 0, 3]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_7 = P[..., 0, 7]
+    P_0_8 = P[..., 0, 8]
+    P_0_9 = P[..., 0, 9]
+    P_0_10 = P[..., 0, 10]
+    P_0_11 = P[..., 0, 11]
+    P_0_12 = P[..., 0, 12]
+    P_0_13 = P[..., 0, 13]
+    P_0_14 = P[..., 0, 14]
+    P_0_15 = P[..., 0, 15]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_0_18 = P[..., 0, 18]
+    P_0_19 = P[..., 0, 19]
+    P_0_20 = P[..., 0, 20]
+    P_0_21 = P[..., 0, 21]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_1 = P[..., 1, 1]
+    P_1_2 = P[..., 1, 2]
+    P_1_3 = P[..., 1, 3]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_7 = P[..., 1, 7]
+    P_1_8 = P[..., 1, 8]
+    P_1_9 = P[..., 1, 9]
+    P_1_10 = P[..., 1, 10]
+    P_1_11 = P[..., 1, 11]
+    P_1_12 = P[..., 1, 12]
+    P_1_13 = P[..., 1, 13]
+    P_1_14 = P[..., 1, 14]
+    P_1_15 = P[..., 1, 15]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_1_18 = P[..., 1, 18]
+    P_1_19 = P[..., 1, 19]
+    P_1_20 = P[..., 1, 20]
+    P_1_21 = P[..., 1, 21]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_2 = P[..., 2, 2]
+    P_2_3 = P[..., 2, 3]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_7 = P[..., 2, 7]
+    P_2_8 = P[..., 2, 8]
+    P_2_9 = P[..., 2, 9]
+    P_2_10 = P[..., 2, 10]
+    P_2_11 = P[..., 2, 11]
+    P_2_12 = P[..., 2, 12]
+    P_2_13 = P[..., 2, 13]
+    P_2_14 = P[..., 2, 14]
+    P_2_15 = P[..., 2, 15]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_2_18 = P[..., 2, 18]
+    P_2_19 = P[..., 2, 19]
+    P_2_20 = P[..., 2, 20]
+    P_2_21 = P[..., 2, 21]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_3 = P[..., 3, 3]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_7 = P[..., 3, 7]
+    P_3_8 = P[..., 3, 8]
+    P_3_9 = P[..., 3, 9]
+    P_3_10 = P[..., 3, 10]
+    P_3_11 = P[..., 3, 11]
+    P_3_12 = P[..., 3, 12]
+    P_3_13 = P[..., 3, 13]
+    P_3_14 = P[..., 3, 14]
+    P_3_15 = P[..., 3, 15]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_3_18 = P[..., 3, 18]
+    P_3_19 = P[..., 3, 19]
+    P_3_20 = P[..., 3, 20]
+    P_3_21 = P[..., 3, 21]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    P_4_4 = P[..., 4, 4]
+    P_4_5 = P[..., 4, 5]
+    P_4_6 = P[..., 4, 6]
+    P_4_7 = P[..., 4, 7]
+    P_4_8 = P[..., 4, 8]
+    P_4_9 = P[..., 4, 9]
+    P_4_10 = P[..., 4, 10]
+    P_4_11 = P[..., 4, 11]
+    P_4_12 = P[..., 4, 12]
+    P_4_13 = P[..., 4, 13]
+    P_4_14 = P[..., 4, 14]
+    P_4_15 = P[..., 4, 15]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_4_18 = P[..., 4, 18]
+    P_4_19 = P[..., 4, 19]
+    P_4_20 = P[..., 4, 20]
+    P_4_21 = P[..., 4, 21]
+    P_4_22 = P[..., 4, 22]
+    P_4_23 = P[..., 4, 23]
+    P_5_5 = P[..., 5, 5]
+    P_5_6 = P[..., 5, 6]
+    P_5_7 = P[..., 5, 7]
+    P_5_8 = P[..., 5, 8]
+    P_5_9 = P[..., 5, 9]
+    P_5_10 = P[..., 5, 10]
+    P_5_11 = P[..., 5, 11]
+    P_5_12 = P[..., 5, 12]
+    P_5_13 = P[..., 5, 13]
+    P_5_14 = P[..., 5, 14]
+    P_5_15 = P[..., 5, 15]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_5_18 = P[..., 5, 18]
+    P_5_19 = P[..., 5, 19]
+    P_5_20 = P[..., 5, 20]
+    P_5_21 = P[..., 5, 21]
+    P_5_22 = P[..., 5, 22]
+    P_5_23 = P[..., 5, 23]
+    P_6_6 = P[..., 6, 6]
+    P_6_7 = P[..., 6, 7]
+    P_6_8 = P[..., 6, 8]
+    P_6_9 = P[..., 6, 9]
+    P_6_10 = P[..., 6, 10]
+    P_6_11 = P[..., 6, 11]
+    P_6_12 = P[..., 6, 12]
+    P_6_13 = P[..., 6, 13]
+    P_6_14 = P[..., 6, 14]
+    P_6_15 = P[..., 6, 15]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_6_18 = P[..., 6, 18]
+    P_6_19 = P[..., 6, 19]
+    P_6_20 = P[..., 6, 20]
+    P_6_21 = P[..., 6, 21]
+    P_6_22 = P[..., 6, 22]
+    P_6_23 = P[..., 6, 23]
+    Tbs_1_0 = Tbs[..., 1, 0]
+    Tbs_1_1 = Tbs[..., 1, 1]
+    Tbs_1_2 = Tbs[..., 1, 2]
+    HK0 = -Tbs_1_0*q2 + Tbs_1_1*q1 + Tbs_1_2*q0
+    HK1 = Tbs_1_0*q3 + Tbs_1_1*q0 - Tbs_1_2*q1
+    HK2 = Tbs_1_0*q0 - Tbs_1_1*q3 + Tbs_1_2*q2
+    HK3 = HK0*vd + HK1*ve + HK2*vn
+    HK4 = 1/range_
+    HK5 = 2*HK4
+    HK6 = Tbs_1_0*q1 + Tbs_1_1*q2 + Tbs_1_2*q3
+    HK7 = -HK0*ve + HK1*vd + HK6*vn
+    HK8 = HK0*vn - HK2*vd + HK6*ve
+    HK9 = -HK1*vn + HK2*ve + HK6*vd
+    HK10 = q0*q2
+    HK11 = q1*q3
+    HK12 = 2*Tbs_1_2
+    HK13 = q0*q3
+    HK14 = q1*q2
+    HK15 = 2*Tbs_1_1
+    HK16 = q1**2
+    HK17 = q2**2
+    HK18 = -HK17
+    HK19 = q0**2
+    HK20 = q3**2
+    HK21 = HK19 - HK20
+    HK22 = HK12*(HK10 + HK11) - HK15*(HK13 - HK14) + Tbs_1_0*(HK16 + HK18 + HK21)
+    HK23 = 2*Tbs_1_0
+    HK24 = q0*q1
+    HK25 = q2*q3
+    HK26 = -HK16
+    HK27 = -HK12*(HK24 - HK25) + HK23*(HK13 + HK14) + Tbs_1_1*(HK17 + HK21 + HK26)
+    HK28 = HK15*(HK24 + HK25) - HK23*(HK10 - HK11) + Tbs_1_2*(HK18 + HK19 + HK20 + HK26)
+    HK29 = 2*HK3
+    HK30 = 2*HK7
+    HK31 = 2*HK8
+    HK32 = 2*HK9
+    HK33 = HK22*P_0_4 + HK27*P_0_5 + HK28*P_0_6 + HK29*P_0_0 + HK30*P_0_1 + HK31*P_0_2 + HK32*P_0_3
+    HK34 = range_**(-2)
+    HK35 = HK22*P_4_6 + HK27*P_5_6 + HK28*P_6_6 + HK29*P_0_6 + HK30*P_1_6 + HK31*P_2_6 + HK32*P_3_6
+    HK36 = HK22*P_4_5 + HK27*P_5_5 + HK28*P_5_6 + HK29*P_0_5 + HK30*P_1_5 + HK31*P_2_5 + HK32*P_3_5
+    HK37 = HK22*P_4_4 + HK27*P_4_5 + HK28*P_4_6 + HK29*P_0_4 + HK30*P_1_4 + HK31*P_2_4 + HK32*P_3_4
+    HK38 = HK22*P_2_4 + HK27*P_2_5 + HK28*P_2_6 + HK29*P_0_2 + HK30*P_1_2 + HK31*P_2_2 + HK32*P_2_3
+    HK39 = HK22*P_3_4 + HK27*P_3_5 + HK28*P_3_6 + HK29*P_0_3 + HK30*P_1_3 + HK31*P_2_3 + HK32*P_3_3
+    HK40 = HK22*P_1_4 + HK27*P_1_5 + HK28*P_1_6 + HK29*P_0_1 + HK30*P_1_1 + HK31*P_1_2 + HK32*P_1_3
+    HK41 = HK4/(HK22*HK34*HK37 + HK27*HK34*HK36 + HK28*HK34*HK35 + HK29*HK33*HK34 + HK30*HK34*HK40 + HK31*HK34*HK38 + HK32*HK34*HK39 + R_LOS)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 0] = HK3*HK5
+    H[..., 1] = HK5*HK7
+    H[..., 2] = HK5*HK8
+    H[..., 3] = HK5*HK9
+    H[..., 4] = HK22*HK4
+    H[..., 5] = HK27*HK4
+    H[..., 6] = HK28*HK4
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = HK33*HK41
+    K[..., 1] = HK40*HK41
+    K[..., 2] = HK38*HK41
+    K[..., 3] = HK39*HK41
+    K[..., 4] = HK37*HK41
+    K[..., 5] = HK36*HK41
+    K[..., 6] = HK35*HK41
+    K[..., 7] = HK41*(HK22*P_4_7 + HK27*P_5_7 + HK28*P_6_7 + HK29*P_0_7 + HK30*P_1_7 + HK31*P_2_7 + HK32*P_3_7)
+    K[..., 8] = HK41*(HK22*P_4_8 + HK27*P_5_8 + HK28*P_6_8 + HK29*P_0_8 + HK30*P_1_8 + HK31*P_2_8 + HK32*P_3_8)
+    K[..., 9] = HK41*(HK22*P_4_9 + HK27*P_5_9 + HK28*P_6_9 + HK29*P_0_9 + HK30*P_1_9 + HK31*P_2_9 + HK32*P_3_9)
+    K[..., 10] = HK41*(HK22*P_4_10 + HK27*P_5_10 + HK28*P_6_10 + HK29*P_0_10 + HK30*P_1_10 + HK31*P_2_10 + HK32*P_3_10)
+    K[..., 11] = HK41*(HK22*P_4_11 + HK27*P_5_11 + HK28*P_6_11 + HK29*P_0_11 + HK30*P_1_11 + HK31*P_2_11 + HK32*P_3_11)
+    K[..., 12] = HK41*(HK22*P_4_12 + HK27*P_5_12 + HK28*P_6_12 + HK29*P_0_12 + HK30*P_1_12 + HK31*P_2_12 + HK32*P_3_12)
+    K[..., 13] = HK41*(HK22*P_4_13 + HK27*P_5_13 + HK28*P_6_13 + HK29*P_0_13 + HK30*P_1_13 + HK31*P_2_13 + HK32*P_3_13)
+    K[..., 14] = HK41*(HK22*P_4_14 + HK27*P_5_14 + HK28*P_6_14 + HK29*P_0_14 + HK30*P_1_14 + HK31*P_2_14 + HK32*P_3_14)
+    K[..., 15] = HK41*(HK22*P_4_15 + HK27*P_5_15 + HK28*P_6_15 + HK29*P_0_15 + HK30*P_1_15 + HK31*P_2_15 + HK32*P_3_15)
+    K[..., 16] = HK41*(HK22*P_4_16 + HK27*P_5_16 + HK28*P_6_16 + HK29*P_0_16 + HK30*P_1_16 + HK31*P_2_16 + HK32*P_3_16)
+    K[..., 17] = HK41*(HK22*P_4_17 + HK27*P_5_17 + HK28*P_6_17 + HK29*P_0_17 + HK30*P_1_17 + HK31*P_2_17 + HK32*P_3_17)
+    K[..., 18] = HK41*(HK22*P_4_18 + HK27*P_5_18 + HK28*P_6_18 + HK29*P_0_18 + HK30*P_1_18 + HK31*P_2_18 + HK32*P_3_18)
+    K[..., 19] = HK41*(HK22*P_4_19 + HK27*P_5_19 + HK28*P_6_19 + HK29*P_0_19 + HK30*P_1_19 + HK31*P_2_19 + HK32*P_3_19)
+    K[..., 20] = HK41*(HK22*P_4_20 + HK27*P_5_20 + HK28*P_6_20 + HK29*P_0_20 + HK30*P_1_20 + HK31*P_2_20 + HK32*P_3_20)
+    K[..., 21] = HK41*(HK22*P_4_21 + HK27*P_5_21 + HK28*P_6_21 + HK29*P_0_21 + HK30*P_1_21 + HK31*P_2_21 + HK32*P_3_21)
+    K[..., 22] = HK41*(HK22*P_4_22 + HK27*P_5_22 + HK28*P_6_22 + HK29*P_0_22 + HK30*P_1_22 + HK31*P_2_22 + HK32*P_3_22)
+    K[..., 23] = HK41*(HK22*P_4_23 + HK27*P_5_23 + HK28*P_6_23 + HK29*P_0_23 + HK30*P_1_23 + HK31*P_2_23 + HK32*P_3_23)
+    return H, K
+
+# flow_x observation Jacobian and Kalman gain, loop over the filters
+def fuse_flow_x_kernel(states, P, Tbs, R_LOS, range_):
+    n_filters = P.shape[0]
+    Tbs = numpy.asarray(Tbs, dtype=numpy.float64)
+    Tbs = numpy.broadcast_to(Tbs, (n_filters,) + Tbs.shape[-2:])
+    R_LOS = numpy.broadcast_to(numpy.asarray(R_LOS, dtype=numpy.float64), (n_filters,))
+    range_ = numpy.broadcast_to(numpy.asarray(range_, dtype=numpy.float64), (n_filters,))
+    return _fuse_flow_x_kernel(states, P, Tbs, R_LOS, range_)
+
+@jit
+def _fuse_flow_x_kernel(states, P, Tbs, R_LOS, range_):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        q0 = states[index, 0]
+        q1 = states[index, 1]
+        q2 = states[index, 2]
+        q3 = states[index, 3]
+        vn = states[index, 4]
+        ve = states[index, 5]
+        vd = states[index, 6]
+        P_0_0 = P[index, 0, 0]
+        P_0_1 = P[index, 0, 1]
+        P_0_2 = P[index, 0, 2]
+        P_0_3 = P[index, 0, 3]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_7 = P[index, 0, 7]
+        P_0_8 = P[index, 0, 8]
+        P_0_9 = P[index, 0, 9]
+        P_0_10 = P[index, 0, 10]
+        P_0_11 = P[index, 0, 11]
+        P_0_12 = P[index, 0, 12]
+        P_0_13 = P[index, 0, 13]
+        P_0_14 = P[index, 0, 14]
+        P_0_15 = P[index, 0, 15]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_0_18 = P[index, 0, 18]
+        P_0_19 = P[index, 0, 19]
+        P_0_20 = P[index, 0, 20]
+        P_0_21 = P[index, 0, 21]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_1 = P[index, 1, 1]
+        P_1_2 = P[index, 1, 2]
+        P_1_3 = P[index, 1, 3]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_7 = P[index, 1, 7]
+        P_1_8 = P[index, 1, 8]
+        P_1_9 = P[index, 1, 9]
+        P_1_10 = P[index, 1, 10]
+        P_1_11 = P[index, 1, 11]
+        P_1_12 = P[index, 1, 12]
+        P_1_13 = P[index, 1, 13]
+        P_1_14 = P[index, 1, 14]
+        P_1_15 = P[index, 1, 15]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_1_18 = P[index, 1, 18]
+        P_1_19 = P[index, 1, 19]
+        P_1_20 = P[index, 1, 20]
+        P_1_21 = P[index, 1, 21]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_2 = P[index, 2, 2]
+        P_2_3 = P[index, 2, 3]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_7 = P[index, 2, 7]
+        P_2_8 = P[index, 2, 8]
+        P_2_9 = P[index, 2, 9]
+        P_2_10 = P[index, 2, 10]
+        P_2_11 = P[index, 2, 11]
+        P_2_12 = P[index, 2, 12]
+        P_2_13 = P[index, 2, 13]
+        P_2_14 = P[index, 2, 14]
+        P_2_15 = P[index, 2, 15]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_2_18 = P[index, 2, 18]
+        P_2_19 = P[index, 2, 19]
+        P_2_20 = P[index, 2, 20]
+        P_2_21 = P[index, 2, 21]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_3 = P[index, 3, 3]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_7 = P[index, 3, 7]
+        P_3_8 = P[index, 3, 8]
+        P_3_9 = P[index, 3, 9]
+        P_3_10 = P[index, 3, 10]
+        P_3_11 = P[index, 3, 11]
+        P_3_12 = P[index, 3, 12]
+        P_3_13 = P[index, 3, 13]
+        P_3_14 = P[index, 3, 14]
+        P_3_15 = P[index, 3, 15]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_3_18 = P[index, 3, 18]
+        P_3_19 = P[index, 3, 19]
+        P_3_20 = P[index, 3, 20]
+        P_3_21 = P[index, 3, 21]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        P_4_4 = P[index, 4, 4]
+        P_4_5 = P[index, 4, 5]
+        P_4_6 = P[index, 4, 6]
+        P_4_7 = P[index, 4, 7]
+        P_4_8 = P[index, 4, 8]
+        P_4_9 = P[index, 4, 9]
+        P_4_10 = P[index, 4, 10]
+        P_4_11 = P[index, 4, 11]
+        P_4_12 = P[index, 4, 12]
+        P_4_13 = P[index, 4, 13]
+        P_4_14 = P[index, 4, 14]
+        P_4_15 = P[index, 4, 15]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_4_18 = P[index, 4, 18]
+        P_4_19 = P[index, 4, 19]
+        P_4_20 = P[index, 4, 20]
+        P_4_21 = P[index, 4, 21]
+        P_4_22 = P[index, 4, 22]
+        P_4_23 = P[index, 4, 23]
+        P_5_5 = P[index, 5, 5]
+        P_5_6 = P[index, 5, 6]
+        P_5_7 = P[index, 5, 7]
+        P_5_8 = P[index, 5, 8]
+        P_5_9 = P[index, 5, 9]
+        P_5_10 = P[index, 5, 10]
+        P_5_11 = P[index, 5, 11]
+        P_5_12 = P[index, 5, 12]
+        P_5_13 = P[index, 5, 13]
+        P_5_14 = P[index, 5, 14]
+        P_5_15 = P[index, 5, 15]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_5_18 = P[index, 5, 18]
+        P_5_19 = P[index, 5, 19]
+        P_5_20 = P[index, 5, 20]
+        P_5_21 = P[index, 5, 21]
+        P_5_22 = P[index, 5, 22]
+        P_5_23 = P[index, 5, 23]
+        P_6_6 = P[index, 6, 6]
+        P_6_7 = P[index, 6, 7]
+        P_6_8 = P[index, 6, 8]
+        P_6_9 = P[index, 6, 9]
+        P_6_10 = P[index, 6, 10]
+        P_6_11 = P[index, 6, 11]
+        P_6_12 = P[index, 6, 12]
+        P_6_13 = P[index, 6, 13]
+        P_6_14 = P[index, 6, 14]
+        P_6_15 = P[index, 6, 15]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_6_18 = P[index, 6, 18]
+        P_6_19 = P[index, 6, 19]
+        P_6_20 = P[index, 6, 20]
+        P_6_21 = P[index, 6, 21]
+        P_6_22 = P[index, 6, 22]
+        P_6_23 = P[index, 6, 23]
+        Tbs_1_0 = Tbs[index, 1, 0]
+        Tbs_1_1 = Tbs[index, 1, 1]
+        Tbs_1_2 = Tbs[index, 1, 2]
+        HK0 = -Tbs_1_0*q2 + Tbs_1_1*q1 + Tbs_1_2*q0
+        HK1 = Tbs_1_0*q3 + Tbs_1_1*q0 - Tbs_1_2*q1
+        HK2 = Tbs_1_0*q0 - Tbs_1_1*q3 + Tbs_1_2*q2
+        HK3 = HK0*vd + HK1*ve + HK2*vn
+        HK4 = 1/range_[index]
+        HK5 = 2*HK4
+        HK6 = Tbs_1_0*q1 + Tbs_1_1*q2 + Tbs_1_2*q3
+        HK7 = -HK0*ve + HK1*vd + HK6*vn
+        HK8 = HK0*vn - HK2*vd + HK6*ve
+        HK9 = -HK1*vn + HK2*ve + HK6*vd
+        HK10 = q0*q2
+        HK11 = q1*q3
+        HK12 = 2*Tbs_1_2
+        HK13 = q0*q3
+        HK14 = q1*q2
+        HK15 = 2*Tbs_1_1
+        HK16 = q1**2
+        HK17 = q2**2
+        HK18 = -HK17
+        HK19 = q0**2
+        HK20 = q3**2
+        HK21 = HK19 - HK20
+        HK22 = HK12*(HK10 + HK11) - HK15*(HK13 - HK14) + Tbs_1_0*(HK16 + HK18 + HK21)
+        HK23 = 2*Tbs_1_0
+        HK24 = q0*q1
+        HK25 = q2*q3
+        HK26 = -HK16
+        HK27 = -HK12*(HK24 - HK25) + HK23*(HK13 + HK14) + Tbs_1_1*(HK17 + HK21 + HK26)
+        HK28 = HK15*(HK24 + HK25) - HK23*(HK10 - HK11) + Tbs_1_2*(HK18 + HK19 + HK20 + HK26)
+        HK29 = 2*HK3
+        HK30 = 2*HK7
+        HK31 = 2*HK8
+        HK32 = 2*HK9
+        HK33 = HK22*P_0_4 + HK27*P_0_5 + HK28*P_0_6 + HK29*P_0_0 + HK30*P_0_1 + HK31*P_0_2 + HK32*P_0_3
+        HK34 = range_[index]**(-2)
+        HK35 = HK22*P_4_6 + HK27*P_5_6 + HK28*P_6_6 + HK29*P_0_6 + HK30*P_1_6 + HK31*P_2_6 + HK32*P_3_6
+        HK36 = HK22*P_4_5 + HK27*P_5_5 + HK28*P_5_6 + HK29*P_0_5 + HK30*P_1_5 + HK31*P_2_5 + HK32*P_3_5
+        HK37 = HK22*P_4_4 + HK27*P_4_5 + HK28*P_4_6 + HK29*P_0_4 + HK30*P_1_4 + HK31*P_2_4 + HK32*P_3_4
+        HK38 = HK22*P_2_4 + HK27*P_2_5 + HK28*P_2_6 + HK29*P_0_2 + HK30*P_1_2 + HK31*P_2_2 + HK32*P_2_3
+        HK39 = HK22*P_3_4 + HK27*P_3_5 + HK28*P_3_6 + HK29*P_0_3 + HK30*P_1_3 + HK31*P_2_3 + HK32*P_3_3
+        HK40 = HK22*P_1_4 + HK27*P_1_5 + HK28*P_1_6 + HK29*P_0_1 + HK30*P_1_1 + HK31*P_1_2 + HK32*P_1_3
+        HK41 = HK4/(HK22*HK34*HK37 + HK27*HK34*HK36 + HK28*HK34*HK35 + HK29*HK33*HK34 + HK30*HK34*HK40 + HK31*HK34*HK38 + HK32*HK34*HK39 + R_LOS[index])
+        H[index, 0] = HK3*HK5
+        H[index, 1] = HK5*HK7
+        H[index, 2] = HK5*HK8
+        H[index, 3] = HK5*HK9
+        H[index, 4] = HK22*HK4
+        H[index, 5] = HK27*HK4
+        H[index, 6] = HK28*HK4
+        K[index, 0] = HK33*HK41
+        K[index, 1] = HK40*HK41
+        K[index, 2] = HK38*HK41
+        K[index, 3] = HK39*HK41
+        K[index, 4] = HK37*HK41
+        K[index, 5] = HK36*HK41
+        K[index, 6] = HK35*HK41
+        K[index, 7] = HK41*(HK22*P_4_7 + HK27*P_5_7 + HK28*P_6_7 + HK29*P_0_7 + HK30*P_1_7 + HK31*P_2_7 + HK32*P_3_7)
+        K[index, 8] = HK41*(HK22*P_4_8 + HK27*P_5_8 + HK28*P_6_8 + HK29*P_0_8 + HK30*P_1_8 + HK31*P_2_8 + HK32*P_3_8)
+        K[index, 9] = HK41*(HK22*P_4_9 + HK27*P_5_9 + HK28*P_6_9 + HK29*P_0_9 + HK30*P_1_9 + HK31*P_2_9 + HK32*P_3_9)
+        K[index, 10] = HK41*(HK22*P_4_10 + HK27*P_5_10 + HK28*P_6_10 + HK29*P_0_10 + HK30*P_1_10 + HK31*P_2_10 + HK32*P_3_10)
+        K[index, 11] = HK41*(HK22*P_4_11 + HK27*P_5_11 + HK28*P_6_11 + HK29*P_0_11 + HK30*P_1_11 + HK31*P_2_11 + HK32*P_3_11)
+        K[index, 12] = HK41*(HK22*P_4_12 + HK27*P_5_12 + HK28*P_6_12 + HK29*P_0_12 + HK30*P_1_12 + HK31*P_2_12 + HK32*P_3_12)
+        K[index, 13] = HK41*(HK22*P_4_13 + HK27*P_5_13 + HK28*P_6_13 + HK29*P_0_13 + HK30*P_1_13 + HK31*P_2_13 + HK32*P_3_13)
+        K[index, 14] = HK41*(HK22*P_4_14 + HK27*P_5_14 + HK28*P_6_14 + HK29*P_0_14 + HK30*P_1_14 + HK31*P_2_14 + HK32*P_3_14)
+        K[index, 15] = HK41*(HK22*P_4_15 + HK27*P_5_15 + HK28*P_6_15 + HK29*P_0_15 + HK30*P_1_15 + HK31*P_2_15 + HK32*P_3_15)
+        K[index, 16] = HK41*(HK22*P_4_16 + HK27*P_5_16 + HK28*P_6_16 + HK29*P_0_16 + HK30*P_1_16 + HK31*P_2_16 + HK32*P_3_16)
+        K[index, 17] = HK41*(HK22*P_4_17 + HK27*P_5_17 + HK28*P_6_17 + HK29*P_0_17 + HK30*P_1_17 + HK31*P_2_17 + HK32*P_3_17)
+        K[index, 18] = HK41*(HK22*P_4_18 + HK27*P_5_18 + HK28*P_6_18 + HK29*P_0_18 + HK30*P_1_18 + HK31*P_2_18 + HK32*P_3_18)
+        K[index, 19] = HK41*(HK22*P_4_19 + HK27*P_5_19 + HK28*P_6_19 + HK29*P_0_19 + HK30*P_1_19 + HK31*P_2_19 + HK32*P_3_19)
+        K[index, 20] = HK41*(HK22*P_4_20 + HK27*P_5_20 + HK28*P_6_20 + HK29*P_0_20 + HK30*P_1_20 + HK31*P_2_20 + HK32*P_3_20)
+        K[index, 21] = HK41*(HK22*P_4_21 + HK27*P_5_21 + HK28*P_6_21 + HK29*P_0_21 + HK30*P_1_21 + HK31*P_2_21 + HK32*P_3_21)
+        K[index, 22] = HK41*(HK22*P_4_22 + HK27*P_5_22 + HK28*P_6_22 + HK29*P_0_22 + HK30*P_1_22 + HK31*P_2_22 + HK32*P_3_22)
+        K[index, 23] = HK41*(HK22*P_4_23 + HK27*P_5_23 + HK28*P_6_23 + HK29*P_0_23 + HK30*P_1_23 + HK31*P_2_23 + HK32*P_3_23)
+    return H, K
+
+# flow_y observation Jacobian and Kalman gain
+def fuse_flow_y(states, P, Tbs, R_LOS, range_):
+    q0 = states[..., 0]
+    q1 = states[..., 1]
+    q2 = states[..., 2]
+    q3 = states[..., 3]
+    vn = states[..., 4]
+    ve = states[..., 5]
+    vd = states[..., 6]
+    P_0_0 = P[..., 0, 0]
+    P_0_1 = P[..., 0, 1]
+    P_0_2 = P[..., 0, 2]
+    P_0_3 = P[..., 0, 3]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_7 = P[..., 0, 7]
+    P_0_8 = P[..., 0, 8]
+    P_0_9 = P[..., 0, 9]
+    P_0_10 = P[..., 0, 10]
+    P_0_11 = P[..., 0, 11]
+    P_0_12 = P[..., 0, 12]
+    P_0_13 = P[..., 0, 13]
+    P_0_14 = P[..., 0, 14]
+    P_0_15 = P[..., 0, 15]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_0_18 = P[..., 0, 18]
+    P_0_19 = P[..., 0, 19]
+    P_0_20 = P[..., 0, 20]
+    P_0_21 = P[..., 0, 21]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_1 = P[..., 1, 1]
+    P_1_2 = P[..., 1, 2]
+    P_1_3 = P[..., 1, 3]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_7 = P[..., 1, 7]
+    P_1_8 = P[..., 1, 8]
+    P_1_9 = P[..., 1, 9]
+    P_1_10 = P[..., 1, 10]
+    P_1_11 = P[..., 1, 11]
+    P_1_12 = P[..., 1, 12]
+    P_1_13 = P[..., 1, 13]
+    P_1_14 = P[..., 1, 14]
+    P_1_15 = P[..., 1, 15]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_1_18 = P[..., 1, 18]
+    P_1_19 = P[..., 1, 19]
+    P_1_20 = P[..., 1, 20]
+    P_1_21 = P[..., 1, 21]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_2 = P[..., 2, 2]
+    P_2_3 = P[..., 2, 3]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_7 = P[..., 2, 7]
+    P_2_8 = P[..., 2, 8]
+    P_2_9 = P[..., 2, 9]
+    P_2_10 = P[..., 2, 10]
+    P_2_11 = P[..., 2, 11]
+    P_2_12 = P[..., 2, 12]
+    P_2_13 = P[..., 2, 13]
+    P_2_14 = P[..., 2, 14]
+    P_2_15 = P[..., 2, 15]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_2_18 = P[..., 2, 18]
+    P_2_19 = P[..., 2, 19]
+    P_2_20 = P[..., 2, 20]
+    P_2_21 = P[..., 2, 21]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_3 = P[..., 3, 3]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_7 = P[..., 3, 7]
+    P_3_8 = P[..., 3, 8]
+    P_3_9 = P[..., 3, 9]
+    P_3_10 = P[..., 3, 10]
+    P_3_11 = P[..., 3, 11]
+    P_3_12 = P[..., 3, 12]
+    P_3_13 = P[..., 3, 13]
+    P_3_14 = P[..., 3, 14]
+    P_3_15 = P[..., 3, 15]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_3_18 = P[..., 3, 18]
+    P_3_19 = P[..., 3, 19]
+    P_3_20 = P[..., 3, 20]
+    P_3_21 = P[..., 3, 21]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    P_4_4 = P[..., 4, 4]
+    P_4_5 = P[..., 4, 5]
+    P_4_6 = P[..., 4, 6]
+    P_4_7 = P[..., 4, 7]
+    P_4_8 = P[..., 4, 8]
+    P_4_9 = P[..., 4, 9]
+    P_4_10 = P[..., 4, 10]
+    P_4_11 = P[..., 4, 11]
+    P_4_12 = P[..., 4, 12]
+    P_4_13 = P[..., 4, 13]
+    P_4_14 = P[..., 4, 14]
+    P_4_15 = P[..., 4, 15]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_4_18 = P[..., 4, 18]
+    P_4_19 = P[..., 4, 19]
+    P_4_20 = P[..., 4, 20]
+    P_4_21 = P[..., 4, 21]
+    P_4_22 = P[..., 4, 22]
+    P_4_23 = P[..., 4, 23]
+    P_5_5 = P[..., 5, 5]
+    P_5_6 = P[..., 5, 6]
+    P_5_7 = P[..., 5, 7]
+    P_5_8 = P[..., 5, 8]
+    P_5_9 = P[..., 5, 9]
+    P_5_10 = P[..., 5, 10]
+    P_5_11 = P[..., 5, 11]
+    P_5_12 = P[..., 5, 12]
+    P_5_13 = P[..., 5, 13]
+    P_5_14 = P[..., 5, 14]
+    P_5_15 = P[..., 5, 15]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_5_18 = P[..., 5, 18]
+    P_5_19 = P[..., 5, 19]
+    P_5_20 = P[..., 5, 20]
+    P_5_21 = P[..., 5, 21]
+    P_5_22 = P[..., 5, 22]
+    P_5_23 = P[..., 5, 23]
+    P_6_6 = P[..., 6, 6]
+    P_6_7 = P[..., 6, 7]
+    P_6_8 = P[..., 6, 8]
+    P_6_9 = P[..., 6, 9]
+    P_6_10 = P[..., 6, 10]
+    P_6_11 = P[..., 6, 11]
+    P_6_12 = P[..., 6, 12]
+    P_6_13 = P[..., 6, 13]
+    P_6_14 = P[..., 6, 14]
+    P_6_15 = P[..., 6, 15]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_6_18 = P[..., 6, 18]
+    P_6_19 = P[..., 6, 19]
+    P_6_20 = P[..., 6, 20]
+    P_6_21 = P[..., 6, 21]
+    P_6_22 = P[..., 6, 22]
+    P_6_23 = P[..., 6, 23]
+    Tbs_0_0 = Tbs[..., 0, 0]
+    Tbs_0_1 = Tbs[..., 0, 1]
+    Tbs_0_2 = Tbs[..., 0, 2]
+    HK0 = -Tbs_0_0*q2 + Tbs_0_1*q1 + Tbs_0_2*q0
+    HK1 = Tbs_0_0*q3 + Tbs_0_1*q0 - Tbs_0_2*q1
+    HK2 = Tbs_0_0*q0 - Tbs_0_1*q3 + Tbs_0_2*q2
+    HK3 = HK0*vd + HK1*ve + HK2*vn
+    HK4 = 1/range_
+    HK5 = 2*HK4
+    HK6 = Tbs_0_0*q1 + Tbs_0_1*q2 + Tbs_0_2*q3
+    HK7 = HK1*vd + HK6*vn
+    HK8 = HK0*vn + HK6*ve
+    HK9 = HK2*ve + HK6*vd
+    HK10 = q0*q3
+    HK11 = q1*q2
+    HK12 = HK10 - HK11
+    HK13 = 2*Tbs_0_1
+    HK14 = q1**2
+    HK15 = q2**2
+    HK16 = -HK15
+    HK17 = q0**2
+    HK18 = q3**2
+    HK19 = HK17 - HK18
+    HK20 = q0*q2
+    HK21 = q1*q3
+    HK22 = 2*Tbs_0_2
+    HK23 = HK22*(HK20 + HK21) + Tbs_0_0*(HK14 + HK16 + HK19)
+    HK24 = q0*q1
+    HK25 = q2*q3
+    HK26 = HK24 - HK25
+    HK27 = -HK14
+    HK28 = 2*Tbs_0_0
+    HK29 = HK28*(HK10 + HK11) + Tbs_0_1*(HK15 + HK19 + HK27)
+    HK30 = HK20 - HK21
+    HK31 = HK13*(HK24 + HK25) + Tbs_0_2*(HK16 + HK17 + HK18 + HK27)
+    HK32 = 2*HK3
+    HK33 = -2*HK0*ve + 2*HK7
+    HK34 = -2*HK2*vd + 2*HK8
+    HK35 = -2*HK1*vn + 2*HK9
+    HK36 = -HK12*HK13 + HK23
+    HK37 = -HK22*HK26 + HK29
+    HK38 = -HK28*HK30 + HK31
+    HK39 = HK32*P_0_0 + HK33*P_0_1 + HK34*P_0_2 + HK35*P_0_3 + HK36*P_0_4 + HK37*P_0_5 + HK38*P_0_6
+    HK40 = range_**(-2)
+    HK41 = HK32*P_0_6 + HK33*P_1_6 + HK34*P_2_6 + HK35*P_3_6 + HK36*P_4_6 + HK37*P_5_6 + HK38*P_6_6
+    HK42 = HK32*P_0_5 + HK33*P_1_5 + HK34*P_2_5 + HK35*P_3_5 + HK36*P_4_5 + HK37*P_5_5 + HK38*P_5_6
+    HK43 = HK32*P_0_4 + HK33*P_1_4 + HK34*P_2_4 + HK35*P_3_4 + HK36*P_4_4 + HK37*P_4_5 + HK38*P_4_6
+    HK44 = HK32*P_0_2 + HK33*P_1_2 + HK34*P_2_2 + HK35*P_2_3 + HK36*P_2_4 + HK37*P_2_5 + HK38*P_2_6
+    HK45 = HK32*P_0_3 + HK33*P_1_3 + HK34*P_2_3 + HK35*P_3_3 + HK36*P_3_4 + HK37*P_3_5 + HK38*P_3_6
+    HK46 = HK32*P_0_1 + HK33*P_1_1 + HK34*P_1_2 + HK35*P_1_3 + HK36*P_1_4 + HK37*P_1_5 + HK38*P_1_6
+    HK47 = HK4/(HK32*HK39*HK40 + HK33*HK40*HK46 + HK34*HK40*HK44 + HK35*HK40*HK45 + HK36*HK40*HK43 + HK37*HK40*HK42 + HK38*HK40*HK41 + R_LOS)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 0] = -HK3*HK5
+    H[..., 1] = -HK5*(-HK0*ve + HK7)
+    H[..., 2] = -HK5*(-HK2*vd + HK8)
+    H[..., 3] = -HK5*(-HK1*vn + HK9)
+    H[..., 4] = -HK4*(-HK12*HK13 + HK23)
+    H[..., 5] = -HK4*(-HK22*HK26 + HK29)
+    H[..., 6] = -HK4*(-HK28*HK30 + HK31)
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = -HK39*HK47
+    K[..., 1] = -HK46*HK47
+    K[..., 2] = -HK44*HK47
+    K[..., 3] = -HK45*HK47
+    K[..., 4] = -HK43*HK47
+    K[..., 5] = -HK42*HK47
+    K[..., 6] = -HK41*HK47
+    K[..., 7] = -HK47*(HK32*P_0_7 + HK33*P_1_7 + HK34*P_2_7 + HK35*P_3_7 + HK36*P_4_7 + HK37*P_5_7 + HK38*P_6_7)
+    K[..., 8] = -HK47*(HK32*P_0_8 + HK33*P_1_8 + HK34*P_2_8 + HK35*P_3_8 + HK36*P_4_8 + HK37*P_5_8 + HK38*P_6_8)
+    K[..., 9] = -HK47*(HK32*P_0_9 + HK33*P_1_9 + HK34*P_2_9 + HK35*P_3_9 + HK36*P_4_9 + HK37*P_5_9 + HK38*P_6_9)
+    K[..., 10] = -HK47*(HK32*P_0_10 + HK33*P_1_10 + HK34*P_2_10 + HK35*P_3_10 + HK36*P_4_10 + HK37*P_5_10 + HK38*P_6_10)
+    K[..., 11] = -HK47*(HK32*P_0_11 + HK33*P_1_11 + HK34*P_2_11 + HK35*P_3_11 + HK36*P_4_11 + HK37*P_5_11 + HK38*P_6_11)
+    K[..., 12] = -HK47*(HK32*P_0_12 + HK33*P_1_12 + HK34*P_2_12 + HK35*P_3_12 + HK36*P_4_12 + HK37*P_5_12 + HK38*P_6_12)
+    K[..., 13] = -HK47*(HK32*P_0_13 + HK33*P_1_13 + HK34*P_2_13 + HK35*P_3_13 + HK36*P_4_13 + HK37*P_5_13 + HK38*P_6_13)
+    K[..., 14] = -HK47*(HK32*P_0_14 + HK33*P_1_14 + HK34*P_2_14 + HK35*P_3_14 + HK36*P_4_14 + HK37*P_5_14 + HK38*P_6_14)
+    K[..., 15] = -HK47*(HK32*P_0_15 + HK33*P_1_15 + HK34*P_2_15 + HK35*P_3_15 + HK36*P_4_15 + HK37*P_5_15 + HK38*P_6_15)
+    K[..., 16] = -HK47*(HK32*P_0_16 + HK33*P_1_16 + HK34*P_2_16 + HK35*P_3_16 + HK36*P_4_16 + HK37*P_5_16 + HK38*P_6_16)
+    K[..., 17] = -HK47*(HK32*P_0_17 + HK33*P_1_17 + HK34*P_2_17 + HK35*P_3_17 + HK36*P_4_17 + HK37*P_5_17 + HK38*P_6_17)
+    K[..., 18] = -HK47*(HK32*P_0_18 + HK33*P_1_18 + HK34*P_2_18 + HK35*P_3_18 + HK36*P_4_18 + HK37*P_5_18 + HK38*P_6_18)
+    K[..., 19] = -HK47*(HK32*P_0_19 + HK33*P_1_19 + HK34*P_2_19 + HK35*P_3_19 + HK36*P_4_19 + HK37*P_5_19 + HK38*P_6_19)
+    K[..., 20] = -HK47*(HK32*P_0_20 + HK33*P_1_20 + HK34*P_2_20 + HK35*P_3_20 + HK36*P_4_20 + HK37*P_5_20 + HK38*P_6_20)
+    K[..., 21] = -HK47*(HK32*P_0_21 + HK33*P_1_21 + HK34*P_2_21 + HK35*P_3_21 + HK36*P_4_21 + HK37*P_5_21 + HK38*P_6_21)
+    K[..., 22] = -HK47*(HK32*P_0_22 + HK33*P_1_22 + HK34*P_2_22 + HK35*P_3_22 + HK36*P_4_22 + HK37*P_5_22 + HK38*P_6_22)
+    K[..., 23] = -HK47*(HK32*P_0_23 + HK33*P_1_23 + HK34*P_2_23 + HK35*P_3_23 + HK36*P_4_23 + HK37*P_5_23 + HK38*P_6_23)
+    return H, K
+
+# flow_y observation Jacobian and Kalman gain, loop over the filters
+def fuse_flow_y_kernel(states, P, Tbs, R_LOS, range_):
+    n_filters = P.shape[0]
+    Tbs = numpy.asarray(Tbs, dtype=numpy.float64)
+    Tbs = numpy.broadcast_to(Tbs, (n_filters,) + Tbs.shape[-2:])
+    R_LOS = numpy.broadcast_to(numpy.asarray(R_LOS, dtype=numpy.float64), (n_filters,))
+    range_ = numpy.broadcast_to(numpy.asarray(range_, dtype=numpy.float64), (n_filters,))
+    return _fuse_flow_y_kernel(states, P, Tbs, R_LOS, range_)
+
+@jit
+def _fuse_flow_y_kernel(states, P, Tbs, R_LOS, range_):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        q0 = states[index, 0]
+        q1 = states[index, 1]
+        q2 = states[index, 2]
+        q3 = states[index, 3]
+        vn = states[index, 4]
+        ve = states[index, 5]
+        vd = states[index, 6]
+        P_0_0 = P[index, 0, 0]
+        P_0_1 = P[index, 0, 1]
+        P_0_2 = P[index, 0, 2]
+        P_0_3 = P[index, 0, 3]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_7 = P[index, 0, 7]
+        P_0_8 = P[index, 0, 8]
+        P_0_9 = P[index, 0, 9]
+        P_0_10 = P[index, 0, 10]
+        P_0_11 = P[index, 0, 11]
+        P_0_12 = P[index, 0, 12]
+        P_0_13 = P[index, 0, 13]
+        P_0_14 = P[index, 0, 14]
+        P_0_15 = P[index, 0, 15]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_0_18 = P[index, 0, 18]
+        P_0_19 = P[index, 0, 19]
+        P_0_20 = P[index, 0, 20]
+        P_0_21 = P[index, 0, 21]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_1 = P[index, 1, 1]
+        P_1_2 = P[index, 1, 2]
+        P_1_3 = P[index, 1, 3]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_7 = P[index, 1, 7]
+        P_1_8 = P[index, 1, 8]
+        P_1_9 = P[index, 1, 9]
+        P_1_10 = P[index, 1, 10]
+        P_1_11 = P[index, 1, 11]
+        P_1_12 = P[index, 1, 12]
+        P_1_13 = P[index, 1, 13]
+        P_1_14 = P[index, 1, 14]
+        P_1_15 = P[index, 1, 15]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_1_18 = P[index, 1, 18]
+        P_1_19 = P[index, 1, 19]
+        P_1_20 = P[index, 1, 20]
+        P_1_21 = P[index, 1, 21]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_2 = P[index, 2, 2]
+        P_2_3 = P[index, 2, 3]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_7 = P[index, 2, 7]
+        P_2_8 = P[index, 2, 8]
+        P_2_9 = P[index, 2, 9]
+        P_2_10 = P[index, 2, 10]
+        P_2_11 = P[index, 2, 11]
+        P_2_12 = P[index, 2, 12]
+        P_2_13 = P[index, 2, 13]
+        P_2_14 = P[index, 2, 14]
+        P_2_15 = P[index, 2, 15]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_2_18 = P[index, 2, 18]
+        P_2_19 = P[index, 2, 19]
+        P_2_20 = P[index, 2, 20]
+        P_2_21 = P[index, 2, 21]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_3 = P[index, 3, 3]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_7 = P[index, 3, 7]
+        P_3_8 = P[index, 3, 8]
+        P_3_9 = P[index, 3, 9]
+        P_3_10 = P[index, 3, 10]
+        P_3_11 = P[index, 3, 11]
+        P_3_12 = P[index, 3, 12]
+        P_3_13 = P[index, 3, 13]
+        P_3_14 = P[index, 3, 14]
+        P_3_15 = P[index, 3, 15]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_3_18 = P[index, 3, 18]
+        P_3_19 = P[index, 3, 19]
+        P_3_20 = P[index, 3, 20]
+        P_3_21 = P[index, 3, 21]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        P_4_4 = P[index, 4, 4]
+        P_4_5 = P[index, 4, 5]
+        P_4_6 = P[index, 4, 6]
+        P_4_7 = P[index, 4, 7]
+        P_4_8 = P[index, 4, 8]
+        P_4_9 = P[index, 4, 9]
+        P_4_10 = P[index, 4, 10]
+        P_4_11 = P[index, 4, 11]
+        P_4_12 = P[index, 4, 12]
+        P_4_13 = P[index, 4, 13]
+        P_4_14 = P[index, 4, 14]
+        P_4_15 = P[index, 4, 15]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_4_18 = P[index, 4, 18]
+        P_4_19 = P[index, 4, 19]
+        P_4_20 = P[index, 4, 20]
+        P_4_21 = P[index, 4, 21]
+        P_4_22 = P[index, 4, 22]
+        P_4_23 = P[index, 4, 23]
+        P_5_5 = P[index, 5, 5]
+        P_5_6 = P[index, 5, 6]
+        P_5_7 = P[index, 5, 7]
+        P_5_8 = P[index, 5, 8]
+        P_5_9 = P[index, 5, 9]
+        P_5_10 = P[index, 5, 10]
+        P_5_11 = P[index, 5, 11]
+        P_5_12 = P[index, 5, 12]
+        P_5_13 = P[index, 5, 13]
+        P_5_14 = P[index, 5, 14]
+        P_5_15 = P[index, 5, 15]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_5_18 = P[index, 5, 18]
+        P_5_19 = P[index, 5, 19]
+        P_5_20 = P[index, 5, 20]
+        P_5_21 = P[index, 5, 21]
+        P_5_22 = P[index, 5, 22]
+        P_5_23 = P[index, 5, 23]
+        P_6_6 = P[index, 6, 6]
+        P_6_7 = P[index, 6, 7]
+        P_6_8 = P[index, 6, 8]
+        P_6_9 = P[index, 6, 9]
+        P_6_10 = P[index, 6, 10]
+        P_6_11 = P[index, 6, 11]
+        P_6_12 = P[index, 6, 12]
+        P_6_13 = P[index, 6, 13]
+        P_6_14 = P[index, 6, 14]
+        P_6_15 = P[index, 6, 15]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_6_18 = P[index, 6, 18]
+        P_6_19 = P[index, 6, 19]
+        P_6_20 = P[index, 6, 20]
+        P_6_21 = P[index, 6, 21]
+        P_6_22 = P[index, 6, 22]
+        P_6_23 = P[index, 6, 23]
+        Tbs_0_0 = Tbs[index, 0, 0]
+        Tbs_0_1 = Tbs[index, 0, 1]
+        Tbs_0_2 = Tbs[index, 0, 2]
+        HK0 = -Tbs_0_0*q2 + Tbs_0_1*q1 + Tbs_0_2*q0
+        HK1 = Tbs_0_0*q3 + Tbs_0_1*q0 - Tbs_0_2*q1
+        HK2 = Tbs_0_0*q0 - Tbs_0_1*q3 + Tbs_0_2*q2
+        HK3 = HK0*vd + HK1*ve + HK2*vn
+        HK4 = 1/range_[index]
+        HK5 = 2*HK4
+        HK6 = Tbs_0_0*q1 + Tbs_0_1*q2 + Tbs_0_2*q3
+        HK7 = HK1*vd + HK6*vn
+        HK8 = HK0*vn + HK6*ve
+        HK9 = HK2*ve + HK6*vd
+        HK10 = q0*q3
+        HK11 = q1*q2
+        HK12 = HK10 - HK11
+        HK13 = 2*Tbs_0_1
+        HK14 = q1**2
+        HK15 = q2**2
+        HK16 = -HK15
+        HK17 = q0**2
+        HK18 = q3**2
+        HK19 = HK17 - HK18
+        HK20 = q0*q2
+        HK21 = q1*q3
+        HK22 = 2*Tbs_0_2
+        HK23 = HK22*(HK20 + HK21) + Tbs_0_0*(HK14 + HK16 + HK19)
+        HK24 = q0*q1
+        HK25 = q2*q3
+        HK26 = HK24 - HK25
+        HK27 = -HK14
+        HK28 = 2*Tbs_0_0
+        HK29 = HK28*(HK10 + HK11) + Tbs_0_1*(HK15 + HK19 + HK27)
+        HK30 = HK20 - HK21
+        HK31 = HK13*(HK24 + HK25) + Tbs_0_2*(HK16 + HK17 + HK18 + HK27)
+        HK32 = 2*HK3
+        HK33 = -2*HK0*ve + 2*HK7
+        HK34 = -2*HK2*vd + 2*HK8
+        HK35 = -2*HK1*vn + 2*HK9
+        HK36 = -HK12*HK13 + HK23
+        HK37 = -HK22*HK26 + HK29
+        HK38 = -HK28*HK30 + HK31
+        HK39 = HK32*P_0_0 + HK33*P_0_1 + HK34*P_0_2 + HK35*P_0_3 + HK36*P_0_4 + HK37*P_0_5 + HK38*P_0_6
+        HK40 = range_[index]**(-2)
+        HK41 = HK32*P_0_6 + HK33*P_1_6 + HK34*P_2_6 + HK35*P_3_6 + HK36*P_4_6 + HK37*P_5_6 + HK38*P_6_6
+        HK42 = HK32*P_0_5 + HK33*P_1_5 + HK34*P_2_5 + HK35*P_3_5 + HK36*P_4_5 + HK37*P_5_5 + HK38*P_5_6
+        HK43 = HK32*P_0_4 + HK33*P_1_4 + HK34*P_2_4 + HK35*P_3_4 + HK36*P_4_4 + HK37*P_4_5 + HK38*P_4_6
+        HK44 = HK32*P_0_2 + HK33*P_1_2 + HK34*P_2_2 + HK35*P_2_3 + HK36*P_2_4 + HK37*P_2_5 + HK38*P_2_6
+        HK45 = HK32*P_0_3 + HK33*P_1_3 + HK34*P_2_3 + HK35*P_3_3 + HK36*P_3_4 + HK37*P_3_5 + HK38*P_3_6
+        HK46 = HK32*P_0_1 + HK33*P_1_1 + HK34*P_1_2 + HK35*P_1_3 + HK36*P_1_4 + HK37*P_1_5 + HK38*P_1_6
+        HK47 = HK4/(HK32*HK39*HK40 + HK33*HK40*HK46 + HK34*HK40*HK44 + HK35*HK40*HK45 + HK36*HK40*HK43 + HK37*HK40*HK42 + HK38*HK40*HK41 + R_LOS[index])
+        H[index, 0] = -HK3*HK5
+        H[index, 1] = -HK5*(-HK0*ve + HK7)
+        H[index, 2] = -HK5*(-HK2*vd + HK8)
+        H[index, 3] = -HK5*(-HK1*vn + HK9)
+        H[index, 4] = -HK4*(-HK12*HK13 + HK23)
+        H[index, 5] = -HK4*(-HK22*HK26 + HK29)
+        H[index, 6] = -HK4*(-HK28*HK30 + HK31)
+        K[index, 0] = -HK39*HK47
+        K[index, 1] = -HK46*HK47
+        K[index, 2] = -HK44*HK47
+        K[index, 3] = -HK45*HK47
+        K[index, 4] = -HK43*HK47
+        K[index, 5] = -HK42*HK47
+        K[index, 6] = -HK41*HK47
+        K[index, 7] = -HK47*(HK32*P_0_7 + HK33*P_1_7 + HK34*P_2_7 + HK35*P_3_7 + HK36*P_4_7 + HK37*P_5_7 + HK38*P_6_7)
+        K[index, 8] = -HK47*(HK32*P_0_8 + HK33*P_1_8 + HK34*P_2_8 + HK35*P_3_8 + HK36*P_4_8 + HK37*P_5_8 + HK38*P_6_8)
+        K[index, 9] = -HK47*(HK32*P_0_9 + HK33*P_1_9 + HK34*P_2_9 + HK35*P_3_9 + HK36*P_4_9 + HK37*P_5_9 + HK38*P_6_9)
+        K[index, 10] = -HK47*(HK32*P_0_10 + HK33*P_1_10 + HK34*P_2_10 + HK35*P_3_10 + HK36*P_4_10 + HK37*P_5_10 + HK38*P_6_10)
+        K[index, 11] = -HK47*(HK32*P_0_11 + HK33*P_1_11 + HK34*P_2_11 + HK35*P_3_11 + HK36*P_4_11 + HK37*P_5_11 + HK38*P_6_11)
+        K[index, 12] = -HK47*(HK32*P_0_12 + HK33*P_1_12 + HK34*P_2_12 + HK35*P_3_12 + HK36*P_4_12 + HK37*P_5_12 + HK38*P_6_12)
+        K[index, 13] = -HK47*(HK32*P_0_13 + HK33*P_1_13 + HK34*P_2_13 + HK35*P_3_13 + HK36*P_4_13 + HK37*P_5_13 + HK38*P_6_13)
+        K[index, 14] = -HK47*(HK32*P_0_14 + HK33*P_1_14 + HK34*P_2_14 + HK35*P_3_14 + HK36*P_4_14 + HK37*P_5_14 + HK38*P_6_14)
+        K[index, 15] = -HK47*(HK32*P_0_15 + HK33*P_1_15 + HK34*P_2_15 + HK35*P_3_15 + HK36*P_4_15 + HK37*P_5_15 + HK38*P_6_15)
+        K[index, 16] = -HK47*(HK32*P_0_16 + HK33*P_1_16 + HK34*P_2_16 + HK35*P_3_16 + HK36*P_4_16 + HK37*P_5_16 + HK38*P_6_16)
+        K[index, 17] = -HK47*(HK32*P_0_17 + HK33*P_1_17 + HK34*P_2_17 + HK35*P_3_17 + HK36*P_4_17 + HK37*P_5_17 + HK38*P_6_17)
+        K[index, 18] = -HK47*(HK32*P_0_18 + HK33*P_1_18 + HK34*P_2_18 + HK35*P_3_18 + HK36*P_4_18 + HK37*P_5_18 + HK38*P_6_18)
+        K[index, 19] = -HK47*(HK32*P_0_19 + HK33*P_1_19 + HK34*P_2_19 + HK35*P_3_19 + HK36*P_4_19 + HK37*P_5_19 + HK38*P_6_19)
+        K[index, 20] = -HK47*(HK32*P_0_20 + HK33*P_1_20 + HK34*P_2_20 + HK35*P_3_20 + HK36*P_4_20 + HK37*P_5_20 + HK38*P_6_20)
+        K[index, 21] = -HK47*(HK32*P_0_21 + HK33*P_1_21 + HK34*P_2_21 + HK35*P_3_21 + HK36*P_4_21 + HK37*P_5_21 + HK38*P_6_21)
+        K[index, 22] = -HK47*(HK32*P_0_22 + HK33*P_1_22 + HK34*P_2_22 + HK35*P_3_22 + HK36*P_4_22 + HK37*P_5_22 + HK38*P_6_22)
+        K[index, 23] = -HK47*(HK32*P_0_23 + HK33*P_1_23 + HK34*P_2_23 + HK35*P_3_23 + HK36*P_4_23 + HK37*P_5_23 + HK38*P_6_23)
+    return H, K
+
+# vel_bf_x observation Jacobian and Kalman gain
+def fuse_vel_bf_x(states, P, R_VEL):
+    q0 = states[..., 0]
+    q1 = states[..., 1]
+    q2 = states[..., 2]
+    q3 = states[..., 3]
+    vn = states[..., 4]
+    ve = states[..., 5]
+    vd = states[..., 6]
+    P_0_0 = P[..., 0, 0]
+    P_0_1 = P[..., 0, 1]
+    P_0_2 = P[..., 0, 2]
+    P_0_3 = P[..., 0, 3]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_7 = P[..., 0, 7]
+    P_0_8 = P[..., 0, 8]
+    P_0_9 = P[..., 0, 9]
+    P_0_10 = P[..., 0, 10]
+    P_0_11 = P[..., 0, 11]
+    P_0_12 = P[..., 0, 12]
+    P_0_13 = P[..., 0, 13]
+    P_0_14 = P[..., 0, 14]
+    P_0_15 = P[..., 0, 15]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_0_18 = P[..., 0, 18]
+    P_0_19 = P[..., 0, 19]
+    P_0_20 = P[..., 0, 20]
+    P_0_21 = P[..., 0, 21]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_1 = P[..., 1, 1]
+    P_1_2 = P[..., 1, 2]
+    P_1_3 = P[..., 1, 3]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_7 = P[..., 1, 7]
+    P_1_8 = P[..., 1, 8]
+    P_1_9 = P[..., 1, 9]
+    P_1_10 = P[..., 1, 10]
+    P_1_11 = P[..., 1, 11]
+    P_1_12 = P[..., 1, 12]
+    P_1_13 = P[..., 1, 13]
+    P_1_14 = P[..., 1, 14]
+    P_1_15 = P[..., 1, 15]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_1_18 = P[..., 1, 18]
+    P_1_19 = P[..., 1, 19]
+    P_1_20 = P[..., 1, 20]
+    P_1_21 = P[..., 1, 21]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_2 = P[..., 2, 2]
+    P_2_3 = P[..., 2, 3]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_7 = P[..., 2, 7]
+    P_2_8 = P[..., 2, 8]
+    P_2_9 = P[..., 2, 9]
+    P_2_10 = P[..., 2, 10]
+    P_2_11 = P[..., 2, 11]
+    P_2_12 = P[..., 2, 12]
+    P_2_13 = P[..., 2, 13]
+    P_2_14 = P[..., 2, 14]
+    P_2_15 = P[..., 2, 15]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_2_18 = P[..., 2, 18]
+    P_2_19 = P[..., 2, 19]
+    P_2_20 = P[..., 2, 20]
+    P_2_21 = P[..., 2, 21]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_3 = P[..., 3, 3]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_7 = P[..., 3, 7]
+    P_3_8 = P[..., 3, 8]
+    P_3_9 = P[..., 3, 9]
+    P_3_10 = P[..., 3, 10]
+    P_3_11 = P[..., 3, 11]
+    P_3_12 = P[..., 3, 12]
+    P_3_13 = P[..., 3, 13]
+    P_3_14 = P[..., 3, 14]
+    P_3_15 = P[..., 3, 15]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_3_18 = P[..., 3, 18]
+    P_3_19 = P[..., 3, 19]
+    P_3_20 = P[..., 3, 20]
+    P_3_21 = P[..., 3, 21]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    P_4_4 = P[..., 4, 4]
+    P_4_5 = P[..., 4, 5]
+    P_4_6 = P[..., 4, 6]
+    P_4_7 = P[..., 4, 7]
+    P_4_8 = P[..., 4, 8]
+    P_4_9 = P[..., 4, 9]
+    P_4_10 = P[..., 4, 10]
+    P_4_11 = P[..., 4, 11]
+    P_4_12 = P[..., 4, 12]
+    P_4_13 = P[..., 4, 13]
+    P_4_14 = P[..., 4, 14]
+    P_4_15 = P[..., 4, 15]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_4_18 = P[..., 4, 18]
+    P_4_19 = P[..., 4, 19]
+    P_4_20 = P[..., 4, 20]
+    P_4_21 = P[..., 4, 21]
+    P_4_22 = P[..., 4, 22]
+    P_4_23 = P[..., 4, 23]
+    P_5_5 = P[..., 5, 5]
+    P_5_6 = P[..., 5, 6]
+    P_5_7 = P[..., 5, 7]
+    P_5_8 = P[..., 5, 8]
+    P_5_9 = P[..., 5, 9]
+    P_5_10 = P[..., 5, 10]
+    P_5_11 = P[..., 5, 11]
+    P_5_12 = P[..., 5, 12]
+    P_5_13 = P[..., 5, 13]
+    P_5_14 = P[..., 5, 14]
+    P_5_15 = P[..., 5, 15]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_5_18 = P[..., 5, 18]
+    P_5_19 = P[..., 5, 19]
+    P_5_20 = P[..., 5, 20]
+    P_5_21 = P[..., 5, 21]
+    P_5_22 = P[..., 5, 22]
+    P_5_23 = P[..., 5, 23]
+    P_6_6 = P[..., 6, 6]
+    P_6_7 = P[..., 6, 7]
+    P_6_8 = P[..., 6, 8]
+    P_6_9 = P[..., 6, 9]
+    P_6_10 = P[..., 6, 10]
+    P_6_11 = P[..., 6, 11]
+    P_6_12 = P[..., 6, 12]
+    P_6_13 = P[..., 6, 13]
+    P_6_14 = P[..., 6, 14]
+    P_6_15 = P[..., 6, 15]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_6_18 = P[..., 6, 18]
+    P_6_19 = P[..., 6, 19]
+    P_6_20 = P[..., 6, 20]
+    P_6_21 = P[..., 6, 21]
+    P_6_22 = P[..., 6, 22]
+    P_6_23 = P[..., 6, 23]
+    HK0 = q0*vn - q2*vd + q3*ve
+    HK1 = q1*vn + q2*ve + q3*vd
+    HK2 = q0*vd - q1*ve + q2*vn
+    HK3 = q0*ve + q1*vd - q3*vn
+    HK4 = q0**2 + q1**2 - q2**2 - q3**2
+    HK5 = q0*q3 + q1*q2
+    HK6 = q0*q2 - q1*q3
+    HK7 = 2*HK5
+    HK8 = 2*HK6
+    HK9 = 2*HK1
+    HK10 = 2*HK0
+    HK11 = 2*HK2
+    HK12 = 2*HK3
+    HK13 = HK10*P_0_0 - HK11*P_0_2 + HK12*P_0_3 + HK4*P_0_4 + HK7*P_0_5 - HK8*P_0_6 + HK9*P_0_1
+    HK14 = HK10*P_0_5 - HK11*P_2_5 + HK12*P_3_5 + HK4*P_4_5 + HK7*P_5_5 - HK8*P_5_6 + HK9*P_1_5
+    HK15 = HK10*P_0_6 - HK11*P_2_6 + HK12*P_3_6 + HK4*P_4_6 + HK7*P_5_6 - HK8*P_6_6 + HK9*P_1_6
+    HK16 = HK10*P_0_1 - HK11*P_1_2 + HK12*P_1_3 + HK4*P_1_4 + HK7*P_1_5 - HK8*P_1_6 + HK9*P_1_1
+    HK17 = HK10*P_0_2 - HK11*P_2_2 + HK12*P_2_3 + HK4*P_2_4 + HK7*P_2_5 - HK8*P_2_6 + HK9*P_1_2
+    HK18 = HK10*P_0_3 - HK11*P_2_3 + HK12*P_3_3 + HK4*P_3_4 + HK7*P_3_5 - HK8*P_3_6 + HK9*P_1_3
+    HK19 = HK10*P_0_4 - HK11*P_2_4 + HK12*P_3_4 + HK4*P_4_4 + HK7*P_4_5 - HK8*P_4_6 + HK9*P_1_4
+    HK20 = 1/(HK10*HK13 - HK11*HK17 + HK12*HK18 + HK14*HK7 - HK15*HK8 + HK16*HK9 + HK19*HK4 + R_VEL)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 0] = 2*HK0
+    H[..., 1] = 2*HK1
+    H[..., 2] = -2*HK2
+    H[..., 3] = 2*HK3
+    H[..., 4] = HK4
+    H[..., 5] = 2*HK5
+    H[..., 6] = -2*HK6
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = HK13*HK20
+    K[..., 1] = HK16*HK20
+    K[..., 2] = HK17*HK20
+    K[..., 3] = HK18*HK20
+    K[..., 4] = HK19*HK20
+    K[..., 5] = HK14*HK20
+    K[..., 6] = HK15*HK20
+    K[..., 7] = HK20*(HK10*P_0_7 - HK11*P_2_7 + HK12*P_3_7 + HK4*P_4_7 + HK7*P_5_7 - HK8*P_6_7 + HK9*P_1_7)
+    K[..., 8] = HK20*(HK10*P_0_8 - HK11*P_2_8 + HK12*P_3_8 + HK4*P_4_8 + HK7*P_5_8 - HK8*P_6_8 + HK9*P_1_8)
+    K[..., 9] = HK20*(HK10*P_0_9 - HK11*P_2_9 + HK12*P_3_9 + HK4*P_4_9 + HK7*P_5_9 - HK8*P_6_9 + HK9*P_1_9)
+    K[..., 10] = HK20*(HK10*P_0_10 - HK11*P_2_10 + HK12*P_3_10 + HK4*P_4_10 + HK7*P_5_10 - HK8*P_6_10 + HK9*P_1_10)
+    K[..., 11] = HK20*(HK10*P_0_11 - HK11*P_2_11 + HK12*P_3_11 + HK4*P_4_11 + HK7*P_5_11 - HK8*P_6_11 + HK9*P_1_11)
+    K[..., 12] = HK20*(HK10*P_0_12 - HK11*P_2_12 + HK12*P_3_12 + HK4*P_4_12 + HK7*P_5_12 - HK8*P_6_12 + HK9*P_1_12)
+    K[..., 13] = HK20*(HK10*P_0_13 - HK11*P_2_13 + HK12*P_3_13 + HK4*P_4_13 + HK7*P_5_13 - HK8*P_6_13 + HK9*P_1_13)
+    K[..., 14] = HK20*(HK10*P_0_14 - HK11*P_2_14 + HK12*P_3_14 + HK4*P_4_14 + HK7*P_5_14 - HK8*P_6_14 + HK9*P_1_14)
+    K[..., 15] = HK20*(HK10*P_0_15 - HK11*P_2_15 + HK12*P_3_15 + HK4*P_4_15 + HK7*P_5_15 - HK8*P_6_15 + HK9*P_1_15)
+    K[..., 16] = HK20*(HK10*P_0_16 - HK11*P_2_16 + HK12*P_3_16 + HK4*P_4_16 + HK7*P_5_16 - HK8*P_6_16 + HK9*P_1_16)
+    K[..., 17] = HK20*(HK10*P_0_17 - HK11*P_2_17 + HK12*P_3_17 + HK4*P_4_17 + HK7*P_5_17 - HK8*P_6_17 + HK9*P_1_17)
+    K[..., 18] = HK20*(HK10*P_0_18 - HK11*P_2_18 + HK12*P_3_18 + HK4*P_4_18 + HK7*P_5_18 - HK8*P_6_18 + HK9*P_1_18)
+    K[..., 19] = HK20*(HK10*P_0_19 - HK11*P_2_19 + HK12*P_3_19 + HK4*P_4_19 + HK7*P_5_19 - HK8*P_6_19 + HK9*P_1_19)
+    K[..., 20] = HK20*(HK10*P_0_20 - HK11*P_2_20 + HK12*P_3_20 + HK4*P_4_20 + HK7*P_5_20 - HK8*P_6_20 + HK9*P_1_20)
+    K[..., 21] = HK20*(HK10*P_0_21 - HK11*P_2_21 + HK12*P_3_21 + HK4*P_4_21 + HK7*P_5_21 - HK8*P_6_21 + HK9*P_1_21)
+    K[..., 22] = HK20*(HK10*P_0_22 - HK11*P_2_22 + HK12*P_3_22 + HK4*P_4_22 + HK7*P_5_22 - HK8*P_6_22 + HK9*P_1_22)
+    K[..., 23] = HK20*(HK10*P_0_23 - HK11*P_2_23 + HK12*P_3_23 + HK4*P_4_23 + HK7*P_5_23 - HK8*P_6_23 + HK9*P_1_23)
+    return H, K
+
+# vel_bf_x observation Jacobian and Kalman gain, loop over the filters
+def fuse_vel_bf_x_kernel(states, P, R_VEL):
+    n_filters = P.shape[0]
+    R_VEL = numpy.broadcast_to(numpy.asarray(R_VEL, dtype=numpy.float64), (n_filters,))
+    return _fuse_vel_bf_x_kernel(states, P, R_VEL)
+
+@jit
+def _fuse_vel_bf_x_kernel(states, P, R_VEL):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        q0 = states[index, 0]
+        q1 = states[index, 1]
+        q2 = states[index, 2]
+        q3 = states[index, 3]
+        vn = states[index, 4]
+        ve = states[index, 5]
+        vd = states[index, 6]
+        P_0_0 = P[index, 0, 0]
+        P_0_1 = P[index, 0, 1]
+        P_0_2 = P[index, 0, 2]
+        P_0_3 = P[index, 0, 3]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_7 = P[index, 0, 7]
+        P_0_8 = P[index, 0, 8]
+        P_0_9 = P[index, 0, 9]
+        P_0_10 = P[index, 0, 10]
+        P_0_11 = P[index, 0, 11]
+        P_0_12 = P[index, 0, 12]
+        P_0_13 = P[index, 0, 13]
+        P_0_14 = P[index, 0, 14]
+        P_0_15 = P[index, 0, 15]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_0_18 = P[index, 0, 18]
+        P_0_19 = P[index, 0, 19]
+        P_0_20 = P[index, 0, 20]
+        P_0_21 = P[index, 0, 21]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_1 = P[index, 1, 1]
+        P_1_2 = P[index, 1, 2]
+        P_1_3 = P[index, 1, 3]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_7 = P[index, 1, 7]
+        P_1_8 = P[index, 1, 8]
+        P_1_9 = P[index, 1, 9]
+        P_1_10 = P[index, 1, 10]
+        P_1_11 = P[index, 1, 11]
+        P_1_12 = P[index, 1, 12]
+        P_1_13 = P[index, 1, 13]
+        P_1_14 = P[index, 1, 14]
+        P_1_15 = P[index, 1, 15]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_1_18 = P[index, 1, 18]
+        P_1_19 = P[index, 1, 19]
+        P_1_20 = P[index, 1, 20]
+        P_1_21 = P[index, 1, 21]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_2 = P[index, 2, 2]
+        P_2_3 = P[index, 2, 3]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_7 = P[index, 2, 7]
+        P_2_8 = P[index, 2, 8]
+        P_2_9 = P[index, 2, 9]
+        P_2_10 = P[index, 2, 10]
+        P_2_11 = P[index, 2, 11]
+        P_2_12 = P[index, 2, 12]
+        P_2_13 = P[index, 2, 13]
+        P_2_14 = P[index, 2, 14]
+        P_2_15 = P[index, 2, 15]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_2_18 = P[index, 2, 18]
+        P_2_19 = P[index, 2, 19]
+        P_2_20 = P[index, 2, 20]
+        P_2_21 = P[index, 2, 21]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_3 = P[index, 3, 3]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_7 = P[index, 3, 7]
+        P_3_8 = P[index, 3, 8]
+        P_3_9 = P[index, 3, 9]
+        P_3_10 = P[index, 3, 10]
+        P_3_11 = P[index, 3, 11]
+        P_3_12 = P[index, 3, 12]
+        P_3_13 = P[index, 3, 13]
+        P_3_14 = P[index, 3, 14]
+        P_3_15 = P[index, 3, 15]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_3_18 = P[index, 3, 18]
+        P_3_19 = P[index, 3, 19]
+        P_3_20 = P[index, 3, 20]
+        P_3_21 = P[index, 3, 21]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        P_4_4 = P[index, 4, 4]
+        P_4_5 = P[index, 4, 5]
+        P_4_6 = P[index, 4, 6]
+        P_4_7 = P[index, 4, 7]
+        P_4_8 = P[index, 4, 8]
+        P_4_9 = P[index, 4, 9]
+        P_4_10 = P[index, 4, 10]
+        P_4_11 = P[index, 4, 11]
+        P_4_12 = P[index, 4, 12]
+        P_4_13 = P[index, 4, 13]
+        P_4_14 = P[index, 4, 14]
+        P_4_15 = P[index, 4, 15]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_4_18 = P[index, 4, 18]
+        P_4_19 = P[index, 4, 19]
+        P_4_20 = P[index, 4, 20]
+        P_4_21 = P[index, 4, 21]
+        P_4_22 = P[index, 4, 22]
+        P_4_23 = P[index, 4, 23]
+        P_5_5 = P[index, 5, 5]
+        P_5_6 = P[index, 5, 6]
+        P_5_7 = P[index, 5, 7]
+        P_5_8 = P[index, 5, 8]
+        P_5_9 = P[index, 5, 9]
+        P_5_10 = P[index, 5, 10]
+        P_5_11 = P[index, 5, 11]
+        P_5_12 = P[index, 5, 12]
+        P_5_13 = P[index, 5, 13]
+        P_5_14 = P[index, 5, 14]
+        P_5_15 = P[index, 5, 15]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_5_18 = P[index, 5, 18]
+        P_5_19 = P[index, 5, 19]
+        P_5_20 = P[index, 5, 20]
+        P_5_21 = P[index, 5, 21]
+        P_5_22 = P[index, 5, 22]
+        P_5_23 = P[index, 5, 23]
+        P_6_6 = P[index, 6, 6]
+        P_6_7 = P[index, 6, 7]
+        P_6_8 = P[index, 6, 8]
+        P_6_9 = P[index, 6, 9]
+        P_6_10 = P[index, 6, 10]
+        P_6_11 = P[index, 6, 11]
+        P_6_12 = P[index, 6, 12]
+        P_6_13 = P[index, 6, 13]
+        P_6_14 = P[index, 6, 14]
+        P_6_15 = P[index, 6, 15]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_6_18 = P[index, 6, 18]
+        P_6_19 = P[index, 6, 19]
+        P_6_20 = P[index, 6, 20]
+        P_6_21 = P[index, 6, 21]
+        P_6_22 = P[index, 6, 22]
+        P_6_23 = P[index, 6, 23]
+        HK0 = q0*vn - q2*vd + q3*ve
+        HK1 = q1*vn + q2*ve + q3*vd
+        HK2 = q0*vd - q1*ve + q2*vn
+        HK3 = q0*ve + q1*vd - q3*vn
+        HK4 = q0**2 + q1**2 - q2**2 - q3**2
+        HK5 = q0*q3 + q1*q2
+        HK6 = q0*q2 - q1*q3
+        HK7 = 2*HK5
+        HK8 = 2*HK6
+        HK9 = 2*HK1
+        HK10 = 2*HK0
+        HK11 = 2*HK2
+        HK12 = 2*HK3
+        HK13 = HK10*P_0_0 - HK11*P_0_2 + HK12*P_0_3 + HK4*P_0_4 + HK7*P_0_5 - HK8*P_0_6 + HK9*P_0_1
+        HK14 = HK10*P_0_5 - HK11*P_2_5 + HK12*P_3_5 + HK4*P_4_5 + HK7*P_5_5 - HK8*P_5_6 + HK9*P_1_5
+        HK15 = HK10*P_0_6 - HK11*P_2_6 + HK12*P_3_6 + HK4*P_4_6 + HK7*P_5_6 - HK8*P_6_6 + HK9*P_1_6
+        HK16 = HK10*P_0_1 - HK11*P_1_2 + HK12*P_1_3 + HK4*P_1_4 + HK7*P_1_5 - HK8*P_1_6 + HK9*P_1_1
+        HK17 = HK10*P_0_2 - HK11*P_2_2 + HK12*P_2_3 + HK4*P_2_4 + HK7*P_2_5 - HK8*P_2_6 + HK9*P_1_2
+        HK18 = HK10*P_0_3 - HK11*P_2_3 + HK12*P_3_3 + HK4*P_3_4 + HK7*P_3_5 - HK8*P_3_6 + HK9*P_1_3
+        HK19 = HK10*P_0_4 - HK11*P_2_4 + HK12*P_3_4 + HK4*P_4_4 + HK7*P_4_5 - HK8*P_4_6 + HK9*P_1_4
+        HK20 = 1/(HK10*HK13 - HK11*HK17 + HK12*HK18 + HK14*HK7 - HK15*HK8 + HK16*HK9 + HK19*HK4 + R_VEL[index])
+        H[index, 0] = 2*HK0
+        H[index, 1] = 2*HK1
+        H[index, 2] = -2*HK2
+        H[index, 3] = 2*HK3
+        H[index, 4] = HK4
+        H[index, 5] = 2*HK5
+        H[index, 6] = -2*HK6
+        K[index, 0] = HK13*HK20
+        K[index, 1] = HK16*HK20
+        K[index, 2] = HK17*HK20
+        K[index, 3] = HK18*HK20
+        K[index, 4] = HK19*HK20
+        K[index, 5] = HK14*HK20
+        K[index, 6] = HK15*HK20
+        K[index, 7] = HK20*(HK10*P_0_7 - HK11*P_2_7 + HK12*P_3_7 + HK4*P_4_7 + HK7*P_5_7 - HK8*P_6_7 + HK9*P_1_7)
+        K[index, 8] = HK20*(HK10*P_0_8 - HK11*P_2_8 + HK12*P_3_8 + HK4*P_4_8 + HK7*P_5_8 - HK8*P_6_8 + HK9*P_1_8)
+        K[index, 9] = HK20*(HK10*P_0_9 - HK11*P_2_9 + HK12*P_3_9 + HK4*P_4_9 + HK7*P_5_9 - HK8*P_6_9 + HK9*P_1_9)
+        K[index, 10] = HK20*(HK10*P_0_10 - HK11*P_2_10 + HK12*P_3_10 + HK4*P_4_10 + HK7*P_5_10 - HK8*P_6_10 + HK9*P_1_10)
+        K[index, 11] = HK20*(HK10*P_0_11 - HK11*P_2_11 + HK12*P_3_11 + HK4*P_4_11 + HK7*P_5_11 - HK8*P_6_11 + HK9*P_1_11)
+        K[index, 12] = HK20*(HK10*P_0_12 - HK11*P_2_12 + HK12*P_3_12 + HK4*P_4_12 + HK7*P_5_12 - HK8*P_6_12 + HK9*P_1_12)
+        K[index, 13] = HK20*(HK10*P_0_13 - HK11*P_2_13 + HK12*P_3_13 + HK4*P_4_13 + HK7*P_5_13 - HK8*P_6_13 + HK9*P_1_13)
+        K[index, 14] = HK20*(HK10*P_0_14 - HK11*P_2_14 + HK12*P_3_14 + HK4*P_4_14 + HK7*P_5_14 - HK8*P_6_14 + HK9*P_1_14)
+        K[index, 15] = HK20*(HK10*P_0_15 - HK11*P_2_15 + HK12*P_3_15 + HK4*P_4_15 + HK7*P_5_15 - HK8*P_6_15 + HK9*P_1_15)
+        K[index, 16] = HK20*(HK10*P_0_16 - HK11*P_2_16 + HK12*P_3_16 + HK4*P_4_16 + HK7*P_5_16 - HK8*P_6_16 + HK9*P_1_16)
+        K[index, 17] = HK20*(HK10*P_0_17 - HK11*P_2_17 + HK12*P_3_17 + HK4*P_4_17 + HK7*P_5_17 - HK8*P_6_17 + HK9*P_1_17)
+        K[index, 18] = HK20*(HK10*P_0_18 - HK11*P_2_18 + HK12*P_3_18 + HK4*P_4_18 + HK7*P_5_18 - HK8*P_6_18 + HK9*P_1_18)
+        K[index, 19] = HK20*(HK10*P_0_19 - HK11*P_2_19 + HK12*P_3_19 + HK4*P_4_19 + HK7*P_5_19 - HK8*P_6_19 + HK9*P_1_19)
+        K[index, 20] = HK20*(HK10*P_0_20 - HK11*P_2_20 + HK12*P_3_20 + HK4*P_4_20 + HK7*P_5_20 - HK8*P_6_20 + HK9*P_1_20)
+        K[index, 21] = HK20*(HK10*P_0_21 - HK11*P_2_21 + HK12*P_3_21 + HK4*P_4_21 + HK7*P_5_21 - HK8*P_6_21 + HK9*P_1_21)
+        K[index, 22] = HK20*(HK10*P_0_22 - HK11*P_2_22 + HK12*P_3_22 + HK4*P_4_22 + HK7*P_5_22 - HK8*P_6_22 + HK9*P_1_22)
+        K[index, 23] = HK20*(HK10*P_0_23 - HK11*P_2_23 + HK12*P_3_23 + HK4*P_4_23 + HK7*P_5_23 - HK8*P_6_23 + HK9*P_1_23)
+    return H, K
+
+# vel_bf_y observation Jacobian and Kalman gain
+def fuse_vel_bf_y(states, P, R_VEL):
+    q0 = states[..., 0]
+    q1 = states[..., 1]
+    q2 = states[..., 2]
+    q3 = states[..., 3]
+    vn = states[..., 4]
+    ve = states[..., 5]
+    vd = states[..., 6]
+    P_0_0 = P[..., 0, 0]
+    P_0_1 = P[..., 0, 1]
+    P_0_2 = P[..., 0, 2]
+    P_0_3 = P[..., 0, 3]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_7 = P[..., 0, 7]
+    P_0_8 = P[..., 0, 8]
+    P_0_9 = P[..., 0, 9]
+    P_0_10 = P[..., 0, 10]
+    P_0_11 = P[..., 0, 11]
+    P_0_12 = P[..., 0, 12]
+    P_0_13 = P[..., 0, 13]
+    P_0_14 = P[..., 0, 14]
+    P_0_15 = P[..., 0, 15]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_0_18 = P[..., 0, 18]
+    P_0_19 = P[..., 0, 19]
+    P_0_20 = P[..., 0, 20]
+    P_0_21 = P[..., 0, 21]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_1 = P[..., 1, 1]
+    P_1_2 = P[..., 1, 2]
+    P_1_3 = P[..., 1, 3]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_7 = P[..., 1, 7]
+    P_1_8 = P[..., 1, 8]
+    P_1_9 = P[..., 1, 9]
+    P_1_10 = P[..., 1, 10]
+    P_1_11 = P[..., 1, 11]
+    P_1_12 = P[..., 1, 12]
+    P_1_13 = P[..., 1, 13]
+    P_1_14 = P[..., 1, 14]
+    P_1_15 = P[..., 1, 15]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_1_18 = P[..., 1, 18]
+    P_1_19 = P[..., 1, 19]
+    P_1_20 = P[..., 1, 20]
+    P_1_21 = P[..., 1, 21]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_2 = P[..., 2, 2]
+    P_2_3 = P[..., 2, 3]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_7 = P[..., 2, 7]
+    P_2_8 = P[..., 2, 8]
+    P_2_9 = P[..., 2, 9]
+    P_2_10 = P[..., 2, 10]
+    P_2_11 = P[..., 2, 11]
+    P_2_12 = P[..., 2, 12]
+    P_2_13 = P[..., 2, 13]
+    P_2_14 = P[..., 2, 14]
+    P_2_15 = P[..., 2, 15]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_2_18 = P[..., 2, 18]
+    P_2_19 = P[..., 2, 19]
+    P_2_20 = P[..., 2, 20]
+    P_2_21 = P[..., 2, 21]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_3 = P[..., 3, 3]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_7 = P[..., 3, 7]
+    P_3_8 = P[..., 3, 8]
+    P_3_9 = P[..., 3, 9]
+    P_3_10 = P[..., 3, 10]
+    P_3_11 = P[..., 3, 11]
+    P_3_12 = P[..., 3, 12]
+    P_3_13 = P[..., 3, 13]
+    P_3_14 = P[..., 3, 14]
+    P_3_15 = P[..., 3, 15]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_3_18 = P[..., 3, 18]
+    P_3_19 = P[..., 3, 19]
+    P_3_20 = P[..., 3, 20]
+    P_3_21 = P[..., 3, 21]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    P_4_4 = P[..., 4, 4]
+    P_4_5 = P[..., 4, 5]
+    P_4_6 = P[..., 4, 6]
+    P_4_7 = P[..., 4, 7]
+    P_4_8 = P[..., 4, 8]
+    P_4_9 = P[..., 4, 9]
+    P_4_10 = P[..., 4, 10]
+    P_4_11 = P[..., 4, 11]
+    P_4_12 = P[..., 4, 12]
+    P_4_13 = P[..., 4, 13]
+    P_4_14 = P[..., 4, 14]
+    P_4_15 = P[..., 4, 15]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_4_18 = P[..., 4, 18]
+    P_4_19 = P[..., 4, 19]
+    P_4_20 = P[..., 4, 20]
+    P_4_21 = P[..., 4, 21]
+    P_4_22 = P[..., 4, 22]
+    P_4_23 = P[..., 4, 23]
+    P_5_5 = P[..., 5, 5]
+    P_5_6 = P[..., 5, 6]
+    P_5_7 = P[..., 5, 7]
+    P_5_8 = P[..., 5, 8]
+    P_5_9 = P[..., 5, 9]
+    P_5_10 = P[..., 5, 10]
+    P_5_11 = P[..., 5, 11]
+    P_5_12 = P[..., 5, 12]
+    P_5_13 = P[..., 5, 13]
+    P_5_14 = P[..., 5, 14]
+    P_5_15 = P[..., 5, 15]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_5_18 = P[..., 5, 18]
+    P_5_19 = P[..., 5, 19]
+    P_5_20 = P[..., 5, 20]
+    P_5_21 = P[..., 5, 21]
+    P_5_22 = P[..., 5, 22]
+    P_5_23 = P[..., 5, 23]
+    P_6_6 = P[..., 6, 6]
+    P_6_7 = P[..., 6, 7]
+    P_6_8 = P[..., 6, 8]
+    P_6_9 = P[..., 6, 9]
+    P_6_10 = P[..., 6, 10]
+    P_6_11 = P[..., 6, 11]
+    P_6_12 = P[..., 6, 12]
+    P_6_13 = P[..., 6, 13]
+    P_6_14 = P[..., 6, 14]
+    P_6_15 = P[..., 6, 15]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_6_18 = P[..., 6, 18]
+    P_6_19 = P[..., 6, 19]
+    P_6_20 = P[..., 6, 20]
+    P_6_21 = P[..., 6, 21]
+    P_6_22 = P[..., 6, 22]
+    P_6_23 = P[..., 6, 23]
+    HK0 = q0*ve + q1*vd - q3*vn
+    HK1 = q0*vd - q1*ve + q2*vn
+    HK2 = q1*vn + q2*ve + q3*vd
+    HK3 = q0*vn - q2*vd + q3*ve
+    HK4 = q0*q3 - q1*q2
+    HK5 = q0**2 - q1**2 + q2**2 - q3**2
+    HK6 = q0*q1 + q2*q3
+    HK7 = 2*HK6
+    HK8 = 2*HK4
+    HK9 = 2*HK2
+    HK10 = 2*HK0
+    HK11 = 2*HK1
+    HK12 = 2*HK3
+    HK13 = HK10*P_0_0 + HK11*P_0_1 - HK12*P_0_3 + HK5*P_0_5 + HK7*P_0_6 - HK8*P_0_4 + HK9*P_0_2
+    HK14 = HK10*P_0_6 + HK11*P_1_6 - HK12*P_3_6 + HK5*P_5_6 + HK7*P_6_6 - HK8*P_4_6 + HK9*P_2_6
+    HK15 = HK10*P_0_4 + HK11*P_1_4 - HK12*P_3_4 + HK5*P_4_5 + HK7*P_4_6 - HK8*P_4_4 + HK9*P_2_4
+    HK16 = HK10*P_0_2 + HK11*P_1_2 - HK12*P_2_3 + HK5*P_2_5 + HK7*P_2_6 - HK8*P_2_4 + HK9*P_2_2
+    HK17 = HK10*P_0_1 + HK11*P_1_1 - HK12*P_1_3 + HK5*P_1_5 + HK7*P_1_6 - HK8*P_1_4 + HK9*P_1_2
+    HK18 = HK10*P_0_3 + HK11*P_1_3 - HK12*P_3_3 + HK5*P_3_5 + HK7*P_3_6 - HK8*P_3_4 + HK9*P_2_3
+    HK19 = HK10*P_0_5 + HK11*P_1_5 - HK12*P_3_5 + HK5*P_5_5 + HK7*P_5_6 - HK8*P_4_5 + HK9*P_2_5
+    HK20 = 1/(HK10*HK13 + HK11*HK17 - HK12*HK18 + HK14*HK7 - HK15*HK8 + HK16*HK9 + HK19*HK5 + R_VEL)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 0] = 2*HK0
+    H[..., 1] = 2*HK1
+    H[..., 2] = 2*HK2
+    H[..., 3] = -2*HK3
+    H[..., 4] = -2*HK4
+    H[..., 5] = HK5
+    H[..., 6] = 2*HK6
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = HK13*HK20
+    K[..., 1] = HK17*HK20
+    K[..., 2] = HK16*HK20
+    K[..., 3] = HK18*HK20
+    K[..., 4] = HK15*HK20
+    K[..., 5] = HK19*HK20
+    K[..., 6] = HK14*HK20
+    K[..., 7] = HK20*(HK10*P_0_7 + HK11*P_1_7 - HK12*P_3_7 + HK5*P_5_7 + HK7*P_6_7 - HK8*P_4_7 + HK9*P_2_7)
+    K[..., 8] = HK20*(HK10*P_0_8 + HK11*P_1_8 - HK12*P_3_8 + HK5*P_5_8 + HK7*P_6_8 - HK8*P_4_8 + HK9*P_2_8)
+    K[..., 9] = HK20*(HK10*P_0_9 + HK11*P_1_9 - HK12*P_3_9 + HK5*P_5_9 + HK7*P_6_9 - HK8*P_4_9 + HK9*P_2_9)
+    K[..., 10] = HK20*(HK10*P_0_10 + HK11*P_1_10 - HK12*P_3_10 + HK5*P_5_10 + HK7*P_6_10 - HK8*P_4_10 + HK9*P_2_10)
+    K[..., 11] = HK20*(HK10*P_0_11 + HK11*P_1_11 - HK12*P_3_11 + HK5*P_5_11 + HK7*P_6_11 - HK8*P_4_11 + HK9*P_2_11)
+    K[..., 12] = HK20*(HK10*P_0_12 + HK11*P_1_12 - HK12*P_3_12 + HK5*P_5_12 + HK7*P_6_12 - HK8*P_4_12 + HK9*P_2_12)
+    K[..., 13] = HK20*(HK10*P_0_13 + HK11*P_1_13 - HK12*P_3_13 + HK5*P_5_13 + HK7*P_6_13 - HK8*P_4_13 + HK9*P_2_13)
+    K[..., 14] = HK20*(HK10*P_0_14 + HK11*P_1_14 - HK12*P_3_14 + HK5*P_5_14 + HK7*P_6_14 - HK8*P_4_14 + HK9*P_2_14)
+    K[..., 15] = HK20*(HK10*P_0_15 + HK11*P_1_15 - HK12*P_3_15 + HK5*P_5_15 + HK7*P_6_15 - HK8*P_4_15 + HK9*P_2_15)
+    K[..., 16] = HK20*(HK10*P_0_16 + HK11*P_1_16 - HK12*P_3_16 + HK5*P_5_16 + HK7*P_6_16 - HK8*P_4_16 + HK9*P_2_16)
+    K[..., 17] = HK20*(HK10*P_0_17 + HK11*P_1_17 - HK12*P_3_17 + HK5*P_5_17 + HK7*P_6_17 - HK8*P_4_17 + HK9*P_2_17)
+    K[..., 18] = HK20*(HK10*P_0_18 + HK11*P_1_18 - HK12*P_3_18 + HK5*P_5_18 + HK7*P_6_18 - HK8*P_4_18 + HK9*P_2_18)
+    K[..., 19] = HK20*(HK10*P_0_19 + HK11*P_1_19 - HK12*P_3_19 + HK5*P_5_19 + HK7*P_6_19 - HK8*P_4_19 + HK9*P_2_19)
+    K[..., 20] = HK20*(HK10*P_0_20 + HK11*P_1_20 - HK12*P_3_20 + HK5*P_5_20 + HK7*P_6_20 - HK8*P_4_20 + HK9*P_2_20)
+    K[..., 21] = HK20*(HK10*P_0_21 + HK11*P_1_21 - HK12*P_3_21 + HK5*P_5_21 + HK7*P_6_21 - HK8*P_4_21 + HK9*P_2_21)
+    K[..., 22] = HK20*(HK10*P_0_22 + HK11*P_1_22 - HK12*P_3_22 + HK5*P_5_22 + HK7*P_6_22 - HK8*P_4_22 + HK9*P_2_22)
+    K[..., 23] = HK20*(HK10*P_0_23 + HK11*P_1_23 - HK12*P_3_23 + HK5*P_5_23 + HK7*P_6_23 - HK8*P_4_23 + HK9*P_2_23)
+    return H, K
+
+# vel_bf_y observation Jacobian and Kalman gain, loop over the filters
+def fuse_vel_bf_y_kernel(states, P, R_VEL):
+    n_filters = P.shape[0]
+    R_VEL = numpy.broadcast_to(numpy.asarray(R_VEL, dtype=numpy.float64), (n_filters,))
+    return _fuse_vel_bf_y_kernel(states, P, R_VEL)
+
+@jit
+def _fuse_vel_bf_y_kernel(states, P, R_VEL):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        q0 = states[index, 0]
+        q1 = states[index, 1]
+        q2 = states[index, 2]
+        q3 = states[index, 3]
+        vn = states[index, 4]
+        ve = states[index, 5]
+        vd = states[index, 6]
+        P_0_0 = P[index, 0, 0]
+        P_0_1 = P[index, 0, 1]
+        P_0_2 = P[index, 0, 2]
+        P_0_3 = P[index, 0, 3]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_7 = P[index, 0, 7]
+        P_0_8 = P[index, 0, 8]
+        P_0_9 = P[index, 0, 9]
+        P_0_10 = P[index, 0, 10]
+        P_0_11 = P[index, 0, 11]
+        P_0_12 = P[index, 0, 12]
+        P_0_13 = P[index, 0, 13]
+        P_0_14 = P[index, 0, 14]
+        P_0_15 = P[index, 0, 15]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_0_18 = P[index, 0, 18]
+        P_0_19 = P[index, 0, 19]
+        P_0_20 = P[index, 0, 20]
+        P_0_21 = P[index, 0, 21]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_1 = P[index, 1, 1]
+        P_1_2 = P[index, 1, 2]
+        P_1_3 = P[index, 1, 3]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_7 = P[index, 1, 7]
+        P_1_8 = P[index, 1, 8]
+        P_1_9 = P[index, 1, 9]
+        P_1_10 = P[index, 1, 10]
+        P_1_11 = P[index, 1, 11]
+        P_1_12 = P[index, 1, 12]
+        P_1_13 = P[index, 1, 13]
+        P_1_14 = P[index, 1, 14]
+        P_1_15 = P[index, 1, 15]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_1_18 = P[index, 1, 18]
+        P_1_19 = P[index, 1, 19]
+        P_1_20 = P[index, 1, 20]
+        P_1_21 = P[index, 1, 21]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_2 = P[index, 2, 2]
+        P_2_3 = P[index, 2, 3]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_7 = P[index, 2, 7]
+        P_2_8 = P[index, 2, 8]
+        P_2_9 = P[index, 2, 9]
+        P_2_10 = P[index, 2, 10]
+        P_2_11 = P[index, 2, 11]
+        P_2_12 = P[index, 2, 12]
+        P_2_13 = P[index, 2, 13]
+        P_2_14 = P[index, 2, 14]
+        P_2_15 = P[index, 2, 15]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_2_18 = P[index, 2, 18]
+        P_2_19 = P[index, 2, 19]
+        P_2_20 = P[index, 2, 20]
+        P_2_21 = P[index, 2, 21]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_3 = P[index, 3, 3]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_7 = P[index, 3, 7]
+        P_3_8 = P[index, 3, 8]
+        P_3_9 = P[index, 3, 9]
+        P_3_10 = P[index, 3, 10]
+        P_3_11 = P[index, 3, 11]
+        P_3_12 = P[index, 3, 12]
+        P_3_13 = P[index, 3, 13]
+        P_3_14 = P[index, 3, 14]
+        P_3_15 = P[index, 3, 15]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_3_18 = P[index, 3, 18]
+        P_3_19 = P[index, 3, 19]
+        P_3_20 = P[index, 3, 20]
+        P_3_21 = P[index, 3, 21]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        P_4_4 = P[index, 4, 4]
+        P_4_5 = P[index, 4, 5]
+        P_4_6 = P[index, 4, 6]
+        P_4_7 = P[index, 4, 7]
+        P_4_8 = P[index, 4, 8]
+        P_4_9 = P[index, 4, 9]
+        P_4_10 = P[index, 4, 10]
+        P_4_11 = P[index, 4, 11]
+        P_4_12 = P[index, 4, 12]
+        P_4_13 = P[index, 4, 13]
+        P_4_14 = P[index, 4, 14]
+        P_4_15 = P[index, 4, 15]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_4_18 = P[index, 4, 18]
+        P_4_19 = P[index, 4, 19]
+        P_4_20 = P[index, 4, 20]
+        P_4_21 = P[index, 4, 21]
+        P_4_22 = P[index, 4, 22]
+        P_4_23 = P[index, 4, 23]
+        P_5_5 = P[index, 5, 5]
+        P_5_6 = P[index, 5, 6]
+        P_5_7 = P[index, 5, 7]
+        P_5_8 = P[index, 5, 8]
+        P_5_9 = P[index, 5, 9]
+        P_5_10 = P[index, 5, 10]
+        P_5_11 = P[index, 5, 11]
+        P_5_12 = P[index, 5, 12]
+        P_5_13 = P[index, 5, 13]
+        P_5_14 = P[index, 5, 14]
+        P_5_15 = P[index, 5, 15]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_5_18 = P[index, 5, 18]
+        P_5_19 = P[index, 5, 19]
+        P_5_20 = P[index, 5, 20]
+        P_5_21 = P[index, 5, 21]
+        P_5_22 = P[index, 5, 22]
+        P_5_23 = P[index, 5, 23]
+        P_6_6 = P[index, 6, 6]
+        P_6_7 = P[index, 6, 7]
+        P_6_8 = P[index, 6, 8]
+        P_6_9 = P[index, 6, 9]
+        P_6_10 = P[index, 6, 10]
+        P_6_11 = P[index, 6, 11]
+        P_6_12 = P[index, 6, 12]
+        P_6_13 = P[index, 6, 13]
+        P_6_14 = P[index, 6, 14]
+        P_6_15 = P[index, 6, 15]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_6_18 = P[index, 6, 18]
+        P_6_19 = P[index, 6, 19]
+        P_6_20 = P[index, 6, 20]
+        P_6_21 = P[index, 6, 21]
+        P_6_22 = P[index, 6, 22]
+        P_6_23 = P[index, 6, 23]
+        HK0 = q0*ve + q1*vd - q3*vn
+        HK1 = q0*vd - q1*ve + q2*vn
+        HK2 = q1*vn + q2*ve + q3*vd
+        HK3 = q0*vn - q2*vd + q3*ve
+        HK4 = q0*q3 - q1*q2
+        HK5 = q0**2 - q1**2 + q2**2 - q3**2
+        HK6 = q0*q1 + q2*q3
+        HK7 = 2*HK6
+        HK8 = 2*HK4
+        HK9 = 2*HK2
+        HK10 = 2*HK0
+        HK11 = 2*HK1
+        HK12 = 2*HK3
+        HK13 = HK10*P_0_0 + HK11*P_0_1 - HK12*P_0_3 + HK5*P_0_5 + HK7*P_0_6 - HK8*P_0_4 + HK9*P_0_2
+        HK14 = HK10*P_0_6 + HK11*P_1_6 - HK12*P_3_6 + HK5*P_5_6 + HK7*P_6_6 - HK8*P_4_6 + HK9*P_2_6
+        HK15 = HK10*P_0_4 + HK11*P_1_4 - HK12*P_3_4 + HK5*P_4_5 + HK7*P_4_6 - HK8*P_4_4 + HK9*P_2_4
+        HK16 = HK10*P_0_2 + HK11*P_1_2 - HK12*P_2_3 + HK5*P_2_5 + HK7*P_2_6 - HK8*P_2_4 + HK9*P_2_2
+        HK17 = HK10*P_0_1 + HK11*P_1_1 - HK12*P_1_3 + HK5*P_1_5 + HK7*P_1_6 - HK8*P_1_4 + HK9*P_1_2
+        HK18 = HK10*P_0_3 + HK11*P_1_3 - HK12*P_3_3 + HK5*P_3_5 + HK7*P_3_6 - HK8*P_3_4 + HK9*P_2_3
+        HK19 = HK10*P_0_5 + HK11*P_1_5 - HK12*P_3_5 + HK5*P_5_5 + HK7*P_5_6 - HK8*P_4_5 + HK9*P_2_5
+        HK20 = 1/(HK10*HK13 + HK11*HK17 - HK12*HK18 + HK14*HK7 - HK15*HK8 + HK16*HK9 + HK19*HK5 + R_VEL[index])
+        H[index, 0] = 2*HK0
+        H[index, 1] = 2*HK1
+        H[index, 2] = 2*HK2
+        H[index, 3] = -2*HK3
+        H[index, 4] = -2*HK4
+        H[index, 5] = HK5
+        H[index, 6] = 2*HK6
+        K[index, 0] = HK13*HK20
+        K[index, 1] = HK17*HK20
+        K[index, 2] = HK16*HK20
+        K[index, 3] = HK18*HK20
+        K[index, 4] = HK15*HK20
+        K[index, 5] = HK19*HK20
+        K[index, 6] = HK14*HK20
+        K[index, 7] = HK20*(HK10*P_0_7 + HK11*P_1_7 - HK12*P_3_7 + HK5*P_5_7 + HK7*P_6_7 - HK8*P_4_7 + HK9*P_2_7)
+        K[index, 8] = HK20*(HK10*P_0_8 + HK11*P_1_8 - HK12*P_3_8 + HK5*P_5_8 + HK7*P_6_8 - HK8*P_4_8 + HK9*P_2_8)
+        K[index, 9] = HK20*(HK10*P_0_9 + HK11*P_1_9 - HK12*P_3_9 + HK5*P_5_9 + HK7*P_6_9 - HK8*P_4_9 + HK9*P_2_9)
+        K[index, 10] = HK20*(HK10*P_0_10 + HK11*P_1_10 - HK12*P_3_10 + HK5*P_5_10 + HK7*P_6_10 - HK8*P_4_10 + HK9*P_2_10)
+        K[index, 11] = HK20*(HK10*P_0_11 + HK11*P_1_11 - HK12*P_3_11 + HK5*P_5_11 + HK7*P_6_11 - HK8*P_4_11 + HK9*P_2_11)
+        K[index, 12] = HK20*(HK10*P_0_12 + HK11*P_1_12 - HK12*P_3_12 + HK5*P_5_12 + HK7*P_6_12 - HK8*P_4_12 + HK9*P_2_12)
+        K[index, 13] = HK20*(HK10*P_0_13 + HK11*P_1_13 - HK12*P_3_13 + HK5*P_5_13 + HK7*P_6_13 - HK8*P_4_13 + HK9*P_2_13)
+        K[index, 14] = HK20*(HK10*P_0_14 + HK11*P_1_14 - HK12*P_3_14 + HK5*P_5_14 + HK7*P_6_14 - HK8*P_4_14 + HK9*P_2_14)
+        K[index, 15] = HK20*(HK10*P_0_15 + HK11*P_1_15 - HK12*P_3_15 + HK5*P_5_15 + HK7*P_6_15 - HK8*P_4_15 + HK9*P_2_15)
+        K[index, 16] = HK20*(HK10*P_0_16 + HK11*P_1_16 - HK12*P_3_16 + HK5*P_5_16 + HK7*P_6_16 - HK8*P_4_16 + HK9*P_2_16)
+        K[index, 17] = HK20*(HK10*P_0_17 + HK11*P_1_17 - HK12*P_3_17 + HK5*P_5_17 + HK7*P_6_17 - HK8*P_4_17 + HK9*P_2_17)
+        K[index, 18] = HK20*(HK10*P_0_18 + HK11*P_1_18 - HK12*P_3_18 + HK5*P_5_18 + HK7*P_6_18 - HK8*P_4_18 + HK9*P_2_18)
+        K[index, 19] = HK20*(HK10*P_0_19 + HK11*P_1_19 - HK12*P_3_19 + HK5*P_5_19 + HK7*P_6_19 - HK8*P_4_19 + HK9*P_2_19)
+        K[index, 20] = HK20*(HK10*P_0_20 + HK11*P_1_20 - HK12*P_3_20 + HK5*P_5_20 + HK7*P_6_20 - HK8*P_4_20 + HK9*P_2_20)
+        K[index, 21] = HK20*(HK10*P_0_21 + HK11*P_1_21 - HK12*P_3_21 + HK5*P_5_21 + HK7*P_6_21 - HK8*P_4_21 + HK9*P_2_21)
+        K[index, 22] = HK20*(HK10*P_0_22 + HK11*P_1_22 - HK12*P_3_22 + HK5*P_5_22 + HK7*P_6_22 - HK8*P_4_22 + HK9*P_2_22)
+        K[index, 23] = HK20*(HK10*P_0_23 + HK11*P_1_23 - HK12*P_3_23 + HK5*P_5_23 + HK7*P_6_23 - HK8*P_4_23 + HK9*P_2_23)
+    return H, K
+
+# vel_bf_z observation Jacobian and Kalman gain
+def fuse_vel_bf_z(states, P, R_VEL):
+    q0 = states[..., 0]
+    q1 = states[..., 1]
+    q2 = states[..., 2]
+    q3 = states[..., 3]
+    vn = states[..., 4]
+    ve = states[..., 5]
+    vd = states[..., 6]
+    P_0_0 = P[..., 0, 0]
+    P_0_1 = P[..., 0, 1]
+    P_0_2 = P[..., 0, 2]
+    P_0_3 = P[..., 0, 3]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_7 = P[..., 0, 7]
+    P_0_8 = P[..., 0, 8]
+    P_0_9 = P[..., 0, 9]
+    P_0_10 = P[..., 0, 10]
+    P_0_11 = P[..., 0, 11]
+    P_0_12 = P[..., 0, 12]
+    P_0_13 = P[..., 0, 13]
+    P_0_14 = P[..., 0, 14]
+    P_0_15 = P[..., 0, 15]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_0_18 = P[..., 0, 18]
+    P_0_19 = P[..., 0, 19]
+    P_0_20 = P[..., 0, 20]
+    P_0_21 = P[..., 0, 21]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_1 = P[..., 1, 1]
+    P_1_2 = P[..., 1, 2]
+    P_1_3 = P[..., 1, 3]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_7 = P[..., 1, 7]
+    P_1_8 = P[..., 1, 8]
+    P_1_9 = P[..., 1, 9]
+    P_1_10 = P[..., 1, 10]
+    P_1_11 = P[..., 1, 11]
+    P_1_12 = P[..., 1, 12]
+    P_1_13 = P[..., 1, 13]
+    P_1_14 = P[..., 1, 14]
+    P_1_15 = P[..., 1, 15]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_1_18 = P[..., 1, 18]
+    P_1_19 = P[..., 1, 19]
+    P_1_20 = P[..., 1, 20]
+    P_1_21 = P[..., 1, 21]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_2 = P[..., 2, 2]
+    P_2_3 = P[..., 2, 3]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_7 = P[..., 2, 7]
+    P_2_8 = P[..., 2, 8]
+    P_2_9 = P[..., 2, 9]
+    P_2_10 = P[..., 2, 10]
+    P_2_11 = P[..., 2, 11]
+    P_2_12 = P[..., 2, 12]
+    P_2_13 = P[..., 2, 13]
+    P_2_14 = P[..., 2, 14]
+    P_2_15 = P[..., 2, 15]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_2_18 = P[..., 2, 18]
+    P_2_19 = P[..., 2, 19]
+    P_2_20 = P[..., 2, 20]
+    P_2_21 = P[..., 2, 21]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_3 = P[..., 3, 3]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_7 = P[..., 3, 7]
+    P_3_8 = P[..., 3, 8]
+    P_3_9 = P[..., 3, 9]
+    P_3_10 = P[..., 3, 10]
+    P_3_11 = P[..., 3, 11]
+    P_3_12 = P[..., 3, 12]
+    P_3_13 = P[..., 3, 13]
+    P_3_14 = P[..., 3, 14]
+    P_3_15 = P[..., 3, 15]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_3_18 = P[..., 3, 18]
+    P_3_19 = P[..., 3, 19]
+    P_3_20 = P[..., 3, 20]
+    P_3_21 = P[..., 3, 21]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    P_4_4 = P[..., 4, 4]
+    P_4_5 = P[..., 4, 5]
+    P_4_6 = P[..., 4, 6]
+    P_4_7 = P[..., 4, 7]
+    P_4_8 = P[..., 4, 8]
+    P_4_9 = P[..., 4, 9]
+    P_4_10 = P[..., 4, 10]
+    P_4_11 = P[..., 4, 11]
+    P_4_12 = P[..., 4, 12]
+    P_4_13 = P[..., 4, 13]
+    P_4_14 = P[..., 4, 14]
+    P_4_15 = P[..., 4, 15]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_4_18 = P[..., 4, 18]
+    P_4_19 = P[..., 4, 19]
+    P_4_20 = P[..., 4, 20]
+    P_4_21 = P[..., 4, 21]
+    P_4_22 = P[..., 4, 22]
+    P_4_23 = P[..., 4, 23]
+    P_5_5 = P[..., 5, 5]
+    P_5_6 = P[..., 5, 6]
+    P_5_7 = P[..., 5, 7]
+    P_5_8 = P[..., 5, 8]
+    P_5_9 = P[..., 5, 9]
+    P_5_10 = P[..., 5, 10]
+    P_5_11 = P[..., 5, 11]
+    P_5_12 = P[..., 5, 12]
+    P_5_13 = P[..., 5, 13]
+    P_5_14 = P[..., 5, 14]
+    P_5_15 = P[..., 5, 15]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_5_18 = P[..., 5, 18]
+    P_5_19 = P[..., 5, 19]
+    P_5_20 = P[..., 5, 20]
+    P_5_21 = P[..., 5, 21]
+    P_5_22 = P[..., 5, 22]
+    P_5_23 = P[..., 5, 23]
+    P_6_6 = P[..., 6, 6]
+    P_6_7 = P[..., 6, 7]
+    P_6_8 = P[..., 6, 8]
+    P_6_9 = P[..., 6, 9]
+    P_6_10 = P[..., 6, 10]
+    P_6_11 = P[..., 6, 11]
+    P_6_12 = P[..., 6, 12]
+    P_6_13 = P[..., 6, 13]
+    P_6_14 = P[..., 6, 14]
+    P_6_15 = P[..., 6, 15]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_6_18 = P[..., 6, 18]
+    P_6_19 = P[..., 6, 19]
+    P_6_20 = P[..., 6, 20]
+    P_6_21 = P[..., 6, 21]
+    P_6_22 = P[..., 6, 22]
+    P_6_23 = P[..., 6, 23]
+    HK0 = q0*vd - q1*ve + q2*vn
+    HK1 = q0*ve + q1*vd - q3*vn
+    HK2 = q0*vn - q2*vd + q3*ve
+    HK3 = q1*vn + q2*ve + q3*vd
+    HK4 = q0*q2 + q1*q3
+    HK5 = q0*q1 - q2*q3
+    HK6 = q0**2 - q1**2 - q2**2 + q3**2
+    HK7 = 2*HK4
+    HK8 = 2*HK5
+    HK9 = 2*HK3
+    HK10 = 2*HK0
+    HK11 = 2*HK1
+    HK12 = 2*HK2
+    HK13 = HK10*P_0_0 - HK11*P_0_1 + HK12*P_0_2 + HK6*P_0_6 + HK7*P_0_4 - HK8*P_0_5 + HK9*P_0_3
+    HK14 = HK10*P_0_4 - HK11*P_1_4 + HK12*P_2_4 + HK6*P_4_6 + HK7*P_4_4 - HK8*P_4_5 + HK9*P_3_4
+    HK15 = HK10*P_0_5 - HK11*P_1_5 + HK12*P_2_5 + HK6*P_5_6 + HK7*P_4_5 - HK8*P_5_5 + HK9*P_3_5
+    HK16 = HK10*P_0_3 - HK11*P_1_3 + HK12*P_2_3 + HK6*P_3_6 + HK7*P_3_4 - HK8*P_3_5 + HK9*P_3_3
+    HK17 = HK10*P_0_1 - HK11*P_1_1 + HK12*P_1_2 + HK6*P_1_6 + HK7*P_1_4 - HK8*P_1_5 + HK9*P_1_3
+    HK18 = HK10*P_0_2 - HK11*P_1_2 + HK12*P_2_2 + HK6*P_2_6 + HK7*P_2_4 - HK8*P_2_5 + HK9*P_2_3
+    HK19 = HK10*P_0_6 - HK11*P_1_6 + HK12*P_2_6 + HK6*P_6_6 + HK7*P_4_6 - HK8*P_5_6 + HK9*P_3_6
+    HK20 = 1/(HK10*HK13 - HK11*HK17 + HK12*HK18 + HK14*HK7 - HK15*HK8 + HK16*HK9 + HK19*HK6 + R_VEL)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 0] = 2*HK0
+    H[..., 1] = -2*HK1
+    H[..., 2] = 2*HK2
+    H[..., 3] = 2*HK3
+    H[..., 4] = 2*HK4
+    H[..., 5] = -2*HK5
+    H[..., 6] = HK6
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = HK13*HK20
+    K[..., 1] = HK17*HK20
+    K[..., 2] = HK18*HK20
+    K[..., 3] = HK16*HK20
+    K[..., 4] = HK14*HK20
+    K[..., 5] = HK15*HK20
+    K[..., 6] = HK19*HK20
+    K[..., 7] = HK20*(HK10*P_0_7 - HK11*P_1_7 + HK12*P_2_7 + HK6*P_6_7 + HK7*P_4_7 - HK8*P_5_7 + HK9*P_3_7)
+    K[..., 8] = HK20*(HK10*P_0_8 - HK11*P_1_8 + HK12*P_2_8 + HK6*P_6_8 + HK7*P_4_8 - HK8*P_5_8 + HK9*P_3_8)
+    K[..., 9] = HK20*(HK10*P_0_9 - HK11*P_1_9 + HK12*P_2_9 + HK6*P_6_9 + HK7*P_4_9 - HK8*P_5_9 + HK9*P_3_9)
+    K[..., 10] = HK20*(HK10*P_0_10 - HK11*P_1_10 + HK12*P_2_10 + HK6*P_6_10 + HK7*P_4_10 - HK8*P_5_10 + HK9*P_3_10)
+    K[..., 11] = HK20*(HK10*P_0_11 - HK11*P_1_11 + HK12*P_2_11 + HK6*P_6_11 + HK7*P_4_11 - HK8*P_5_11 + HK9*P_3_11)
+    K[..., 12] = HK20*(HK10*P_0_12 - HK11*P_1_12 + HK12*P_2_12 + HK6*P_6_12 + HK7*P_4_12 - HK8*P_5_12 + HK9*P_3_12)
+    K[..., 13] = HK20*(HK10*P_0_13 - HK11*P_1_13 + HK12*P_2_13 + HK6*P_6_13 + HK7*P_4_13 - HK8*P_5_13 + HK9*P_3_13)
+    K[..., 14] = HK20*(HK10*P_0_14 - HK11*P_1_14 + HK12*P_2_14 + HK6*P_6_14 + HK7*P_4_14 - HK8*P_5_14 + HK9*P_3_14)
+    K[..., 15] = HK20*(HK10*P_0_15 - HK11*P_1_15 + HK12*P_2_15 + HK6*P_6_15 + HK7*P_4_15 - HK8*P_5_15 + HK9*P_3_15)
+    K[..., 16] = HK20*(HK10*P_0_16 - HK11*P_1_16 + HK12*P_2_16 + HK6*P_6_16 + HK7*P_4_16 - HK8*P_5_16 + HK9*P_3_16)
+    K[..., 17] = HK20*(HK10*P_0_17 - HK11*P_1_17 + HK12*P_2_17 + HK6*P_6_17 + HK7*P_4_17 - HK8*P_5_17 + HK9*P_3_17)
+    K[..., 18] = HK20*(HK10*P_0_18 - HK11*P_1_18 + HK12*P_2_18 + HK6*P_6_18 + HK7*P_4_18 - HK8*P_5_18 + HK9*P_3_18)
+    K[..., 19] = HK20*(HK10*P_0_19 - HK11*P_1_19 + HK12*P_2_19 + HK6*P_6_19 + HK7*P_4_19 - HK8*P_5_19 + HK9*P_3_19)
+    K[..., 20] = HK20*(HK10*P_0_20 - HK11*P_1_20 + HK12*P_2_20 + HK6*P_6_20 + HK7*P_4_20 - HK8*P_5_20 + HK9*P_3_20)
+    K[..., 21] = HK20*(HK10*P_0_21 - HK11*P_1_21 + HK12*P_2_21 + HK6*P_6_21 + HK7*P_4_21 - HK8*P_5_21 + HK9*P_3_21)
+    K[..., 22] = HK20*(HK10*P_0_22 - HK11*P_1_22 + HK12*P_2_22 + HK6*P_6_22 + HK7*P_4_22 - HK8*P_5_22 + HK9*P_3_22)
+    K[..., 23] = HK20*(HK10*P_0_23 - HK11*P_1_23 + HK12*P_2_23 + HK6*P_6_23 + HK7*P_4_23 - HK8*P_5_23 + HK9*P_3_23)
+    return H, K
+
+# vel_bf_z observation Jacobian and Kalman gain, loop over the filters
+def fuse_vel_bf_z_kernel(states, P, R_VEL):
+    n_filters = P.shape[0]
+    R_VEL = numpy.broadcast_to(numpy.asarray(R_VEL, dtype=numpy.float64), (n_filters,))
+    return _fuse_vel_bf_z_kernel(states, P, R_VEL)
+
+@jit
+def _fuse_vel_bf_z_kernel(states, P, R_VEL):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        q0 = states[index, 0]
+        q1 = states[index, 1]
+        q2 = states[index, 2]
+        q3 = states[index, 3]
+        vn = states[index, 4]
+        ve = states[index, 5]
+        vd = states[index, 6]
+        P_0_0 = P[index, 0, 0]
+        P_0_1 = P[index, 0, 1]
+        P_0_2 = P[index, 0, 2]
+        P_0_3 = P[index, 0, 3]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_7 = P[index, 0, 7]
+        P_0_8 = P[index, 0, 8]
+        P_0_9 = P[index, 0, 9]
+        P_0_10 = P[index, 0, 10]
+        P_0_11 = P[index, 0, 11]
+        P_0_12 = P[index, 0, 12]
+        P_0_13 = P[index, 0, 13]
+        P_0_14 = P[index, 0, 14]
+        P_0_15 = P[index, 0, 15]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_0_18 = P[index, 0, 18]
+        P_0_19 = P[index, 0, 19]
+        P_0_20 = P[index, 0, 20]
+        P_0_21 = P[index, 0, 21]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_1 = P[index, 1, 1]
+        P_1_2 = P[index, 1, 2]
+        P_1_3 = P[index, 1, 3]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_7 = P[index, 1, 7]
+        P_1_8 = P[index, 1, 8]
+        P_1_9 = P[index, 1, 9]
+        P_1_10 = P[index, 1, 10]
+        P_1_11 = P[index, 1, 11]
+        P_1_12 = P[index, 1, 12]
+        P_1_13 = P[index, 1, 13]
+        P_1_14 = P[index, 1, 14]
+        P_1_15 = P[index, 1, 15]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_1_18 = P[index, 1, 18]
+        P_1_19 = P[index, 1, 19]
+        P_1_20 = P[index, 1, 20]
+        P_1_21 = P[index, 1, 21]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_2 = P[index, 2, 2]
+        P_2_3 = P[index, 2, 3]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_7 = P[index, 2, 7]
+        P_2_8 = P[index, 2, 8]
+        P_2_9 = P[index, 2, 9]
+        P_2_10 = P[index, 2, 10]
+        P_2_11 = P[index, 2, 11]
+        P_2_12 = P[index, 2, 12]
+        P_2_13 = P[index, 2, 13]
+        P_2_14 = P[index, 2, 14]
+        P_2_15 = P[index, 2, 15]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_2_18 = P[index, 2, 18]
+        P_2_19 = P[index, 2, 19]
+        P_2_20 = P[index, 2, 20]
+        P_2_21 = P[index, 2, 21]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_3 = P[index, 3, 3]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_7 = P[index, 3, 7]
+        P_3_8 = P[index, 3, 8]
+        P_3_9 = P[index, 3, 9]
+        P_3_10 = P[index, 3, 10]
+        P_3_11 = P[index, 3, 11]
+        P_3_12 = P[index, 3, 12]
+        P_3_13 = P[index, 3, 13]
+        P_3_14 = P[index, 3, 14]
+        P_3_15 = P[index, 3, 15]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_3_18 = P[index, 3, 18]
+        P_3_19 = P[index, 3, 19]
+        P_3_20 = P[index, 3, 20]
+        P_3_21 = P[index, 3, 21]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        P_4_4 = P[index, 4, 4]
+        P_4_5 = P[index, 4, 5]
+        P_4_6 = P[index, 4, 6]
+        P_4_7 = P[index, 4, 7]
+        P_4_8 = P[index, 4, 8]
+        P_4_9 = P[index, 4, 9]
+        P_4_10 = P[index, 4, 10]
+        P_4_11 = P[index, 4, 11]
+        P_4_12 = P[index, 4, 12]
+        P_4_13 = P[index, 4, 13]
+        P_4_14 = P[index, 4, 14]
+        P_4_15 = P[index, 4, 15]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_4_18 = P[index, 4, 18]
+        P_4_19 = P[index, 4, 19]
+        P_4_20 = P[index, 4, 20]
+        P_4_21 = P[index, 4, 21]
+        P_4_22 = P[index, 4, 22]
+        P_4_23 = P[index, 4, 23]
+        P_5_5 = P[index, 5, 5]
+        P_5_6 = P[index, 5, 6]
+        P_5_7 = P[index, 5, 7]
+        P_5_8 = P[index, 5, 8]
+        P_5_9 = P[index, 5, 9]
+        P_5_10 = P[index, 5, 10]
+        P_5_11 = P[index, 5, 11]
+        P_5_12 = P[index, 5, 12]
+        P_5_13 = P[index, 5, 13]
+        P_5_14 = P[index, 5, 14]
+        P_5_15 = P[index, 5, 15]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_5_18 = P[index, 5, 18]
+        P_5_19 = P[index, 5, 19]
+        P_5_20 = P[index, 5, 20]
+        P_5_21 = P[index, 5, 21]
+        P_5_22 = P[index, 5, 22]
+        P_5_23 = P[index, 5, 23]
+        P_6_6 = P[index, 6, 6]
+        P_6_7 = P[index, 6, 7]
+        P_6_8 = P[index, 6, 8]
+        P_6_9 = P[index, 6, 9]
+        P_6_10 = P[index, 6, 10]
+        P_6_11 = P[index, 6, 11]
+        P_6_12 = P[index, 6, 12]
+        P_6_13 = P[index, 6, 13]
+        P_6_14 = P[index, 6, 14]
+        P_6_15 = P[index, 6, 15]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_6_18 = P[index, 6, 18]
+        P_6_19 = P[index, 6, 19]
+        P_6_20 = P[index, 6, 20]
+        P_6_21 = P[index, 6, 21]
+        P_6_22 = P[index, 6, 22]
+        P_6_23 = P[index, 6, 23]
+        HK0 = q0*vd - q1*ve + q2*vn
+        HK1 = q0*ve + q1*vd - q3*vn
+        HK2 = q0*vn - q2*vd + q3*ve
+        HK3 = q1*vn + q2*ve + q3*vd
+        HK4 = q0*q2 + q1*q3
+        HK5 = q0*q1 - q2*q3
+        HK6 = q0**2 - q1**2 - q2**2 + q3**2
+        HK7 = 2*HK4
+        HK8 = 2*HK5
+        HK9 = 2*HK3
+        HK10 = 2*HK0
+        HK11 = 2*HK1
+        HK12 = 2*HK2
+        HK13 = HK10*P_0_0 - HK11*P_0_1 + HK12*P_0_2 + HK6*P_0_6 + HK7*P_0_4 - HK8*P_0_5 + HK9*P_0_3
+        HK14 = HK10*P_0_4 - HK11*P_1_4 + HK12*P_2_4 + HK6*P_4_6 + HK7*P_4_4 - HK8*P_4_5 + HK9*P_3_4
+        HK15 = HK10*P_0_5 - HK11*P_1_5 + HK12*P_2_5 + HK6*P_5_6 + HK7*P_4_5 - HK8*P_5_5 + HK9*P_3_5
+        HK16 = HK10*P_0_3 - HK11*P_1_3 + HK12*P_2_3 + HK6*P_3_6 + HK7*P_3_4 - HK8*P_3_5 + HK9*P_3_3
+        HK17 = HK10*P_0_1 - HK11*P_1_1 + HK12*P_1_2 + HK6*P_1_6 + HK7*P_1_4 - HK8*P_1_5 + HK9*P_1_3
+        HK18 = HK10*P_0_2 - HK11*P_1_2 + HK12*P_2_2 + HK6*P_2_6 + HK7*P_2_4 - HK8*P_2_5 + HK9*P_2_3
+        HK19 = HK10*P_0_6 - HK11*P_1_6 + HK12*P_2_6 + HK6*P_6_6 + HK7*P_4_6 - HK8*P_5_6 + HK9*P_3_6
+        HK20 = 1/(HK10*HK13 - HK11*HK17 + HK12*HK18 + HK14*HK7 - HK15*HK8 + HK16*HK9 + HK19*HK6 + R_VEL[index])
+        H[index, 0] = 2*HK0
+        H[index, 1] = -2*HK1
+        H[index, 2] = 2*HK2
+        H[index, 3] = 2*HK3
+        H[index, 4] = 2*HK4
+        H[index, 5] = -2*HK5
+        H[index, 6] = HK6
+        K[index, 0] = HK13*HK20
+        K[index, 1] = HK17*HK20
+        K[index, 2] = HK18*HK20
+        K[index, 3] = HK16*HK20
+        K[index, 4] = HK14*HK20
+        K[index, 5] = HK15*HK20
+        K[index, 6] = HK19*HK20
+        K[index, 7] = HK20*(HK10*P_0_7 - HK11*P_1_7 + HK12*P_2_7 + HK6*P_6_7 + HK7*P_4_7 - HK8*P_5_7 + HK9*P_3_7)
+        K[index, 8] = HK20*(HK10*P_0_8 - HK11*P_1_8 + HK12*P_2_8 + HK6*P_6_8 + HK7*P_4_8 - HK8*P_5_8 + HK9*P_3_8)
+        K[index, 9] = HK20*(HK10*P_0_9 - HK11*P_1_9 + HK12*P_2_9 + HK6*P_6_9 + HK7*P_4_9 - HK8*P_5_9 + HK9*P_3_9)
+        K[index, 10] = HK20*(HK10*P_0_10 - HK11*P_1_10 + HK12*P_2_10 + HK6*P_6_10 + HK7*P_4_10 - HK8*P_5_10 + HK9*P_3_10)
+        K[index, 11] = HK20*(HK10*P_0_11 - HK11*P_1_11 + HK12*P_2_11 + HK6*P_6_11 + HK7*P_4_11 - HK8*P_5_11 + HK9*P_3_11)
+        K[index, 12] = HK20*(HK10*P_0_12 - HK11*P_1_12 + HK12*P_2_12 + HK6*P_6_12 + HK7*P_4_12 - HK8*P_5_12 + HK9*P_3_12)
+        K[index, 13] = HK20*(HK10*P_0_13 - HK11*P_1_13 + HK12*P_2_13 + HK6*P_6_13 + HK7*P_4_13 - HK8*P_5_13 + HK9*P_3_13)
+        K[index, 14] = HK20*(HK10*P_0_14 - HK11*P_1_14 + HK12*P_2_14 + HK6*P_6_14 + HK7*P_4_14 - HK8*P_5_14 + HK9*P_3_14)
+        K[index, 15] = HK20*(HK10*P_0_15 - HK11*P_1_15 + HK12*P_2_15 + HK6*P_6_15 + HK7*P_4_15 - HK8*P_5_15 + HK9*P_3_15)
+        K[index, 16] = HK20*(HK10*P_0_16 - HK11*P_1_16 + HK12*P_2_16 + HK6*P_6_16 + HK7*P_4_16 - HK8*P_5_16 + HK9*P_3_16)
+        K[index, 17] = HK20*(HK10*P_0_17 - HK11*P_1_17 + HK12*P_2_17 + HK6*P_6_17 + HK7*P_4_17 - HK8*P_5_17 + HK9*P_3_17)
+        K[index, 18] = HK20*(HK10*P_0_18 - HK11*P_1_18 + HK12*P_2_18 + HK6*P_6_18 + HK7*P_4_18 - HK8*P_5_18 + HK9*P_3_18)
+        K[index, 19] = HK20*(HK10*P_0_19 - HK11*P_1_19 + HK12*P_2_19 + HK6*P_6_19 + HK7*P_4_19 - HK8*P_5_19 + HK9*P_3_19)
+        K[index, 20] = HK20*(HK10*P_0_20 - HK11*P_1_20 + HK12*P_2_20 + HK6*P_6_20 + HK7*P_4_20 - HK8*P_5_20 + HK9*P_3_20)
+        K[index, 21] = HK20*(HK10*P_0_21 - HK11*P_1_21 + HK12*P_2_21 + HK6*P_6_21 + HK7*P_4_21 - HK8*P_5_21 + HK9*P_3_21)
+        K[index, 22] = HK20*(HK10*P_0_22 - HK11*P_1_22 + HK12*P_2_22 + HK6*P_6_22 + HK7*P_4_22 - HK8*P_5_22 + HK9*P_3_22)
+        K[index, 23] = HK20*(HK10*P_0_23 - HK11*P_1_23 + HK12*P_2_23 + HK6*P_6_23 + HK7*P_4_23 - HK8*P_5_23 + HK9*P_3_23)
+    return H, K
+
+# acc_bf_x observation Jacobian and Kalman gain
+def fuse_acc_bf_x(states, P, Kaccx, R_ACC):
+    q0 = states[..., 0]
+    q1 = states[..., 1]
+    q2 = states[..., 2]
+    q3 = states[..., 3]
+    vn = states[..., 4]
+    ve = states[..., 5]
+    vd = states[..., 6]
+    vwn = states[..., 22]
+    vwe = states[..., 23]
+    P_0_0 = P[..., 0, 0]
+    P_0_1 = P[..., 0, 1]
+    P_0_2 = P[..., 0, 2]
+    P_0_3 = P[..., 0, 3]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_7 = P[..., 0, 7]
+    P_0_8 = P[..., 0, 8]
+    P_0_9 = P[..., 0, 9]
+    P_0_10 = P[..., 0, 10]
+    P_0_11 = P[..., 0, 11]
+    P_0_12 = P[..., 0, 12]
+    P_0_13 = P[..., 0, 13]
+    P_0_14 = P[..., 0, 14]
+    P_0_15 = P[..., 0, 15]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_0_18 = P[..., 0, 18]
+    P_0_19 = P[..., 0, 19]
+    P_0_20 = P[..., 0, 20]
+    P_0_21 = P[..., 0, 21]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_1 = P[..., 1, 1]
+    P_1_2 = P[..., 1, 2]
+    P_1_3 = P[..., 1, 3]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_7 = P[..., 1, 7]
+    P_1_8 = P[..., 1, 8]
+    P_1_9 = P[..., 1, 9]
+    P_1_10 = P[..., 1, 10]
+    P_1_11 = P[..., 1, 11]
+    P_1_12 = P[..., 1, 12]
+    P_1_13 = P[..., 1, 13]
+    P_1_14 = P[..., 1, 14]
+    P_1_15 = P[..., 1, 15]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_1_18 = P[..., 1, 18]
+    P_1_19 = P[..., 1, 19]
+    P_1_20 = P[..., 1, 20]
+    P_1_21 = P[..., 1, 21]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_2 = P[..., 2, 2]
+    P_2_3 = P[..., 2, 3]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_7 = P[..., 2, 7]
+    P_2_8 = P[..., 2, 8]
+    P_2_9 = P[..., 2, 9]
+    P_2_10 = P[..., 2, 10]
+    P_2_11 = P[..., 2, 11]
+    P_2_12 = P[..., 2, 12]
+    P_2_13 = P[..., 2, 13]
+    P_2_14 = P[..., 2, 14]
+    P_2_15 = P[..., 2, 15]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_2_18 = P[..., 2, 18]
+    P_2_19 = P[..., 2, 19]
+    P_2_20 = P[..., 2, 20]
+    P_2_21 = P[..., 2, 21]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_3 = P[..., 3, 3]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_7 = P[..., 3, 7]
+    P_3_8 = P[..., 3, 8]
+    P_3_9 = P[..., 3, 9]
+    P_3_10 = P[..., 3, 10]
+    P_3_11 = P[..., 3, 11]
+    P_3_12 = P[..., 3, 12]
+    P_3_13 = P[..., 3, 13]
+    P_3_14 = P[..., 3, 14]
+    P_3_15 = P[..., 3, 15]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_3_18 = P[..., 3, 18]
+    P_3_19 = P[..., 3, 19]
+    P_3_20 = P[..., 3, 20]
+    P_3_21 = P[..., 3, 21]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    P_4_4 = P[..., 4, 4]
+    P_4_5 = P[..., 4, 5]
+    P_4_6 = P[..., 4, 6]
+    P_4_7 = P[..., 4, 7]
+    P_4_8 = P[..., 4, 8]
+    P_4_9 = P[..., 4, 9]
+    P_4_10 = P[..., 4, 10]
+    P_4_11 = P[..., 4, 11]
+    P_4_12 = P[..., 4, 12]
+    P_4_13 = P[..., 4, 13]
+    P_4_14 = P[..., 4, 14]
+    P_4_15 = P[..., 4, 15]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_4_18 = P[..., 4, 18]
+    P_4_19 = P[..., 4, 19]
+    P_4_20 = P[..., 4, 20]
+    P_4_21 = P[..., 4, 21]
+    P_4_22 = P[..., 4, 22]
+    P_4_23 = P[..., 4, 23]
+    P_5_5 = P[..., 5, 5]
+    P_5_6 = P[..., 5, 6]
+    P_5_7 = P[..., 5, 7]
+    P_5_8 = P[..., 5, 8]
+    P_5_9 = P[..., 5, 9]
+    P_5_10 = P[..., 5, 10]
+    P_5_11 = P[..., 5, 11]
+    P_5_12 = P[..., 5, 12]
+    P_5_13 = P[..., 5, 13]
+    P_5_14 = P[..., 5, 14]
+    P_5_15 = P[..., 5, 15]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_5_18 = P[..., 5, 18]
+    P_5_19 = P[..., 5, 19]
+    P_5_20 = P[..., 5, 20]
+    P_5_21 = P[..., 5, 21]
+    P_5_22 = P[..., 5, 22]
+    P_5_23 = P[..., 5, 23]
+    P_6_6 = P[..., 6, 6]
+    P_6_7 = P[..., 6, 7]
+    P_6_8 = P[..., 6, 8]
+    P_6_9 = P[..., 6, 9]
+    P_6_10 = P[..., 6, 10]
+    P_6_11 = P[..., 6, 11]
+    P_6_12 = P[..., 6, 12]
+    P_6_13 = P[..., 6, 13]
+    P_6_14 = P[..., 6, 14]
+    P_6_15 = P[..., 6, 15]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_6_18 = P[..., 6, 18]
+    P_6_19 = P[..., 6, 19]
+    P_6_20 = P[..., 6, 20]
+    P_6_21 = P[..., 6, 21]
+    P_6_22 = P[..., 6, 22]
+    P_6_23 = P[..., 6, 23]
+    P_7_22 = P[..., 7, 22]
+    P_7_23 = P[..., 7, 23]
+    P_8_22 = P[..., 8, 22]
+    P_8_23 = P[..., 8, 23]
+    P_9_22 = P[..., 9, 22]
+    P_9_23 = P[..., 9, 23]
+    P_10_22 = P[..., 10, 22]
+    P_10_23 = P[..., 10, 23]
+    P_11_22 = P[..., 11, 22]
+    P_11_23 = P[..., 11, 23]
+    P_12_22 = P[..., 12, 22]
+    P_12_23 = P[..., 12, 23]
+    P_13_22 = P[..., 13, 22]
+    P_13_23 = P[..., 13, 23]
+    P_14_22 = P[..., 14, 22]
+    P_14_23 = P[..., 14, 23]
+    P_15_22 = P[..., 15, 22]
+    P_15_23 = P[..., 15, 23]
+    P_16_22 = P[..., 16, 22]
+    P_16_23 = P[..., 16, 23]
+    P_17_22 = P[..., 17, 22]
+    P_17_23 = P[..., 17, 23]
+    P_18_22 = P[..., 18, 22]
+    P_18_23 = P[..., 18, 23]
+    P_19_22 = P[..., 19, 22]
+    P_19_23 = P[..., 19, 23]
+    P_20_22 = P[..., 20, 22]
+    P_20_23 = P[..., 20, 23]
+    P_21_22 = P[..., 21, 22]
+    P_21_23 = P[..., 21, 23]
+    P_22_22 = P[..., 22, 22]
+    P_22_23 = P[..., 22, 23]
+    P_23_23 = P[..., 23, 23]
+    HK0 = vn - vwn
+    HK1 = ve - vwe
+    HK2 = HK0*q0 + HK1*q3 - q2*vd
+    HK3 = 2*Kaccx
+    HK4 = HK0*q1 + HK1*q2 + q3*vd
+    HK5 = HK0*q2 - HK1*q1 + q0*vd
+    HK6 = -HK0*q3 + HK1*q0 + q1*vd
+    HK7 = q0**2 + q1**2 - q2**2 - q3**2
+    HK8 = HK7*Kaccx
+    HK9 = q0*q3 + q1*q2
+    HK10 = HK3*HK9
+    HK11 = q0*q2 - q1*q3
+    HK12 = 2*HK5
+    HK13 = 2*HK11
+    HK14 = 2*HK9
+    HK15 = 2*HK2
+    HK16 = 2*HK4
+    HK17 = 2*HK6
+    HK18 = -HK14*P_0_23 + HK14*P_0_5 + HK15*P_0_0 + HK16*P_0_1 + HK17*P_0_3 + HK7*P_0_4
+    HK19 = Kaccx**2
+    HK20 = -HK7
+    HK21 = -2*HK5
+    HK22 = -2*HK11
+    HK23 = HK14*P_5_23
+    HK24 = -HK14*P_23_23 + HK15*P_0_23 + HK16*P_1_23 + HK17*P_3_23 + HK23 + HK7*P_4_23
+    HK25 = HK14*P_5_5 + HK15*P_0_5 + HK16*P_1_5 + HK17*P_3_5 - HK23 + HK7*P_4_5
+    HK26 = HK14*P_5_6 - HK14*P_6_23 + HK15*P_0_6 + HK16*P_1_6 + HK17*P_3_6 + HK7*P_4_6
+    HK27 = -HK14*P_4_23 + HK14*P_4_5 + HK15*P_0_4 + HK16*P_1_4 + HK17*P_3_4 + HK7*P_4_4
+    HK28 = HK7*P_4_22
+    HK29 = -HK14*P_22_23 + HK14*P_5_22 + HK15*P_0_22 + HK16*P_1_22 + HK17*P_3_22 + HK28
+    HK30 = -HK14*P_1_23 + HK14*P_1_5 + HK15*P_0_1 + HK16*P_1_1 + HK17*P_1_3 + HK7*P_1_4
+    HK31 = -HK14*P_2_23 + HK14*P_2_5 + HK15*P_0_2 + HK16*P_1_2 + HK17*P_2_3 + HK7*P_2_4
+    HK32 = -HK14*P_3_23 + HK14*P_3_5 + HK15*P_0_3 + HK16*P_1_3 + HK17*P_3_3 + HK7*P_3_4
+    HK33 = Kaccx/(2*HK11*HK19*(HK20*P_6_22 + HK21*P_2_6 + HK22*P_6_6 + HK26) - HK14*HK19*(HK20*P_5_22 + HK21*P_2_5 + HK22*P_5_6 + HK25) - HK15*HK19*(HK18 + HK20*P_0_22 + HK21*P_0_2 + HK22*P_0_6) - HK16*HK19*(HK20*P_1_22 + HK21*P_1_2 + HK22*P_1_6 + HK30) - HK17*HK19*(HK20*P_3_22 + HK21*P_2_3 + HK22*P_3_6 + HK32) + 2*HK19*HK5*(HK20*P_2_22 + HK21*P_2_2 + HK22*P_2_6 + HK31) + HK19*HK7*(HK20*P_22_22 + HK21*P_2_22 + HK22*P_6_22 + HK29) - HK19*HK7*(HK20*P_4_22 + HK21*P_2_4 + HK22*P_4_6 + HK27) + 2*HK19*HK9*(HK20*P_22_23 + HK21*P_2_23 + HK22*P_6_23 + HK24) - R_ACC)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 0] = -HK2*HK3
+    H[..., 1] = -HK3*HK4
+    H[..., 2] = HK3*HK5
+    H[..., 3] = -HK3*HK6
+    H[..., 4] = -HK8
+    H[..., 5] = -HK10
+    H[..., 6] = HK11*HK3
+    H[..., 22] = HK8
+    H[..., 23] = HK10
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = HK33*(-HK12*P_0_2 - HK13*P_0_6 + HK18 - HK7*P_0_22)
+    K[..., 1] = HK33*(-HK12*P_1_2 - HK13*P_1_6 + HK30 - HK7*P_1_22)
+    K[..., 2] = HK33*(-HK12*P_2_2 - HK13*P_2_6 + HK31 - HK7*P_2_22)
+    K[..., 3] = HK33*(-HK12*P_2_3 - HK13*P_3_6 + HK32 - HK7*P_3_22)
+    K[..., 4] = HK33*(-HK12*P_2_4 - HK13*P_4_6 + HK27 - HK28)
+    K[..., 5] = HK33*(-HK12*P_2_5 - HK13*P_5_6 + HK25 - HK7*P_5_22)
+    K[..., 6] = HK33*(-HK12*P_2_6 - HK13*P_6_6 + HK26 - HK7*P_6_22)
+    K[..., 7] = HK33*(-HK12*P_2_7 - HK13*P_6_7 + HK14*P_5_7 - HK14*P_7_23 + HK15*P_0_7 + HK16*P_1_7 + HK17*P_3_7 + HK7*P_4_7 - HK7*P_7_22)
+    K[..., 8] = HK33*(-HK12*P_2_8 - HK13*P_6_8 + HK14*P_5_8 - HK14*P_8_23 + HK15*P_0_8 + HK16*P_1_8 + HK17*P_3_8 + HK7*P_4_8 - HK7*P_8_22)
+    K[..., 9] = HK33*(-HK12*P_2_9 - HK13*P_6_9 + HK14*P_5_9 - HK14*P_9_23 + HK15*P_0_9 + HK16*P_1_9 + HK17*P_3_9 + HK7*P_4_9 - HK7*P_9_22)
+    K[..., 10] = HK33*(-HK12*P_2_10 - HK13*P_6_10 - HK14*P_10_23 + HK14*P_5_10 + HK15*P_0_10 + HK16*P_1_10 + HK17*P_3_10 - HK7*P_10_22 + HK7*P_4_10)
+    K[..., 11] = HK33*(-HK12*P_2_11 - HK13*P_6_11 - HK14*P_11_23 + HK14*P_5_11 + HK15*P_0_11 + HK16*P_1_11 + HK17*P_3_11 - HK7*P_11_22 + HK7*P_4_11)
+    K[..., 12] = HK33*(-HK12*P_2_12 - HK13*P_6_12 - HK14*P_12_23 + HK14*P_5_12 + HK15*P_0_12 + HK16*P_1_12 + HK17*P_3_12 - HK7*P_12_22 + HK7*P_4_12)
+    K[..., 13] = HK33*(-HK12*P_2_13 - HK13*P_6_13 - HK14*P_13_23 + HK14*P_5_13 + HK15*P_0_13 + HK16*P_1_13 + HK17*P_3_13 - HK7*P_13_22 + HK7*P_4_13)
+    K[..., 14] = HK33*(-HK12*P_2_14 - HK13*P_6_14 - HK14*P_14_23 + HK14*P_5_14 + HK15*P_0_14 + HK16*P_1_14 + HK17*P_3_14 - HK7*P_14_22 + HK7*P_4_14)
+    K[..., 15] = HK33*(-HK12*P_2_15 - HK13*P_6_15 - HK14*P_15_23 + HK14*P_5_15 + HK15*P_0_15 + HK16*P_1_15 + HK17*P_3_15 - HK7*P_15_22 + HK7*P_4_15)
+    K[..., 16] = HK33*(-HK12*P_2_16 - HK13*P_6_16 - HK14*P_16_23 + HK14*P_5_16 + HK15*P_0_16 + HK16*P_1_16 + HK17*P_3_16 - HK7*P_16_22 + HK7*P_4_16)
+    K[..., 17] = HK33*(-HK12*P_2_17 - HK13*P_6_17 - HK14*P_17_23 + HK14*P_5_17 + HK15*P_0_17 + HK16*P_1_17 + HK17*P_3_17 - HK7*P_17_22 + HK7*P_4_17)
+    K[..., 18] = HK33*(-HK12*P_2_18 - HK13*P_6_18 - HK14*P_18_23 + HK14*P_5_18 + HK15*P_0_18 + HK16*P_1_18 + HK17*P_3_18 - HK7*P_18_22 + HK7*P_4_18)
+    K[..., 19] = HK33*(-HK12*P_2_19 - HK13*P_6_19 - HK14*P_19_23 + HK14*P_5_19 + HK15*P_0_19 + HK16*P_1_19 + HK17*P_3_19 - HK7*P_19_22 + HK7*P_4_19)
+    K[..., 20] = HK33*(-HK12*P_2_20 - HK13*P_6_20 - HK14*P_20_23 + HK14*P_5_20 + HK15*P_0_20 + HK16*P_1_20 + HK17*P_3_20 - HK7*P_20_22 + HK7*P_4_20)
+    K[..., 21] = HK33*(-HK12*P_2_21 - HK13*P_6_21 - HK14*P_21_23 + HK14*P_5_21 + HK15*P_0_21 + HK16*P_1_21 + HK17*P_3_21 - HK7*P_21_22 + HK7*P_4_21)
+    K[..., 22] = HK33*(-HK12*P_2_22 - HK13*P_6_22 + HK29 - HK7*P_22_22)
+    K[..., 23] = HK33*(-HK12*P_2_23 - HK13*P_6_23 + HK24 - HK7*P_22_23)
+    return H, K
+
+# acc_bf_x observation Jacobian and Kalman gain, loop over the filters
+def fuse_acc_bf_x_kernel(states, P, Kaccx, R_ACC):
+    n_filters = P.shape[0]
+    Kaccx = numpy.broadcast_to(numpy.asarray(Kaccx, dtype=numpy.float64), (n_filters,))
+    R_ACC = numpy.broadcast_to(numpy.asarray(R_ACC, dtype=numpy.float64), (n_filters,))
+    return _fuse_acc_bf_x_kernel(states, P, Kaccx, R_ACC)
+
+@jit
+def _fuse_acc_bf_x_kernel(states, P, Kaccx, R_ACC):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        q0 = states[index, 0]
+        q1 = states[index, 1]
+        q2 = states[index, 2]
+        q3 = states[index, 3]
+        vn = states[index, 4]
+        ve = states[index, 5]
+        vd = states[index, 6]
+        vwn = states[index, 22]
+        vwe = states[index, 23]
+        P_0_0 = P[index, 0, 0]
+        P_0_1 = P[index, 0, 1]
+        P_0_2 = P[index, 0, 2]
+        P_0_3 = P[index, 0, 3]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_7 = P[index, 0, 7]
+        P_0_8 = P[index, 0, 8]
+        P_0_9 = P[index, 0, 9]
+        P_0_10 = P[index, 0, 10]
+        P_0_11 = P[index, 0, 11]
+        P_0_12 = P[index, 0, 12]
+        P_0_13 = P[index, 0, 13]
+        P_0_14 = P[index, 0, 14]
+        P_0_15 = P[index, 0, 15]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_0_18 = P[index, 0, 18]
+        P_0_19 = P[index, 0, 19]
+        P_0_20 = P[index, 0, 20]
+        P_0_21 = P[index, 0, 21]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_1 = P[index, 1, 1]
+        P_1_2 = P[index, 1, 2]
+        P_1_3 = P[index, 1, 3]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_7 = P[index, 1, 7]
+        P_1_8 = P[index, 1, 8]
+        P_1_9 = P[index, 1, 9]
+        P_1_10 = P[index, 1, 10]
+        P_1_11 = P[index, 1, 11]
+        P_1_12 = P[index, 1, 12]
+        P_1_13 = P[index, 1, 13]
+        P_1_14 = P[index, 1, 14]
+        P_1_15 = P[index, 1, 15]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_1_18 = P[index, 1, 18]
+        P_1_19 = P[index, 1, 19]
+        P_1_20 = P[index, 1, 20]
+        P_1_21 = P[index, 1, 21]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_2 = P[index, 2, 2]
+        P_2_3 = P[index, 2, 3]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_7 = P[index, 2, 7]
+        P_2_8 = P[index, 2, 8]
+        P_2_9 = P[index, 2, 9]
+        P_2_10 = P[index, 2, 10]
+        P_2_11 = P[index, 2, 11]
+        P_2_12 = P[index, 2, 12]
+        P_2_13 = P[index, 2, 13]
+        P_2_14 = P[index, 2, 14]
+        P_2_15 = P[index, 2, 15]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_2_18 = P[index, 2, 18]
+        P_2_19 = P[index, 2, 19]
+        P_2_20 = P[index, 2, 20]
+        P_2_21 = P[index, 2, 21]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_3 = P[index, 3, 3]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_7 = P[index, 3, 7]
+        P_3_8 = P[index, 3, 8]
+        P_3_9 = P[index, 3, 9]
+        P_3_10 = P[index, 3, 10]
+        P_3_11 = P[index, 3, 11]
+        P_3_12 = P[index, 3, 12]
+        P_3_13 = P[index, 3, 13]
+        P_3_14 = P[index, 3, 14]
+        P_3_15 = P[index, 3, 15]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_3_18 = P[index, 3, 18]
+        P_3_19 = P[index, 3, 19]
+        P_3_20 = P[index, 3, 20]
+        P_3_21 = P[index, 3, 21]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        P_4_4 = P[index, 4, 4]
+        P_4_5 = P[index, 4, 5]
+        P_4_6 = P[index, 4, 6]
+        P_4_7 = P[index, 4, 7]
+        P_4_8 = P[index, 4, 8]
+        P_4_9 = P[index, 4, 9]
+        P_4_10 = P[index, 4, 10]
+        P_4_11 = P[index, 4, 11]
+        P_4_12 = P[index, 4, 12]
+        P_4_13 = P[index, 4, 13]
+        P_4_14 = P[index, 4, 14]
+        P_4_15 = P[index, 4, 15]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_4_18 = P[index, 4, 18]
+        P_4_19 = P[index, 4, 19]
+        P_4_20 = P[index, 4, 20]
+        P_4_21 = P[index, 4, 21]
+        P_4_22 = P[index, 4, 22]
+        P_4_23 = P[index, 4, 23]
+        P_5_5 = P[index, 5, 5]
+        P_5_6 = P[index, 5, 6]
+        P_5_7 = P[index, 5, 7]
+        P_5_8 = P[index, 5, 8]
+        P_5_9 = P[index, 5, 9]
+        P_5_10 = P[index, 5, 10]
+        P_5_11 = P[index, 5, 11]
+        P_5_12 = P[index, 5, 12]
+        P_5_13 = P[index, 5, 13]
+        P_5_14 = P[index, 5, 14]
+        P_5_15 = P[index, 5, 15]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_5_18 = P[index, 5, 18]
+        P_5_19 = P[index, 5, 19]
+        P_5_20 = P[index, 5, 20]
+        P_5_21 = P[index, 5, 21]
+        P_5_22 = P[index, 5, 22]
+        P_5_23 = P[index, 5, 23]
+        P_6_6 = P[index, 6, 6]
+        P_6_7 = P[index, 6, 7]
+        P_6_8 = P[index, 6, 8]
+        P_6_9 = P[index, 6, 9]
+        P_6_10 = P[index, 6, 10]
+        P_6_11 = P[index, 6, 11]
+        P_6_12 = P[index, 6, 12]
+        P_6_13 = P[index, 6, 13]
+        P_6_14 = P[index, 6, 14]
+        P_6_15 = P[index, 6, 15]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_6_18 = P[index, 6, 18]
+        P_6_19 = P[index, 6, 19]
+        P_6_20 = P[index, 6, 20]
+        P_6_21 = P[index, 6, 21]
+        P_6_22 = P[index, 6, 22]
+        P_6_23 = P[index, 6, 23]
+        P_7_22 = P[index, 7, 22]
+        P_7_23 = P[index, 7, 23]
+        P_8_22 = P[index, 8, 22]
+        P_8_23 = P[index, 8, 23]
+        P_9_22 = P[index, 9, 22]
+        P_9_23 = P[index, 9, 23]
+        P_10_22 = P[index, 10, 22]
+        P_10_23 = P[index, 10, 23]
+        P_11_22 = P[index, 11, 22]
+        P_11_23 = P[index, 11, 23]
+        P_12_22 = P[index, 12, 22]
+        P_12_23 = P[index, 12, 23]
+        P_13_22 = P[index, 13, 22]
+        P_13_23 = P[index, 13, 23]
+        P_14_22 = P[index, 14, 22]
+        P_14_23 = P[index, 14, 23]
+        P_15_22 = P[index, 15, 22]
+        P_15_23 = P[index, 15, 23]
+        P_16_22 = P[index, 16, 22]
+        P_16_23 = P[index, 16, 23]
+        P_17_22 = P[index, 17, 22]
+        P_17_23 = P[index, 17, 23]
+        P_18_22 = P[index, 18, 22]
+        P_18_23 = P[index, 18, 23]
+        P_19_22 = P[index, 19, 22]
+        P_19_23 = P[index, 19, 23]
+        P_20_22 = P[index, 20, 22]
+        P_20_23 = P[index, 20, 23]
+        P_21_22 = P[index, 21, 22]
+        P_21_23 = P[index, 21, 23]
+        P_22_22 = P[index, 22, 22]
+        P_22_23 = P[index, 22, 23]
+        P_23_23 = P[index, 23, 23]
+        HK0 = vn - vwn
+        HK1 = ve - vwe
+        HK2 = HK0*q0 + HK1*q3 - q2*vd
+        HK3 = 2*Kaccx[index]
+        HK4 = HK0*q1 + HK1*q2 + q3*vd
+        HK5 = HK0*q2 - HK1*q1 + q0*vd
+        HK6 = -HK0*q3 + HK1*q0 + q1*vd
+        HK7 = q0**2 + q1**2 - q2**2 - q3**2
+        HK8 = HK7*Kaccx[index]
+        HK9 = q0*q3 + q1*q2
+        HK10 = HK3*HK9
+        HK11 = q0*q2 - q1*q3
+        HK12 = 2*HK5
+        HK13 = 2*HK11
+        HK14 = 2*HK9
+        HK15 = 2*HK2
+        HK16 = 2*HK4
+        HK17 = 2*HK6
+        HK18 = -HK14*P_0_23 + HK14*P_0_5 + HK15*P_0_0 + HK16*P_0_1 + HK17*P_0_3 + HK7*P_0_4
+        HK19 = Kaccx[index]**2
+        HK20 = -HK7
+        HK21 = -2*HK5
+        HK22 = -2*HK11
+        HK23 = HK14*P_5_23
+        HK24 = -HK14*P_23_23 + HK15*P_0_23 + HK16*P_1_23 + HK17*P_3_23 + HK23 + HK7*P_4_23
+        HK25 = HK14*P_5_5 + HK15*P_0_5 + HK16*P_1_5 + HK17*P_3_5 - HK23 + HK7*P_4_5
+        HK26 = HK14*P_5_6 - HK14*P_6_23 + HK15*P_0_6 + HK16*P_1_6 + HK17*P_3_6 + HK7*P_4_6
+        HK27 = -HK14*P_4_23 + HK14*P_4_5 + HK15*P_0_4 + HK16*P_1_4 + HK17*P_3_4 + HK7*P_4_4
+        HK28 = HK7*P_4_22
+        HK29 = -HK14*P_22_23 + HK14*P_5_22 + HK15*P_0_22 + HK16*P_1_22 + HK17*P_3_22 + HK28
+        HK30 = -HK14*P_1_23 + HK14*P_1_5 + HK15*P_0_1 + HK16*P_1_1 + HK17*P_1_3 + HK7*P_1_4
+        HK31 = -HK14*P_2_23 + HK14*P_2_5 + HK15*P_0_2 + HK16*P_1_2 + HK17*P_2_3 + HK7*P_2_4
+        HK32 = -HK14*P_3_23 + HK14*P_3_5 + HK15*P_0_3 + HK16*P_1_3 + HK17*P_3_3 + HK7*P_3_4
+        HK33 = Kaccx[index]/(2*HK11*HK19*(HK20*P_6_22 + HK21*P_2_6 + HK22*P_6_6 + HK26) - HK14*HK19*(HK20*P_5_22 + HK21*P_2_5 + HK22*P_5_6 + HK25) - HK15*HK19*(HK18 + HK20*P_0_22 + HK21*P_0_2 + HK22*P_0_6) - HK16*HK19*(HK20*P_1_22 + HK21*P_1_2 + HK22*P_1_6 + HK30) - HK17*HK19*(HK20*P_3_22 + HK21*P_2_3 + HK22*P_3_6 + HK32) + 2*HK19*HK5*(HK20*P_2_22 + HK21*P_2_2 + HK22*P_2_6 + HK31) + HK19*HK7*(HK20*P_22_22 + HK21*P_2_22 + HK22*P_6_22 + HK29) - HK19*HK7*(HK20*P_4_22 + HK21*P_2_4 + HK22*P_4_6 + HK27) + 2*HK19*HK9*(HK20*P_22_23 + HK21*P_2_23 + HK22*P_6_23 + HK24) - R_ACC[index])
+        H[index, 0] = -HK2*HK3
+        H[index, 1] = -HK3*HK4
+        H[index, 2] = HK3*HK5
+        H[index, 3] = -HK3*HK6
+        H[index, 4] = -HK8
+        H[index, 5] = -HK10
+        H[index, 6] = HK11*HK3
+        H[index, 22] = HK8
+        H[index, 23] = HK10
+        K[index, 0] = HK33*(-HK12*P_0_2 - HK13*P_0_6 + HK18 - HK7*P_0_22)
+        K[index, 1] = HK33*(-HK12*P_1_2 - HK13*P_1_6 + HK30 - HK7*P_1_22)
+        K[index, 2] = HK33*(-HK12*P_2_2 - HK13*P_2_6 + HK31 - HK7*P_2_22)
+        K[index, 3] = HK33*(-HK12*P_2_3 - HK13*P_3_6 + HK32 - HK7*P_3_22)
+        K[index, 4] = HK33*(-HK12*P_2_4 - HK13*P_4_6 + HK27 - HK28)
+        K[index, 5] = HK33*(-HK12*P_2_5 - HK13*P_5_6 + HK25 - HK7*P_5_22)
+        K[index, 6] = HK33*(-HK12*P_2_6 - HK13*P_6_6 + HK26 - HK7*P_6_22)
+        K[index, 7] = HK33*(-HK12*P_2_7 - HK13*P_6_7 + HK14*P_5_7 - HK14*P_7_23 + HK15*P_0_7 + HK16*P_1_7 + HK17*P_3_7 + HK7*P_4_7 - HK7*P_7_22)
+        K[index, 8] = HK33*(-HK12*P_2_8 - HK13*P_6_8 + HK14*P_5_8 - HK14*P_8_23 + HK15*P_0_8 + HK16*P_1_8 + HK17*P_3_8 + HK7*P_4_8 - HK7*P_8_22)
+        K[index, 9] = HK33*(-HK12*P_2_9 - HK13*P_6_9 + HK14*P_5_9 - HK14*P_9_23 + HK15*P_0_9 + HK16*P_1_9 + HK17*P_3_9 + HK7*P_4_9 - HK7*P_9_22)
+        K[index, 10] = HK33*(-HK12*P_2_10 - HK13*P_6_10 - HK14*P_10_23 + HK14*P_5_10 + HK15*P_0_10 + HK16*P_1_10 + HK17*P_3_10 - HK7*P_10_22 + HK7*P_4_10)
+        K[index, 11] = HK33*(-HK12*P_2_11 - HK13*P_6_11 - HK14*P_11_23 + HK14*P_5_11 + HK15*P_0_11 + HK16*P_1_11 + HK17*P_3_11 - HK7*P_11_22 + HK7*P_4_11)
+        K[index, 12] = HK33*(-HK12*P_2_12 - HK13*P_6_12 - HK14*P_12_23 + HK14*P_5_12 + HK15*P_0_12 + HK16*P_1_12 + HK17*P_3_12 - HK7*P_12_22 + HK7*P_4_12)
+        K[index, 13] = HK33*(-HK12*P_2_13 - HK13*P_6_13 - HK14*P_13_23 + HK14*P_5_13 + HK15*P_0_13 + HK16*P_1_13 + HK17*P_3_13 - HK7*P_13_22 + HK7*P_4_13)
+        K[index, 14] = HK33*(-HK12*P_2_14 - HK13*P_6_14 - HK14*P_14_23 + HK14*P_5_14 + HK15*P_0_14 + HK16*P_1_14 + HK17*P_3_14 - HK7*P_14_22 + HK7*P_4_14)
+        K[index, 15] = HK33*(-HK12*P_2_15 - HK13*P_6_15 - HK14*P_15_23 + HK14*P_5_15 + HK15*P_0_15 + HK16*P_1_15 + HK17*P_3_15 - HK7*P_15_22 + HK7*P_4_15)
+        K[index, 16] = HK33*(-HK12*P_2_16 - HK13*P_6_16 - HK14*P_16_23 + HK14*P_5_16 + HK15*P_0_16 + HK16*P_1_16 + HK17*P_3_16 - HK7*P_16_22 + HK7*P_4_16)
+        K[index, 17] = HK33*(-HK12*P_2_17 - HK13*P_6_17 - HK14*P_17_23 + HK14*P_5_17 + HK15*P_0_17 + HK16*P_1_17 + HK17*P_3_17 - HK7*P_17_22 + HK7*P_4_17)
+        K[index, 18] = HK33*(-HK12*P_2_18 - HK13*P_6_18 - HK14*P_18_23 + HK14*P_5_18 + HK15*P_0_18 + HK16*P_1_18 + HK17*P_3_18 - HK7*P_18_22 + HK7*P_4_18)
+        K[index, 19] = HK33*(-HK12*P_2_19 - HK13*P_6_19 - HK14*P_19_23 + HK14*P_5_19 + HK15*P_0_19 + HK16*P_1_19 + HK17*P_3_19 - HK7*P_19_22 + HK7*P_4_19)
+        K[index, 20] = HK33*(-HK12*P_2_20 - HK13*P_6_20 - HK14*P_20_23 + HK14*P_5_20 + HK15*P_0_20 + HK16*P_1_20 + HK17*P_3_20 - HK7*P_20_22 + HK7*P_4_20)
+        K[index, 21] = HK33*(-HK12*P_2_21 - HK13*P_6_21 - HK14*P_21_23 + HK14*P_5_21 + HK15*P_0_21 + HK16*P_1_21 + HK17*P_3_21 - HK7*P_21_22 + HK7*P_4_21)
+        K[index, 22] = HK33*(-HK12*P_2_22 - HK13*P_6_22 + HK29 - HK7*P_22_22)
+        K[index, 23] = HK33*(-HK12*P_2_23 - HK13*P_6_23 + HK24 - HK7*P_22_23)
+    return H, K
+
+# acc_bf_y observation Jacobian and Kalman gain
+def fuse_acc_bf_y(states, P, Kaccy, R_ACC):
+    q0 = states[..., 0]
+    q1 = states[..., 1]
+    q2 = states[..., 2]
+    q3 = states[..., 3]
+    vn = states[..., 4]
+    ve = states[..., 5]
+    vd = states[..., 6]
+    vwn = states[..., 22]
+    vwe = states[..., 23]
+    P_0_0 = P[..., 0, 0]
+    P_0_1 = P[..., 0, 1]
+    P_0_2 = P[..., 0, 2]
+    P_0_3 = P[..., 0, 3]
+    P_0_4 = P[..., 0, 4]
+    P_0_5 = P[..., 0, 5]
+    P_0_6 = P[..., 0, 6]
+    P_0_7 = P[..., 0, 7]
+    P_0_8 = P[..., 0, 8]
+    P_0_9 = P[..., 0, 9]
+    P_0_10 = P[..., 0, 10]
+    P_0_11 = P[..., 0, 11]
+    P_0_12 = P[..., 0, 12]
+    P_0_13 = P[..., 0, 13]
+    P_0_14 = P[..., 0, 14]
+    P_0_15 = P[..., 0, 15]
+    P_0_16 = P[..., 0, 16]
+    P_0_17 = P[..., 0, 17]
+    P_0_18 = P[..., 0, 18]
+    P_0_19 = P[..., 0, 19]
+    P_0_20 = P[..., 0, 20]
+    P_0_21 = P[..., 0, 21]
+    P_0_22 = P[..., 0, 22]
+    P_0_23 = P[..., 0, 23]
+    P_1_1 = P[..., 1, 1]
+    P_1_2 = P[..., 1, 2]
+    P_1_3 = P[..., 1, 3]
+    P_1_4 = P[..., 1, 4]
+    P_1_5 = P[..., 1, 5]
+    P_1_6 = P[..., 1, 6]
+    P_1_7 = P[..., 1, 7]
+    P_1_8 = P[..., 1, 8]
+    P_1_9 = P[..., 1, 9]
+    P_1_10 = P[..., 1, 10]
+    P_1_11 = P[..., 1, 11]
+    P_1_12 = P[..., 1, 12]
+    P_1_13 = P[..., 1, 13]
+    P_1_14 = P[..., 1, 14]
+    P_1_15 = P[..., 1, 15]
+    P_1_16 = P[..., 1, 16]
+    P_1_17 = P[..., 1, 17]
+    P_1_18 = P[..., 1, 18]
+    P_1_19 = P[..., 1, 19]
+    P_1_20 = P[..., 1, 20]
+    P_1_21 = P[..., 1, 21]
+    P_1_22 = P[..., 1, 22]
+    P_1_23 = P[..., 1, 23]
+    P_2_2 = P[..., 2, 2]
+    P_2_3 = P[..., 2, 3]
+    P_2_4 = P[..., 2, 4]
+    P_2_5 = P[..., 2, 5]
+    P_2_6 = P[..., 2, 6]
+    P_2_7 = P[..., 2, 7]
+    P_2_8 = P[..., 2, 8]
+    P_2_9 = P[..., 2, 9]
+    P_2_10 = P[..., 2, 10]
+    P_2_11 = P[..., 2, 11]
+    P_2_12 = P[..., 2, 12]
+    P_2_13 = P[..., 2, 13]
+    P_2_14 = P[..., 2, 14]
+    P_2_15 = P[..., 2, 15]
+    P_2_16 = P[..., 2, 16]
+    P_2_17 = P[..., 2, 17]
+    P_2_18 = P[..., 2, 18]
+    P_2_19 = P[..., 2, 19]
+    P_2_20 = P[..., 2, 20]
+    P_2_21 = P[..., 2, 21]
+    P_2_22 = P[..., 2, 22]
+    P_2_23 = P[..., 2, 23]
+    P_3_3 = P[..., 3, 3]
+    P_3_4 = P[..., 3, 4]
+    P_3_5 = P[..., 3, 5]
+    P_3_6 = P[..., 3, 6]
+    P_3_7 = P[..., 3, 7]
+    P_3_8 = P[..., 3, 8]
+    P_3_9 = P[..., 3, 9]
+    P_3_10 = P[..., 3, 10]
+    P_3_11 = P[..., 3, 11]
+    P_3_12 = P[..., 3, 12]
+    P_3_13 = P[..., 3, 13]
+    P_3_14 = P[..., 3, 14]
+    P_3_15 = P[..., 3, 15]
+    P_3_16 = P[..., 3, 16]
+    P_3_17 = P[..., 3, 17]
+    P_3_18 = P[..., 3, 18]
+    P_3_19 = P[..., 3, 19]
+    P_3_20 = P[..., 3, 20]
+    P_3_21 = P[..., 3, 21]
+    P_3_22 = P[..., 3, 22]
+    P_3_23 = P[..., 3, 23]
+    P_4_4 = P[..., 4, 4]
+    P_4_5 = P[..., 4, 5]
+    P_4_6 = P[..., 4, 6]
+    P_4_7 = P[..., 4, 7]
+    P_4_8 = P[..., 4, 8]
+    P_4_9 = P[..., 4, 9]
+    P_4_10 = P[..., 4, 10]
+    P_4_11 = P[..., 4, 11]
+    P_4_12 = P[..., 4, 12]
+    P_4_13 = P[..., 4, 13]
+    P_4_14 = P[..., 4, 14]
+    P_4_15 = P[..., 4, 15]
+    P_4_16 = P[..., 4, 16]
+    P_4_17 = P[..., 4, 17]
+    P_4_18 = P[..., 4, 18]
+    P_4_19 = P[..., 4, 19]
+    P_4_20 = P[..., 4, 20]
+    P_4_21 = P[..., 4, 21]
+    P_4_22 = P[..., 4, 22]
+    P_4_23 = P[..., 4, 23]
+    P_5_5 = P[..., 5, 5]
+    P_5_6 = P[..., 5, 6]
+    P_5_7 = P[..., 5, 7]
+    P_5_8 = P[..., 5, 8]
+    P_5_9 = P[..., 5, 9]
+    P_5_10 = P[..., 5, 10]
+    P_5_11 = P[..., 5, 11]
+    P_5_12 = P[..., 5, 12]
+    P_5_13 = P[..., 5, 13]
+    P_5_14 = P[..., 5, 14]
+    P_5_15 = P[..., 5, 15]
+    P_5_16 = P[..., 5, 16]
+    P_5_17 = P[..., 5, 17]
+    P_5_18 = P[..., 5, 18]
+    P_5_19 = P[..., 5, 19]
+    P_5_20 = P[..., 5, 20]
+    P_5_21 = P[..., 5, 21]
+    P_5_22 = P[..., 5, 22]
+    P_5_23 = P[..., 5, 23]
+    P_6_6 = P[..., 6, 6]
+    P_6_7 = P[..., 6, 7]
+    P_6_8 = P[..., 6, 8]
+    P_6_9 = P[..., 6, 9]
+    P_6_10 = P[..., 6, 10]
+    P_6_11 = P[..., 6, 11]
+    P_6_12 = P[..., 6, 12]
+    P_6_13 = P[..., 6, 13]
+    P_6_14 = P[..., 6, 14]
+    P_6_15 = P[..., 6, 15]
+    P_6_16 = P[..., 6, 16]
+    P_6_17 = P[..., 6, 17]
+    P_6_18 = P[..., 6, 18]
+    P_6_19 = P[..., 6, 19]
+    P_6_20 = P[..., 6, 20]
+    P_6_21 = P[..., 6, 21]
+    P_6_22 = P[..., 6, 22]
+    P_6_23 = P[..., 6, 23]
+    P_7_22 = P[..., 7, 22]
+    P_7_23 = P[..., 7, 23]
+    P_8_22 = P[..., 8, 22]
+    P_8_23 = P[..., 8, 23]
+    P_9_22 = P[..., 9, 22]
+    P_9_23 = P[..., 9, 23]
+    P_10_22 = P[..., 10, 22]
+    P_10_23 = P[..., 10, 23]
+    P_11_22 = P[..., 11, 22]
+    P_11_23 = P[..., 11, 23]
+    P_12_22 = P[..., 12, 22]
+    P_12_23 = P[..., 12, 23]
+    P_13_22 = P[..., 13, 22]
+    P_13_23 = P[..., 13, 23]
+    P_14_22 = P[..., 14, 22]
+    P_14_23 = P[..., 14, 23]
+    P_15_22 = P[..., 15, 22]
+    P_15_23 = P[..., 15, 23]
+    P_16_22 = P[..., 16, 22]
+    P_16_23 = P[..., 16, 23]
+    P_17_22 = P[..., 17, 22]
+    P_17_23 = P[..., 17, 23]
+    P_18_22 = P[..., 18, 22]
+    P_18_23 = P[..., 18, 23]
+    P_19_22 = P[..., 19, 22]
+    P_19_23 = P[..., 19, 23]
+    P_20_22 = P[..., 20, 22]
+    P_20_23 = P[..., 20, 23]
+    P_21_22 = P[..., 21, 22]
+    P_21_23 = P[..., 21, 23]
+    P_22_22 = P[..., 22, 22]
+    P_22_23 = P[..., 22, 23]
+    P_23_23 = P[..., 23, 23]
+    HK0 = ve - vwe
+    HK1 = vn - vwn
+    HK2 = HK0*q0 - HK1*q3 + q1*vd
+    HK3 = 2*Kaccy
+    HK4 = -HK0*q1 + HK1*q2 + q0*vd
+    HK5 = HK0*q2 + HK1*q1 + q3*vd
+    HK6 = HK0*q3 + HK1*q0 - q2*vd
+    HK7 = q0*q3 - q1*q2
+    HK8 = HK3*HK7
+    HK9 = q0**2 - q1**2 + q2**2 - q3**2
+    HK10 = HK9*Kaccy
+    HK11 = q0*q1 + q2*q3
+    HK12 = 2*HK6
+    HK13 = 2*HK7
+    HK14 = 2*HK2
+    HK15 = 2*HK4
+    HK16 = 2*HK5
+    HK17 = 2*HK11
+    HK18 = HK13*P_0_22 + HK14*P_0_0 + HK15*P_0_1 + HK16*P_0_2 + HK17*P_0_6 + HK9*P_0_5
+    HK19 = Kaccy**2
+    HK20 = -HK9
+    HK21 = -2*HK6
+    HK22 = -2*HK7
+    HK23 = HK13*P_6_22 + HK14*P_0_6 + HK15*P_1_6 + HK16*P_2_6 + HK17*P_6_6 + HK9*P_5_6
+    HK24 = HK13*P_22_22 + HK14*P_0_22 + HK15*P_1_22 + HK16*P_2_22 + HK17*P_6_22 + HK9*P_5_22
+    HK25 = HK13*P_4_22
+    HK26 = HK14*P_0_4 + HK15*P_1_4 + HK16*P_2_4 + HK17*P_4_6 + HK25 + HK9*P_4_5
+    HK27 = HK13*P_5_22 + HK14*P_0_5 + HK15*P_1_5 + HK16*P_2_5 + HK17*P_5_6 + HK9*P_5_5
+    HK28 = HK9*P_5_23
+    HK29 = HK13*P_22_23 + HK14*P_0_23 + HK15*P_1_23 + HK16*P_2_23 + HK17*P_6_23 + HK28
+    HK30 = HK13*P_2_22 + HK14*P_0_2 + HK15*P_1_2 + HK16*P_2_2 + HK17*P_2_6 + HK9*P_2_5
+    HK31 = HK13*P_1_22 + HK14*P_0_1 + HK15*P_1_1 + HK16*P_1_2 + HK17*P_1_6 + HK9*P_1_5
+    HK32 = HK13*P_3_22 + HK14*P_0_3 + HK15*P_1_3 + HK16*P_2_3 + HK17*P_3_6 + HK9*P_3_5
+    HK33 = Kaccy/(-HK13*HK19*(HK20*P_22_23 + HK21*P_3_22 + HK22*P_4_22 + HK24) - HK14*HK19*(HK18 + HK20*P_0_23 + HK21*P_0_3 + HK22*P_0_4) - HK15*HK19*(HK20*P_1_23 + HK21*P_1_3 + HK22*P_1_4 + HK31) - HK16*HK19*(HK20*P_2_23 + HK21*P_2_3 + HK22*P_2_4 + HK30) - HK17*HK19*(HK20*P_6_23 + HK21*P_3_6 + HK22*P_4_6 + HK23) + 2*HK19*HK6*(HK20*P_3_23 + HK21*P_3_3 + HK22*P_3_4 + HK32) + 2*HK19*HK7*(HK20*P_4_23 + HK21*P_3_4 + HK22*P_4_4 + HK26) + HK19*HK9*(HK20*P_23_23 + HK21*P_3_23 + HK22*P_4_23 + HK29) - HK19*HK9*(HK20*P_5_23 + HK21*P_3_5 + HK22*P_4_5 + HK27) - R_ACC)
+    H = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    H[..., 0] = -HK2*HK3
+    H[..., 1] = -HK3*HK4
+    H[..., 2] = -HK3*HK5
+    H[..., 3] = HK3*HK6
+    H[..., 4] = HK8
+    H[..., 5] = -HK10
+    H[..., 6] = -HK11*HK3
+    H[..., 22] = -HK8
+    H[..., 23] = HK10
+    K = numpy.zeros(numpy.shape(P)[:-2] + (24,))
+    K[..., 0] = HK33*(-HK12*P_0_3 - HK13*P_0_4 + HK18 - HK9*P_0_23)
+    K[..., 1] = HK33*(-HK12*P_1_3 - HK13*P_1_4 + HK31 - HK9*P_1_23)
+    K[..., 2] = HK33*(-HK12*P_2_3 - HK13*P_2_4 + HK30 - HK9*P_2_23)
+    K[..., 3] = HK33*(-HK12*P_3_3 - HK13*P_3_4 + HK32 - HK9*P_3_23)
+    K[..., 4] = HK33*(-HK12*P_3_4 - HK13*P_4_4 + HK26 - HK9*P_4_23)
+    K[..., 5] = HK33*(-HK12*P_3_5 - HK13*P_4_5 + HK27 - HK28)
+    K[..., 6] = HK33*(-HK12*P_3_6 - HK13*P_4_6 + HK23 - HK9*P_6_23)
+    K[..., 7] = HK33*(-HK12*P_3_7 - HK13*P_4_7 + HK13*P_7_22 + HK14*P_0_7 + HK15*P_1_7 + HK16*P_2_7 + HK17*P_6_7 + HK9*P_5_7 - HK9*P_7_23)
+    K[..., 8] = HK33*(-HK12*P_3_8 - HK13*P_4_8 + HK13*P_8_22 + HK14*P_0_8 + HK15*P_1_8 + HK16*P_2_8 + HK17*P_6_8 + HK9*P_5_8 - HK9*P_8_23)
+    K[..., 9] = HK33*(-HK12*P_3_9 - HK13*P_4_9 + HK13*P_9_22 + HK14*P_0_9 + HK15*P_1_9 + HK16*P_2_9 + HK17*P_6_9 + HK9*P_5_9 - HK9*P_9_23)
+    K[..., 10] = HK33*(-HK12*P_3_10 + HK13*P_10_22 - HK13*P_4_10 + HK14*P_0_10 + HK15*P_1_10 + HK16*P_2_10 + HK17*P_6_10 - HK9*P_10_23 + HK9*P_5_10)
+    K[..., 11] = HK33*(-HK12*P_3_11 + HK13*P_11_22 - HK13*P_4_11 + HK14*P_0_11 + HK15*P_1_11 + HK16*P_2_11 + HK17*P_6_11 - HK9*P_11_23 + HK9*P_5_11)
+    K[..., 12] = HK33*(-HK12*P_3_12 + HK13*P_12_22 - HK13*P_4_12 + HK14*P_0_12 + HK15*P_1_12 + HK16*P_2_12 + HK17*P_6_12 - HK9*P_12_23 + HK9*P_5_12)
+    K[..., 13] = HK33*(-HK12*P_3_13 + HK13*P_13_22 - HK13*P_4_13 + HK14*P_0_13 + HK15*P_1_13 + HK16*P_2_13 + HK17*P_6_13 - HK9*P_13_23 + HK9*P_5_13)
+    K[..., 14] = HK33*(-HK12*P_3_14 + HK13*P_14_22 - HK13*P_4_14 + HK14*P_0_14 + HK15*P_1_14 + HK16*P_2_14 + HK17*P_6_14 - HK9*P_14_23 + HK9*P_5_14)
+    K[..., 15] = HK33*(-HK12*P_3_15 + HK13*P_15_22 - HK13*P_4_15 + HK14*P_0_15 + HK15*P_1_15 + HK16*P_2_15 + HK17*P_6_15 - HK9*P_15_23 + HK9*P_5_15)
+    K[..., 16] = HK33*(-HK12*P_3_16 + HK13*P_16_22 - HK13*P_4_16 + HK14*P_0_16 + HK15*P_1_16 + HK16*P_2_16 + HK17*P_6_16 - HK9*P_16_23 + HK9*P_5_16)
+    K[..., 17] = HK33*(-HK12*P_3_17 + HK13*P_17_22 - HK13*P_4_17 + HK14*P_0_17 + HK15*P_1_17 + HK16*P_2_17 + HK17*P_6_17 - HK9*P_17_23 + HK9*P_5_17)
+    K[..., 18] = HK33*(-HK12*P_3_18 + HK13*P_18_22 - HK13*P_4_18 + HK14*P_0_18 + HK15*P_1_18 + HK16*P_2_18 + HK17*P_6_18 - HK9*P_18_23 + HK9*P_5_18)
+    K[..., 19] = HK33*(-HK12*P_3_19 + HK13*P_19_22 - HK13*P_4_19 + HK14*P_0_19 + HK15*P_1_19 + HK16*P_2_19 + HK17*P_6_19 - HK9*P_19_23 + HK9*P_5_19)
+    K[..., 20] = HK33*(-HK12*P_3_20 + HK13*P_20_22 - HK13*P_4_20 + HK14*P_0_20 + HK15*P_1_20 + HK16*P_2_20 + HK17*P_6_20 - HK9*P_20_23 + HK9*P_5_20)
+    K[..., 21] = HK33*(-HK12*P_3_21 + HK13*P_21_22 - HK13*P_4_21 + HK14*P_0_21 + HK15*P_1_21 + HK16*P_2_21 + HK17*P_6_21 - HK9*P_21_23 + HK9*P_5_21)
+    K[..., 22] = HK33*(-HK12*P_3_22 + HK24 - HK25 - HK9*P_22_23)
+    K[..., 23] = HK33*(-HK12*P_3_23 - HK13*P_4_23 + HK29 - HK9*P_23_23)
+    return H, K
+
+# acc_bf_y observation Jacobian and Kalman gain, loop over the filters
+def fuse_acc_bf_y_kernel(states, P, Kaccy, R_ACC):
+    n_filters = P.shape[0]
+    Kaccy = numpy.broadcast_to(numpy.asarray(Kaccy, dtype=numpy.float64), (n_filters,))
+    R_ACC = numpy.broadcast_to(numpy.asarray(R_ACC, dtype=numpy.float64), (n_filters,))
+    return _fuse_acc_bf_y_kernel(states, P, Kaccy, R_ACC)
+
+@jit
+def _fuse_acc_bf_y_kernel(states, P, Kaccy, R_ACC):
+    n_filters = P.shape[0]
+    H = numpy.zeros((n_filters,) + (24,))
+    K = numpy.zeros((n_filters,) + (24,))
+    for index in range(n_filters):
+        q0 = states[index, 0]
+        q1 = states[index, 1]
+        q2 = states[index, 2]
+        q3 = states[index, 3]
+        vn = states[index, 4]
+        ve = states[index, 5]
+        vd = states[index, 6]
+        vwn = states[index, 22]
+        vwe = states[index, 23]
+        P_0_0 = P[index, 0, 0]
+        P_0_1 = P[index, 0, 1]
+        P_0_2 = P[index, 0, 2]
+        P_0_3 = P[index, 0, 3]
+        P_0_4 = P[index, 0, 4]
+        P_0_5 = P[index, 0, 5]
+        P_0_6 = P[index, 0, 6]
+        P_0_7 = P[index, 0, 7]
+        P_0_8 = P[index, 0, 8]
+        P_0_9 = P[index, 0, 9]
+        P_0_10 = P[index, 0, 10]
+        P_0_11 = P[index, 0, 11]
+        P_0_12 = P[index, 0, 12]
+        P_0_13 = P[index, 0, 13]
+        P_0_14 = P[index, 0, 14]
+        P_0_15 = P[index, 0, 15]
+        P_0_16 = P[index, 0, 16]
+        P_0_17 = P[index, 0, 17]
+        P_0_18 = P[index, 0, 18]
+        P_0_19 = P[index, 0, 19]
+        P_0_20 = P[index, 0, 20]
+        P_0_21 = P[index, 0, 21]
+        P_0_22 = P[index, 0, 22]
+        P_0_23 = P[index, 0, 23]
+        P_1_1 = P[index, 1, 1]
+        P_1_2 = P[index, 1, 2]
+        P_1_3 = P[index, 1, 3]
+        P_1_4 = P[index, 1, 4]
+        P_1_5 = P[index, 1, 5]
+        P_1_6 = P[index, 1, 6]
+        P_1_7 = P[index, 1, 7]
+        P_1_8 = P[index, 1, 8]
+        P_1_9 = P[index, 1, 9]
+        P_1_10 = P[index, 1, 10]
+        P_1_11 = P[index, 1, 11]
+        P_1_12 = P[index, 1, 12]
+        P_1_13 = P[index, 1, 13]
+        P_1_14 = P[index, 1, 14]
+        P_1_15 = P[index, 1, 15]
+        P_1_16 = P[index, 1, 16]
+        P_1_17 = P[index, 1, 17]
+        P_1_18 = P[index, 1, 18]
+        P_1_19 = P[index, 1, 19]
+        P_1_20 = P[index, 1, 20]
+        P_1_21 = P[index, 1, 21]
+        P_1_22 = P[index, 1, 22]
+        P_1_23 = P[index, 1, 23]
+        P_2_2 = P[index, 2, 2]
+        P_2_3 = P[index, 2, 3]
+        P_2_4 = P[index, 2, 4]
+        P_2_5 = P[index, 2, 5]
+        P_2_6 = P[index, 2, 6]
+        P_2_7 = P[index, 2, 7]
+        P_2_8 = P[index, 2, 8]
+        P_2_9 = P[index, 2, 9]
+        P_2_10 = P[index, 2, 10]
+        P_2_11 = P[index, 2, 11]
+        P_2_12 = P[index, 2, 12]
+        P_2_13 = P[index, 2, 13]
+        P_2_14 = P[index, 2, 14]
+        P_2_15 = P[index, 2, 15]
+        P_2_16 = P[index, 2, 16]
+        P_2_17 = P[index, 2, 17]
+        P_2_18 = P[index, 2, 18]
+        P_2_19 = P[index, 2, 19]
+        P_2_20 = P[index, 2, 20]
+        P_2_21 = P[index, 2, 21]
+        P_2_22 = P[index, 2, 22]
+        P_2_23 = P[index, 2, 23]
+        P_3_3 = P[index, 3, 3]
+        P_3_4 = P[index, 3, 4]
+        P_3_5 = P[index, 3, 5]
+        P_3_6 = P[index, 3, 6]
+        P_3_7 = P[index, 3, 7]
+        P_3_8 = P[index, 3, 8]
+        P_3_9 = P[index, 3, 9]
+        P_3_10 = P[index, 3, 10]
+        P_3_11 = P[index, 3, 11]
+        P_3_12 = P[index, 3, 12]
+        P_3_13 = P[index, 3, 13]
+        P_3_14 = P[index, 3, 14]
+        P_3_15 = P[index, 3, 15]
+        P_3_16 = P[index, 3, 16]
+        P_3_17 = P[index, 3, 17]
+        P_3_18 = P[index, 3, 18]
+        P_3_19 = P[index, 3, 19]
+        P_3_20 = P[index, 3, 20]
+        P_3_21 = P[index, 3, 21]
+        P_3_22 = P[index, 3, 22]
+        P_3_23 = P[index, 3, 23]
+        P_4_4 = P[index, 4, 4]
+        P_4_5 = P[index, 4, 5]
+        P_4_6 = P[index, 4, 6]
+        P_4_7 = P[index, 4, 7]
+        P_4_8 = P[index, 4, 8]
+        P_4_9 = P[index, 4, 9]
+        P_4_10 = P[index, 4, 10]
+        P_4_11 = P[index, 4, 11]
+        P_4_12 = P[index, 4, 12]
+        P_4_13 = P[index, 4, 13]
+        P_4_14 = P[index, 4, 14]
+        P_4_15 = P[index, 4, 15]
+        P_4_16 = P[index, 4, 16]
+        P_4_17 = P[index, 4, 17]
+        P_4_18 = P[index, 4, 18]
+        P_4_19 = P[index, 4, 19]
+        P_4_20 = P[index, 4, 20]
+        P_4_21 = P[index, 4, 21]
+        P_4_22 = P[index, 4, 22]
+        P_4_23 = P[index, 4, 23]
+        P_5_5 = P[index, 5, 5]
+        P_5_6 = P[index, 5, 6]
+        P_5_7 = P[index, 5, 7]
+        P_5_8 = P[index, 5, 8]
+        P_5_9 = P[index, 5, 9]
+        P_5_10 = P[index, 5, 10]
+        P_5_11 = P[index, 5, 11]
+        P_5_12 = P[index, 5, 12]
+        P_5_13 = P[index, 5, 13]
+        P_5_14 = P[index, 5, 14]
+        P_5_15 = P[index, 5, 15]
+        P_5_16 = P[index, 5, 16]
+        P_5_17 = P[index, 5, 17]
+        P_5_18 = P[index, 5, 18]
+        P_5_19 = P[index, 5, 19]
+        P_5_20 = P[index, 5, 20]
+        P_5_21 = P[index, 5, 21]
+        P_5_22 = P[index, 5, 22]
+        P_5_23 = P[index, 5, 23]
+        P_6_6 = P[index, 6, 6]
+        P_6_7 = P[index, 6, 7]
+        P_6_8 = P[index, 6, 8]
+        P_6_9 = P[index, 6, 9]
+        P_6_10 = P[index, 6, 10]
+        P_6_11 = P[index, 6, 11]
+        P_6_12 = P[index, 6, 12]
+        P_6_13 = P[index, 6, 13]
+        P_6_14 = P[index, 6, 14]
+        P_6_15 = P[index, 6, 15]
+        P_6_16 = P[index, 6, 16]
+        P_6_17 = P[index, 6, 17]
+        P_6_18 = P[index, 6, 18]
+        P_6_19 = P[index, 6, 19]
+        P_6_20 = P[index, 6, 20]
+        P_6_21 = P[index, 6, 21]
+        P_6_22 = P[index, 6, 22]
+        P_6_23 = P[index, 6, 23]
+        P_7_22 = P[index, 7, 22]
+        P_7_23 = P[index, 7, 23]
+        P_8_22 = P[index, 8, 22]
+        P_8_23 = P[index, 8, 23]
+        P_9_22 = P[index, 9, 22]
+        P_9_23 = P[index, 9, 23]
+        P_10_22 = P[index, 10, 22]
+        P_10_23 = P[index, 10, 23]
+        P_11_22 = P[index, 11, 22]
+        P_11_23 = P[index, 11, 23]
+        P_12_22 = P[index, 12, 22]
+        P_12_23 = P[index, 12, 23]
+        P_13_22 = P[index, 13, 22]
+        P_13_23 = P[index, 13, 23]
+        P_14_22 = P[index, 14, 22]
+        P_14_23 = P[index, 14, 23]
+        P_15_22 = P[index, 15, 22]
+        P_15_23 = P[index, 15, 23]
+        P_16_22 = P[index, 16, 22]
+        P_16_23 = P[index, 16, 23]
+        P_17_22 = P[index, 17, 22]
+        P_17_23 = P[index, 17, 23]
+        P_18_22 = P[index, 18, 22]
+        P_18_23 = P[index, 18, 23]
+        P_19_22 = P[index, 19, 22]
+        P_19_23 = P[index, 19, 23]
+        P_20_22 = P[index, 20, 22]
+        P_20_23 = P[index, 20, 23]
+        P_21_22 = P[index, 21, 22]
+        P_21_23 = P[index, 21, 23]
+        P_22_22 = P[index, 22, 22]
+        P_22_23 = P[index, 22, 23]
+        P_23_23 = P[index, 23, 23]
+        HK0 = ve - vwe
+        HK1 = vn - vwn
+        HK2 = HK0*q0 - HK1*q3 + q1*vd
+        HK3 = 2*Kaccy[index]
+        HK4 = -HK0*q1 + HK1*q2 + q0*vd
+        HK5 = HK0*q2 + HK1*q1 + q3*vd
+        HK6 = HK0*q3 + HK1*q0 - q2*vd
+        HK7 = q0*q3 - q1*q2
+        HK8 = HK3*HK7
+        HK9 = q0**2 - q1**2 + q2**2 - q3**2
+        HK10 = HK9*Kaccy[index]
+        HK11 = q0*q1 + q2*q3
+        HK12 = 2*HK6
+        HK13 = 2*HK7
+        HK14 = 2*HK2
+        HK15 = 2*HK4
+        HK16 = 2*HK5
+        HK17 = 2*HK11
+        HK18 = HK13*P_0_22 + HK14*P_0_0 + HK15*P_0_1 + HK16*P_0_2 + HK17*P_0_6 + HK9*P_0_5
+        HK19 = Kaccy[index]**2
+        HK20 = -HK9
+        HK21 = -2*HK6
+        HK22 = -2*HK7
+        HK23 = HK13*P_6_22 + HK14*P_0_6 + HK15*P_1_6 + HK16*P_2_6 + HK17*P_6_6 + HK9*P_5_6
+        HK24 = HK13*P_22_22 + HK14*P_0_22 + HK15*P_1_22 + HK16*P_2_22 + HK17*P_6_22 + HK9*P_5_22
+        HK25 = HK13*P_4_22
+        HK26 = HK14*P_0_4 + HK15*P_1_4 + HK16*P_2_4 + HK17*P_4_6 + HK25 + HK9*P_4_5
+        HK27 = HK13*P_5_22 + HK14*P_0_5 + HK15*P_1_5 + HK16*P_2_5 + HK17*P_5_6 + HK9*P_5_5
+        HK28 = HK9*P_5_23
+        HK29 = HK13*P_22_23 + HK14*P_0_23 + HK15*P_1_23 + HK16*P_2_23 + HK17*P_6_23 + HK28
+        HK30 = HK13*P_2_22 + HK14*P_0_2 + HK15*P_1_2 + HK16*P_2_2 + HK17*P_2_6 + HK9*P_2_5
+        HK31 = HK13*P_1_22 + HK14*P_0_1 + HK15*P_1_1 + HK16*P_1_2 + HK17*P_1_6 + HK9*P_1_5
+        HK32 = HK13*P_3_22 + HK14*P_0_3 + HK15*P_1_3 + HK16*P_2_3 + HK17*P_3_6 + HK9*P_3_5
+        HK33 = Kaccy[index]/(-HK13*HK19*(HK20*P_22_23 + HK21*P_3_22 + HK22*P_4_22 + HK24) - HK14*HK19*(HK18 + HK20*P_0_23 + HK21*P_0_3 + HK22*P_0_4) - HK15*HK19*(HK20*P_1_23 + HK21*P_1_3 + HK22*P_1_4 + HK31) - HK16*HK19*(HK20*P_2_23 + HK21*P_2_3 + HK22*P_2_4 + HK30) - HK17*HK19*(HK20*P_6_23 + HK21*P_3_6 + HK22*P_4_6 + HK23) + 2*HK19*HK6*(HK20*P_3_23 + HK21*P_3_3 + HK22*P_3_4 + HK32) + 2*HK19*HK7*(HK20*P_4_23 + HK21*P_3_4 + HK22*P_4_4 + HK26) + HK19*HK9*(HK20*P_23_23 + HK21*P_3_23 + HK22*P_4_23 + HK29) - HK19*HK9*(HK20*P_5_23 + HK21*P_3_5 + HK22*P_4_5 + HK27) - R_ACC[index])
+        H[index, 0] = -HK2*HK3
+        H[index, 1] = -HK3*HK4
+        H[index, 2] = -HK3*HK5
+        H[index, 3] = HK3*HK6
+        H[index, 4] = HK8
+        H[index, 5] = -HK10
+        H[index, 6] = -HK11*HK3
+        H[index, 22] = -HK8
+        H[index, 23] = HK10
+        K[index, 0] = HK33*(-HK12*P_0_3 - HK13*P_0_4 + HK18 - HK9*P_0_23)
+        K[index, 1] = HK33*(-HK12*P_1_3 - HK13*P_1_4 + HK31 - HK9*P_1_23)
+        K[index, 2] = HK33*(-HK12*P_2_3 - HK13*P_2_4 + HK30 - HK9*P_2_23)
+        K[index, 3] = HK33*(-HK12*P_3_3 - HK13*P_3_4 + HK32 - HK9*P_3_23)
+        K[index, 4] = HK33*(-HK12*P_3_4 - HK13*P_4_4 + HK26 - HK9*P_4_23)
+        K[index, 5] = HK33*(-HK12*P_3_5 - HK13*P_4_5 + HK27 - HK28)
+        K[index, 6] = HK33*(-HK12*P_3_6 - HK13*P_4_6 + HK23 - HK9*P_6_23)
+        K[index, 7] = HK33*(-HK12*P_3_7 - HK13*P_4_7 + HK13*P_7_22 + HK14*P_0_7 + HK15*P_1_7 + HK16*P_2_7 + HK17*P_6_7 + HK9*P_5_7 - HK9*P_7_23)
+        K[index, 8] = HK33*(-HK12*P_3_8 - HK13*P_4_8 + HK13*P_8_22 + HK14*P_0_8 + HK15*P_1_8 + HK16*P_2_8 + HK17*P_6_8 + HK9*P_5_8 - HK9*P_8_23)
+        K[index, 9] = HK33*(-HK12*P_3_9 - HK13*P_4_9 + HK13*P_9_22 + HK14*P_0_9 + HK15*P_1_9 + HK16*P_2_9 + HK17*P_6_9 + HK9*P_5_9 - HK9*P_9_23)
+        K[index, 10] = HK33*(-HK12*P_3_10 + HK13*P_10_22 - HK13*P_4_10 + HK14*P_0_10 + HK15*P_1_10 + HK16*P_2_10 + HK17*P_6_10 - HK9*P_10_23 + HK9*P_5_10)
+        K[index, 11] = HK33*(-HK12*P_3_11 + HK13*P_11_22 - HK13*P_4_11 + HK14*P_0_11 + HK15*P_1_11 + HK16*P_2_11 + HK17*P_6_11 - HK9*P_11_23 + HK9*P_5_11)
+        K[index, 12] = HK33*(-HK12*P_3_12 + HK13*P_12_22 - HK13*P_4_12 + HK14*P_0_12 + HK15*P_1_12 + HK16*P_2_12 + HK17*P_6_12 - HK9*P_12_23 + HK9*P_5_12)
+        K[index, 13] = HK33*(-HK12*P_3_13 + HK13*P_13_22 - HK13*P_4_13 + HK14*P_0_13 + HK15*P_1_13 + HK16*P_2_13 + HK17*P_6_13 - HK9*P_13_23 + HK9*P_5_13)
+        K[index, 14] = HK33*(-HK12*P_3_14 + HK13*P_14_22 - HK13*P_4_14 + HK14*P_0_14 + HK15*P_1_14 + HK16*P_2_14 + HK17*P_6_14 - HK9*P_14_23 + HK9*P_5_14)
+        K[index, 15] = HK33*(-HK12*P_3_15 + HK13*P_15_22 - HK13*P_4_15 + HK14*P_0_15 + HK15*P_1_15 + HK16*P_2_15 + HK17*P_6_15 - HK9*P_15_23 + HK9*P_5_15)
+        K[index, 16] = HK33*(-HK12*P_3_16 + HK13*P_16_22 - HK13*P_4_16 + HK14*P_0_16 + HK15*P_1_16 + HK16*P_2_16 + HK17*P_6_16 - HK9*P_16_23 + HK9*P_5_16)
+        K[index, 17] = HK33*(-HK12*P_3_17 + HK13*P_17_22 - HK13*P_4_17 + HK14*P_0_17 + HK15*P_1_17 + HK16*P_2_17 + HK17*P_6_17 - HK9*P_17_23 + HK9*P_5_17)
+        K[index, 18] = HK33*(-HK12*P_3_18 + HK13*P_18_22 - HK13*P_4_18 + HK14*P_0_18 + HK15*P_1_18 + HK16*P_2_18 + HK17*P_6_18 - HK9*P_18_23 + HK9*P_5_18)
+        K[index, 19] = HK33*(-HK12*P_3_19 + HK13*P_19_22 - HK13*P_4_19 + HK14*P_0_19 + HK15*P_1_19 + HK16*P_2_19 + HK17*P_6_19 - HK9*P_19_23 + HK9*P_5_19)
+        K[index, 20] = HK33*(-HK12*P_3_20 + HK13*P_20_22 - HK13*P_4_20 + HK14*P_0_20 + HK15*P_1_20 + HK16*P_2_20 + HK17*P_6_20 - HK9*P_20_23 + HK9*P_5_20)
+        K[index, 21] = HK33*(-HK12*P_3_21 + HK13*P_21_22 - HK13*P_4_21 + HK14*P_0_21 + HK15*P_1_21 + HK16*P_2_21 + HK17*P_6_21 - HK9*P_21_23 + HK9*P_5_21)
+        K[index, 22] = HK33*(-HK12*P_3_22 + HK24 - HK25 - HK9*P_22_23)
+        K[index, 23] = HK33*(-HK12*P_3_23 - HK13*P_4_23 + HK29 - HK9*P_23_23)
+    return H, K
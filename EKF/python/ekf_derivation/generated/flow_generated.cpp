@@ -52,23 +52,6 @@ Hfusion.at<3>() = HK5*HK9;
 Hfusion.at<4>() = HK22*HK4;
 Hfusion.at<5>() = HK27*HK4;
 Hfusion.at<6>() = HK28*HK4;
-Hfusion.at<7>() = 0;
-Hfusion.at<8>() = 0;
-Hfusion.at<9>() = 0;
-Hfusion.at<10>() = 0;
-Hfusion.at<11>() = 0;
-Hfusion.at<12>() = 0;
-Hfusion.at<13>() = 0;
-Hfusion.at<14>() = 0;
-Hfusion.at<15>() = 0;
-Hfusion.at<16>() = 0;
-Hfusion.at<17>() = 0;
-Hfusion.at<18>() = 0;
-Hfusion.at<19>() = 0;
-Hfusion.at<20>() = 0;
-Hfusion.at<21>() = 0;
-Hfusion.at<22>() = 0;
-Hfusion.at<23>() = 0;
 
 
 // Kalman gains
@@ -100,120 +83,90 @@ Kfusion(23) = HK41*(HK22*P(4,23) + HK27*P(5,23) + HK28*P(6,23) + HK29*P(0,23) +
 
 // Y Axis Equations
 // Sub Expressions
-const float HK0 = Tbs(0,1)*q1;
-const float HK1 = Tbs(0,2)*q0;
-const float HK2 = Tbs(0,0)*q2;
-const float HK3 = HK0 + HK1 - HK2;
-const float HK4 = Tbs(0,0)*q3;
-const float HK5 = Tbs(0,1)*q0;
-const float HK6 = Tbs(0,2)*q1;
-const float HK7 = HK4 + HK5 - HK6;
-const float HK8 = Tbs(0,0)*q0;
-const float HK9 = Tbs(0,2)*q2;
-const float HK10 = Tbs(0,1)*q3;
-const float HK11 = -HK10 + HK8 + HK9;
-const float HK12 = HK11*vn + HK3*vd + HK7*ve;
-const float HK13 = 1.0F/range;
-const float HK14 = 2*HK13;
-const float HK15 = Tbs(0,0)*q1 + Tbs(0,1)*q2 + Tbs(0,2)*q3;
-const float HK16 = HK15*vn + HK7*vd;
-const float HK17 = HK16 - HK3*ve;
-const float HK18 = HK15*ve + HK3*vn;
-const float HK19 = -HK11*vd + HK18;
-const float HK20 = HK11*ve + HK15*vd;
-const float HK21 = HK20 - HK7*vn;
-const float HK22 = q0*q3;
-const float HK23 = q1*q2;
-const float HK24 = 2*Tbs(0,1);
-const float HK25 = powf(q1, 2);
-const float HK26 = powf(q2, 2);
-const float HK27 = -HK26;
-const float HK28 = powf(q0, 2);
-const float HK29 = powf(q3, 2);
-const float HK30 = HK28 - HK29;
-const float HK31 = q0*q2;
-const float HK32 = q1*q3;
-const float HK33 = 2*Tbs(0,2);
-const float HK34 = HK33*(HK31 + HK32) + Tbs(0,0)*(HK25 + HK27 + HK30);
-const float HK35 = -HK24*(HK22 - HK23) + HK34;
-const float HK36 = q0*q1;
-const float HK37 = q2*q3;
-const float HK38 = -HK25;
-const float HK39 = 2*Tbs(0,0);
-const float HK40 = HK39*(HK22 + HK23) + Tbs(0,1)*(HK26 + HK30 + HK38);
-const float HK41 = -HK33*(HK36 - HK37) + HK40;
-const float HK42 = HK24*(HK36 + HK37) + Tbs(0,2)*(HK27 + HK28 + HK29 + HK38);
-const float HK43 = -HK39*(HK31 - HK32) + HK42;
-const float HK44 = 2*HK12;
-const float HK45 = 2*HK16 + 2*ve*(-HK0 - HK1 + HK2);
-const float HK46 = 2*HK18 + 2*vd*(HK10 - HK8 - HK9);
-const float HK47 = 2*HK20 + 2*vn*(-HK4 - HK5 + HK6);
-const float HK48 = HK24*(-HK22 + HK23) + HK34;
-const float HK49 = HK33*(-HK36 + HK37) + HK40;
-const float HK50 = HK39*(-HK31 + HK32) + HK42;
-const float HK51 = HK44*P(0,0) + HK45*P(0,1) + HK46*P(0,2) + HK47*P(0,3) + HK48*P(0,4) + HK49*P(0,5) + HK50*P(0,6);
-const float HK52 = powf(range, -2);
-const float HK53 = HK44*P(0,6) + HK45*P(1,6) + HK46*P(2,6) + HK47*P(3,6) + HK48*P(4,6) + HK49*P(5,6) + HK50*P(6,6);
-const float HK54 = HK44*P(0,5) + HK45*P(1,5) + HK46*P(2,5) + HK47*P(3,5) + HK48*P(4,5) + HK49*P(5,5) + HK50*P(5,6);
-const float HK55 = HK44*P(0,4) + HK45*P(1,4) + HK46*P(2,4) + HK47*P(3,4) + HK48*P(4,4) + HK49*P(4,5) + HK50*P(4,6);
-const float HK56 = HK44*P(0,2) + HK45*P(1,2) + HK46*P(2,2) + HK47*P(2,3) + HK48*P(2,4) + HK49*P(2,5) + HK50*P(2,6);
-const float HK57 = 2*HK52;
-const float HK58 = HK44*P(0,3) + HK45*P(1,3) + HK46*P(2,3) + HK47*P(3,3) + HK48*P(3,4) + HK49*P(3,5) + HK50*P(3,6);
-const float HK59 = HK44*P(0,1) + HK45*P(1,1) + HK46*P(1,2) + HK47*P(1,3) + HK48*P(1,4) + HK49*P(1,5) + HK50*P(1,6);
-const float HK60 = HK13/(HK17*HK57*HK59 + HK19*HK56*HK57 + HK21*HK57*HK58 + HK35*HK52*HK55 + HK41*HK52*HK54 + HK43*HK52*HK53 + HK44*HK51*HK52 + R_LOS);
+const float HK0 = -Tbs(0,0)*q2 + Tbs(0,1)*q1 + Tbs(0,2)*q0;
+const float HK1 = Tbs(0,0)*q3 + Tbs(0,1)*q0 - Tbs(0,2)*q1;
+const float HK2 = Tbs(0,0)*q0 - Tbs(0,1)*q3 + Tbs(0,2)*q2;
+const float HK3 = HK0*vd + HK1*ve + HK2*vn;
+const float HK4 = 1.0F/range;
+const float HK5 = 2*HK4;
+const float HK6 = Tbs(0,0)*q1 + Tbs(0,1)*q2 + Tbs(0,2)*q3;
+const float HK7 = HK1*vd + HK6*vn;
+const float HK8 = HK0*vn + HK6*ve;
+const float HK9 = HK2*ve + HK6*vd;
+const float HK10 = q0*q3;
+const float HK11 = q1*q2;
+const float HK12 = HK10 - HK11;
+const float HK13 = 2*Tbs(0,1);
+const float HK14 = powf(q1, 2);
+const float HK15 = powf(q2, 2);
+const float HK16 = -HK15;
+const float HK17 = powf(q0, 2);
+const float HK18 = powf(q3, 2);
+const float HK19 = HK17 - HK18;
+const float HK20 = q0*q2;
+const float HK21 = q1*q3;
+const float HK22 = 2*Tbs(0,2);
+const float HK23 = HK22*(HK20 + HK21) + Tbs(0,0)*(HK14 + HK16 + HK19);
+const float HK24 = q0*q1;
+const float HK25 = q2*q3;
+const float HK26 = HK24 - HK25;
+const float HK27 = -HK14;
+const float HK28 = 2*Tbs(0,0);
+const float HK29 = HK28*(HK10 + HK11) + Tbs(0,1)*(HK15 + HK19 + HK27);
+const float HK30 = HK20 - HK21;
+const float HK31 = HK13*(HK24 + HK25) + Tbs(0,2)*(HK16 + HK17 + HK18 + HK27);
+const float HK32 = 2*HK3;
+const float HK33 = -2*HK0*ve + 2*HK7;
+const float HK34 = -2*HK2*vd + 2*HK8;
+const float HK35 = -2*HK1*vn + 2*HK9;
+const float HK36 = -HK12*HK13 + HK23;
+const float HK37 = -HK22*HK26 + HK29;
+const float HK38 = -HK28*HK30 + HK31;
+const float HK39 = HK32*P(0,0) + HK33*P(0,1) + HK34*P(0,2) + HK35*P(0,3) + HK36*P(0,4) + HK37*P(0,5) + HK38*P(0,6);
+const float HK40 = powf(range, -2);
+const float HK41 = HK32*P(0,6) + HK33*P(1,6) + HK34*P(2,6) + HK35*P(3,6) + HK36*P(4,6) + HK37*P(5,6) + HK38*P(6,6);
+const float HK42 = HK32*P(0,5) + HK33*P(1,5) + HK34*P(2,5) + HK35*P(3,5) + HK36*P(4,5) + HK37*P(5,5) + HK38*P(5,6);
+const float HK43 = HK32*P(0,4) + HK33*P(1,4) + HK34*P(2,4) + HK35*P(3,4) + HK36*P(4,4) + HK37*P(4,5) + HK38*P(4,6);
+const float HK44 = HK32*P(0,2) + HK33*P(1,2) + HK34*P(2,2) + HK35*P(2,3) + HK36*P(2,4) + HK37*P(2,5) + HK38*P(2,6);
+const float HK45 = HK32*P(0,3) + HK33*P(1,3) + HK34*P(2,3) + HK35*P(3,3) + HK36*P(3,4) + HK37*P(3,5) + HK38*P(3,6);
+const float HK46 = HK32*P(0,1) + HK33*P(1,1) + HK34*P(1,2) + HK35*P(1,3) + HK36*P(1,4) + HK37*P(1,5) + HK38*P(1,6);
+const float HK47 = HK4/(HK32*HK39*HK40 + HK33*HK40*HK46 + HK34*HK40*HK44 + HK35*HK40*HK45 + HK36*HK40*HK43 + HK37*HK40*HK42 + HK38*HK40*HK41 + R_LOS);
 
 
 // Observation Jacobians
-Hfusion.at<0>() = -HK12*HK14;
-Hfusion.at<1>() = -HK14*HK17;
-Hfusion.at<2>() = -HK14*HK19;
-Hfusion.at<3>() = -HK14*HK21;
-Hfusion.at<4>() = -HK13*HK35;
-Hfusion.at<5>() = -HK13*HK41;
-Hfusion.at<6>() = -HK13*HK43;
-Hfusion.at<7>() = 0;
-Hfusion.at<8>() = 0;
-Hfusion.at<9>() = 0;
-Hfusion.at<10>() = 0;
-Hfusion.at<11>() = 0;
-Hfusion.at<12>() = 0;
-Hfusion.at<13>() = 0;
-Hfusion.at<14>() = 0;
-Hfusion.at<15>() = 0;
-Hfusion.at<16>() = 0;
-Hfusion.at<17>() = 0;
-Hfusion.at<18>() = 0;
-Hfusion.at<19>() = 0;
-Hfusion.at<20>() = 0;
-Hfusion.at<21>() = 0;
-Hfusion.at<22>() = 0;
-Hfusion.at<23>() = 0;
+Hfusion.at<0>() = -HK3*HK5;
+Hfusion.at<1>() = -HK5*(-HK0*ve + HK7);
+Hfusion.at<2>() = -HK5*(-HK2*vd + HK8);
+Hfusion.at<3>() = -HK5*(-HK1*vn + HK9);
+Hfusion.at<4>() = -HK4*(-HK12*HK13 + HK23);
+Hfusion.at<5>() = -HK4*(-HK22*HK26 + HK29);
+Hfusion.at<6>() = -HK4*(-HK28*HK30 + HK31);
 
 
 // Kalman gains
-Kfusion(0) = -HK51*HK60;
-Kfusion(1) = -HK59*HK60;
-Kfusion(2) = -HK56*HK60;
-Kfusion(3) = -HK58*HK60;
-Kfusion(4) = -HK55*HK60;
-Kfusion(5) = -HK54*HK60;
-Kfusion(6) = -HK53*HK60;
-Kfusion(7) = -HK60*(HK44*P(0,7) + HK45*P(1,7) + HK46*P(2,7) + HK47*P(3,7) + HK48*P(4,7) + HK49*P(5,7) + HK50*P(6,7));
-Kfusion(8) = -HK60*(HK44*P(0,8) + HK45*P(1,8) + HK46*P(2,8) + HK47*P(3,8) + HK48*P(4,8) + HK49*P(5,8) + HK50*P(6,8));
-Kfusion(9) = -HK60*(HK44*P(0,9) + HK45*P(1,9) + HK46*P(2,9) + HK47*P(3,9) + HK48*P(4,9) + HK49*P(5,9) + HK50*P(6,9));
-Kfusion(10) = -HK60*(HK44*P(0,10) + HK45*P(1,10) + HK46*P(2,10) + HK47*P(3,10) + HK48*P(4,10) + HK49*P(5,10) + HK50*P(6,10));
-Kfusion(11) = -HK60*(HK44*P(0,11) + HK45*P(1,11) + HK46*P(2,11) + HK47*P(3,11) + HK48*P(4,11) + HK49*P(5,11) + HK50*P(6,11));
-Kfusion(12) = -HK60*(HK44*P(0,12) + HK45*P(1,12) + HK46*P(2,12) + HK47*P(3,12) + HK48*P(4,12) + HK49*P(5,12) + HK50*P(6,12));
-Kfusion(13) = -HK60*(HK44*P(0,13) + HK45*P(1,13) + HK46*P(2,13) + HK47*P(3,13) + HK48*P(4,13) + HK49*P(5,13) + HK50*P(6,13));
-Kfusion(14) = -HK60*(HK44*P(0,14) + HK45*P(1,14) + HK46*P(2,14) + HK47*P(3,14) + HK48*P(4,14) + HK49*P(5,14) + HK50*P(6,14));
-Kfusion(15) = -HK60*(HK44*P(0,15) + HK45*P(1,15) + HK46*P(2,15) + HK47*P(3,15) + HK48*P(4,15) + HK49*P(5,15) + HK50*P(6,15));
-Kfusion(16) = -HK60*(HK44*P(0,16) + HK45*P(1,16) + HK46*P(2,16) + HK47*P(3,16) + HK48*P(4,16) + HK49*P(5,16) + HK50*P(6,16));
-Kfusion(17) = -HK60*(HK44*P(0,17) + HK45*P(1,17) + HK46*P(2,17) + HK47*P(3,17) + HK48*P(4,17) + HK49*P(5,17) + HK50*P(6,17));
-Kfusion(18) = -HK60*(HK44*P(0,18) + HK45*P(1,18) + HK46*P(2,18) + HK47*P(3,18) + HK48*P(4,18) + HK49*P(5,18) + HK50*P(6,18));
-Kfusion(19) = -HK60*(HK44*P(0,19) + HK45*P(1,19) + HK46*P(2,19) + HK47*P(3,19) + HK48*P(4,19) + HK49*P(5,19) + HK50*P(6,19));
-Kfusion(20) = -HK60*(HK44*P(0,20) + HK45*P(1,20) + HK46*P(2,20) + HK47*P(3,20) + HK48*P(4,20) + HK49*P(5,20) + HK50*P(6,20));
-Kfusion(21) = -HK60*(HK44*P(0,21) + HK45*P(1,21) + HK46*P(2,21) + HK47*P(3,21) + HK48*P(4,21) + HK49*P(5,21) + HK50*P(6,21));
-Kfusion(22) = -HK60*(HK44*P(0,22) + HK45*P(1,22) + HK46*P(2,22) + HK47*P(3,22) + HK48*P(4,22) + HK49*P(5,22) + HK50*P(6,22));
-Kfusion(23) = -HK60*(HK44*P(0,23) + HK45*P(1,23) + HK46*P(2,23) + HK47*P(3,23) + HK48*P(4,23) + HK49*P(5,23) + HK50*P(6,23));
+Kfusion(0) = -HK39*HK47;
+Kfusion(1) = -HK46*HK47;
+Kfusion(2) = -HK44*HK47;
+Kfusion(3) = -HK45*HK47;
+Kfusion(4) = -HK43*HK47;
+Kfusion(5) = -HK42*HK47;
+Kfusion(6) = -HK41*HK47;
+Kfusion(7) = -HK47*(HK32*P(0,7) + HK33*P(1,7) + HK34*P(2,7) + HK35*P(3,7) + HK36*P(4,7) + HK37*P(5,7) + HK38*P(6,7));
+Kfusion(8) = -HK47*(HK32*P(0,8) + HK33*P(1,8) + HK34*P(2,8) + HK35*P(3,8) + HK36*P(4,8) + HK37*P(5,8) + HK38*P(6,8));
+Kfusion(9) = -HK47*(HK32*P(0,9) + HK33*P(1,9) + HK34*P(2,9) + HK35*P(3,9) + HK36*P(4,9) + HK37*P(5,9) + HK38*P(6,9));
+Kfusion(10) = -HK47*(HK32*P(0,10) + HK33*P(1,10) + HK34*P(2,10) + HK35*P(3,10) + HK36*P(4,10) + HK37*P(5,10) + HK38*P(6,10));
+Kfusion(11) = -HK47*(HK32*P(0,11) + HK33*P(1,11) + HK34*P(2,11) + HK35*P(3,11) + HK36*P(4,11) + HK37*P(5,11) + HK38*P(6,11));
+Kfusion(12) = -HK47*(HK32*P(0,12) + HK33*P(1,12) + HK34*P(2,12) + HK35*P(3,12) + HK36*P(4,12) + HK37*P(5,12) + HK38*P(6,12));
+Kfusion(13) = -HK47*(HK32*P(0,13) + HK33*P(1,13) + HK34*P(2,13) + HK35*P(3,13) + HK36*P(4,13) + HK37*P(5,13) + HK38*P(6,13));
+Kfusion(14) = -HK47*(HK32*P(0,14) + HK33*P(1,14) + HK34*P(2,14) + HK35*P(3,14) + HK36*P(4,14) + HK37*P(5,14) + HK38*P(6,14));
+Kfusion(15) = -HK47*(HK32*P(0,15) + HK33*P(1,15) + HK34*P(2,15) + HK35*P(3,15) + HK36*P(4,15) + HK37*P(5,15) + HK38*P(6,15));
+Kfusion(16) = -HK47*(HK32*P(0,16) + HK33*P(1,16) + HK34*P(2,16) + HK35*P(3,16) + HK36*P(4,16) + HK37*P(5,16) + HK38*P(6,16));
+Kfusion(17) = -HK47*(HK32*P(0,17) + HK33*P(1,17) + HK34*P(2,17) + HK35*P(3,17) + HK36*P(4,17) + HK37*P(5,17) + HK38*P(6,17));
+Kfusion(18) = -HK47*(HK32*P(0,18) + HK33*P(1,18) + HK34*P(2,18) + HK35*P(3,18) + HK36*P(4,18) + HK37*P(5,18) + HK38*P(6,18));
+Kfusion(19) = -HK47*(HK32*P(0,19) + HK33*P(1,19) + HK34*P(2,19) + HK35*P(3,19) + HK36*P(4,19) + HK37*P(5,19) + HK38*P(6,19));
+Kfusion(20) = -HK47*(HK32*P(0,20) + HK33*P(1,20) + HK34*P(2,20) + HK35*P(3,20) + HK36*P(4,20) + HK37*P(5,20) + HK38*P(6,20));
+Kfusion(21) = -HK47*(HK32*P(0,21) + HK33*P(1,21) + HK34*P(2,21) + HK35*P(3,21) + HK36*P(4,21) + HK37*P(5,21) + HK38*P(6,21));
+Kfusion(22) = -HK47*(HK32*P(0,22) + HK33*P(1,22) + HK34*P(2,22) + HK35*P(3,22) + HK36*P(4,22) + HK37*P(5,22) + HK38*P(6,22));
+Kfusion(23) = -HK47*(HK32*P(0,23) + HK33*P(1,23) + HK34*P(2,23) + HK35*P(3,23) + HK36*P(4,23) + HK37*P(5,23) + HK38*P(6,23));
 
 
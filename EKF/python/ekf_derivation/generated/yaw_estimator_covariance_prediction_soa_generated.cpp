@@ -0,0 +1,22 @@
+// Equations for covariance matrix prediction of all models
+for (unsigned model_index = 0; model_index < N_MODELS_EKFGSF; model_index++) {
+	const float S0 = cosf(_ekf_gsf_soa.X[2][model_index]);
+	const float S1 = powf(S0, 2);
+	const float S2 = sinf(_ekf_gsf_soa.X[2][model_index]);
+	const float S3 = powf(S2, 2);
+	const float S4 = S0*dvy[model_index] + S2*dvx[model_index];
+	const float S5 = -S4*_ekf_gsf_soa.P[2][2][model_index] + _ekf_gsf_soa.P[0][2][model_index];
+	const float S6 = S0*dvx[model_index] - S2*dvy[model_index];
+	const float S7 = S0*S2;
+	const float S8 = S7*dvxVar - S7*dvyVar + _ekf_gsf_soa.P[0][1][model_index];
+	const float S9 = S6*_ekf_gsf_soa.P[2][2][model_index] + _ekf_gsf_soa.P[1][2][model_index];
+
+
+	_ekf_gsf_soa.P[0][0][model_index] = S1*dvxVar + S3*dvyVar - S4*S5 - S4*_ekf_gsf_soa.P[0][2][model_index] + _ekf_gsf_soa.P[0][0][model_index];
+	_ekf_gsf_soa.P[0][1][model_index] = -S4*_ekf_gsf_soa.P[1][2][model_index] + S5*S6 + S8;
+	_ekf_gsf_soa.P[1][1][model_index] = S1*dvyVar + S3*dvxVar + S6*S9 + S6*_ekf_gsf_soa.P[1][2][model_index] + _ekf_gsf_soa.P[1][1][model_index];
+	_ekf_gsf_soa.P[0][2][model_index] = S5;
+	_ekf_gsf_soa.P[1][2][model_index] = S9;
+	_ekf_gsf_soa.P[2][2][model_index] = _ekf_gsf_soa.P[2][2][model_index] + dazVar;
+}
+
@@ -2,84 +2,61 @@
 
 from sympy import *
 from code_gen import *
-
-# q: quaternion describing rotation from frame 1 to frame 2
-# returns a rotation matrix derived form q which describes the same
-# rotation
-def quat2Rot(q):
-    q0 = q[0]
-    q1 = q[1]
-    q2 = q[2]
-    q3 = q[3]
-
-    Rot = Matrix([[q0**2 + q1**2 - q2**2 - q3**2, 2*(q1*q2 - q0*q3), 2*(q1*q3 + q0*q2)],
-                  [2*(q1*q2 + q0*q3), q0**2 - q1**2 + q2**2 - q3**2, 2*(q2*q3 - q0*q1)],
-                   [2*(q1*q3-q0*q2), 2*(q2*q3 + q0*q1), q0**2 - q1**2 - q2**2 + q3**2]])
-
-    return Rot
-
-def create_cov_matrix(i, j):
-    if j >= i:
-        return Symbol("P(" + str(i) + "," + str(j) + ")", real=True)
-        # legacy array format
-        # return Symbol("P[" + str(i) + "][" + str(j) + "]", real=True)
-    else:
-        return 0
-
-def create_yaw_estimator_cov_matrix():
-    # define a symbolic covariance matrix
-    P = Matrix(3,3,create_cov_matrix)
-
-    for index in range(3):
-        for j in range(3):
-            if index > j:
-                P[index,j] = P[j,index]
-
-    return P
+from derivation_cache import DerivationCache, cached_derivation
+from cost_model import create_report, format_table, format_variant_table, write_report
+from symbolic_backend import BACKENDS, cse, matrix_product
+from derivation_runner import initialise_process, load_derivation_module, print_derivation_result, run_derivation
+from derivation_utils import cached_cse, create_symmetric_cov_matrix, jacobian, quat2Rot, quat_mult
+from profiler import clear_records, format_profile, get_records, profile_stage, write_profile
+from strength_reduction import remove_unused_subexpressions
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from types import SimpleNamespace
+
+# the wind estimator and terrain estimator derivations are run by the same driver
+wind_est_derivation = load_derivation_module(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..',
+                                                          'airdata', 'python', 'wind_est_derivation.py'))
+derive_terrain_flow = load_derivation_module(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                                                          'terrain_flow_derivation', 'derive_terrain_flow.py'))
+
+DERIVATION_GROUPS = ("ekf", "wind", "terrain")
 
 def create_Tbs_matrix(i, j):
     return Symbol("Tbs(" + str(i) + "," + str(j) + ")", real=True)
     # legacy array format
     # return Symbol("Tbs[" + str(i) + "][" + str(j) + "]", real=True)
 
-def quat_mult(p,q):
-    r = Matrix([p[0] * q[0] - p[1] * q[1] - p[2] * q[2] - p[3] * q[3],
-                p[0] * q[1] + p[1] * q[0] + p[2] * q[3] - p[3] * q[2],
-                p[0] * q[2] - p[1] * q[3] + p[2] * q[0] + p[3] * q[1],
-                p[0] * q[3] + p[1] * q[2] - p[2] * q[1] + p[3] * q[0]])
-
-    return r
-
-def create_symmetric_cov_matrix():
-    # define a symbolic covariance matrix
-    P = Matrix(24,24,create_cov_matrix)
-
-    for index in range(24):
-        for j in range(24):
-            if index > j:
-                P[index,j] = P[j,index]
-
-    return P
-
 # generate equations for observation vector innovation variances
+@cached_derivation
 def generate_observation_vector_innovation_variances(P,state,observation,variance,n_obs):
     H = observation.jacobian(state)
     innovation_variance = zeros(n_obs,1)
     for index in range(n_obs):
-        H[index,:] = Matrix([observation[index]]).jacobian(state)
-        innovation_variance[index] = H[index,:] * P * H[index,:].T + Matrix([variance])
+        H[index,:] = jacobian(Matrix([observation[index]]),state)
+        innovation_variance[index] = matrix_product(H[index,:],P,H[index,:].T) + Matrix([variance])
 
     IV_simple = cse(innovation_variance, symbols("IV0:1000"), optimizations='basic')
 
     return IV_simple
 
-# generate equations for observation Jacobian and Kalman gain
-def generate_observation_equations(P,state,observation,variance,varname="HK"):
-    H = Matrix([observation]).jacobian(state)
-    innov_var = H * P * H.T + Matrix([variance])
+# observation Jacobian and Kalman gain of a single observation
+def get_observation_jacobian_and_gain(P,state,observation,variance):
+    H = jacobian(Matrix([observation]),state)
+    innov_var = matrix_product(H,P,H.T) + Matrix([variance])
     assert(innov_var.shape[0] == 1)
     assert(innov_var.shape[1] == 1)
-    K = P * H.T / innov_var[0,0]
+    K = matrix_product(P,H.T) / innov_var[0,0]
+
+    return H, K
+
+# generate equations for observation Jacobian and Kalman gain
+@cached_derivation
+def generate_observation_equations(P,state,observation,variance,varname="HK"):
+    H, K = get_observation_jacobian_and_gain(P,state,observation,variance)
     extension="0:1000"
     var_string = varname+extension
     HK_simple = cse(Matrix([H.transpose(), K]), symbols(var_string), optimizations='basic')
@@ -88,16 +65,17 @@ def generate_observation_equations(P,state,observation,variance,varname="HK"):
 
 # generate equations for observation vector Jacobian and Kalman gain
 # n_obs is the vector dimension and must be >= 2
+@cached_derivation
 def generate_observation_vector_equations(P,state,observation,variance,n_obs):
     K = zeros(24,n_obs)
     H = observation.jacobian(state)
     HK = zeros(n_obs*48,1)
     for index in range(n_obs):
-        H[index,:] = Matrix([observation[index]]).jacobian(state)
-        innov_var = H[index,:] * P * H[index,:].T + Matrix([variance])
+        H[index,:] = jacobian(Matrix([observation[index]]),state)
+        innov_var = matrix_product(H[index,:],P,H[index,:].T) + Matrix([variance])
         assert(innov_var.shape[0] == 1)
         assert(innov_var.shape[1] == 1)
-        K[:,index] = P * H[index,:].T / innov_var[0,0]
+        K[:,index] = matrix_product(P,H[index,:].T) / innov_var[0,0]
         HK[index*48:(index+1)*48,0] = Matrix([H[index,:].transpose(), K[:,index]])
 
     HK_simple = cse(HK, symbols("HK0:1000"), optimizations='basic')
@@ -113,7 +91,7 @@ def write_equations_to_file(equations,code_generator_id,n_obs):
         code_generator_id.print_string("Sub Expressions")
         code_generator_id.write_subexpressions(equations[0])
         code_generator_id.print_string("Observation Jacobians")
-        code_generator_id.write_matrix(Matrix(equations[1][0][0:24]), "Hfusion", False, ".at<", ">()")
+        code_generator_id.write_matrix(Matrix(equations[1][0][0:24]), "Hfusion", False, ".at<", ">()", skip_zeros=True)
         code_generator_id.print_string("Kalman gains")
         code_generator_id.write_matrix(Matrix(equations[1][0][24:]), "Kfusion", False, "(", ")")
     else:
@@ -122,15 +100,14 @@ def write_equations_to_file(equations,code_generator_id,n_obs):
         for axis_index in range(n_obs):
             start_index = axis_index*48
             code_generator_id.print_string("Observation Jacobians - axis %i" % axis_index)
-            code_generator_id.write_matrix(Matrix(equations[1][0][start_index:start_index+24]), "Hfusion", False, ".at<", ">()")
+            code_generator_id.write_matrix(Matrix(equations[1][0][start_index:start_index+24]), "Hfusion", False, ".at<", ">()", skip_zeros=True)
             code_generator_id.print_string("Kalman gains - axis %i" % axis_index)
             code_generator_id.write_matrix(Matrix(equations[1][0][start_index+24:start_index+48]), "Kfusion", False, "(", ")")
 
     return
 
-# derive equations for sequential fusion of optical flow measurements
-def optical_flow_observation(P,state,R_to_body,vx,vy,vz):
-    flow_code_generator = CodeGenerator("./generated/flow_generated.cpp")
+# predicted optical flow line of sight rates about the sensor X and Y axes
+def optical_flow_model(R_to_body,vx,vy,vz):
     range = symbols("range", real=True) # range from camera focal point to ground along sensor Z axis
     obs_var = symbols("R_LOS", real=True) # optical flow line of sight rate measurement noise variance
 
@@ -142,8 +119,16 @@ def optical_flow_observation(P,state,R_to_body,vx,vy,vz):
 
     # Divide by range to get predicted angular LOS rates relative to X and Y
     # axes. Note these are rates in a non-rotating sensor frame
-    losRateSensorX = +relVelSensor[1]/range
-    losRateSensorY = -relVelSensor[0]/range
+    observation = Matrix([relVelSensor[1]/range,-relVelSensor[0]/range])
+
+    return observation, obs_var
+
+# derive equations for sequential fusion of optical flow measurements
+def optical_flow_observation(P,state,R_to_body,vx,vy,vz):
+    flow_code_generator = CodeGenerator("./generated/flow_generated.cpp")
+    observation, obs_var = optical_flow_model(R_to_body,vx,vy,vz)
+    losRateSensorX = observation[0]
+    losRateSensorY = observation[1]
 
     # calculate the observation Jacobian and Kalman gains for the X axis
     equations = generate_observation_equations(P,state,losRateSensorX,obs_var)
@@ -160,7 +145,6 @@ def optical_flow_observation(P,state,R_to_body,vx,vy,vz):
     flow_code_generator.close()
 
     # calculate a combined result for a possible reduction in operations, but will use more stack
-    observation = Matrix([relVelSensor[1]/range,-relVelSensor[0]/range])
     equations = generate_observation_vector_equations(P,state,observation,obs_var,2)
     flow_code_generator_alt = CodeGenerator("./generated/flow_generated_alt.cpp")
     write_equations_to_file(equations,flow_code_generator_alt,2)
@@ -168,13 +152,19 @@ def optical_flow_observation(P,state,R_to_body,vx,vy,vz):
 
     return
 
-# Derive equations for sequential fusion of body frame velocity measurements
-def body_frame_velocity_observation(P,state,R_to_body,vx,vy,vz):
+# predicted velocity in body frame
+def body_frame_velocity_model(R_to_body,vx,vy,vz):
     obs_var = symbols("R_VEL", real=True) # measurement noise variance
 
     # Calculate earth relative velocity in a non-rotating sensor frame
     vel_bf = R_to_body * Matrix([vx,vy,vz])
 
+    return vel_bf, obs_var
+
+# Derive equations for sequential fusion of body frame velocity measurements
+def body_frame_velocity_observation(P,state,R_to_body,vx,vy,vz):
+    vel_bf, obs_var = body_frame_velocity_model(R_to_body,vx,vy,vz)
+
     vel_bf_code_generator = CodeGenerator("./generated/vel_bf_generated.cpp")
     axes = [0,1,2]
     H_obs = vel_bf.jacobian(state) # observation Jacobians
@@ -184,7 +174,7 @@ def body_frame_velocity_observation(P,state,R_to_body,vx,vy,vz):
 
         vel_bf_code_generator.print_string("axis %i" % index)
         vel_bf_code_generator.write_subexpressions(equations[0])
-        vel_bf_code_generator.write_matrix(Matrix(equations[1][0][0:24]), "H_VEL", False, "(", ")")
+        vel_bf_code_generator.write_matrix(Matrix(equations[1][0][0:24]), "H_VEL", False, "(", ")", skip_zeros=True)
         vel_bf_code_generator.write_matrix(Matrix(equations[1][0][24:]), "Kfusion", False, "(", ")")
 
     vel_bf_code_generator.close()
@@ -196,8 +186,8 @@ def body_frame_velocity_observation(P,state,R_to_body,vx,vy,vz):
     write_equations_to_file(equations,vel_bf_code_generator_alt,3)
     vel_bf_code_generator_alt.close()
 
-# derive equations for fusion of dual antenna yaw measurement
-def gps_yaw_observation(P,state,R_to_body):
+# predicted yaw angle of the dual antenna array
+def gps_yaw_model(R_to_body):
     obs_var = symbols("R_YAW", real=True) # measurement noise variance
     ant_yaw = symbols("ant_yaw", real=True) # yaw angle of antenna array axis wrt X body axis
 
@@ -210,6 +200,12 @@ def gps_yaw_observation(P,state,R_to_body):
     # Calculate the yaw angle from the projection
     observation = atan(ant_vec_ef[1]/ant_vec_ef[0])
 
+    return observation, obs_var
+
+# derive equations for fusion of dual antenna yaw measurement
+def gps_yaw_observation(P,state,R_to_body):
+    observation, obs_var = gps_yaw_model(R_to_body)
+
     equations = generate_observation_equations(P,state,observation,obs_var)
 
     gps_yaw_code_generator = CodeGenerator("./generated/gps_yaw_generated.cpp")
@@ -218,14 +214,20 @@ def gps_yaw_observation(P,state,R_to_body):
 
     return
 
-# derive equations for fusion of declination
-def declination_observation(P,state,ix,iy):
+# predicted magnetic declination
+def declination_model(ix,iy):
     obs_var = symbols("R_DECL", real=True) # measurement noise variance
 
     # the predicted measurement is the angle wrt magnetic north of the horizontal
     # component of the measured field
     observation = atan(iy/ix)
 
+    return observation, obs_var
+
+# derive equations for fusion of declination
+def declination_observation(P,state,ix,iy):
+    observation, obs_var = declination_model(ix,iy)
+
     equations = generate_observation_equations(P,state,observation,obs_var)
 
     mag_decl_code_generator = CodeGenerator("./generated/mag_decl_generated.cpp")
@@ -234,8 +236,8 @@ def declination_observation(P,state,ix,iy):
 
     return
 
-# derive equations for fusion of lateral body acceleration (multirotors only)
-def body_frame_accel_observation(P,state,R_to_body,vx,vy,vz,wx,wy):
+# predicted lateral body acceleration (multirotors only)
+def body_frame_accel_model(R_to_body,vx,vy,vz,wx,wy):
     obs_var = symbols("R_ACC", real=True) # measurement noise variance
     Kaccx = symbols("Kaccx", real=True) # measurement noise variance
     Kaccy = symbols("Kaccy", real=True) # measurement noise variance
@@ -257,6 +259,12 @@ def body_frame_accel_observation(P,state,R_to_body,vx,vy,vz,wx,wy):
     # The nonlinear equation will be used to calculate the predicted measurement in implementation
     observation = Matrix([-Kaccx*vrel[0],-Kaccy*vrel[1]])
 
+    return observation, obs_var
+
+# derive equations for fusion of lateral body acceleration (multirotors only)
+def body_frame_accel_observation(P,state,R_to_body,vx,vy,vz,wx,wy):
+    observation, obs_var = body_frame_accel_model(R_to_body,vx,vy,vz,wx,wy)
+
     acc_bf_code_generator  = CodeGenerator("./generated/acc_bf_generated.cpp")
     H = observation.jacobian(state)
     K = zeros(24,2)
@@ -285,50 +293,56 @@ def yaw_observation(P,state,R_to_earth):
     # Calculate the yaw (first rotation) angle from the 321 rotation sequence
     # Provide alternative angle that avoids singularity at +-pi/2 yaw
     angMeasA = atan(R_to_earth[1,0]/R_to_earth[0,0])
-    H_YAW321_A = Matrix([angMeasA]).jacobian(state)
-    H_YAW321_A_simple = cse(H_YAW321_A, symbols('SA0:200'))
+    H_YAW321_A = jacobian(Matrix([angMeasA]),state)
+    H_YAW321_A_simple = cached_cse(H_YAW321_A, symbols('SA0:200'))
 
     angMeasB = pi/2 - atan(R_to_earth[0,0]/R_to_earth[1,0])
-    H_YAW321_B = Matrix([angMeasB]).jacobian(state)
-    H_YAW321_B_simple = cse(H_YAW321_B, symbols('SB0:200'))
+    H_YAW321_B = jacobian(Matrix([angMeasB]),state)
+    H_YAW321_B_simple = cached_cse(H_YAW321_B, symbols('SB0:200'))
 
     yaw_code_generator.print_string("calculate 321 yaw observation matrix - option A")
     yaw_code_generator.write_subexpressions(H_YAW321_A_simple[0])
-    yaw_code_generator.write_matrix(Matrix(H_YAW321_A_simple[1]).T, "H_YAW", False, ".at<", ">()")
+    yaw_code_generator.write_matrix(Matrix(H_YAW321_A_simple[1]).T, "H_YAW", False, ".at<", ">()", skip_zeros=True)
 
     yaw_code_generator.print_string("calculate 321 yaw observation matrix - option B")
     yaw_code_generator.write_subexpressions(H_YAW321_B_simple[0])
-    yaw_code_generator.write_matrix(Matrix(H_YAW321_B_simple[1]).T, "H_YAW", False, ".at<", ">()")
+    yaw_code_generator.write_matrix(Matrix(H_YAW321_B_simple[1]).T, "H_YAW", False, ".at<", ">()", skip_zeros=True)
 
     # Derive observation Jacobian for fusion of 312 sequence yaw measurement
     # Calculate the yaw (first rotation) angle from an Euler 312 sequence
     # Provide alternative angle that avoids singularity at +-pi/2 yaw
     angMeasA = atan(-R_to_earth[0,1]/R_to_earth[1,1])
-    H_YAW312_A = Matrix([angMeasA]).jacobian(state)
-    H_YAW312_A_simple = cse(H_YAW312_A, symbols('SA0:200'))
+    H_YAW312_A = jacobian(Matrix([angMeasA]),state)
+    H_YAW312_A_simple = cached_cse(H_YAW312_A, symbols('SA0:200'))
 
     angMeasB = pi/2 - atan(-R_to_earth[1,1]/R_to_earth[0,1])
-    H_YAW312_B = Matrix([angMeasB]).jacobian(state)
-    H_YAW312_B_simple = cse(H_YAW312_B, symbols('SB0:200'))
+    H_YAW312_B = jacobian(Matrix([angMeasB]),state)
+    H_YAW312_B_simple = cached_cse(H_YAW312_B, symbols('SB0:200'))
 
     yaw_code_generator.print_string("calculate 312 yaw observation matrix - option A")
     yaw_code_generator.write_subexpressions(H_YAW312_A_simple[0])
-    yaw_code_generator.write_matrix(Matrix(H_YAW312_A_simple[1]).T, "H_YAW", False, ".at<", ">()")
+    yaw_code_generator.write_matrix(Matrix(H_YAW312_A_simple[1]).T, "H_YAW", False, ".at<", ">()", skip_zeros=True)
 
     yaw_code_generator.print_string("calculate 312 yaw observation matrix - option B")
     yaw_code_generator.write_subexpressions(H_YAW312_B_simple[0])
-    yaw_code_generator.write_matrix(Matrix(H_YAW312_B_simple[1]).T, "H_YAW", False, ".at<", ">()")
+    yaw_code_generator.write_matrix(Matrix(H_YAW312_B_simple[1]).T, "H_YAW", False, ".at<", ">()", skip_zeros=True)
 
     yaw_code_generator.close()
 
     return
 
-# 3D magnetometer fusion
-def mag_observation_variance(P,state,R_to_body,i,ib):
+# predicted magnetometer measurement
+def mag_model(R_to_body,i,ib):
     obs_var = symbols("R_MAG", real=True)  # magnetometer measurement noise variance
 
     m_mag = R_to_body * i + ib
 
+    return m_mag, obs_var
+
+# 3D magnetometer fusion
+def mag_observation_variance(P,state,R_to_body,i,ib):
+    m_mag, obs_var = mag_model(R_to_body,i,ib)
+
     # separate calculation of innovation variance equations for the y and z axes
     m_mag[0]=0
     innov_var_equations = generate_observation_vector_innovation_variances(P,state,m_mag,obs_var,3)
@@ -340,9 +354,7 @@ def mag_observation_variance(P,state,R_to_body,i,ib):
 
 # 3D magnetometer fusion
 def mag_observation(P,state,R_to_body,i,ib):
-    obs_var = symbols("R_MAG", real=True)  # magnetometer measurement noise variance
-
-    m_mag = R_to_body * i + ib
+    m_mag, obs_var = mag_model(R_to_body,i,ib)
 
     # calculate a separate set of equations for each axis
     mag_code_generator = CodeGenerator("./generated/3Dmag_generated.cpp")
@@ -373,12 +385,18 @@ def mag_observation(P,state,R_to_body,i,ib):
 
     return
 
-# airspeed fusion
-def tas_observation(P,state,vx,vy,vz,wx,wy):
+# predicted true airspeed
+def tas_model(vx,vy,vz,wx,wy):
     obs_var = symbols("R_TAS", real=True) # true airspeed measurement noise variance
 
     observation = sqrt((vx-wx)*(vx-wx)+(vy-wy)*(vy-wy)+vz*vz)
 
+    return observation, obs_var
+
+# airspeed fusion
+def tas_observation(P,state,vx,vy,vz,wx,wy):
+    observation, obs_var = tas_model(vx,vy,vz,wx,wy)
+
     equations = generate_observation_equations(P,state,observation,obs_var)
 
     tas_code_generator = CodeGenerator("./generated/tas_generated.cpp")
@@ -387,14 +405,20 @@ def tas_observation(P,state,vx,vy,vz,wx,wy):
 
     return
 
-# sideslip fusion
-def beta_observation(P,state,R_to_body,vx,vy,vz,wx,wy):
+# predicted sideslip
+def beta_model(R_to_body,vx,vy,vz,wx,wy):
     obs_var = symbols("R_BETA", real=True) # sideslip measurement noise variance
 
     v_rel_ef = Matrix([vx-wx,vy-wy,vz])
     v_rel_bf = R_to_body * v_rel_ef
     observation = v_rel_bf[1]/v_rel_bf[0]
 
+    return observation, obs_var
+
+# sideslip fusion
+def beta_observation(P,state,R_to_body,vx,vy,vz,wx,wy):
+    observation, obs_var = beta_model(R_to_body,vx,vy,vz,wx,wy)
+
     equations = generate_observation_equations(P,state,observation,obs_var)
 
     beta_code_generator = CodeGenerator("./generated/beta_generated.cpp")
@@ -403,6 +427,248 @@ def beta_observation(P,state,R_to_body,vx,vy,vz,wx,wy):
 
     return
 
+# returns the indices of the states which are not changed by the prediction
+# and are not driven by the process noise (biases, magnetic field, wind)
+def get_static_states(A,G):
+    n_states = A.shape[0]
+    identity = eye(n_states)
+
+    return [index for index in range(n_states) if A[index,:] == identity[index,:] and G[index,:].is_zero_matrix]
+
+# compute the upper triangle of A * P * A.T + G * var_u * G.T using the
+# block structure of the state transition matrix, the lower triangle is zero
+def predict_covariance_upper_triangle(P,A,G,var_u):
+    n_states = A.shape[0]
+    static_states = get_static_states(A,G)
+    nonzero_columns = [[column for column in range(n_states) if A[row,column] != 0] for row in range(n_states)]
+
+    # rows of A * P, only required for the states which are not static
+    AP = {}
+    for row in range(n_states):
+        if row not in static_states:
+            AP[row] = [Add(*[A[row,k] * P[k,column] for k in nonzero_columns[row]]) for column in range(n_states)]
+
+    G_var_u = G * var_u
+
+    P_new = zeros(n_states, n_states)
+    for row in range(n_states):
+        for column in range(row, n_states):
+            if row in static_states and column in static_states:
+                P_new[row,column] = P[row,column]
+            elif row in static_states:
+                # P is symmetric, (A * P * A.T)(row,column) = (A * P)(column,row)
+                P_new[row,column] = AP[column][row]
+            elif column in static_states:
+                P_new[row,column] = AP[row][column]
+            else:
+                P_new[row,column] = (Add(*[AP[row][l] * A[column,l] for l in nonzero_columns[column]])
+                                     + Add(*[G_var_u[row,m] * G[column,m] for m in range(G.shape[1])]))
+
+    return P_new
+
+# generate equations for the covariance prediction, the lower triangle is not computed
+@cached_derivation
+def generate_covariance_prediction_equations(P,A,G,var_u):
+    P_new = predict_covariance_upper_triangle(P,A,G,var_u)
+
+    return simplify_covariance_prediction(P_new)
+
+def simplify_covariance_prediction(P_new):
+    # the static state block is a copy of P, only simplify the remaining
+    # entries in the order they are written to file
+    n_states = P_new.shape[0]
+    entries = [(row, column) for column in range(n_states) for row in range(column + 1) if not P_new[row,column].is_Atom]
+    subexpressions, simplified = cse([P_new[row,column] for row, column in entries], symbols("PS0:400"), optimizations='basic')
+
+    P_new_s = P_new.copy()
+    for (row, column), expression in zip(entries, simplified):
+        P_new_s[row,column] = expression
+
+    return subexpressions, [P_new_s]
+
+# covariance prediction
+def predict_covariance(P,A,G,var_u):
+    P_new_simple = generate_covariance_prediction_equations(P,A,G,var_u)
+
+    cov_code_generator = CodeGenerator("./generated/covariance_generated.cpp")
+    cov_code_generator.print_string("Equations for covariance matrix prediction, without process noise!")
+    cov_code_generator.write_subexpressions(P_new_simple[0])
+    cov_code_generator.write_matrix(Matrix(P_new_simple[1]), "nextP", True, "(", ")")
+
+    cov_code_generator.close()
+
+    return
+
+# returns the observation models which are fused one axis at a time, as a
+# list of (name, observation, variance, keyword arguments of the derivation)
+def get_observation_models(model):
+    models = []
+
+    observation, obs_var = tas_model(model.vx,model.vy,model.vz,model.wx,model.wy)
+    models.append(("tas", observation, obs_var, {}))
+
+    observation, obs_var = beta_model(model.R_to_body,model.vx,model.vy,model.vz,model.wx,model.wy)
+    models.append(("beta", observation, obs_var, {}))
+
+    observation, obs_var = declination_model(model.ix,model.iy)
+    models.append(("mag_decl", observation, obs_var, {}))
+
+    observation, obs_var = gps_yaw_model(model.R_to_body)
+    models.append(("gps_yaw", observation, obs_var, {}))
+
+    observation, obs_var = mag_model(model.R_to_body,model.i,model.ib)
+    for index, axis in enumerate("XYZ"):
+        models.append(("3Dmag_" + axis.lower(), observation[index], obs_var, {"varname": "HK" + axis}))
+
+    observation, obs_var = optical_flow_model(model.R_to_body,model.vx,model.vy,model.vz)
+    for index, axis in enumerate("xy"):
+        models.append(("flow_" + axis, observation[index], obs_var, {}))
+
+    observation, obs_var = body_frame_velocity_model(model.R_to_body,model.vx,model.vy,model.vz)
+    for index, axis in enumerate("xyz"):
+        models.append(("vel_bf_" + axis, observation[index], obs_var, {}))
+
+    observation, obs_var = body_frame_accel_model(model.R_to_body,model.vx,model.vy,model.vz,model.wx,model.wy)
+    for index, axis in enumerate("xy"):
+        models.append(("acc_bf_" + axis, observation[index], obs_var, {}))
+
+    return models
+
+# batched NumPy versions of the covariance prediction and the observation fusion
+def generate_python_code(model):
+    python_code_generator = PythonCodeGenerator("./generated/ekf_generated.py", model.state)
+
+    P_new_simple = generate_covariance_prediction_equations(model.P,model.A,model.G,model.var_u)
+    python_code_generator.write_function("predict_covariance", P_new_simple[0], [("nextP", Matrix(P_new_simple[1]), True)],
+                                         "covariance matrix prediction, without process noise")
+
+    for name, observation, obs_var, kwargs in get_observation_models(model):
+        equations = generate_observation_equations(model.P,model.state,observation,obs_var,**kwargs)
+        python_code_generator.write_function("fuse_" + name, equations[0],
+                                             [("H", Matrix(equations[1][0][0:24]), False), ("K", Matrix(equations[1][0][24:]), False)],
+                                             "%s observation Jacobian and Kalman gain" % name)
+
+    python_code_generator.close()
+
+    return
+
+# groups of states which can be inhibited, as indices into the state vector
+STATE_GROUPS = {
+    "mag_field": list(range(16,19)),
+    "mag_bias": list(range(19,22)),
+    "wind": list(range(22,24)),
+}
+
+# reduced variants of the generated code, each variant masks the states of the listed groups
+STATE_MASK_VARIANTS = {
+    "no_wind": ("wind",),
+    "no_mag_bias": ("mag_bias",),
+    "no_mag": ("mag_field","mag_bias"),
+    "no_mag_no_wind": ("mag_field","mag_bias","wind"),
+}
+
+# the variants are not compiled into the EKF, they are only written with --variants
+# to report how many operations masking the states would save, the directory is
+# ignored by git
+STATE_MASK_DIRECTORY = "./generated/state_mask"
+
+def get_masked_states(variant):
+    return sorted(index for group in STATE_MASK_VARIANTS[variant] for index in STATE_GROUPS[group])
+
+# returns the covariance matrix with the rows and columns of the masked states set to zero
+def mask_covariance_matrix(P,masked_states):
+    P_masked = P.copy()
+    for index in masked_states:
+        P_masked[index,:] = zeros(1,P.shape[1])
+        P_masked[:,index] = zeros(P.shape[0],1)
+
+    return P_masked
+
+# returns a copy of the model in which the masked states are inhibited: their values,
+# variances and covariances are zero, so the equations derived from it only contain
+# the terms of the remaining states
+def apply_state_mask(model,variant):
+    masked_states = get_masked_states(variant)
+    zero_states = {model.state[index]: 0 for index in masked_states}
+
+    masked_model = SimpleNamespace(**vars(model))
+    masked_model.P = mask_covariance_matrix(model.P,masked_states)
+    masked_model.A = model.A.xreplace(zero_states)
+    masked_model.G = model.G.xreplace(zero_states)
+    masked_model.masked_states = masked_states
+    masked_model.zero_states = zero_states
+
+    return masked_model
+
+# returns the observation models of a masked model, observations which only depend on
+# masked states, such as the magnetometer without the mag states, can not be fused and
+# are left out
+def get_masked_observation_models(model):
+    models = []
+    for name, observation, obs_var, kwargs in get_observation_models(model):
+        observation = observation.xreplace(model.zero_states)
+        if not observation.has(nan, zoo) and observation.free_symbols & set(model.state):
+            models.append((name, observation, obs_var, kwargs))
+
+    return models
+
+# name of the file with the equations of an observation model, the axes of a model share a file
+def get_observation_file_name(name):
+    return re.sub(r"_[xyz]$", "", name) + "_generated.cpp"
+
+def get_variant_file_name(file_name,variant):
+    return file_name.replace("_generated.cpp", "_%s_generated.cpp" % variant)
+
+# derive the covariance prediction and the observation equations of a state mask variant,
+# returns the generated files and the files of the full equations they replace
+def state_mask_variant(model,variant):
+    masked_model = apply_state_mask(model,variant)
+    os.makedirs(STATE_MASK_DIRECTORY, exist_ok=True)
+    files = []
+
+    P_new_simple = generate_covariance_prediction_equations(masked_model.P,masked_model.A,masked_model.G,masked_model.var_u)
+    file_name = get_variant_file_name("covariance_generated.cpp",variant)
+    cov_code_generator = CodeGenerator(os.path.join(STATE_MASK_DIRECTORY, file_name))
+    cov_code_generator.print_string("Equations for covariance matrix prediction, without process noise!")
+    cov_code_generator.print_string("States %s are masked, their rows and columns of nextP are not written" % ",".join(str(index) for index in masked_model.masked_states))
+    cov_code_generator.write_subexpressions(P_new_simple[0])
+    cov_code_generator.write_matrix(Matrix(P_new_simple[1]), "nextP", True, "(", ")", skip_zeros=True)
+    cov_code_generator.close()
+    files.append((file_name, "covariance_generated.cpp"))
+
+    code_generators = {}
+    for name, observation, obs_var, kwargs in get_masked_observation_models(masked_model):
+        full_file_name = get_observation_file_name(name)
+        if full_file_name not in code_generators:
+            file_name = get_variant_file_name(full_file_name,variant)
+            code_generators[full_file_name] = CodeGenerator(os.path.join(STATE_MASK_DIRECTORY, file_name))
+            files.append((file_name, full_file_name))
+
+        equations = generate_observation_equations(masked_model.P,masked_model.state,observation,obs_var,**kwargs)
+        code_generators[full_file_name].print_string("%s equations" % name)
+        write_equations_to_file(equations,code_generators[full_file_name],1)
+
+    for code_generator in code_generators.values():
+        code_generator.close()
+
+    return {variant: files}
+
+def get_upper_triangle(matrix):
+    return [matrix[row,column] for row in range(matrix.shape[0]) for column in range(row, matrix.shape[1])]
+
+# returns the substitution of the per model inputs of the yaw estimator by
+# the arrays of the structure of arrays layout, indexed by model_index
+def create_yaw_estimator_soa_symbols(P,psi,dvx,dvy):
+    soa_symbols = {psi: Symbol("_ekf_gsf_soa.X[2][model_index]", real=True),
+                   dvx: Symbol("dvx[model_index]", real=True),
+                   dvy: Symbol("dvy[model_index]", real=True)}
+
+    for row in range(3):
+        for column in range(row, 3):
+            soa_symbols[P[row,column]] = Symbol("_ekf_gsf_soa.P[%i][%i][model_index]" % (row, column), real=True)
+
+    return soa_symbols
+
 # yaw estimator prediction and observation code
 def yaw_estimator():
     dt = symbols("dt", real=True)  # dt (sec)
@@ -430,14 +696,14 @@ def yaw_estimator():
     newStateVector = Matrix([velNew,psiNew])
 
     # Calculate state transition matrix
-    F = newStateVector.jacobian(stateVector)
+    F = jacobian(newStateVector,stateVector)
 
     # Derive the covariance prediction equations
     # Error growth in the inertial solution is assumed to be driven by 'noise' in the delta angles and
     # velocities, after bias effects have been removed.
 
     # derive the control(disturbance) influence matrix from IMU noise to state noise
-    G = newStateVector.jacobian(Matrix([dvx,dvy,daz]))
+    G = jacobian(newStateVector,Matrix([dvx,dvy,daz]))
 
     # derive the state error matrix
     distMatrix = Matrix([[dvxVar , 0 , 0],
@@ -447,11 +713,11 @@ def yaw_estimator():
     Q = G * distMatrix * G.T
 
     # propagate covariance matrix
-    P = create_yaw_estimator_cov_matrix()
+    P = create_symmetric_cov_matrix(3)
 
-    P_new = F * P * F.T + Q
+    P_new = matrix_product(F,P,F.T) + Q
 
-    P_new_simple = cse(P_new, symbols("S0:1000"), optimizations='basic')
+    P_new_simple = cached_cse(P_new, symbols("S0:1000"), optimizations='basic')
 
     yaw_estimator_covariance_generator = CodeGenerator("./generated/yaw_estimator_covariance_prediction_generated.cpp")
     yaw_estimator_covariance_generator.print_string("Equations for covariance matrix prediction")
@@ -459,6 +725,16 @@ def yaw_estimator():
     yaw_estimator_covariance_generator.write_matrix(Matrix(P_new_simple[1]), "_ekf_gsf[model_index].P", True)
     yaw_estimator_covariance_generator.close()
 
+    # structure of arrays version updating all models in one loop, the arrays
+    # are indexed by the model last so the compiler can vectorise the loop
+    soa_symbols = create_yaw_estimator_soa_symbols(P,psi,dvx,dvy)
+    soa_loop = ("model_index", "N_MODELS_EKFGSF")
+    yaw_estimator_covariance_soa_generator = CodeGenerator("./generated/yaw_estimator_covariance_prediction_soa_generated.cpp", loop=soa_loop)
+    yaw_estimator_covariance_soa_generator.print_string("Equations for covariance matrix prediction of all models")
+    yaw_estimator_covariance_soa_generator.write_subexpressions([(item[0], item[1].xreplace(soa_symbols)) for item in P_new_simple[0]])
+    yaw_estimator_covariance_soa_generator.write_matrix(Matrix(P_new_simple[1]).xreplace(soa_symbols), "_ekf_gsf_soa.P", True, "[", "][model_index]", "][")
+    yaw_estimator_covariance_soa_generator.close()
+
     # derive the covariance update equation for a NE velocity observation
     velObsVar = symbols("velObsVar", real=True) # velocity observation variance (m/s)^2
     H = Matrix([[1,0,0],
@@ -467,14 +743,18 @@ def yaw_estimator():
     R = Matrix([[velObsVar , 0],
                 [0 , velObsVar]])
 
-    S = H * P * H.T + R
+    S = matrix_product(H,P,H.T) + R
     S_det_inv = 1 / S.det()
     S_inv = S.inv()
-    K = (P * H.T) * S_inv
-    P_new = P - K * S * K.T
+    K = matrix_product(P,H.T,S_inv)
+    P_new = P - matrix_product(K,S,K.T)
 
     # optimize code
-    t, [S_det_inv_s, S_inv_s, K_s, P_new_s] = cse([S_det_inv, S_inv, K, P_new], symbols("t0:1000"), optimizations='basic')
+    t, [S_det_inv_s, S_inv_s, K_s, P_new_s] = cached_cse([S_det_inv, S_inv, K, P_new], symbols("t0:1000"), optimizations='basic')
+
+    # the lower triangles of the symmetric matrices are not written, remove the
+    # intermediate variables which are only used by them
+    t = remove_unused_subexpressions(t, [S_det_inv_s] + get_upper_triangle(Matrix(S_inv_s)) + list(K_s) + get_upper_triangle(Matrix(P_new_s)))
 
     yaw_estimator_observation_generator = CodeGenerator("./generated/yaw_estimator_measurement_update_generated.cpp")
     yaw_estimator_observation_generator.print_string("Intermediate variables")
@@ -489,10 +769,21 @@ def yaw_estimator():
     yaw_estimator_observation_generator.write_matrix(Matrix(P_new_s), "_ekf_gsf[model_index].P", True)
     yaw_estimator_observation_generator.close()
 
-def generate_code():
-    print('Starting code generation:')
-    print('Creating symbolic variables ...')
-
+    yaw_estimator_observation_soa_generator = CodeGenerator("./generated/yaw_estimator_measurement_update_soa_generated.cpp", loop=soa_loop)
+    yaw_estimator_observation_soa_generator.print_string("Equations for NE velocity fusion of all models")
+    yaw_estimator_observation_soa_generator.write_subexpressions([(item[0], item[1].xreplace(soa_symbols)) for item in t])
+    yaw_estimator_observation_soa_generator.print_string("Equations for NE velocity innovation variance's determinante inverse")
+    yaw_estimator_observation_soa_generator.write_matrix(Matrix([[S_det_inv_s]]).xreplace(soa_symbols), "_ekf_gsf_soa.S_det_inverse[model_index]", False)
+    yaw_estimator_observation_soa_generator.print_string("Equations for NE velocity innovation variance inverse")
+    yaw_estimator_observation_soa_generator.write_matrix(Matrix(S_inv_s).xreplace(soa_symbols), "_ekf_gsf_soa.S_inverse", True, "[", "][model_index]", "][")
+    yaw_estimator_observation_soa_generator.print_string("Equations for NE velocity Kalman gain")
+    yaw_estimator_observation_soa_generator.write_matrix(Matrix(K_s).xreplace(soa_symbols), "K", False, "[", "][model_index]", "][")
+    yaw_estimator_observation_soa_generator.print_string("Equations for covariance matrix update")
+    yaw_estimator_observation_soa_generator.write_matrix(Matrix(P_new_s).xreplace(soa_symbols), "_ekf_gsf_soa.P", True, "[", "][model_index]", "][")
+    yaw_estimator_observation_soa_generator.close()
+
+# symbolic state, inputs, state propagation and covariance matrix of the 24 state EKF
+def create_ekf_model():
     dt = symbols("dt", real=True)  # dt
     g = symbols("g", real=True) # gravity constant
 
@@ -576,54 +867,182 @@ def generate_code():
     state_new = Matrix([q_new, v_new, p_new, d_ang_b_new, d_vel_b_new, i_new, ib_new, w_new])
 
     print('Computing state propagation jacobian ...')
-    A = state_new.jacobian(state)
-    G = state_new.jacobian(u)
+    A = jacobian(state_new,state)
+    G = jacobian(state_new,u)
 
     P = create_symmetric_cov_matrix()
 
-    print('Computing covariance propagation ...')
-    P_new = A * P * A.T + G * var_u * G.T
-
-    for index in range(24):
-        for j in range(24):
-            if index > j:
-                P_new[index,j] = 0
+    return SimpleNamespace(dt=dt, g=g, d_ang=d_ang, d_v=d_v, var_u=var_u, q=q,
+                           R_to_earth=R_to_earth, R_to_body=R_to_body,
+                           vx=vx, vy=vy, vz=vz, wx=wx, wy=wy, ix=ix, iy=iy, i=i, ib=ib,
+                           state=state, A=A, G=G, P=P)
+
+# derivations of the EKF as a list of (name, function, arguments), the covariance
+# prediction is listed first as it takes the longest. variants is a list of names
+# of STATE_MASK_VARIANTS for which reduced equations are generated
+def get_derivations(model, variants=None):
+    derivations = [
+        ("covariance prediction", predict_covariance, (model.P,model.A,model.G,model.var_u)),
+        ("heading observation", yaw_observation, (model.P,model.state,model.R_to_earth)),
+        ("gps heading observation", gps_yaw_observation, (model.P,model.state,model.R_to_body)),
+        ("mag observation variance", mag_observation_variance, (model.P,model.state,model.R_to_body,model.i,model.ib)),
+        ("mag observation", mag_observation, (model.P,model.state,model.R_to_body,model.i,model.ib)),
+        ("declination observation", declination_observation, (model.P,model.state,model.ix,model.iy)),
+        ("airspeed observation", tas_observation, (model.P,model.state,model.vx,model.vy,model.vz,model.wx,model.wy)),
+        ("sideslip observation", beta_observation, (model.P,model.state,model.R_to_body,model.vx,model.vy,model.vz,model.wx,model.wy)),
+        ("optical flow observation", optical_flow_observation, (model.P,model.state,model.R_to_body,model.vx,model.vy,model.vz)),
+        ("body frame velocity observation", body_frame_velocity_observation, (model.P,model.state,model.R_to_body,model.vx,model.vy,model.vz)),
+        ("body frame acceleration observation", body_frame_accel_observation, (model.P,model.state,model.R_to_body,model.vx,model.vy,model.vz,model.wx,model.wy)),
+        ("yaw estimator", yaw_estimator, ()),
+    ]
+    for variant in variants or []:
+        derivations.append(("%s state mask variant" % variant, state_mask_variant, (model,variant)))
+
+    return derivations
+
+# groups are the names of DERIVATION_GROUPS to generate, the EKF, the wind estimator and the terrain estimator
+def generate_code(jobs=1, cache=None, report_file=None, strength_reduction=False, python=False, variants=None,
+                  backend="sympy", profile_file=None, trace_memory=True, cprofile_directory=None,
+                  groups=DERIVATION_GROUPS):
+    profiling = (profile_file is not None or cprofile_directory is not None, trace_memory, cprofile_directory)
+    initialise_process(cache, strength_reduction, backend, profiling)
 
-    print('Simplifying covariance propagation ...')
-    P_new_simple = cse(P_new, symbols("PS0:400"), optimizations='basic')
-
-    print('Writing covariance propagation to file ...')
-    cov_code_generator = CodeGenerator("./generated/covariance_generated.cpp")
-    cov_code_generator.print_string("Equations for covariance matrix prediction, without process noise!")
-    cov_code_generator.write_subexpressions(P_new_simple[0])
-    cov_code_generator.write_matrix(Matrix(P_new_simple[1]), "nextP", True, "(", ")")
-
-    cov_code_generator.close()
+    print('Starting code generation:')
+    print('Creating symbolic variables ...')
 
-    # derive autocode for observation methods
-    print('Generating heading observation code ...')
-    yaw_observation(P,state,R_to_earth)
-    print('Generating gps heading observation code ...')
-    gps_yaw_observation(P,state,R_to_body)
-    print('Generating mag observation code ...')
-    mag_observation_variance(P,state,R_to_body,i,ib)
-    mag_observation(P,state,R_to_body,i,ib)
-    print('Generating declination observation code ...')
-    declination_observation(P,state,ix,iy)
-    print('Generating airspeed observation code ...')
-    tas_observation(P,state,vx,vy,vz,wx,wy)
-    print('Generating sideslip observation code ...')
-    beta_observation(P,state,R_to_body,vx,vy,vz,wx,wy)
-    print('Generating optical flow observation code ...')
-    optical_flow_observation(P,state,R_to_body,vx,vy,vz)
-    print('Generating body frame velocity observation code ...')
-    body_frame_velocity_observation(P,state,R_to_body,vx,vy,vz)
-    print('Generating body frame acceleration observation code ...')
-    body_frame_accel_observation(P,state,R_to_body,vx,vy,vz,wx,wy)
-    print('Generating yaw estimator code ...')
-    yaw_estimator()
-    print('Code generation finished!')
+    # derivations are independent of each other and write to separate files,
+    # the EKF derivations are listed first as they take the longest
+    clear_records()
+    derivations = []
+    model = None
+    if "ekf" in groups:
+        with profile_stage("ekf model"):
+            model = create_ekf_model()
+        derivations.extend(get_derivations(model, variants))
+    if "wind" in groups:
+        derivations.extend(wind_est_derivation.get_derivations(wind_est_derivation.create_wind_model()))
+    if "terrain" in groups:
+        derivations.extend(derive_terrain_flow.get_derivations(derive_terrain_flow.create_terrain_model()))
+    profile_records = get_records()
+
+    start_time = time.perf_counter()
+    total_hits = 0
+    total_misses = 0
+    file_costs = {}
+    variant_files = {}
+
+    if jobs > 1:
+        print('Generating code using %i parallel jobs ...' % jobs)
+        with ProcessPoolExecutor(max_workers=jobs, initializer=initialise_process, initargs=(cache, strength_reduction, backend, profiling)) as executor:
+            futures = {executor.submit(run_derivation, derivation): derivation[0] for derivation in derivations}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as error:
+                    for pending_future in futures:
+                        pending_future.cancel()
+                    # the traceback of the worker does not tell which derivation failed
+                    raise RuntimeError('Generating %s code failed: %s' % (futures[future], error)) from error
+                hits, misses = print_derivation_result(result, cache)
+                file_costs.update(result[4])
+                if result[5] is not None:
+                    variant_files.update(result[5])
+                profile_records.extend(result[6])
+                total_hits += hits
+                total_misses += misses
+    else:
+        for derivation in derivations:
+            print('Generating %s code ...' % derivation[0])
+            result = run_derivation(derivation)
+            hits, misses = print_derivation_result(result, cache)
+            file_costs.update(result[4])
+            if result[5] is not None:
+                variant_files.update(result[5])
+            profile_records.extend(result[6])
+            total_hits += hits
+            total_misses += misses
+
+    if python and model is not None:
+        # runs after the C code so the derivations are read from the cache
+        print('Generating python code ...')
+        python_start_time = time.perf_counter()
+        clear_records()
+        with profile_stage("python code"):
+            generate_python_code(model)
+        profile_records.extend(get_records())
+        print('Generated python code in %.1f s' % (time.perf_counter() - python_start_time))
+
+    print('Code generation finished in %.1f s!' % (time.perf_counter() - start_time))
+    if cache is not None:
+        print('Derivation cache hits: %i, misses: %i' % (total_hits, total_misses))
+
+    report = create_report(file_costs, "./generated", variant_files)
+    print('Operation count of the generated code:')
+    print(format_table(report))
+    if variant_files:
+        print('Operation count of the state mask variants:')
+        print(format_variant_table(report))
+    if report_file is not None:
+        write_report(report, report_file)
+
+    if profiling[0]:
+        print('Profile of the derivation stages:')
+        print(format_profile(profile_records))
+        if cprofile_directory is not None:
+            print('cProfile statistics of the derivations written to %s' % cprofile_directory)
+    if profile_file is not None:
+        write_profile(profile_records, profile_file)
 
 
 if __name__ == "__main__":
-    generate_code()
+    parser = argparse.ArgumentParser(description='Generate the EKF observation and covariance prediction code and '
+                                                 'the wind estimator and terrain estimator code')
+    parser.add_argument('--derivations', nargs='+', choices=DERIVATION_GROUPS, default=list(DERIVATION_GROUPS),
+                        help='derivations to run, the wind estimator and terrain estimator code is written to the '
+                             'generated directories next to their scripts (default: all)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of derivations to run in parallel processes (default: 1)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='derive all equations without reading or writing the derivation cache')
+    parser.add_argument('--cache-dir', default='./.cache',
+                        help='directory of the derivation cache (default: ./.cache)')
+    parser.add_argument('--cache-stats', action='store_true',
+                        help='print statistics of the derivation cache and exit')
+    parser.add_argument('--strength-reduction', action='store_true',
+                        help='rewrite powers, repeated divisions and constants in the generated code to cheaper operations')
+    parser.add_argument('--backend', choices=BACKENDS, default='sympy',
+                        help='symbolic backend of the Jacobians, matrix products and cse, symengine is faster but '
+                             'its sub expressions differ from the ones of sympy (default: sympy)')
+    parser.add_argument('--python', action='store_true',
+                        help='also generate batched NumPy functions in ./generated/ekf_generated.py')
+    parser.add_argument('--variants', nargs='*', choices=sorted(STATE_MASK_VARIANTS), metavar='VARIANT',
+                        help='report the operations saved by equations with the states of inhibited state groups masked, '
+                             'all variants if no names are given. The equations are written to %s for the report '
+                             'and verify_generated.py, they are not used by the EKF' % STATE_MASK_DIRECTORY)
+    parser.add_argument('--report', default='./operation_counts.json',
+                        help='file name of the JSON operation count report (default: ./operation_counts.json)')
+    parser.add_argument('--profile', metavar='FILE',
+                        help='write the wall and CPU time, peak memory, expression node count and number of sub '
+                             'expressions of each derivation stage to a JSON file')
+    parser.add_argument('--no-trace-memory', action='store_true',
+                        help='do not trace the peak memory of the profiled stages, tracemalloc slows down the derivations')
+    parser.add_argument('--cprofile-dir', metavar='DIRECTORY',
+                        help='write the cProfile statistics of each derivation to a file in the directory')
+    parser.add_argument('--clear-cache', action='store_true',
+                        help='remove all entries of the derivation cache and exit')
+    args = parser.parse_args()
+    if "ekf" not in args.derivations and (args.python or args.variants is not None):
+        parser.error('--python and --variants require the ekf derivations')
+
+    cache = DerivationCache(args.cache_dir)
+
+    if args.cache_stats:
+        print(json.dumps(cache.get_stats(), indent=4))
+    elif args.clear_cache:
+        cache.clear()
+    else:
+        generate_code(jobs=args.jobs, cache=None if args.no_cache else cache, report_file=args.report,
+                      strength_reduction=args.strength_reduction, python=args.python,
+                      variants=sorted(STATE_MASK_VARIANTS) if args.variants == [] else args.variants,
+                      backend=args.backend, profile_file=args.profile, trace_memory=not args.no_trace_memory,
+                      cprofile_directory=args.cprofile_dir, groups=args.derivations)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Profiling of the stages of the symbolic derivations.
+
+Each derivation is profiled as a stage and within it the Jacobians, matrix
+products, expansions, cse and code generation it runs. A stage records its
+wall and CPU time, the peak memory traced by tracemalloc, the number of
+expression tree nodes of its inputs and outputs and the number of cse sub
+expressions. The calls of a stage within the same derivation are summed up.
+The peak memory of a stage needs tracemalloc.reset_peak() of Python 3.9, it is
+not traced with older versions.
+
+The outermost stages can also be profiled with cProfile, the statistics are
+written to one file per stage which can be read with the pstats module.
+"""
+import cProfile
+import contextlib
+import functools
+import json
+import os
+import re
+import time
+import tracemalloc
+
+from sympy import Basic
+from sympy.matrices import MatrixBase
+
+_enabled = False
+_trace_memory = False
+_cprofile_directory = None
+
+# records of the stages profiled in this process, keyed on the stage path
+_records = {}
+# stages which are running, the innermost last
+_stack = []
+
+def set_profiling(enabled, trace_memory=True, cprofile_directory=None):
+    global _enabled, _trace_memory, _cprofile_directory
+    _enabled = enabled
+    _trace_memory = enabled and trace_memory and hasattr(tracemalloc, "reset_peak")
+    _cprofile_directory = cprofile_directory if enabled else None
+    if _trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def is_profiling():
+    return _enabled
+
+def get_records():
+    return list(_records.values())
+
+def clear_records():
+    _records.clear()
+
+# number of nodes of the expression trees, sub trees shared between expressions
+# are counted each time they are used as they are in the generated code
+def count_nodes(value, sizes=None):
+    if sizes is None:
+        sizes = {}
+
+    if isinstance(value, Basic) and not isinstance(value, MatrixBase):
+        if value not in sizes:
+            sizes[value] = 1 + sum(count_nodes(arg, sizes) for arg in value.args)
+        return sizes[value]
+    if isinstance(value, (MatrixBase, list, tuple)):
+        return sum(count_nodes(item, sizes) for item in value)
+
+    return 0
+
+def get_record(path):
+    if path not in _records:
+        _records[path] = {"derivation": path.split("/")[0],
+                          "stage": path,
+                          "calls": 0,
+                          "wall_time": 0.0,
+                          "cpu_time": 0.0,
+                          "memory_peak": None,
+                          "input_nodes": 0,
+                          "output_nodes": 0,
+                          "max_output_nodes": 0,
+                          "subexpressions": 0}
+
+    return _records[path]
+
+def get_cprofile_file_name(path):
+    return os.path.join(_cprofile_directory, re.sub(r"\W+", "_", path).strip("_") + ".prof")
+
+# profiles the code run inside of the context as a stage of the enclosing stage,
+# the caller can set the "outputs" of the yielded frame to count their nodes
+@contextlib.contextmanager
+def profile_stage(name, inputs=None):
+    if not _enabled:
+        yield {}
+        return
+
+    path = "/".join([frame["path"] for frame in _stack[-1:]] + [name])
+    frame = {"path": path, "outputs": None, "subexpressions": 0, "memory_peak": 0}
+    # created on entry so that the records are listed in the order the stages start
+    record = get_record(path)
+    if _trace_memory:
+        # the peak of the enclosing stages is kept before it is reset for this stage
+        peak = tracemalloc.get_traced_memory()[1]
+        for parent in _stack:
+            parent["memory_peak"] = max(parent["memory_peak"], peak)
+        tracemalloc.reset_peak()
+
+    profile = None
+    if _cprofile_directory is not None and not _stack:
+        profile = cProfile.Profile()
+
+    _stack.append(frame)
+    input_nodes = count_nodes(inputs) if inputs is not None else 0
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    if profile is not None:
+        profile.enable()
+    try:
+        yield frame
+    finally:
+        if profile is not None:
+            profile.disable()
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        _stack.pop()
+
+        record["calls"] += 1
+        record["wall_time"] += wall_time
+        record["cpu_time"] += cpu_time
+        record["input_nodes"] += input_nodes
+        if frame["outputs"] is not None:
+            output_nodes = count_nodes(frame["outputs"])
+            record["output_nodes"] += output_nodes
+            record["max_output_nodes"] = max(record["max_output_nodes"], output_nodes)
+        record["subexpressions"] += frame["subexpressions"]
+        if _stack:
+            _stack[-1]["subexpressions"] += frame["subexpressions"]
+        if _trace_memory:
+            frame["memory_peak"] = max(frame["memory_peak"], tracemalloc.get_traced_memory()[1])
+            record["memory_peak"] = max(record["memory_peak"] or 0, frame["memory_peak"])
+            for parent in _stack:
+                parent["memory_peak"] = max(parent["memory_peak"], frame["memory_peak"])
+        if profile is not None:
+            os.makedirs(_cprofile_directory, exist_ok=True)
+            profile.dump_stats(get_cprofile_file_name(path))
+
+# profiles each call of the decorated function as a stage, the nodes of the
+# arguments and of the returned value are counted. A cse function takes the
+# expressions as first argument and returns the (sub expressions, outputs),
+# only its first argument is counted as input
+def profiled(name, is_cse=False):
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+
+            with profile_stage(name, args[0] if is_cse else list(args)) as frame:
+                value = function(*args, **kwargs)
+                frame["outputs"] = value
+                if is_cse:
+                    frame["subexpressions"] = len(value[0])
+                return value
+
+        return wrapper
+
+    return decorator
+
+def format_profile(records):
+    lines = ["%-60s %6s %9s %9s %10s %12s %8s" % ("stage", "calls", "wall [s]", "cpu [s]", "peak [MB]",
+                                                  "output nodes", "subexpr")]
+    lines.append("-" * len(lines[0]))
+    for record in records:
+        memory = "%10.1f" % (record["memory_peak"] / 1e6) if record["memory_peak"] is not None else "%10s" % "-"
+        # inner stages are indented below their derivation
+        depth = record["stage"].count("/")
+        name = "  " * depth + record["stage"].split("/")[-1]
+        lines.append("%-60s %6i %9.3f %9.3f %s %12i %8i" % (name[:60], record["calls"], record["wall_time"],
+                                                            record["cpu_time"], memory, record["output_nodes"],
+                                                            record["subexpressions"]))
+
+    return "\n".join(lines)
+
+def write_profile(records, file_name):
+    with open(file_name, 'w') as file:
+        json.dump({"stages": records}, file, indent=4)
+        file.write("\n")
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Strength reduction of the cse simplified equations before they are printed
+as C code.
+
+The sub expressions and the outputs computed from them are rewritten to
+use cheaper operations: constants are folded, sub expressions which only
+alias or negate a symbol are substituted, integer powers use the sq()
+helper, inverse square roots use sqrtf, a divisor used more than once is
+replaced by a shared reciprocal and sub expressions which no output uses
+are removed.
+"""
+import random
+import re
+
+from sympy import Float, Function, Pow, Rational, Symbol, sqrt
+
+# square helper, defined in EKF/utils.hpp and generated/util.h
+sq = Function("sq", real=True)
+
+def check_constant(constant):
+    # a division by zero in the derivation is folded to zoo, which can not be printed as C code
+    if not (constant.is_finite and constant.is_real):
+        raise ValueError("constant %s of the generated code is not a finite real number" % constant)
+
+    return constant
+
+def fold_constants(expression):
+    if expression.is_Atom:
+        if expression.is_number:
+            check_constant(expression)
+        if expression.is_Rational and not expression.is_Integer:
+            return Float(expression)
+        return expression
+
+    if expression.is_number:
+        return Float(check_constant(expression.evalf()))
+
+    if expression.is_Pow:
+        # keep the exponent, it selects sqrt, division or powers
+        return Pow(fold_constants(expression.base), expression.exp)
+
+    return expression.func(*[fold_constants(arg) for arg in expression.args])
+
+def is_trivial(expression):
+    if expression.is_Atom:
+        return True
+
+    return expression.is_Mul and len(expression.args) == 2 and expression.args[0] == -1 and expression.args[1].is_Atom
+
+# substitute the sub expressions which are a symbol, a constant or a negated symbol
+def inline_trivial_subexpressions(subexpressions, outputs):
+    replacements = {}
+    kept = []
+    for symbol, expression in subexpressions:
+        expression = expression.xreplace(replacements)
+        if is_trivial(expression):
+            replacements[symbol] = expression
+        else:
+            kept.append((symbol, expression))
+
+    return kept, [expression.xreplace(replacements) for expression in outputs]
+
+def reduce_integer_powers(expression):
+    if expression.is_Atom:
+        return expression
+
+    args = [reduce_integer_powers(arg) for arg in expression.args]
+
+    if expression.is_Pow and expression.exp.is_Integer and abs(expression.exp) >= 2:
+        base = args[0]
+        exponent = abs(int(expression.exp))
+        if exponent == 2:
+            reduced = sq(base)
+        elif exponent == 3 and base.is_Atom:
+            reduced = base * sq(base)
+        elif exponent == 4:
+            reduced = sq(sq(base))
+        else:
+            reduced = Pow(base, exponent)
+
+        return reduced if expression.exp > 0 else Pow(reduced, -1)
+
+    return expression.func(*args)
+
+# print x**(-1/2) as a division by a square root instead of a call to powf
+def reduce_inverse_square_roots(expression):
+    if expression.is_Atom:
+        return expression
+
+    args = [reduce_inverse_square_roots(arg) for arg in expression.args]
+
+    if expression.is_Pow and expression.exp == Rational(-1, 2):
+        return Pow(sqrt(args[0]), -1, evaluate=False)
+
+    return expression.func(*args)
+
+def get_divisors(expression, divisors):
+    if expression.is_Atom:
+        return divisors
+
+    if expression.is_Pow and expression.exp == -1 and not expression.base.is_Number:
+        divisors.append(expression.base)
+
+    for arg in expression.args:
+        get_divisors(arg, divisors)
+
+    return divisors
+
+# compute the reciprocal of a divisor used more than once as a new sub expression
+def share_reciprocals(subexpressions, outputs, prefix):
+    divisors = []
+    for expression in [item[1] for item in subexpressions] + outputs:
+        get_divisors(expression, divisors)
+
+    repeated = []
+    for divisor in divisors:
+        if divisors.count(divisor) > 1 and divisor not in repeated:
+            repeated.append(divisor)
+
+    if not repeated:
+        return subexpressions, outputs
+
+    used_names = {str(item[0]) for item in subexpressions}
+    definitions = {item[0]: index for index, item in enumerate(subexpressions)}
+    replacements = {}
+    insertions = {}
+    for divisor in repeated:
+        index = len(replacements)
+        while prefix + "_inv" + str(index) in used_names:
+            index += 1
+        reciprocal = Symbol(prefix + "_inv" + str(index), real=True)
+        used_names.add(str(reciprocal))
+        replacements[Pow(divisor, -1)] = reciprocal
+
+        # define the reciprocal after the last sub expression the divisor uses
+        position = max([definitions[symbol] + 1 for symbol in divisor.free_symbols if symbol in definitions], default=0)
+        insertions.setdefault(position, []).append((reciprocal, Pow(divisor, -1)))
+
+    reduced = []
+    for index in range(len(subexpressions) + 1):
+        reduced.extend(insertions.get(index, []))
+        if index < len(subexpressions):
+            symbol, expression = subexpressions[index]
+            reduced.append((symbol, expression.xreplace(replacements)))
+
+    return reduced, [expression.xreplace(replacements) for expression in outputs]
+
+def remove_unused_subexpressions(subexpressions, outputs):
+    used = set()
+    for expression in outputs:
+        used |= expression.free_symbols
+
+    kept = []
+    for symbol, expression in reversed(subexpressions):
+        if symbol in used:
+            kept.append((symbol, expression))
+            used |= expression.free_symbols
+
+    return list(reversed(kept))
+
+def get_prefix(subexpressions):
+    if subexpressions:
+        match = re.match(r"[A-Za-z_]+", str(subexpressions[0][0]))
+        if match:
+            return match.group(0)
+
+    return "S"
+
+def reduce_strength(subexpressions, outputs):
+    prefix = get_prefix(subexpressions)
+
+    subexpressions = [(symbol, fold_constants(expression)) for symbol, expression in subexpressions]
+    outputs = [fold_constants(expression) for expression in outputs]
+
+    subexpressions, outputs = inline_trivial_subexpressions(subexpressions, outputs)
+
+    subexpressions = [(symbol, reduce_integer_powers(expression)) for symbol, expression in subexpressions]
+    outputs = [reduce_integer_powers(expression) for expression in outputs]
+
+    subexpressions, outputs = share_reciprocals(subexpressions, outputs, prefix)
+
+    subexpressions = remove_unused_subexpressions(subexpressions, outputs)
+
+    subexpressions = [(symbol, reduce_inverse_square_roots(expression)) for symbol, expression in subexpressions]
+    outputs = [reduce_inverse_square_roots(expression) for expression in outputs]
+
+    return subexpressions, outputs
+
+def evaluate(subexpressions, outputs, values):
+    values = dict(values)
+    for symbol, expression in subexpressions:
+        values[symbol] = expression.replace(sq, lambda x: x**2).xreplace(values).evalf()
+
+    return [complex(expression.replace(sq, lambda x: x**2).xreplace(values).evalf()) for expression in outputs]
+
+# evaluate both sets of equations at random inputs and check that the outputs match
+def check_strength_reduction(subexpressions, outputs, reduced_subexpressions, reduced_outputs, samples=3, tolerance=1e-9):
+    temporaries = {item[0] for item in subexpressions} | {item[0] for item in reduced_subexpressions}
+    inputs = set()
+    for expression in [item[1] for item in subexpressions] + list(outputs):
+        inputs |= expression.free_symbols
+    inputs = sorted(inputs - temporaries, key=str)
+
+    generator = random.Random(0)
+    for sample in range(samples):
+        values = {symbol: Float(generator.uniform(0.5, 1.5)) for symbol in inputs}
+        expected = evaluate(subexpressions, outputs, values)
+        result = evaluate(reduced_subexpressions, reduced_outputs, values)
+        for index in range(len(expected)):
+            error = abs(result[index] - expected[index])
+            assert error <= tolerance * max(1.0, abs(expected[index])), \
+                "strength reduction changed output %i: %s != %s" % (index, result[index], expected[index])
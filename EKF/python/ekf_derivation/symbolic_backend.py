@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Symbolic backends of the derivations.
+
+The sympy backend is the reference. The symengine backend converts the
+expressions to SymEngine for the Jacobians, matrix products, expansions and
+the common sub expression elimination, which are much faster there, and
+returns sympy expressions for the code generation. Its sub expressions differ
+from the ones of sympy's cse, the generated code is equivalent but not
+identical to the code of the sympy backend.
+"""
+import re
+
+import sympy
+from sympy.matrices import MatrixBase
+from profiler import profiled
+
+try:
+    import symengine
+except ImportError:
+    symengine = None
+
+BACKENDS = ("sympy", "symengine")
+
+_backend = "sympy"
+
+def set_backend(name):
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError("unknown symbolic backend: %s" % name)
+    if name == "symengine" and symengine is None:
+        raise ImportError("the symengine backend requires the symengine package: pip3 install symengine")
+    _backend = name
+
+def get_backend():
+    return _backend
+
+# identifies the backend in the keys of the derivation cache
+def get_backend_id():
+    if _backend == "symengine":
+        return "symengine " + symengine.__version__
+
+    return _backend
+
+def get_symbols_by_name(expressions):
+    symbols = {}
+    for expression in expressions:
+        for symbol in sympy.sympify(expression).free_symbols:
+            symbols[symbol.name] = symbol
+
+    return symbols
+
+# SymEngine has no assumptions, the symbols of a converted expression are
+# replaced by the symbols of the same name of the original expressions
+def to_sympy(expression, symbols_by_name):
+    expression = sympy.sympify(expression)
+    replacements = {symbol: symbols_by_name[symbol.name] for symbol in expression.free_symbols
+                    if symbol.name in symbols_by_name}
+
+    return expression.xreplace(replacements)
+
+def to_sympy_matrix(matrix, symbols_by_name):
+    return sympy.Matrix(matrix.rows, matrix.cols, [to_sympy(item, symbols_by_name) for item in matrix])
+
+@profiled("jacobian")
+def jacobian(expressions, variables):
+    expressions = sympy.Matrix(expressions)
+    variables = sympy.Matrix(variables)
+    if _backend == "sympy":
+        return expressions.jacobian(variables)
+
+    symbols_by_name = get_symbols_by_name(list(expressions) + list(variables))
+    result = symengine.Matrix(list(expressions)).jacobian(symengine.Matrix(list(variables)))
+
+    return to_sympy_matrix(result, symbols_by_name)
+
+@profiled("matrix product")
+def matrix_product(*factors):
+    if _backend == "sympy":
+        result = factors[0]
+        for factor in factors[1:]:
+            result = result * factor
+        return result
+
+    symbols_by_name = get_symbols_by_name([item for factor in factors for item in factor])
+    result = symengine.Matrix(factors[0].tolist())
+    for factor in factors[1:]:
+        result = result * symengine.Matrix(factor.tolist())
+
+    return to_sympy_matrix(result, symbols_by_name)
+
+@profiled("expand")
+def expand(expression):
+    if _backend == "sympy":
+        return sympy.expand(expression)
+
+    return to_sympy(symengine.expand(symengine.sympify(expression)), get_symbols_by_name([expression]))
+
+# common sub expression elimination with the same arguments and result as sympy.cse,
+# matrices are returned as matrices of the same shape
+@profiled("cse", is_cse=True)
+def cse(expressions, symbols, optimizations=None):
+    if _backend == "sympy":
+        return sympy.cse(expressions, symbols, optimizations=optimizations)
+
+    if isinstance(expressions, MatrixBase):
+        items = [expressions]
+    else:
+        items = list(expressions)
+    shapes = [item.shape if isinstance(item, MatrixBase) else None for item in items]
+    flat = []
+    for item in items:
+        flat.extend(list(item) if isinstance(item, MatrixBase) else [item])
+
+    symbols_by_name = get_symbols_by_name(flat)
+    if any(re.match(r"^x\d+$", name) for name in symbols_by_name):
+        raise ValueError("the inputs use the names of the symengine sub expressions")
+
+    replacements, reduced = symengine.cse([symengine.sympify(expression) for expression in flat])
+
+    # rename the sub expressions x0, x1, ... in the order they are defined
+    symbols = iter(symbols)
+    for temporary, _ in replacements:
+        try:
+            symbols_by_name[temporary.name] = next(symbols)
+        except StopIteration:
+            raise ValueError("the symbols are fewer than the %i sub expressions" % len(replacements)) from None
+
+    subexpressions = [(symbols_by_name[temporary.name], to_sympy(expression, symbols_by_name))
+                      for temporary, expression in replacements]
+    reduced = [to_sympy(expression, symbols_by_name) for expression in reduced]
+
+    result = []
+    for shape in shapes:
+        if shape is None:
+            result.append(reduced.pop(0))
+        else:
+            size = shape[0] * shape[1]
+            result.append(sympy.Matrix(shape[0], shape[1], reduced[:size]))
+            reduced = reduced[size:]
+
+    return subexpressions, result
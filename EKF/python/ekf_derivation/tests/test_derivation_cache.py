@@ -0,0 +1,56 @@
+import sys
+
+from sympy import Symbol
+
+import derivation_cache
+from derivation_cache import DerivationCache, get_source_hash
+
+x = Symbol("x", real=True)
+
+def write_module(directory, source):
+    (directory / "cached_test_derivation.py").write_text(source)
+    get_source_hash.cache_clear()
+
+def test_key_of_same_inputs_is_equal(tmp_path):
+    cache = DerivationCache(str(tmp_path))
+
+    assert cache.make_key("main", "f", (x,), {}) == cache.make_key("main", "f", (x,), {})
+    assert cache.make_key("main", "f", (x,), {}) != cache.make_key("main", "f", (2*x,), {})
+    assert cache.make_key("main", "f", (x,), {}) != cache.make_key("main", "g", (x,), {})
+    assert cache.make_key("main", "f", (x,), {}) != cache.make_key("main", "f", (x,), {"varname": "HK"})
+
+def test_key_changes_with_the_source_of_the_derivation(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    cache = DerivationCache(str(tmp_path))
+
+    write_module(tmp_path, "def f(x):\n    return x\n")
+    key = cache.make_key("cached_test_derivation", "f", (x,), {})
+    write_module(tmp_path, "def f(x):\n    return 2*x\n")
+    assert cache.make_key("cached_test_derivation", "f", (x,), {}) != key
+
+    sys.modules.pop("cached_test_derivation")
+
+def test_key_contains_the_source_of_the_shared_modules(tmp_path, monkeypatch):
+    module_names = []
+    monkeypatch.setattr(derivation_cache, "get_source_hash", lambda names: module_names.extend(names) or "")
+
+    DerivationCache(str(tmp_path)).make_key("main", "f", (x,), {})
+    assert {"main", "derivation_utils", "symbolic_backend", "derivation_cache"} <= set(module_names)
+
+def test_cached_derivation_is_read_from_the_cache(tmp_path):
+    calls = []
+
+    @derivation_cache.cached_derivation
+    def derivation(expression):
+        calls.append(expression)
+        return expression + 1
+
+    derivation_cache.set_cache(DerivationCache(str(tmp_path)))
+    try:
+        assert derivation(x) == x + 1
+        assert derivation(x) == x + 1
+        assert derivation_cache.get_counters() == (1, 1)
+    finally:
+        derivation_cache.set_cache(None)
+
+    assert calls == [x]
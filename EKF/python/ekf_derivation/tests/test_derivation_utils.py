@@ -0,0 +1,51 @@
+import sys
+
+from sympy import Float, ImmutableMatrix, Integer, Matrix, Symbol
+
+from derivation_runner import load_derivation_module
+from derivation_utils import jacobian, memoised, quat2Rot
+
+def test_memo_returns_the_result_of_equal_arguments():
+    calls = []
+
+    @memoised
+    def scale(expression, factor):
+        calls.append(expression)
+        return ImmutableMatrix([expression * factor])
+
+    x = Symbol("x", real=True)
+    assert scale(x, 2) is scale(Symbol("x", real=True), 2)
+    assert calls == [x]
+
+def test_memo_keys_on_types_and_assumptions():
+    @memoised
+    def identity(expression):
+        return ImmutableMatrix([expression])
+
+    assert identity(Integer(2))[0].is_Integer
+    assert identity(Float(2.0))[0].is_Float
+    assert identity(Symbol("x"))[0].is_real is None
+    assert identity(Symbol("x", real=True))[0].is_real
+
+def test_memoised_results_can_not_be_changed_by_the_caller():
+    q = Matrix([Symbol("q%i" % index, real=True) for index in range(4)])
+    rotation = quat2Rot(q)
+    rotation[0, 0] = 0
+
+    assert quat2Rot(q)[0, 0] != 0
+
+def test_jacobian():
+    x, y = Symbol("x", real=True), Symbol("y", real=True)
+
+    assert jacobian(Matrix([x * y, x**2]), Matrix([x, y])) == Matrix([[y, x], [2 * x, 0]])
+
+def test_derivation_module_is_loaded_once(tmp_path):
+    file_name = tmp_path / "loaded_test_derivation.py"
+    file_name.write_text("from derivation_utils import jacobian\nvalue = []\n")
+
+    module = load_derivation_module(str(file_name))
+    try:
+        assert sys.modules["loaded_test_derivation"] is module
+        assert load_derivation_module(str(file_name)) is module
+    finally:
+        del sys.modules["loaded_test_derivation"]
@@ -0,0 +1,145 @@
+import os
+import shutil
+import sys
+import types
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from main import create_ekf_model, get_observation_models
+from verify_generated import (create_random_inputs, get_inputs, load_python_module, load_replay_states,
+                              verify_covariance, verify_observation)
+
+GENERATED_MODULE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "generated", "ekf_generated.py")
+REPLAY_STATES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "test",
+                             "change_indication", "iris_gps.csv")
+N_SAMPLES = 100
+TOLERANCE = 1e-9
+
+# the observation models compiled by the replay state test, the others take
+# too long to derive and compile for a unit test
+COMPILED_MODELS = ("tas", "mag_decl", "3Dmag_x", "vel_bf_x")
+COMPILED_TOLERANCE = 1e-3
+
+@pytest.fixture(scope="module")
+def model():
+    return create_ekf_model()
+
+@pytest.fixture(scope="module")
+def observation_models(model):
+    return get_observation_models(model)
+
+@pytest.fixture(scope="module")
+def inputs(model, observation_models):
+    input_names = set(str(symbol) for symbol in get_inputs(list(model.A) + list(model.G) + list(model.var_u)))
+    for name, observation, obs_var, kwargs in observation_models:
+        input_names |= set(str(symbol) for symbol in get_inputs([observation, obs_var]))
+
+    return create_random_inputs(np.random.default_rng(0), N_SAMPLES, [str(symbol) for symbol in model.state],
+                                sorted(input_names))
+
+def load_generated_module(monkeypatch, numba):
+    # None makes the import of numba fail
+    monkeypatch.setitem(sys.modules, "numba", numba)
+
+    return load_python_module(GENERATED_MODULE)
+
+def get_options(module):
+    return SimpleNamespace(compiler=None, python_module=module, strength_reduction=False, symbolic=False)
+
+# the vectorised functions and the kernels are compared against the lambdified
+# Jacobian and the Kalman gain computed from it
+def test_observation_functions_match_the_symbolic_models(monkeypatch, model, observation_models, inputs):
+    module = load_generated_module(monkeypatch, None)
+    values, states, P = inputs
+
+    for name, observation, obs_var, kwargs in observation_models:
+        result = verify_observation(None, model, name, observation, obs_var, kwargs, values, states, P, N_SAMPLES,
+                                    get_options(module))
+        assert max(result["python_outputs"].values()) < TOLERANCE, name
+
+def test_covariance_prediction_matches_the_symbolic_model(monkeypatch, model, inputs):
+    module = load_generated_module(monkeypatch, None)
+    values, states, P = inputs
+
+    result = verify_covariance(None, model, values, states, P, N_SAMPLES, get_options(module))
+    assert max(result["python_outputs"].values()) < TOLERANCE
+
+def test_kernels_are_plain_functions_without_numba(monkeypatch):
+    module = load_generated_module(monkeypatch, None)
+
+    assert module.jit(len) is len
+    assert isinstance(module.fuse_tas_kernel, types.FunctionType)
+
+def test_kernels_are_compiled_with_numba(monkeypatch):
+    compiled = []
+
+    def njit(function):
+        compiled.append(function.__name__)
+        return function
+
+    module = load_generated_module(monkeypatch, SimpleNamespace(njit=njit))
+
+    # the loops are compiled, not the wrappers which broadcast their inputs
+    assert "_predict_covariance_kernel" in compiled
+    assert "_fuse_tas_kernel" in compiled
+    assert all(name.startswith("_") and name.endswith("_kernel") for name in compiled)
+
+# a scalar input is used for all filters of the batch
+def check_scalar_inputs(module, inputs):
+    values, states, P = inputs
+    Tbs = np.eye(3)
+    R_LOS = values["R_LOS"][0]
+    range_ = values["range"][0]
+
+    expected = module.fuse_flow_x(states, P, np.broadcast_to(Tbs, (N_SAMPLES, 3, 3)), np.full(N_SAMPLES, R_LOS),
+                                  np.full(N_SAMPLES, range_))
+    for function in (module.fuse_flow_x, module.fuse_flow_x_kernel):
+        for result, expected_result in zip(function(states, P, Tbs, R_LOS, range_), expected):
+            np.testing.assert_allclose(result, expected_result, rtol=1e-12)
+
+    for expected_result, result in zip(module.fuse_tas(states, P, 0.5), module.fuse_tas_kernel(states, P, 0.5)):
+        np.testing.assert_allclose(result, expected_result, rtol=1e-12)
+
+def test_kernels_take_scalar_inputs(monkeypatch, inputs):
+    check_scalar_inputs(load_generated_module(monkeypatch, None), inputs)
+
+def test_compiled_kernels_take_scalar_inputs(inputs):
+    pytest.importorskip("numba")
+    check_scalar_inputs(load_python_module(GENERATED_MODULE), inputs)
+
+def test_compiled_kernels_match_the_vectorised_functions(monkeypatch, inputs):
+    pytest.importorskip("numba")
+    module = load_python_module(GENERATED_MODULE)
+    values, states, P = inputs
+    R_TAS = values["R_TAS"]
+
+    for expected, result in zip(module.fuse_tas(states, P, R_TAS), module.fuse_tas_kernel(states, P, R_TAS)):
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+# the generated functions are checked against the generated C++ code compiled
+# with the local compiler, at the states and variances of the iris_gps replay
+# written to change_indication by the C++ replay test
+@pytest.mark.skipif(shutil.which(os.environ.get("CXX", "c++")) is None, reason="no C++ compiler")
+def test_functions_match_the_compiled_code_at_the_replay_states(monkeypatch, tmp_path, model, observation_models):
+    module = load_generated_module(monkeypatch, None)
+    input_names = set(str(symbol) for symbol in get_inputs(list(model.A) + list(model.G) + list(model.var_u)))
+    for name, observation, obs_var, kwargs in observation_models:
+        input_names |= set(str(symbol) for symbol in get_inputs([observation, obs_var]))
+    replay = load_replay_states(REPLAY_STATES)
+    values, states, P = create_random_inputs(np.random.default_rng(0), N_SAMPLES,
+                                             [str(symbol) for symbol in model.state], sorted(input_names), replay)
+    options = SimpleNamespace(compiler=os.environ.get("CXX", "c++"), python_module=module, strength_reduction=False,
+                              symbolic=False)
+
+    assert len(replay[0]) > 100
+    for name, observation, obs_var, kwargs in observation_models:
+        if name not in COMPILED_MODELS:
+            continue
+        result = verify_observation(str(tmp_path), model, name, observation, obs_var, kwargs, values, states, P,
+                                    N_SAMPLES, options)
+        # the compiled code runs in single precision
+        assert max(result["outputs"].values()) < COMPILED_TOLERANCE, name
+        assert max(result["python_outputs"].values()) < COMPILED_TOLERANCE, name
+
@@ -0,0 +1,129 @@
+import pytest
+from sympy import Float, Pow, Rational, Symbol, ccode, pi, sqrt, symbols
+from sympy.codegen.ast import float32, real
+
+from strength_reduction import (check_strength_reduction, fold_constants, inline_trivial_subexpressions,
+                                reduce_integer_powers, reduce_inverse_square_roots, reduce_strength,
+                                remove_unused_subexpressions, share_reciprocals, sq)
+
+x, y, z = symbols("x y z", real=True)
+S0, S1, S2, S3 = symbols("S0:4", real=True)
+
+def test_squares_and_fourth_powers_use_sq():
+    assert reduce_integer_powers(x**2) == sq(x)
+    assert reduce_integer_powers(x**4) == sq(sq(x))
+    assert reduce_integer_powers((x + y)**2) == sq(x + y)
+
+def test_cube_of_a_symbol_is_a_product():
+    assert reduce_integer_powers(x**3) == x*sq(x)
+
+def test_cube_of_a_compound_base_is_kept():
+    # x*sq(x) would evaluate the base twice
+    assert reduce_integer_powers((x + y)**3) == (x + y)**3
+
+def test_powers_inside_the_base_are_reduced():
+    assert reduce_integer_powers((x**2 + y)**2) == sq(sq(x) + y)
+    assert reduce_integer_powers(sqrt(x**2 + y**4)) == sqrt(sq(x) + sq(sq(y)))
+
+def test_higher_powers_are_kept():
+    assert reduce_integer_powers(x**5) == x**5
+
+def test_negative_exponents_divide_by_the_reduced_power():
+    assert reduce_integer_powers(x**-2) == 1/sq(x)
+    assert reduce_integer_powers(x**-3) == 1/(x*sq(x))
+    assert reduce_integer_powers(x**-4) == 1/sq(sq(x))
+    assert reduce_integer_powers(x**-1) == 1/x
+
+def test_non_integer_exponents_are_kept():
+    assert reduce_integer_powers(x**Rational(3, 2)) == x**Rational(3, 2)
+    assert reduce_integer_powers(x**Float(2.0)) == x**Float(2.0)
+    assert reduce_integer_powers(x**y) == x**y
+
+def test_inverse_square_root_is_a_division_by_sqrt():
+    reduced = reduce_inverse_square_roots(x**Rational(-1, 2))
+
+    assert reduced.is_Pow and reduced.exp == -1
+    assert reduced.base == sqrt(x)
+
+@pytest.mark.parametrize("expression", [y*(x + z)**Rational(-1, 2), y + (x + z)**Rational(-1, 2)])
+def test_inverse_square_root_is_not_printed_as_powf(expression):
+    code = ccode(reduce_inverse_square_roots(expression), type_aliases={real: float32})
+
+    assert "sqrtf(" in code
+    assert "powf" not in code
+
+def test_other_roots_are_kept():
+    assert reduce_inverse_square_roots(sqrt(x)) == sqrt(x)
+    assert reduce_inverse_square_roots(x**Rational(-3, 2)) == x**Rational(-3, 2)
+
+def test_rational_and_irrational_constants_are_folded():
+    assert fold_constants(Rational(1, 3)*x) == Float(1.0/3.0)*x
+    assert fold_constants(sqrt(2)*x) == Float(sqrt(2).evalf())*x
+    assert fold_constants(2*x) == 2*x
+
+def test_constant_folding_keeps_the_exponents():
+    assert fold_constants(x**Rational(1, 2)) == sqrt(x)
+    assert fold_constants((x + Rational(1, 2))**-1) == (x + Float(0.5))**-1
+
+def test_named_constants_are_kept():
+    assert fold_constants(pi*x) == pi*x
+
+@pytest.mark.parametrize("expression", [x/(y - y), x*Pow(0, -1, evaluate=False), Pow(0, -1, evaluate=False) + x])
+def test_division_by_a_zero_constant_is_an_error(expression):
+    with pytest.raises(ValueError):
+        fold_constants(expression)
+
+def test_repeated_divisor_is_replaced_by_a_reciprocal():
+    subexpressions, outputs = share_reciprocals([(S0, x + y)], [z/S0, x/S0, y/S0], "S")
+
+    reciprocal = Symbol("S_inv0", real=True)
+    assert subexpressions == [(S0, x + y), (reciprocal, 1/S0)]
+    assert outputs == [reciprocal*z, reciprocal*x, reciprocal*y]
+
+def test_reciprocal_is_defined_after_the_sub_expressions_of_the_divisor():
+    subexpressions, outputs = share_reciprocals([(S0, x + y), (S1, z/(S0 + x)), (S2, 2*x)], [y/(S0 + x)], "S")
+
+    reciprocal = Symbol("S_inv0", real=True)
+    assert subexpressions == [(S0, x + y), (reciprocal, 1/(S0 + x)), (S1, reciprocal*z), (S2, 2*x)]
+    assert outputs == [reciprocal*y]
+
+def test_divisor_used_once_is_kept():
+    assert share_reciprocals([(S0, x + y)], [z/S0, x*S0], "S") == ([(S0, x + y)], [z/S0, x*S0])
+
+def test_numeric_divisors_are_not_shared():
+    outputs = [x*Pow(3, -1, evaluate=False), y*Pow(3, -1, evaluate=False)]
+
+    assert share_reciprocals([], outputs, "S") == ([], outputs)
+
+def test_reciprocal_names_do_not_clash():
+    existing = Symbol("S_inv0", real=True)
+    subexpressions, outputs = share_reciprocals([(existing, x + y)], [z/y, x/y], "S")
+
+    reciprocal = Symbol("S_inv1", real=True)
+    assert subexpressions == [(reciprocal, 1/y), (existing, x + y)]
+    assert outputs == [reciprocal*z, reciprocal*x]
+
+def test_trivial_sub_expressions_are_inlined():
+    subexpressions, outputs = inline_trivial_subexpressions([(S0, x), (S1, -y), (S2, S0 + S1)], [S2*S1, S0])
+
+    assert subexpressions == [(S2, x - y)]
+    assert outputs == [-S2*y, x]
+
+def test_unused_sub_expressions_are_removed():
+    subexpressions = [(S0, x + y), (S1, S0*z), (S2, x - z), (S3, S1 + 1)]
+
+    assert remove_unused_subexpressions(subexpressions, [S3]) == [(S0, x + y), (S1, S0*z), (S3, S1 + 1)]
+
+def test_reduced_equations_evaluate_to_the_same_outputs():
+    subexpressions = [(S0, Rational(1, 2)*x), (S1, (x + y)**Rational(-1, 2)), (S2, S0**2 + z**3), (S3, -y)]
+    outputs = [S2/(S1 + x), S0/(S1 + x), S1**4*S3, (x*y)**-2]
+
+    reduced_subexpressions, reduced_outputs = reduce_strength(subexpressions, outputs)
+    check_strength_reduction(subexpressions, outputs, reduced_subexpressions, reduced_outputs)
+
+    assert S3 not in {item[0] for item in reduced_subexpressions}
+    assert any(str(item[0]).startswith("S_inv") for item in reduced_subexpressions)
+
+def test_check_detects_a_changed_output():
+    with pytest.raises(AssertionError):
+        check_strength_reduction([(S0, x + y)], [S0**2], [(S0, x + y)], [sq(S0) + 1])
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+from sympy import Matrix, Symbol, cos, expand, numbered_symbols, sin, sqrt
+
+import symbolic_backend
+from derivation_utils import create_symmetric_cov_matrix, quat2Rot
+
+symengine = pytest.importorskip("symengine")
+
+@pytest.fixture
+def backend():
+    def use(name):
+        symbolic_backend.set_backend(name)
+    yield use
+    symbolic_backend.set_backend("sympy")
+
+# the body x velocity and the true airspeed of a small model with an attitude,
+# a velocity and a wind state, its covariance matrix and the product of it and
+# the observation Jacobian
+def create_model():
+    q = Matrix([Symbol("q%i" % index, real=True) for index in range(4)])
+    v = Matrix([Symbol("v%s" % axis, real=True) for axis in "ne"])
+    w = Matrix([Symbol("w%s" % axis, real=True) for axis in "ne"])
+    state = Matrix([*q, *v, *w])
+    relative = Matrix([v[0] - w[0], v[1] - w[1], 0])
+    observations = Matrix([(quat2Rot(q).T * relative)[0], sqrt(relative.dot(relative))])
+    P = create_symmetric_cov_matrix(len(state))
+
+    return state, observations, P
+
+def derive(state, observations, P):
+    H = symbolic_backend.jacobian(observations, state)
+    PHT = symbolic_backend.matrix_product(P, H.T)
+    subexpressions, (H_reduced, PHT_reduced) = symbolic_backend.cse([H, PHT], numbered_symbols("IS"))
+
+    return H, PHT, subexpressions, H_reduced, PHT_reduced
+
+def evaluate(subexpressions, matrix, values):
+    values = dict(values)
+    for symbol, expression in subexpressions:
+        values[symbol] = expression.evalf(subs=values)
+
+    return [float(item.evalf(subs=values)) for item in matrix]
+
+def test_symengine_results_equal_the_sympy_results(backend):
+    state, observations, P = create_model()
+    backend("sympy")
+    reference = derive(state, observations, P)
+    backend("symengine")
+    result = derive(state, observations, P)
+
+    for expected, item in zip(list(reference[0]) + list(reference[1]), list(result[0]) + list(result[1])):
+        assert expand(item - expected) == 0
+    # the reduced matrices keep the shapes and the symbols with their assumptions
+    assert result[3].shape == reference[3].shape and result[4].shape == reference[4].shape
+    assert result[0].free_symbols <= reference[0].free_symbols
+
+    generator = random.Random(0)
+    values = {symbol: generator.uniform(0.1, 1.0) for symbol in state.free_symbols | P.free_symbols}
+    for reference_matrix, matrix in [(reference[3], result[3]), (reference[4], result[4])]:
+        assert evaluate(result[2], matrix, values) == pytest.approx(evaluate(reference[2], reference_matrix, values),
+                                                                      rel=1e-12)
+
+def test_cse_inputs_with_the_names_of_symengine_temporaries_are_an_error(backend):
+    backend("symengine")
+    x0, y = Symbol("x0", real=True), Symbol("y", real=True)
+
+    with pytest.raises(ValueError):
+        symbolic_backend.cse([(x0 + y)**2 + (x0 + y)**3], numbered_symbols("IS"))
+
+def test_cse_with_too_few_symbols_is_an_error(backend):
+    backend("symengine")
+    x, y = Symbol("x", real=True), Symbol("y", real=True)
+
+    with pytest.raises(ValueError):
+        symbolic_backend.cse([(x + y)**2 + (x + y)**3, sin(x * y) + cos(x * y)], [Symbol("IS0")])
@@ -0,0 +1,590 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Numeric verification of the generated equations.
+
+The observation models and the covariance prediction of main.py are evaluated
+with NumPy on a batch of random states and covariance matrices: the
+observation Jacobian H is the lambdified symbolic Jacobian, the Kalman gain
+is K = P*H'/(H*P*H' + R) and the predicted covariance is
+A*P*A' + G*var_u*G'. The same equations are generated as C code with the
+CodeGenerator, compiled with the local C++ compiler and run on the same
+batch in single precision.
+
+For every output the largest error of the compiled code is reported,
+relative to the magnitude of the reference value or, for values which are
+small compared to the rest of the batch, to the RMS of that output. The
+symbolic Jacobians are checked against central finite differences of the
+observation models. The batched NumPy functions written by main.py --python
+are checked against the compiled code.
+
+The states and variances can be taken from a change indication file written
+by the C++ replay tests instead of being drawn at random. With --symbolic the
+upper triangle of the covariance prediction derived from the block structure
+of A is also compared symbolically against the dense matrix product.
+"""
+import argparse
+import importlib.util
+import inspect
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from sympy import Matrix, lambdify
+
+from code_gen import CodeGenerator, get_python_name
+from derivation_cache import DerivationCache, set_cache
+from symbolic_backend import BACKENDS, expand, matrix_product, set_backend
+from main import (STATE_MASK_VARIANTS, apply_state_mask, create_ekf_model, generate_observation_equations,
+                  generate_covariance_prediction_equations, get_masked_observation_models, get_observation_models,
+                  predict_covariance_upper_triangle, write_equations_to_file)
+
+N_STATES = 24
+
+# standard deviations used for the random states and covariance matrices
+STATE_SIGMAS = np.array([0.05] * 4 + [0.5] * 3 + [2.0] * 3 + [1e-4] * 3 + [1e-3] * 3 + [0.02] * 3 + [0.01] * 3 + [1.0] * 2)
+
+_MATRIX_ENTRY = re.compile(r"^(\w+)\((\d+),(\d+)\)$")
+
+PROGRAM_TEMPLATE = """#include <math.h>
+#include <stdio.h>
+
+static inline float sq(float x) { return x * x; }
+
+struct Matrix {
+	float data[24][24];
+	float &operator()(int row, int col) { return data[row][col]; }
+};
+
+struct Vector {
+	float data[24];
+	float &operator()(int index) { return data[index]; }
+	template<int index> float &at() { return data[index]; }
+};
+
+int main(int argc, char *argv[])
+{
+	if (argc != 3) {
+		return 1;
+	}
+
+	FILE *input = fopen(argv[1], "rb");
+	FILE *output = fopen(argv[2], "wb");
+
+	if (input == NULL || output == NULL) {
+		return 1;
+	}
+
+	double sample[%(n_inputs)i];
+	double result[%(n_outputs)i];
+
+	while (fread(sample, sizeof(double), %(n_inputs)i, input) == %(n_inputs)i) {
+%(declarations)s
+%(inputs)s
+		{
+%(code)s
+		}
+
+%(outputs)s
+		fwrite(result, sizeof(double), %(n_outputs)i, output);
+	}
+
+	fclose(input);
+	fclose(output);
+
+	return 0;
+}
+"""
+
+def quaternion_from_euler(roll, pitch, yaw):
+    cr, sr = np.cos(roll / 2), np.sin(roll / 2)
+    cp, sp = np.cos(pitch / 2), np.sin(pitch / 2)
+    cy, sy = np.cos(yaw / 2), np.sin(yaw / 2)
+
+    return np.stack([cr * cp * cy + sr * sp * sy,
+                     sr * cp * cy - cr * sp * sy,
+                     cr * sp * cy + sr * cp * sy,
+                     cr * cp * sy - sr * sp * cy], axis=1)
+
+def rotation_from_quaternion(q):
+    q0, q1, q2, q3 = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+
+    return np.stack([np.stack([q0**2 + q1**2 - q2**2 - q3**2, 2*(q1*q2 - q0*q3), 2*(q1*q3 + q0*q2)], axis=1),
+                     np.stack([2*(q1*q2 + q0*q3), q0**2 - q1**2 + q2**2 - q3**2, 2*(q2*q3 - q0*q1)], axis=1),
+                     np.stack([2*(q1*q3 - q0*q2), 2*(q2*q3 + q0*q1), q0**2 - q1**2 - q2**2 + q3**2], axis=1)], axis=1)
+
+# random states of a vehicle flying forward in a level attitude, so the
+# models are evaluated away from their singularities
+def create_random_states(generator, n_samples):
+    yaw = generator.uniform(-np.pi, np.pi, n_samples)
+    q = quaternion_from_euler(generator.normal(0.0, 0.2, n_samples), generator.normal(0.0, 0.2, n_samples), yaw)
+
+    speed = generator.uniform(8.0, 20.0, n_samples)
+    velocity = np.stack([speed * np.cos(yaw), speed * np.sin(yaw), generator.normal(0.0, 1.0, n_samples)], axis=1)
+    velocity[:, :2] += generator.normal(0.0, 1.0, (n_samples, 2))
+
+    states = np.concatenate([q,
+                             velocity,
+                             generator.normal(0.0, 100.0, (n_samples, 3)),
+                             generator.normal(0.0, 1e-4, (n_samples, 3)),
+                             generator.normal(0.0, 1e-3, (n_samples, 3)),
+                             np.array([0.2, 0.02, 0.4]) + generator.normal(0.0, 0.02, (n_samples, 3)),
+                             generator.normal(0.0, 0.01, (n_samples, 3)),
+                             generator.normal(0.0, 3.0, (n_samples, 2))], axis=1)
+
+    return states
+
+# random symmetric positive definite covariance matrices with correlated
+# states, sigmas are the standard deviations of the states
+def create_random_covariances(generator, n_samples, sigmas):
+    factors = generator.normal(size=(n_samples, N_STATES, N_STATES))
+    correlation = factors @ factors.transpose(0, 2, 1) / N_STATES + 0.1 * np.eye(N_STATES)
+    scale = sigmas / np.sqrt(np.diagonal(correlation, axis1=1, axis2=2))
+
+    return correlation * scale[:, :, None] * scale[:, None, :]
+
+# random values of the inputs which are not states or covariances
+def create_random_input(generator, name, n_samples, dt):
+    if name == "dt":
+        return dt
+    if name == "g":
+        return np.full(n_samples, 9.80665)
+    if name in ("dax", "day", "daz"):
+        return generator.normal(0.0, 0.01, n_samples)
+    if name in ("dvx", "dvy"):
+        return generator.normal(0.0, 0.05, n_samples)
+    if name == "dvz":
+        return -9.80665 * dt + generator.normal(0.0, 0.01, n_samples)
+    if name.endswith("Var"):
+        return generator.uniform(1e-8, 1e-5, n_samples)
+    if name.startswith("R_"):
+        return generator.uniform(0.01, 1.0, n_samples)
+    if name == "range":
+        return generator.uniform(1.0, 10.0, n_samples)
+    if name == "ant_yaw":
+        return generator.uniform(-np.pi, np.pi, n_samples)
+    if name in ("Kaccx", "Kaccy"):
+        return generator.uniform(0.1, 0.5, n_samples)
+
+    return generator.uniform(0.5, 1.5, n_samples)
+
+# returns the states and variances of a change indication file, without the
+# samples written before the filter has initialised the attitude and the
+# magnetic field. States which are inhibited in the replay have a zero
+# variance, they use the default standard deviation.
+def load_replay_states(file_name):
+    data = np.loadtxt(file_name, delimiter=",", skiprows=1, ndmin=2)
+    states = data[:, 1:N_STATES + 1]
+    variances = data[:, N_STATES + 1:2 * N_STATES + 1]
+    valid = (variances[:, 0] > 0) & (np.abs(states[:, 16]) > 0)
+    variances = np.where(variances > 0, variances, STATE_SIGMAS ** 2)
+
+    return states[valid], variances[valid]
+
+# returns a dictionary of input name to the values of the batch, the states
+# and the covariance matrices, replay is a tuple of states and variances
+# the batch is drawn from
+def create_random_inputs(generator, n_samples, state_names, input_names, replay=None):
+    if replay is None:
+        states = create_random_states(generator, n_samples)
+        P = create_random_covariances(generator, n_samples, STATE_SIGMAS)
+    else:
+        rows = generator.integers(0, len(replay[0]), n_samples)
+        states = replay[0][rows]
+        P = create_random_covariances(generator, n_samples, np.sqrt(replay[1][rows]))
+    dt = generator.uniform(0.004, 0.012, n_samples)
+
+    values = {name: states[:, index] for index, name in enumerate(state_names)}
+    for row in range(N_STATES):
+        for column in range(row, N_STATES):
+            values["P(%i,%i)" % (row, column)] = P[:, row, column]
+
+    # rotation from body to sensor frame, the sensor is mounted with a random orientation
+    Tbs = rotation_from_quaternion(quaternion_from_euler(*generator.uniform(-np.pi, np.pi, (3, n_samples))))
+    for row in range(3):
+        for column in range(3):
+            values["Tbs(%i,%i)" % (row, column)] = Tbs[:, row, column]
+
+    for name in input_names:
+        if name not in values:
+            values[name] = create_random_input(generator, name, n_samples, dt)
+
+    return values, states, P
+
+# inhibit the masked states of a state mask variant, the values returned by
+# create_random_inputs() are views of the states and covariances
+def mask_inputs(states, P, masked_states):
+    states[:, masked_states] = 0.0
+    P[:, masked_states, :] = 0.0
+    P[:, :, masked_states] = 0.0
+
+def evaluate(expressions, symbols, values, n_samples):
+    function = lambdify(symbols, expressions, "numpy")
+    results = function(*[values[str(symbol)] for symbol in symbols])
+
+    return np.stack([np.broadcast_to(np.asarray(result, dtype=float), (n_samples,)) for result in results], axis=1)
+
+def get_inputs(expressions):
+    inputs = set()
+    for expression in expressions:
+        inputs |= expression.free_symbols
+
+    return sorted(inputs, key=str)
+
+# relative error of each output, values which are small compared to the rest
+# of the batch are compared to the RMS of the output instead
+def get_relative_errors(result, expected):
+    rms = np.sqrt(np.mean(expected ** 2, axis=0))
+    scale = np.maximum(np.abs(expected), rms)
+    errors = np.abs(result - expected)
+
+    return np.max(np.divide(errors, scale, out=np.zeros_like(errors), where=scale > 0), axis=0)
+
+# central differences of the observation with a step relative to each state
+def get_finite_difference_jacobian(observation, state, input_symbols, values, n_samples):
+    function = lambdify(input_symbols, observation, "numpy")
+    jacobian = np.zeros((n_samples, len(state)))
+    for index, symbol in enumerate(state):
+        name = str(symbol)
+        step = 1e-8 * np.maximum(1.0, np.abs(values[name]))
+        perturbed = dict(values)
+        perturbed[name] = values[name] + step
+        upper = function(*[perturbed[str(item)] for item in input_symbols])
+        perturbed[name] = values[name] - step
+        lower = function(*[perturbed[str(item)] for item in input_symbols])
+        jacobian[:, index] = (upper - lower) / (2 * step)
+
+    return jacobian
+
+def create_program(code, input_names, output_names):
+    matrices = set()
+    vectors = set()
+    lines = []
+    for index, name in enumerate(input_names):
+        match = _MATRIX_ENTRY.match(name)
+        if match:
+            matrices.add(match.group(1))
+            if match.group(1) == "P":
+                lines.append("\t\tP(%s,%s) = P(%s,%s) = (float)sample[%i];" % (match.group(2), match.group(3), match.group(3), match.group(2), index))
+            else:
+                lines.append("\t\t%s = (float)sample[%i];" % (name, index))
+        else:
+            lines.append("\t\tconst float %s = (float)sample[%i];" % (name, index))
+
+    outputs = []
+    for index, name in enumerate(output_names):
+        match = re.match(r"^(\w+)\((\d+)(,\d+)?\)$", name)
+        (matrices if match.group(3) else vectors).add(match.group(1))
+        outputs.append("\t\tresult[%i] = %s;" % (index, name))
+
+    declarations = ["\t\tMatrix %s = {};" % name for name in sorted(matrices)]
+    declarations += ["\t\tVector %s = {};" % name for name in sorted(vectors)]
+
+    return PROGRAM_TEMPLATE % {"n_inputs": len(input_names),
+                               "n_outputs": len(output_names),
+                               "declarations": "\n".join(declarations),
+                               "inputs": "\n".join(lines),
+                               "code": "\n".join("\t\t\t" + line if line else "" for line in code.splitlines()),
+                               "outputs": "\n".join(outputs)}
+
+# compile the generated code and run it on the batch, returns the outputs
+def run_generated_code(directory, name, code, input_names, output_names, values, compiler):
+    source_file = os.path.join(directory, name + ".cpp")
+    program_file = os.path.join(directory, name)
+    input_file = os.path.join(directory, name + "_input.bin")
+    output_file = os.path.join(directory, name + "_output.bin")
+
+    with open(source_file, 'w') as file:
+        file.write(create_program(code, input_names, output_names))
+
+    subprocess.run([compiler, "-O2", "-std=c++11", "-o", program_file, source_file], check=True)
+
+    np.ascontiguousarray(np.stack([values[name] for name in input_names], axis=1), dtype="<f8").tofile(input_file)
+    subprocess.run([program_file, input_file, output_file], check=True)
+
+    return np.fromfile(output_file, dtype="<f8").reshape(-1, len(output_names))
+
+def generate_observation_code(directory, name, P, state, observation, obs_var, kwargs, strength_reduction):
+    equations = generate_observation_equations(P,state,observation,obs_var,**kwargs)
+
+    file_name = os.path.join(directory, name + "_generated.cpp")
+    code_generator = CodeGenerator(file_name, strength_reduction)
+    write_equations_to_file(equations,code_generator,1)
+    code_generator.close()
+
+    with open(file_name) as file:
+        return file.read()
+
+def generate_covariance_code(directory, P, A, G, var_u, strength_reduction):
+    P_new_simple = generate_covariance_prediction_equations(P,A,G,var_u)
+
+    file_name = os.path.join(directory, "covariance_generated.cpp")
+    code_generator = CodeGenerator(file_name, strength_reduction)
+    code_generator.write_subexpressions(P_new_simple[0])
+    code_generator.write_matrix(Matrix(P_new_simple[1]), "nextP", True, "(", ")")
+    code_generator.close()
+
+    with open(file_name) as file:
+        return file.read()
+
+def load_python_module(file_name):
+    specification = importlib.util.spec_from_file_location("ekf_generated", file_name)
+    module = importlib.util.module_from_spec(specification)
+    specification.loader.exec_module(module)
+
+    return module
+
+# arguments of a generated Python function, all inputs have the batch as first dimension
+def get_python_arguments(function, values, states, P):
+    names = {get_python_name(name): name for name in values}
+    arguments = []
+    for parameter in inspect.signature(function).parameters:
+        if parameter == "states":
+            arguments.append(states)
+        elif parameter == "P":
+            arguments.append(P)
+        elif parameter in names:
+            arguments.append(values[names[parameter]])
+        else:
+            entries = [_MATRIX_ENTRY.match(name) for name in values]
+            entries = [(int(match.group(2)), int(match.group(3))) for match in entries if match and match.group(1) == parameter]
+            matrix = np.zeros((len(states), max(entry[0] for entry in entries) + 1, max(entry[1] for entry in entries) + 1))
+            for row, column in entries:
+                matrix[:, row, column] = values["%s(%i,%i)" % (parameter, row, column)]
+            arguments.append(matrix)
+
+    return arguments
+
+# errors of the vectorised function and of the kernel of a generated Python
+# function, get_outputs converts the returned arrays to the outputs of the C code
+def verify_python(module, function_name, values, states, P, get_outputs, expected):
+    errors = 0
+    for function in (getattr(module, function_name), getattr(module, function_name + "_kernel")):
+        returned = function(*get_python_arguments(function, values, states, P))
+        outputs = get_outputs(*returned) if isinstance(returned, tuple) else get_outputs(returned)
+        errors = np.maximum(errors, get_relative_errors(outputs, expected))
+
+    return errors
+
+def verify_observation(directory, model, name, observation, obs_var, kwargs, values, states, P, n_samples, options):
+    state = list(model.state)
+    input_symbols = get_inputs([observation])
+    H = Matrix([observation]).jacobian(model.state)
+
+    H_expected = evaluate(list(H), input_symbols, values, n_samples)
+    PH = np.einsum("nij,nj->ni", P, H_expected)
+    innovation_variance = np.einsum("ni,ni->n", H_expected, PH) + values[str(obs_var)]
+    K_expected = PH / innovation_variance[:, None]
+
+    H_difference = get_finite_difference_jacobian(observation, state, input_symbols, values, n_samples)
+    result = {"jacobian_error": float(np.max(get_relative_errors(H_difference, H_expected)))}
+
+    if options.compiler is not None:
+        code = generate_observation_code(directory, name, model.P, model.state, observation, obs_var, kwargs, options.strength_reduction)
+        input_names = [str(symbol) for symbol in input_symbols] + [str(obs_var)]
+        input_names += ["P(%i,%i)" % (row, column) for row in range(N_STATES) for column in range(row, N_STATES)]
+        output_names = ["Hfusion(%i)" % index for index in range(N_STATES)] + ["Kfusion(%i)" % index for index in range(N_STATES)]
+        outputs = run_generated_code(directory, name, code, input_names, output_names, values, options.compiler)
+        errors = get_relative_errors(outputs, np.concatenate([H_expected, K_expected], axis=1))
+        result["outputs"] = {output_name: float(error) for output_name, error in zip(output_names, errors)}
+
+    if options.python_module is not None:
+        # compare against the compiled code, or the model if it is not compiled
+        expected = outputs if options.compiler is not None else np.concatenate([H_expected, K_expected], axis=1)
+        errors = verify_python(options.python_module, "fuse_" + name, values, states, P,
+                               lambda H, K: np.concatenate([H, K], axis=1), expected)
+        output_names = ["H[%i]" % index for index in range(N_STATES)] + ["K[%i]" % index for index in range(N_STATES)]
+        result["python_outputs"] = {output_name: float(error) for output_name, error in zip(output_names, errors)}
+
+    return result
+
+# returns the number of entries of the upper triangle of the covariance prediction
+# which differ from the dense matrix product A*P*A' + G*var_u*G'
+def check_covariance_prediction(P,A,G,var_u):
+    P_new = predict_covariance_upper_triangle(P,A,G,var_u)
+    P_new_dense = matrix_product(A,P,A.T) + matrix_product(G,var_u,G.T)
+
+    n_differences = 0
+    for row in range(P_new.shape[0]):
+        for column in range(row, P_new.shape[1]):
+            if P_new[row,column] != P_new_dense[row,column] and expand(P_new[row,column] - P_new_dense[row,column]) != 0:
+                n_differences += 1
+
+    return n_differences
+
+def verify_covariance(directory, model, values, states, P, n_samples, options):
+    input_symbols = get_inputs(list(model.A) + list(model.G) + list(model.var_u))
+    A = evaluate(list(model.A), input_symbols, values, n_samples).reshape(n_samples, N_STATES, N_STATES)
+    G = evaluate(list(model.G), input_symbols, values, n_samples).reshape(n_samples, N_STATES, model.G.shape[1])
+    var_u = evaluate(list(model.var_u.diagonal()), input_symbols, values, n_samples)
+    P_expected = A @ P @ A.transpose(0, 2, 1) + (G * var_u[:, None, :]) @ G.transpose(0, 2, 1)
+
+    # the upper triangle in the order it is written by the CodeGenerator
+    entries = [(row, column) for column in range(N_STATES) for row in range(column + 1)]
+    expected = np.stack([P_expected[:, row, column] for row, column in entries], axis=1)
+
+    result = {}
+    if options.symbolic:
+        result["symbolic_differences"] = check_covariance_prediction(model.P, model.A, model.G, model.var_u)
+
+    if options.compiler is not None:
+        code = generate_covariance_code(directory, model.P, model.A, model.G, model.var_u, options.strength_reduction)
+        input_names = [str(symbol) for symbol in input_symbols if not _MATRIX_ENTRY.match(str(symbol))]
+        input_names += ["P(%i,%i)" % (row, column) for row in range(N_STATES) for column in range(row, N_STATES)]
+        output_names = ["nextP(%i,%i)" % entry for entry in entries]
+        outputs = run_generated_code(directory, "covariance", code, input_names, output_names, values, options.compiler)
+        errors = get_relative_errors(outputs, expected)
+        result["outputs"] = {output_name: float(error) for output_name, error in zip(output_names, errors)}
+
+    if options.python_module is not None:
+        upper_triangle = lambda nextP: np.stack([nextP[:, row, column] for row, column in entries], axis=1)
+        errors = verify_python(options.python_module, "predict_covariance", values, states, P, upper_triangle,
+                               outputs if options.compiler is not None else expected)
+        output_names = ["nextP[%i,%i]" % entry for entry in entries]
+        result["python_outputs"] = {output_name: float(error) for output_name, error in zip(output_names, errors)}
+
+    return result
+
+def format_result(name, result, tolerance, jacobian_tolerance):
+    line = name.ljust(14)
+    failed = False
+    if "outputs" in result:
+        worst = max(result["outputs"], key=result["outputs"].get)
+        error = result["outputs"][worst]
+        failed |= error > tolerance
+        line += "%12.2e  %-16s" % (error, worst)
+    else:
+        line += "%12s  %-16s" % ("-", "-")
+
+    if "jacobian_error" in result:
+        failed |= result["jacobian_error"] > jacobian_tolerance
+        line += "%12.2e" % result["jacobian_error"]
+    else:
+        line += "%12s" % "-"
+
+    if "python_outputs" in result:
+        error = max(result["python_outputs"].values())
+        failed |= error > tolerance
+        line += "%12.2e" % error
+
+    if "symbolic_differences" in result:
+        failed |= result["symbolic_differences"] > 0
+        line += "  %i symbolic differences" % result["symbolic_differences"]
+
+    return line + ("  FAIL" if failed else "  ok"), failed
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the generated EKF equations numerically against the symbolic models')
+    parser.add_argument('-n', '--samples', type=int, default=2000,
+                        help='number of random states and covariance matrices (default: 2000)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the random batch (default: 0)')
+    parser.add_argument('--models', nargs='+',
+                        help='names of the models to check (default: all)')
+    parser.add_argument('--compiler', default=os.environ.get("CXX", "c++"),
+                        help='C++ compiler used to build the generated code (default: $CXX or c++)')
+    parser.add_argument('--no-compile', action='store_true',
+                        help='only check the Jacobians against finite differences')
+    parser.add_argument('--strength-reduction', action='store_true',
+                        help='check the generated code after the strength reduction pass')
+    parser.add_argument('--tolerance', type=float, default=1e-3,
+                        help='largest relative error of the generated code (default: 1e-3)')
+    parser.add_argument('--jacobian-tolerance', type=float, default=1e-5,
+                        help='largest relative error of the Jacobians (default: 1e-5)')
+    parser.add_argument('--python', nargs='?', const='./generated/ekf_generated.py', metavar='MODULE',
+                        help='check the NumPy functions generated by main.py --python against the compiled code '
+                             '(default module: ./generated/ekf_generated.py)')
+    parser.add_argument('--states', metavar='FILE',
+                        help='draw the states and variances from a change indication file of the replay tests, '
+                             'e.g. ../../../test/change_indication/iris_gps.csv')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='derive all equations without reading or writing the derivation cache')
+    parser.add_argument('--cache-dir', default='./.cache',
+                        help='directory of the derivation cache (default: ./.cache)')
+    parser.add_argument('--backend', choices=BACKENDS, default='sympy',
+                        help='symbolic backend used to derive the equations (default: sympy)')
+    parser.add_argument('--variant', choices=sorted(STATE_MASK_VARIANTS),
+                        help='check the equations of a state mask variant, the masked states and their covariances are zero')
+    parser.add_argument('--symbolic', action='store_true',
+                        help='also compare the covariance prediction symbolically against the dense matrix product')
+    parser.add_argument('--report',
+                        help='write the error of every output to this JSON file')
+    parser.add_argument('--keep', metavar='DIRECTORY',
+                        help='keep the generated programs in this directory')
+    options = parser.parse_args()
+
+    if options.no_compile:
+        options.compiler = None
+    if options.variant and options.python:
+        parser.error("the generated NumPy functions have no state mask variants")
+    options.python_module = load_python_module(options.python) if options.python else None
+    set_cache(None if options.no_cache else DerivationCache(options.cache_dir))
+    set_backend(options.backend)
+
+    model = create_ekf_model()
+    if options.variant:
+        model = apply_state_mask(model, options.variant)
+        observation_models = get_masked_observation_models(model)
+    else:
+        observation_models = get_observation_models(model)
+    names = ["covariance"] + [item[0] for item in observation_models]
+    selected = options.models if options.models else names
+    unknown = [name for name in selected if name not in names]
+    if unknown:
+        parser.error("unknown models: %s (available: %s)" % (", ".join(unknown), ", ".join(names)))
+
+    input_names = set(str(symbol) for symbol in get_inputs(list(model.A) + list(model.G) + list(model.var_u)))
+    for name, observation, obs_var, kwargs in observation_models:
+        input_names |= set(str(symbol) for symbol in get_inputs([observation, obs_var]))
+
+    generator = np.random.default_rng(options.seed)
+    replay = load_replay_states(options.states) if options.states else None
+    values, states, P = create_random_inputs(generator, options.samples, [str(symbol) for symbol in model.state],
+                                             sorted(input_names), replay)
+    if options.variant:
+        mask_inputs(states, P, model.masked_states)
+
+    if options.keep:
+        os.makedirs(options.keep, exist_ok=True)
+        directory = options.keep
+    else:
+        temporary_directory = tempfile.TemporaryDirectory()
+        directory = temporary_directory.name
+
+    print('Checking %i samples (max relative error of the generated code, Jacobian error):' % options.samples)
+    print("model".ljust(14) + "%12s  %-16s%12s" % ("code error", "worst output", "jacobian")
+          + ("%12s" % "python" if options.python_module is not None else ""))
+    results = {}
+    n_failed = 0
+    for name in names:
+        if name not in selected:
+            continue
+        start_time = time.perf_counter()
+        if name == "covariance":
+            results[name] = verify_covariance(directory, model, values, states, P, options.samples, options)
+        else:
+            item = observation_models[names.index(name) - 1]
+            results[name] = verify_observation(directory, model, *item, values, states, P, options.samples, options)
+        results[name]["duration"] = time.perf_counter() - start_time
+        line, failed = format_result(name, results[name], options.tolerance, options.jacobian_tolerance)
+        print(line)
+        n_failed += failed
+
+    if options.report:
+        with open(options.report, 'w') as file:
+            json.dump({"samples": options.samples, "seed": options.seed, "states": options.states,
+                       "variant": options.variant, "backend": options.backend, "results": results},
+                      file, indent=4, sort_keys=True)
+            file.write("\n")
+
+    if n_failed:
+        print('%i of %i models exceed the tolerance' % (n_failed, len(results)))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
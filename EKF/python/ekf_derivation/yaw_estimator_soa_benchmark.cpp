@@ -0,0 +1,187 @@
+// Benchmark of the yaw estimator covariance prediction and NE velocity fusion equations.
+// The models are updated one at a time with the array of structures layout used by
+// EKFGSF_yaw.cpp and all together with the structure of arrays layout.
+//
+// Build and run from this directory:
+// g++ -O3 -march=native -ffast-math -o yaw_estimator_soa_benchmark yaw_estimator_soa_benchmark.cpp && ./yaw_estimator_soa_benchmark
+// The loops over the models are only vectorised at -O3, the vectorised sinf and cosf
+// require -ffast-math. The number of models can be changed with -DN_MODELS_EKFGSF=<count>
+
+#include <math.h>
+#include <stdio.h>
+#include <cstdlib>
+#include <chrono>
+
+#ifndef N_MODELS_EKFGSF
+#define N_MODELS_EKFGSF 5
+#endif
+
+static const int N_ITERATIONS = 1000000;
+
+inline float sq(float in) {
+	return in * in;
+}
+
+template<int ROWS, int COLS>
+struct Matrix {
+	float data[ROWS][COLS];
+	float &operator()(int row, int col) { return data[row][col]; }
+};
+
+// array of structures layout of EKFGSF_yaw.h
+struct ekf_gsf_struct {
+	float X[3];
+	Matrix<3, 3> P;
+	Matrix<2, 2> S_inverse;
+	float S_det_inverse;
+};
+
+// structure of arrays layout, indexed by the model last
+struct ekf_gsf_soa_struct {
+	float X[3][N_MODELS_EKFGSF];
+	float P[3][3][N_MODELS_EKFGSF];
+	float S_inverse[2][2][N_MODELS_EKFGSF];
+	float S_det_inverse[N_MODELS_EKFGSF];
+};
+
+static void predictCovariance(ekf_gsf_struct _ekf_gsf[], const float dvx_in[], const float dvy_in[],
+			      float dvxVar, float dvyVar, float dazVar)
+{
+	for (unsigned model_index = 0; model_index < N_MODELS_EKFGSF; model_index++) {
+		Matrix<3, 3> &P = _ekf_gsf[model_index].P;
+		const float psi = _ekf_gsf[model_index].X[2];
+		const float dvx = dvx_in[model_index];
+		const float dvy = dvy_in[model_index];
+
+#include "generated/yaw_estimator_covariance_prediction_generated.cpp"
+	}
+}
+
+static void updateCovariance(ekf_gsf_struct _ekf_gsf[], Matrix<3, 2> K_models[], float velObsVar)
+{
+	for (unsigned model_index = 0; model_index < N_MODELS_EKFGSF; model_index++) {
+		Matrix<3, 3> &P = _ekf_gsf[model_index].P;
+		Matrix<3, 2> &K = K_models[model_index];
+
+#include "generated/yaw_estimator_measurement_update_generated.cpp"
+	}
+}
+
+static void predictCovarianceSoa(ekf_gsf_soa_struct &_ekf_gsf_soa, const float dvx[], const float dvy[],
+				 float dvxVar, float dvyVar, float dazVar)
+{
+#include "generated/yaw_estimator_covariance_prediction_soa_generated.cpp"
+}
+
+static void updateCovarianceSoa(ekf_gsf_soa_struct &_ekf_gsf_soa, float K[3][2][N_MODELS_EKFGSF], float velObsVar)
+{
+#include "generated/yaw_estimator_measurement_update_soa_generated.cpp"
+}
+
+static float random(float min, float max)
+{
+	return min + (max - min) * (float)rand() / (float)RAND_MAX;
+}
+
+int main()
+{
+	ekf_gsf_struct ekf_gsf[N_MODELS_EKFGSF] = {};
+	ekf_gsf_soa_struct ekf_gsf_soa = {};
+	Matrix<3, 2> K_models[N_MODELS_EKFGSF] = {};
+	float K_soa[3][2][N_MODELS_EKFGSF] = {};
+	float dvx[N_MODELS_EKFGSF];
+	float dvy[N_MODELS_EKFGSF];
+
+	const float dt = 0.01f;
+	const float dvxVar = sq(2.0f * dt);
+	const float dvyVar = dvxVar;
+	const float dazVar = sq(0.1f * dt);
+	const float velObsVar = 0.25f;
+
+	for (unsigned model_index = 0; model_index < N_MODELS_EKFGSF; model_index++) {
+		const float yaw = random(-3.14f, 3.14f);
+		dvx[model_index] = random(-0.1f, 0.1f);
+		dvy[model_index] = random(-0.1f, 0.1f);
+
+		// same initial covariance as EKFGSF_yaw::initialiseEKFGSF()
+		const float P[3] = {sq(0.5f), sq(0.5f), sq(3.14f / 5.0f)};
+
+		for (unsigned index = 0; index < 3; index++) {
+			ekf_gsf[model_index].P(index, index) = P[index];
+			ekf_gsf_soa.P[index][index][model_index] = P[index];
+		}
+
+		ekf_gsf[model_index].X[2] = yaw;
+		ekf_gsf_soa.X[2][model_index] = yaw;
+	}
+
+	// the prediction only and alternating predictions and updates as the estimator does,
+	// the lower triangle of the covariance matrices is not used by the equations
+	auto start = std::chrono::steady_clock::now();
+
+	for (int iteration = 0; iteration < N_ITERATIONS; iteration++) {
+		predictCovariance(ekf_gsf, dvx, dvy, dvxVar, dvyVar, dazVar);
+	}
+
+	const double duration_predict = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+	start = std::chrono::steady_clock::now();
+
+	for (int iteration = 0; iteration < N_ITERATIONS; iteration++) {
+		predictCovarianceSoa(ekf_gsf_soa, dvx, dvy, dvxVar, dvyVar, dazVar);
+	}
+
+	const double duration_predict_soa = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+	start = std::chrono::steady_clock::now();
+
+	for (int iteration = 0; iteration < N_ITERATIONS; iteration++) {
+		predictCovariance(ekf_gsf, dvx, dvy, dvxVar, dvyVar, dazVar);
+		updateCovariance(ekf_gsf, K_models, velObsVar);
+	}
+
+	const double duration_update = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+	start = std::chrono::steady_clock::now();
+
+	for (int iteration = 0; iteration < N_ITERATIONS; iteration++) {
+		predictCovarianceSoa(ekf_gsf_soa, dvx, dvy, dvxVar, dvyVar, dazVar);
+		updateCovarianceSoa(ekf_gsf_soa, K_soa, velObsVar);
+	}
+
+	const double duration_update_soa = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+
+	// both layouts must give the same result
+	float max_diff_fraction = 0.0f;
+
+	for (unsigned model_index = 0; model_index < N_MODELS_EKFGSF; model_index++) {
+		for (unsigned row = 0; row < 3; row++) {
+			for (unsigned col = row; col < 3; col++) {
+				const float old_value = ekf_gsf[model_index].P(row, col);
+				const float new_value = ekf_gsf_soa.P[row][col][model_index];
+				const float diff_fraction = fabsf(old_value - new_value) / fmaxf(fabsf(old_value), 1e-12f);
+				max_diff_fraction = fmaxf(max_diff_fraction, diff_fraction);
+			}
+
+			for (unsigned col = 0; col < 2; col++) {
+				const float old_value = K_models[model_index](row, col);
+				const float new_value = K_soa[row][col][model_index];
+				const float diff_fraction = fabsf(old_value - new_value) / fmaxf(fabsf(old_value), 1e-12f);
+				max_diff_fraction = fmaxf(max_diff_fraction, diff_fraction);
+			}
+		}
+	}
+
+	const double to_ns = 1e9 / N_ITERATIONS;
+	printf("%i models, %i iterations, time per call for all models:\n", N_MODELS_EKFGSF, N_ITERATIONS);
+	printf("covariance prediction: per model %.1f ns, structure of arrays %.1f ns (speedup %.2f)\n",
+	       duration_predict * to_ns, duration_predict_soa * to_ns, duration_predict / duration_predict_soa);
+	printf("prediction and fusion: per model %.1f ns, structure of arrays %.1f ns (speedup %.2f)\n",
+	       duration_update * to_ns, duration_update_soa * to_ns, duration_update / duration_update_soa);
+
+	if (max_diff_fraction > 1e-4f) {
+		printf("Fail: covariance and Kalman gain max diff fraction = %e\n", max_diff_fraction);
+		return 1;
+	}
+
+	printf("Pass: covariance and Kalman gain max diff fraction = %e\n", max_diff_fraction);
+
+	return 0;
+}
@@ -7,92 +7,76 @@ measurements for terrain estimation.
 """
 
 from sympy import *
+import os
+from types import SimpleNamespace
+import sys
 
-# q: quaternion describing rotation from frame 1 to frame 2
-# returns a rotation matrix derived form q which describes the same
-# rotation
-def quat2Rot(q):
-    q0 = q[0]
-    q1 = q[1]
-    q2 = q[2]
-    q3 = q[3]
+if __name__ == "__main__":
+    sys.exit("The terrain estimator code is generated by the EKF derivation driver, run in %s:\n"
+             "    python3 main.py --derivations terrain"
+             % os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'ekf_derivation')))
 
-    Rot = Matrix([[q0**2 + q1**2 - q2**2 - q3**2, 2*(q1*q2 - q0*q3), 2*(q1*q3 + q0*q2)],
-                  [2*(q1*q2 + q0*q3), q0**2 - q1**2 + q2**2 - q3**2, 2*(q2*q3 - q0*q1)],
-                   [2*(q1*q3-q0*q2), 2*(q2*q3 + q0*q1), q0**2 - q1**2 - q2**2 + q3**2]])
+# the symbolic primitives and the code generation are shared with the EKF derivation,
+# the derivations are run by ekf_derivation/main.py --derivations terrain
+from code_gen import CodeGenerator
+from derivation_utils import cached_cse, jacobian, quat2Rot
 
-    return Rot
+GENERATED_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'generated')
 
-# take an expression calculated by the cse() method and write the expression
-# into a text file in C format
-def write_simplified(P_touple, filename, out_name):
-    subs = P_touple[0]
-    P = Matrix(P_touple[1])
-    fd = open(filename, 'a')
+# symbolic variables of the terrain estimator
+def create_terrain_model():
+    ########## Symbolic variable definition #######################################
 
-    is_vector = P.shape[0] == 1 or P.shape[1] == 1
+    # vehicle velocity
+    v_x = Symbol("v_x", real=True)  # vehicle body x velocity
+    v_y = Symbol("v_y", real=True)  # vehicle body y velocity
 
-    # write sub expressions
-    for index, item in enumerate(subs):
-        fd.write('float ' + str(item[0]) + ' = ' + str(item[1]) + ';\n')
+    # unit quaternion describing vehicle attitude, qw is real part
+    qw = Symbol("q0", real=True)
+    qx = Symbol("q1", real=True)
+    qy = Symbol("q2", real=True)
+    qz = Symbol("q3", real=True)
+    q_att = Matrix([qw, qx, qy, qz])
 
-    # write actual matrix values
-    fd.write('\n')
+    # terrain vertial position in local NED frame
+    _terrain_vpos = Symbol("_terrain_vpos", real=True)
 
-    if not is_vector:
-        iterator = range(0,sqrt(len(P)), 1)
-        for row in iterator:
-            for column in iterator:
-                fd.write(out_name + '(' + str(row) + ',' + str(column) + ') = ' + str(P[row, column]) + ';\n')
-    else:
-        iterator = range(0, len(P), 1)
+    _terrain_var = Symbol("_terrain_var", real=True)
 
-        for item in iterator:
-            fd.write(out_name + '(' + str(item) + ') = ' + str(P[item]) + ';\n')
+    # vehicle vertical position in local NED frame
+    pos_z = Symbol("z", real=True)
 
-    fd.write('\n\n')
-    fd.close()
+    return SimpleNamespace(v_x=v_x, v_y=v_y, q_att=q_att, _terrain_vpos=_terrain_vpos,
+                           _terrain_var=_terrain_var, pos_z=pos_z)
 
-########## Symbolic variable definition #######################################
+# calculate the observation scalar of the optical flow and write it to a file in C format
+def write_flow_observation(model, flow, out_name, directory, file_name):
+    H = jacobian(Matrix([flow]), Matrix([model._terrain_vpos]))
+    H_simple = cached_cse(H, symbols('t0:30'))
 
-
-# vehicle velocity
-v_x = Symbol("v_x", real=True)  # vehicle body x velocity
-v_y = Symbol("v_y", real=True)  # vehicle body y velocity
-
-# unit quaternion describing vehicle attitude, qw is real part
-qw = Symbol("q0", real=True)
-qx = Symbol("q1", real=True)
-qy = Symbol("q2", real=True)
-qz = Symbol("q3", real=True)
-q_att = Matrix([qw, qx, qy, qz])
-
-# terrain vertial position in local NED frame
-_terrain_vpos = Symbol("_terrain_vpos", real=True)
-
-_terrain_var = Symbol("_terrain_var", real=True)
-
-# vehicle vertical position in local NED frame
-pos_z = Symbol("z", real=True)
-
-R_body_to_earth = quat2Rot(q_att)
+    os.makedirs(directory, exist_ok=True)
+    code_generator = CodeGenerator(os.path.join(directory, file_name))
+    code_generator.print_string("Equations for the optical flow observation scalar")
+    code_generator.write_subexpressions(H_simple[0])
+    code_generator.write_matrix(Matrix(H_simple[1]), out_name)
+    code_generator.close()
 
 # Optical flow around x axis
-flow_x = -v_y / (_terrain_vpos - pos_z) * R_body_to_earth[2,2]
-
-# Calculate observation scalar
-H_x = Matrix([flow_x]).jacobian(Matrix([_terrain_vpos]))
-
-H_x_simple = cse(H_x, symbols('t0:30'))
+def flow_x_observation(model, directory):
+    R_body_to_earth = quat2Rot(model.q_att)
+    flow_x = -model.v_y / (model._terrain_vpos - model.pos_z) * R_body_to_earth[2,2]
+    write_flow_observation(model, flow_x, "Hx", directory, "terrain_flow_x_observation_generated.cpp")
 
 # Optical flow around y axis
-flow_y = v_x / (_terrain_vpos - pos_z) * R_body_to_earth[2,2]
-
-# Calculate observation scalar
-H_y = Matrix([flow_y]).jacobian(Matrix([_terrain_vpos]))
-
-H_y_simple = cse(H_y, symbols('t0:30'))
-
-write_simplified(H_x_simple, "flow_x_observation.txt", "Hx")
-write_simplified(H_y_simple, "flow_y_observation.txt", "Hy")
-
+def flow_y_observation(model, directory):
+    R_body_to_earth = quat2Rot(model.q_att)
+    flow_y = model.v_x / (model._terrain_vpos - model.pos_z) * R_body_to_earth[2,2]
+    write_flow_observation(model, flow_y, "Hy", directory, "terrain_flow_y_observation_generated.cpp")
+
+# derivations of the terrain estimator as a list of (name, function, arguments),
+# they write separate files in the directory and can run in parallel
+def get_derivations(model, directory=GENERATED_DIRECTORY):
+    return [
+        ("terrain flow x observation", flow_x_observation, (model, directory)),
+        ("terrain flow y observation", flow_y_observation, (model, directory)),
+    ]
@@ -0,0 +1,6 @@
+// Equations for the optical flow observation scalar
+
+
+Hx = v_y*(powf(q0, 2) - powf(q1, 2) - powf(q2, 2) + powf(q3, 2))/powf(_terrain_vpos - z, 2);
+
+
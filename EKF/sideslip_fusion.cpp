@@ -44,9 +44,12 @@
 #include "ekf.h"
 #include <ecl.h>
 #include <mathlib/mathlib.h>
+#include "ekf_timing.h"
 
 void Ekf::fuseSideslip()
 {
+	ECL_EKF_TIMED_SCOPE(FUSE_SIDESLIP);
+
 	// get latest estimated orientation
 	const float &q0 = _state.quat_nominal(0);
 	const float &q1 = _state.quat_nominal(1);
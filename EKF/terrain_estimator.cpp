@@ -42,6 +42,7 @@
 #include "ekf.h"
 #include <ecl.h>
 #include <mathlib/mathlib.h>
+#include "ekf_timing.h"
 
 bool Ekf::initHagl()
 {
@@ -142,6 +143,8 @@ void Ekf::runTerrainEstimator()
 
 void Ekf::fuseHagl()
 {
+	ECL_EKF_TIMED_SCOPE(FUSE_HAGL);
+
 	// get a height above ground measurement from the range finder assuming a flat earth
 	const float meas_hagl = _range_sensor.getDistBottom();
 
@@ -188,6 +191,8 @@ void Ekf::fuseHagl()
 
 void Ekf::fuseFlowForTerrain()
 {
+	ECL_EKF_TIMED_SCOPE(FUSE_FLOW_FOR_TERRAIN);
+
 	// calculate optical LOS rates using optical flow rates that have had the body angular rate contribution removed
 	// correct for gyro bias errors in the data used to do the motion compensation
 	// Note the sign convention used: A positive LOS rate is a RH rotation of the scene about that axis.
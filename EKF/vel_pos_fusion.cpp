@@ -44,6 +44,7 @@
 #include <ecl.h>
 #include <mathlib/mathlib.h>
 #include "ekf.h"
+#include "ekf_timing.h"
 
 bool Ekf::fuseHorizontalVelocity(const Vector3f &innov, const Vector2f &innov_gate, const Vector3f &obs_var,
 				 Vector3f &innov_var, Vector2f &test_ratio)
@@ -152,6 +153,7 @@ bool Ekf::fuseVerticalPosition(const Vector3f &innov, const Vector2f &innov_gate
 // Helper function that fuses a single velocity or position measurement
 void Ekf::fuseVelPosHeight(const float innov, const float innov_var, const int obs_index)
 {
+	ECL_EKF_TIMED_SCOPE(FUSE_VEL_POS_HEIGHT);
 
 	Vector24f Kfusion;  // Kalman gain vector for any single observation - sequential fusion is used.
 	const unsigned state_index = obs_index + 4;  // we start with vx and this is the 4. state
@@ -0,0 +1,66 @@
+// Equations for observation matrix
+const float HH0 = sqrtf(powf(v_d, 2) + powf(v_e - w_e, 2) + powf(v_n - w_n, 2));
+const float HH1 = k_tas/HH0;
+
+
+H_tas(0) = HH1*(-1.0F*v_n + 1.0F*w_n);
+H_tas(1) = HH1*(-1.0F*v_e + 1.0F*w_e);
+H_tas(2) = HH0;
+
+
+// Equations for Kalman gain
+const float KTAS0 = sqrtf(powf(v_d, 2) + powf(v_e - w_e, 2) + powf(v_n - w_n, 2));
+const float KTAS1 = k_tas/KTAS0;
+const float KTAS2 = KTAS1*(-1.0F*v_n + 1.0F*w_n);
+const float KTAS3 = KTAS1*(-1.0F*v_e + 1.0F*w_e);
+const float KTAS4 = KTAS0*_P(0,2) + KTAS2*_P(0,0) + KTAS3*_P(0,1);
+const float KTAS5 = KTAS0*_P(2,2) + KTAS2*_P(0,2) + KTAS3*_P(1,2);
+const float KTAS6 = KTAS0*_P(1,2) + KTAS2*_P(0,1) + KTAS3*_P(1,1);
+const float KTAS7 = 1.0F/(KTAS0*KTAS5 + KTAS2*KTAS4 + KTAS3*KTAS6 + r_tas);
+
+
+K(0) = KTAS4*KTAS7;
+K(1) = KTAS6*KTAS7;
+K(2) = KTAS5*KTAS7;
+
+
+// Equations for covariance matrix update
+const float PM0 = sqrtf(powf(v_d, 2) + powf(v_e - w_e, 2) + powf(v_n - w_n, 2));
+const float PM1 = PM0*_P(0,2);
+const float PM2 = k_tas/PM0;
+const float PM3 = PM2*(-1.0F*v_n + 1.0F*w_n);
+const float PM4 = PM3*_P(0,0);
+const float PM5 = PM2*(-1.0F*v_e + 1.0F*w_e);
+const float PM6 = PM5*_P(0,1);
+const float PM7 = PM1 + PM4 + PM6;
+const float PM8 = PM0*_P(2,2);
+const float PM9 = PM3*_P(0,2);
+const float PM10 = PM5*_P(1,2);
+const float PM11 = PM10 + PM8 + PM9;
+const float PM12 = PM0*PM11;
+const float PM13 = PM0*_P(1,2);
+const float PM14 = PM3*_P(0,1);
+const float PM15 = PM5*_P(1,1);
+const float PM16 = PM13 + PM14 + PM15;
+const float PM17 = PM16*PM5;
+const float PM18 = 1.0F/(PM12 + PM17 + PM3*PM7 + r_tas);
+const float PM19 = PM18*PM7;
+const float PM20 = -_P(0,1);
+const float PM21 = -_P(0,2);
+const float PM22 = PM16*PM18;
+const float PM23 = -_P(1,2);
+const float PM24 = PM12*PM18;
+const float PM25 = PM11*PM18;
+
+
+P_next(0,0) = -PM1*PM19 - PM19*PM4 - PM19*PM6 + _P(0,0);
+P_next(1,0) = -PM1*PM22 - PM17*PM18*_P(0,1) - PM20 - PM22*PM4;
+P_next(2,0) = -PM21 - PM24*_P(0,2) - PM25*PM4 - PM25*PM6;
+P_next(0,1) = -PM13*PM19 - PM14*PM19 - PM15*PM19 - PM20;
+P_next(1,1) = -PM13*PM22 - PM14*PM22 - PM15*PM22 + _P(1,1);
+P_next(2,1) = -PM14*PM25 - PM15*PM25 - PM23 - PM24*_P(1,2);
+P_next(0,2) = -PM10*PM19 - PM19*PM8 - PM19*PM9 - PM21;
+P_next(1,2) = -PM10*PM22 - PM22*PM8 - PM22*PM9 - PM23;
+P_next(2,2) = -PM10*PM25 - PM25*PM8 - PM25*PM9 + _P(2,2);
+
+
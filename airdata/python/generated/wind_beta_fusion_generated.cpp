@@ -0,0 +1,100 @@
+// Equations for observation matrix
+const float HB0 = 2*q_att[0];
+const float HB1 = HB0*q_att[3];
+const float HB2 = 2*q_att[1]*q_att[2];
+const float HB3 = HB1 - HB2;
+const float HB4 = v_e - w_e;
+const float HB5 = HB1 + HB2;
+const float HB6 = v_n - w_n;
+const float HB7 = powf(q_att[1], 2);
+const float HB8 = powf(q_att[2], 2);
+const float HB9 = powf(q_att[0], 2) - powf(q_att[3], 2);
+const float HB10 = HB7 - HB8 + HB9;
+const float HB11 = HB10*HB6 + HB4*HB5 + v_d*(-HB0*q_att[2] + 2*q_att[1]*q_att[3]);
+const float HB12 = 1.0F/HB11;
+const float HB13 = -HB7 + HB8 + HB9;
+const float HB14 = (HB13*HB4 - HB3*HB6 + v_d*(HB0*q_att[1] + 2*q_att[2]*q_att[3]))/powf(HB11, 2);
+
+
+H_beta(0) = HB10*HB14 + HB12*HB3;
+H_beta(1) = -HB12*HB13 + HB14*HB5;
+H_beta(2) = 0;
+
+
+// Equations for Kalman gain
+const float KB0 = 2*q_att[0];
+const float KB1 = KB0*q_att[3];
+const float KB2 = 2*q_att[1]*q_att[2];
+const float KB3 = KB1 - KB2;
+const float KB4 = v_e - w_e;
+const float KB5 = KB1 + KB2;
+const float KB6 = v_n - w_n;
+const float KB7 = powf(q_att[1], 2);
+const float KB8 = powf(q_att[2], 2);
+const float KB9 = powf(q_att[0], 2) - powf(q_att[3], 2);
+const float KB10 = KB7 - KB8 + KB9;
+const float KB11 = KB10*KB6 + KB4*KB5 + v_d*(-KB0*q_att[2] + 2*q_att[1]*q_att[3]);
+const float KB12 = 1.0F/KB11;
+const float KB13 = -KB7 + KB8 + KB9;
+const float KB14 = (KB13*KB4 - KB3*KB6 + v_d*(KB0*q_att[1] + 2*q_att[2]*q_att[3]))/powf(KB11, 2);
+const float KB15 = KB10*KB14 + KB12*KB3;
+const float KB16 = -KB12*KB13 + KB14*KB5;
+const float KB17 = KB15*_P(0,0) + KB16*_P(0,1);
+const float KB18 = KB15*_P(0,1) + KB16*_P(1,1);
+const float KB19 = 1.0F/(KB15*KB17 + KB16*KB18 + r_beta);
+
+
+K(0) = KB17*KB19;
+K(1) = KB18*KB19;
+K(2) = KB19*(KB15*_P(0,2) + KB16*_P(1,2));
+
+
+// Equations for covariance matrix update
+const float PM0 = 2*q_att[0];
+const float PM1 = PM0*q_att[3];
+const float PM2 = 2*q_att[1]*q_att[2];
+const float PM3 = PM1 - PM2;
+const float PM4 = v_e - w_e;
+const float PM5 = PM1 + PM2;
+const float PM6 = v_n - w_n;
+const float PM7 = powf(q_att[1], 2);
+const float PM8 = powf(q_att[2], 2);
+const float PM9 = powf(q_att[0], 2) - powf(q_att[3], 2);
+const float PM10 = PM7 - PM8 + PM9;
+const float PM11 = PM10*PM6 + PM4*PM5 + v_d*(-PM0*q_att[2] + 2*q_att[1]*q_att[3]);
+const float PM12 = 1.0F/PM11;
+const float PM13 = -PM7 + PM8 + PM9;
+const float PM14 = (PM13*PM4 - PM3*PM6 + v_d*(PM0*q_att[1] + 2*q_att[2]*q_att[3]))/powf(PM11, 2);
+const float PM15 = PM10*PM14 + PM12*PM3;
+const float PM16 = PM15*_P(0,0);
+const float PM17 = -PM12*PM13 + PM14*PM5;
+const float PM18 = PM17*_P(0,1);
+const float PM19 = PM16 + PM18;
+const float PM20 = PM15*PM19;
+const float PM21 = PM15*_P(0,1);
+const float PM22 = PM17*_P(1,1);
+const float PM23 = PM21 + PM22;
+const float PM24 = PM17*PM23;
+const float PM25 = 1.0F/(PM20 + PM24 + r_beta);
+const float PM26 = PM19*PM25;
+const float PM27 = -_P(0,1);
+const float PM28 = PM20*PM25;
+const float PM29 = -_P(0,2);
+const float PM30 = PM17*_P(1,2);
+const float PM31 = PM23*PM25;
+const float PM32 = -_P(1,2);
+const float PM33 = PM15*_P(0,2);
+const float PM34 = PM25*(PM30 + PM33);
+
+
+P_next(0,0) = -PM16*PM26 - PM18*PM26 + _P(0,0);
+P_next(1,0) = -PM16*PM31 - PM18*PM31 - PM27;
+P_next(2,0) = -PM16*PM34 - PM18*PM34 - PM29;
+P_next(0,1) = -PM22*PM26 - PM27 - PM28*_P(0,1);
+P_next(1,1) = -PM21*PM31 - PM22*PM31 + _P(1,1);
+P_next(2,1) = -PM21*PM34 - PM22*PM34 - PM32;
+P_next(0,2) = -PM26*PM30 - PM28*_P(0,2) - PM29;
+P_next(1,2) = -PM24*PM25*_P(1,2) - PM31*PM33 - PM32;
+P_next(2,2) = -PM30*PM34 - PM33*PM34 + _P(2,2);
+
+
@@ -0,0 +1,18 @@
+// Equations for the Jacobian of the wind estimate
+const float L0 = powf(v_e, 2);
+const float L1 = powf(v_n, 2);
+const float L2 = L0 + L1;
+const float L3 = tas_meas/powf(L2, 3.0F/2.0F);
+const float L4 = L3*v_e*v_n + 1;
+const float L5 = powf(L2, -1.0F/2.0F);
+const float L6 = -L5*tas_meas;
+
+
+L(0,0) = L4;
+L(1,0) = L1*L3 + L6;
+L(0,1) = L0*L3 + L6;
+L(1,1) = L4;
+L(0,2) = -L5*v_e;
+L(1,2) = -L5*v_n;
+
+
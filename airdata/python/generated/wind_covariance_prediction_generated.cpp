@@ -0,0 +1,17 @@
+// Equations for covariance matrix prediction
+const float SPP0 = powf(dt, 2);
+const float SPP1 = SPP0*q_w;
+const float SPP2 = SPP1 + _P(0,1);
+
+
+P_next(0,0) = SPP1 + _P(0,0);
+P_next(1,0) = SPP2;
+P_next(2,0) = _P(0,2);
+P_next(0,1) = SPP2;
+P_next(1,1) = SPP1 + _P(1,1);
+P_next(2,1) = _P(1,2);
+P_next(0,2) = _P(0,2);
+P_next(1,2) = _P(1,2);
+P_next(2,2) = SPP0*q_k_tas + _P(2,2);
+
+
@@ -6,183 +6,179 @@ Created on Tue Nov  1 19:14:39 2016
 """
 
 from sympy import *
+import os
+from types import SimpleNamespace
+import sys
 
-# q: quaternion describing rotation from frame 1 to frame 2
-# returns a rotation matrix derived form q which describes the same
-# rotation
-def quat2Rot(q):
-    q0 = q[0]
-    q1 = q[1]
-    q2 = q[2]
-    q3 = q[3]
+if __name__ == "__main__":
+    sys.exit("The wind estimator code is generated by the EKF derivation driver, run in %s:\n"
+             "    python3 main.py --derivations wind"
+             % os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'EKF', 'python', 'ekf_derivation')))
 
-    Rot = Matrix([[q0**2 + q1**2 - q2**2 - q3**2, 2*(q1*q2 - q0*q3), 2*(q1*q3 + q0*q2)],
-                  [2*(q1*q2 + q0*q3), q0**2 - q1**2 + q2**2 - q3**2, 2*(q2*q3 - q0*q1)],
-                   [2*(q1*q3-q0*q2), 2*(q2*q3 + q0*q1), q0**2 - q1**2 - q2**2 + q3**2]])
+# the symbolic primitives and the code generation are shared with the EKF derivation,
+# the derivations are run by ekf_derivation/main.py --derivations wind
+from code_gen import CodeGenerator
+from derivation_utils import cached_cse, create_symmetric_cov_matrix, jacobian, quat2Rot
+from symbolic_backend import matrix_product
 
-    return Rot
+GENERATED_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'generated')
 
-# take an expression calculated by the cse() method and write the expression
-# into a text file in C format
-def write_simplified(P_touple, filename, out_name):
-    subs = P_touple[0]
-    P = Matrix(P_touple[1])
-    fd = open(filename, 'a')
-
-    is_vector = P.shape[0] == 1 or P.shape[1] == 1
+def create_code_generator(directory, file_name):
+    os.makedirs(directory, exist_ok=True)
 
-    # write sub expressions
-    for index, item in enumerate(subs):
-        fd.write('float ' + str(item[0]) + ' = ' + str(item[1]) + ';\n')
+    return CodeGenerator(os.path.join(directory, file_name))
 
-    # write actual matrix values
-    fd.write('\n')
-
-    if not is_vector:
-        iterator = range(0,sqrt(len(P)), 1)
-        for row in iterator:
-            for column in iterator:
-                fd.write(out_name + '(' + str(row) + ',' + str(column) + ') = ' + str(P[row, column]) + ';\n')
-    else:
-        iterator = range(0, len(P), 1)
+# take an expression calculated by the cse() method and write the expression
+# into the generated file in C format
+def write_simplified(code_generator, P_touple, out_name):
+    code_generator.write_subexpressions(P_touple[0])
+    code_generator.write_matrix(Matrix(P_touple[1]), out_name)
 
-        for item in iterator:
-            fd.write(out_name + '(' + str(item) + ') = ' + str(P[item]) + ';\n')
+# symbolic states, inputs and covariance matrix of the wind estimator
+def create_wind_model():
+    ########## Symbolic variable definition #######################################
 
-    fd.write('\n\n')
-    fd.close()
+    # model state
+    w_n = Symbol("w_n", real=True)  # wind in north direction
+    w_e = Symbol("w_e", real=True)  # wind in east direction
+    k_tas = Symbol("k_tas", real=True) # true airspeed scale factor
+    state = Matrix([w_n, w_e, k_tas])
 
-########## Symbolic variable definition #######################################
+    # process noise
+    q_w = Symbol("q_w", real=True) # process noise for wind states
+    q_k_tas = Symbol("q_k_tas", real=True) # process noise for airspeed scale state
 
-# model state
-w_n = Symbol("w_n", real=True)  # wind in north direction
-w_e = Symbol("w_e", real=True)  # wind in east direction
-k_tas = Symbol("k_tas", real=True) # true airspeed scale factor
-state = Matrix([w_n, w_e, k_tas])
+    # airspeed measurement noise
+    r_tas = Symbol("r_tas", real=True)
 
-# process noise
-q_w = Symbol("q_w", real=True) # process noise for wind states
-q_k_tas = Symbol("q_k_tas", real=True) # process noise for airspeed scale state
+    # sideslip measurement noise
+    r_beta = Symbol("r_beta", real=True)
 
-# airspeed measurement noise
-r_tas = Symbol("r_tas", real=True)
+    # true airspeed measurement
+    tas_meas = Symbol("tas_meas", real=True)
 
-# sideslip measurement noise
-r_beta = Symbol("r_beta", real=True)
+    # ground velocity variance
+    v_n_var = Symbol("v_n_var", real=True)
+    v_e_var = Symbol("v_e_var", real=True)
 
-# true airspeed measurement
-tas_meas = Symbol("tas_meas", real=True)
+    #################### time varying parameters ##################################
 
-# ground velocity variance
-v_n_var = Symbol("v_n_var", real=True)
-v_e_var = Symbol("v_e_var", real=True)
+    # vehicle velocity
+    v_n = Symbol("v_n", real=True)  # north velocity in earth fixed frame
+    v_e = Symbol("v_e", real=True)  # east velocity in earth fixed frame
+    v_d = Symbol("v_d", real=True)  # down velocity in earth fixed frame
 
-#################### time varying parameters ##################################
+    # unit quaternion describing vehicle attitude, qw is real part
+    qw = Symbol("q_att[0]", real=True)
+    qx = Symbol("q_att[1]", real=True)
+    qy = Symbol("q_att[2]", real=True)
+    qz = Symbol("q_att[3]", real=True)
+    q_att = Matrix([qw, qx, qy, qz])
 
-# vehicle velocity
-v_n = Symbol("v_n", real=True)  # north velocity in earth fixed frame
-v_e = Symbol("v_e", real=True)  # east velocity in earth fixed frame
-v_d = Symbol("v_d", real=True)  # down velocity in earth fixed frame
+    # sampling time in seconds
+    dt = Symbol("dt", real=True)
 
-# unit quaternion describing vehicle attitude, qw is real part
-qw = Symbol("q_att[0]", real=True)
-qx = Symbol("q_att[1]", real=True)
-qy = Symbol("q_att[2]", real=True)
-qz = Symbol("q_att[3]", real=True)
-q_att = Matrix([qw, qx, qy, qz])
+    # define symbolic covariance matrix
+    P = create_symmetric_cov_matrix(3, "_P")
 
-# sampling time in seconds
-dt = Symbol("dt", real=True)
+    return SimpleNamespace(w_n=w_n, w_e=w_e, k_tas=k_tas, state=state, q_w=q_w, q_k_tas=q_k_tas,
+                           r_tas=r_tas, r_beta=r_beta, tas_meas=tas_meas, v_n_var=v_n_var, v_e_var=v_e_var,
+                           v_n=v_n, v_e=v_e, v_d=v_d, q_att=q_att, dt=dt, P=P)
 
 ######################## State and covariance prediction ######################
 
-# state transition matrix is zero because we are using a stationary
-# process model. We only need to provide formula for covariance prediction
+def predict_covariance(model, directory):
+    # state transition matrix is zero because we are using a stationary
+    # process model. We only need to provide formula for covariance prediction
 
-# create process noise matrix for covariance prediction
-state_new = state + Matrix([q_w, q_w, q_k_tas]) * dt
-Q = diag(q_w, q_k_tas)
-L = state_new.jacobian([q_w, q_k_tas])
-Q = L * Q * Transpose(L)
+    # create process noise matrix for covariance prediction
+    state_new = model.state + Matrix([model.q_w, model.q_w, model.q_k_tas]) * model.dt
+    Q = diag(model.q_w, model.q_k_tas)
+    L = jacobian(state_new, [model.q_w, model.q_k_tas])
+    Q = matrix_product(L, Q, L.T)
 
-# define symbolic covariance matrix
-p00 = Symbol('_P(0,0)', real=True)
-p01 = Symbol('_P(0,1)', real=True)
-p02 = Symbol('_P(0,2)', real=True)
-p12 = Symbol('_P(1,2)', real=True)
-p11 = Symbol('_P(1,1)', real=True)
-p22 = Symbol('_P(2,2)', real=True)
-P = Matrix([[p00, p01, p02], [p01, p11, p12], [p02, p12, p22]])
+    # covariance prediction equation
+    P_next = model.P + Q
 
-# covariance prediction equation
-P_next = P + Q
-
-# simplify the result and write it to a text file in C format
-PP_simple = cse(P_next, symbols('SPP0:30'))
-P_pred = Matrix(PP_simple[1])
-write_simplified(PP_simple, "cov_pred.txt", 'P_next')
+    # simplify the result and write it to a file in C format
+    PP_simple = cached_cse(P_next, symbols('SPP0:30'))
 
+    code_generator = create_code_generator(directory, "wind_covariance_prediction_generated.cpp")
+    code_generator.print_string("Equations for covariance matrix prediction")
+    write_simplified(code_generator, PP_simple, 'P_next')
+    code_generator.close()
 
 ############################ Measurement update ###############################
 
-# airspeed fusion
-
-tas_pred = Matrix([((v_n - w_n)**2 + (v_e - w_e)**2 + v_d**2)**0.5]) * k_tas
-# compute true airspeed observation matrix
-H_tas = tas_pred.jacobian(state)
-# simplify the result and write it to a text file in C format
-H_tas_simple = cse(H_tas, symbols('HH0:30'))
-write_simplified(H_tas_simple, "airspeed_fusion.txt", 'H_tas')
-K = P * Transpose(H_tas)
-denom = H_tas * P * Transpose(H_tas) + Matrix([r_tas])
-denom = 1/denom.values()[0]
-K = K * denom
+# observation Jacobian, Kalman gain and covariance update of a scalar observation
+def write_fusion_equations(model, observation, variance, prefixes, directory, file_name):
+    P = model.P
+
+    # compute the observation matrix
+    H = jacobian(Matrix([observation]), model.state)
+    K = matrix_product(P, H.T)
+    denom = matrix_product(H, P, H.T) + Matrix([variance])
+    denom = 1/denom.values()[0]
+    K = K * denom
+    P_m = P - matrix_product(K, H, P)
+
+    # simplify the result and write it to a file in C format
+    H_simple = cached_cse(H, symbols(prefixes[0] + '0:30'))
+    K_simple = cached_cse(K, symbols(prefixes[1] + '0:30'))
+    P_m_simple = cached_cse(P_m, symbols('PM0:50'))
+
+    code_generator = create_code_generator(directory, file_name)
+    code_generator.print_string("Equations for observation matrix")
+    write_simplified(code_generator, H_simple, prefixes[2])
+    code_generator.print_string("Equations for Kalman gain")
+    write_simplified(code_generator, K_simple, 'K')
+    code_generator.print_string("Equations for covariance matrix update")
+    write_simplified(code_generator, P_m_simple, 'P_next')
+    code_generator.close()
 
-K_simple = cse(K, symbols('KTAS0:30'))
-write_simplified(K_simple, "airspeed_fusion.txt", "K")
-
-P_m = P - K*H_tas*P
-P_m_simple = cse(P_m, symbols('PM0:50'))
-write_simplified(P_m_simple, "airspeed_fusion.txt", "P_next")
+# airspeed fusion
+def fuse_airspeed(model, directory):
+    tas_pred = ((model.v_n - model.w_n)**2 + (model.v_e - model.w_e)**2 + model.v_d**2)**0.5 * model.k_tas
+    write_fusion_equations(model, tas_pred, model.r_tas, ('HH', 'KTAS', 'H_tas'), directory,
+                           "wind_airspeed_fusion_generated.cpp")
 
 # sideslip fusion
-
-# compute relative wind vector in vehicle body frame
-relative_wind_earth = Matrix([v_n - w_n, v_e - w_e, v_d])
-R_body_to_earth = quat2Rot(q_att)
-relative_wind_body = Transpose(R_body_to_earth) * relative_wind_earth
-# small angle approximation of side slip model
-beta_pred = relative_wind_body[1] / relative_wind_body[0]
-# compute side slip observation matrix
-H_beta = Matrix([beta_pred]).jacobian(state)
-# simplify the result and write it to a text file in C format
-H_beta_simple = cse(H_beta, symbols('HB0:30'))
-write_simplified(H_beta_simple, "beta_fusion.txt", 'H_beta')
-K = P * Transpose(H_beta)
-denom = H_beta * P * Transpose(H_beta) + Matrix([r_beta])
-denom = 1/denom.values()[0]
-K = K*denom
-K_simple = cse(K, symbols('KB0:30'))
-write_simplified(K_simple, "beta_fusion.txt", 'K')
-
-P_m = P - K*H_beta*P
-P_m_simple = cse(P_m, symbols('PM0:50'))
-write_simplified(P_m_simple, "beta_fusion.txt", "P_next")
+def fuse_beta(model, directory):
+    # compute relative wind vector in vehicle body frame
+    relative_wind_earth = Matrix([model.v_n - model.w_n, model.v_e - model.w_e, model.v_d])
+    R_body_to_earth = quat2Rot(model.q_att)
+    relative_wind_body = matrix_product(R_body_to_earth.T, relative_wind_earth)
+    # small angle approximation of side slip model
+    beta_pred = relative_wind_body[1] / relative_wind_body[0]
+    write_fusion_equations(model, beta_pred, model.r_beta, ('HB', 'KB', 'H_beta'), directory,
+                           "wind_beta_fusion_generated.cpp")
 
 # wind covariance initialisation via velocity
-
-# estimate heading from ground velocity
-heading_est = atan2(v_n, v_e)
-
-# calculate wind speed estimate from vehicle ground velocity, heading and
-# airspeed measurement
-w_n_est = v_n - tas_meas * cos(heading_est)
-w_e_est = v_e - tas_meas * sin(heading_est)
-wind_est = Matrix([w_n_est, w_e_est])
-
-# calculate estimate of state covariance matrix
-P_wind = diag(v_n_var, v_e_var, r_tas)
-
-wind_jac = wind_est.jacobian([v_n, v_e, tas_meas])
-wind_jac_simple = cse(wind_jac, symbols('L0:30'))
-write_simplified(wind_jac_simple, "cov_init.txt", "L")
+def initialise_covariance(model, directory):
+    # estimate heading from ground velocity
+    heading_est = atan2(model.v_n, model.v_e)
+
+    # calculate wind speed estimate from vehicle ground velocity, heading and
+    # airspeed measurement
+    w_n_est = model.v_n - model.tas_meas * cos(heading_est)
+    w_e_est = model.v_e - model.tas_meas * sin(heading_est)
+    wind_est = Matrix([w_n_est, w_e_est])
+
+    # the state covariance matrix is L * diag(v_n_var, v_e_var, r_tas) * L^T
+    wind_jac = jacobian(wind_est, [model.v_n, model.v_e, model.tas_meas])
+    wind_jac_simple = cached_cse(wind_jac, symbols('L0:30'))
+
+    code_generator = create_code_generator(directory, "wind_covariance_init_generated.cpp")
+    code_generator.print_string("Equations for the Jacobian of the wind estimate")
+    write_simplified(code_generator, wind_jac_simple, 'L')
+    code_generator.close()
+
+# derivations of the wind estimator as a list of (name, function, arguments),
+# they write separate files in the directory and can run in parallel
+def get_derivations(model, directory=GENERATED_DIRECTORY):
+    return [
+        ("wind covariance prediction", predict_covariance, (model, directory)),
+        ("wind airspeed fusion", fuse_airspeed, (model, directory)),
+        ("wind sideslip fusion", fuse_beta, (model, directory)),
+        ("wind covariance initialisation", initialise_covariance, (model, directory)),
+    ]
@@ -32,9 +32,22 @@
 #
 ############################################################################
 
-import math
-import json
-import urllib.request
+"""
+Generates the declination, inclination and strength tables of
+geo_magnetic_tables.hpp from the IGRF spherical harmonic model of the bundled
+coefficient file (IGRF14.shc, https://doi.org/10.5281/zenodo.14012302), without
+network access:
+
+    python3 fetch_noaa_table.py [--date 2025.0] > geo_magnetic_tables.hpp
+
+The field is evaluated at the ellipsoid surface (WGS84) of all grid points at
+once. The tables are the same for the same date and coefficient file.
+"""
+
+import argparse
+import os
+import sys
+import numpy as np
 
 SAMPLING_RES = 10
 SAMPLING_MIN_LAT = -90
@@ -42,8 +55,19 @@ SAMPLING_MAX_LAT = 90
 SAMPLING_MIN_LON = -180
 SAMPLING_MAX_LON = 180
 
-def constrain(n, nmin, nmax):
-    return max(min(nmin, n), nmax)
+COEFFICIENT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'IGRF14.shc')
+
+# main field epoch of IGRF-14, the tables of another date are generated with --date
+DEFAULT_DATE = 2025.0
+
+# WGS84 ellipsoid and the reference radius of the IGRF in km
+WGS84_A = 6378.137
+WGS84_F = 1.0 / 298.257223563
+REFERENCE_RADIUS = 6371.2
+
+# the geographic poles are evaluated this close to them, where the declination is
+# defined by the longitude
+POLE_OFFSET_DEG = 1e-6
 
 header = """/****************************************************************************
  *
@@ -78,99 +102,210 @@ header = """/*******************************************************************
  *
  ****************************************************************************/
 """
-print(header)
-
-print('#include <stdint.h>\n')
-
-LAT_DIM=int((SAMPLING_MAX_LAT-SAMPLING_MIN_LAT)/SAMPLING_RES)+1
-LON_DIM=int((SAMPLING_MAX_LON-SAMPLING_MIN_LON)/SAMPLING_RES)+1
-
-print('static constexpr float SAMPLING_RES = {}'.format(SAMPLING_RES) + ';')
-print('static constexpr float SAMPLING_MIN_LAT = {}'.format(SAMPLING_MIN_LAT) + ';')
-print('static constexpr float SAMPLING_MAX_LAT = {}'.format(SAMPLING_MAX_LAT) + ';')
-print('static constexpr float SAMPLING_MIN_LON = {}'.format(SAMPLING_MIN_LON) + ';')
-print('static constexpr float SAMPLING_MAX_LON = {}'.format(SAMPLING_MAX_LON) + ';')
-print('')
-print('static constexpr int LAT_DIM = {}'.format(LAT_DIM) + ';')
-print('static constexpr int LON_DIM = {}'.format(LON_DIM) + ';')
-print('\n')
-
-# Declination
-params = urllib.parse.urlencode({'lat1': 0, 'lat2': 0, 'lon1': 0, 'lon2': 0, 'latStepSize': 1, 'lonStepSize': 1, 'magneticComponent': 'd', 'resultFormat': 'json'})
-f = urllib.request.urlopen("https://www.ngdc.noaa.gov/geomag-web/calculators/calculateIgrfgrid?%s" % params)
-data = json.loads(f.read())
-print("// Magnetic declination data in radians * 10^-4")
-print('// Model: {},'.format(data['model']))
-print('// Version: {},'.format(data['version']))
-print('// Date: {},'.format(data['result'][0]['date']))
-print('static constexpr const int16_t declination_table[{}][{}]'.format(LAT_DIM, LON_DIM) + " {")
-print('//    LONGITUDE: ', end='')
-for l in range(SAMPLING_MIN_LON, SAMPLING_MAX_LON+1, SAMPLING_RES):
-    print('{0:6d},'.format(l), end='')
-print('')
-for latitude in range(SAMPLING_MIN_LAT, SAMPLING_MAX_LAT+1, SAMPLING_RES):
-    params = urllib.parse.urlencode({'lat1': latitude, 'lat2': latitude, 'lon1': SAMPLING_MIN_LON, 'lon2': SAMPLING_MAX_LON, 'latStepSize': 1, 'lonStepSize': SAMPLING_RES, 'magneticComponent': 'd', 'resultFormat': 'json'})
-    f = urllib.request.urlopen("https://www.ngdc.noaa.gov/geomag-web/calculators/calculateIgrfgrid?%s" % params)
-    data = json.loads(f.read())
-
-    print('/* LAT: {0:3d} */'.format(latitude) + ' { ', end='')
-    for p in data['result']:
-        # declination in radians * 10^-4
-        declination_int = constrain(int(round(math.radians(p['declination'] * 10000))), 32767, -32768)
-        print('{0:6d},'.format(declination_int), end='')
-
-    print(' },')
-print("};\n")
-
-# Inclination
-params = urllib.parse.urlencode({'lat1': 0, 'lat2': 0, 'lon1': 0, 'lon2': 0, 'latStepSize': 1, 'lonStepSize': 1, 'magneticComponent': 'i', 'resultFormat': 'json'})
-f = urllib.request.urlopen("https://www.ngdc.noaa.gov/geomag-web/calculators/calculateIgrfgrid?%s" % params)
-data = json.loads(f.read())
-print("// Magnetic inclination data in radians * 10^-4")
-print('// Model: {},'.format(data['model']))
-print('// Version: {},'.format(data['version']))
-print('// Date: {},'.format(data['result'][0]['date']))
-print('static constexpr const int16_t inclination_table[{}][{}]'.format(LAT_DIM, LON_DIM) + " {")
-print('//    LONGITUDE: ', end='')
-for l in range(SAMPLING_MIN_LON, SAMPLING_MAX_LON+1, SAMPLING_RES):
-    print('{0:6d},'.format(l), end='')
-print('')
-for latitude in range(SAMPLING_MIN_LAT, SAMPLING_MAX_LAT+1, SAMPLING_RES):
-    params = urllib.parse.urlencode({'lat1': latitude, 'lat2': latitude, 'lon1': SAMPLING_MIN_LON, 'lon2': SAMPLING_MAX_LON, 'latStepSize': 1, 'lonStepSize': SAMPLING_RES, 'magneticComponent': 'i', 'resultFormat': 'json'})
-    f = urllib.request.urlopen("https://www.ngdc.noaa.gov/geomag-web/calculators/calculateIgrfgrid?%s" % params)
-    data = json.loads(f.read())
-
-    print('/* LAT: {0:3d} */'.format(latitude) + ' { ', end='')
-    for p in data['result']:
-        # inclination in radians * 10^-4
-        inclination_int = constrain(int(round(math.radians(p['inclination'] * 10000))), 32767, -32768)
-        print('{0:6d},'.format(inclination_int), end='')
-
-    print(' },')
-print("};\n")
-
-# total intensity
-params = urllib.parse.urlencode({'lat1': 0, 'lat2': 0, 'lon1': 0, 'lon2': 0, 'latStepSize': 1, 'lonStepSize': 1, 'magneticComponent': 'i', 'resultFormat': 'json'})
-f = urllib.request.urlopen("https://www.ngdc.noaa.gov/geomag-web/calculators/calculateIgrfgrid?%s" % params)
-data = json.loads(f.read())
-print("// Magnetic strength data in milli-Gauss * 10")
-print('// Model: {},'.format(data['model']))
-print('// Version: {},'.format(data['version']))
-print('// Date: {},'.format(data['result'][0]['date']))
-print('static constexpr const int16_t strength_table[{}][{}]'.format(LAT_DIM, LON_DIM) + " {")
-print('//    LONGITUDE: ', end='')
-for l in range(SAMPLING_MIN_LON, SAMPLING_MAX_LON+1, SAMPLING_RES):
-    print('{0:5d},'.format(l), end='')
-print('')
-for latitude in range(SAMPLING_MIN_LAT, SAMPLING_MAX_LAT+1, SAMPLING_RES):
-    params = urllib.parse.urlencode({'lat1': latitude, 'lat2': latitude, 'lon1': SAMPLING_MIN_LON, 'lon2': SAMPLING_MAX_LON, 'latStepSize': 1, 'lonStepSize': SAMPLING_RES, 'magneticComponent': 'f', 'resultFormat': 'json'})
-    f = urllib.request.urlopen("https://www.ngdc.noaa.gov/geomag-web/calculators/calculateIgrfgrid?%s" % params)
-    data = json.loads(f.read())
-
-    print('/* LAT: {0:3d} */'.format(latitude) + ' { ', end='')
-    for p in data['result']:
-        totalintensity_int = int(round(p['totalintensity']/10))
-        print('{0:5d},'.format(totalintensity_int), end='')
-
-    print(' },')
-print("};")
+
+
+def read_coefficients(file_name):
+    """
+    reads the Gauss coefficients of a spherical harmonic coefficient (shc) file
+    :return: (model name, array of epochs, degrees n, orders m, array of shape
+    (coefficients, epochs) with g for m >= 0 and h for m < 0)
+    """
+    model = os.path.splitext(os.path.basename(file_name))[0]
+    rows = []
+
+    with open(file_name) as file:
+        lines = [line for line in file if line.strip()]
+
+    comments = [line for line in lines if line.startswith('#')]
+    if comments:
+        model = comments[0].lstrip('# ').strip()
+    lines = [line for line in lines if not line.startswith('#')]
+
+    epochs = np.array(lines[1].split(), dtype=np.float64)
+    for line in lines[2:]:
+        rows.append(np.array(line.split(), dtype=np.float64))
+    rows = np.array(rows)
+
+    return model, epochs, rows[:, 0].astype(int), rows[:, 1].astype(int), rows[:, 2:]
+
+
+def get_coefficients(epochs, coefficients, date):
+    """
+    interpolates the coefficients linearly to the date
+    :return: array of the coefficients at the date
+    """
+    if date < epochs[0] or date > epochs[-1]:
+        raise ValueError('date {} outside of the model epochs {} to {}'.format(date, epochs[0], epochs[-1]))
+
+    return np.array([np.interp(date, epochs, row) for row in coefficients])
+
+
+def get_legendre_functions(theta, n_max):
+    """
+    computes the Schmidt semi-normalised associated Legendre functions and their
+    derivatives by the colatitude
+    :return: (P, dP) arrays of shape (n_max + 1, n_max + 1) + theta.shape
+    """
+    cos_theta = np.cos(theta)
+    sin_theta = np.sin(theta)
+    p = np.zeros((n_max + 1, n_max + 1) + theta.shape)
+    dp = np.zeros_like(p)
+    p[0, 0] = 1.0
+
+    for n in range(1, n_max + 1):
+        if n == 1:
+            p[1, 1] = sin_theta
+            dp[1, 1] = cos_theta
+        else:
+            k = np.sqrt((2.0 * n - 1.0) / (2.0 * n))
+            p[n, n] = k * sin_theta * p[n - 1, n - 1]
+            dp[n, n] = k * (cos_theta * p[n - 1, n - 1] + sin_theta * dp[n - 1, n - 1])
+
+        for m in range(n):
+            k = np.sqrt((n - 1.0) ** 2 - m ** 2)
+            p[n, m] = ((2.0 * n - 1.0) * cos_theta * p[n - 1, m] - k * p[n - 2, m]) / np.sqrt(n ** 2 - m ** 2)
+            dp[n, m] = ((2.0 * n - 1.0) * (cos_theta * dp[n - 1, m] - sin_theta * p[n - 1, m]) -
+                        k * dp[n - 2, m]) / np.sqrt(n ** 2 - m ** 2)
+
+    return p, dp
+
+
+def get_magnetic_field(lat, lon, altitude, degrees, orders, coefficients):
+    """
+    evaluates the field model at geodetic positions, all positions in one call
+    :param lat: geodetic latitudes in degrees
+    :param lon: longitudes in degrees
+    :param altitude: altitude above the WGS84 ellipsoid in km
+    :return: (north, east, down) components in nT, arrays of the shape of lat
+    """
+    lat = np.radians(np.clip(lat, -90.0 + POLE_OFFSET_DEG, 90.0 - POLE_OFFSET_DEG))
+    lon = np.radians(lon)
+
+    # geocentric radius and colatitude of the geodetic position
+    e2 = WGS84_F * (2.0 - WGS84_F)
+    prime_vertical = WGS84_A / np.sqrt(1.0 - e2 * np.sin(lat) ** 2)
+    x = (prime_vertical + altitude) * np.cos(lat)
+    z = (prime_vertical * (1.0 - e2) + altitude) * np.sin(lat)
+    r = np.hypot(x, z)
+    geocentric_lat = np.arctan2(z, x)
+    theta = np.pi / 2.0 - geocentric_lat
+
+    n_max = int(degrees.max())
+    p, dp = get_legendre_functions(theta, n_max)
+    b_r = np.zeros_like(r)
+    b_theta = np.zeros_like(r)
+    b_phi = np.zeros_like(r)
+
+    g = {(n, m): value for n, m, value in zip(degrees, orders, coefficients) if m >= 0}
+    h = {(n, -m): value for n, m, value in zip(degrees, orders, coefficients) if m < 0}
+
+    for n in range(1, n_max + 1):
+        radius_ratio = (REFERENCE_RADIUS / r) ** (n + 2)
+        for m in range(n + 1):
+            cos_m = np.cos(m * lon)
+            sin_m = np.sin(m * lon)
+            g_nm = g.get((n, m), 0.0)
+            h_nm = h.get((n, m), 0.0)
+            b_r += (n + 1) * radius_ratio * (g_nm * cos_m + h_nm * sin_m) * p[n, m]
+            b_theta -= radius_ratio * (g_nm * cos_m + h_nm * sin_m) * dp[n, m]
+            b_phi -= radius_ratio * m * (h_nm * cos_m - g_nm * sin_m) * p[n, m] / np.sin(theta)
+
+    # rotate from the geocentric to the geodetic frame
+    delta = lat - geocentric_lat
+    north = -b_theta * np.cos(delta) - b_r * np.sin(delta)
+    down = -b_r * np.cos(delta) + b_theta * np.sin(delta)
+
+    return north, b_phi, down
+
+
+def get_tables(degrees, orders, coefficients):
+    """
+    computes the tables of all grid points
+    :return: (declination [rad], inclination [rad], strength [nT]) arrays of
+    shape (LAT_DIM, LON_DIM)
+    """
+    latitudes = np.arange(SAMPLING_MIN_LAT, SAMPLING_MAX_LAT + 1, SAMPLING_RES, dtype=np.float64)
+    longitudes = np.arange(SAMPLING_MIN_LON, SAMPLING_MAX_LON + 1, SAMPLING_RES, dtype=np.float64)
+    lat, lon = np.meshgrid(latitudes, longitudes, indexing='ij')
+
+    north, east, down = get_magnetic_field(lat, lon, 0.0, degrees, orders, coefficients)
+    horizontal = np.hypot(north, east)
+
+    return np.arctan2(east, north), np.arctan2(down, horizontal), np.sqrt(horizontal ** 2 + down ** 2)
+
+
+def format_table(name, description, values, width, model, version, date):
+    """
+    formats a table as C array with a comment row of the longitudes
+    :return:
+    """
+    lines = ['// {}'.format(description),
+             '// Model: {},'.format(model),
+             '// Version: {},'.format(version),
+             '// Date: {},'.format(date),
+             'static constexpr const int16_t {}_table[{}][{}]'.format(name, values.shape[0], values.shape[1]) + ' {',
+             '//    LONGITUDE: ' + ''.join('{0:{1}d},'.format(l, width)
+                                          for l in range(SAMPLING_MIN_LON, SAMPLING_MAX_LON + 1, SAMPLING_RES))]
+
+    for latitude, row in zip(range(SAMPLING_MIN_LAT, SAMPLING_MAX_LAT + 1, SAMPLING_RES), values):
+        lines.append('/* LAT: {0:3d} */'.format(latitude) + ' { ' +
+                     ''.join('{0:{1}d},'.format(value, width) for value in row) + ' },')
+
+    return '\n'.join(lines) + '\n};'
+
+
+def main():
+    """
+    main entry point
+    :return:
+    """
+    parser = argparse.ArgumentParser(description='Generate geo_magnetic_tables.hpp from the IGRF coefficients.')
+    parser.add_argument('--date', type=float, default=DEFAULT_DATE,
+                        help='date of the field as decimal year (default: %(default)s)')
+    parser.add_argument('--coefficients', default=COEFFICIENT_FILE,
+                        help='spherical harmonic coefficient file (default: %(default)s)')
+    parser.add_argument('-o', '--output', default=None,
+                        help='output file (default: stdout)')
+    args = parser.parse_args()
+
+    model, epochs, degrees, orders, coefficients = read_coefficients(args.coefficients)
+    try:
+        coefficients = get_coefficients(epochs, coefficients, args.date)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        exit(-1)
+    declination, inclination, strength = get_tables(degrees, orders, coefficients)
+
+    # declination and inclination in radians * 10^-4, strength in nT / 10 = milli-Gauss * 10
+    int16_limits = (-32768, 32767)
+    version = os.path.basename(args.coefficients)
+    lat_dim, lon_dim = declination.shape
+    text = [header,
+            '#include <stdint.h>\n',
+            'static constexpr float SAMPLING_RES = {};'.format(SAMPLING_RES),
+            'static constexpr float SAMPLING_MIN_LAT = {};'.format(SAMPLING_MIN_LAT),
+            'static constexpr float SAMPLING_MAX_LAT = {};'.format(SAMPLING_MAX_LAT),
+            'static constexpr float SAMPLING_MIN_LON = {};'.format(SAMPLING_MIN_LON),
+            'static constexpr float SAMPLING_MAX_LON = {};'.format(SAMPLING_MAX_LON),
+            '',
+            'static constexpr int LAT_DIM = {};'.format(lat_dim),
+            'static constexpr int LON_DIM = {};'.format(lon_dim),
+            '\n',
+            format_table('declination', 'Magnetic declination data in radians * 10^-4',
+                         np.clip(np.round(declination * 1e4), *int16_limits).astype(int), 6, model, version,
+                         args.date) + '\n',
+            format_table('inclination', 'Magnetic inclination data in radians * 10^-4',
+                         np.clip(np.round(inclination * 1e4), *int16_limits).astype(int), 6, model, version,
+                         args.date) + '\n',
+            format_table('strength', 'Magnetic strength data in milli-Gauss * 10',
+                         np.round(strength / 10).astype(int), 5, model, version, args.date)]
+
+    if args.output is None:
+        print('\n'.join(text))
+    else:
+        with open(args.output, 'w') as file:
+            file.write('\n'.join(text) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Tests of the IGRF field model of fetch_noaa_table.py against reference values of
+IGRF-14 at 2025.0, computed with the independent ppigrf implementation
+(https://github.com/IAGA-VMOD/ppigrf).
+"""
+
+import os
+import subprocess
+import sys
+import numpy as np
+import pytest
+
+from fetch_noaa_table import (COEFFICIENT_FILE, DEFAULT_DATE, get_coefficients, get_magnetic_field, get_tables,
+                              read_coefficients)
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fetch_noaa_table.py')
+
+# latitude, longitude [deg], altitude [km] and the north, east and down field [nT]
+REFERENCE_FIELDS = [
+    (47.3977, 8.5456, 0.0, (21534.3963, 1285.9020, 43236.7284)),
+    (-33.92, 18.42, 0.0, (9559.6329, -4741.4156, -22692.3479)),
+    (0.0, -60.0, 0.0, (25340.9789, -7587.1791, 4449.5584)),
+    (78.22, 15.65, 0.0, (7091.0129, 1523.6083, 54694.4021)),
+    (-77.85, 166.67, 0.0, (-8164.9731, 6746.1410, -61102.1444)),
+    (35.0, -120.0, 10.0, (23072.2496, 4899.9610, 39649.5018)),
+]
+
+
+@pytest.fixture(scope="module")
+def model():
+    name, epochs, degrees, orders, coefficients = read_coefficients(COEFFICIENT_FILE)
+    return epochs, degrees, orders, coefficients
+
+
+@pytest.mark.parametrize("lat, lon, altitude, field", REFERENCE_FIELDS)
+def test_field_matches_the_reference(model, lat, lon, altitude, field):
+    epochs, degrees, orders, coefficients = model
+    coefficients = get_coefficients(epochs, coefficients, DEFAULT_DATE)
+
+    north, east, down = get_magnetic_field(np.array(lat), np.array(lon), altitude, degrees, orders, coefficients)
+
+    np.testing.assert_allclose([north, east, down], field, atol=0.01)
+
+
+def test_positions_are_evaluated_at_once(model):
+    epochs, degrees, orders, coefficients = model
+    coefficients = get_coefficients(epochs, coefficients, DEFAULT_DATE)
+    lat = np.array([field[0] for field in REFERENCE_FIELDS[:5]])
+    lon = np.array([field[1] for field in REFERENCE_FIELDS[:5]])
+
+    north, east, down = get_magnetic_field(lat, lon, 0.0, degrees, orders, coefficients)
+
+    np.testing.assert_allclose(np.column_stack([north, east, down]),
+                               [field[3] for field in REFERENCE_FIELDS[:5]], atol=0.01)
+
+
+def test_coefficients_are_interpolated_between_the_epochs(model):
+    epochs, degrees, orders, coefficients = model
+    index = int(np.flatnonzero(epochs == 2020.0)[0])
+
+    np.testing.assert_array_equal(get_coefficients(epochs, coefficients, 2020.0), coefficients[:, index])
+    np.testing.assert_allclose(get_coefficients(epochs, coefficients, 2022.5),
+                               0.5 * (coefficients[:, index] + coefficients[:, index + 1]))
+
+
+def test_dates_outside_of_the_model_are_an_error(model):
+    epochs, degrees, orders, coefficients = model
+
+    with pytest.raises(ValueError):
+        get_coefficients(epochs, coefficients, epochs[-1] + 1.0)
+    with pytest.raises(ValueError):
+        get_coefficients(epochs, coefficients, epochs[0] - 1.0)
+
+
+def test_tables_cover_the_grid_with_plausible_values(model):
+    epochs, degrees, orders, coefficients = model
+    declination, inclination, strength = get_tables(degrees, orders, get_coefficients(epochs, coefficients,
+                                                                                       DEFAULT_DATE))
+
+    assert declination.shape == inclination.shape == strength.shape == (19, 37)
+    assert np.isfinite(declination).all() and np.isfinite(inclination).all()
+    # the field is between about 22000 nT in the South Atlantic and 67000 nT near the south magnetic pole
+    assert 20000.0 < strength.min() < 25000.0
+    assert 60000.0 < strength.max() < 70000.0
+    # the field points down in the north and up in the south
+    assert (inclination[-1] > np.radians(80.0)).all()
+    assert (inclination[0] < -np.radians(60.0)).all()
+
+
+def test_table_file_is_written(tmp_path):
+    output_file = tmp_path / 'geo_magnetic_tables.hpp'
+
+    subprocess.run([sys.executable, SCRIPT, '--date', '2025.5', '-o', str(output_file)], check=True)
+
+    text = output_file.read_text()
+    assert 'static constexpr int LAT_DIM = 19;' in text
+    assert 'static constexpr int LON_DIM = 37;' in text
+    assert text.count('// Date: 2025.5,') == 3
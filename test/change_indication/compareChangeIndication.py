@@ -0,0 +1,384 @@
+"""
+Compares change indication outputs, the EKF states and variances logged by
+EkfLogger, against reference outputs with a tolerance per state instead of a
+text diff. Small numerical differences, e.g. from other compiler versions, are
+accepted and for larger differences it reports where the outputs diverged:
+
+	the first divergence time of all states and of each state
+	the maximum absolute and relative error of each state
+	a summary per state group
+
+The files are read in chunks of rows, so outputs of any length can be compared.
+Files holding the outputs of several logs one after another, each with its own
+header line, are compared log by log. Directories are compared file by file.
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import numpy as np
+
+# state groups of the 24 EKF states with the absolute and relative tolerance of
+# the states and of their variances
+STATE_GROUPS = [
+	("quaternion", range(0, 4), (1e-5, 1e-4), (1e-9, 1e-3)),
+	("velocity", range(4, 7), (1e-3, 1e-4), (1e-7, 1e-3)),
+	("position", range(7, 10), (1e-3, 1e-4), (1e-6, 1e-3)),
+	("delta angle bias", range(10, 13), (1e-7, 1e-3), (1e-15, 1e-3)),
+	("delta velocity bias", range(13, 16), (1e-6, 1e-3), (1e-13, 1e-3)),
+	("earth magnetic field", range(16, 19), (1e-5, 1e-4), (1e-10, 1e-3)),
+	("body magnetic field", range(19, 22), (1e-5, 1e-4), (1e-10, 1e-3)),
+	("wind velocity", range(22, 24), (1e-3, 1e-4), (1e-7, 1e-3)),
+]
+
+N_STATES = 24
+CHUNK_ROWS = 100000
+
+
+def get_arguments():
+	"""
+	parses the command line arguments
+	:return:
+	"""
+	parser = argparse.ArgumentParser(
+	description='Compare change indication outputs with a tolerance per state and report where they diverge.')
+	parser.add_argument('reference', help='reference output file or directory')
+	parser.add_argument('output', help='output file or directory compared to the reference')
+	parser.add_argument('--atol', action='append', default=[], metavar='GROUP=VALUE',
+		help='absolute tolerance of a state group, "variance" can be appended to the group name, '
+			'"all" sets all groups')
+	parser.add_argument('--rtol', action='append', default=[], metavar='GROUP=VALUE',
+		help='relative tolerance of a state group, as for --atol')
+	parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS,
+		help='number of rows compared at a time (default: %i)' % CHUNK_ROWS)
+	parser.add_argument('--json', metavar='FILE', default=None,
+		help='also write the comparison results to a json file')
+	return parser.parse_args()
+
+
+def get_column_groups() -> dict:
+	"""
+	returns the state group and the default tolerances of each column name
+	:return: dict of column name to (group name, absolute tolerance, relative tolerance)
+	"""
+	columns = {}
+
+	for name, states, state_tolerance, variance_tolerance in STATE_GROUPS:
+		for state in states:
+			columns["state[%i]" % state] = (name,) + state_tolerance
+			columns["variance[%i]" % state] = (name + " variance",) + variance_tolerance
+
+	return columns
+
+
+def set_tolerances(column_groups: dict, settings: list, index: int) -> dict:
+	"""
+	overrides the absolute (index 1) or relative (index 2) tolerances of the groups
+	given as GROUP=VALUE
+	:return: dict of column name to (group name, absolute tolerance, relative tolerance)
+	"""
+	group_names = {group for group, _, _ in column_groups.values()}
+
+	for setting in settings:
+		group, separator, value = setting.rpartition('=')
+		if not separator or (group != "all" and group not in group_names):
+			raise ValueError("invalid tolerance %s, groups are: all, %s" % (setting, ", ".join(sorted(group_names))))
+		for column, entry in column_groups.items():
+			if group in ("all", entry[0]):
+				entry = list(entry)
+				entry[index] = float(value)
+				column_groups[column] = tuple(entry)
+
+	return column_groups
+
+
+def read_logs(file_name: str, chunk_rows: int):
+	"""
+	reads the logs of an output file, each starting with a header line
+	:return: generator of (column names, generator of float64 row chunks) per log
+	"""
+	with open(file_name) as file:
+		lines = (line.strip() for line in file)
+		lines = (line for line in lines if line)
+		pending = next(lines, None)
+
+		while pending is not None:
+			if not pending.startswith("Timestamp"):
+				raise ValueError("%s: expected a header line, got %s" % (file_name, pending[:40]))
+			columns = pending.split(',')
+			pending = None
+
+			def read_chunks():
+				nonlocal pending
+				while True:
+					chunk = []
+					for line in itertools.islice(lines, chunk_rows):
+						if line.startswith("Timestamp"):
+							pending = line
+							break
+						chunk.append(line)
+					if chunk:
+						values = np.loadtxt(chunk, delimiter=',', dtype=np.float64, ndmin=2)
+						if values.shape[1] != len(columns):
+							raise ValueError("%s: rows do not have %i columns" % (file_name, len(columns)))
+						yield values
+					if len(chunk) < chunk_rows:
+						return
+
+			yield columns, read_chunks()
+
+
+class LogComparison:
+	"""
+	the errors of one log accumulated over the compared chunks
+	"""
+
+	def __init__(self, columns: list, column_groups: dict):
+		self.columns = [column for column in columns[1:] if column in column_groups]
+		self.column_indices = [columns.index(column) for column in self.columns]
+		self.groups = [column_groups[column][0] for column in self.columns]
+		self.atol = np.array([column_groups[column][1] for column in self.columns])
+		self.rtol = np.array([column_groups[column][2] for column in self.columns])
+
+		n_columns = len(self.columns)
+		self.rows = 0
+		self.max_abs_error = np.zeros(n_columns)
+		self.max_abs_error_time = np.zeros(n_columns, dtype=np.int64)
+		self.max_rel_error = np.zeros(n_columns)
+		self.diverged_rows = np.zeros(n_columns, dtype=np.int64)
+		self.first_divergence = np.full(n_columns, -1, dtype=np.int64)
+		self.first_timestamp_mismatch = None
+		self.missing_rows = 0
+		self.extra_rows = 0
+
+	def add(self, reference: np.ndarray, output: np.ndarray) -> None:
+		"""
+		compares a chunk of rows of both outputs
+		:return:
+		"""
+		timestamps = reference[:, 0].astype(np.int64)
+		mismatch = np.flatnonzero(timestamps != output[:, 0].astype(np.int64))
+		if len(mismatch) > 0 and self.first_timestamp_mismatch is None:
+			self.first_timestamp_mismatch = int(timestamps[mismatch[0]])
+
+		reference = reference[:, self.column_indices]
+		output = output[:, self.column_indices]
+
+		with np.errstate(invalid='ignore', divide='ignore'):
+			abs_error = np.abs(output - reference)
+			rel_error = abs_error / np.abs(reference)
+		# equal values, also equal infinities and NaNs, have no error
+		equal = (output == reference) | (np.isnan(output) & np.isnan(reference))
+		abs_error[equal] = 0.0
+		rel_error[equal] = 0.0
+		# a NaN in only one of the outputs is an infinite error
+		abs_error[np.isnan(abs_error)] = np.inf
+		rel_error[np.isnan(rel_error)] = np.inf
+
+		diverged = abs_error > self.atol + self.rtol * np.abs(reference)
+		diverged[np.isnan(reference) != np.isnan(output)] = True
+
+		if len(abs_error) > 0:
+			max_rows = np.argmax(abs_error, axis=0)
+			max_errors = abs_error[max_rows, np.arange(abs_error.shape[1])]
+			larger = max_errors > self.max_abs_error
+			self.max_abs_error[larger] = max_errors[larger]
+			self.max_abs_error_time[larger] = timestamps[max_rows[larger]]
+			self.max_rel_error = np.maximum(self.max_rel_error, rel_error.max(axis=0))
+
+		self.diverged_rows += diverged.sum(axis=0)
+		first_rows = np.argmax(diverged, axis=0)
+		new = (self.first_divergence < 0) & diverged.any(axis=0)
+		self.first_divergence[new] = timestamps[first_rows[new]]
+		self.rows += len(timestamps)
+
+	def has_diverged(self) -> bool:
+		"""
+		:return: true if any state diverged or the logs have different rows
+		"""
+		return bool(np.any(self.diverged_rows > 0) or self.first_timestamp_mismatch is not None
+			or self.missing_rows > 0 or self.extra_rows > 0)
+
+	def first_divergence_time(self):
+		"""
+		:return: the first time any state diverged, None if none did
+		"""
+		times = self.first_divergence[self.first_divergence >= 0]
+
+		return int(times.min()) if len(times) > 0 else None
+
+	def get_results(self) -> dict:
+		"""
+		returns the results as json serialisable dict
+		:return:
+		"""
+		states = {}
+		for i, column in enumerate(self.columns):
+			states[column] = {"group": self.groups[i],
+				"max_abs_error": float(self.max_abs_error[i]),
+				"max_abs_error_time": int(self.max_abs_error_time[i]),
+				"max_rel_error": float(self.max_rel_error[i]),
+				"diverged_rows": int(self.diverged_rows[i]),
+				"first_divergence": int(self.first_divergence[i]) if self.first_divergence[i] >= 0 else None}
+
+		groups = {}
+		for group in dict.fromkeys(self.groups):
+			selected = [i for i, column_group in enumerate(self.groups) if column_group == group]
+			times = self.first_divergence[selected]
+			times = times[times >= 0]
+			groups[group] = {"states": len(selected),
+				"diverged_states": int(np.sum(self.diverged_rows[selected] > 0)),
+				"max_abs_error": float(self.max_abs_error[selected].max()),
+				"max_rel_error": float(self.max_rel_error[selected].max()),
+				"first_divergence": int(times.min()) if len(times) > 0 else None}
+
+		return {"rows": self.rows,
+			"diverged": self.has_diverged(),
+			"first_divergence": self.first_divergence_time(),
+			"first_timestamp_mismatch": self.first_timestamp_mismatch,
+			"missing_rows": self.missing_rows,
+			"extra_rows": self.extra_rows,
+			"groups": groups,
+			"states": states}
+
+
+def compare_files(reference_file: str, output_file: str, column_groups: dict, chunk_rows: int = CHUNK_ROWS) -> list:
+	"""
+	compares the logs of an output file with those of the reference file
+	:return: list of LogComparison, one per log
+	"""
+	comparisons = []
+	reference_logs = read_logs(reference_file, chunk_rows)
+	output_logs = read_logs(output_file, chunk_rows)
+
+	for reference_log, output_log in itertools.zip_longest(reference_logs, output_logs):
+		if reference_log is None or output_log is None:
+			raise ValueError("%s and %s have a different number of logs" % (reference_file, output_file))
+
+		reference_columns, reference_chunks = reference_log
+		output_columns, output_chunks = output_log
+		if reference_columns != output_columns:
+			raise ValueError("%s and %s have different columns" % (reference_file, output_file))
+
+		comparison = LogComparison(reference_columns, column_groups)
+		reference_chunk = np.empty((0, len(reference_columns)))
+		output_chunk = np.empty((0, len(output_columns)))
+		reference_done = output_done = False
+
+		# the chunks of both files are aligned row by row
+		while True:
+			if len(reference_chunk) == 0 and not reference_done:
+				reference_chunk = next(reference_chunks, None)
+				reference_done = reference_chunk is None
+				reference_chunk = np.empty((0, len(reference_columns))) if reference_done else reference_chunk
+			if len(output_chunk) == 0 and not output_done:
+				output_chunk = next(output_chunks, None)
+				output_done = output_chunk is None
+				output_chunk = np.empty((0, len(output_columns))) if output_done else output_chunk
+
+			n_rows = min(len(reference_chunk), len(output_chunk))
+			if n_rows == 0:
+				break
+			comparison.add(reference_chunk[:n_rows], output_chunk[:n_rows])
+			reference_chunk = reference_chunk[n_rows:]
+			output_chunk = output_chunk[n_rows:]
+
+		comparison.missing_rows = len(reference_chunk) + sum(len(chunk) for chunk in reference_chunks)
+		comparison.extra_rows = len(output_chunk) + sum(len(chunk) for chunk in output_chunks)
+		comparisons.append(comparison)
+
+	return comparisons
+
+
+def get_file_pairs(reference: str, output: str) -> list:
+	"""
+	returns the pairs of files to compare, the csv files of the same name if the
+	reference is a directory
+	:return: list of (reference file, output file)
+	"""
+	if not os.path.isdir(reference):
+		return [(reference, output)]
+
+	return [(os.path.join(reference, name), os.path.join(output, name))
+		for name in sorted(os.listdir(reference)) if name.endswith('.csv')]
+
+
+def format_time(timestamp) -> str:
+	"""
+	formats a timestamp in microseconds as seconds
+	:return:
+	"""
+	return "%.3f s" % (timestamp / 1e6) if timestamp is not None else "-"
+
+
+def format_comparison(name: str, comparison: LogComparison) -> str:
+	"""
+	formats the results of a log comparison as text
+	:return:
+	"""
+	results = comparison.get_results()
+	lines = ["%s: %s, %i rows, first divergence at %s" % (name, "DIVERGED" if results["diverged"] else "ok",
+		results["rows"], format_time(results["first_divergence"]))]
+
+	if results["first_timestamp_mismatch"] is not None:
+		lines.append("  timestamps differ from %s" % format_time(results["first_timestamp_mismatch"]))
+	if results["missing_rows"] or results["extra_rows"]:
+		lines.append("  %i rows missing, %i extra rows" % (results["missing_rows"], results["extra_rows"]))
+
+	lines.append("  %-30s %8s %12s %12s %16s" % ("group", "diverged", "max abs err", "max rel err", "first diverged"))
+	for group, result in results["groups"].items():
+		lines.append("  %-30s %4i/%-3i %12.4g %12.4g %16s" % (group, result["diverged_states"], result["states"],
+			result["max_abs_error"], result["max_rel_error"], format_time(result["first_divergence"])))
+
+	lines.append("  %-30s %8s %12s %12s %16s" % ("state", "rows", "max abs err", "at", "first diverged"))
+	for column, result in results["states"].items():
+		if result["diverged_rows"] > 0 or result["max_abs_error"] > 0:
+			lines.append("  %-30s %8i %12.4g %12s %16s" % (column, result["diverged_rows"], result["max_abs_error"],
+				format_time(result["max_abs_error_time"]), format_time(result["first_divergence"])))
+
+	return "\n".join(lines)
+
+
+def main() -> None:
+	"""
+	main entry point
+	:return:
+	"""
+	args = get_arguments()
+
+	try:
+		column_groups = set_tolerances(get_column_groups(), args.atol, 1)
+		column_groups = set_tolerances(column_groups, args.rtol, 2)
+	except ValueError as error:
+		print(error)
+		sys.exit(2)
+
+	results = {}
+	diverged = False
+
+	for reference_file, output_file in get_file_pairs(args.reference, args.output):
+		try:
+			comparisons = compare_files(reference_file, output_file, column_groups, args.chunk_rows)
+		except (OSError, ValueError) as error:
+			print("%s: could not be compared: %s" % (output_file, error))
+			results[output_file] = {"error": str(error)}
+			diverged = True
+			continue
+
+		for i, comparison in enumerate(comparisons):
+			name = output_file if len(comparisons) == 1 else "%s log %i" % (output_file, i)
+			print(format_comparison(name, comparison))
+			results[name] = comparison.get_results()
+			diverged = diverged or comparison.has_diverged()
+
+	if args.json is not None:
+		with open(args.json, 'w') as file:
+			json.dump(results, file, indent=4)
+			file.write("\n")
+
+	sys.exit(1 if diverged else 0)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,140 @@
+"""
+Tests of compareChangeIndication.py on perturbed copies of the iris_gps change
+indication output.
+"""
+import math
+import os
+import pytest
+from compareChangeIndication import compare_files, get_column_groups, set_tolerances
+
+REFERENCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'iris_gps.csv')
+
+# column of state[4], the north velocity, in the rows of the output
+VELOCITY_COLUMN = 5
+
+
+def read_rows(file_name: str) -> list:
+	"""
+	reads the header and the rows of an output file as lists of cells
+	:return:
+	"""
+	with open(file_name) as file:
+		return [line.strip().split(',') for line in file if line.strip()]
+
+
+def write_perturbed_copy(file_name: str, column: int, offset: float, first_row: int, n_rows: int = None) -> None:
+	"""
+	writes a copy of the reference with the offset added to a column from the first
+	row on, the other cells are copied unchanged
+	:return:
+	"""
+	rows = read_rows(REFERENCE)
+	for row in rows[1 + first_row:][:n_rows]:
+		row[column] = repr(float(row[column]) + offset)
+
+	with open(file_name, 'w') as file:
+		file.write("\n".join(",".join(row) for row in rows) + "\n")
+
+
+def get_timestamp(row: int) -> int:
+	"""
+	:return: the timestamp of a row of the reference
+	"""
+	return int(read_rows(REFERENCE)[1 + row][0])
+
+
+def compare(output_file: str, column_groups: dict = None, chunk_rows: int = 100000) -> dict:
+	"""
+	compares an output file with the reference, which has a single log
+	:return: results of the comparison
+	"""
+	comparisons = compare_files(REFERENCE, output_file, column_groups or get_column_groups(), chunk_rows)
+	assert len(comparisons) == 1
+
+	return comparisons[0].get_results()
+
+
+def test_identical_outputs_do_not_diverge():
+	results = compare(REFERENCE)
+
+	assert results["rows"] == len(read_rows(REFERENCE)) - 1
+	assert not results["diverged"]
+	assert results["first_divergence"] is None
+	assert all(state["max_abs_error"] == 0.0 for state in results["states"].values())
+
+
+def test_differences_within_the_tolerance_are_accepted(tmp_path):
+	output_file = str(tmp_path / 'output.csv')
+	# the absolute tolerance of the velocity states is 1e-3
+	write_perturbed_copy(output_file, VELOCITY_COLUMN, 5e-4, 100)
+
+	results = compare(output_file)
+
+	assert not results["diverged"]
+	assert results["states"]["state[4]"]["max_abs_error"] == pytest.approx(5e-4, rel=1e-6)
+	assert results["states"]["state[4]"]["diverged_rows"] == 0
+	assert results["states"]["state[5]"]["max_abs_error"] == 0.0
+
+
+def test_first_divergence_is_the_first_perturbed_row(tmp_path):
+	output_file = str(tmp_path / 'output.csv')
+	write_perturbed_copy(output_file, VELOCITY_COLUMN, 0.01, 200)
+
+	results = compare(output_file)
+
+	assert results["diverged"]
+	assert results["first_divergence"] == get_timestamp(200)
+	assert results["states"]["state[4]"]["first_divergence"] == get_timestamp(200)
+	assert results["states"]["state[4]"]["diverged_rows"] == results["rows"] - 200
+	assert results["groups"]["velocity"]["diverged_states"] == 1
+	assert results["groups"]["velocity"]["first_divergence"] == get_timestamp(200)
+	assert all(group["diverged_states"] == 0 for name, group in results["groups"].items() if name != "velocity")
+
+
+def test_divergence_is_found_across_chunks(tmp_path):
+	output_file = str(tmp_path / 'output.csv')
+	write_perturbed_copy(output_file, VELOCITY_COLUMN, 0.01, 123, n_rows=1)
+
+	results = compare(output_file)
+	chunked_results = compare(output_file, chunk_rows=7)
+
+	assert results["first_divergence"] == get_timestamp(123)
+	assert results["states"]["state[4]"]["diverged_rows"] == 1
+	assert chunked_results == results
+
+
+def test_tolerance_can_be_raised_per_group(tmp_path):
+	output_file = str(tmp_path / 'output.csv')
+	write_perturbed_copy(output_file, VELOCITY_COLUMN, 0.01, 200)
+
+	results = compare(output_file, set_tolerances(get_column_groups(), ["velocity=0.02"], 1))
+
+	assert not results["diverged"]
+
+
+def test_unknown_tolerance_group_is_an_error():
+	with pytest.raises(ValueError):
+		set_tolerances(get_column_groups(), ["speed=0.02"], 1)
+
+
+def test_nan_in_the_output_diverges(tmp_path):
+	output_file = str(tmp_path / 'output.csv')
+	write_perturbed_copy(output_file, VELOCITY_COLUMN, math.nan, 50, n_rows=1)
+
+	results = compare(output_file)
+
+	assert results["first_divergence"] == get_timestamp(50)
+	assert results["states"]["state[4]"]["max_abs_error"] == math.inf
+
+
+def test_missing_rows_diverge(tmp_path):
+	output_file = str(tmp_path / 'output.csv')
+	rows = read_rows(REFERENCE)
+	with open(output_file, 'w') as file:
+		file.write("\n".join(",".join(row) for row in rows[:-10]) + "\n")
+
+	results = compare(output_file)
+
+	assert results["diverged"]
+	assert results["first_divergence"] is None
+	assert results["missing_rows"] == 10
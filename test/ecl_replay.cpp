@@ -0,0 +1,312 @@
+/****************************************************************************
+ *
+ *   Copyright (c) 2020 ECL Development Team. All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions
+ * are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright
+ *    notice, this list of conditions and the following disclaimer.
+ * 2. Redistributions in binary form must reproduce the above copyright
+ *    notice, this list of conditions and the following disclaimer in
+ *    the documentation and/or other materials provided with the
+ *    distribution.
+ * 3. Neither the name PX4 nor the names of its contributors may be
+ *    used to endorse or promote products derived from this software
+ *    without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ * FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ * COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ * INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ * BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS
+ * OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED
+ * AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ * LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ * ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ *
+ ****************************************************************************/
+
+/**
+ * Replays a sensor data file through the EKF and logs the states and variances
+ * like the replay tests, used by test/sensor_simulator/runReplays.py to run
+ * the replay datasets in parallel processes. Built as ecl_benchmark with the
+ * timing of the EKF update steps (EKF/ekf_timing.h), it also prints the
+ * statistics of the call durations, used by test/sensor_simulator/runBenchmarks.py
+ */
+
+#include <algorithm>
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <fstream>
+#include <memory>
+#include <string>
+#include <vector>
+#include "EKF/ekf.h"
+#include "sensor_simulator/sensor_simulator.h"
+#include "sensor_simulator/ekf_logger.h"
+#include "sensor_simulator/ekf_innovations.h"
+#include "sensor_simulator/ekf_parameters.h"
+
+using sensor_simulator::setEkfParameter;
+
+#if defined(ECL_EKF_TIMING)
+#include "EKF/ekf_timing.h"
+
+using namespace estimator::timing;
+
+static std::vector<uint64_t> call_durations[SECTION_COUNT];
+
+static void recordCallDuration(Section section, uint64_t duration_ns)
+{
+	call_durations[section].push_back(duration_ns);
+}
+
+// nearest rank percentile of sorted durations
+static uint64_t getPercentile(const std::vector<uint64_t> &durations, double percentile)
+{
+	const size_t rank = static_cast<size_t>(percentile / 100.0 * durations.size() + 0.999999);
+	return durations[std::max<size_t>(rank, 1) - 1];
+}
+
+// the durations of the calls of each section, with a histogram of log2 bins of
+// nanoseconds, as json object
+static void printCallDurations()
+{
+	printf("{");
+	bool first = true;
+
+	for (int section = 0; section < SECTION_COUNT; section++) {
+		std::vector<uint64_t> &durations = call_durations[section];
+
+		if (durations.empty()) {
+			continue;
+		}
+
+		std::sort(durations.begin(), durations.end());
+
+		uint64_t sum = 0;
+		std::vector<uint64_t> histogram;
+
+		for (const uint64_t duration : durations) {
+			size_t bin = 0;
+
+			while ((duration >> bin) > 1) {
+				bin++;
+			}
+
+			if (histogram.size() <= bin) {
+				histogram.resize(bin + 1, 0);
+			}
+
+			histogram[bin]++;
+			sum += duration;
+		}
+
+		printf("%s\"%s\": {\"calls\": %zu, \"mean\": %.1f, \"p50\": %llu, \"p99\": %llu, \"max\": %llu, \"histogram\": [",
+		       first ? "" : ", ", getSectionName(static_cast<Section>(section)), durations.size(),
+		       static_cast<double>(sum) / durations.size(),
+		       static_cast<unsigned long long>(getPercentile(durations, 50.0)),
+		       static_cast<unsigned long long>(getPercentile(durations, 99.0)),
+		       static_cast<unsigned long long>(durations.back()));
+
+		for (size_t bin = 0; bin < histogram.size(); bin++) {
+			printf("%s%llu", bin > 0 ? ", " : "", static_cast<unsigned long long>(histogram[bin]));
+		}
+
+		printf("]}");
+		first = false;
+	}
+
+	printf("}");
+}
+#endif
+
+static void printUsage(const char *name)
+{
+	fprintf(stderr, "usage: %s <sensor data .csv|.bin> <output.csv> --duration <s> [--logging-rate <hz>]\n"
+		"       [--sensor gps|flow|range|vio|airspeed]... [--fusion-mode <bits>] [--param <name>=<value>]...\n"
+		"       [--innovations <innovations.csv>]\n",
+		name);
+}
+
+static void writeInnovationHeader(std::ofstream &file)
+{
+	file << "Timestamp";
+
+	for (const std::string &name : sensor_simulator::getInnovationNames()) {
+		file << ",innovation[" << name << "]";
+	}
+
+	for (const std::string &name : sensor_simulator::getInnovationNames()) {
+		file << ",innovation_variance[" << name << "]";
+	}
+
+	for (const std::string &name : sensor_simulator::getInnovationTestRatioNames()) {
+		file << ",test_ratio[" << name << "]";
+	}
+
+	file << std::endl;
+}
+
+static void writeInnovations(std::ofstream &file, Ekf &ekf)
+{
+	std::vector<float> innovations(sensor_simulator::getInnovationNames().size());
+	std::vector<float> innovation_variances(innovations.size());
+	std::vector<float> test_ratios(sensor_simulator::getInnovationTestRatioNames().size());
+
+	sensor_simulator::getInnovations(ekf, innovations.data(), innovation_variances.data());
+	sensor_simulator::getInnovationTestRatios(ekf, test_ratios.data());
+
+	file << ekf.get_imu_sample_delayed().time_us;
+
+	for (const std::vector<float> *values : {&innovations, &innovation_variances, &test_ratios}) {
+		for (const float value : *values) {
+			file << "," << value;
+		}
+	}
+
+	file << std::endl;
+}
+
+static bool endsWith(const std::string &text, const std::string &suffix)
+{
+	return text.size() >= suffix.size() && text.compare(text.size() - suffix.size(), suffix.size(), suffix) == 0;
+}
+
+int main(int argc, char *argv[])
+{
+	if (argc < 3) {
+		printUsage(argv[0]);
+		return -1;
+	}
+
+	const std::string input_file = argv[1];
+	const std::string output_file = argv[2];
+	float duration_seconds = 0.f;
+	float logging_rate_hz = 10.f;
+	std::vector<std::string> sensors;
+	std::vector<std::string> parameters;
+	std::string innovation_file;
+
+	for (int i = 3; i < argc; i++) {
+		const std::string option = argv[i];
+
+		if (i + 1 >= argc) {
+			printUsage(argv[0]);
+			return -1;
+		}
+
+		const std::string value = argv[++i];
+
+		if (option == "--duration") {
+			duration_seconds = std::strtof(value.c_str(), nullptr);
+
+		} else if (option == "--logging-rate") {
+			logging_rate_hz = std::strtof(value.c_str(), nullptr);
+
+		} else if (option == "--sensor") {
+			sensors.push_back(value);
+
+		} else if (option == "--fusion-mode") {
+			parameters.push_back("fusion_mode=" + value);
+
+		} else if (option == "--param") {
+			parameters.push_back(value);
+
+		} else if (option == "--innovations") {
+			innovation_file = value;
+
+		} else {
+			printUsage(argv[0]);
+			return -1;
+		}
+	}
+
+	if (duration_seconds <= 0.f || logging_rate_hz <= 0.f) {
+		fprintf(stderr, "duration and logging rate must be positive\n");
+		return -1;
+	}
+
+	std::shared_ptr<Ekf> ekf = std::make_shared<Ekf>();
+	SensorSimulator sensor_simulator(ekf);
+	EkfLogger ekf_logger(ekf);
+
+	const auto load_start = std::chrono::steady_clock::now();
+
+	const bool loaded = endsWith(input_file, ".bin") ? sensor_simulator.loadSensorDataFromBinaryFile(input_file)
+			    : sensor_simulator.loadSensorDataFromFile(input_file);
+
+	if (!loaded) {
+		fprintf(stderr, "%s\n", sensor_simulator.getLoadError().c_str());
+		return -1;
+	}
+
+	ekf_logger.setFilePath(output_file);
+
+	// the IMU, baro and mag simulators are already running
+	for (const std::string &sensor : sensors) {
+		if (!sensor_simulator.startSensor(sensor)) {
+			fprintf(stderr, "unknown sensor %s\n", sensor.c_str());
+			return -1;
+		}
+	}
+
+	for (const std::string &parameter : parameters) {
+		if (!setEkfParameter(*ekf->getParamHandle(), parameter)) {
+			fprintf(stderr, "invalid parameter %s\n", parameter.c_str());
+			return -1;
+		}
+	}
+
+	std::ofstream innovations;
+
+	if (!innovation_file.empty()) {
+		innovations.open(innovation_file);
+
+		if (!innovations) {
+			fprintf(stderr, "can not write to %s\n", innovation_file.c_str());
+			return -1;
+		}
+
+		writeInnovationHeader(innovations);
+	}
+
+#if defined(ECL_EKF_TIMING)
+	setRecorder(recordCallDuration);
+#endif
+
+	const auto replay_start = std::chrono::steady_clock::now();
+
+	const int n_steps = static_cast<int>(duration_seconds * logging_rate_hz + 0.5f);
+
+	for (int i = 0; i < n_steps; ++i) {
+		sensor_simulator.runReplaySeconds(1.0f / logging_rate_hz);
+		ekf_logger.writeStateToFile();
+
+		if (innovations.is_open()) {
+			writeInnovations(innovations, *ekf);
+		}
+	}
+
+	const auto replay_end = std::chrono::steady_clock::now();
+
+	printf("{\"load_time\": %.6f, \"replay_time\": %.6f, \"steps\": %i",
+	       std::chrono::duration<double>(replay_start - load_start).count(),
+	       std::chrono::duration<double>(replay_end - replay_start).count(), n_steps);
+
+#if defined(ECL_EKF_TIMING)
+	setRecorder(nullptr);
+	printf(", \"call_durations\": ");
+	printCallDurations();
+#endif
+
+	printf("}\n");
+
+	return 0;
+}
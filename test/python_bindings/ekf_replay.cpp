@@ -0,0 +1,269 @@
+/****************************************************************************
+ *
+ *   Copyright (c) 2020 ECL Development Team. All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions
+ * are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright
+ *    notice, this list of conditions and the following disclaimer.
+ * 2. Redistributions in binary form must reproduce the above copyright
+ *    notice, this list of conditions and the following disclaimer in
+ *    the documentation and/or other materials provided with the
+ *    distribution.
+ * 3. Neither the name PX4 nor the names of its contributors may be
+ *    used to endorse or promote products derived from this software
+ *    without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ * FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ * COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ * INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ * BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS
+ * OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED
+ * AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ * LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ * ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ *
+ ****************************************************************************/
+
+/**
+ * Python module running the EKF on sensor data given as NumPy arrays. The
+ * replay runs with the GIL released so that replays of different Replay
+ * objects can run in parallel threads.
+ */
+
+#include <algorithm>
+#include <cmath>
+#include <memory>
+#include <string>
+#include <utility>
+#include <vector>
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+#include "EKF/ekf.h"
+#include "sensor_simulator/sensor_simulator.h"
+#include "sensor_simulator/ekf_innovations.h"
+#include "sensor_simulator/ekf_parameters.h"
+
+namespace py = pybind11;
+
+namespace
+{
+
+// the sensor data arrays in the order of the rows of equal timestamps in the
+// replay csv files, with their sensor type
+const std::vector<std::pair<std::string, sensor_info::measurement_t>> replay_sensors = {
+	{"imu", sensor_info::IMU},
+	{"mag", sensor_info::MAG},
+	{"baro", sensor_info::BARO},
+	{"gps", sensor_info::GPS},
+	{"airspeed", sensor_info::AIRSPEED},
+	{"flow", sensor_info::FLOW},
+	{"range", sensor_info::RANGE},
+	{"vio", sensor_info::VISION},
+	{"landed", sensor_info::LANDING_STATUS},
+};
+
+constexpr int n_states = 24;
+
+class Replay
+{
+public:
+	Replay():
+		_ekf{std::make_shared<Ekf>()},
+		_sensor_simulator(_ekf)
+	{}
+
+	void setParameter(const std::string &name, const py::object &value)
+	{
+		if (!sensor_simulator::setEkfParameter(*_ekf->getParamHandle(), name, py::str(value))) {
+			throw py::value_error("invalid parameter " + name + "=" + std::string(py::str(value)));
+		}
+	}
+
+	void startSensor(const std::string &sensor_name)
+	{
+		if (!_sensor_simulator.startSensor(sensor_name)) {
+			throw py::value_error("unknown sensor " + sensor_name);
+		}
+	}
+
+	// sensor data arrays of shape (samples, 1 + values), the timestamp in
+	// microseconds followed by the values of the rows of the replay csv files
+	void load(const py::kwargs &sensor_data)
+	{
+		std::vector<sensor_info> replay_data;
+
+		for (const auto &item : sensor_data) {
+			const std::string name = py::str(item.first);
+
+			if (std::none_of(replay_sensors.begin(), replay_sensors.end(),
+			[&name](const std::pair<std::string, sensor_info::measurement_t> &sensor) { return sensor.first == name; })) {
+				throw py::value_error("unknown sensor data " + name);
+			}
+		}
+
+		for (const auto &sensor : replay_sensors) {
+			if (!sensor_data.contains(sensor.first.c_str())) {
+				continue;
+			}
+
+			auto samples = py::array_t<double, py::array::c_style | py::array::forcecast>::ensure(
+					       sensor_data[sensor.first.c_str()]);
+
+			if (!samples || samples.ndim() != 2 || samples.shape(1) < 1
+			    || samples.shape(1) > (py::ssize_t)sensor_info{}.sensor_data.size() + 1) {
+				throw py::value_error(sensor.first + " data must have the shape (samples, 1 + values) with at most "
+						      + std::to_string(sensor_info{}.sensor_data.size()) + " values");
+			}
+
+			auto values = samples.unchecked<2>();
+
+			for (py::ssize_t i = 0; i < values.shape(0); i++) {
+				sensor_info sample;
+				sample.timestamp = (uint64_t)values(i, 0);
+				sample.sensor_type = sensor.second;
+
+				for (py::ssize_t j = 1; j < values.shape(1); j++) {
+					sample.sensor_data[j - 1] = values(i, j);
+				}
+
+				replay_data.push_back(sample);
+			}
+		}
+
+		// the samples of equal timestamps keep the order of the sensors
+		std::stable_sort(replay_data.begin(), replay_data.end(),
+		[](const sensor_info & a, const sensor_info & b) { return a.timestamp < b.timestamp; });
+
+		_loaded = _sensor_simulator.loadSensorData(replay_data);
+
+		if (!_loaded) {
+			throw py::value_error(_sensor_simulator.getLoadError());
+		}
+	}
+
+	// a missing or malformed file raises ValueError instead of ending the process
+	void loadFile(const std::string &file_name)
+	{
+		if (file_name.size() > 4 && file_name.compare(file_name.size() - 4, 4, ".bin") == 0) {
+			_loaded = _sensor_simulator.loadSensorDataFromBinaryFile(file_name);
+
+		} else {
+			_loaded = _sensor_simulator.loadSensorDataFromFile(file_name);
+		}
+
+		if (!_loaded) {
+			throw py::value_error(_sensor_simulator.getLoadError());
+		}
+	}
+
+	// runs the replay for the duration and returns the output at the logging rate
+	py::dict run(float duration_seconds, float logging_rate_hz)
+	{
+		if (!_loaded) {
+			throw std::runtime_error("no sensor data loaded");
+		}
+
+		if (!(duration_seconds > 0.f) || !(logging_rate_hz > 0.f)) {
+			throw py::value_error("duration and logging rate must be positive");
+		}
+
+		const py::ssize_t n_steps = std::lround(duration_seconds * logging_rate_hz);
+		const py::ssize_t n_innovations = sensor_simulator::getInnovationNames().size();
+		const py::ssize_t n_test_ratios = sensor_simulator::getInnovationTestRatioNames().size();
+
+		py::array_t<uint64_t> timestamps(n_steps);
+		py::array_t<float> states({n_steps, (py::ssize_t)n_states});
+		py::array_t<float> variances({n_steps, (py::ssize_t)n_states});
+		py::array_t<float> innovations({n_steps, n_innovations});
+		py::array_t<float> innovation_variances({n_steps, n_innovations});
+		py::array_t<float> test_ratios({n_steps, n_test_ratios});
+
+		uint64_t *timestamp = timestamps.mutable_data();
+		float *state = states.mutable_data();
+		float *variance = variances.mutable_data();
+		float *innovation = innovations.mutable_data();
+		float *innovation_variance = innovation_variances.mutable_data();
+		float *test_ratio = test_ratios.mutable_data();
+
+		{
+			py::gil_scoped_release release;
+
+			for (py::ssize_t i = 0; i < n_steps; i++) {
+				_sensor_simulator.runReplaySeconds(1.0f / logging_rate_hz);
+
+				timestamp[i] = _ekf->get_imu_sample_delayed().time_us;
+				const matrix::Vector<float, n_states> state_vector = _ekf->getStateAtFusionHorizonAsVector();
+				const matrix::Vector<float, n_states> variance_vector = _ekf->covariances_diagonal();
+
+				for (int j = 0; j < n_states; j++) {
+					state[i * n_states + j] = state_vector(j);
+					variance[i * n_states + j] = variance_vector(j);
+				}
+
+				sensor_simulator::getInnovations(*_ekf, innovation + i * n_innovations,
+								 innovation_variance + i * n_innovations);
+				sensor_simulator::getInnovationTestRatios(*_ekf, test_ratio + i * n_test_ratios);
+			}
+		}
+
+		py::dict output;
+		output["timestamp"] = timestamps;
+		output["states"] = states;
+		output["variances"] = variances;
+		output["innovations"] = innovations;
+		output["innovation_variances"] = innovation_variances;
+		output["test_ratios"] = test_ratios;
+		return output;
+	}
+
+	uint64_t getTime() const { return _sensor_simulator.getTime(); }
+
+private:
+	std::shared_ptr<Ekf> _ekf;
+	SensorSimulator _sensor_simulator;
+	bool _loaded{false};
+};
+
+} // namespace
+
+PYBIND11_MODULE(ekf_replay, m)
+{
+	m.doc() = "Runs the EKF of the ECL on sensor data given as NumPy arrays";
+
+	m.attr("SENSOR_DATA") = [] {
+		std::vector<std::string> names;
+
+		for (const auto &sensor : replay_sensors) {
+			names.push_back(sensor.first);
+		}
+
+		return names;
+	}();
+	m.attr("INNOVATION_NAMES") = sensor_simulator::getInnovationNames();
+	m.attr("TEST_RATIO_NAMES") = sensor_simulator::getInnovationTestRatioNames();
+	m.def("parameter_names", &sensor_simulator::getEkfParameterNames, "names of the settable EKF parameters");
+
+	py::class_<Replay>(m, "Replay", "EKF with a sensor simulator replaying sensor data")
+	.def(py::init<>())
+	.def("set_parameter", &Replay::setParameter, py::arg("name"), py::arg("value"),
+	     "sets a scalar EKF parameter by its name")
+	.def("start_sensor", &Replay::startSensor, py::arg("sensor"),
+	     "starts the simulation of gps, flow, range, vio or airspeed, imu, mag and baro are always running")
+	.def("load", &Replay::load,
+	     "loads sensor data arrays given by sensor name, each of shape (samples, 1 + values) with the timestamp "
+	     "in microseconds followed by the values of the replay csv rows")
+	.def("load_file", &Replay::loadFile, py::arg("file_name"),
+	     "loads a sensor data csv file or binary replay file")
+	.def("run", &Replay::run, py::arg("duration"), py::arg("logging_rate") = 10.f,
+	     "replays the duration in seconds and returns a dict of the timestamps, states, variances, innovations, "
+	     "innovation variances and test ratios logged at the logging rate")
+	.def_property_readonly("time", &Replay::getTime, "time of the sensor simulator in microseconds");
+}
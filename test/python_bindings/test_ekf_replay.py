@@ -0,0 +1,181 @@
+"""
+Replays the datasets of test/replay_data with the ekf_replay Python module and
+compares the outputs with the change indication files written by the replays of
+test_EKF_withReplayData.cpp. The states and variances are formatted as EkfLogger
+writes them, so the outputs have to be identical. The other tests replay vio
+arrays at rest and load missing or malformed files.
+
+The test is run by CTest in the build of make test_build_python, which sets
+ECL_PYTHON_BINDINGS_DIR to the directory of the module. Without it the test is
+skipped if the module can not be imported.
+"""
+import csv
+import os
+import sys
+import numpy as np
+import pytest
+
+TEST_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPLAY_DATA = os.path.join(TEST_DIRECTORY, 'replay_data')
+
+sys.path.insert(0, os.path.join(TEST_DIRECTORY, 'sensor_simulator'))
+from runReplays import find_datasets, read_config
+
+if os.environ.get('ECL_PYTHON_BINDINGS_DIR'):
+	sys.path.insert(0, os.environ['ECL_PYTHON_BINDINGS_DIR'])
+	import ekf_replay
+else:
+	ekf_replay = pytest.importorskip('ekf_replay', reason='build the module with make test_build_python')
+
+DATASETS = [(name, csv_file) for name, _, csv_file in find_datasets(REPLAY_DATA, [], True)]
+
+
+def read_sensor_data(csv_file: str) -> dict:
+	"""
+	reads a sensor data csv file into the arrays of Replay.load, empty cells are
+	dropped as by SensorSimulator::loadSensorDataFromFile
+	:return: dict of sensor name to array of shape (samples, 1 + values)
+	"""
+	rows = {}
+	with open(csv_file) as file:
+		for row in csv.reader(file):
+			if len(row) < 2 or not row[0].isdigit():
+				continue
+			rows.setdefault(row[1], []).append([row[0]] + [cell for cell in row[2:] if cell != ''])
+
+	sensor_data = {}
+	for sensor, sensor_rows in rows.items():
+		values = np.zeros((len(sensor_rows), max(len(row) for row in sensor_rows)))
+		for i, row in enumerate(sensor_rows):
+			values[i, :len(row)] = np.array(row, dtype=np.float64)
+		sensor_data[sensor] = values
+
+	return sensor_data
+
+
+def create_replay(config: dict):
+	"""
+	creates a replay with the sensors and parameters of a replay config
+	:return:
+	"""
+	replay = ekf_replay.Replay()
+	for sensor in config["sensors"]:
+		replay.start_sensor(sensor)
+	if config["fusion_mode"] is not None:
+		replay.set_parameter("fusion_mode", config["fusion_mode"])
+	for name, value in config["parameters"].items():
+		replay.set_parameter(name, value)
+
+	return replay
+
+
+def format_output(output: dict) -> list:
+	"""
+	formats the timestamps, states and variances as the rows written by EkfLogger
+	:return: list of lines
+	"""
+	lines = []
+	for timestamp, states, variances in zip(output["timestamp"], output["states"], output["variances"]):
+		lines.append(",".join([str(timestamp)] + ["%g" % value for value in np.concatenate((states, variances))]))
+
+	return lines
+
+
+@pytest.mark.parametrize("name, csv_file", DATASETS, ids=[name for name, _ in DATASETS])
+def test_replay_is_identical_to_the_change_indication(name, csv_file):
+	config = read_config(csv_file, None)
+	if config["reference"] is None:
+		pytest.skip("%s has no change indication file" % name)
+
+	replay = create_replay(config)
+	replay.load(**read_sensor_data(csv_file))
+	output = replay.run(config["duration"], config["logging_rate"])
+
+	with open(config["reference"]) as file:
+		reference = file.read().splitlines()[1:]
+
+	assert len(output["timestamp"]) == len(reference)
+	for i, (line, reference_line) in enumerate(zip(format_output(output), reference)):
+		assert line == reference_line, "%s differs in row %i" % (name, i + 1)
+
+
+@pytest.mark.parametrize("name, csv_file", DATASETS, ids=[name for name, _ in DATASETS])
+def test_arrays_and_file_give_the_same_replay(name, csv_file):
+	config = read_config(csv_file, None)
+
+	replay = create_replay(config)
+	replay.load(**read_sensor_data(csv_file))
+	output = replay.run(config["duration"], config["logging_rate"])
+
+	file_replay = create_replay(config)
+	file_replay.load_file(csv_file)
+	file_output = file_replay.run(config["duration"], config["logging_rate"])
+
+	for key in ["timestamp", "states", "variances", "innovations", "innovation_variances", "test_ratios"]:
+		np.testing.assert_array_equal(output[key], file_output[key], err_msg=key)
+
+
+# EKF fusion_mode bit of the external vision position (MASK_USE_EVPOS)
+MASK_USE_EVPOS = 1 << 3
+
+# the vehicle at rest, each value is held until the next sample of the sensor
+REST_DATA = {
+	"imu": np.array([[0, 0.0, 0.0, -9.80665, 0.0, 0.0, 0.0]]),
+	"mag": np.array([[0, 0.2, 0.0, 0.4]]),
+	"baro": np.array([[0, 0.0]]),
+}
+
+
+def replay_at_rest(vio_position: list = None) -> dict:
+	"""
+	replays 10 s at rest with the external vision position fused, at the vio
+	position or at the origin of the data at rest if None
+	:return: output of Replay.run
+	"""
+	replay = ekf_replay.Replay()
+	replay.start_sensor("vio")
+	replay.set_parameter("fusion_mode", MASK_USE_EVPOS)
+
+	sensor_data = dict(REST_DATA)
+	if vio_position is not None:
+		# position, orientation quaternion and velocity
+		sensor_data["vio"] = np.array([[0] + vio_position + [1.0, 0.0, 0.0, 0.0] + [0.0, 0.0, 0.0]])
+	replay.load(**sensor_data)
+
+	return replay.run(10.0)
+
+
+def test_vio_samples_set_the_external_vision_position():
+	output = replay_at_rest([1.5, -0.5, 0.0])
+	rest_output = replay_at_rest()
+	ev_pos_x = list(ekf_replay.INNOVATION_NAMES).index("ev_pos_x")
+
+	# states 7 to 9 are the NED position
+	np.testing.assert_allclose(output["states"][-1, 7:9], [1.5, -0.5], atol=0.1)
+	np.testing.assert_allclose(rest_output["states"][-1, 7:9], [0.0, 0.0], atol=0.1)
+	assert output["innovation_variances"][-1, ev_pos_x] > 0.0
+	assert rest_output["innovation_variances"][-1, ev_pos_x] > 0.0
+
+
+def test_vio_data_has_at_most_ten_values():
+	replay = ekf_replay.Replay()
+
+	with pytest.raises(ValueError):
+		replay.load(vio=np.zeros((1, 12)), **REST_DATA)
+
+
+def test_missing_or_malformed_file_is_a_value_error(tmp_path):
+	replay = ekf_replay.Replay()
+	malformed_file = tmp_path / 'malformed.csv'
+	malformed_file.write_text('1000,baro,488.0\n2000,gyro,0.1\n')
+	unsorted_file = tmp_path / 'unsorted.csv'
+	unsorted_file.write_text('2000,baro,488.0\n1000,baro,488.1\n')
+
+	for file_name in [tmp_path / 'missing.csv', tmp_path / 'missing.bin', malformed_file, unsorted_file]:
+		with pytest.raises(ValueError):
+			replay.load_file(str(file_name))
+
+	# the failed loads leave the replay without sensor data
+	with pytest.raises(RuntimeError):
+		replay.run(1.0)
+
@@ -0,0 +1,206 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import glob
+import json
+import os
+import time
+import traceback
+from createSensorDataFile import SENSOR_GETTERS, ConversionError, convert_ulog
+
+
+def get_arguments():
+	"""
+	parses the command line arguments
+	:return:
+	"""
+	parser = argparse.ArgumentParser(
+	description='Create the csv files with sensor data values in chronological order of all ulog files'
+			' in directories or matching glob patterns.')
+	parser.add_argument('inputs', nargs='+', metavar='directory|pattern',
+		help='directories searched for *.ulg files or glob patterns of ulog files')
+	parser.add_argument('-o', '--output-dir', default=None,
+		help='directory of the csv files (default: next to each ulog file)')
+	parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+		help='number of logs converted in parallel processes (default: number of cores)')
+	parser.add_argument('--manifest', default=None,
+		help='manifest file (default: manifest.json in the output directory or the current directory)')
+	parser.add_argument('--force', action='store_true',
+		help='also convert logs whose csv file is newer than the log')
+	parser.add_argument('--sensors', nargs='+', choices=list(SENSOR_GETTERS), default=list(SENSOR_GETTERS),
+		help='sensors written to the csv files (default: all)')
+	parser.add_argument('--binary', action='store_true',
+		help='also write binary replay files next to the csv files')
+	return parser.parse_args()
+
+
+def find_ulog_files(inputs: list) -> list:
+	"""
+	returns the ulog files in the directories, searched recursively, and matching
+	the glob patterns
+	:return: sorted list of file paths
+	"""
+	files = set()
+
+	for pattern in inputs:
+		if os.path.isdir(pattern):
+			pattern = os.path.join(pattern, '**', '*.ulg')
+		files.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+
+	return sorted(files)
+
+
+def get_output_file(input_file: str, output_dir: str = None) -> str:
+	"""
+	returns the csv file of the ulog file
+	:return:
+	"""
+	output_file = os.path.splitext(input_file)[0] + '.csv'
+	if output_dir is not None:
+		output_file = os.path.join(output_dir, os.path.basename(output_file))
+
+	return output_file
+
+
+def get_binary_file(output_file: str) -> str:
+	"""
+	returns the binary replay file written next to the csv file
+	:return:
+	"""
+	return os.path.splitext(output_file)[0] + '.bin'
+
+
+def is_up_to_date(input_file: str, output_files: list) -> bool:
+	"""
+	checks whether the output files were written after the ulog file was modified
+	:return:
+	"""
+	return all(os.path.isfile(output_file) and os.path.getmtime(output_file) > os.path.getmtime(input_file)
+		for output_file in output_files)
+
+
+def convert(input_file: str, output_file: str, sensors: list, binary: bool = False) -> dict:
+	"""
+	converts one ulog file, the errors are returned in the manifest entry so that
+	a failing log does not stop the conversion of the others
+	:return: manifest entry of the log
+	"""
+	entry = {"input": input_file, "output": output_file}
+	output_files = [output_file]
+	if binary:
+		entry["binary_output"] = get_binary_file(output_file)
+		output_files.append(entry["binary_output"])
+	start_time = time.perf_counter()
+
+	try:
+		# the files are renamed when complete so that a failed conversion does
+		# not leave a file which looks up to date
+		result = convert_ulog(input_file, output_file + '.partial', sensors,
+			binary_file=entry["binary_output"] + '.partial' if binary else None)
+		for file_name in output_files:
+			os.replace(file_name + '.partial', file_name)
+		entry.update(status="converted", **result)
+		entry["total_rows"] = sum(result["rows"].values())
+	except ConversionError as error:
+		entry.update(status="failed", error=str(error))
+	except Exception as error:
+		entry.update(status="failed", error=repr(error), traceback=traceback.format_exc())
+	finally:
+		for file_name in output_files:
+			if os.path.isfile(file_name + '.partial'):
+				os.remove(file_name + '.partial')
+
+	entry["conversion_time"] = time.perf_counter() - start_time
+
+	return entry
+
+
+def read_manifest(file_name: str) -> dict:
+	"""
+	reads the entries of a previous manifest, the entries of skipped logs are kept
+	:return: dict of input file to manifest entry
+	"""
+	try:
+		with open(file_name) as file:
+			return {entry["input"]: entry for entry in json.load(file)["logs"]}
+	except (OSError, ValueError, KeyError, TypeError):
+		return {}
+
+
+def write_manifest(entries: list, file_name: str) -> None:
+	"""
+	writes the manifest entries of all logs to a json file
+	:return:
+	"""
+	counts = {}
+	for entry in entries:
+		counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+
+	with open(file_name, 'w') as file:
+		json.dump({"summary": counts, "logs": entries}, file, indent=4)
+		file.write("\n")
+
+
+def main() -> None:
+	"""
+	main entry point
+	:return:
+	"""
+	args = get_arguments()
+	input_files = find_ulog_files(args.inputs)
+
+	if not input_files:
+		print("No ulog files found")
+		exit(-1)
+
+	if args.output_dir is not None:
+		os.makedirs(args.output_dir, exist_ok=True)
+	manifest_file = args.manifest or os.path.join(args.output_dir or '.', 'manifest.json')
+	previous_entries = read_manifest(manifest_file)
+
+	output_files = [get_output_file(input_file, args.output_dir) for input_file in input_files]
+	if len(set(output_files)) < len(output_files):
+		print("Ulog files in different directories have the same name, they can not be written to one output directory")
+		exit(-1)
+
+	entries = {}
+	conversions = []
+	for input_file, output_file in zip(input_files, output_files):
+		expected_files = [output_file, get_binary_file(output_file)] if args.binary else [output_file]
+		if not args.force and is_up_to_date(input_file, expected_files):
+			entry = dict(previous_entries.get(input_file, {}), input=input_file, output=output_file)
+			entry["status"] = "skipped"
+			entry.pop("error", None)
+			entry.pop("traceback", None)
+			entries[input_file] = entry
+		else:
+			conversions.append((input_file, output_file))
+
+	print("Converting %i of %i ulog files" % (len(conversions), len(input_files)))
+
+	if conversions:
+		with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(conversions)))) as executor:
+			futures = [executor.submit(convert, input_file, output_file, args.sensors, args.binary)
+				for input_file, output_file in conversions]
+			for future in as_completed(futures):
+				entry = future.result()
+				entries[entry["input"]] = entry
+				if entry["status"] == "failed":
+					print("FAILED    %s: %s" % (entry["input"], entry["error"]))
+				else:
+					print("converted %s: %i rows in %.2f s" % (entry["input"], entry["total_rows"],
+						entry["conversion_time"]))
+
+	entries = [entries[input_file] for input_file in input_files]
+	write_manifest(entries, manifest_file)
+
+	failures = [entry for entry in entries if entry["status"] == "failed"]
+	print("%i converted, %i skipped, %i failed, manifest written to %s" % (
+		sum(entry["status"] == "converted" for entry in entries),
+		sum(entry["status"] == "skipped" for entry in entries), len(failures), manifest_file))
+
+	if failures:
+		exit(1)
+
+
+if __name__ == '__main__':
+	main()
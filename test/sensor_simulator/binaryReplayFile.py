@@ -0,0 +1,263 @@
+"""
+Binary replay files, a compact and memory mappable form of the sensor data csv
+files which SensorSimulator::loadSensorDataFromBinaryFile iterates without
+parsing. The layout is described in replay_file.h, all values are little endian:
+
+	header        magic, version, number of sections, number of samples and
+	              offset of the time index
+	section table per sensor type: sensor type, number of values, size of the
+	              values (4 or 8 bytes), number of records, offset and size of
+	              the records
+	time index    (section, record) of each sample in chronological order
+	records       per section fixed width records of a uint64 timestamp and the
+	              values of the sensor
+
+The values of a record are the cells of the csv row in the same order, so that
+the sensor simulator gets the same data from both files. They are stored as
+float32 if each cell of the sensor is the shortest representation of a float32,
+which is the case for all sensors written from float32 log fields, else float64.
+"""
+import argparse
+import numpy as np
+
+MAGIC = b'ECLRPLAY'
+VERSION = 1
+
+# sensor types of the sections, the values of sensor_info::measurement_t
+SENSOR_TYPES = {
+	"imu": 0,
+	"mag": 1,
+	"baro": 2,
+	"gps": 3,
+	"airspeed": 4,
+	"range": 5,
+	"flow": 6,
+	"vio": 7,
+	"landed": 8,
+}
+
+# maximum number of values of a sample, the size of sensor_info::sensor_data
+MAX_VALUES = 10
+
+HEADER_TYPE = np.dtype([('magic', 'S8'), ('version', '<u4'), ('n_sections', '<u4'), ('n_samples', '<u8'),
+	('index_offset', '<u8')])
+SECTION_TYPE = np.dtype([('sensor_type', '<u4'), ('n_values', '<u2'), ('value_size', '<u2'), ('n_records', '<u8'),
+	('records_offset', '<u8'), ('record_size', '<u8')])
+INDEX_TYPE = np.dtype([('section', '<u4'), ('record', '<u4')])
+
+
+def get_record_type(n_values: int, value_type: np.dtype) -> np.dtype:
+	"""
+	returns the type of the packed records of a section
+	:return:
+	"""
+	return np.dtype([('timestamp', '<u8'), ('values', np.dtype(value_type).newbyteorder('<'), (n_values,))])
+
+
+def get_record_values(cells: list) -> np.ndarray:
+	"""
+	converts the cells of csv rows to the values of their records, empty cells are
+	dropped as in the csv rows and the values after them move up
+	:param cells: list of string arrays, one per column
+	:return: float64 array of shape (rows, columns)
+	"""
+	strings = np.stack(cells, axis=1) if cells else np.empty((0, 0), dtype=str)
+	empty = strings == ''
+
+	if not empty.any():
+		return strings.astype(np.float64)
+
+	values = np.zeros(strings.shape, dtype=np.float64)
+	for row, row_strings in enumerate(strings):
+		row_strings = row_strings[row_strings != '']
+		values[row, :len(row_strings)] = row_strings.astype(np.float64)
+
+	return values
+
+
+def is_float32_representation(cells: list) -> bool:
+	"""
+	checks whether each non empty cell is the shortest representation of a float32
+	value, which the value is converted from by the sensor simulator
+	:return:
+	"""
+	for strings in cells:
+		strings = strings[strings != '']
+		if np.any(strings.astype(np.float64).astype(np.float32).astype(str) != strings):
+			return False
+
+	return True
+
+
+class ReplayFileWriter:
+	"""
+	collects the records of each sensor and the order of the samples, then writes
+	the binary replay file. The sections are in the order of the sensor types
+	"""
+
+	def __init__(self, sensors: list):
+		self.sections = {}
+		self.index = []
+
+		for sensor in sorted(sensors, key=lambda sensor: SENSOR_TYPES[sensor]):
+			self.sections[sensor] = {"timestamps": [], "values": [], "n_records": 0, "float32": True}
+
+	def add_samples(self, sensor: str, timestamps: np.ndarray, cells: list) -> np.ndarray:
+		"""
+		adds the samples of a sensor, given by the cells of their csv rows
+		:return: time index entries of the samples
+		"""
+		return self.add_values(sensor, timestamps, get_record_values(cells), is_float32_representation(cells))
+
+	def add_values(self, sensor: str, timestamps: np.ndarray, values: np.ndarray, float32: bool = None) -> np.ndarray:
+		"""
+		adds the samples of a sensor, given by their values. They are stored as
+		float32 if float32 is set, by default if the values are float32, and all
+		other samples of the sensor are too
+		:return: time index entries of the samples
+		"""
+		section = self.sections[sensor]
+
+		if float32 is None:
+			float32 = values.dtype == np.float32
+		values = np.asarray(values, dtype=np.float64)
+		if values.shape[1] > MAX_VALUES:
+			raise ValueError("%s samples have %i values, at most %i are supported" % (sensor, values.shape[1],
+				MAX_VALUES))
+
+		section["float32"] = section["float32"] and float32
+		section["timestamps"].append(np.asarray(timestamps, dtype=np.uint64))
+		section["values"].append(values)
+
+		entries = np.empty(len(values), dtype=INDEX_TYPE)
+		entries['section'] = list(self.sections).index(sensor)
+		entries['record'] = np.arange(section["n_records"], section["n_records"] + len(values))
+		section["n_records"] += len(values)
+
+		return entries
+
+	def add_index(self, entries: np.ndarray) -> None:
+		"""
+		appends time index entries in chronological order
+		:return:
+		"""
+		self.index.append(entries)
+
+	def write(self, file_name: str) -> None:
+		"""
+		writes the binary replay file
+		:return:
+		"""
+		index = np.concatenate(self.index) if self.index else np.empty(0, dtype=INDEX_TYPE)
+
+		# sensors without samples have no section
+		sections = {sensor: section for sensor, section in self.sections.items() if section["n_records"] > 0}
+		section_numbers = np.cumsum([section["n_records"] > 0 for section in self.sections.values()]) - 1
+		index['section'] = section_numbers[index['section']] if len(index) > 0 else index['section']
+
+		header = np.zeros(1, dtype=HEADER_TYPE)
+		header['magic'] = MAGIC
+		header['version'] = VERSION
+		header['n_sections'] = len(sections)
+		header['n_samples'] = len(index)
+		header['index_offset'] = HEADER_TYPE.itemsize + len(sections) * SECTION_TYPE.itemsize
+
+		table = np.zeros(len(sections), dtype=SECTION_TYPE)
+		records = []
+		offset = int(header['index_offset'][0]) + index.nbytes
+
+		for i, (sensor, section) in enumerate(sections.items()):
+			values = np.concatenate(section["values"])
+			value_type = np.float32 if section["float32"] else np.float64
+			record_type = get_record_type(values.shape[1], value_type)
+
+			section_records = np.empty(len(values), dtype=record_type)
+			section_records['timestamp'] = np.concatenate(section["timestamps"])
+			section_records['values'] = values.reshape(len(values), values.shape[1])
+
+			table[i] = (SENSOR_TYPES[sensor], values.shape[1], np.dtype(value_type).itemsize, len(values),
+				offset, record_type.itemsize)
+			records.append(section_records)
+			offset += section_records.nbytes
+
+		with open(file_name, 'wb') as file:
+			file.write(header.tobytes())
+			file.write(table.tobytes())
+			file.write(index.tobytes())
+			for section_records in records:
+				file.write(section_records.tobytes())
+
+
+def read_replay_file(file_name: str) -> tuple:
+	"""
+	memory maps a binary replay file
+	:return: (dict of sensor name to record array, time index array)
+	"""
+	data = np.memmap(file_name, dtype=np.uint8, mode='r')
+	header = data[:HEADER_TYPE.itemsize].view(HEADER_TYPE)[0]
+
+	if header['magic'] != MAGIC or header['version'] != VERSION:
+		raise ValueError("%s is not a binary replay file of version %i" % (file_name, VERSION))
+
+	sensor_names = {sensor_type: sensor for sensor, sensor_type in SENSOR_TYPES.items()}
+	table_end = HEADER_TYPE.itemsize + int(header['n_sections']) * SECTION_TYPE.itemsize
+	table = data[HEADER_TYPE.itemsize:table_end].view(SECTION_TYPE)
+
+	sections = {}
+	for section in table:
+		value_type = np.float32 if section['value_size'] == 4 else np.float64
+		record_type = get_record_type(int(section['n_values']), value_type)
+		start = int(section['records_offset'])
+		end = start + int(section['n_records']) * record_type.itemsize
+		sections[sensor_names[int(section['sensor_type'])]] = data[start:end].view(record_type)
+
+	index_offset = int(header['index_offset'])
+	index = data[index_offset:index_offset + int(header['n_samples']) * INDEX_TYPE.itemsize].view(INDEX_TYPE)
+
+	return sections, index
+
+
+def convert_csv_file(csv_file: str, replay_file: str) -> int:
+	"""
+	converts a sensor data csv file to a binary replay file
+	:return: number of samples
+	"""
+	with open(csv_file) as file:
+		rows = [line.rstrip('\r\n').split(',') for line in file if line.strip()]
+
+	sensors = np.array([row[1] for row in rows])
+	timestamps = np.array([int(row[0]) for row in rows], dtype=np.uint64)
+	entries = np.empty(len(rows), dtype=INDEX_TYPE)
+
+	for sensor in dict.fromkeys(sensors):
+		if sensor not in SENSOR_TYPES:
+			raise ValueError("unknown sensor type %s in %s" % (sensor, csv_file))
+
+	writer = ReplayFileWriter(list(dict.fromkeys(sensors)))
+	for sensor in writer.sections:
+		selected = np.flatnonzero(sensors == sensor)
+		n_columns = max(len(rows[i]) for i in selected) - 2
+		cells = [np.array([rows[i][j + 2] if j + 2 < len(rows[i]) else '' for i in selected]) for j in range(n_columns)]
+		entries[selected] = writer.add_samples(sensor, timestamps[selected], cells)
+
+	writer.add_index(entries)
+	writer.write(replay_file)
+
+	return len(rows)
+
+
+def main() -> None:
+	"""
+	main entry point
+	:return:
+	"""
+	parser = argparse.ArgumentParser(description='Convert a sensor data csv file to a binary replay file.')
+	parser.add_argument('input_file', metavar='file.csv', help='csv input file path')
+	parser.add_argument('output_file', metavar='file.bin', help='binary replay output file path')
+	args = parser.parse_args()
+
+	print("%i samples written" % convert_csv_file(args.input_file, args.output_file))
+
+
+if __name__ == '__main__':
+	main()
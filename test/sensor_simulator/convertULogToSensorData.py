@@ -1,6 +1,19 @@
 from pyulog import ULog
 import pandas as pd
 
+def readsTopic(topic: str):
+	"""
+	marks the decorated getter with the ulog topic it reads, so that only the
+	topics of the sensors which are converted need to be loaded
+	:return:
+	"""
+	def decorator(getter):
+		getter.topic = topic
+		return getter
+	return decorator
+
+
+@readsTopic("vehicle_visual_odometry")
 def getVioData(ulog: ULog) -> pd.DataFrame:
 
 	vehicle_visual_odometry = ulog.get_dataset("vehicle_visual_odometry").data
@@ -20,6 +33,7 @@ def getVioData(ulog: ULog) -> pd.DataFrame:
 	return vio
 
 
+@readsTopic("optical_flow")
 def getOpticalFlowData(ulog: ULog) -> pd.DataFrame:
 
 	optical_flow = ulog.get_dataset("optical_flow").data
@@ -35,6 +49,7 @@ def getOpticalFlowData(ulog: ULog) -> pd.DataFrame:
 	return flow
 
 
+@readsTopic("airspeed")
 def getAirspeedData(ulog: ULog) -> pd.DataFrame:
 
 	airspeed = ulog.get_dataset("airspeed").data
@@ -46,6 +61,7 @@ def getAirspeedData(ulog: ULog) -> pd.DataFrame:
 	return airspeed
 
 
+@readsTopic("distance_sensor")
 def getRangeFinderData(ulog: ULog) -> pd.DataFrame:
 
 	range = pd.DataFrame()
@@ -57,7 +73,7 @@ def getRangeFinderData(ulog: ULog) -> pd.DataFrame:
 			'quality': range_0["signal_quality"]
 			})
 		range = pd.concat([range, rng_0], ignore_index=True, sort=False)
-	except:
+	except IndexError:
 		pass
 
 	try:
@@ -68,7 +84,7 @@ def getRangeFinderData(ulog: ULog) -> pd.DataFrame:
 			'quality': range_1["signal_quality"]
 			})
 		range = pd.concat([range, rng_1], ignore_index=True, sort=False)
-	except:
+	except IndexError:
 		pass
 
 	try:
@@ -79,12 +95,13 @@ def getRangeFinderData(ulog: ULog) -> pd.DataFrame:
 			'quality': range_2["signal_quality"]
 			})
 		range = pd.concat([range, rng_2], ignore_index=True, sort=False)
-	except:
+	except IndexError:
 		pass
 
 	return range
 
 
+@readsTopic("vehicle_gps_position")
 def getGpsData(ulog: ULog) -> pd.DataFrame:
 
 	vehicle_gps_position = ulog.get_dataset("vehicle_gps_position").data
@@ -100,6 +117,7 @@ def getGpsData(ulog: ULog) -> pd.DataFrame:
 	return gps
 
 
+@readsTopic("vehicle_air_data")
 def getBarometerData(ulog: ULog) -> pd.DataFrame:
 
 	vehicle_air_data = ulog.get_dataset("vehicle_air_data").data
@@ -109,6 +127,7 @@ def getBarometerData(ulog: ULog) -> pd.DataFrame:
 	return baro
 
 
+@readsTopic("vehicle_magnetometer")
 def getMagnetometerData(ulog: ULog) -> pd.DataFrame:
 
 	vehicle_magnetometer = ulog.get_dataset("vehicle_magnetometer").data
@@ -120,6 +139,7 @@ def getMagnetometerData(ulog: ULog) -> pd.DataFrame:
 	return mag
 
 
+@readsTopic("sensor_combined")
 def getImuData(ulog: ULog) -> pd.DataFrame:
 
 	sensor_combined = ulog.get_dataset("sensor_combined").data
@@ -133,6 +153,7 @@ def getImuData(ulog: ULog) -> pd.DataFrame:
 		'gyro_rad[2]': sensor_combined["gyro_rad[2]"]})
 	return imu
 
+@readsTopic("vehicle_land_detected")
 def getVehicleLandingStatus(ulog: ULog) -> pd.DataFrame:
 	vehicle_land_detected = ulog.get_dataset("vehicle_land_detected").data
 	land = pd.DataFrame({'timestamp': vehicle_land_detected['timestamp'],
@@ -1,12 +1,37 @@
 from pyulog import ULog
 import argparse
-import pandas as pd
-import csv
+import numpy as np
 import convertULogToSensorData as util
+from binaryReplayFile import ReplayFileWriter
 
 path = "/home/kamil/Documents/QGroundControl/Logs/iris_vision.ulg"
 output_path = "/home/kamil/Documents/QGroundControl/Logs/sensor_data_iris_vision.csv"
 
+# the first 0.5 seconds of data are removed to be robust against faulty initialized data
+TRIM_DURATION_US = 500000
+
+# maximum number of rows taken from each sensor for one block of the merge
+MERGE_BLOCK_ROWS = 65536
+
+# the sensor data getters in the order their rows are written for equal timestamps
+SENSOR_GETTERS = {
+	"imu": util.getImuData,
+	"mag": util.getMagnetometerData,
+	"baro": util.getBarometerData,
+	"gps": util.getGpsData,
+	"airspeed": util.getAirspeedData,
+	"flow": util.getOpticalFlowData,
+	"range": util.getRangeFinderData,
+	"vio": util.getVioData,
+	"landed": util.getVehicleLandingStatus,
+}
+
+
+class ConversionError(Exception):
+	"""
+	raised if a ulog file can not be converted, the message describes the reason
+	"""
+
 
 def get_arguments():
 	"""
@@ -18,106 +43,278 @@ def get_arguments():
 			'ulog file.')
 	parser.add_argument('input_file', metavar='file.ulg', help='ULog input file path')
 	parser.add_argument('output_file', metavar='file.ulg', help='csv output file path')
-	return parser.parse_args()
+	parser.add_argument('--sensors', nargs='+', choices=list(SENSOR_GETTERS), default=list(SENSOR_GETTERS),
+		help='sensors written to the csv file (default: all)')
+	parser.add_argument('--start', type=float, default=None,
+		help='start of the converted data in seconds since the start of the log')
+	parser.add_argument('--end', type=float, default=None,
+		help='end of the converted data in seconds since the start of the log')
+	parser.add_argument('--binary', metavar='file.bin', default=None,
+		help='also write the sensor data to a binary replay file')
+	args = parser.parse_args()
+	if args.start is not None and args.end is not None and args.end <= args.start:
+		parser.error('--end must be later than --start')
+	return args
 
-def main() -> None:
+
+def get_topics(sensors: list) -> list:
 	"""
-	main entry point
-	:return:
+	returns the ulog topics read by the getters of the sensors
+	:return: list of topic names
 	"""
-	args = get_arguments()
+	topics = []
 
-	table = pd.DataFrame()
+	for sensor in sensors:
+		topic = SENSOR_GETTERS[sensor].topic
+		if topic not in topics:
+			topics.append(topic)
 
-	try:
-		ulog = ULog(args.input_file)
-	except:
-		print("Could not find ulog file")
-		exit(-1)
+	return topics
 
-	try:
-		imu = util.getImuData(ulog)
-		print("IMU data detected")
-		table = pd.concat([table, imu], ignore_index=True, sort=False)
-	except:
-		print("IMU data not detected")
 
+def load_ulog(file_name: str, sensors: list) -> ULog:
+	"""
+	loads only the topics of the sensors from the ulog file
+	:return:
+	"""
 	try:
-		mag = util.getMagnetometerData(ulog)
-		print("Mag data detected")
-		table = pd.concat([table, mag], ignore_index=True, sort=False)
-	except:
-		print("Mag data not detected")
+		return ULog(file_name, message_name_filter_list=get_topics(sensors))
+	except OSError as error:
+		raise ConversionError("could not open ulog file: " + str(error)) from error
+	except Exception as error:
+		raise ConversionError("could not parse ulog file: " + repr(error)) from error
 
-	try:
-		baro = util.getBarometerData(ulog)
-		print("Baro data detected")
-		table = pd.concat([table, baro], ignore_index=True, sort=False)
-	except:
-		print("Baro data not detected")
 
-	try:
-		gps = util.getGpsData(ulog)
-		print("GPS data detected")
-		table = pd.concat([table, gps], ignore_index=True, sort=False)
-	except:
-		print("GPS data not detected")
+def get_time_window(ulog: ULog, start: float = None, end: float = None) -> tuple:
+	"""
+	converts a time window in seconds since the start of the log to ulog timestamps
+	:return: (start timestamp, end timestamp), None if not limited
+	"""
+	start_time = ulog.start_timestamp + int(round(start * 1e6)) if start is not None else None
+	end_time = ulog.start_timestamp + int(round(end * 1e6)) if end is not None else None
 
-	try:
-		airspeed = util.getAirspeedData(ulog)
-		print("Airspeed data detected")
-		table = pd.concat([table, airspeed], ignore_index=True, sort=False)
-	except:
-		print("Airspeed data not detected")
+	return start_time, end_time
 
-	try:
-		flow = util.getOpticalFlowData(ulog)
-		print("Flow data detected")
-		table = pd.concat([table, flow], ignore_index=True, sort=False)
-	except:
-		print("Flow data not detected")
 
-	try:
-		range = util.getRangeFinderData(ulog)
-		print("Range data detected")
-		table = pd.concat([table, range], ignore_index=True, sort=False)
-	except:
-		print("Range data not detected")
+def get_sensor_data(ulog: ULog, sensors: list = None, time_window: tuple = (None, None)) -> dict:
+	"""
+	reads the data of the sensors found in the ulog, limited to the samples within
+	the time window. A sensor is not detected if the ulog has no data of its topic
+	:return: dict of sensor name to DataFrame, for the detected sensors
+	"""
+	tables = {}
+	start_time, end_time = time_window
 
-	try:
-		vio = util.getVioData(ulog)
-		print("VIO data detected")
-		table = pd.concat([table, vio], ignore_index=True, sort=False)
-	except:
-		print("VIO data not detected")
+	for name, getter in SENSOR_GETTERS.items():
+		if sensors is not None and name not in sensors:
+			continue
+		try:
+			table = getter(ulog)
+		except IndexError:
+			continue
+		except KeyError as error:
+			raise ConversionError("%s data has no field %s in topic %s" % (name, error, getter.topic)) from error
+
+		if len(table) == 0:
+			continue
+		if start_time is not None:
+			table = table[table['timestamp'] >= start_time]
+		if end_time is not None:
+			table = table[table['timestamp'] <= end_time]
+		tables[name] = table
+
+	return tables
+
+
+def get_column_types(tables: list) -> dict:
+	"""
+	returns the columns of the sensor data in the order of the csv rows with the
+	type they are formatted as. This is the type pandas gives the column of all
+	sensor data concatenated, integer columns become float if a sensor lacks them
+	:return: dict of column name to numpy dtype
+	"""
+	column_types = {}
+
+	for table in tables:
+		for column in table.columns:
+			if column in ('timestamp', 'sensor'):
+				continue
+			dtype = table[column].to_numpy().dtype
+			column_types[column] = np.result_type(column_types[column], dtype) if column in column_types else dtype
+
+	for column, dtype in column_types.items():
+		if dtype.kind in 'iub' and any(column not in table.columns for table in tables):
+			column_types[column] = np.dtype(object) if dtype.kind == 'b' else np.dtype(np.float64)
+
+	return column_types
+
+
+class SensorRows:
+	"""
+	the rows of one sensor, sorted by timestamp, with the values already in the
+	type and column order of the csv file
+	"""
+
+	def __init__(self, table, column_types: dict):
+		timestamps = table['timestamp'].to_numpy()
+		order = None
+
+		if np.any(timestamps[1:] < timestamps[:-1]):
+			order = np.argsort(timestamps, kind='stable')
+			timestamps = timestamps[order]
+
+		self.timestamps = timestamps
+		self.sensor = table['sensor'].to_numpy()
+		self.columns = []
+
+		for column, dtype in column_types.items():
+			if column in table.columns:
+				values = table[column].to_numpy().astype(dtype)
+				self.columns.append(values if order is None else values[order])
+
+		if order is not None:
+			self.sensor = self.sensor[order]
+
+		self.position = 0
+
+	def format_values(self, start: int, end: int) -> list:
+		"""
+		formats the values of the rows from start to end as they are written to the
+		csv file, missing values are empty strings
+		:return: list of string arrays, one per column
+		"""
+		cells = []
+
+		for values in self.columns:
+			values = values[start:end]
+			strings = values.astype(str)
+			if values.dtype.kind == 'f':
+				missing = np.isnan(values)
+				if missing.any():
+					strings[missing] = ''
+			cells.append(strings)
+
+		return cells
+
+	def format_rows(self, start: int, end: int, time_offset: int, value_cells: list) -> list:
+		"""
+		formats the rows from start to end as csv lines without empty cells
+		:return: list of strings
+		"""
+		cells = [(self.timestamps[start:end] - time_offset).astype(str), self.sensor[start:end].astype(str)]
+		cells.extend(value_cells)
+
+		if any((strings == '').any() for strings in value_cells):
+			return [",".join(cell for cell in row if cell != '') for row in zip(*cells)]
+
+		return [",".join(row) for row in zip(*cells)]
+
+
+def write_sensor_data(tables: dict, output_file: str, binary_file: str = None, time_offset: int = None) -> dict:
+	"""
+	writes the rows of all sensors in chronological order to the csv file, the
+	samples after time_offset with the timestamps relative to it, by default
+	TRIM_DURATION_US after the first sample. Each sensor is
+	already sorted, the sensors are merged in blocks so only one block of rows is
+	formatted at a time. The same samples are written to the binary replay file if
+	one is given
+	:return: dict of sensor name to number of rows written
+	"""
+	tables = {name: table for name, table in tables.items() if len(table) > 0}
+	column_types = get_column_types(list(tables.values()))
+	sensors = [SensorRows(table, column_types) for table in tables.values()]
+	n_rows = dict.fromkeys(tables, 0)
+	binary_writer = ReplayFileWriter(list(tables)) if binary_file is not None else None
+
+	if not sensors:
+		open(output_file, 'w').close()
+		if binary_writer is not None:
+			binary_writer.write(binary_file)
+		return n_rows
+
+	if time_offset is None:
+		time_offset = min(sensor.timestamps[0] for sensor in sensors) + TRIM_DURATION_US
+
+	for name, sensor in zip(tables, sensors):
+		sensor.position = int(np.searchsorted(sensor.timestamps, time_offset, side='right'))
+		n_rows[name] = len(sensor.timestamps) - sensor.position
+
+	with open(output_file, 'w', newline='') as out_file:
+		while True:
+			active = [sensor for sensor in sensors if sensor.position < len(sensor.timestamps)]
+			if not active:
+				break
+
+			# all rows up to the end of the block which ends first, at most
+			# MERGE_BLOCK_ROWS rows of each sensor apart from equal timestamps
+			block_end_time = min(sensor.timestamps[min(sensor.position + MERGE_BLOCK_ROWS, len(sensor.timestamps)) - 1]
+				for sensor in active)
+
+			rows = []
+			timestamps = []
+			index_entries = []
+			for name, sensor in zip(tables, sensors):
+				if sensor.position == len(sensor.timestamps):
+					continue
+				end = int(np.searchsorted(sensor.timestamps, block_end_time, side='right'))
+				value_cells = sensor.format_values(sensor.position, end)
+				rows.extend(sensor.format_rows(sensor.position, end, time_offset, value_cells))
+				timestamps.append(sensor.timestamps[sensor.position:end])
+				if binary_writer is not None:
+					index_entries.append(binary_writer.add_samples(name, timestamps[-1] - time_offset, value_cells))
+				sensor.position = end
+
+			# rows with equal timestamps keep the order of the sensors
+			order = np.argsort(np.concatenate(timestamps), kind='stable')
+			out_file.write("".join(rows[index] + "\r\n" for index in order))
+			if binary_writer is not None:
+				binary_writer.add_index(np.concatenate(index_entries)[order])
+
+	if binary_writer is not None:
+		binary_writer.write(binary_file)
+
+	return n_rows
+
+
+def convert_ulog(input_file: str, output_file: str, sensors: list = None, start: float = None,
+		end: float = None, binary_file: str = None) -> dict:
+	"""
+	converts the sensor data of a ulog file to a csv file and optionally a binary
+	replay file
+	:return: dict with the duration of the log in seconds, the detected sensors and
+	the number of rows written per sensor
+	"""
+	if sensors is None:
+		sensors = list(SENSOR_GETTERS)
+
+	ulog = load_ulog(input_file, sensors)
+	tables = get_sensor_data(ulog, sensors, get_time_window(ulog, start, end))
 
 	try:
-		land = util.getVehicleLandingStatus(ulog)
-		print("Landing data detected")
-		table = pd.concat([table, land], ignore_index=True, sort=False)
-	except:
-		print("Landing data not detected")
-
-	table = table.sort_values('timestamp', axis=0, ascending=True)
-	table['timestamp'] = table['timestamp'] - table['timestamp'].iloc[0]
-	# remove the first 0.5 seconds of data to be robust against faulty initialized data
-	table = table[table.timestamp > 500000]
-	table.timestamp = table.timestamp - 500000
+		rows = write_sensor_data(tables, output_file, binary_file)
+	except OSError as error:
+		raise ConversionError("could not write to output file: " + str(error)) from error
+
+	return {"duration": (ulog.last_timestamp - ulog.start_timestamp) / 1e6,
+		"sensors": list(tables),
+		"rows": rows}
+
+
+def main() -> None:
+	"""
+	main entry point
+	:return:
+	"""
+	args = get_arguments()
 
 	try:
-		table.to_csv(args.output_file, index=None, header=None)
-
-		# post processing remove empty cells from csv
-		result = []
-		with open(args.output_file, "r") as in_file:
-			reader = csv.reader(in_file)
-			result = [[item for item in row if item != ''] for row in reader]
-
-		with open(args.output_file, "w") as out_file:
-			csv_writer = csv.writer(out_file)
-			csv_writer.writerows(result)
-	except:
-		print("Could not write to specified output file")
+		result = convert_ulog(args.input_file, args.output_file, args.sensors, args.start, args.end, args.binary)
+	except ConversionError as error:
+		print("Could not convert %s: %s" % (args.input_file, error))
+		exit(-1)
+
+	for name in args.sensors:
+		print(name + (" data detected" if name in result["sensors"] else " data not detected"))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,805 @@
+"""
+Creates sensor data files of a synthetic flight, for replays of hours of flight
+or with controlled sensor faults which the recorded flights do not have. The
+samples of the IMU, mag, baro, GPS, airspeed, flow, range finder and landing
+status are computed from a kinematic trajectory with noise, biases, latency and
+faults and written to a sensor data csv file and/or a binary replay file. The
+true states are written to a ground truth csv file the EKF outputs can be scored
+against.
+
+The trajectory is either a flight pattern or read from a csv file with the
+columns time [s], north, east, down [m] and yaw [rad]. The attitude follows from
+the acceleration and the yaw, as that of a multicopter. All entries of the config
+file (json) are optional, the defaults are in DEFAULT_CONFIG and SENSOR_DEFAULTS:
+
+	{
+		"duration": 3600,
+		"seed": 1,
+		"origin": {"lat": 47.3977, "lon": 8.5456, "alt": 488.0},
+		"trajectory": {"pattern": "circle", "altitude": 10, "radius": 20, "speed": 5},
+		"wind": [2.0, -1.0],
+		"sensors": {
+			"imu": {"gyro_bias": [0.002, -0.001, 0.0]},
+			"mag": {}, "baro": {}, "gps": {}, "landed": {},
+			"flow": {"noise": 0.1}, "range": {}
+		},
+		"faults": [
+			{"type": "gps_glitch", "start": 600, "duration": 10, "offset": [20, 0, 0]},
+			{"type": "mag_interference", "start": 900, "duration": 30, "field": [0.2, 0.0, 0.1]},
+			{"type": "imu_clipping", "start": 1200, "duration": 2, "vibration": 80},
+			{"type": "dropout", "sensor": "flow", "start": 1500, "duration": 5}
+		]
+	}
+
+Noises are standard deviations of the samples, bias drifts standard deviations
+of the bias change in one second and delays the latency of the samples in
+seconds. The samples of the sensors are written at the rates of their configs,
+the sensor simulator of the replay resamples them at its own rates.
+
+The values are those the sensor simulator feeds the EKF with: the GPS columns are
+altitude [mm], latitude and longitude [1e-7 deg] and the flow columns the flow
+and gyro integrals of flowSample, in the sign convention of the EKF.
+"""
+import argparse
+import copy
+import json
+import os
+import re
+import numpy as np
+import pandas as pd
+from binaryReplayFile import ReplayFileWriter
+from createSensorDataFile import SENSOR_GETTERS, write_sensor_data
+
+REPO_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MAGNETIC_TABLES = os.path.join(REPO_DIRECTORY, 'geo_lookup', 'geo_magnetic_tables.hpp')
+
+CONSTANTS_ONE_G = 9.80665
+CONSTANTS_RADIUS_OF_EARTH = 6371000.0
+
+# step of the grid the kinematics are computed on and interpolated from
+GRID_STEP = 0.01
+
+# the vehicle is landed while it is lower and slower than this
+LANDED_HEIGHT = 0.1
+LANDED_SPEED = 0.2
+
+DEFAULT_CONFIG = {
+	"duration": 600.0,
+	"seed": 0,
+	"origin": {"lat": 47.3977, "lon": 8.5456, "alt": 488.0},
+	"trajectory": {"pattern": "circle", "altitude": 10.0, "radius": 20.0, "speed": 5.0, "yaw": "heading",
+		"ground_time": 10.0, "climb_rate": 1.0, "ramp_time": 5.0},
+	"wind": [0.0, 0.0],
+	"sensors": {"imu": {}, "mag": {}, "baro": {}, "gps": {}, "landed": {}},
+	"faults": [],
+}
+
+SENSOR_DEFAULTS = {
+	"imu": {"rate": 200.0, "delay": 0.0, "accel_noise": 0.35, "gyro_noise": 0.015, "accel_bias": [0.0, 0.0, 0.0],
+		"gyro_bias": [0.0, 0.0, 0.0], "accel_bias_drift": 0.0, "gyro_bias_drift": 0.0, "accel_range": 16 * CONSTANTS_ONE_G,
+		"gyro_range": np.radians(2000.0)},
+	"mag": {"rate": 50.0, "delay": 0.0, "noise": 0.005, "bias": [0.0, 0.0, 0.0]},
+	"baro": {"rate": 50.0, "delay": 0.0, "noise": 0.5, "bias": 0.0, "bias_drift": 0.0},
+	"gps": {"rate": 5.0, "delay": 0.11, "hpos_noise": 0.5, "vpos_noise": 0.8, "vel_noise": 0.1},
+	"airspeed": {"rate": 20.0, "delay": 0.1, "noise": 0.3},
+	"flow": {"rate": 50.0, "delay": 0.005, "noise": 0.05, "min_range": 0.1},
+	"range": {"rate": 30.0, "delay": 0.005, "noise": 0.05, "min_range": 0.1, "max_range": 30.0},
+	"landed": {"rate": 1.0, "delay": 0.0},
+}
+
+# the sensors affected by the faults of each type
+FAULTS = {
+	"gps_glitch": ["gps"],
+	"mag_interference": ["mag"],
+	"imu_clipping": ["imu"],
+	"dropout": list(SENSOR_DEFAULTS),
+}
+
+# the GPS position columns are integers which do not fit into float32
+FLOAT64_COLUMNS = ["alt", "lat", "lon"]
+
+TRUTH_COLUMNS = ["north", "east", "down", "vel_north", "vel_east", "vel_down", "q0", "q1", "q2", "q3", "lat", "lon",
+	"alt", "mag_north", "mag_east", "mag_down", "wind_north", "wind_east", "landed"]
+
+
+class ConfigError(Exception):
+	"""
+	raised if the config of a synthetic flight is invalid, the message describes the reason
+	"""
+
+
+def get_arguments():
+	"""
+	parses the command line arguments
+	:return:
+	"""
+	parser = argparse.ArgumentParser(
+		description='Create a sensor data file of a synthetic flight with noise, biases, latency and faults.')
+	parser.add_argument('output_file', metavar='file.csv|file.bin',
+		help='sensor data output file path, a binary replay file if it ends with .bin')
+	parser.add_argument('--config', metavar='config.json', default=None,
+		help='config of the flight, the sensors and the faults (default: the default config)')
+	parser.add_argument('--trajectory', metavar='trajectory.csv', default=None,
+		help='fly the trajectory of the csv file instead of the pattern of the config')
+	parser.add_argument('--binary', metavar='file.bin', default=None,
+		help='also write the sensor data to a binary replay file')
+	parser.add_argument('--truth', metavar='truth.csv', default=None,
+		help='write the true states to this csv file')
+	parser.add_argument('--truth-rate', type=float, default=10.0,
+		help='rate of the true states in Hz (default: %(default)s)')
+	parser.add_argument('--duration', type=float, default=None,
+		help='duration of the flight in seconds, overrides the config')
+	parser.add_argument('--seed', type=int, default=None,
+		help='seed of the noises, overrides the config')
+	return parser.parse_args()
+
+
+def read_config(file_name: str = None) -> dict:
+	"""
+	reads a config file and fills in the defaults
+	:return:
+	"""
+	config = copy.deepcopy(DEFAULT_CONFIG)
+
+	if file_name is not None:
+		try:
+			with open(file_name) as file:
+				entries = json.load(file)
+		except ValueError as error:
+			raise ConfigError("could not parse %s: %s" % (file_name, error)) from error
+
+		unknown = [key for key in entries if key not in DEFAULT_CONFIG]
+		if unknown:
+			raise ConfigError("unknown entries %s in %s" % (", ".join(unknown), file_name))
+
+		for key, value in entries.items():
+			if key in ("origin", "trajectory"):
+				config[key].update(value)
+			else:
+				config[key] = value
+
+	unknown = [sensor for sensor in config["sensors"] if sensor not in SENSOR_DEFAULTS]
+	if unknown:
+		raise ConfigError("unknown sensors %s" % ", ".join(unknown))
+	config["sensors"] = {sensor: dict(SENSOR_DEFAULTS[sensor], **config["sensors"][sensor])
+		for sensor in SENSOR_GETTERS if sensor in config["sensors"]}
+
+	for fault in config["faults"]:
+		if fault.get("type") not in FAULTS:
+			raise ConfigError("fault type must be one of %s" % ", ".join(FAULTS))
+		if "start" not in fault or "duration" not in fault:
+			raise ConfigError("%s fault needs a start and a duration" % fault["type"])
+		if fault["type"] == "dropout" and fault.get("sensor") not in SENSOR_DEFAULTS:
+			raise ConfigError("dropout fault needs a sensor, one of %s" % ", ".join(SENSOR_DEFAULTS))
+
+	return config
+
+
+def smoothstep(x: np.ndarray) -> np.ndarray:
+	"""
+	quintic step from 0 to 1 for x from 0 to 1 with zero first and second
+	derivative at both ends
+	:return:
+	"""
+	x = np.clip(x, 0.0, 1.0)
+	return x * x * x * (10.0 - 15.0 * x + 6.0 * x * x)
+
+
+def smoothstep_integral(x: np.ndarray) -> np.ndarray:
+	"""
+	integral of the smoothstep from 0 to x, which is continued with slope 1 for x > 1
+	:return:
+	"""
+	clipped = np.clip(x, 0.0, 1.0)
+	return clipped ** 4 * (2.5 - 3.0 * clipped + clipped * clipped) + np.maximum(x - 1.0, 0.0)
+
+
+class PatternTrajectory:
+	"""
+	a flight pattern at constant height: the vehicle waits on the ground, climbs,
+	flies the pattern, descends and waits on the ground again. The speed along the
+	pattern and the height change with smooth steps
+	"""
+
+	PATTERNS = ["hover", "circle", "figure8"]
+
+	def __init__(self, config: dict, duration: float):
+		if config["pattern"] not in self.PATTERNS:
+			raise ConfigError("trajectory pattern must be one of %s" % ", ".join(self.PATTERNS))
+
+		self.pattern = config["pattern"]
+		self.altitude = float(config["altitude"])
+		self.radius = float(config["radius"])
+		self.speed = float(config["speed"])
+		self.ramp_time = float(config["ramp_time"])
+		self.heading = config["yaw"] == "heading"
+		self.yaw_angle = 0.0 if self.heading else np.radians(float(config["yaw"]))
+		self.duration = duration
+
+		self.takeoff_time = float(config["ground_time"])
+		self.climb_time = self.altitude / float(config["climb_rate"])
+		self.pattern_start = self.takeoff_time + self.climb_time
+		self.pattern_end = self.duration - self.takeoff_time - self.climb_time
+		if self.pattern_end - self.pattern_start < 2.0 * self.ramp_time:
+			raise ConfigError("duration of %.1f s too short for the ground time, climb and speed ramps" % duration)
+
+	def get_distance(self, t: np.ndarray) -> np.ndarray:
+		"""
+		returns the distance along the pattern
+		:return:
+		"""
+		ramp = self.ramp_time
+		return self.speed * ramp * (smoothstep_integral((t - self.pattern_start) / ramp) -
+			smoothstep_integral((t - self.pattern_end + ramp) / ramp))
+
+	def position(self, t: np.ndarray) -> np.ndarray:
+		"""
+		returns the position in NED frame relative to the origin
+		:return: array of shape (samples, 3)
+		"""
+		height = self.altitude * (smoothstep((t - self.takeoff_time) / self.climb_time) -
+			smoothstep((t - self.pattern_end) / self.climb_time))
+		angle = self.get_distance(t) / self.radius
+
+		if self.pattern == "circle":
+			north, east = self.radius * np.sin(angle), self.radius * (1.0 - np.cos(angle))
+		elif self.pattern == "figure8":
+			north, east = self.radius * np.sin(angle), 0.5 * self.radius * np.sin(2.0 * angle)
+		else:
+			north, east = np.zeros_like(t), np.zeros_like(t)
+
+		return np.stack([north, east, -height], axis=1)
+
+	def yaw(self, t: np.ndarray) -> np.ndarray:
+		"""
+		returns the yaw, along the pattern or fixed
+		:return:
+		"""
+		if not self.heading or self.pattern == "hover":
+			return np.full_like(t, self.yaw_angle)
+
+		angle = self.get_distance(t) / self.radius
+		if self.pattern == "circle":
+			return angle
+		return np.arctan2(np.cos(2.0 * angle), np.cos(angle))
+
+
+class SampledTrajectory:
+	"""
+	a trajectory given by samples of the position and yaw, interpolated by cubic
+	Hermite splines
+	"""
+
+	def __init__(self, times: np.ndarray, positions: np.ndarray, yaws: np.ndarray):
+		if len(times) < 2 or np.any(np.diff(times) <= 0.0):
+			raise ConfigError("trajectory needs at least two samples with increasing times")
+
+		self.times = times
+		self.values = np.column_stack([positions, np.unwrap(yaws)])
+		self.slopes = np.gradient(self.values, times, axis=0)
+		self.duration = float(times[-1])
+
+	def interpolate(self, t: np.ndarray) -> np.ndarray:
+		"""
+		returns the interpolated positions and yaws
+		:return: array of shape (samples, 4)
+		"""
+		t = np.clip(t, self.times[0], self.times[-1])
+		index = np.clip(np.searchsorted(self.times, t, side='right') - 1, 0, len(self.times) - 2)
+		dt = (self.times[index + 1] - self.times[index])[:, np.newaxis]
+		u = (t - self.times[index])[:, np.newaxis] / dt
+
+		return ((2.0 * u ** 3 - 3.0 * u ** 2 + 1.0) * self.values[index] +
+			(u ** 3 - 2.0 * u ** 2 + u) * dt * self.slopes[index] +
+			(-2.0 * u ** 3 + 3.0 * u ** 2) * self.values[index + 1] +
+			(u ** 3 - u ** 2) * dt * self.slopes[index + 1])
+
+	def position(self, t: np.ndarray) -> np.ndarray:
+		"""
+		returns the position in NED frame relative to the origin
+		:return: array of shape (samples, 3)
+		"""
+		return self.interpolate(t)[:, :3]
+
+	def yaw(self, t: np.ndarray) -> np.ndarray:
+		"""
+		returns the yaw
+		:return:
+		"""
+		return self.interpolate(t)[:, 3]
+
+
+def read_trajectory(file_name: str) -> SampledTrajectory:
+	"""
+	reads a trajectory csv file with the columns time, north, east, down and yaw
+	:return:
+	"""
+	table = pd.read_csv(file_name)
+	missing = [column for column in ["time", "north", "east", "down", "yaw"] if column not in table.columns]
+	if missing:
+		raise ConfigError("trajectory file %s has no columns %s" % (file_name, ", ".join(missing)))
+
+	return SampledTrajectory(table["time"].to_numpy(np.float64), table[["north", "east", "down"]].to_numpy(np.float64),
+		table["yaw"].to_numpy(np.float64))
+
+
+def quaternion_multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+	"""
+	returns the Hamilton products of the quaternions of the rows
+	:return:
+	"""
+	return np.stack([
+		a[:, 0] * b[:, 0] - a[:, 1] * b[:, 1] - a[:, 2] * b[:, 2] - a[:, 3] * b[:, 3],
+		a[:, 0] * b[:, 1] + a[:, 1] * b[:, 0] + a[:, 2] * b[:, 3] - a[:, 3] * b[:, 2],
+		a[:, 0] * b[:, 2] - a[:, 1] * b[:, 3] + a[:, 2] * b[:, 0] + a[:, 3] * b[:, 1],
+		a[:, 0] * b[:, 3] + a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1] + a[:, 3] * b[:, 0]], axis=1)
+
+
+def rotate(quaternion: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+	"""
+	rotates the vectors of the rows by the quaternions, from body to earth frame
+	for the attitude quaternions
+	:return:
+	"""
+	u = quaternion[:, 1:]
+	t = 2.0 * np.cross(u, vectors)
+	return vectors + quaternion[:, :1] * t + np.cross(u, t)
+
+
+def rotate_inverse(quaternion: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+	"""
+	rotates the vectors of the rows by the inverse quaternions, from earth to body
+	frame for the attitude quaternions
+	:return:
+	"""
+	return rotate(quaternion * np.array([1.0, -1.0, -1.0, -1.0]), vectors)
+
+
+def get_attitude(acceleration: np.ndarray, yaw: np.ndarray) -> np.ndarray:
+	"""
+	returns the attitude of a multicopter with the thrust along the negative body
+	z axis: the yaw rotation followed by the shortest rotation tilting the body z
+	axis against the specific force
+	:return: quaternions from body to earth frame
+	"""
+	thrust = acceleration - np.array([0.0, 0.0, CONSTANTS_ONE_G])
+	z_axis = -thrust / np.linalg.norm(thrust, axis=1, keepdims=True)
+
+	yaw_rotation = np.column_stack([np.cos(0.5 * yaw), np.zeros_like(yaw), np.zeros_like(yaw), np.sin(0.5 * yaw)])
+	z_axis = rotate_inverse(yaw_rotation, z_axis)
+	tilt = np.column_stack([1.0 + z_axis[:, 2], -z_axis[:, 1], z_axis[:, 0], np.zeros_like(yaw)])
+	tilt /= np.linalg.norm(tilt, axis=1, keepdims=True)
+
+	return quaternion_multiply(yaw_rotation, tilt)
+
+
+def get_kinematics(trajectory, duration: float) -> dict:
+	"""
+	computes the kinematics of the trajectory on a grid of GRID_STEP, by central
+	differences of the positions and attitudes
+	:return: dict of position, velocity, acceleration (NED), quaternion (body to
+	earth) and body angular rate arrays of the grid times
+	"""
+	h = GRID_STEP
+	t = np.arange(-2, int(np.ceil(duration / h)) + 3) * h
+	positions = trajectory.position(t)
+	accelerations = (positions[2:] - 2.0 * positions[1:-1] + positions[:-2]) / (h * h)
+	attitudes = get_attitude(accelerations, trajectory.yaw(t[1:-1]))
+
+	# keep the quaternions of neighbouring times in the same hemisphere
+	flips = np.sum(attitudes[1:] * attitudes[:-1], axis=1) < 0.0
+	attitudes[1:] *= np.cumprod(np.where(flips, -1.0, 1.0))[:, np.newaxis]
+	derivatives = (attitudes[2:] - attitudes[:-2]) / (2.0 * h)
+	conjugates = attitudes[1:-1] * np.array([1.0, -1.0, -1.0, -1.0])
+
+	return {
+		"position": positions[2:-2],
+		"velocity": (positions[3:-1] - positions[1:-3]) / (2.0 * h),
+		"acceleration": accelerations[1:-1],
+		"quaternion": attitudes[1:-1],
+		"rate": 2.0 * quaternion_multiply(conjugates, derivatives)[:, 1:],
+	}
+
+
+def interpolate_kinematics(kinematics: dict, t: np.ndarray) -> dict:
+	"""
+	interpolates the kinematics of the grid linearly to the times
+	:return: dict of the kinematics of the times
+	"""
+	n_grid = len(kinematics["position"])
+	t = np.clip(t / GRID_STEP, 0.0, n_grid - 1)
+	index = np.minimum(t.astype(np.int64), n_grid - 2)
+	weight = (t - index)[:, np.newaxis]
+
+	interpolated = {key: (1.0 - weight) * values[index] + weight * values[index + 1]
+		for key, values in kinematics.items()}
+	interpolated["quaternion"] /= np.linalg.norm(interpolated["quaternion"], axis=1, keepdims=True)
+
+	return interpolated
+
+
+def get_landed(kinematics: dict) -> np.ndarray:
+	"""
+	returns whether the vehicle is landed
+	:return:
+	"""
+	return (-kinematics["position"][:, 2] < LANDED_HEIGHT) & \
+		(np.linalg.norm(kinematics["velocity"], axis=1) < LANDED_SPEED)
+
+
+def get_global_position(position: np.ndarray, origin: dict) -> tuple:
+	"""
+	converts NED positions to latitude, longitude and altitude with the azimuthal
+	equidistant projection of map_projection_reproject in geo/geo.cpp
+	:return: (latitude [deg], longitude [deg], altitude [m])
+	"""
+	lat_0 = np.radians(origin["lat"])
+	x = position[:, 0] / CONSTANTS_RADIUS_OF_EARTH
+	y = position[:, 1] / CONSTANTS_RADIUS_OF_EARTH
+	c = np.sqrt(x * x + y * y)
+	# sin(c) / c, which is 1 at the origin
+	sinc = np.sinc(c / np.pi)
+
+	lat = np.arcsin(np.cos(c) * np.sin(lat_0) + x * sinc * np.cos(lat_0))
+	lon = np.radians(origin["lon"]) + np.arctan2(y * sinc, np.cos(lat_0) * np.cos(c) - x * np.sin(lat_0) * sinc)
+
+	return np.degrees(lat), np.degrees(lon), origin["alt"] - position[:, 2]
+
+
+def read_magnetic_tables(file_name: str = MAGNETIC_TABLES) -> dict:
+	"""
+	reads the declination, inclination and strength tables of geo_lookup
+	:return: dict of table name to array of shape (latitudes, longitudes)
+	"""
+	with open(file_name) as file:
+		text = file.read()
+
+	tables = {}
+	for name, body in re.findall(r'(\w+)_table\[\d+\]\[\d+\]\s*\{(.*?)\n\};', text, re.S):
+		rows = re.findall(r'/\* LAT:\s*-?\d+ \*/\s*\{([^}]*)\}', body)
+		tables[name] = np.array([[int(value) for value in row.split(',') if value.strip()] for row in rows],
+			dtype=np.float64)
+
+	return tables
+
+
+def get_table_data(lat: np.ndarray, lon: np.ndarray, table: np.ndarray) -> np.ndarray:
+	"""
+	interpolates a geo_lookup table bilinearly as get_table_data in
+	geo_lookup/geo_mag_declination.cpp
+	:return:
+	"""
+	resolution = 180.0 / (table.shape[0] - 1)
+	lat = np.clip(lat, -90.0, 90.0)
+	lon = np.where(lon > 180.0, lon - 360.0, lon)
+	lon = np.where(lon < -180.0, lon + 360.0, lon)
+
+	lat_index = np.clip(np.floor((lat + 90.0) / resolution), 0, table.shape[0] - 2).astype(int)
+	lon_index = np.clip(np.floor((lon + 180.0) / resolution), 0, table.shape[1] - 2).astype(int)
+	lat_scale = np.clip((lat + 90.0) / resolution - lat_index, 0.0, 1.0)
+	lon_scale = np.clip((lon + 180.0) / resolution - lon_index, 0.0, 1.0)
+
+	data_min = table[lat_index, lon_index] + lon_scale * (table[lat_index, lon_index + 1] - table[lat_index, lon_index])
+	data_max = table[lat_index + 1, lon_index] + lon_scale * (table[lat_index + 1, lon_index + 1] -
+		table[lat_index + 1, lon_index])
+
+	return data_min + lat_scale * (data_max - data_min)
+
+
+def get_earth_field(lat: np.ndarray, lon: np.ndarray, tables: dict) -> np.ndarray:
+	"""
+	returns the earth magnetic field of the geo_lookup tables
+	:return: array of shape (samples, 3), NED in Gauss
+	"""
+	declination = get_table_data(lat, lon, tables["declination"]) * 1e-4
+	inclination = get_table_data(lat, lon, tables["inclination"]) * 1e-4
+	strength = get_table_data(lat, lon, tables["strength"]) * 1e-4
+
+	horizontal = strength * np.cos(inclination)
+	return np.column_stack([horizontal * np.cos(declination), horizontal * np.sin(declination),
+		strength * np.sin(inclination)])
+
+
+def get_fault_mask(t: np.ndarray, faults: list, fault_type: str, sensor: str = None) -> list:
+	"""
+	returns the faults of a type, of the sensor for dropouts, with the mask of the
+	samples they affect
+	:return: list of (fault, boolean mask)
+	"""
+	return [(fault, (t >= fault["start"]) & (t < fault["start"] + fault["duration"])) for fault in faults
+		if fault["type"] == fault_type and (sensor is None or fault.get("sensor") == sensor)]
+
+
+def get_bias(random, n_samples: int, n_axes: int, bias, drift: float, dt: float) -> np.ndarray:
+	"""
+	returns the initial bias followed by a random walk with the drift per second
+	:return: array of shape (samples, axes)
+	"""
+	bias = np.broadcast_to(np.asarray(bias, dtype=np.float64), (n_axes,))
+	if drift == 0.0:
+		return np.tile(bias, (n_samples, 1))
+
+	steps = random.normal(0.0, drift * np.sqrt(dt), (n_samples, n_axes))
+	steps[0] = 0.0
+	return bias + np.cumsum(steps, axis=0)
+
+
+class SyntheticFlight:
+	"""
+	computes the sensor samples of a trajectory. Each sensor is sampled at its own
+	rate from the kinematics at the sample times minus its delay
+	"""
+
+	def __init__(self, config: dict, trajectory):
+		self.config = config
+		self.trajectory = trajectory
+		self.duration = float(trajectory.duration)
+		self.origin = config["origin"]
+		self.wind = np.array(list(config["wind"]) + [0.0], dtype=np.float64)
+		self.faults = config["faults"]
+		self.random = np.random.default_rng(config["seed"])
+		self.magnetic_tables = read_magnetic_tables()
+		self.kinematics = get_kinematics(trajectory, self.duration)
+		self.imu_bias = None
+
+	def get_times(self, sensor: str) -> np.ndarray:
+		"""
+		returns the sample times of a sensor, from one sample period after the start
+		:return: seconds
+		"""
+		rate = self.config["sensors"][sensor]["rate"]
+		return np.arange(1, int(self.duration * rate) + 1) / rate
+
+	def get_imu(self, t: np.ndarray, kinematics: dict, sensor: dict) -> dict:
+		"""
+		returns the accelerometer [m/s^2] and gyro [rad/s] samples, the specific force
+		and angular rate in body frame with bias, noise and clipping at the ranges
+		:return: dict of column name to values
+		"""
+		n = len(t)
+		dt = 1.0 / sensor["rate"]
+		accel_bias = get_bias(self.random, n, 3, sensor["accel_bias"], sensor["accel_bias_drift"], dt)
+		gyro_bias = get_bias(self.random, n, 3, sensor["gyro_bias"], sensor["gyro_bias_drift"], dt)
+		self.imu_bias = (t, accel_bias, gyro_bias)
+
+		specific_force = kinematics["acceleration"] - np.array([0.0, 0.0, CONSTANTS_ONE_G])
+		accel = rotate_inverse(kinematics["quaternion"], specific_force) + accel_bias + \
+			self.random.normal(0.0, sensor["accel_noise"], (n, 3))
+		gyro = kinematics["rate"] + gyro_bias + self.random.normal(0.0, sensor["gyro_noise"], (n, 3))
+
+		accel_range = np.full(n, sensor["accel_range"])
+		gyro_range = np.full(n, sensor["gyro_range"])
+		for fault, mask in get_fault_mask(t, self.faults, "imu_clipping"):
+			accel[mask] += self.random.normal(0.0, fault.get("vibration", 0.0), (np.count_nonzero(mask), 3))
+			accel_range[mask] = fault.get("accel_range", sensor["accel_range"])
+			gyro_range[mask] = fault.get("gyro_range", sensor["gyro_range"])
+		accel = np.clip(accel, -accel_range[:, np.newaxis], accel_range[:, np.newaxis])
+		gyro = np.clip(gyro, -gyro_range[:, np.newaxis], gyro_range[:, np.newaxis])
+
+		return {"accel_m_s2[0]": accel[:, 0], "accel_m_s2[1]": accel[:, 1], "accel_m_s2[2]": accel[:, 2],
+			"gyro_rad[0]": gyro[:, 0], "gyro_rad[1]": gyro[:, 1], "gyro_rad[2]": gyro[:, 2]}
+
+	def get_mag(self, t: np.ndarray, kinematics: dict, sensor: dict) -> dict:
+		"""
+		returns the magnetometer samples [Gauss], the earth field of geo_lookup in
+		body frame with bias, noise and interference
+		:return: dict of column name to values
+		"""
+		lat, lon, _ = get_global_position(kinematics["position"], self.origin)
+		field = rotate_inverse(kinematics["quaternion"], get_earth_field(lat, lon, self.magnetic_tables)) + \
+			np.asarray(sensor["bias"]) + self.random.normal(0.0, sensor["noise"], (len(t), 3))
+
+		for fault, mask in get_fault_mask(t, self.faults, "mag_interference"):
+			field[mask] += np.asarray(fault["field"], dtype=np.float64)
+
+		return {"magnetometer_ga[0]": field[:, 0], "magnetometer_ga[1]": field[:, 1], "magnetometer_ga[2]": field[:, 2]}
+
+	def get_baro(self, t: np.ndarray, kinematics: dict, sensor: dict) -> dict:
+		"""
+		returns the barometric altitude samples [m] with bias and noise
+		:return: dict of column name to values
+		"""
+		bias = get_bias(self.random, len(t), 1, sensor["bias"], sensor["bias_drift"], 1.0 / sensor["rate"])[:, 0]
+		altitude = self.origin["alt"] - kinematics["position"][:, 2] + bias + \
+			self.random.normal(0.0, sensor["noise"], len(t))
+
+		return {"baro_alt_meter": altitude}
+
+	def get_gps(self, t: np.ndarray, kinematics: dict, sensor: dict) -> dict:
+		"""
+		returns the GPS position and velocity samples with noise and glitches
+		:return: dict of column name to values
+		"""
+		n = len(t)
+		position = kinematics["position"] + np.column_stack([self.random.normal(0.0, sensor["hpos_noise"], (n, 2)),
+			self.random.normal(0.0, sensor["vpos_noise"], n)])
+		velocity = kinematics["velocity"] + self.random.normal(0.0, sensor["vel_noise"], (n, 3))
+
+		for fault, mask in get_fault_mask(t, self.faults, "gps_glitch"):
+			position[mask] += np.asarray(fault.get("offset", [0.0, 0.0, 0.0]), dtype=np.float64)
+			velocity[mask] += np.asarray(fault.get("velocity_offset", [0.0, 0.0, 0.0]), dtype=np.float64)
+
+		lat, lon, alt = get_global_position(position, self.origin)
+
+		return {"alt": np.round(alt * 1e3), "lat": np.round(lat * 1e7), "lon": np.round(lon * 1e7),
+			"vel_N": velocity[:, 0], "vel_E": velocity[:, 1], "vel_D": velocity[:, 2]}
+
+	def get_airspeed(self, t: np.ndarray, kinematics: dict, sensor: dict) -> dict:
+		"""
+		returns the true and indicated airspeed samples [m/s] with noise
+		:return: dict of column name to values
+		"""
+		height = self.origin["alt"] - kinematics["position"][:, 2]
+		true_airspeed = np.linalg.norm(kinematics["velocity"] - self.wind, axis=1) + \
+			self.random.normal(0.0, sensor["noise"], len(t))
+		# density ratio of the international standard atmosphere
+		density_ratio = (1.0 - 2.25577e-5 * height) ** 4.2559
+
+		return {"true_as": true_airspeed, "indicated_as": true_airspeed * np.sqrt(density_ratio)}
+
+	def get_range_to_ground(self, kinematics: dict, min_range: float) -> np.ndarray:
+		"""
+		returns the distance to the flat ground along the body z axis
+		:return:
+		"""
+		z_axis_down = 1.0 - 2.0 * (kinematics["quaternion"][:, 1] ** 2 + kinematics["quaternion"][:, 2] ** 2)
+		return np.maximum(-kinematics["position"][:, 2] / np.maximum(z_axis_down, 0.1), min_range)
+
+	def get_flow(self, t: np.ndarray, kinematics: dict, sensor: dict) -> dict:
+		"""
+		returns the optical flow samples, the flow and gyro angle integrals over one
+		sample period [rad]
+		:return: dict of column name to values
+		"""
+		n = len(t)
+		dt = 1.0 / sensor["rate"]
+		distance = self.get_range_to_ground(kinematics, sensor["min_range"])
+		velocity = rotate_inverse(kinematics["quaternion"], kinematics["velocity"])
+		rate = kinematics["rate"]
+
+		# the EKF compares flow_xy_rad - gyro_xyz with (v_y, -v_x) / distance * dt,
+		# gyro_xyz is the negative of the body angle change
+		flow_x = (velocity[:, 1] / distance - rate[:, 0] + self.random.normal(0.0, sensor["noise"], n)) * dt
+		flow_y = (-velocity[:, 0] / distance - rate[:, 1] + self.random.normal(0.0, sensor["noise"], n)) * dt
+
+		return {"pixel_flow_x_integral": flow_x, "pixel_flow_y_integral": flow_y,
+			"gyro_x_rate_integral": -rate[:, 0] * dt, "gyro_y_rate_integral": -rate[:, 1] * dt,
+			"gyro_z_rate_integral": -rate[:, 2] * dt, "quality": np.full(n, 255.0)}
+
+	def get_range(self, t: np.ndarray, kinematics: dict, sensor: dict) -> dict:
+		"""
+		returns the range finder distance [m] and signal quality samples, the
+		quality is 0 beyond the maximum range
+		:return: dict of column name to values
+		"""
+		distance = self.get_range_to_ground(kinematics, sensor["min_range"]) + \
+			self.random.normal(0.0, sensor["noise"], len(t))
+		out_of_range = distance > sensor["max_range"]
+
+		return {"current_distance": np.where(out_of_range, sensor["max_range"], np.maximum(distance, 0.0)),
+			"signal_quality": np.where(out_of_range, 0.0, 100.0)}
+
+	def get_landed(self, t: np.ndarray, kinematics: dict, sensor: dict) -> dict:
+		"""
+		returns the landing status samples
+		:return: dict of column name to values
+		"""
+		return {"landed": get_landed(kinematics).astype(np.float64)}
+
+	def get_sensor_data(self, sensor: str) -> pd.DataFrame:
+		"""
+		computes the samples of a sensor and drops those of its dropouts
+		:return: table with the timestamp [us], the sensor name and the values, as
+		float32 apart from the GPS values
+		"""
+		config = self.config["sensors"][sensor]
+		t = self.get_times(sensor)
+		kinematics = interpolate_kinematics(self.kinematics, t - config["delay"])
+		values = getattr(self, "get_" + sensor)(t, kinematics, config)
+
+		table = pd.DataFrame({"timestamp": np.round(t * 1e6).astype(np.int64), "sensor": sensor})
+		for column, column_values in values.items():
+			table[column] = column_values if column in FLOAT64_COLUMNS else column_values.astype(np.float32)
+
+		dropped = np.zeros(len(t), dtype=bool)
+		for _, mask in get_fault_mask(t, self.faults, "dropout", sensor):
+			dropped |= mask
+
+		return table[~dropped].reset_index(drop=True)
+
+	def get_truth(self, rate: float) -> pd.DataFrame:
+		"""
+		returns the true states at the rate, the IMU biases if the IMU was sampled
+		:return:
+		"""
+		t = np.arange(0, int(self.duration * rate) + 1) / rate
+		kinematics = interpolate_kinematics(self.kinematics, t)
+		lat, lon, alt = get_global_position(kinematics["position"], self.origin)
+
+		columns = [kinematics["position"], kinematics["velocity"], kinematics["quaternion"],
+			np.column_stack([lat, lon, alt]), get_earth_field(lat, lon, self.magnetic_tables),
+			np.tile(self.wind[:2], (len(t), 1)), get_landed(kinematics)[:, np.newaxis]]
+		table = pd.DataFrame(np.column_stack(columns), columns=TRUTH_COLUMNS)
+		table.insert(0, "timestamp", np.round(t * 1e6).astype(np.int64))
+
+		if self.imu_bias is not None:
+			imu_t, accel_bias, gyro_bias = self.imu_bias
+			for axis in range(3):
+				table["accel_bias[%i]" % axis] = np.interp(t, imu_t, accel_bias[:, axis])
+			for axis in range(3):
+				table["gyro_bias[%i]" % axis] = np.interp(t, imu_t, gyro_bias[:, axis])
+
+		return table
+
+
+def write_replay_file(tables: dict, file_name: str) -> None:
+	"""
+	writes the sensor data tables to a binary replay file, without formatting them
+	as csv rows
+	:return:
+	"""
+	writer = ReplayFileWriter(list(tables))
+	entries = []
+
+	for name, table in tables.items():
+		values = table.drop(columns=["timestamp", "sensor"]).to_numpy()
+		entries.append(writer.add_values(name, table["timestamp"].to_numpy(), values))
+
+	# samples with equal timestamps keep the order of the sensors
+	timestamps = np.concatenate([table["timestamp"].to_numpy() for table in tables.values()])
+	writer.add_index(np.concatenate(entries)[np.argsort(timestamps, kind='stable')])
+	writer.write(file_name)
+
+
+def create_synthetic_data(config: dict, trajectory, output_file: str = None, binary_file: str = None,
+		truth_file: str = None, truth_rate: float = 10.0) -> dict:
+	"""
+	computes the sensor data of a synthetic flight and writes it to the csv file
+	and/or the binary replay file, and the true states to the truth file
+	:return: dict of sensor name to number of samples
+	"""
+	flight = SyntheticFlight(config, trajectory)
+	tables = {sensor: flight.get_sensor_data(sensor) for sensor in config["sensors"]}
+
+	if output_file is not None:
+		write_sensor_data(tables, output_file, time_offset=0)
+	if binary_file is not None:
+		write_replay_file(tables, binary_file)
+	if truth_file is not None:
+		flight.get_truth(truth_rate).to_csv(truth_file, index=False)
+
+	return {sensor: len(table) for sensor, table in tables.items()}
+
+
+def main() -> None:
+	"""
+	main entry point
+	:return:
+	"""
+	args = get_arguments()
+
+	try:
+		config = read_config(args.config)
+		if args.duration is not None:
+			config["duration"] = args.duration
+		if args.seed is not None:
+			config["seed"] = args.seed
+
+		if args.trajectory is not None:
+			trajectory = read_trajectory(args.trajectory)
+		else:
+			trajectory = PatternTrajectory(config["trajectory"], float(config["duration"]))
+	except (OSError, ConfigError) as error:
+		print("Invalid config: %s" % error)
+		exit(-1)
+
+	binary_file = args.output_file if args.output_file.endswith('.bin') else args.binary
+	output_file = None if args.output_file.endswith('.bin') else args.output_file
+	samples = create_synthetic_data(config, trajectory, output_file, binary_file, args.truth, args.truth_rate)
+
+	for name, n_samples in samples.items():
+		print("%i %s samples" % (n_samples, name))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,105 @@
+/****************************************************************************
+ *
+ *   Copyright (c) 2020 ECL Development Team. All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions
+ * are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright
+ *    notice, this list of conditions and the following disclaimer.
+ * 2. Redistributions in binary form must reproduce the above copyright
+ *    notice, this list of conditions and the following disclaimer in
+ *    the documentation and/or other materials provided with the
+ *    distribution.
+ * 3. Neither the name PX4 nor the names of its contributors may be
+ *    used to endorse or promote products derived from this software
+ *    without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ * FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ * COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ * INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ * BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS
+ * OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED
+ * AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ * LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ * ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ *
+ ****************************************************************************/
+
+#include "ekf_innovations.h"
+
+namespace sensor_simulator
+{
+
+const std::vector<std::string> &getInnovationNames()
+{
+	static const std::vector<std::string> names = {
+		"gps_vel_n", "gps_vel_e", "gps_vel_d", "gps_pos_n", "gps_pos_e", "gps_pos_d",
+		"ev_vel_x", "ev_vel_y", "ev_vel_z", "ev_pos_x", "ev_pos_y", "ev_pos_z",
+		"baro_hgt", "rng_hgt", "aux_vel_n", "aux_vel_e", "flow_x", "flow_y", "heading",
+		"mag_x", "mag_y", "mag_z", "drag_x", "drag_y", "airspeed", "beta", "hagl",
+	};
+	return names;
+}
+
+const std::vector<std::string> &getInnovationTestRatioNames()
+{
+	static const std::vector<std::string> names = {
+		"gps_hvel", "gps_vvel", "gps_hpos", "gps_vpos", "ev_hvel", "ev_vvel", "ev_hpos", "ev_vpos",
+		"baro_hgt", "rng_hgt", "aux_vel", "flow", "heading", "mag", "drag_x", "drag_y", "airspeed", "beta", "hagl",
+	};
+	return names;
+}
+
+void getInnovations(const Ekf &ekf, float *innovations, float *innovation_variances)
+{
+	ekf.getGpsVelPosInnov(&innovations[0], innovations[2], &innovations[3], innovations[5]);
+	ekf.getGpsVelPosInnovVar(&innovation_variances[0], innovation_variances[2], &innovation_variances[3],
+				 innovation_variances[5]);
+	ekf.getEvVelPosInnov(&innovations[6], innovations[8], &innovations[9], innovations[11]);
+	ekf.getEvVelPosInnovVar(&innovation_variances[6], innovation_variances[8], &innovation_variances[9],
+				innovation_variances[11]);
+	ekf.getBaroHgtInnov(innovations[12]);
+	ekf.getBaroHgtInnovVar(innovation_variances[12]);
+	ekf.getRngHgtInnov(innovations[13]);
+	ekf.getRngHgtInnovVar(innovation_variances[13]);
+	ekf.getAuxVelInnov(&innovations[14]);
+	ekf.getAuxVelInnovVar(&innovation_variances[14]);
+	ekf.getFlowInnov(&innovations[16]);
+	ekf.getFlowInnovVar(&innovation_variances[16]);
+	ekf.getHeadingInnov(innovations[18]);
+	ekf.getHeadingInnovVar(innovation_variances[18]);
+	ekf.getMagInnov(&innovations[19]);
+	ekf.getMagInnovVar(&innovation_variances[19]);
+	ekf.getDragInnov(&innovations[22]);
+	ekf.getDragInnovVar(&innovation_variances[22]);
+	ekf.getAirspeedInnov(innovations[24]);
+	ekf.getAirspeedInnovVar(innovation_variances[24]);
+	ekf.getBetaInnov(innovations[25]);
+	ekf.getBetaInnovVar(innovation_variances[25]);
+	ekf.getHaglInnov(innovations[26]);
+	ekf.getHaglInnovVar(innovation_variances[26]);
+}
+
+void getInnovationTestRatios(const Ekf &ekf, float *test_ratios)
+{
+	ekf.getGpsVelPosInnovRatio(test_ratios[0], test_ratios[1], test_ratios[2], test_ratios[3]);
+	ekf.getEvVelPosInnovRatio(test_ratios[4], test_ratios[5], test_ratios[6], test_ratios[7]);
+	ekf.getBaroHgtInnovRatio(test_ratios[8]);
+	ekf.getRngHgtInnovRatio(test_ratios[9]);
+	ekf.getAuxVelInnovRatio(test_ratios[10]);
+	ekf.getFlowInnovRatio(test_ratios[11]);
+	ekf.getHeadingInnovRatio(test_ratios[12]);
+	ekf.getMagInnovRatio(test_ratios[13]);
+	ekf.getDragInnovRatio(&test_ratios[14]);
+	ekf.getAirspeedInnovRatio(test_ratios[16]);
+	ekf.getBetaInnovRatio(test_ratios[17]);
+	ekf.getHaglInnovRatio(test_ratios[18]);
+}
+
+} // namespace sensor_simulator
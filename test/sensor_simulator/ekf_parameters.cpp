@@ -0,0 +1,235 @@
+/****************************************************************************
+ *
+ *   Copyright (c) 2020 ECL Development Team. All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions
+ * are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright
+ *    notice, this list of conditions and the following disclaimer.
+ * 2. Redistributions in binary form must reproduce the above copyright
+ *    notice, this list of conditions and the following disclaimer in
+ *    the documentation and/or other materials provided with the
+ *    distribution.
+ * 3. Neither the name PX4 nor the names of its contributors may be
+ *    used to endorse or promote products derived from this software
+ *    without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ * FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ * COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ * INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ * BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS
+ * OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED
+ * AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ * LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ * ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ *
+ ****************************************************************************/
+
+#include "ekf_parameters.h"
+#include <cerrno>
+#include <cstdlib>
+#include <functional>
+#include <limits>
+#include <type_traits>
+
+namespace sensor_simulator
+{
+
+namespace
+{
+
+template<typename T>
+typename std::enable_if<std::is_floating_point<T>::value, bool>::type
+parseValue(const std::string &value, T &field)
+{
+	char *end = nullptr;
+	errno = 0;
+	const float parsed = std::strtof(value.c_str(), &end);
+
+	if (value.empty() || *end != '\0' || errno != 0) {
+		return false;
+	}
+
+	field = parsed;
+	return true;
+}
+
+template<typename T>
+typename std::enable_if<std::is_integral<T>::value, bool>::type
+parseValue(const std::string &value, T &field)
+{
+	char *end = nullptr;
+	errno = 0;
+	// base 0 to also accept hexadecimal bitmasks
+	const long long parsed = std::strtoll(value.c_str(), &end, 0);
+
+	if (value.empty() || *end != '\0' || errno != 0
+	    || parsed < static_cast<long long>(std::numeric_limits<T>::min())
+	    || parsed > static_cast<long long>(std::numeric_limits<T>::max())) {
+		return false;
+	}
+
+	field = static_cast<T>(parsed);
+	return true;
+}
+
+struct ParameterSetter {
+	const char *name;
+	std::function<bool(estimator::parameters &, const std::string &)> set;
+};
+
+#define PARAMETER(field) {#field, [](estimator::parameters &params, const std::string &value) { return parseValue(value, params.field); }}
+
+// all scalar members of estimator::parameters
+const ParameterSetter parameter_setters[] = {
+	PARAMETER(fusion_mode),
+	PARAMETER(vdist_sensor_type),
+	PARAMETER(terrain_fusion_mode),
+	PARAMETER(sensor_interval_min_ms),
+	PARAMETER(min_delay_ms),
+	PARAMETER(mag_delay_ms),
+	PARAMETER(baro_delay_ms),
+	PARAMETER(gps_delay_ms),
+	PARAMETER(airspeed_delay_ms),
+	PARAMETER(flow_delay_ms),
+	PARAMETER(range_delay_ms),
+	PARAMETER(ev_delay_ms),
+	PARAMETER(auxvel_delay_ms),
+	PARAMETER(gyro_noise),
+	PARAMETER(accel_noise),
+	PARAMETER(gyro_bias_p_noise),
+	PARAMETER(accel_bias_p_noise),
+	PARAMETER(mage_p_noise),
+	PARAMETER(magb_p_noise),
+	PARAMETER(wind_vel_p_noise),
+	PARAMETER(wind_vel_p_noise_scaler),
+	PARAMETER(terrain_p_noise),
+	PARAMETER(terrain_gradient),
+	PARAMETER(switch_on_gyro_bias),
+	PARAMETER(switch_on_accel_bias),
+	PARAMETER(initial_tilt_err),
+	PARAMETER(initial_wind_uncertainty),
+	PARAMETER(gps_vel_noise),
+	PARAMETER(gps_pos_noise),
+	PARAMETER(pos_noaid_noise),
+	PARAMETER(baro_noise),
+	PARAMETER(baro_innov_gate),
+	PARAMETER(gps_pos_innov_gate),
+	PARAMETER(gps_vel_innov_gate),
+	PARAMETER(gnd_effect_deadzone),
+	PARAMETER(gnd_effect_max_hgt),
+	PARAMETER(mag_heading_noise),
+	PARAMETER(mag_noise),
+	PARAMETER(mag_declination_deg),
+	PARAMETER(heading_innov_gate),
+	PARAMETER(mag_innov_gate),
+	PARAMETER(mag_declination_source),
+	PARAMETER(mag_fusion_type),
+	PARAMETER(mag_acc_gate),
+	PARAMETER(mag_yaw_rate_gate),
+	PARAMETER(quat_max_variance),
+	PARAMETER(tas_innov_gate),
+	PARAMETER(eas_noise),
+	PARAMETER(beta_innov_gate),
+	PARAMETER(beta_noise),
+	PARAMETER(beta_avg_ft_us),
+	PARAMETER(range_noise),
+	PARAMETER(range_innov_gate),
+	PARAMETER(rng_gnd_clearance),
+	PARAMETER(rng_sens_pitch),
+	PARAMETER(range_noise_scaler),
+	PARAMETER(vehicle_variance_scaler),
+	PARAMETER(max_hagl_for_range_aid),
+	PARAMETER(max_vel_for_range_aid),
+	PARAMETER(range_aid),
+	PARAMETER(range_aid_innov_gate),
+	PARAMETER(range_cos_max_tilt),
+	PARAMETER(ev_vel_innov_gate),
+	PARAMETER(ev_pos_innov_gate),
+	PARAMETER(flow_noise),
+	PARAMETER(flow_noise_qual_min),
+	PARAMETER(flow_qual_min),
+	PARAMETER(flow_innov_gate),
+	PARAMETER(gps_check_mask),
+	PARAMETER(req_hacc),
+	PARAMETER(req_vacc),
+	PARAMETER(req_sacc),
+	PARAMETER(req_nsats),
+	PARAMETER(req_pdop),
+	PARAMETER(req_hdrift),
+	PARAMETER(req_vdrift),
+	PARAMETER(vel_Tau),
+	PARAMETER(pos_Tau),
+	PARAMETER(acc_bias_lim),
+	PARAMETER(acc_bias_learn_acc_lim),
+	PARAMETER(acc_bias_learn_gyr_lim),
+	PARAMETER(acc_bias_learn_tc),
+	PARAMETER(reset_timeout_max),
+	PARAMETER(no_aid_timeout_max),
+	PARAMETER(valid_timeout_max),
+	PARAMETER(static_pressure_coef_xp),
+	PARAMETER(static_pressure_coef_xn),
+	PARAMETER(static_pressure_coef_yp),
+	PARAMETER(static_pressure_coef_yn),
+	PARAMETER(static_pressure_coef_z),
+	PARAMETER(max_correction_airspeed),
+	PARAMETER(drag_noise),
+	PARAMETER(bcoef_x),
+	PARAMETER(bcoef_y),
+	PARAMETER(vert_innov_test_lim),
+	PARAMETER(bad_acc_reset_delay_us),
+	PARAMETER(auxvel_noise),
+	PARAMETER(auxvel_gate),
+	PARAMETER(is_moving_scaler),
+	PARAMETER(synthesize_mag_z),
+	PARAMETER(check_mag_strength),
+	PARAMETER(EKFGSF_tas_default),
+	PARAMETER(EKFGSF_reset_delay),
+	PARAMETER(EKFGSF_yaw_err_max),
+	PARAMETER(EKFGSF_reset_count_limit),
+};
+
+#undef PARAMETER
+
+} // namespace
+
+bool setEkfParameter(estimator::parameters &params, const std::string &name, const std::string &value)
+{
+	for (const ParameterSetter &setter : parameter_setters) {
+		if (name == setter.name) {
+			return setter.set(params, value);
+		}
+	}
+
+	return false;
+}
+
+bool setEkfParameter(estimator::parameters &params, const std::string &assignment)
+{
+	const size_t separator = assignment.find('=');
+
+	if (separator == std::string::npos) {
+		return false;
+	}
+
+	return setEkfParameter(params, assignment.substr(0, separator), assignment.substr(separator + 1));
+}
+
+std::vector<std::string> getEkfParameterNames()
+{
+	std::vector<std::string> names;
+
+	for (const ParameterSetter &setter : parameter_setters) {
+		names.emplace_back(setter.name);
+	}
+
+	return names;
+}
+
+} // namespace sensor_simulator
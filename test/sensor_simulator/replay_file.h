@@ -0,0 +1,88 @@
+/****************************************************************************
+ *
+ *   Copyright (c) 2020 ECL Development Team. All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions
+ * are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright
+ *    notice, this list of conditions and the following disclaimer.
+ * 2. Redistributions in binary form must reproduce the above copyright
+ *    notice, this list of conditions and the following disclaimer in
+ *    the documentation and/or other materials provided with the
+ *    distribution.
+ * 3. Neither the name PX4 nor the names of its contributors may be
+ *    used to endorse or promote products derived from this software
+ *    without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ * FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ * COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ * INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ * BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS
+ * OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED
+ * AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ * LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ * ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ *
+ ****************************************************************************/
+
+
+/**
+ * Layout of the binary replay files written by createSensorDataFile.py and
+ * binaryReplayFile.py. The file is memory mapped by the sensor simulator and
+ * its records are read without parsing. All values are little endian:
+ *
+ * header         ReplayFileHeader
+ * section table  a ReplayFileSection per sensor type
+ * time index     a ReplayFileIndexEntry per sample in chronological order
+ * records        per section n_records fixed width records of a uint64
+ *                timestamp followed by n_values float32 or float64 values
+ *
+ * The values of a record are those of the sensor data csv row of the sample.
+ */
+
+#pragma once
+
+#include <cstdint>
+
+namespace sensor_simulator
+{
+namespace replay_file
+{
+
+static constexpr char MAGIC[8] {'E', 'C', 'L', 'R', 'P', 'L', 'A', 'Y'};
+static constexpr uint32_t VERSION {1};
+
+struct ReplayFileHeader {
+	char magic[8];
+	uint32_t version;
+	uint32_t n_sections;
+	uint64_t n_samples;
+	uint64_t index_offset;	// in bytes from the start of the file
+};
+
+struct ReplayFileSection {
+	uint32_t sensor_type;	// sensor_info::measurement_t
+	uint16_t n_values;
+	uint16_t value_size;	// 4 for float32 or 8 for float64 values
+	uint64_t n_records;
+	uint64_t records_offset;	// in bytes from the start of the file
+	uint64_t record_size;	// in bytes
+};
+
+struct ReplayFileIndexEntry {
+	uint32_t section;
+	uint32_t record;
+};
+
+static_assert(sizeof(ReplayFileHeader) == 32, "unexpected replay file header size");
+static_assert(sizeof(ReplayFileSection) == 32, "unexpected replay file section size");
+static_assert(sizeof(ReplayFileIndexEntry) == 8, "unexpected replay file index entry size");
+
+} // namespace replay_file
+} // namespace sensor_simulator
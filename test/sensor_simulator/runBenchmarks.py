@@ -0,0 +1,258 @@
+"""
+Benchmarks the EKF update steps on the replay datasets with the ecl_benchmark
+binary of the test build, the replay binary with timers around the prediction
+and fusion calls of Ekf::update and around the fuse routines they call (see
+EKF/ekf_timing.h).
+
+The datasets and their configs are those replayed by runReplays.py. They are
+replayed one after the other so that they do not compete for the cores, each
+one several times of which the median statistics are kept. The results are
+appended to a json history file, one of its runs is the baseline each run is
+compared with. A call statistic (p50 or p99 of the call durations) more than
+the threshold slower than in the baseline is reported as regression.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import numpy as np
+from runReplays import DEFAULT_REPLAY_DATA, REPO_DIRECTORY, ConfigError, find_datasets, get_command, read_config
+
+DEFAULT_BINARY = os.path.join(REPO_DIRECTORY, 'build', 'test_build', 'test', 'ecl_benchmark')
+
+# statistics of the call durations compared with the baseline
+COMPARED_STATISTICS = ["p50", "p99"]
+
+# sections with fewer calls are not compared, their percentiles are too noisy
+MIN_CALLS = 100
+
+
+def get_arguments():
+	"""
+	parses the command line arguments
+	:return:
+	"""
+	parser = argparse.ArgumentParser(
+		description='Benchmark the EKF update steps on the replay datasets and compare with a baseline.')
+	parser.add_argument('datasets', nargs='*', metavar='name',
+		help='names of the benchmarked datasets (default: all)')
+	parser.add_argument('--replay-data', default=DEFAULT_REPLAY_DATA,
+		help='directory of the sensor data files and configs (default: %(default)s)')
+	parser.add_argument('--binary', default=DEFAULT_BINARY,
+		help='ecl_benchmark binary (default: %(default)s)')
+	parser.add_argument('--history', default='benchmark_history.json',
+		help='json file the results are appended to (default: %(default)s)')
+	parser.add_argument('--runs', type=int, default=3,
+		help='number of replays of each dataset (default: %(default)s)')
+	parser.add_argument('--label', default=None,
+		help='label of the run in the history, e.g. the change it measures')
+	parser.add_argument('--set-baseline', action='store_true',
+		help='make this run the baseline of the following runs')
+	parser.add_argument('--threshold', type=float, default=0.1,
+		help='relative slowdown reported as regression (default: %(default)s)')
+	parser.add_argument('--report-only', action='store_true',
+		help='do not run the benchmark, compare the last run of the history with the baseline')
+	args = parser.parse_args()
+	if args.runs < 1:
+		parser.error('--runs must be at least 1')
+	return args
+
+
+def get_revision() -> str:
+	"""
+	returns the git revision of the repository, None if it is not known
+	:return:
+	"""
+	try:
+		return subprocess.check_output(['git', 'describe', '--always', '--dirty'], cwd=REPO_DIRECTORY,
+			stderr=subprocess.DEVNULL, universal_newlines=True).strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+
+def read_history(file_name: str) -> dict:
+	"""
+	reads the benchmark history, an empty history if the file does not exist
+	:return: dict with the runs and the index of the baseline run
+	"""
+	if not os.path.isfile(file_name):
+		return {"baseline": None, "runs": []}
+
+	with open(file_name) as file:
+		return json.load(file)
+
+
+def write_history(history: dict, file_name: str) -> None:
+	"""
+	writes the benchmark history
+	:return:
+	"""
+	with open(file_name, 'w') as file:
+		json.dump(history, file, indent=4)
+		file.write("\n")
+
+
+def merge_replays(replays: list) -> dict:
+	"""
+	merges the results of the replays of a dataset, the median of each statistic
+	and the sum of the histograms
+	:return: results of the dataset
+	"""
+	result = {"runs": len(replays),
+		"replay_time": float(np.median([replay["replay_time"] for replay in replays])),
+		"steps": replays[0]["steps"],
+		"call_durations": {}}
+
+	for section in replays[0]["call_durations"]:
+		durations = [replay["call_durations"][section] for replay in replays if section in replay["call_durations"]]
+		merged = {"calls": durations[0]["calls"]}
+		for statistic in ["mean", "p50", "p99", "max"]:
+			merged[statistic] = float(np.median([duration[statistic] for duration in durations]))
+
+		n_bins = max(len(duration["histogram"]) for duration in durations)
+		histogram = np.zeros(n_bins, dtype=np.int64)
+		for duration in durations:
+			histogram[:len(duration["histogram"])] += duration["histogram"]
+		merged["histogram"] = histogram.tolist()
+		result["call_durations"][section] = merged
+
+	return result
+
+
+def benchmark(name: str, input_file: str, config: dict, binary: str, runs: int) -> dict:
+	"""
+	replays a dataset several times with the benchmark binary
+	:return: results of the dataset
+	"""
+	replays = []
+
+	with tempfile.TemporaryDirectory() as output_dir:
+		config = dict(config, output=os.path.join(output_dir, name + '.csv'))
+		for _ in range(runs):
+			result = subprocess.run(get_command(binary, input_file, config), stdout=subprocess.PIPE,
+				stderr=subprocess.PIPE, universal_newlines=True)
+			if result.returncode != 0:
+				raise RuntimeError((result.stderr or result.stdout).strip() or "exit code %i" % result.returncode)
+			replays.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+	return merge_replays(replays)
+
+
+def compare_runs(run: dict, baseline: dict, threshold: float) -> list:
+	"""
+	compares the call statistics of a run with those of the baseline
+	:return: list of dicts of dataset, section, statistic, baseline and run value
+	and whether it is a regression, for the statistics of both runs
+	"""
+	comparisons = []
+
+	for name, result in run["datasets"].items():
+		if name not in baseline["datasets"]:
+			continue
+		baseline_durations = baseline["datasets"][name]["call_durations"]
+
+		for section, durations in result["call_durations"].items():
+			if section not in baseline_durations or min(durations["calls"], baseline_durations[section]["calls"]) < MIN_CALLS:
+				continue
+
+			for statistic in COMPARED_STATISTICS:
+				value = durations[statistic]
+				baseline_value = baseline_durations[section][statistic]
+				ratio = value / baseline_value if baseline_value > 0 else 1.0
+				comparisons.append({"dataset": name, "section": section, "statistic": statistic,
+					"baseline": baseline_value, "value": value, "ratio": ratio,
+					"regression": ratio > 1.0 + threshold})
+
+	return comparisons
+
+
+def format_run(run: dict) -> str:
+	"""
+	formats the call statistics of a run as table
+	:return:
+	"""
+	lines = []
+
+	for name, result in run["datasets"].items():
+		lines.append("%s: %i steps replayed in %.3f s" % (name, result["steps"], result["replay_time"]))
+		lines.append("  %-28s %9s %10s %10s %10s" % ("call", "calls", "p50 [ns]", "p99 [ns]", "max [ns]"))
+		for section, durations in result["call_durations"].items():
+			lines.append("  %-28s %9i %10.0f %10.0f %10.0f" % (section, durations["calls"], durations["p50"],
+				durations["p99"], durations["max"]))
+
+	return "\n".join(lines)
+
+
+def format_comparisons(comparisons: list, threshold: float) -> str:
+	"""
+	formats the regressions and the number of compared statistics
+	:return:
+	"""
+	regressions = [comparison for comparison in comparisons if comparison["regression"]]
+	lines = ["%i of %i call statistics more than %.0f %% slower than the baseline" % (len(regressions),
+		len(comparisons), threshold * 100)]
+
+	for comparison in sorted(regressions, key=lambda comparison: -comparison["ratio"]):
+		lines.append("  REGRESSION %s %s %s: %.0f ns -> %.0f ns (%+.1f %%)" % (comparison["dataset"],
+			comparison["section"], comparison["statistic"], comparison["baseline"], comparison["value"],
+			(comparison["ratio"] - 1.0) * 100))
+
+	return "\n".join(lines)
+
+
+def main() -> None:
+	"""
+	main entry point
+	:return:
+	"""
+	args = get_arguments()
+	history = read_history(args.history)
+
+	if args.report_only:
+		if not history["runs"]:
+			print("No runs in %s" % args.history)
+			exit(-1)
+		run = history["runs"][-1]
+	else:
+		datasets = find_datasets(args.replay_data, args.datasets, False)
+		if not datasets:
+			print("No replay data found")
+			exit(-1)
+		if not os.path.isfile(args.binary):
+			print("Benchmark binary %s not found, build it with make test_build" % args.binary)
+			exit(-1)
+
+		run = {"time": datetime.datetime.now().isoformat(timespec='seconds'), "revision": get_revision(),
+			"label": args.label, "host": platform.node(), "datasets": {}}
+		for name, input_file, csv_file in datasets:
+			try:
+				run["datasets"][name] = benchmark(name, input_file, read_config(csv_file, None), args.binary, args.runs)
+			except (ConfigError, RuntimeError) as error:
+				print("FAILED %s: %s" % (name, error))
+				exit(-1)
+
+		history["runs"].append(run)
+		if args.set_baseline or history["baseline"] is None:
+			history["baseline"] = len(history["runs"]) - 1
+		write_history(history, args.history)
+
+	print(format_run(run))
+
+	baseline = history["runs"][history["baseline"]]
+	if baseline is run:
+		print("This run is the baseline")
+		return
+
+	print("Baseline: %s (%s)" % (baseline["time"], baseline.get("revision") or "unknown revision"))
+	comparisons = compare_runs(run, baseline, args.threshold)
+	print(format_comparisons(comparisons, args.threshold))
+
+	if any(comparison["regression"] for comparison in comparisons):
+		exit(1)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,377 @@
+"""
+Runs parameter sweeps over the replay datasets and collects summary metrics of
+each replay into one table. A sweep file (json) sets the parameters:
+
+	{
+		"datasets": ["iris_gps"],
+		"parameters": {
+			"gyro_noise": [0.01, 0.015, 0.02],
+			"eas_noise": {"distribution": "uniform", "low": 1.0, "high": 2.0},
+			"gps_delay_ms": {"distribution": "normal", "mean": 110, "std": 10}
+		},
+		"samples": 50,
+		"seed": 0
+	}
+
+Parameters given as list of values are swept on a grid, all combinations of
+the values. Parameters given as distribution (uniform, loguniform with low and
+high, normal with mean and std) are drawn "samples" times with the seed, each
+draw is combined with each grid point. The datasets (default: all) are replayed
+with their replay configs (see runReplays.py), the swept parameters replace the
+parameters of the configs.
+
+The replays run in a process pool with the ecl_replay binary or the ekf_replay
+Python module. The metrics of each replay are cached by the hash of the dataset
+and the replay config, so an interrupted or extended sweep only runs the new
+replays. The cache has to be cleared when the EKF changes.
+
+Metrics of each replay, from the outputs at the logging rate:
+
+	<source>_test_ratio_mean / _max  innovation test ratio of each active source
+	<source>_rejected                fraction of outputs with a test ratio above 1
+	gps_hpos_error_rms               rms of the horizontal GPS position innovations,
+	gps_vpos_error_rms               the position error against GPS, and vertical
+	final_variance_<state group>     largest final variance of the states of the group
+	diverged                         whether any state became NaN
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import numpy as np
+import pandas as pd
+from runReplays import DEFAULT_BINARY, DEFAULT_REPLAY_DATA, REPO_DIRECTORY, TEST_DIRECTORY, ConfigError, \
+	find_datasets, get_command, read_config
+
+sys.path.insert(0, os.path.join(TEST_DIRECTORY, 'change_indication'))
+from compareChangeIndication import STATE_GROUPS
+
+DEFAULT_BINDINGS = os.path.join(REPO_DIRECTORY, 'build', 'test_build_python', 'test', 'python_bindings')
+DEFAULT_CACHE_DIRECTORY = os.path.join(REPO_DIRECTORY, 'build', 'sweep_cache')
+
+DISTRIBUTIONS = {
+	"uniform": ("low", "high"),
+	"loguniform": ("low", "high"),
+	"normal": ("mean", "std"),
+}
+
+
+def get_arguments():
+	"""
+	parses the command line arguments
+	:return:
+	"""
+	parser = argparse.ArgumentParser(description='Replay the datasets for a grid or random draws of EKF parameters.')
+	parser.add_argument('sweep_file', metavar='sweep.json', help='parameters of the sweep')
+	parser.add_argument('--backend', choices=['binary', 'bindings'], default='binary',
+		help='replay with the ecl_replay binary or the ekf_replay Python module (default: %(default)s)')
+	parser.add_argument('--binary', default=DEFAULT_BINARY,
+		help='ecl_replay binary (default: %(default)s)')
+	parser.add_argument('--bindings', default=DEFAULT_BINDINGS,
+		help='directory of the ekf_replay Python module (default: %(default)s)')
+	parser.add_argument('--replay-data', default=DEFAULT_REPLAY_DATA,
+		help='directory of the sensor data files and configs (default: %(default)s)')
+	parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+		help='number of replays in parallel processes (default: number of cores)')
+	parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIRECTORY,
+		help='directory of the cached metrics (default: %(default)s)')
+	parser.add_argument('-o', '--output', default='sweep_results.csv',
+		help='csv file of the table of the metrics (default: %(default)s)')
+	return parser.parse_args()
+
+
+def read_sweep(file_name: str) -> dict:
+	"""
+	reads and checks a sweep file
+	:return:
+	"""
+	with open(file_name) as file:
+		sweep = json.load(file)
+
+	unknown = [key for key in sweep if key not in ("datasets", "parameters", "samples", "seed")]
+	if unknown:
+		raise ConfigError("unknown entries %s in %s" % (", ".join(unknown), file_name))
+	if not sweep.get("parameters"):
+		raise ConfigError("%s sets no parameters" % file_name)
+
+	for name, values in sweep["parameters"].items():
+		if isinstance(values, list):
+			if not values:
+				raise ConfigError("no values of %s" % name)
+		elif isinstance(values, dict):
+			arguments = DISTRIBUTIONS.get(values.get("distribution"))
+			if arguments is None:
+				raise ConfigError("distribution of %s must be one of %s" % (name, ", ".join(DISTRIBUTIONS)))
+			if any(argument not in values for argument in arguments):
+				raise ConfigError("distribution of %s needs %s" % (name, " and ".join(arguments)))
+		else:
+			raise ConfigError("%s must be a list of values or a distribution" % name)
+
+	return sweep
+
+
+def get_parameter_sets(sweep: dict) -> list:
+	"""
+	returns the parameter sets of the sweep, each draw of the distributed
+	parameters combined with each point of the grid
+	:return: list of dicts of parameter name to value
+	"""
+	grid = {name: values for name, values in sweep["parameters"].items() if isinstance(values, list)}
+	distributions = {name: values for name, values in sweep["parameters"].items() if isinstance(values, dict)}
+
+	grid_points = [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+	if not distributions:
+		return grid_points
+
+	random = np.random.default_rng(sweep.get("seed", 0))
+	n_samples = int(sweep.get("samples", 1))
+	draws = {}
+	for name, distribution in distributions.items():
+		if distribution["distribution"] == "uniform":
+			draws[name] = random.uniform(distribution["low"], distribution["high"], n_samples)
+		elif distribution["distribution"] == "loguniform":
+			draws[name] = np.exp(random.uniform(np.log(distribution["low"]), np.log(distribution["high"]), n_samples))
+		else:
+			draws[name] = random.normal(distribution["mean"], distribution["std"], n_samples)
+
+	return [dict(point, **{name: float(values[sample]) for name, values in draws.items()})
+		for sample in range(n_samples) for point in grid_points]
+
+
+def get_file_hash(file_name: str) -> str:
+	"""
+	returns the sha256 hash of a file
+	:return:
+	"""
+	file_hash = hashlib.sha256()
+	with open(file_name, 'rb') as file:
+		for block in iter(lambda: file.read(1 << 20), b''):
+			file_hash.update(block)
+
+	return file_hash.hexdigest()
+
+
+def get_cache_key(dataset_hash: str, config: dict) -> str:
+	"""
+	returns the cache key of a replay, the hash of the dataset and of the config
+	entries which change the replay
+	:return:
+	"""
+	replay = {key: config[key] for key in ("duration", "sensors", "fusion_mode", "parameters", "logging_rate")}
+	text = dataset_hash + json.dumps(replay, sort_keys=True)
+
+	return hashlib.sha256(text.encode()).hexdigest()
+
+
+def read_output_file(file_name: str) -> tuple:
+	"""
+	reads a csv output file of the replay binary
+	:return: (column names, float64 array of the rows)
+	"""
+	with open(file_name) as file:
+		columns = file.readline().strip().split(',')
+	values = np.loadtxt(file_name, delimiter=',', skiprows=1, ndmin=2)
+
+	return columns, values
+
+
+def replay_with_binary(input_file: str, config: dict, binary: str) -> dict:
+	"""
+	replays a dataset with the ecl_replay binary
+	:return: dict of output arrays as returned by ekf_replay.Replay.run and the
+	names of the innovations and test ratios
+	"""
+	with tempfile.TemporaryDirectory() as output_dir:
+		config = dict(config, output=os.path.join(output_dir, 'output.csv'))
+		innovation_file = os.path.join(output_dir, 'innovations.csv')
+		result = subprocess.run(get_command(binary, input_file, config) + ['--innovations', innovation_file],
+			stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+		if result.returncode != 0:
+			raise RuntimeError((result.stderr or result.stdout).strip() or "exit code %i" % result.returncode)
+
+		columns, states = read_output_file(config["output"])
+		innovation_columns, innovations = read_output_file(innovation_file)
+
+	def select(prefix: str) -> tuple:
+		indices = [i for i, column in enumerate(innovation_columns) if column.startswith(prefix + '[')]
+		return [innovation_columns[i][len(prefix) + 1:-1] for i in indices], innovations[:, indices]
+
+	innovation_names, innovation_values = select('innovation')
+	test_ratio_names, test_ratio_values = select('test_ratio')
+
+	return {"states": states[:, [columns.index("state[%i]" % i) for i in range(24)]],
+		"variances": states[:, [columns.index("variance[%i]" % i) for i in range(24)]],
+		"innovations": innovation_values,
+		"innovation_variances": select('innovation_variance')[1],
+		"test_ratios": test_ratio_values,
+		"innovation_names": innovation_names,
+		"test_ratio_names": test_ratio_names}
+
+
+def replay_with_bindings(input_file: str, config: dict, bindings: str) -> dict:
+	"""
+	replays a dataset with the ekf_replay Python module
+	:return: dict of output arrays as returned by ekf_replay.Replay.run and the
+	names of the innovations and test ratios
+	"""
+	if bindings not in sys.path:
+		sys.path.insert(0, bindings)
+	import ekf_replay
+
+	replay = ekf_replay.Replay()
+	replay.load_file(input_file)
+	for sensor in config["sensors"]:
+		replay.start_sensor(sensor)
+	if config["fusion_mode"] is not None:
+		replay.set_parameter("fusion_mode", config["fusion_mode"])
+	for name, value in config["parameters"].items():
+		replay.set_parameter(name, value)
+
+	output = replay.run(config["duration"], config["logging_rate"])
+	output["innovation_names"] = list(ekf_replay.INNOVATION_NAMES)
+	output["test_ratio_names"] = list(ekf_replay.TEST_RATIO_NAMES)
+
+	return output
+
+
+def get_metrics(output: dict) -> dict:
+	"""
+	computes the summary metrics of the outputs of a replay
+	:return: dict of metric name to value
+	"""
+	metrics = {"diverged": bool(np.isnan(output["states"]).any())}
+
+	test_ratios = np.asarray(output["test_ratios"], dtype=np.float64)
+	for i, name in enumerate(output["test_ratio_names"]):
+		# sources which were never fused have no test ratio
+		if np.any(test_ratios[:, i] > 0):
+			metrics[name + "_test_ratio_mean"] = float(np.mean(test_ratios[:, i]))
+			metrics[name + "_test_ratio_max"] = float(np.max(test_ratios[:, i]))
+			metrics[name + "_rejected"] = float(np.mean(test_ratios[:, i] > 1.0))
+
+	innovations = np.asarray(output["innovations"], dtype=np.float64)
+	innovation_variances = np.asarray(output["innovation_variances"], dtype=np.float64)
+	columns = {name: i for i, name in enumerate(output["innovation_names"])}
+	fused = innovation_variances[:, columns["gps_pos_n"]] > 0
+	if np.any(fused):
+		horizontal = innovations[fused][:, [columns["gps_pos_n"], columns["gps_pos_e"]]]
+		metrics["gps_hpos_error_rms"] = float(np.sqrt(np.mean(np.sum(horizontal ** 2, axis=1))))
+		metrics["gps_vpos_error_rms"] = float(np.sqrt(np.mean(innovations[fused, columns["gps_pos_d"]] ** 2)))
+
+	variances = np.asarray(output["variances"], dtype=np.float64)
+	for name, states, _, _ in STATE_GROUPS:
+		metrics["final_variance_" + name.replace(' ', '_')] = float(np.max(variances[-1, list(states)]))
+
+	return metrics
+
+
+def run_replay(task: dict, backend: str, binary: str, bindings: str) -> dict:
+	"""
+	replays a dataset with a parameter set and caches the metrics, the errors are
+	returned in the result so that a failing replay does not stop the sweep
+	:return: result with the dataset, the parameters and the metrics
+	"""
+	result = {"dataset": task["dataset"], "parameters": task["parameters"]}
+
+	try:
+		if backend == "binary":
+			output = replay_with_binary(task["input"], task["config"], binary)
+		else:
+			output = replay_with_bindings(task["input"], task["config"], bindings)
+		result["metrics"] = get_metrics(output)
+	except Exception as error:
+		result["error"] = str(error)
+		return result
+
+	with open(task["cache_file"] + '.partial', 'w') as file:
+		json.dump(result, file)
+	os.replace(task["cache_file"] + '.partial', task["cache_file"])
+
+	return result
+
+
+def get_table(results: list) -> pd.DataFrame:
+	"""
+	returns the table of the dataset, the parameters and the metrics of each replay
+	:return:
+	"""
+	rows = [dict(dataset=result["dataset"], **result["parameters"], **result["metrics"]) for result in results]
+
+	return pd.DataFrame(rows)
+
+
+def main() -> None:
+	"""
+	main entry point
+	:return:
+	"""
+	args = get_arguments()
+
+	try:
+		sweep = read_sweep(args.sweep_file)
+	except (OSError, ValueError, ConfigError) as error:
+		print("Invalid sweep file %s: %s" % (args.sweep_file, error))
+		exit(-1)
+
+	datasets = find_datasets(args.replay_data, sweep.get("datasets", []), False)
+	if not datasets:
+		print("No replay data found")
+		exit(-1)
+	if args.backend == "binary" and not os.path.isfile(args.binary):
+		print("Replay binary %s not found, build it with make test_build" % args.binary)
+		exit(-1)
+
+	os.makedirs(args.cache_dir, exist_ok=True)
+	parameter_sets = get_parameter_sets(sweep)
+
+	tasks = []
+	for name, input_file, csv_file in datasets:
+		config = read_config(csv_file, None)
+		dataset_hash = get_file_hash(csv_file)
+		for parameters in parameter_sets:
+			task_config = dict(config, parameters=dict(config["parameters"], **parameters))
+			tasks.append({"dataset": name, "input": input_file, "parameters": parameters, "config": task_config,
+				"cache_file": os.path.join(args.cache_dir, get_cache_key(dataset_hash, task_config) + '.json')})
+
+	results = {}
+	replays = []
+	for index, task in enumerate(tasks):
+		if os.path.isfile(task["cache_file"]):
+			with open(task["cache_file"]) as file:
+				results[index] = dict(json.load(file), parameters=task["parameters"])
+		else:
+			replays.append(index)
+
+	print("%i parameter sets on %i datasets, %i replays cached, %i to run" % (len(parameter_sets), len(datasets),
+		len(results), len(replays)))
+
+	failures = []
+	if replays:
+		with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(replays)))) as executor:
+			futures = {executor.submit(run_replay, tasks[index], args.backend, args.binary, args.bindings): index
+				for index in replays}
+			for i, future in enumerate(as_completed(futures)):
+				result = future.result()
+				if "error" in result:
+					failures.append(result)
+					print("FAILED %s %s: %s" % (result["dataset"], result["parameters"], result["error"]))
+				else:
+					results[futures[future]] = result
+				print("%i of %i replays done" % (i + 1, len(replays)), end='\r')
+		print()
+
+	table = get_table([results[index] for index in sorted(results)])
+	table.to_csv(args.output, index=False)
+	print("%i replays, %i failed, table written to %s" % (len(results), len(failures), args.output))
+
+	if failures:
+		exit(1)
+
+
+if __name__ == '__main__':
+	main()
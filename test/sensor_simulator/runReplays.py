@@ -0,0 +1,324 @@
+"""
+Runs the replay of every sensor data csv file in the replay data directory with
+the ecl_replay binary of the test build, each dataset in its own process.
+
+Each dataset <name>.csv can have a config file <name>.json next to it, all
+entries are optional:
+
+	duration      replayed seconds (default: up to the last sample)
+	sensors       simulated sensors started in addition to the IMU, baro and
+	              mag: gps, flow, range, vio, airspeed
+	fusion_mode   fusion_mode bits, as integer or list of bit names
+	parameters    dict of EKF parameter name to value
+	logging_rate  rate of the logged states and variances in Hz (default: 10)
+	output        file the states and variances are written to, relative to
+	              the config file (default: <name>.csv in the output directory)
+
+The binary replay file <name>.bin is replayed instead of the csv file if it
+exists. The outputs and timings of all datasets are written to one report.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+
+TEST_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_DIRECTORY = os.path.dirname(TEST_DIRECTORY)
+
+sys.path.insert(0, os.path.join(TEST_DIRECTORY, 'change_indication'))
+from compareChangeIndication import compare_files, get_column_groups
+
+DEFAULT_REPLAY_DATA = os.path.join(TEST_DIRECTORY, 'replay_data')
+DEFAULT_BINARY = os.path.join(REPO_DIRECTORY, 'build', 'test_build', 'test', 'ecl_replay')
+DEFAULT_OUTPUT_DIRECTORY = os.path.join(REPO_DIRECTORY, 'build', 'replay_output')
+
+SENSORS = ["gps", "flow", "range", "vio", "airspeed"]
+
+# bits of parameters::fusion_mode, see EKF/common.h
+FUSION_MODE_BITS = {
+	"gps": 1 << 0,
+	"flow": 1 << 1,
+	"inhibit_acc_bias": 1 << 2,
+	"ev_pos": 1 << 3,
+	"ev_yaw": 1 << 4,
+	"drag": 1 << 5,
+	"rotate_ev": 1 << 6,
+	"gps_yaw": 1 << 7,
+	"ev_vel": 1 << 8,
+}
+
+CONFIG_KEYS = ["duration", "sensors", "fusion_mode", "parameters", "logging_rate", "output"]
+
+
+class ConfigError(Exception):
+	"""
+	raised if the config of a dataset is invalid, the message describes the reason
+	"""
+
+
+def get_arguments():
+	"""
+	parses the command line arguments
+	:return:
+	"""
+	parser = argparse.ArgumentParser(
+		description='Replay all sensor data files of the replay data directory in parallel processes.')
+	parser.add_argument('datasets', nargs='*', metavar='name',
+		help='names of the replayed datasets (default: all)')
+	parser.add_argument('--replay-data', default=DEFAULT_REPLAY_DATA,
+		help='directory of the sensor data files and configs (default: %(default)s)')
+	parser.add_argument('--binary', default=DEFAULT_BINARY,
+		help='ecl_replay binary (default: %(default)s)')
+	parser.add_argument('-o', '--output-dir', default=None,
+		help='write all outputs to this directory instead of the files of the configs')
+	parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+		help='number of datasets replayed in parallel processes (default: number of cores)')
+	parser.add_argument('--csv', action='store_true',
+		help='replay the csv files even if there are binary replay files')
+	parser.add_argument('--compare', action='store_true',
+		help='compare the outputs with the files of the configs, requires --output-dir')
+	parser.add_argument('--report', default='replay_report.json',
+		help='report file (default: %(default)s)')
+	args = parser.parse_args()
+	if args.compare and args.output_dir is None:
+		parser.error('--compare requires --output-dir, else the outputs overwrite the compared files')
+	return args
+
+
+def get_fusion_mode(value) -> int:
+	"""
+	converts the fusion mode of a config, an integer or a list of bit names
+	:return:
+	"""
+	if isinstance(value, bool):
+		raise ConfigError("fusion_mode must be an integer or a list of %s" % ", ".join(FUSION_MODE_BITS))
+	if isinstance(value, int):
+		return value
+	if isinstance(value, list):
+		unknown = [bit for bit in value if bit not in FUSION_MODE_BITS]
+		if unknown:
+			raise ConfigError("unknown fusion_mode bits %s" % ", ".join(map(str, unknown)))
+		return sum(FUSION_MODE_BITS[bit] for bit in set(value))
+	raise ConfigError("fusion_mode must be an integer or a list of %s" % ", ".join(FUSION_MODE_BITS))
+
+
+def get_data_duration(csv_file: str) -> float:
+	"""
+	returns the time of the last sample of a sensor data csv file
+	:return: seconds
+	"""
+	with open(csv_file, 'rb') as file:
+		file.seek(0, os.SEEK_END)
+		file.seek(max(0, file.tell() - 4096))
+		lines = [line for line in file.read().splitlines() if line.strip()]
+
+	return int(lines[-1].split(b',')[0]) / 1e6 if lines else 0.0
+
+
+def read_config(csv_file: str, output_dir: str) -> dict:
+	"""
+	reads the config of a dataset and fills in the defaults
+	:return: dict with all config entries, the output as absolute path
+	"""
+	name = os.path.splitext(os.path.basename(csv_file))[0]
+	config_file = os.path.splitext(csv_file)[0] + '.json'
+	config = {}
+
+	if os.path.isfile(config_file):
+		try:
+			with open(config_file) as file:
+				config = json.load(file)
+		except ValueError as error:
+			raise ConfigError("could not parse %s: %s" % (config_file, error)) from error
+		if not isinstance(config, dict):
+			raise ConfigError("%s must contain an object" % config_file)
+
+	unknown = [key for key in config if key not in CONFIG_KEYS]
+	if unknown:
+		raise ConfigError("unknown entries %s in %s" % (", ".join(unknown), config_file))
+
+	sensors = config.get("sensors", [])
+	unknown = [sensor for sensor in sensors if sensor not in SENSORS]
+	if unknown:
+		raise ConfigError("unknown sensors %s in %s" % (", ".join(unknown), config_file))
+
+	parameters = config.get("parameters", {})
+	if not isinstance(parameters, dict):
+		raise ConfigError("parameters must be an object in %s" % config_file)
+
+	if output_dir is not None or "output" not in config:
+		output = os.path.join(output_dir or DEFAULT_OUTPUT_DIRECTORY, name + '.csv')
+	else:
+		output = os.path.join(os.path.dirname(os.path.abspath(config_file)), config["output"])
+
+	return {
+		"duration": float(config.get("duration", get_data_duration(csv_file))),
+		"sensors": sensors,
+		"fusion_mode": get_fusion_mode(config["fusion_mode"]) if "fusion_mode" in config else None,
+		"parameters": parameters,
+		"logging_rate": float(config.get("logging_rate", 10)),
+		"output": os.path.abspath(output),
+		"reference": os.path.join(os.path.dirname(os.path.abspath(config_file)), config["output"])
+			if "output" in config else None,
+	}
+
+
+def find_datasets(replay_data: str, names: list, use_csv: bool) -> list:
+	"""
+	returns the datasets of the replay data directory
+	:return: sorted list of (name, replayed file, csv file)
+	"""
+	datasets = []
+
+	for csv_file in sorted(glob.glob(os.path.join(replay_data, '*.csv'))):
+		name = os.path.splitext(os.path.basename(csv_file))[0]
+		if names and name not in names:
+			continue
+		binary_file = os.path.splitext(csv_file)[0] + '.bin'
+		datasets.append((name, csv_file if use_csv or not os.path.isfile(binary_file) else binary_file, csv_file))
+
+	return datasets
+
+
+def get_command(binary: str, input_file: str, config: dict) -> list:
+	"""
+	returns the ecl_replay command line of a dataset
+	:return:
+	"""
+	command = [binary, input_file, config["output"], '--duration', repr(config["duration"]),
+		'--logging-rate', repr(config["logging_rate"])]
+
+	for sensor in config["sensors"]:
+		command += ['--sensor', sensor]
+	if config["fusion_mode"] is not None:
+		command += ['--fusion-mode', str(config["fusion_mode"])]
+	for name, value in config["parameters"].items():
+		command += ['--param', '%s=%s' % (name, value)]
+
+	return command
+
+
+def replay(name: str, input_file: str, config: dict, binary: str, compare: bool) -> dict:
+	"""
+	replays one dataset, the errors are returned in the report entry so that a
+	failing dataset does not stop the replay of the others
+	:return: report entry of the dataset
+	"""
+	entry = {"name": name, "input": input_file, "output": config["output"]}
+	command = get_command(binary, input_file, config)
+	entry["command"] = command
+	start_time = time.perf_counter()
+
+	try:
+		os.makedirs(os.path.dirname(config["output"]), exist_ok=True)
+		result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+	except OSError as error:
+		entry.update(status="failed", error=str(error), wall_time=time.perf_counter() - start_time)
+		return entry
+
+	entry["wall_time"] = time.perf_counter() - start_time
+
+	if result.returncode != 0:
+		entry.update(status="failed", error=(result.stderr or result.stdout).strip() or
+			"exit code %i" % result.returncode)
+		return entry
+
+	try:
+		entry.update(json.loads(result.stdout.strip().splitlines()[-1]))
+	except (ValueError, IndexError):
+		pass
+	entry["status"] = "replayed"
+
+	if compare and config["reference"] is not None:
+		try:
+			comparisons = compare_files(config["reference"], config["output"], get_column_groups())
+			entry["comparison"] = [comparison.get_results() for comparison in comparisons]
+			if any(comparison.has_diverged() for comparison in comparisons):
+				entry["status"] = "diverged"
+		except (OSError, ValueError) as error:
+			entry.update(status="failed", error="could not compare with %s: %s" % (config["reference"], error))
+
+	return entry
+
+
+def write_report(entries: list, file_name: str, wall_time: float) -> None:
+	"""
+	writes the report entries of all datasets to a json file
+	:return:
+	"""
+	counts = {}
+	for entry in entries:
+		counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+	counts["wall_time"] = wall_time
+	counts["replay_time"] = sum(entry.get("replay_time", 0.0) for entry in entries)
+
+	with open(file_name, 'w') as file:
+		json.dump({"summary": counts, "datasets": entries}, file, indent=4)
+		file.write("\n")
+
+
+def main() -> None:
+	"""
+	main entry point
+	:return:
+	"""
+	args = get_arguments()
+	datasets = find_datasets(args.replay_data, args.datasets, args.csv)
+
+	if not datasets:
+		print("No replay data found")
+		exit(-1)
+
+	if not os.path.isfile(args.binary):
+		print("Replay binary %s not found, build it with make test_build" % args.binary)
+		exit(-1)
+
+	entries = {}
+	replays = []
+	for name, input_file, csv_file in datasets:
+		try:
+			replays.append((name, input_file, read_config(csv_file, args.output_dir)))
+		except ConfigError as error:
+			entries[name] = {"name": name, "input": input_file, "status": "failed", "error": str(error)}
+			print("FAILED   %s: %s" % (name, error))
+
+	outputs = [config["output"] for _, _, config in replays]
+	if len(set(outputs)) < len(outputs):
+		print("Datasets have the same output file")
+		exit(-1)
+
+	print("Replaying %i datasets" % len(replays))
+	start_time = time.perf_counter()
+
+	if replays:
+		with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(replays)))) as executor:
+			futures = [executor.submit(replay, name, input_file, config, args.binary, args.compare)
+				for name, input_file, config in replays]
+			for future in as_completed(futures):
+				entry = future.result()
+				entries[entry["name"]] = entry
+				if entry["status"] == "failed":
+					print("FAILED   %s: %s" % (entry["name"], entry["error"]))
+				else:
+					print("%-8s %s in %.2f s" % (entry["status"], entry["name"], entry["wall_time"]))
+
+	wall_time = time.perf_counter() - start_time
+	entries = [entries[name] for name, _, _ in datasets]
+	write_report(entries, args.report, wall_time)
+
+	failures = [entry for entry in entries if entry["status"] != "replayed"]
+	print("%i replayed, %i diverged, %i failed in %.2f s, report written to %s" % (
+		sum(entry["status"] == "replayed" for entry in entries),
+		sum(entry["status"] == "diverged" for entry in entries),
+		sum(entry["status"] == "failed" for entry in entries), wall_time, args.report))
+
+	if failures:
+		exit(1)
+
+
+if __name__ == '__main__':
+	main()
@@ -1,5 +1,14 @@
 #include "sensor_simulator.h"
 
+#include <cctype>
+#include <cerrno>
+#include <cstdlib>
+#include <cstring>
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
 
 SensorSimulator::SensorSimulator(std::shared_ptr<Ekf> ekf):
 _ekf{ekf},
@@ -19,14 +28,50 @@ _airspeed(ekf)
 
 SensorSimulator::~SensorSimulator()
 {
+	unmapReplayFile();
+}
+
+// parse the number of a csv cell, trailing white space such as the carriage
+// return of Windows line ends is accepted
+static bool parseTimestamp(const std::string &text, uint64_t &value)
+{
+	char *end = nullptr;
+	errno = 0;
+	value = strtoull(text.c_str(), &end, 10);
 
+	while (end != text.c_str() && isspace(*end)) {
+		end++;
+	}
+
+	return end != text.c_str() && *end == '\0' && errno == 0 && text.find('-') == std::string::npos;
 }
 
-void SensorSimulator::loadSensorDataFromFile(std::string file_name)
+static bool parseValue(const std::string &text, double &value)
 {
+	char *end = nullptr;
+	value = strtod(text.c_str(), &end);
+
+	while (end != text.c_str() && isspace(*end)) {
+		end++;
+	}
+
+	return end != text.c_str() && *end == '\0';
+}
+
+bool SensorSimulator::loadSensorDataFromFile(std::string file_name)
+{
+	unmapReplayFile();
+
 	std::ifstream file(file_name);
 	std::string line;
 
+	if (!file.is_open()) {
+		return setLoadError("Can not open replay file " + file_name);
+	}
+
+	_replay_data.clear();
+	_current_replay_data_index = 0;
+
 	while (!file.eof()) {
 		std::string timestamp;
 		std::string sensor_type;
@@ -38,14 +83,16 @@ void SensorSimulator::loadSensorDataFromFile(std::string file_name)
 		if (!timestamp.compare("")){ // empty line at end of file
 			break;
 		}
-		sensor_sample.timestamp = std::stoul(timestamp);
+
+		if (!parseTimestamp(timestamp, sensor_sample.timestamp)) {
+			return setLoadError("Timestamp " + timestamp + " invalid");
+		}
 
 		if(_replay_data.size() > 0) {
 			sensor_info last_sample = _replay_data.back();
 			if (sensor_sample.timestamp < last_sample.timestamp)
 			{
-				std::cout << "Timestamps not sorted ascendingly" << std::endl;
-				exit(-1);
+				return setLoadError("Timestamps not sorted ascendingly");
 			}
 		}
 
@@ -77,8 +124,7 @@ void SensorSimulator::loadSensorDataFromFile(std::string file_name)
 			sensor_sample.sensor_type = sensor_info::LANDING_STATUS;
 
 		} else {
-			std::cout << "Sensor type in file unknown" << std::endl;
-			exit(-1);
+			return setLoadError("Sensor type in file unknown");
 		}
 
 		getline(file, sensor_data);
@@ -87,21 +133,234 @@ void SensorSimulator::loadSensorDataFromFile(std::string file_name)
 		while( ss.good() )
 		{
 			if(i>=10){
-				std::cout << "sensor data bigger than expected" << std::endl;
-				exit(-1);
+				return setLoadError("sensor data bigger than expected");
 			}
 			std::string value_string;
 			getline( ss, value_string, ',' );
 			if(!value_string.compare("")){
 				continue;
 			}
-			sensor_sample.sensor_data[i] = std::stod(value_string);
+			if (!parseValue(value_string, sensor_sample.sensor_data[i])) {
+				return setLoadError("Sensor value " + value_string + " invalid");
+			}
 			i++;
 		}
 		_replay_data.emplace_back(sensor_sample);
 	}
 	file.close();
+
+	if (_replay_data.empty()) {
+		return setLoadError("Replay file " + file_name + " holds no sensor data");
+	}
+
+	_has_replay_data = true;
+	return true;
+}
+
+bool SensorSimulator::loadSensorData(const std::vector<sensor_info> &replay_data)
+{
+	unmapReplayFile();
+
+	if (replay_data.empty()) {
+		return setLoadError("No sensor data given");
+	}
+
+	for (size_t i = 1; i < replay_data.size(); i++) {
+		if (replay_data[i].timestamp < replay_data[i - 1].timestamp) {
+			return setLoadError("Timestamps not sorted ascendingly");
+		}
+	}
+
+	_replay_data = replay_data;
+	_current_replay_data_index = 0;
+	_has_replay_data = true;
+	return true;
+}
+
+bool SensorSimulator::loadSensorDataFromBinaryFile(std::string file_name)
+{
+	using namespace sensor_simulator::replay_file;
+
+	unmapReplayFile();
+
+	const int fd = open(file_name.c_str(), O_RDONLY);
+	struct stat file_stat;
+
+	if (fd < 0 || fstat(fd, &file_stat) != 0 || (size_t)file_stat.st_size < sizeof(ReplayFileHeader)) {
+		if (fd >= 0) {
+			close(fd);
+		}
+
+		return setLoadError("Can not open binary replay file " + file_name);
+	}
+
+	void *data = mmap(nullptr, file_stat.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+	close(fd);
+
+	if (data == MAP_FAILED) {
+		return setLoadError("Can not map binary replay file " + file_name);
+	}
+
+	_replay_file = static_cast<const uint8_t *>(data);
+	_replay_file_size = file_stat.st_size;
+
+	// the records are copied with memcpy as they are not aligned
+	ReplayFileHeader header;
+	memcpy(&header, _replay_file, sizeof(header));
+
+	if (memcmp(header.magic, MAGIC, sizeof(MAGIC)) != 0 || header.version != VERSION) {
+		return setLoadError("Binary replay file format unknown");
+	}
+
+	const uint64_t table_size = (uint64_t)header.n_sections * sizeof(ReplayFileSection);
+
+	if (sizeof(header) + table_size > _replay_file_size
+	    || header.index_offset > _replay_file_size
+	    || header.n_samples > (_replay_file_size - header.index_offset) / sizeof(ReplayFileIndexEntry)) {
+		return setLoadError("Binary replay file truncated");
+	}
+
+	_replay_file_sections.resize(header.n_sections);
+	memcpy(_replay_file_sections.data(), _replay_file + sizeof(header), table_size);
+
+	for (const ReplayFileSection &section : _replay_file_sections) {
+		if (section.sensor_type > sensor_info::LANDING_STATUS) {
+			return setLoadError("Sensor type in file unknown");
+		}
+
+		if (section.n_values > sensor_info{}.sensor_data.size()
+		    || (section.value_size != sizeof(float) && section.value_size != sizeof(double))
+		    || section.record_size != sizeof(uint64_t) + section.n_values * section.value_size) {
+			return setLoadError("sensor data bigger than expected");
+		}
+
+		if (section.records_offset > _replay_file_size
+		    || section.n_records > (_replay_file_size - section.records_offset) / section.record_size) {
+			return setLoadError("Binary replay file truncated");
+		}
+	}
+
+	if (header.n_samples == 0) {
+		return setLoadError("Binary replay file " + file_name + " holds no sensor data");
+	}
+
+	_replay_file_index = _replay_file + header.index_offset;
+	_replay_file_n_samples = header.n_samples;
+	_current_replay_data_index = 0;
+
+	// the index is checked once so that the replay can read the records unchecked
+	uint64_t last_timestamp = 0;
+
+	for (size_t i = 0; i < _replay_file_n_samples; i++) {
+		ReplayFileIndexEntry entry;
+		memcpy(&entry, _replay_file_index + i * sizeof(entry), sizeof(entry));
+
+		if (entry.section >= _replay_file_sections.size()
+		    || entry.record >= _replay_file_sections[entry.section].n_records) {
+			return setLoadError("Binary replay file index invalid");
+		}
+
+		const uint64_t timestamp = getReplaySample(i).timestamp;
+
+		if (timestamp < last_timestamp) {
+			return setLoadError("Timestamps not sorted ascendingly");
+		}
+
+		last_timestamp = timestamp;
+	}
+
 	_has_replay_data = true;
+	return true;
+}
+
+bool SensorSimulator::setLoadError(const std::string &error)
+{
+	unmapReplayFile();
+	_replay_data.clear();
+	_has_replay_data = false;
+	_load_error = error;
+	return false;
+}
+
+void SensorSimulator::unmapReplayFile()
+{
+	if (_replay_file != nullptr) {
+		munmap(const_cast<uint8_t *>(_replay_file), _replay_file_size);
+		_replay_file = nullptr;
+		_replay_file_size = 0;
+		_replay_file_index = nullptr;
+		_replay_file_n_samples = 0;
+		_replay_file_sections.clear();
+	}
+}
+
+size_t SensorSimulator::getReplayDataSize() const
+{
+	return (_replay_file != nullptr) ? _replay_file_n_samples : _replay_data.size();
+}
+
+sensor_info SensorSimulator::getReplaySample(size_t index) const
+{
+	using namespace sensor_simulator::replay_file;
+
+	sensor_info sample;
+
+	if (index >= getReplayDataSize()) {
+		// past the end of the replay data the default sample is returned, which
+		// sets zero IMU data. The change indication outputs are recorded with it.
+		return sample;
+	}
+
+	if (_replay_file == nullptr) {
+		return _replay_data[index];
+	}
+
+	ReplayFileIndexEntry entry;
+	memcpy(&entry, _replay_file_index + index * sizeof(entry), sizeof(entry));
+
+	const ReplayFileSection &section = _replay_file_sections[entry.section];
+	const uint8_t *record = _replay_file + section.records_offset + entry.record * section.record_size;
+	const uint8_t *values = record + sizeof(uint64_t);
+
+	memcpy(&sample.timestamp, record, sizeof(uint64_t));
+	sample.sensor_type = static_cast<sensor_info::measurement_t>(section.sensor_type);
+
+	for (size_t i = 0; i < section.n_values; i++) {
+		if (section.value_size == sizeof(float)) {
+			float value;
+			memcpy(&value, values + i * sizeof(float), sizeof(float));
+			sample.sensor_data[i] = value;
+
+		} else {
+			memcpy(&sample.sensor_data[i], values + i * sizeof(double), sizeof(double));
+		}
+	}
+
+	return sample;
+}
+
+bool SensorSimulator::startSensor(const std::string &sensor_name)
+{
+	if (sensor_name == "gps") {
+		startGps();
+
+	} else if (sensor_name == "flow") {
+		startFlow();
+
+	} else if (sensor_name == "range") {
+		startRangeFinder();
+
+	} else if (sensor_name == "vio") {
+		startExternalVision();
+
+	} else if (sensor_name == "airspeed") {
+		startAirspeedSensor();
+
+	} else {
+		return false;
+	}
+
+	return true;
 }
 
 void SensorSimulator::setSensorRateToDefault()
@@ -198,18 +457,20 @@ void SensorSimulator::runReplayMicroseconds(uint32_t duration)
 
 void SensorSimulator::setSensorDataFromReplayData()
 {
-	if(_replay_data.size() > 0) {
-		sensor_info sample = _replay_data[_current_replay_data_index];
+	const size_t replay_data_size = getReplayDataSize();
+
+	if(replay_data_size > 0) {
+		sensor_info sample = getReplaySample(_current_replay_data_index);
 		while(sample.timestamp < _time)
 		{
 			setSingleReplaySample(sample);
-			if(_current_replay_data_index < _replay_data.size())
+			if(_current_replay_data_index < replay_data_size)
 			{
 				_current_replay_data_index ++;
 			} else {
 				break;
 			}
-			sample = _replay_data[_current_replay_data_index];
+			sample = getReplaySample(_current_replay_data_index);
 		}
 	} else {
 		std::cerr << "Loaded replay data empty. Likely could not load replay data" << std::endl;
@@ -262,13 +523,17 @@ void SensorSimulator::setSingleReplaySample(const sensor_info& sample)
 		_flow.setData(flow_sample);
 
 	} else if (sample.sensor_type == sensor_info::VISION) {
-		// sensor not yet implemented
-
-		// extVisionSample vision_sample;
-		// vision_sample.pos;
-		// vision_sample.quat;
-		// vision_sample.vel;
-		// _vio.setData((float) sample.sensor_data[0], (float) sample.sensor_data[1]);
+		// the variances and the local velocity frame of the data at rest are kept
+		_vio.setPosition(Vector3f((float) sample.sensor_data[0],
+					  (float) sample.sensor_data[1],
+					  (float) sample.sensor_data[2]));
+		_vio.setOrientation(Quatf((float) sample.sensor_data[3],
+					  (float) sample.sensor_data[4],
+					  (float) sample.sensor_data[5],
+					  (float) sample.sensor_data[6]));
+		_vio.setVelocity(Vector3f((float) sample.sensor_data[7],
+					  (float) sample.sensor_data[8],
+					  (float) sample.sensor_data[9]));
 
 	} else if (sample.sensor_type == sensor_info::LANDING_STATUS) {
 		bool landed = sample.sensor_data[0];
@@ -48,6 +48,7 @@
 #include <sstream>
 #include <vector>
 #include <array>
+#include <string>
 
 #include "imu.h"
 #include "mag.h"
@@ -57,6 +58,7 @@
 #include "range_finder.h"
 #include "vio.h"
 #include "airspeed.h"
+#include "replay_file.h"
 #include "EKF/ekf.h"
 
 using namespace sensor_simulator::sensor;
@@ -81,6 +83,19 @@ private:
 	void updateSensors();
 	void setSensorDataFromReplayData();
 	void setSingleReplaySample(const sensor_info& sample);
+	size_t getReplayDataSize() const;
+	sensor_info getReplaySample(size_t index) const;
+	void unmapReplayFile();
+	bool setLoadError(const std::string &error);
+
+	std::string _load_error;
+
+	// memory mapped binary replay file, see replay_file.h
+	const uint8_t *_replay_file {nullptr};
+	size_t _replay_file_size {0};
+	const uint8_t *_replay_file_index {nullptr};
+	size_t _replay_file_n_samples {0};
+	std::vector<sensor_simulator::replay_file::ReplayFileSection> _replay_file_sections;
 
 
 public:
@@ -113,10 +128,19 @@ public:
 	void startAirspeedSensor(){ _airspeed.start(); }
 	void stopAirspeedSensor(){ _airspeed.stop(); }
 
+	// starts the simulation of a sensor by the name of its replay data, the
+	// IMU, baro and mag simulations are always running
+	bool startSensor(const std::string &sensor_name);
+
 	void setImuBias(Vector3f accel_bias, Vector3f gyro_bias);
 	void simulateOrientation(Quatf orientation);
 
-	void loadSensorDataFromFile(std::string filename);
+	// the loaders return false on a missing or malformed file or unsorted
+	// samples, getLoadError() tells why
+	bool loadSensorDataFromFile(std::string filename);
+	bool loadSensorDataFromBinaryFile(std::string file_name);
+	bool loadSensorData(const std::vector<sensor_info> &replay_data);
+	const std::string &getLoadError() const { return _load_error; }
 
 	Imu _imu;
 	Mag _mag;
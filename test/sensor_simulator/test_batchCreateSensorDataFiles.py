@@ -0,0 +1,133 @@
+"""
+Tests of the batch conversion of batchCreateSensorDataFiles.py with a stub
+converter, so that no ulog files are needed.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import pytest
+import batchCreateSensorDataFiles
+from createSensorDataFile import ConversionError
+
+
+def stub_convert_ulog(input_file: str, output_file: str, sensors: list = None, start: float = None,
+		end: float = None, binary_file: str = None) -> dict:
+	"""
+	converts the logs named good*.ulg, writes a part of the output files of the
+	logs named bad*.ulg and fails, and fails for all other logs
+	:return:
+	"""
+	name = os.path.basename(input_file)
+	if not name.startswith(("good", "bad")):
+		raise AssertionError(name + " should not be converted")
+
+	for file_name in [output_file, binary_file]:
+		if file_name is not None:
+			with open(file_name, 'w') as file:
+				file.write("0,imu\r\n")
+
+	if name.startswith("bad"):
+		raise ConversionError("imu data has no field 'gyro_rad[0]' in topic sensor_combined")
+
+	return {"duration": 12.5, "sensors": ["imu", "gps"], "rows": {"imu": 3000, "gps": 60}}
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+	"""
+	a directory with a log which converts, one whose csv file is up to date and
+	one which fails, the up to date log has an entry in the previous manifest
+	:return:
+	"""
+	monkeypatch.setattr(batchCreateSensorDataFiles, "ProcessPoolExecutor", ThreadPoolExecutor)
+	monkeypatch.setattr(batchCreateSensorDataFiles, "convert_ulog", stub_convert_ulog)
+
+	for name in ["good.ulg", "current.ulg", "bad.ulg"]:
+		(tmp_path / name).write_bytes(b"ULog")
+		os.utime(str(tmp_path / name), (1000000000, 1000000000))
+	for name in ["current.csv", "current.bin"]:
+		(tmp_path / name).write_text("0,imu\r\n")
+
+	previous_entry = {"input": str(tmp_path / "current.ulg"), "output": str(tmp_path / "current.csv"),
+		"status": "converted", "duration": 60.0, "sensors": ["imu"], "rows": {"imu": 15000}, "total_rows": 15000,
+		"conversion_time": 1.5}
+	with open(str(tmp_path / "manifest.json"), 'w') as file:
+		json.dump({"summary": {"converted": 1}, "logs": [previous_entry]}, file)
+
+	return tmp_path
+
+
+def run_batch(monkeypatch, log_dir, arguments: list) -> dict:
+	"""
+	runs the batch conversion of the log directory, which exits with an error as
+	one log fails
+	:return: the manifest
+	"""
+	monkeypatch.setattr('sys.argv', ['batchCreateSensorDataFiles.py', str(log_dir),
+		'--manifest', str(log_dir / "manifest.json")] + arguments)
+
+	with pytest.raises(SystemExit) as exit_info:
+		batchCreateSensorDataFiles.main()
+	assert exit_info.value.code == 1
+
+	with open(str(log_dir / "manifest.json")) as file:
+		return json.load(file)
+
+
+@pytest.mark.parametrize("arguments", [[], ['--binary']])
+def test_manifest_records_each_log(monkeypatch, log_dir, arguments):
+	manifest = run_batch(monkeypatch, log_dir, arguments)
+
+	assert manifest["summary"] == {"converted": 1, "skipped": 1, "failed": 1}
+	bad, current, good = manifest["logs"]
+
+	assert good["input"] == str(log_dir / "good.ulg")
+	assert good["output"] == str(log_dir / "good.csv")
+	assert good["status"] == "converted"
+	assert good["duration"] == 12.5
+	assert good["sensors"] == ["imu", "gps"]
+	assert good["rows"] == {"imu": 3000, "gps": 60}
+	assert good["total_rows"] == 3060
+	assert good["conversion_time"] >= 0.0
+	assert "error" not in good
+
+	assert bad["status"] == "failed"
+	assert bad["error"] == "imu data has no field 'gyro_rad[0]' in topic sensor_combined"
+	assert bad["conversion_time"] >= 0.0
+	assert "rows" not in bad and "traceback" not in bad
+
+	# the details of the skipped log are kept from the previous manifest
+	assert current["status"] == "skipped"
+	assert current["rows"] == {"imu": 15000}
+	assert current["total_rows"] == 15000
+	assert current["duration"] == 60.0
+
+	if arguments:
+		assert good["binary_output"] == str(log_dir / "good.bin")
+		assert bad["binary_output"] == str(log_dir / "bad.bin")
+
+
+@pytest.mark.parametrize("arguments", [[], ['--binary']])
+def test_failed_conversion_leaves_no_output_files(monkeypatch, log_dir, arguments):
+	run_batch(monkeypatch, log_dir, arguments)
+
+	files = sorted(os.listdir(str(log_dir)))
+	assert not [name for name in files if name.endswith('.partial')]
+	assert "bad.csv" not in files and "bad.bin" not in files
+	assert "good.csv" in files
+	assert ("good.bin" in files) == bool(arguments)
+
+
+def test_forced_conversion_does_not_skip_up_to_date_logs(monkeypatch, log_dir):
+	monkeypatch.setattr('sys.argv', ['batchCreateSensorDataFiles.py', str(log_dir), '--force',
+		'--manifest', str(log_dir / "manifest.json")])
+
+	# the stub fails for the up to date log if it is converted
+	with pytest.raises(SystemExit):
+		batchCreateSensorDataFiles.main()
+
+	with open(str(log_dir / "manifest.json")) as file:
+		manifest = json.load(file)
+	assert manifest["summary"] == {"converted": 1, "failed": 2}
+	assert manifest["logs"][1]["error"].startswith("AssertionError('current.ulg")
+	assert "traceback" in manifest["logs"][1]
@@ -0,0 +1,273 @@
+"""
+Tests of the streaming merge of createSensorDataFile.py against the concat and
+sort of the sensor tables it replaced, and of the topics and time window read
+from the ulog file.
+"""
+import csv
+import numpy as np
+import pandas as pd
+import pytest
+import createSensorDataFile
+from createSensorDataFile import SENSOR_GETTERS, TRIM_DURATION_US, write_sensor_data
+
+
+def create_table(sensor: str, timestamps: list, columns: dict) -> pd.DataFrame:
+	"""
+	creates the table of a sensor as returned by its getter
+	:return:
+	"""
+	table = pd.DataFrame({'timestamp': np.array(timestamps, dtype=np.uint64), 'sensor': sensor})
+	for name, values in columns.items():
+		table[name] = values
+
+	return table
+
+
+def create_tables() -> dict:
+	"""
+	creates the tables of a short log with the value types of the ulog topics. Some
+	timestamps are within the trim, some are equal across the sensors, the mag
+	table is not sorted and a range sample has no signal quality
+	:return: dict of sensor name to table in the order of the sensor getters
+	"""
+	start = 1000000
+	imu_times = [start + 4000 * i for i in range(200)]
+	mag_times = [start + 20000 * i for i in range(40)]
+	mag_times[30], mag_times[31] = mag_times[31], mag_times[30]
+	baro_times = [start + 20000 * i + 4000 for i in range(40)]
+	gps_times = [start + 350000 * i for i in range(4)]
+	range_times = [start + TRIM_DURATION_US + 100000 * i + 2000 for i in range(8)]
+	landed_times = [start + 300000, start + 600000]
+	generator = np.random.default_rng(0)
+
+	def values(n: int, scale: float = 1.0) -> np.ndarray:
+		return (generator.normal(size=n) * scale).astype(np.float32)
+
+	range_quality = np.array([100, 80, -1, 100, 100, 50, 100, 100], dtype=np.int8)
+	range_distance = values(len(range_times), 10.0)
+	range_distance[3] = np.nan
+
+	return {
+		"imu": create_table("imu", imu_times, {'accel_m_s2[0]': values(200), 'accel_m_s2[1]': values(200),
+			'accel_m_s2[2]': values(200) - 9.81, 'gyro_rad[0]': values(200, 0.01), 'gyro_rad[1]': values(200, 0.01),
+			'gyro_rad[2]': values(200, 0.01)}),
+		"mag": create_table("mag", mag_times, {'magnetometer_ga[0]': values(40, 0.2),
+			'magnetometer_ga[1]': values(40, 0.2), 'magnetometer_ga[2]': values(40, 0.4)}),
+		"baro": create_table("baro", baro_times, {'baro_alt_meter': values(40) + 488.0}),
+		"gps": create_table("gps", gps_times, {'alt': np.array([488123, 488130, 488140, 488150], dtype=np.int32),
+			'lon': np.array([85456000, 85456001, 85456003, 85456006], dtype=np.int32),
+			'lat': np.array([473977000, 473977002, 473977004, 473977006], dtype=np.int32),
+			'vel_N': values(4), 'vel_E': values(4), 'vel_D': values(4)}),
+		"range": create_table("range", range_times, {'data': range_distance, 'quality': range_quality}),
+		"landed": create_table("landed", landed_times, {'landed': np.array([1, 0], dtype=np.uint8)}),
+	}
+
+
+def write_reference(tables: dict, output_file: str) -> None:
+	"""
+	writes the csv file as the converter did before the streaming merge, with a
+	stable sort: all tables concatenated, sorted, trimmed, written with pandas and
+	read back to remove the empty cells
+	:return:
+	"""
+	table = pd.DataFrame()
+	for sensor_table in tables.values():
+		table = pd.concat([table, sensor_table], ignore_index=True, sort=False)
+
+	table = table.sort_values('timestamp', axis=0, ascending=True, kind='stable')
+	table['timestamp'] = table['timestamp'] - table['timestamp'].iloc[0]
+	table = table[table.timestamp > TRIM_DURATION_US]
+	table.timestamp = table.timestamp - TRIM_DURATION_US
+	table.to_csv(output_file, index=None, header=None)
+
+	with open(output_file, "r") as in_file:
+		result = [[item for item in row if item != ''] for row in csv.reader(in_file)]
+
+	with open(output_file, "w") as out_file:
+		csv.writer(out_file).writerows(result)
+
+
+def read_rows(file_name: str) -> list:
+	"""
+	:return: the cells of the rows of a csv file
+	"""
+	with open(file_name, newline='') as file:
+		return [line.rstrip("\r\n").split(",") for line in file]
+
+
+@pytest.mark.parametrize("block_rows", [3, 65536])
+def test_output_is_identical_to_the_sorted_concatenation(tmp_path, monkeypatch, block_rows):
+	monkeypatch.setattr(createSensorDataFile, "MERGE_BLOCK_ROWS", block_rows)
+	tables = create_tables()
+	output_file = str(tmp_path / 'output.csv')
+	reference_file = str(tmp_path / 'reference.csv')
+
+	n_rows = write_sensor_data(tables, output_file)
+	write_reference(tables, reference_file)
+
+	with open(output_file, 'rb') as output, open(reference_file, 'rb') as reference:
+		assert output.read() == reference.read()
+	assert sum(n_rows.values()) == len(read_rows(output_file))
+
+
+def test_rows_within_the_trim_are_removed_and_the_timestamps_rebased(tmp_path):
+	tables = create_tables()
+	output_file = str(tmp_path / 'output.csv')
+
+	n_rows = write_sensor_data(tables, output_file)
+	rows = read_rows(output_file)
+
+	# the first imu sample is the first of the log, the sample at the end of the trim is removed
+	first = int(tables["imu"]["timestamp"].iloc[0])
+	for sensor, table in tables.items():
+		timestamps = sorted(int(timestamp) - first - TRIM_DURATION_US for timestamp in table["timestamp"])
+		expected = [timestamp for timestamp in timestamps if timestamp > 0]
+		assert [int(row[0]) for row in rows if row[1] == sensor] == expected, sensor
+		assert n_rows[sensor] == len(expected)
+	assert rows[0][:2] == ["2000", "range"]
+
+
+def test_rows_of_equal_timestamps_are_in_the_order_of_the_sensors(tmp_path):
+	tables = create_tables()
+	output_file = str(tmp_path / 'output.csv')
+
+	write_sensor_data(tables, output_file)
+	rows = read_rows(output_file)
+
+	order = list(SENSOR_GETTERS)
+	# imu, mag and gps have samples at 700000 us, after the trim at 200000 us
+	assert [row[1] for row in rows if row[0] == "200000"] == ["imu", "mag", "gps"]
+	for previous, row in zip(rows, rows[1:]):
+		assert int(previous[0]) < int(row[0]) or order.index(previous[1]) < order.index(row[1])
+
+
+def test_missing_values_are_left_out_of_the_ragged_rows(tmp_path):
+	tables = create_tables()
+	output_file = str(tmp_path / 'output.csv')
+
+	write_sensor_data(tables, output_file)
+	range_rows = [row for row in read_rows(output_file) if row[1] == "range"]
+
+	# the distance of the fourth range sample is missing
+	assert [len(row) for row in range_rows] == [4, 4, 4, 3, 4, 4, 4, 4]
+	assert range_rows[3][2:] == ["100.0"]
+	# the integer columns missing in the other sensors are written as float
+	gps_row = next(row for row in read_rows(output_file) if row[1] == "gps")
+	assert gps_row[2:5] == ["488140.0", "85456003.0", "473977004.0"]
+
+
+class FakeDataset:
+	"""
+	a ulog dataset of which every field not given is zero
+	"""
+
+	class Fields(dict):
+		def __missing__(self, field):
+			return np.zeros(len(self['timestamp']), dtype=np.float32)
+
+	def __init__(self, timestamps: list):
+		self.data = FakeDataset.Fields(timestamp=np.array(timestamps, dtype=np.uint64))
+
+
+class FakeULog:
+	"""
+	a ulog with the datasets given as dict of (topic, multi id) to timestamps,
+	recording the topics read and the topic filter it was loaded with
+	"""
+
+	def __init__(self, datasets: dict, start_timestamp: int = 0, last_timestamp: int = 0,
+			message_name_filter_list: list = None):
+		self.datasets = datasets
+		self.start_timestamp = start_timestamp
+		self.last_timestamp = last_timestamp
+		self.message_name_filter_list = message_name_filter_list
+		self.requested_topics = []
+
+	def get_dataset(self, name: str, multi_instance: int = 0) -> FakeDataset:
+		self.requested_topics.append(name)
+		if self.message_name_filter_list is not None and name not in self.message_name_filter_list:
+			raise IndexError(name + " was not loaded")
+		if (name, multi_instance) not in self.datasets:
+			raise IndexError(name + " not found")
+		return FakeDataset(self.datasets[(name, multi_instance)])
+
+
+def create_datasets(timestamps: list) -> dict:
+	"""
+	:return: datasets of all topics read by the sensor getters with the same timestamps
+	"""
+	datasets = {(getter.topic, 0): timestamps for getter in SENSOR_GETTERS.values()}
+	datasets[("distance_sensor", 1)] = timestamps
+	datasets[("distance_sensor", 2)] = timestamps
+	return datasets
+
+
+def install_fake_ulog(monkeypatch, datasets: dict, start_timestamp: int, last_timestamp: int) -> list:
+	"""
+	replaces the ULog class of the converter by FakeULog with the datasets
+	:return: list of the fake ulogs created by the converter
+	"""
+	created = []
+
+	def load(file_name, message_name_filter_list=None):
+		created.append(FakeULog(datasets, start_timestamp, last_timestamp, message_name_filter_list))
+		return created[-1]
+
+	monkeypatch.setattr(createSensorDataFile, "ULog", load)
+	return created
+
+
+@pytest.mark.parametrize("sensor", list(SENSOR_GETTERS))
+def test_topic_of_a_getter_is_the_topic_it_reads(sensor):
+	getter = SENSOR_GETTERS[sensor]
+	ulog = FakeULog(create_datasets([1000, 2000]))
+
+	table = getter(ulog)
+
+	assert set(ulog.requested_topics) == {getter.topic}
+	assert len(table) > 0
+
+
+def test_topics_of_all_sensors_are_loaded_once():
+	topics = createSensorDataFile.get_topics(list(SENSOR_GETTERS))
+
+	assert sorted(topics) == sorted({getter.topic for getter in SENSOR_GETTERS.values()})
+	assert len(topics) == len(SENSOR_GETTERS)
+
+
+@pytest.mark.parametrize("arguments, topics", [
+	([], [getter.topic for getter in SENSOR_GETTERS.values()]),
+	(['--sensors', 'gps', 'imu'], ["sensor_combined", "vehicle_gps_position"]),
+	(['--sensors', 'range'], ["distance_sensor"]),
+])
+def test_only_the_topics_of_the_selected_sensors_are_loaded(tmp_path, monkeypatch, arguments, topics):
+	created = install_fake_ulog(monkeypatch, create_datasets(list(range(1000000, 3000000, 100000))), 1000000, 3000000)
+	output_file = str(tmp_path / 'output.csv')
+	monkeypatch.setattr('sys.argv', ['createSensorDataFile.py', 'input.ulg', output_file] + arguments)
+
+	createSensorDataFile.main()
+
+	assert len(created) == 1
+	assert sorted(created[0].message_name_filter_list) == sorted(topics)
+	sensors = arguments[1:] if arguments else list(SENSOR_GETTERS)
+	assert {row[1] for row in read_rows(output_file)} == set(sensors)
+
+
+def test_time_window_is_clipped_and_the_trim_starts_at_its_first_sample(tmp_path, monkeypatch):
+	start = 1000000
+	datasets = {
+		("sensor_combined", 0): list(range(start, start + 4000000, 4000)),
+		("vehicle_gps_position", 0): list(range(start + 50000, start + 4000000, 100000)),
+	}
+	install_fake_ulog(monkeypatch, datasets, start, start + 4000000)
+	output_file = str(tmp_path / 'output.csv')
+
+	result = createSensorDataFile.convert_ulog('input.ulg', output_file, start=1.0, end=2.0)
+
+	assert result["duration"] == 4.0
+	assert result["sensors"] == ["imu", "gps"]
+	# the window is 2 s to 3 s after the start of the log, the trim ends 0.5 s after its first imu sample
+	rows = read_rows(output_file)
+	assert [int(row[0]) for row in rows if row[1] == "imu"] == list(range(4000, 500001, 4000))
+	assert [int(row[0]) for row in rows if row[1] == "gps"] == [50000, 150000, 250000, 350000, 450000]
+	assert result["rows"] == {"imu": 125, "gps": 5}
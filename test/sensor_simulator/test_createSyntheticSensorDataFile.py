@@ -0,0 +1,214 @@
+"""
+Tests of the fault injection and of the column order of the sensor data written
+by createSyntheticSensorDataFile.py.
+"""
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from binaryReplayFile import convert_csv_file, read_replay_file
+from createSensorDataFile import SENSOR_GETTERS
+from createSyntheticSensorDataFile import (CONSTANTS_ONE_G, CONSTANTS_RADIUS_OF_EARTH, ConfigError,
+	PatternTrajectory, SyntheticFlight, create_synthetic_data, get_fault_mask, read_config)
+
+DURATION = 30.0
+
+# a short ground time and climb leave time for the circle pattern
+TRAJECTORY = {"ground_time": 2.0, "altitude": 4.0}
+
+# the values of the rows of each sensor in the order SensorSimulator::setSingleReplaySample reads them
+SENSOR_COLUMNS = {
+	"imu": ["accel_m_s2[0]", "accel_m_s2[1]", "accel_m_s2[2]", "gyro_rad[0]", "gyro_rad[1]", "gyro_rad[2]"],
+	"mag": ["magnetometer_ga[0]", "magnetometer_ga[1]", "magnetometer_ga[2]"],
+	"baro": ["baro_alt_meter"],
+	"gps": ["alt", "lat", "lon", "vel_N", "vel_E", "vel_D"],
+	"airspeed": ["true_as", "indicated_as"],
+	"flow": ["pixel_flow_x_integral", "pixel_flow_y_integral", "gyro_x_rate_integral", "gyro_y_rate_integral",
+		"gyro_z_rate_integral", "quality"],
+	"range": ["current_distance", "signal_quality"],
+	"landed": ["landed"],
+}
+
+
+def get_config(tmp_path, faults: list = None) -> dict:
+	"""
+	reads the config of a short flight with all sensors and the faults
+	:return:
+	"""
+	config_file = tmp_path / 'config.json'
+	config_file.write_text(json.dumps({"duration": DURATION, "trajectory": TRAJECTORY,
+		"sensors": {sensor: {} for sensor in SENSOR_COLUMNS}, "faults": faults or []}))
+
+	return read_config(str(config_file))
+
+
+def get_sensor_data(tmp_path, sensor: str, faults: list = None) -> pd.DataFrame:
+	"""
+	returns the samples of a sensor of the flight with the faults
+	:return:
+	"""
+	config = get_config(tmp_path, faults)
+	flight = SyntheticFlight(config, PatternTrajectory(config["trajectory"], DURATION))
+
+	return flight.get_sensor_data(sensor)
+
+
+def get_window(table: pd.DataFrame, fault: dict) -> np.ndarray:
+	"""
+	:return: the mask of the samples of a table in the window of the fault
+	"""
+	t = table["timestamp"].to_numpy() / 1e6
+	return (t >= fault["start"]) & (t < fault["start"] + fault["duration"])
+
+
+def test_fault_mask_covers_the_window_from_the_start():
+	t = np.arange(0.0, 10.0, 0.5)
+	fault = {"type": "gps_glitch", "start": 2.0, "duration": 3.0}
+
+	(selected, mask), = get_fault_mask(t, [fault], "gps_glitch")
+
+	assert selected is fault
+	np.testing.assert_array_equal(t[mask], [2.0, 2.5, 3.0, 3.5, 4.0, 4.5])
+
+
+def test_fault_mask_selects_the_type_and_the_dropout_sensor():
+	t = np.arange(0.0, 10.0, 0.5)
+	faults = [{"type": "gps_glitch", "start": 1.0, "duration": 1.0},
+		{"type": "dropout", "sensor": "flow", "start": 2.0, "duration": 1.0},
+		{"type": "dropout", "sensor": "gps", "start": 3.0, "duration": 1.0}]
+
+	assert [fault for fault, _ in get_fault_mask(t, faults, "gps_glitch")] == [faults[0]]
+	assert [fault for fault, _ in get_fault_mask(t, faults, "dropout", "gps")] == [faults[2]]
+	assert get_fault_mask(t, faults, "mag_interference") == []
+
+
+def test_faults_need_a_window_and_a_dropout_sensor(tmp_path):
+	with pytest.raises(ConfigError):
+		get_config(tmp_path, [{"type": "gps_glitch", "start": 1.0}])
+	with pytest.raises(ConfigError):
+		get_config(tmp_path, [{"type": "dropout", "start": 1.0, "duration": 1.0}])
+	with pytest.raises(ConfigError):
+		get_config(tmp_path, [{"type": "gps_jamming", "start": 1.0, "duration": 1.0}])
+
+
+def test_gps_glitch_offsets_the_position_in_the_window(tmp_path):
+	fault = {"type": "gps_glitch", "start": 12.0, "duration": 3.0, "offset": [20.0, 0.0, -5.0]}
+	reference = get_sensor_data(tmp_path, "gps")
+	glitched = get_sensor_data(tmp_path, "gps", [fault])
+	window = get_window(glitched, fault)
+
+	lat_offset = (glitched["lat"] - reference["lat"]).to_numpy()
+	alt_offset = (glitched["alt"] - reference["alt"]).to_numpy()
+	# 20 m north in 1e-7 deg, the altitude in mm
+	np.testing.assert_allclose(lat_offset[window], np.degrees(20.0 / CONSTANTS_RADIUS_OF_EARTH) * 1e7, atol=1.0)
+	np.testing.assert_allclose(alt_offset[window], 5000.0, atol=1.0)
+	assert window.any() and not lat_offset[~window].any() and not alt_offset[~window].any()
+	pd.testing.assert_series_equal(glitched["lon"], reference["lon"])
+
+
+def test_mag_interference_adds_the_field_in_the_window(tmp_path):
+	fault = {"type": "mag_interference", "start": 5.0, "duration": 2.0, "field": [0.2, 0.0, -0.1]}
+	reference = get_sensor_data(tmp_path, "mag")
+	disturbed = get_sensor_data(tmp_path, "mag", [fault])
+	window = get_window(disturbed, fault)
+
+	for column, field in zip(SENSOR_COLUMNS["mag"], fault["field"]):
+		difference = (disturbed[column] - reference[column]).to_numpy()
+		np.testing.assert_allclose(difference[window], field, atol=1e-6)
+		assert not difference[~window].any()
+
+
+def test_imu_clipping_limits_the_acceleration_in_the_window(tmp_path):
+	fault = {"type": "imu_clipping", "start": 4.0, "duration": 1.0, "vibration": 80.0, "accel_range": 20.0}
+	reference = get_sensor_data(tmp_path, "imu")
+	clipped = get_sensor_data(tmp_path, "imu", [fault])
+	window = get_window(clipped, fault)
+	accel = clipped[SENSOR_COLUMNS["imu"][:3]].to_numpy()
+
+	assert np.abs(accel[window]).max() == pytest.approx(20.0)
+	assert np.abs(accel[~window]).max() < 20.0
+	# the vibration is drawn after the IMU noise, the samples before the window are unchanged
+	before = clipped["timestamp"].to_numpy() < fault["start"] * 1e6
+	pd.testing.assert_frame_equal(clipped[before], reference[before])
+
+
+def test_dropout_removes_the_samples_of_the_sensor(tmp_path):
+	fault = {"type": "dropout", "sensor": "flow", "start": 8.0, "duration": 2.5}
+	reference = get_sensor_data(tmp_path, "flow")
+	dropped = get_sensor_data(tmp_path, "flow", [fault])
+
+	assert not get_window(dropped, fault).any()
+	assert len(dropped) == len(reference) - np.count_nonzero(get_window(reference, fault))
+	pd.testing.assert_frame_equal(dropped, reference[~get_window(reference, fault)].reset_index(drop=True))
+	pd.testing.assert_frame_equal(get_sensor_data(tmp_path, "gps", [fault]), get_sensor_data(tmp_path, "gps"))
+
+
+def test_sensor_columns_are_in_the_order_of_the_sensor_simulator(tmp_path):
+	config = get_config(tmp_path)
+	flight = SyntheticFlight(config, PatternTrajectory(config["trajectory"], DURATION))
+
+	for sensor, columns in SENSOR_COLUMNS.items():
+		assert list(flight.get_sensor_data(sensor).columns) == ["timestamp", "sensor"] + columns, sensor
+
+
+def test_csv_rows_have_the_values_in_the_column_order(tmp_path):
+	config = get_config(tmp_path)
+	output_file = str(tmp_path / 'synthetic.csv')
+	create_synthetic_data(config, PatternTrajectory(config["trajectory"], DURATION), output_file)
+
+	rows = {}
+	with open(output_file) as file:
+		for line in file:
+			cells = line.strip().split(',')
+			rows.setdefault(cells[1], []).append([float(cell) for cell in [cells[0]] + cells[2:] if cell != ''])
+
+	assert set(rows) == set(SENSOR_COLUMNS)
+	for sensor, columns in SENSOR_COLUMNS.items():
+		assert all(len(row) == 1 + len(columns) for row in rows[sensor]), sensor
+
+	# the vehicle is on the ground at the origin for the first seconds
+	origin = config["origin"]
+	alt, lat, lon = rows["gps"][0][1:4]
+	assert alt == pytest.approx(origin["alt"] * 1e3, abs=5e3)
+	assert lat == pytest.approx(origin["lat"] * 1e7, abs=100)
+	assert lon == pytest.approx(origin["lon"] * 1e7, abs=100)
+	accel_z, gyro_z = rows["imu"][0][3], rows["imu"][0][6]
+	assert accel_z == pytest.approx(-CONSTANTS_ONE_G, abs=2.0)
+	assert gyro_z == pytest.approx(0.0, abs=0.1)
+
+
+def test_rows_of_equal_timestamps_are_in_the_order_of_the_sensors(tmp_path):
+	config = get_config(tmp_path)
+	output_file = str(tmp_path / 'synthetic.csv')
+	create_synthetic_data(config, PatternTrajectory(config["trajectory"], DURATION), output_file)
+
+	order = list(SENSOR_GETTERS)
+	table = pd.read_csv(output_file, header=None, usecols=[0, 1], names=["timestamp", "sensor"])
+	sensor_index = table["sensor"].map(order.index).to_numpy()
+	same_time = np.diff(table["timestamp"].to_numpy()) == 0
+
+	assert (np.diff(table["timestamp"].to_numpy()) >= 0).all()
+	assert (np.diff(sensor_index)[same_time] > 0).all()
+
+
+def test_binary_file_holds_the_samples_of_the_csv_file(tmp_path):
+	config = get_config(tmp_path, [{"type": "dropout", "sensor": "gps", "start": 3.0, "duration": 2.0}])
+	output_file = str(tmp_path / 'synthetic.csv')
+	binary_file = str(tmp_path / 'synthetic.bin')
+	converted_file = str(tmp_path / 'converted.bin')
+	create_synthetic_data(config, PatternTrajectory(config["trajectory"], DURATION), output_file, binary_file)
+	convert_csv_file(output_file, converted_file)
+
+	sections, index = read_replay_file(binary_file)
+	converted_sections, converted_index = read_replay_file(converted_file)
+
+	np.testing.assert_array_equal(index, converted_index)
+	assert list(sections) == list(converted_sections)
+	for sensor, records in sections.items():
+		converted = converted_sections[sensor]
+		np.testing.assert_array_equal(records['timestamp'], converted['timestamp'])
+		# the float32 GPS velocities of the float64 GPS section are parsed from their
+		# shortest representation in the csv file, they are equal as float32
+		np.testing.assert_array_equal(records['values'].astype(np.float32),
+			converted['values'].astype(np.float32), err_msg=sensor)
+	np.testing.assert_array_equal(sections["gps"]['values'][:, :3], converted_sections["gps"]['values'][:, :3])
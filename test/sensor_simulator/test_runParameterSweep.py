@@ -0,0 +1,145 @@
+"""
+Tests of the cache keys of runParameterSweep.py and of the reuse of the cached
+metrics by a sweep, with a stand-in for the ecl_replay binary which logs its
+calls.
+"""
+import json
+import os
+import stat
+import subprocess
+import sys
+import pandas as pd
+from runParameterSweep import get_cache_key, get_file_hash
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'runParameterSweep.py')
+
+CONFIG = {"duration": 35.0, "sensors": ["gps"], "fusion_mode": 1, "parameters": {"gyro_noise": 0.015},
+	"logging_rate": 10.0, "output": "/tmp/a/iris_gps.csv", "reference": None}
+
+# writes the outputs of ecl_replay with the test ratio of the GPS position set to
+# the gyro_noise parameter, and appends its command line to the log file
+FAKE_REPLAY = """#!{python}
+import sys
+arguments = sys.argv[1:]
+with open({log!r}, 'a') as file:
+	file.write(' '.join(arguments) + '\\n')
+parameters = dict(value.split('=') for option, value in zip(arguments, arguments[1:]) if option == '--param')
+with open(arguments[1], 'w') as file:
+	file.write(','.join(['Timestamp'] + ['state[%i]' % i for i in range(24)] + ['variance[%i]' % i for i in range(24)]) + '\\n')
+	for row in range(3):
+		file.write(','.join([str(row * 100000)] + ['0'] * 24 + ['0.1'] * 24) + '\\n')
+with open(arguments[arguments.index('--innovations') + 1], 'w') as file:
+	file.write('Timestamp,innovation[gps_pos_n],innovation[gps_pos_e],innovation[gps_pos_d],'
+		'innovation_variance[gps_pos_n],innovation_variance[gps_pos_e],innovation_variance[gps_pos_d],'
+		'test_ratio[gps_hpos]\\n')
+	for row in range(3):
+		file.write('%i,1,1,1,1,1,1,%s\\n' % (row * 100000, parameters['gyro_noise']))
+print('{{}}')
+"""
+
+
+def test_cache_key_is_stable():
+	assert get_cache_key("hash", CONFIG) == get_cache_key("hash", dict(CONFIG))
+	assert len(get_cache_key("hash", CONFIG)) == 64
+
+
+def test_cache_key_ignores_the_output_files():
+	config = dict(CONFIG, output="/tmp/b/output.csv", reference="/tmp/reference.csv")
+
+	assert get_cache_key("hash", config) == get_cache_key("hash", CONFIG)
+
+
+def test_cache_key_ignores_the_order_of_the_parameters():
+	config = dict(CONFIG, parameters={"gyro_noise": 0.015, "eas_noise": 1.4})
+	reordered = dict(CONFIG, parameters={"eas_noise": 1.4, "gyro_noise": 0.015})
+
+	assert get_cache_key("hash", config) == get_cache_key("hash", reordered)
+
+
+def test_cache_key_changes_with_the_replay():
+	key = get_cache_key("hash", CONFIG)
+	changes = [{"duration": 30.0}, {"sensors": ["gps", "airspeed"]}, {"fusion_mode": 3},
+		{"parameters": {"gyro_noise": 0.02}}, {"parameters": {"gyro_noise": 0.015, "eas_noise": 1.4}},
+		{"logging_rate": 5.0}]
+
+	for change in changes:
+		assert get_cache_key("hash", dict(CONFIG, **change)) != key, change
+	assert get_cache_key("other hash", CONFIG) != key
+
+
+def test_file_hash_changes_with_the_content(tmp_path):
+	data_file = tmp_path / 'data.csv'
+	data_file.write_text('1000,baro,488.0\n')
+	file_hash = get_file_hash(str(data_file))
+
+	assert get_file_hash(str(data_file)) == file_hash
+	data_file.write_text('1000,baro,488.5\n')
+	assert get_file_hash(str(data_file)) != file_hash
+
+
+def run_sweep(tmp_path, values: list) -> pd.DataFrame:
+	"""
+	runs a sweep of gyro_noise over the dataset of the temporary directory
+	:return: table of the results
+	"""
+	sweep_file = tmp_path / 'sweep.json'
+	sweep_file.write_text(json.dumps({"parameters": {"gyro_noise": values}}))
+	output_file = tmp_path / 'sweep_results.csv'
+
+	subprocess.run([sys.executable, SCRIPT, str(sweep_file), '--binary', str(tmp_path / 'ecl_replay'),
+		'--replay-data', str(tmp_path / 'replay_data'), '--cache-dir', str(tmp_path / 'cache'), '-o',
+		str(output_file), '-j', '1'], check=True, stdout=subprocess.PIPE)
+
+	return pd.read_csv(str(output_file))
+
+
+def get_replays(tmp_path) -> list:
+	"""
+	:return: the command lines of the replays run so far
+	"""
+	log_file = tmp_path / 'replays.log'
+	return log_file.read_text().splitlines() if log_file.exists() else []
+
+
+def create_sweep_directory(tmp_path) -> None:
+	"""
+	creates the stand-in replay binary and a dataset in the temporary directory
+	:return:
+	"""
+	binary = tmp_path / 'ecl_replay'
+	binary.write_text(FAKE_REPLAY.format(python=sys.executable, log=str(tmp_path / 'replays.log')))
+	binary.chmod(binary.stat().st_mode | stat.S_IEXEC)
+
+	replay_data = tmp_path / 'replay_data'
+	replay_data.mkdir()
+	(replay_data / 'flight.csv').write_text('1000,baro,488.0\n2000,baro,488.1\n')
+	(replay_data / 'flight.json').write_text(json.dumps({"duration": 1, "sensors": ["gps"]}))
+
+
+def test_sweep_replays_only_the_uncached_parameter_sets(tmp_path):
+	create_sweep_directory(tmp_path)
+
+	table = run_sweep(tmp_path, [0.01, 0.02])
+	assert len(get_replays(tmp_path)) == 2
+	assert sorted(table["gyro_noise"]) == [0.01, 0.02]
+	assert list(table["gps_hpos_test_ratio_max"]) == list(table["gyro_noise"])
+
+	cached_table = run_sweep(tmp_path, [0.01, 0.02])
+	assert len(get_replays(tmp_path)) == 2
+	pd.testing.assert_frame_equal(cached_table, table)
+
+	extended_table = run_sweep(tmp_path, [0.01, 0.02, 0.03])
+	assert len(get_replays(tmp_path)) == 3
+	assert '--param gyro_noise=0.03' in get_replays(tmp_path)[-1]
+	assert sorted(extended_table["gyro_noise"]) == [0.01, 0.02, 0.03]
+
+
+def test_changed_dataset_is_replayed_again(tmp_path):
+	create_sweep_directory(tmp_path)
+
+	run_sweep(tmp_path, [0.01])
+	with open(str(tmp_path / 'replay_data' / 'flight.csv'), 'a') as file:
+		file.write('3000,baro,488.2\n')
+	run_sweep(tmp_path, [0.01])
+
+	assert len(get_replays(tmp_path)) == 2
@@ -34,61 +34,139 @@
 #include <gtest/gtest.h>
 #include <math.h>
 #include <memory>
+#include <sstream>
 #include "EKF/ekf.h"
 #include "sensor_simulator/sensor_simulator.h"
 #include "sensor_simulator/ekf_wrapper.h"
 #include "sensor_simulator/ekf_logger.h"
 
-class EkfReplayTest : public ::testing::Test {
+class EkfReplay {
  public:
-	EkfReplayTest(): ::testing::Test(),
+	EkfReplay():
 	_ekf{std::make_shared<Ekf>()},
 	_sensor_simulator(_ekf),
 	_ekf_wrapper(_ekf),
 	_ekf_logger(_ekf) {};
 
+	// Start simulation and enable fusion of additional sensor types here
+	// By default the IMU, Baro and Mag sensor simulators are already running
+	void setupIrisGps()
+	{
+		_sensor_simulator.startGps();
+		_ekf_wrapper.enableGpsFusion();
+	}
+
+	void setupEkfGsfReset()
+	{
+		_sensor_simulator.startGps();
+		_ekf_wrapper.enableGpsFusion();
+		auto params = _ekf->getParamHandle();
+		params->gps_vel_innov_gate = 1.f;
+		params->gps_pos_innov_gate = 1.f;
+		params->EKFGSF_reset_delay = 500000;
+	}
+
+	void runAndLog(int duration_seconds)
+	{
+		uint8_t logging_rate_hz = 10;
+		for(int i = 0; i < duration_seconds * logging_rate_hz; ++i)
+		{
+			_sensor_simulator.runReplaySeconds(1.0f / logging_rate_hz);
+			_ekf_logger.writeStateToFile();
+		}
+	}
+
 	std::shared_ptr<Ekf> _ekf;
 	SensorSimulator _sensor_simulator;
 	EkfWrapper _ekf_wrapper;
 	EkfLogger _ekf_logger;
 };
 
+class EkfReplayTest : public ::testing::Test, public EkfReplay {
+ public:
+	EkfReplayTest(): ::testing::Test(), EkfReplay() {};
+};
+
 TEST_F(EkfReplayTest, irisGps)
 {
-	_sensor_simulator.loadSensorDataFromFile("../../../test/replay_data/iris_gps.csv");
+	ASSERT_TRUE(_sensor_simulator.loadSensorDataFromFile("../../../test/replay_data/iris_gps.csv"))
+			<< _sensor_simulator.getLoadError();
 	_ekf_logger.setFilePath("../../../test/change_indication/iris_gps.csv");
 
-	// Start simulation and enable fusion of additional sensor types here
-	// By default the IMU, Baro and Mag sensor simulators are already running
-	_sensor_simulator.startGps();
-	_ekf_wrapper.enableGpsFusion();
-
-	uint8_t logging_rate_hz = 10;
-	for(int i = 0; i < 35 * logging_rate_hz; ++i)
-	{
-		_sensor_simulator.runReplaySeconds(1.0f / logging_rate_hz);
-		_ekf_logger.writeStateToFile();
-	}
+	setupIrisGps();
+	runAndLog(35);
 }
 
 TEST_F(EkfReplayTest, ekfGsfReset)
 {
-	_sensor_simulator.loadSensorDataFromFile("../../../test/replay_data/ekf_gsf_reset.csv");
+	ASSERT_TRUE(_sensor_simulator.loadSensorDataFromFile("../../../test/replay_data/ekf_gsf_reset.csv"))
+			<< _sensor_simulator.getLoadError();
 	_ekf_logger.setFilePath("../../../test/change_indication/ekf_gsf_reset.csv");
 
-	// Start simulation and enable fusion of additional sensor types here
-	// By default the IMU, Baro and Mag sensor simulators are already running
-	_sensor_simulator.startGps();
-	_ekf_wrapper.enableGpsFusion();
-	auto params = _ekf->getParamHandle();
-	params->gps_vel_innov_gate = 1.f;
-	params->gps_pos_innov_gate = 1.f;
-	params->EKFGSF_reset_delay = 500000;
-
-	uint8_t logging_rate_hz = 10;
-	for(int i = 0; i < 39 * logging_rate_hz; ++i)
+	setupEkfGsfReset();
+	runAndLog(39);
+}
+
+// CMake only defines REPLAY_BINARY_DIR if Python 3 with numpy converts the binary replay files
+#ifdef REPLAY_BINARY_DIR
+
+static std::string readFile(const std::string &file_name)
+{
+	std::ifstream file(file_name);
+	std::stringstream content;
+	content << file.rdbuf();
+	return content.str();
+}
+
+// The binary replay files hold the same sensor data as the csv files, the
+// replays must log the same states and variances as written to change_indication.
+// CMake converts the csv files to the binary files in REPLAY_BINARY_DIR.
+TEST(EkfBinaryReplayTest, irisGpsIdenticalToCsv)
+{
+	{
+		EkfReplay csv_replay;
+		ASSERT_TRUE(csv_replay._sensor_simulator.loadSensorDataFromFile("../../../test/replay_data/iris_gps.csv"))
+				<< csv_replay._sensor_simulator.getLoadError();
+		csv_replay._ekf_logger.setFilePath("iris_gps_csv_replay.csv");
+		csv_replay.setupIrisGps();
+		csv_replay.runAndLog(35);
+	}
 	{
-		_sensor_simulator.runReplaySeconds(1.0f / logging_rate_hz);
-		_ekf_logger.writeStateToFile();
+		EkfReplay binary_replay;
+		ASSERT_TRUE(binary_replay._sensor_simulator.loadSensorDataFromBinaryFile(REPLAY_BINARY_DIR "/iris_gps.bin"))
+				<< binary_replay._sensor_simulator.getLoadError();
+		binary_replay._ekf_logger.setFilePath("iris_gps_binary_replay.csv");
+		binary_replay.setupIrisGps();
+		binary_replay.runAndLog(35);
 	}
+
+	const std::string csv_output = readFile("iris_gps_csv_replay.csv");
+	EXPECT_FALSE(csv_output.empty());
+	EXPECT_EQ(csv_output, readFile("iris_gps_binary_replay.csv"));
+}
+
+TEST(EkfBinaryReplayTest, ekfGsfResetIdenticalToCsv)
+{
+	{
+		EkfReplay csv_replay;
+		ASSERT_TRUE(csv_replay._sensor_simulator.loadSensorDataFromFile("../../../test/replay_data/ekf_gsf_reset.csv"))
+				<< csv_replay._sensor_simulator.getLoadError();
+		csv_replay._ekf_logger.setFilePath("ekf_gsf_reset_csv_replay.csv");
+		csv_replay.setupEkfGsfReset();
+		csv_replay.runAndLog(39);
+	}
+	{
+		EkfReplay binary_replay;
+		ASSERT_TRUE(binary_replay._sensor_simulator.loadSensorDataFromBinaryFile(REPLAY_BINARY_DIR "/ekf_gsf_reset.bin"))
+				<< binary_replay._sensor_simulator.getLoadError();
+		binary_replay._ekf_logger.setFilePath("ekf_gsf_reset_binary_replay.csv");
+		binary_replay.setupEkfGsfReset();
+		binary_replay.runAndLog(39);
+	}
+
+	const std::string csv_output = readFile("ekf_gsf_reset_csv_replay.csv");
+	EXPECT_FALSE(csv_output.empty());
+	EXPECT_EQ(csv_output, readFile("ekf_gsf_reset_binary_replay.csv"));
 }
+
+#endif // REPLAY_BINARY_DIR